@@ -1,18 +1,56 @@
 #
 # convenient types, classes and functions to process models
 #
-from .mtypes import Jsonable
-from .runtime.types import Report, EntryCheckFun
-from .model import JsonModel
-from .script import (
-    jmc_script,
-    model_from_json, model_from_url, model_from_str,
-    model_checker, model_checker_from_url, model_checker_from_json,
-)
+# NOTE exports are imported on first access, so that generated checkers which only
+# need json_model.runtime do not load the compiler and its dependencies.
+#
+import importlib
+from typing import TYPE_CHECKING
+
+_EXPORTS: dict[str, str] = {
+    "Jsonable": ".mtypes",
+    "Report": ".runtime.types",
+    "EntryCheckFun": ".runtime.types",
+    "JsonModel": ".model",
+    "CodeCache": ".code_cache",
+    "jmc_script": ".script",
+    "model_from_json": ".script",
+    "model_from_url": ".script",
+    "model_from_str": ".script",
+    "model_checker": ".script",
+    "model_checker_from_url": ".script",
+    "model_checker_from_json": ".script",
+    "CheckerRegistry": ".script",
+}
+
+# submodules, which were reachable as attributes once the package was imported
+_EXPORTS.update({
+    name: f".{name}"
+    for name in ("analyze", "code_cache", "export", "irep", "language", "model", "mtypes", "objmerge",
+                 "optim", "recurse", "resolver", "runtime", "script", "url_cache", "utils", "xstatic")
+})
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_EXPORTS[name], __name__)
+    value = module if _EXPORTS[name] == f".{name}" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(list(globals().keys()) + list(_EXPORTS.keys()))
+
+if TYPE_CHECKING:
+    from .mtypes import Jsonable
+    from .runtime.types import Report, EntryCheckFun
+    from .model import JsonModel
+    from .code_cache import CodeCache
+    from .script import (
+        jmc_script,
+        model_from_json, model_from_url, model_from_str,
+        model_checker, model_checker_from_url, model_checker_from_json,
+        CheckerRegistry,
+    )
 
-__ALL__ = [
-    Jsonable, Report, EntryCheckFun, JsonModel,
-    jmc_script,
-    model_from_json, model_from_url, model_from_str,
-    model_checker, model_checker_from_url, model_checker_from_json,
-]
+__all__ = list(_EXPORTS.keys())
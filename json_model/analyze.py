@@ -6,9 +6,10 @@ import re
 
 from .mtypes import UnknownModel, ModelPath, ModelType, ModelFilter, ModelObject, ModelArray
 from .utils import log, CONST_RE, is_regex, is_a_simple_object
-from .recurse import recModel, allFlt, noRwt
+from .recurse import recModel, allFlt, noRwt, path_list
 from .model import JsonModel
 from .runtime import ConstSet
+from .runtime.types import Path
 
 # JsonModel = typing.NewType("JsonModel", None)
 type Constants = bool|int|float|str|list[int|float|str]
@@ -26,13 +27,13 @@ def references(jm: JsonModel) -> dict[str, set[int]]:
 
         refs: set[int] = set()
 
-        def drRwt(m: ModelType, p: ModelPath) -> ModelType:
+        def drRwt(m: ModelType, p: Path) -> ModelType:
             if isinstance(m, str) and jm._isRef(m):
-                target = jm.resolveRef(m, p)
+                target = jm.resolveRef(m, path_list(p))
                 refs.add(target._id)
             return m
 
-        recModel(model, allFlt, drRwt, True)
+        recModel(model, allFlt, drRwt, True, lazy=True)
 
         return refs
 
@@ -68,6 +68,9 @@ class CLangJansson(Language):
 
     This implementation relies on inheritance for many methods, thanks to the root
     class heavy parameterization about operators, end-of-instruction and the like.
+
+    With pyext, the same code is compiled as a CPython extension module which checks
+    Python objects directly, see runtime/c/json-model-py.h for the Jansson API emulation.
     """
 
     def __init__(self, *,
@@ -75,7 +78,8 @@ class CLangJansson(Language):
              with_path: bool = True, with_report: bool = True, with_comment: bool = True,
              with_predef: bool = True, strcmp_opt: bool = True, byte_order: str = "le",
              inline: bool = True, with_hints: bool = True, max_strcmp_cset: int = 64,
-             partition_threshold: int = 32, relib: str = "pcre2", int_t: str = "int64_t"
+             partition_threshold: int = 32, relib: str = "pcre2", int_t: str = "int64_t",
+             pyext: bool = False, with_profile: bool = False
         ):
 
         super().__init__(
@@ -86,7 +90,7 @@ class CLangJansson(Language):
              path_t="jm_path_t", float_t="double", str_t="const char *", hash_t="uint32_t",
              match_t="bool" if relib == "pcre2" else "int", with_hints=with_hints,
              eoi=";", relib=relib, debug=debug, with_predef=with_predef,
-             set_caps=(type(None), bool, int, float, str))  # type: ignore
+             with_profile=with_profile, set_caps=(type(None), bool, int, float, str))  # type: ignore
 
         assert byte_order in ("le", "be"), f"expecting little (le) or big (be) endian: {byte_order}"
         assert relib in ("pcre2", "re2"), f"regex engine {relib} is not supported, try: pcre2/re2"
@@ -100,12 +104,21 @@ class CLangJansson(Language):
         # NOTE not necessary equal to the one in CodeGenerator
         self._partition_threshold = partition_threshold
         self._byte_order = byte_order
+        self._pyext = pyext
 
     #
     # file
     #
     def file_header(self, exe: bool = True) -> Block:
         code: Block = super().file_header(exe)
+        if self._pyext:
+            # Python.h must be included first
+            code += [
+                "",
+                "// CPython extension module",
+                "#define JSON_MODEL_PYEXT 1",
+                r"#include <json-model.h>",
+            ]
         code += [ "", "// regular expression engine" ]
         if self._relib == "pcre2":
             code += [
@@ -125,7 +138,7 @@ class CLangJansson(Language):
         return code
 
     def file_footer(self, exe: bool = True) -> Block:
-        return [""] + self.file_load("clang_entry.c")
+        return [""] + self.file_load("clang_pyext.c" if self._pyext else "clang_entry.c")
 
     #
     # inlined type test expressions about JSON data
@@ -346,7 +359,9 @@ class CLangJansson(Language):
         return [ f"{decl}{var}{assign}{self._eoi}" ]
 
     def int_var(self, var: Var, val: IntExpr|None = None, declare: bool = False) -> Block:
-        return self._var(var, val, self._int if declare else None)
+        # Python integer values may not fit in 64 bits
+        wide = self._pyext and isinstance(val, str) and val.startswith("json_integer_value(")
+        return self._var(var, val, ("jm_int_t" if wide else self._int) if declare else None)
 
     #
     # reporting
@@ -453,9 +468,26 @@ class CLangJansson(Language):
                 f"static bool {name}(const char *s, jm_path_t *path, jm_report_t *rep);",
             ]
 
+    def _profiled(self, name: str, raw: str, key: str, val_t: str) -> Block:
+        return [
+            f"static bool {name}({val_t}val, jm_path_t *path, jm_report_t *rep)",
+            r"{",
+            f"    static jm_profile_t prof = {{ {self.esc(key)}, 0, 0, 0, NULL, false }};",
+            r"    int64_t start = jm_profile_start(&prof);",
+            f"    bool res = {raw}(val, path, rep);",
+            r"    jm_profile_stop(&prof, start, res);",
+            r"    return res;",
+            r"}",
+        ]
+
     def sub_re(self, name: str, regex: str, opts: str) -> Block:
         code = self.file_load(f"clang_{self._relib}_fun.c")
-        return [ c.replace("FUNCTION_NAME", name) for c in code ]
+        if not self._with_profile:
+            return [ c.replace("FUNCTION_NAME", name) for c in code ]
+        # rename matching function and wrap it
+        code = [ c.replace("FUNCTION_NAME(", f"{name}_raw(").replace("FUNCTION_NAME", name)
+                    for c in code ]
+        return code + self._profiled(name, f"{name}_raw", f"/{regex}/{opts}", "const char *")
 
     def ini_re(self, name: str, regex: str, opts: str) -> Block:
         # declare once
@@ -683,6 +715,10 @@ class CLangJansson(Language):
         if len(types) == 1:
             tcs = types.pop()
             val = self._var_cst(var, tcs)
+            if self._pyext and tcs is int:
+                # constants fit in 64 bits, Python integers may not
+                return f"{self.is_a(var, tcs)} && jm_py_int_fits({var}) && " \
+                    f"jm_search_cst(&{val}, {name}, {len(constants)})"
             return f"{self.is_a(var, tcs)} && jm_search_cst(&{val}, {name}, {len(constants)})"
         else:  # multi type managed in a generated function
             return f"{name}_test({var})"
@@ -725,6 +761,9 @@ class CLangJansson(Language):
     def sub_fun(self, name: str, body: Block, inline: bool = False) -> Block:
         return [ self._fun(name, inline) ] + self.indent(body)
 
+    def sub_profile(self, name: str, raw: str, key: str) -> Block:
+        return self._profiled(name, raw, key, "const json_t *")
+
     def def_cmap(self, name: str, mapping: dict[JsonScalar, str]) -> Block:
         return [ f"static jm_constmap_t {name}_tab[{len(mapping)}];" ]
 
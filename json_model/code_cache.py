@@ -0,0 +1,323 @@
+#
+# On-disk caches of compiled Python checkers, generated code and jmc outputs
+#
+
+import os
+import re
+import json
+import pickle
+import hashlib
+import marshal
+import tempfile
+import importlib.util
+from types import CodeType
+from typing import Any, BinaryIO
+
+from .utils import log, __version__
+from .model import JsonModel
+from .mtypes import ModelType, Jsonable
+from .runtime.types import Path
+from .resolver import Resolver
+from .recurse import recModel, allFlt
+
+
+class CodeCache:
+    """Cache marshalled Python code objects of generated checkers.
+
+    Entries are content-addressed by the canonical JSON of all loaded models,
+    the compiler options and the compiler version.  They are tagged with the
+    Python bytecode magic number so that an interpreter upgrade invalidates them.
+    Least recently used entries are removed when the cache exceeds its size cap.
+    """
+
+    SUFFIX = ".jmc"
+    ENVVAR = "JSON_MODEL_CODE_CACHEDIR"
+    SUBDIR = "code"
+
+    def __init__(self, cache_dir: str|None = None, max_size: int = 64 * 1024 * 1024):
+
+        self._cache_dir: str
+        if cache_dir is not None:
+            self._cache_dir = cache_dir
+        elif self.ENVVAR in os.environ:
+            self._cache_dir = os.environ[self.ENVVAR]
+        else:
+            self._cache_dir = os.environ.get("HOME", ".") + "/.cache/json-model/" + self.SUBDIR
+
+        # create cache dir if necessary, possibly concurrently
+        os.makedirs(self._cache_dir, exist_ok=True)
+        assert os.path.isdir(self._cache_dir)
+
+        # total size in bytes, 0 for unbounded
+        self._max_size = max_size
+
+        # load statistics
+        self.hits, self.misses = 0, 0
+
+    def key(self, jm: JsonModel, **options) -> str:
+        """Compute cache key for a model and its compilation options."""
+        assert jm._is_head and jm._models
+        models = [m.toJSON(True) for m in sorted(jm._models.values(), key=lambda m: m._id)]
+        data = {"version": __version__, "options": options, "models": models}
+        sdata = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha3_256(sdata.encode("UTF-8")).hexdigest()
+
+    def _file(self, key: str) -> str:
+        return self._cache_dir + "/" + key + self.SUFFIX
+
+    def _read(self, f: BinaryIO) -> Any:
+        """Read an entry, raise an exception if invalid."""
+        magic = f.read(len(importlib.util.MAGIC_NUMBER))
+        if magic != importlib.util.MAGIC_NUMBER:
+            raise ValueError("bytecode magic number mismatch")
+        code = marshal.load(f)
+        if not isinstance(code, CodeType):
+            raise ValueError("not a code object")
+        return code
+
+    def _write(self, f: BinaryIO, data: Any):
+        """Write an entry."""
+        f.write(importlib.util.MAGIC_NUMBER)
+        marshal.dump(data, f)
+
+    def load(self, key: str) -> Any:
+        """Load a cached entry, a code object here, if available and valid, else None."""
+        cfile = self._file(key)
+        try:
+            with open(cfile, "rb") as f:
+                data = self._read(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            log.warning(f"invalidating code cache entry {key}: {e}")
+            self.invalidate(key)
+            self.misses += 1
+            return None
+        # keep track of last use for eviction
+        os.utime(cfile)
+        log.info(f"loading cached code: {key}")
+        self.hits += 1
+        return data
+
+    def store(self, key: str, data: Any):
+        """Store an entry, a code object here, in the cache."""
+        # write to a temporary file and rename, for concurrent processes
+        fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                self._write(f, data)
+            os.replace(tmp, self._file(key))
+        except Exception:
+            os.unlink(tmp)
+            raise
+        self.trim()
+
+    def invalidate(self, key: str):
+        """Remove one cache entry."""
+        try:
+            os.unlink(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """Cache entries as (last use, size, path)."""
+        entries = []
+        for file in os.listdir(self._cache_dir):
+            if re.match(r"[0-9a-f]{64}" + re.escape(self.SUFFIX) + "$", file):
+                cfile = self._cache_dir + "/" + file
+                try:
+                    st = os.stat(cfile)
+                    entries.append((st.st_mtime, st.st_size, cfile))
+                except FileNotFoundError:  # concurrent removal
+                    pass
+        return entries
+
+    def size(self) -> int:
+        """Total size of cache entries in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def trim(self):
+        """Remove least recently used entries beyond size cap."""
+        if not self._max_size:
+            return
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, cfile in sorted(entries):
+            if total <= self._max_size:
+                break
+            log.info(f"evicting cached code: {cfile}")
+            try:
+                os.unlink(cfile)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Clear cache."""
+        for _, _, cfile in self._entries():
+            os.unlink(cfile)
+
+
+class DefinitionCache(CodeCache):
+    """Cache generated code of individual models across compilations.
+
+    Each compiled model, a root or one of its definitions, is a unit keyed by its
+    preprocessed model, the models it references transitively, the compiler options
+    and the compiler version.  An entry holds the code blocks generated for the unit
+    and the generator state needed to replay them, so that only changed definitions
+    and their dependents are regenerated.  Keys do not depend on model ids, which
+    are sequential, and ids in entries are stored as references to the models.
+    """
+
+    SUFFIX = ".jmd"
+    ENVVAR = "JSON_MODEL_DEF_CACHEDIR"
+    SUBDIR = "defs"
+
+    def keys(self, jm: JsonModel, **options) -> dict[int, str]:
+        """Compute cache keys of all compilable models, by model id."""
+        assert jm._is_head and jm._globs is not None
+
+        # NOTE references are resolved as the generator does, through global symbols,
+        # as preprocessing may move sub-models out of their initial scope.
+        def direct(m: JsonModel) -> set[int|str]:
+            refs: set[int|str] = set()
+
+            def drRwt(model: ModelType, _p: Path) -> ModelType:
+                if m._isRef(model):
+                    gref = m._defs.gget(model) if m._defs.ghas(model) else model
+                    refs.add(jm._globs[gref]._id if gref in jm._globs else gref)  # type: ignore
+                return model
+
+            recModel(m._model, allFlt, drRwt, True, lazy=True)
+            return refs
+
+        # direct references and own digest of every model
+        models = {m._id: m for m in [jm, *jm._defs.values(), *jm._globs.values()]}  # type: ignore
+        deps: dict[int, set[int|str]] = {}
+        digests: dict[int|str, str] = {}
+        for mid, m in models.items():
+            deps[mid] = direct(m)
+            data = [m._loose_int, m._loose_float, m._model]
+            sdata = json.dumps(data, sort_keys=True, default=str)
+            digests[mid] = hashlib.sha3_256(sdata.encode("UTF-8")).hexdigest()
+
+        # combine with transitive dependencies
+        keys: dict[int, str] = {}
+        for mid in models:
+            reached, todo = {mid}, [mid]
+            while todo:
+                for ref in deps.get(todo.pop(), ()):  # type: ignore
+                    if ref not in reached:
+                        reached.add(ref)
+                        todo.append(ref)
+            data = {"version": __version__, "options": options, "model": digests[mid],
+                    "deps": sorted(digests.get(ref, str(ref)) for ref in reached - {mid})}
+            sdata = json.dumps(data, sort_keys=True, default=str)
+            keys[mid] = hashlib.sha3_256(sdata.encode("UTF-8")).hexdigest()
+        return keys
+
+    def _read(self, f: BinaryIO) -> Any:
+        unit = pickle.load(f)
+        if not isinstance(unit, dict):
+            raise ValueError("not a compiled unit")
+        return unit
+
+    def _write(self, f: BinaryIO, data: Any):
+        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+
+
+class ArtifactCache(CodeCache):
+    """Cache final outputs of jmc runs, in the spirit of ccache direct mode.
+
+    A manifest, keyed by the compiler options and toolchain, lists the model sources
+    loaded by the previous compilation with their digests.  Outputs are keyed by the
+    manifest key and the current digests of these sources, so that any change to the
+    main model or to one of its externals leads to a miss.  Cumulative hit and miss
+    counts are kept in the cache directory for statistics.
+    """
+
+    SUFFIX = ".jma"
+    ENVVAR = "JSON_MODEL_ARTIFACT_CACHEDIR"
+    SUBDIR = "artifacts"
+    STATS = "stats.json"
+
+    def __init__(self, cache_dir: str|None = None, max_size: int = 1024 * 1024 * 1024):
+        super().__init__(cache_dir, max_size)
+
+    def key(self, **inputs) -> str:  # type: ignore
+        """Compute manifest key from compilation inputs other than models."""
+        data = {"version": __version__, "inputs": inputs}
+        sdata = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha3_256(sdata.encode("UTF-8")).hexdigest()
+
+    @staticmethod
+    def _digest(j: Jsonable) -> str:
+        sdata = json.dumps(j, sort_keys=True)
+        return hashlib.sha3_256(sdata.encode("UTF-8")).hexdigest()
+
+    def _key(self, key: str, sources: list[tuple[str, str]]) -> str:
+        sdata = json.dumps([key, sources])
+        return hashlib.sha3_256(sdata.encode("UTF-8")).hexdigest()
+
+    def lookup(self, key: str, resolver: Resolver) -> dict[str, tuple[int, bytes]]|None:
+        """Get cached output files by name, if sources listed in the manifest are unchanged."""
+        hits, misses = self.hits, self.misses
+        files = None
+        if (manifest := self.load(key)) is not None:
+            try:
+                sources = [(url, self._digest(resolver(url, follow=False))) for url in manifest["sources"]]
+                files = self.load(self._key(key, sources))
+            except Exception as e:  # source vanished or broken, let compilation report
+                log.info(f"artifact cache source error: {e}")
+        self.hits, self.misses = hits + (files is not None), misses + (files is None)
+        self._count(files is not None)
+        return files["files"] if files is not None else None
+
+    def save(self, key: str, resolver: Resolver, files: dict[str, tuple[int, bytes]]):
+        """Store output files and the manifest of sources loaded by the resolver."""
+        sources = [(url, self._digest(j)) for url, j in sorted(resolver._jsons.items())]
+        self.store(self._key(key, sources), {"files": files})
+        self.store(key, {"sources": [url for url, _ in sources]})
+
+    def _read(self, f: BinaryIO) -> Any:
+        entry = pickle.load(f)
+        if not isinstance(entry, dict):
+            raise ValueError("not an artifact entry")
+        return entry
+
+    def _write(self, f: BinaryIO, data: Any):
+        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+
+    def _count(self, hit: bool):
+        """Update persistent statistics, losing counts on concurrent updates is okay."""
+        stats = self.stats()
+        stats["hits" if hit else "misses"] += 1
+        fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"hits": stats["hits"], "misses": stats["misses"]}, f)
+        os.replace(tmp, self._cache_dir + "/" + self.STATS)
+
+    def stats(self) -> dict[str, Any]:
+        """Cumulative statistics and current occupation."""
+        try:
+            with open(self._cache_dir + "/" + self.STATS) as f:
+                counts = json.load(f)
+        except (FileNotFoundError, ValueError):
+            counts = {}
+        entries = self._entries()
+        return {
+            "directory": self._cache_dir,
+            "hits": counts.get("hits", 0),
+            "misses": counts.get("misses", 0),
+            "entries": len(entries),
+            "size": sum(size for _, size, _ in entries),
+            "max_size": self._max_size,
+        }
+
+    def clear(self):
+        super().clear()
+        try:
+            os.unlink(self._cache_dir + "/" + self.STATS)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,118 @@
+/*
+ * # CPython extension API
+ *
+ * ```python
+ * import checker
+ *
+ * rep = []
+ * valid = checker.check_model(value, "model-name", rep)
+ * ```
+ *
+ * - values are Python objects as returned by `json.load`, they are not serialized.
+ * - `rep` is an optional list which collects `(message, path)` tuples on failures.
+ * - an exception is raised if the model does not exist or if the value is not JSON.
+ */
+#ifndef JSON_MODEL_PYEXT_MODULE
+#define JSON_MODEL_PYEXT_MODULE CHECK_FUNCTION_NAME
+#endif  // !JSON_MODEL_PYEXT_MODULE
+
+#define jm_str(s) #s
+#define jm_xstr(s) jm_str(s)
+
+static PyObject *
+CHECK_FUNCTION_NAME_py_init(PyObject *self, PyObject *unused)
+{
+    const char *error = CHECK_FUNCTION_NAME_init();
+    if (error)
+    {
+        PyErr_SetString(PyExc_RuntimeError, error);
+        return NULL;
+    }
+    if (PyErr_Occurred())
+        return NULL;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+CHECK_FUNCTION_NAME_py_free(PyObject *self, PyObject *unused)
+{
+    CHECK_FUNCTION_NAME_free();
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+CHECK_FUNCTION_NAME_py(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = { "val", "name", "rep", NULL };
+    PyObject *val, *rep = Py_None;
+    const char *name = "";
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|sO:CHECK_FUNCTION_NAME", kwlist,
+                                     &val, &name, &rep))
+        return NULL;
+
+    if (rep != Py_None && !PyList_Check(rep))
+    {
+        PyErr_SetString(PyExc_TypeError, "report must be a list or None");
+        return NULL;
+    }
+
+    // lazy
+    if (CHECK_FUNCTION_NAME_py_init(self, NULL) == NULL)
+        return NULL;
+
+    jm_check_fun_t checker = CHECK_FUNCTION_NAME_map(name);
+    if (checker == NULL)
+    {
+        PyErr_Format(PyExc_Exception, "unexpected model name: %s", name);
+        return NULL;
+    }
+
+    // no path bookkeeping without a report
+    jm_path_t root = (jm_path_t) { NULL, 0, NULL, NULL };
+    jm_report_t report = (jm_report_t) { rep };
+    bool reporting = rep != Py_None;
+
+    jm_py_error = NULL;
+    bool valid = checker(val, reporting ? &root : NULL, reporting ? &report : NULL);
+
+    if (jm_py_error)
+    {
+        PyErr_SetString(PyExc_ValueError, jm_py_error);
+        return NULL;
+    }
+    if (PyErr_Occurred())
+        return NULL;
+
+    return PyBool_FromLong(valid);
+}
+
+static PyMethodDef CHECK_FUNCTION_NAME_py_methods[] = {
+    { "CHECK_FUNCTION_NAME", (PyCFunction)(void(*)(void)) CHECK_FUNCTION_NAME_py,
+      METH_VARARGS | METH_KEYWORDS, "Check val validity against JSON Model name." },
+    { "CHECK_FUNCTION_NAME_init", CHECK_FUNCTION_NAME_py_init, METH_NOARGS,
+      "Initialize checker, done lazily on the first check." },
+    { "CHECK_FUNCTION_NAME_free", CHECK_FUNCTION_NAME_py_free, METH_NOARGS,
+      "Free checker resources." },
+    { NULL, NULL, 0, NULL }
+};
+
+static struct PyModuleDef CHECK_FUNCTION_NAME_py_module = {
+    PyModuleDef_HEAD_INIT,
+    jm_xstr(JSON_MODEL_PYEXT_MODULE),
+    "JSON Model checker extension",
+    -1,
+    CHECK_FUNCTION_NAME_py_methods
+};
+
+PyMODINIT_FUNC
+newname(PyInit_, JSON_MODEL_PYEXT_MODULE)(void)
+{
+    PyObject *module = PyModule_Create(&CHECK_FUNCTION_NAME_py_module);
+    if (module != NULL && PyModule_AddStringConstant(module, "__version__", JSON_MODEL_VERSION) < 0)
+    {
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
@@ -0,0 +1,28 @@
+def CHECK_FUNCTION_NAME_fun(name: str, report: bool = False) -> CheckFun:
+    """Return fast or reporting check function for JSON model name."""
+    return (CHECK_FUNCTION_NAME_rmap if report else CHECK_FUNCTION_NAME_map)[name]
+
+# entry point for generated checkers
+def CHECK_FUNCTION_NAME(val: Jsonable, name: str = "", rep: Report = None) -> bool:
+    """Check val validity against JSON Model name."""
+    if name not in CHECK_FUNCTION_NAME_map:
+        raise Exception(f"unexpected model name: {name}")
+    # fast check first, reporting check only on failures
+    if CHECK_FUNCTION_NAME_map[name](val, None, None):
+        return True
+    if rep is not None:
+        CHECK_FUNCTION_NAME_rmap[name](val, (), rep)
+    return False
+
+# batch entry point for generated checkers
+def CHECK_FUNCTION_NAME_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in CHECK_FUNCTION_NAME_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(CHECK_FUNCTION_NAME_map[name], values, reports,
+                      CHECK_FUNCTION_NAME_rmap[name])
@@ -8,4 +8,17 @@ def CHECK_FUNCTION_NAME(val: Jsonable, name: str = "", rep: Report = None) -> bo
     if name not in CHECK_FUNCTION_NAME_map:
         raise Exception(f"unexpected model name: {name}")
     checker = CHECK_FUNCTION_NAME_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def CHECK_FUNCTION_NAME_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in CHECK_FUNCTION_NAME_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(CHECK_FUNCTION_NAME_map[name], values, reports)
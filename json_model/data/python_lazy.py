@@ -0,0 +1,3 @@
+
+# lazy mode: cheap initialization on import, regexes are compiled on first use
+CHECK_FUNCTION_NAME_init()
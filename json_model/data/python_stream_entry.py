@@ -0,0 +1,12 @@
+
+# entry point for incremental checks on raw JSON
+def CHECK_FUNCTION_NAME_stream(data: bytes, name: str = "", rep: Report = None) -> bool:
+    """Check raw JSON data validity against JSON Model name, without building the value.
+
+    Values are only built for sub-models which cannot be checked incrementally.
+    """
+    if name not in CHECK_FUNCTION_NAME_stream_map:
+        raise Exception(f"unexpected model name: {name}")
+    plan = CHECK_FUNCTION_NAME_stream_map[name]
+    # no path bookkeeping without a report
+    return check_stream(plan, data, () if rep is not None else None, rep)
@@ -134,6 +134,9 @@ class Go(Language):
 
         return super().predef(var, name, path, is_str)
 
+    def check_unique(self, val: JsonExpr, path: Var) -> BoolExpr:
+        return f"jm.ArrayIsUnique({val})"
+
     #
     # Expressions & Extraction
     #
@@ -12,12 +12,45 @@ from .language import JsonExpr, BoolExpr, IntExpr, StrExpr, PathExpr, NumExpr, E
 from .mtypes import Jsonable, JsonScalar, Number, TestHint, Conditionals
 from .runtime import Path, Report
 
-def _j(o: str, **params) -> str:
-    """Generate a JSON operation."""
-    return json.dumps({"o": o, **params})
+# position in the IR tree
+type IRPath = list[int|str]
 
-def _l(s: str) -> Jsonable:
-    """Parse a JSON operation or something else."""
+class IRNode(dict):
+    """IR operation, an operation code "o" with its named parameters.
+
+    Nodes are plain dicts so that they serialize directly as the JSON IR, but they are
+    kept in memory from generation to evaluation.
+    As the optimizer rewrites nodes in place, a node inserted a second time in the tree
+    is copied so that there is no sharing.
+    """
+
+    __slots__ = ("_attached",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._attached = False
+
+    def __hash__(self):
+        # consistent with structural equality, nodes are used in sets of known tests
+        return hash((self.get("o"), len(self)))
+
+    def __copy__(self):
+        return IRNode(self)
+
+    def __deepcopy__(self, memo):
+        return IRNode({k: copy.deepcopy(v, memo) for k, v in self.items()})
+
+def _j(o: str, **params) -> IRNode:
+    """Generate an IR operation."""
+    return IRNode(o=o, **params)
+
+def _l(s: Jsonable) -> Jsonable:
+    """Attach an IR operation, or parse something else."""
+    if isinstance(s, IRNode):
+        if s._attached:
+            s = copy.deepcopy(s)
+        s._attached = True
+        return s
     # FIXME true/false/null handling is adhoc and can be wrong
     try:
         return json.loads(s) if isinstance(s, str) and s and (s[0] in '{["0123456789-' or s in ("null", "true", "false")) else s
@@ -26,15 +59,19 @@ def _l(s: str) -> Jsonable:
         log.warning(f"shamefully ignoring json oops on {s}")
         return s
 
+def _f(block: Block) -> Block:
+    """Filter out empty lines from a code block."""
+    return [ i for i in block if i is not None and i != "" ]
+
 def _u(block: Block) -> list[Jsonable]:
-    """Parse a JSON code block."""
-    return [ _l(i) for i in filter(lambda s: s is not None and s != "", block) ]
+    """Attach an IR code block."""
+    return [ _l(i) for i in _f(block) ]
 
 # constant map to json and reverse
-def _cmap2json(mapping: dict[JsonScalar, str]) -> list[tuple[JsonScalar, str]]:
-    return [ ( c, s ) for c, s in mapping.items() ]
+def _cmap2json(mapping: dict[JsonScalar, str]) -> list[list[JsonScalar|str]]:
+    return [ [ c, s ] for c, s in mapping.items() ]
 
-def _json2cmap(mapping: list[tuple[JsonScalar, str]]) -> dict[JsonScalar, str]:
+def _json2cmap(mapping: list[list[JsonScalar|str]]) -> dict[JsonScalar, str]:
     return { c: s for c, s in mapping }
 
 # compute RW effects on boolean variables
@@ -59,7 +96,7 @@ def _getEffect(op: Jsonable, bool_vars: set[str], reporting: bool) -> Effect:
         return read, write, value
 
     # shortcut? error?
-    if not isinstance(op, dict) or "o" not in op:
+    if not isinstance(op, IRNode):
         return read, write, value
 
     # recursive computation
@@ -132,10 +169,10 @@ def _getEffect(op: Jsonable, bool_vars: set[str], reporting: bool) -> Effect:
     return read, write, value
 
 def _isOp(op: Jsonable, o: str) -> bool:
-    return isinstance(op, dict) and "o" in op and op["o"] == o
+    return isinstance(op, IRNode) and op["o"] == o
 
 def _isOps(op: Jsonable, ops: set[str]) -> bool:
-    return isinstance(op, dict) and "o" in op and op["o"] in ops
+    return isinstance(op, IRNode) and op["o"] in ops
 
 def _boolIf(op: Jsonable, bool_vars: set[str]) -> tuple[str, bool]|None:
     if not _isOp(op, "if"):
@@ -195,14 +232,14 @@ def _simpleRet(op: Jsonable, reporting: bool) -> bool:
             if rest == resf:
                 # quite unlikely…
                 op.clear()
-                op.update(o="ret", res={"o": "cst", "c": rest})
+                op.update(o="ret", res=_j("cst", c=rest))
             else:
                 cond = op["cond"]
                 while _isOp(cond, "not"):
                     cond = cond["e"]
                     rest, resf = resf, rest
                 op.clear()
-                op.update(o="ret", res=cond if rest else {"o": "not", "e": cond})
+                op.update(o="ret", res=cond if rest else _j("not", e=cond))
             return True
     return False
 
@@ -256,7 +293,7 @@ def _simpleBoolAssign(op: Jsonable, reporting: bool = True) -> bool:
             })
             if vt is True and vf is True or vt is False and vf is False:
                 # C ? V : V -> V
-                op["val"] = {"o": "cst", "c": vt}
+                op["val"] = _j("cst", c=vt)
             elif vt is True and vf is False:
                 # C ? T : F -> C
                 op["val"] = cond
@@ -265,17 +302,17 @@ def _simpleBoolAssign(op: Jsonable, reporting: bool = True) -> bool:
                 op["val"] = invertBool(cond)
             elif vf is False:
                 # C ? E : F -> C && E
-                op["val"] = {"o": "&", "exprs": [ cond, tbv["val"] ]}
+                op["val"] = _j("&", exprs=[ cond, tbv["val"] ])
             elif vt is True:
                 # C ? T : E -> C || E
-                op["val"] = {"o": "|", "exprs": [ cond, fbv["val"] ]}
+                op["val"] = _j("|", exprs=[ cond, fbv["val"] ])
             elif vf is True:
                 # C ? E : T -> !C || E
-                op["val"] = {"o": "|", "exprs": [ invertBool(cond), tbv["val"] ]}
+                op["val"] = _j("|", exprs=[ invertBool(cond), tbv["val"] ])
             else:
                 assert vt is False
                 # C ? F : E -> !C && E
-                op["val"] = {"o": "&", "exprs": [ invertBool(cond), fbv["val"] ]}
+                op["val"] = _j("&", exprs=[ invertBool(cond), fbv["val"] ])
             return True
     return False
 
@@ -291,7 +328,7 @@ CMP_INV = {
 
 def invertBool(op: Jsonable) -> Jsonable:
     """Invert boolean expression."""
-    if isinstance(op, dict) and "o" in op:
+    if isinstance(op, IRNode):
         if op["o"] in ("sc", "nc"):
             op["op"] = CMP_INV[op["op"]]
         elif op["o"] == "cst":
@@ -299,10 +336,10 @@ def invertBool(op: Jsonable) -> Jsonable:
         elif op["o"] == "not":
             op = op["e"]
         else:
-            op = {"o": "not", "e": op}
+            op = _j("not", e=op)
         return op
     else:
-        return {"o": "not", "e": op}
+        return _j("not", e=op)
 
 # FIXME full simplification should require several passes
 def _optimSeq(seq: Sequence, bool_vars: set[str], reporting: bool) -> Effect:
@@ -388,7 +425,7 @@ def _optimSeq(seq: Sequence, bool_vars: set[str], reporting: bool) -> Effect:
                 if prev_var in effects[prev_idx][1]:
                     prev_var = None
                 # cleanup current instruction with a comment
-                seq[cur_idx] = {"o": "no", "#": f"IRO if merged on {prev_idx}"}
+                seq[cur_idx] = IRNode({"o": "no", "#": f"IRO if merged on {prev_idx}"})
                 effects[cur_idx] = (set(), set(), {})
 
             elif var not in write:
@@ -421,9 +458,9 @@ def _optimSeq(seq: Sequence, bool_vars: set[str], reporting: bool) -> Effect:
             vv = _isBool(assign["val"])  # ???
             if same_var and vv is not None:
                 if vv and inverted or not vv and not inverted:
-                    op["cond"] = {"o": "cst", "c": False}
+                    op["cond"] = _j("cst", c=False)
                 else:
-                    op["cond"] = {"o": "cst", "c": True}
+                    op["cond"] = _j("cst", c=True)
         assign = None
 
         # simplify "if (C) .../..."
@@ -461,7 +498,7 @@ def _optimSeq(seq: Sequence, bool_vars: set[str], reporting: bool) -> Effect:
                 op.clear()
                 op.update({"o": "no", "#": "IRO empty if removed"})
             else:
-                op["cond"] = {"o": "not", "e": op["cond"], "#": "IRO empty true branch removed"}
+                op["cond"] = IRNode({"o": "not", "e": op["cond"], "#": "IRO empty true branch removed"})
                 op["true"], op["false"] = op["false"], []
                 if isinstance(op["likely"], bool):
                     op["likely"] = not op["likely"]
@@ -498,19 +535,19 @@ def _optimSeq(seq: Sequence, bool_vars: set[str], reporting: bool) -> Effect:
                 if true_result["c"]:
                     if _isOp(op["res"], "cst"):
                         if op["res"]["c"]:
-                            newop = {"o": "ret", "res": {"o": "cst", "c": True}}
+                            newop = _j("ret", res=_j("cst", c=True))
                         else:
-                            newop = {"o": "ret", "res": ifop["cond"]}
+                            newop = _j("ret", res=ifop["cond"])
                     else:
-                        newop = {"o": "ret", "res": {"o": "|", "exprs": [ifop["cond"], op["res"]]} }
+                        newop = _j("ret", res=_j("|", exprs=[ifop["cond"], op["res"]]))
                 else:
                     if _isOp(op["res"], "cst"):
                         if op["res"]["c"]:
-                            newop = {"o": "ret", "res": invertBool(ifop["cond"])}
+                            newop = _j("ret", res=invertBool(ifop["cond"]))
                         else:
-                            newop = {"o": "ret", "res": {"o": "cst", "c": False}}
+                            newop = _j("ret", res=_j("cst", c=False))
                     else:
-                        newop = {"o": "ret", "res": {"o": "&", "exprs": [invertBool(ifop["cond"]), op["res"]]} }
+                        newop = _j("ret", res=_j("&", exprs=[invertBool(ifop["cond"]), op["res"]]))
                 # set return on latter instruction
                 ifop.clear()
                 ifop.update({"o": "ign", "#": "IRO if ret ret"})
@@ -584,11 +621,11 @@ def _optimSeq(seq: Sequence, bool_vars: set[str], reporting: bool) -> Effect:
             if same_var and (assign2 := _isBoolAssign(op["true"], reporting)) and assign2["var"] == assign["var"]:
                 # ok, save comments and move expression forward
                 newass = copy.copy(assign)
-                newass["val"] = {
+                newass["val"] = IRNode({
                     "o": "|" if is_not else "&",
                     "exprs": [assign["val"], assign2["val"]],
                     "#": f"IRO merge {'or' if is_not else 'and'}"
-                }
+                })
                 assign2.clear()
                 assign2.update(o="ign")
                 assign.clear()
@@ -615,10 +652,7 @@ def _optimSeq(seq: Sequence, bool_vars: set[str], reporting: bool) -> Effect:
             else:
                 if_not, assign = None, None
         elif if_not is not None and _isOp(op, "ret") and op["res"] == assign["var"]:
-            op["res"] = {
-                "o": "|",
-                "exprs": [{"o": "gv", "var": assign["var"], "tvar": "bool"}, assign["val"]]
-            }
+            op["res"] = _j("|", exprs=[_j("gv", var=assign["var"], tvar="bool"), assign["val"]])
             # turn into a sequence to keep comments
             branch = if_not["true"]
             if_not.clear()
@@ -664,22 +698,26 @@ def _optimSeq(seq: Sequence, bool_vars: set[str], reporting: bool) -> Effect:
 
     return cum_read, cum_write, cum_value
 
-def _recIR(code: Jsonable, path: Path,
-           flt: Callable[[Jsonable, Path], bool],
-           rwt: Callable[[Jsonable, Path], Jsonable]) -> Jsonable:
+def _recIR(code: Jsonable, path: IRPath,
+           flt: Callable[[Jsonable, IRPath], bool],
+           rwt: Callable[[Jsonable, IRPath], Jsonable]) -> Jsonable:
     if flt(code, path):
-        if isinstance(code, dict) and "o" in code:
-            for k in list(code.keys()):
-                code[k] = _recIR(code[k], path + [k], flt, rwt)
-        elif isinstance(code, list):
-            code = [ _recIR(c, path + [i], flt, rwt) for i, c in enumerate(code) ]
+        if isinstance(code, IRNode):
+            for k, v in code.items():
+                if isinstance(v, (IRNode, list)):
+                    code[k] = _recIR(v, path + [k], flt, rwt)
+        else:
+            code = [ _recIR(c, path + [i], flt, rwt) if isinstance(c, (IRNode, list)) else c
+                        for i, c in enumerate(code) ]
         code = rwt(code, path)
     return code
 
 def recurseIR(code: Jsonable,
-              flt: Callable[[Jsonable, Path], bool],
-              rwt: Callable[[Jsonable, Path], Jsonable]):
-    _recIR(code, [], flt, rwt)
+              flt: Callable[[Jsonable, IRPath], bool],
+              rwt: Callable[[Jsonable, IRPath], Jsonable]):
+    """Filter and rewrite IR nodes and lists bottom-up, scalars are not visited."""
+    if isinstance(code, (IRNode, list)):
+        _recIR(code, [], flt, rwt)
 
 def callShortcuts(code: Jsonable, shortcuts: dict[str, str]) -> int:
     """Update check function calls based on shortcuts."""
@@ -698,11 +736,11 @@ def callShortcuts(code: Jsonable, shortcuts: dict[str, str]) -> int:
         else:
             return fun
 
-    def repRwt(code: Jsonable, _: Path) -> Jsonable:
-        if isinstance(code, dict) and "o" in code:
+    def repRwt(code: Jsonable, _: IRPath) -> Jsonable:
+        if isinstance(code, IRNode):
             op = code["o"]
             if op in ("dcm", "scm", "icm", "rcm"):
-                code["mapping"] = [ (c, rep(f)) for c, f in code["mapping"] ]
+                code["mapping"] = [ [ c, rep(f) ] for c, f in code["mapping"] ]
             elif op in ("dpm", "spm", "ipm", "rpm"):
                 code["pmap"] = { p: rep(f) for p, f in code["pmap"].items() }
             elif op == "cc":
@@ -718,7 +756,7 @@ SCALAR_TYPES = { "int", "float", "bool", "str" }
 def partialEval(code: Jsonable, reporting: bool) -> int:
     changes = 0
 
-    def peRwt(code: Jsonable, _: Path) -> Jsonable:
+    def peRwt(code: Jsonable, _: IRPath) -> Jsonable:
         nonlocal changes
         if not reporting:
             if _isOp(code, "rep"):
@@ -767,7 +805,7 @@ def elimCommonSub(code: Jsonable) -> int:
     """Common subexpression elimination in some cases."""
     changes: int = 0
 
-    def cseFlt(code: Jsonable, _: Path) -> bool:
+    def cseFlt(code: Jsonable, _: IRPath) -> bool:
         nonlocal changes
         nchanges = changes
         if _isOps(code, {"|", "&"}):
@@ -788,7 +826,7 @@ def elimCommonSub(code: Jsonable) -> int:
                 nchanges = changes
         return True
 
-    def cseRwt(code: Jsonable, _: Path) -> Jsonable:
+    def cseRwt(code: Jsonable, _: IRPath) -> Jsonable:
         nonlocal changes
         # TODO improve generality with partial match
         if _isOp(code, "|"):
@@ -832,7 +870,7 @@ def elimCommonSub(code: Jsonable) -> int:
 
                 # common expression
                 exprs[first]["o"] = "&"
-                exprs[first]["exprs"] = [ common, {"o": "|", "exprs": ands} ]
+                exprs[first]["exprs"] = [ common, _j("|", exprs=ands) ]
                 # falsify other items
                 for i in range(first+1, last+1):
                     exprs[i].clear()
@@ -863,7 +901,7 @@ def elimDeadCode(code: Jsonable, reporting: bool) -> int:
     """Eliminate dead code in simple cases."""
     changes = 0
 
-    def edcRwt(code: Jsonable, _: Path) -> Jsonable:
+    def edcRwt(code: Jsonable, _: IRPath) -> Jsonable:
         nonlocal changes
         if isinstance(code, list):
             # sequence with a constant return and only assignments
@@ -894,13 +932,13 @@ def elimUnreachableCode(code: Jsonable) -> int:
     changes = 0
 
     def hasRet(op: Jsonable) -> bool:
-        return isinstance(op, dict) and "o" in op and (
+        return isinstance(op, IRNode) and (
             op["o"] == "ret" or
             op["o"] == "seq" and any(map(hasRet, op["seq"])) or
             op["o"] == "if" and any(map(hasRet, op["true"])) and any(map(hasRet, op["false"]))
         )
 
-    def eucRwt(code: Jsonable, _: Path) -> Jsonable:
+    def eucRwt(code: Jsonable, _: IRPath) -> Jsonable:
         nonlocal changes
         if isinstance(code, list):
             returned = False
@@ -920,37 +958,37 @@ def elimUnreachableCode(code: Jsonable) -> int:
     return changes
 
 def optimizeIR(code: list[Jsonable], *, shortcuts: dict[str, str], partial: bool = True,
-               if_optim: bool = True, reporting: bool = True) -> Jsonable:
-    """Optimize IR code."""
+               if_optim: bool = True, reporting: bool = True, done: set[int]|None = None) -> Jsonable:
+    """Optimize IR code.
+
+    Instructions in done, by id, are already optimized and only get call shortcuts.
+    """
 
     if not if_optim and not shortcuts:
         return code
 
     optimized, calls = 0, 0
 
-    for i, c in list(enumerate(code)):
-        if c == "":
+    # NOTE instructions are rewritten in place
+    for ins in code:
+        if not isinstance(ins, IRNode):
             continue
-        changed: bool = False
-        ins = json.loads(c)
-        if isinstance(ins, dict) and "o" in ins and ins["o"] == "sfu":
+        if done and id(ins) in done:
+            if shortcuts:
+                calls += callShortcuts(ins, shortcuts)
+            continue
+        if ins["o"] == "sfu":
             if partial:
-                changes = partialEval(ins, reporting)
-                changed |= changes > 0
+                partialEval(ins, reporting)
             # if statement simplification
             if if_optim:
                 optimized += 1
                 _optimSeq(ins["body"], set(), reporting=reporting)
-                changed = True  # maybe
         if shortcuts:  # call shortcuts
-            changes = callShortcuts(ins, shortcuts)
-            calls += changes
-            changed |= changes > 0
-        changed |= elimCommonSub(ins) > 0
-        changed |= elimDeadCode(ins, reporting) > 0
-        changed |= elimUnreachableCode(ins) > 0
-        if changed:
-            code[i] = json.dumps(ins)
+            calls += callShortcuts(ins, shortcuts)
+        elimCommonSub(ins)
+        elimDeadCode(ins, reporting)
+        elimUnreachableCode(ins)
 
     log.info(f"optimize ir: {optimized} functions processed, {calls} call shortcuts")
 
@@ -960,11 +998,9 @@ def optimizeIR(code: list[Jsonable], *, shortcuts: dict[str, str], partial: bool
 class IRep(Language):
     """Generate JSON intermediate representation of backend code.
 
-    This class basically defer code generation calls using an intermediate JSON structure
-    to hold the function and its parameters.
-
-    NOTE this is currently pretty inefficient, with useless back and forth json encodings
-    that artificially preserve the initial Block (list[str]) and Expr (str) typing.
+    This class basically defer code generation calls using an intermediate structure
+    of IR nodes to hold the function and its parameters.
+    The IR is kept in memory, and is only serialized as JSON for display.
     """
 
     def __init__(self, lang: Language|None, *, debug: bool = False, if_optim: bool = True):
@@ -986,6 +1022,9 @@ class IRep(Language):
     def indent(self, block: Block, sep: bool = True) -> Block:
         raise Exception("indentation not a IR operation")
 
+    def code_to_str(self, code: Block) -> str:
+        return self._isep.join(json.dumps(i) if isinstance(i, IRNode) else i for i in code if i is not None) + "\n"
+
     # generic code generation
     def lcom(self, text: str = "") -> Block:
         return [ _j("co", text=text) ]
@@ -1175,7 +1214,7 @@ class IRep(Language):
         return [ _j("if", cond=_l(cond), true=_u(true), false=_u(false), likely=likely) ]
 
     def mif_stmt(self, cond_true: Conditionals, false: Block = []) -> Block:
-        return [ _j("ifs", cond_true=[ (_l(c), k, _u(b)) for c, k, b in cond_true ], false=_u(false)) ]
+        return [ _j("ifs", cond_true=[ [ _l(c), k, _u(b) ] for c, k, b in cond_true ], false=_u(false)) ]
 
     def sequence(self, seq: Block) -> Block:
         return [ _j("seq", seq=_u(seq)) ]
@@ -1246,6 +1285,9 @@ class IRep(Language):
     def sub_fun(self, name: str, body: Block, inline: bool = False) -> Block:
         return [ _j("sfu", name=name, body=_u(body), inline=inline) ]
 
+    def sub_profile(self, name: str, raw: str, key: str) -> Block:
+        return [ _j("spf", name=name, raw=raw, key=key) ]
+
     def def_cmap(self, name: str, mapping: dict[JsonScalar, str]) -> Block:
         return [ _j("dcm", name=name, mapping=_cmap2json(mapping)) ]
 
@@ -1302,7 +1344,7 @@ def _eval(jv: Jsonable, gen: Language) -> Block|Expr:
         # log.warning(f"{tag} -> {jv[tag]}")
         return _eval(jv[tag], gen)
 
-    if isinstance(jv, dict) and "o" in jv:
+    if isinstance(jv, IRNode):
         # introspection? generation? with a decorator?
         op = jv["o"]
         match op:
@@ -1402,6 +1444,7 @@ def _eval(jv: Jsonable, gen: Language) -> Block|Expr:
             # fun
             case "dfu": return gen.def_fun(name=jv["name"])
             case "sfu": return gen.sub_fun(name=jv["name"], body=ev("body"), inline=jv["inline"])
+            case "spf": return gen.sub_profile(name=jv["name"], raw=jv["raw"], key=jv["key"])
             # constant map
             case "dcm": return gen.def_cmap(name=jv["name"], mapping=_json2cmap(jv["mapping"]))
             case "scm": return gen.sub_cmap(name=jv["name"], mapping=_json2cmap(jv["mapping"]))
@@ -1426,8 +1469,8 @@ def _eval(jv: Jsonable, gen: Language) -> Block|Expr:
 
 def evaluate(ir: Code, lang: Language) -> Code:
     code = Code(lang, ir._entry, ir._executable, ir._package)
-    code._defs = _eval(_u(ir._defs), lang)
-    code._subs = _eval(_u(ir._subs), lang)
-    code._inis = _eval(_u(ir._inis), lang)
-    code._dels = _eval(_u(ir._dels), lang)
+    code._defs = _eval(_f(ir._defs), lang)
+    code._subs = _eval(_f(ir._subs), lang)
+    code._inis = _eval(_f(ir._inis), lang)
+    code._dels = _eval(_f(ir._dels), lang)
     return code
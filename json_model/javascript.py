@@ -10,11 +10,13 @@ class JavaScript(Language):
 
     def __init__(self, *,
                  debug: bool = False, relib: str = "re", with_predef: bool = True,
-                 with_path: bool = True, with_report: bool = True, with_comment: bool = True):
+                 with_path: bool = True, with_report: bool = True, with_comment: bool = True,
+                 regex_cache: int = 0, with_profile: bool = False):
 
         super().__init__(
             "JS",
              with_path=with_path, with_report=with_report, with_comment=with_comment,
+             with_profile=with_profile,
              with_predef=with_predef, not_op="!", and_op="&&", or_op="||", lcom="//",
              true="true", false="false", null="null", relib=relib,
              check_t="object", json_t="object", int_t="Number", float_t="Number",
@@ -25,6 +27,9 @@ class JavaScript(Language):
 
         self._json_esc_table = str.maketrans(_ESC_TABLE)
 
+        # per regex memoization of exec results, 0 for none
+        self._regex_cache = regex_cache
+
     #
     # file
     #
@@ -243,11 +248,24 @@ class JavaScript(Language):
     #
     # (Extended) Regular Expressions
     #
+    def _cached_re(self, opts: str) -> bool:
+        # global and sticky regexes are stateful, their results cannot be reused
+        return self._regex_cache > 0 and "g" not in opts and "y" not in opts
+
     def def_re(self, name: str, regex: str, opts: str) -> Block:
-        return [ f"const {name}_re = new runtime.RX({self.esc(regex)}, {self.esc(opts)})" ]
+        code = [ f"const {name}_re = new runtime.RX({self.esc(regex)}, {self.esc(opts)})" ]
+        if self._cached_re(opts):
+            code += [ f"const {name}_exec = runtime.jm_cached_exec({name}_re, {self._regex_cache})" ]
+        return code
+
+    def _profiled(self, fun: str, key: str) -> Expr:
+        return f"runtime.jm_profiled({fun}, {self.esc(key)})" if self._with_profile else fun
 
     def sub_re(self, name: str, regex: str, opts: str) -> Block:
-        return [ f"const {name} = (s) => {name}_re.exec(s) !== null" ]
+        key = f"/{regex}/{opts}"
+        if self._cached_re(opts):
+            return [ f"const {name} = " + self._profiled(f"(s) => {name}_exec(s) !== null", key) ]
+        return [ f"const {name} = " + self._profiled(f"(s) => {name}_re.exec(s) !== null", key) ]
 
     def match_var(self, var: str, val: Expr|None = None, declare: bool = False) -> Block:
         return self._var(var, val, "Array")
@@ -256,7 +274,7 @@ class JavaScript(Language):
         return self._var(var, val, "String")
 
     def match_re(self, name: str, var: str, regex: str, opts: str) -> BoolExpr:
-        return f"{name}_re.exec({var})"
+        return f"{name}_exec({var})" if self._cached_re(opts) else f"{name}_re.exec({var})"
 
     def match_val(self, mname: str, rname: str, sname: str, dname: str, declare: bool = False) -> Block:
         return [ f"{dname} = {mname}.groups[{self.esc(sname)}]" ]
@@ -294,6 +312,9 @@ class JavaScript(Language):
     def sub_fun(self, name: str, body: Block, inline: bool = False) -> Block:
         return [ f"function {name}(val, path, rep)" ] + self.indent(body)
 
+    def sub_profile(self, name: str, raw: str, key: str) -> Block:
+        return [ f"const {name} = {self._profiled(raw, key)}" ]
+
     def def_cmap(self, name: str, mapping: dict[JsonScalar, str]) -> Block:
         return [ f"let {name} = new Map()" ]
 
@@ -25,6 +25,9 @@ type PropMap = dict[str, str]
 type ConstList = list[None | bool | int | float | str]
 type ConstMap = dict[JsonScalar, str]
 type RegMap = dict[str, str]
+# incremental check of raw JSON: function or plan name, True for any value,
+# [item plan] for arrays, (prop plans, mandatory props, other props plan or None) for objects
+type StreamPlan = str | bool | list[StreamPlan] | tuple[dict[str, StreamPlan], list[str], StreamPlan | None]
 
 
 class Language:
@@ -74,6 +77,7 @@ class Language:
         with_predef: bool = True,
         with_comment: bool = True,
         with_hints: bool = True,
+        with_profile: bool = False,
         set_caps: tuple[type] = (str,),
     ):
         # parameter consistency
@@ -91,6 +95,7 @@ class Language:
         self._with_package = with_package
         self._with_predef = with_predef
         self._with_hints = with_hints
+        self._with_profile = with_profile
 
         # comparison operators
         self._eq = eq
@@ -594,7 +599,7 @@ class Language:
     # paths:
     #
     # fun(path: Path)
-    # lpath: Path = path + [ segment ]  # if path is not None, else None !
+    # lpath: Path = (path, segment)  # if path is not None, else None !
     # checker(val, lpath, ...)
     #
     # fun(Path* path)
@@ -707,6 +712,10 @@ class Language:
         """Generate a check function, with an inline request."""
         raise NotImplementedError("see derived classes")
 
+    def sub_profile(self, name: str, raw: str, key: str) -> Block:
+        """Generate a profiling wrapper name for check function raw, with stats under key."""
+        raise NotImplementedError("see derived classes")
+
     def def_strfun(self, name: str) -> Block:
         """Define a string check function."""
         return []
@@ -774,6 +783,17 @@ class Language:
         """Remove stuff for mapping."""
         return []
 
+    #
+    # STREAM PLANS FOR INCREMENTAL CHECKS ON RAW JSON
+    #
+    def def_splan(self, name: str, plan: StreamPlan | dict[str, StreamPlan]) -> Block:
+        """Declare a stream plan, or a mapping of stream plans."""
+        return []
+
+    def ini_splan(self, name: str, plan: StreamPlan | dict[str, StreamPlan]) -> Block:
+        """Initialize a stream plan, or a mapping of stream plans."""
+        return []
+
     #
     # FUNCTIONS
     #
@@ -857,6 +877,7 @@ class Code:
         self._dels: Block = []  # deallocation code
         self._subs: Block = []  # actual subroutines
         self._shortcuts = {}  # function shortcuts
+        self._optimized: set[int] = set()  # ids of already optimized IR instructions
 
     #
     # add blocks
@@ -879,12 +900,26 @@ class Code:
         """Add lines to cleanup code."""
         self._dels += b if b is not None else self._lang.skip()
 
+    def extend(self, code: "Code"):
+        """Append blocks from another code, eg a variant of the same model."""
+        self.defs(code._defs)
+        self.inis(code._inis)
+        self.dels(code._dels)
+        self.subs(code._subs)
+
     # TODO rename!
-    def sub(self, name: str, body: Block, *, comment: str = "", inline: bool = False):
-        """Add a function definition with a comment."""
+    def sub(self, name: str, body: Block, *, comment: str = "", inline: bool = False,
+            profile: str | None = None):
+        """Add a function definition with a comment, possibly profiled under a key."""
         self.defs(self._lang.def_fun(name))
         fun = self._lang.lcom(comment) if comment else []
-        fun += self._lang.sub_fun(name, body, inline=inline)
+        if profile is None:
+            fun += self._lang.sub_fun(name, body, inline=inline)
+        else:
+            # actual check under another name, called through the profiling wrapper
+            raw = f"{name}_raw"
+            fun += self._lang.sub_fun(raw, body, inline=inline)
+            fun += self._lang.sub_profile(name, raw, profile)
         self.subs(fun)
 
     def pmap(self, name: str, mapping: PropMap, public: bool = False):
@@ -915,6 +950,11 @@ class Code:
         self.dels(self._lang.del_re(name, regex, opts))
         self.subs(self._lang.sub_re(name, regex, opts))
 
+    def splan(self, name: str, plan: StreamPlan | dict[str, StreamPlan]):
+        """Add a stream plan."""
+        self.defs(self._lang.def_splan(name, plan))
+        self.inis(self._lang.ini_splan(name, plan))
+
     def strfun(self, name: str, body: Block):
         """Add a string function."""
         self.defs(self._lang.def_strfun(name))
@@ -6,9 +6,10 @@ import json
 
 from .mtypes import ModelPath, ModelTrafo, ModelRename, ModelDefs, ModelType
 from .mtypes import ModelError, Jsonable, JsonSchema, JsonObject
-from .utils import log, tname, PREDEF_RE, UUID_RE
-from .recurse import recModel, allFlt, noRwt, _recModel
+from .utils import log, tname, phase, PREDEF_RE, UUID_RE
+from .recurse import recModel, allFlt, noRwt, _recModel, path_list
 from .resolver import Resolver
+from .runtime.types import Path
 
 # FIXME
 JsonModel = typing.NewType("JsonModel", None)  # pyright: ignore
@@ -388,19 +389,23 @@ class JsonModel:
 
         if self._is_root:
             # loading twice, rewriting may add references…
-            self.allLoads()
-            self.rewrite()
+            with phase("load"):
+                self.allLoads()
+            with phase("rewrite"):
+                self.rewrite()
 
         if self._is_head:
             # hmmm… the above rewriting may have changed external dependencies,
             # probably it would be enough to rewrite only the changed externals,
             # but which one were changed is not visible from here so we load again
             # everything, just in case.
-            for mid in reversed(list(self._head._models.keys())):  # pyright: ignore
-                jm = self._head._models[mid]  # pyright: ignore
-                if jm._is_root:
-                    jm.allLoads()
-            self.scope(self._globs, [], set(), {})
+            with phase("load"):
+                for mid in reversed(list(self._head._models.keys())):  # pyright: ignore
+                    jm = self._head._models[mid]  # pyright: ignore
+                    if jm._is_root:
+                        jm.allLoads()
+            with phase("scope"):
+                self.scope(self._globs, [], set(), {})
             # _ = self._debug and log.debug(f"globs = {self._globs}")
             self.unload()
 
@@ -463,16 +468,16 @@ class JsonModel:
             return jm
 
         # substitute $<URL>#... with $__external_X#...
-        def ldRwt(model: ModelType, path: ModelPath) -> ModelType:
+        def ldRwt(model: ModelType, path: Path) -> ModelType:
 
             if isinstance(model, str) and self._isUrlRef(model):
-                log.debug(f"{self._id}: ldRwt at {path} with {model}")
+                log.debug(f"{self._id}: ldRwt at {path_list(path)} with {model}")
                 assert self._externs is not None  # pyright hint
                 if "#" in model:
                     model, frag = model.split("#", 1)
                 else:
                     frag = None
-                ext = follow(model, path)
+                ext = follow(model, path_list(path))
                 name = f"__external_{len(self._externs)}"
                 self._defs[name] = ext
                 self._externs.append(ext)
@@ -497,10 +502,10 @@ class JsonModel:
                 self._defs[name] = follow(model, [name])
 
             # look for other external references in the model definitions
-            _recModel(self._defs[name]._model, [name], allFlt, ldRwt, True, False)
+            _recModel(self._defs[name]._model, ((), name), allFlt, ldRwt, True, False, True)
 
         # look for external references in the main model
-        _recModel(self._model, [], allFlt, ldRwt, True, True)
+        _recModel(self._model, (), allFlt, ldRwt, True, True, True)
 
         log.debug(f"{self._id}: OUT allLoads on {self._url}")
 
@@ -551,7 +556,7 @@ class JsonModel:
     def noComment(self, model: ModelType):
         """Remove non trivial comments."""
 
-        def rmComments(m: ModelType, p: ModelPath):
+        def rmComments(m: ModelType, p: Path):
             if isinstance(m, list):
                 return list(filter(lambda i: not isinstance(i, str) or not i.startswith("#"), m))
             elif isinstance(m, dict):
@@ -562,7 +567,7 @@ class JsonModel:
             else:
                 return m
 
-        return recModel(model, allFlt, rmComments)
+        return recModel(model, allFlt, rmComments, lazy=True)
 
     #
     # Display
@@ -919,10 +924,10 @@ class JsonModel:
                 jm.scope(symbols, root + [name], visited, references)
 
         # update map of local references to global references
-        def globRwt(m: ModelType, p: ModelPath) -> ModelType:
+        def globRwt(m: ModelType, p: Path) -> ModelType:
             if isinstance(m, str):
                 if self._isSimpleRef(m):
-                    jm = self.resolveRef(m, p + [m])
+                    jm = self.resolveRef(m, path_list(p) + [m])
                     if jm._id in references:
                         gref = references[jm._id]
                     else:
@@ -940,12 +945,12 @@ class JsonModel:
                     #     jm._defs.gset(gref, gref)
                 elif self._isUrlRef(m):
                     if m not in symbols:
-                        symbols[m] = self.resolveRef(m, p + [m])
+                        symbols[m] = self.resolveRef(m, path_list(p) + [m])
                     if not self._defs.ghas(m):
                         self._defs.gset(m, m)
             return m
 
-        self._model = recModel(self._model, allFlt, globRwt, True)
+        self._model = recModel(self._model, allFlt, globRwt, True, lazy=True)
 
     #
     # Rename and Rewrite Transformations
@@ -957,7 +962,7 @@ class JsonModel:
         if root and not self._name:
             return model
 
-        def rnFlt(m: ModelType, path: ModelPath) -> bool:
+        def rnFlt(m: ModelType, path: Path) -> bool:
             if isinstance(m, dict):
                 remove, added = set(), {}
                 for k, v in m.items():
@@ -973,7 +978,7 @@ class JsonModel:
                 m.update(**added)
             return True
 
-        return recModel(model, rnFlt, noRwt)
+        return recModel(model, rnFlt, noRwt, lazy=True)
 
     # FIXME parsing should conform to JSON Path
     # TODO think transformation path spec
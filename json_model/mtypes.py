@@ -1,4 +1,5 @@
 import typing
+from .runtime.types import Path
 
 # JSON types
 type Number = int|float
@@ -20,6 +21,9 @@ type ModelTrafo = ModelType
 type ModelRename = dict[str, str]
 type ModelFilter = typing.Callable[[ModelType, ModelPath], bool]
 type ModelRewrite = typing.Callable[[ModelType, ModelPath], ModelType]
+# callbacks of lazy recursions get a linked path, see recurse.path_list
+type LazyModelFilter = typing.Callable[[ModelType, Path], bool]
+type LazyModelRewrite = typing.Callable[[ModelType, Path], ModelType]
 
 type CheckFun = typing.Callable[[ValueType, str], bool]
 type KeyCheckFun = typing.Callable[[str, ValueType, str], bool|None]
@@ -5,9 +5,10 @@ import copy
 
 from .mtypes import ModelType, ModelPath
 from .utils import log, tname, merge_objects
-from .recurse import recModel, allFlt, builtFlt, noRwt
+from .recurse import recModel, allFlt, builtFlt, noRwt, path_list
 from .model import JsonModel
 from . import analyze
+from .runtime.types import Path
 
 # - inline defs inside +
 # - distribute + over | and ^
@@ -17,7 +18,7 @@ def _mergeInlining(jm: JsonModel):
 
     changes = 0
 
-    def miFlt(model: ModelType, path: ModelPath) -> bool:
+    def miFlt(model: ModelType, path: Path) -> bool:
 
         def inline(m: ModelType, p: ModelPath):
             nonlocal changes
@@ -42,9 +43,9 @@ def _mergeInlining(jm: JsonModel):
                         log.warning("should not combine models with distinct int/float looseness: "
                                     f"{jm._url} and {jmr._url}")
                     # substitute local references
-                    def subRefRwt(m, p):
+                    def subRefRwt(m: ModelType, _p: Path) -> ModelType:
                         return jmr._defs.gget(m) if jmr._isRef(m) else m
-                    return recModel(mo, allFlt, subRefRwt, True)
+                    return recModel(mo, allFlt, subRefRwt, True, lazy=True)
                 else:  # keep as is
                     return mo
             else:
@@ -54,11 +55,11 @@ def _mergeInlining(jm: JsonModel):
         if isinstance(model, dict) and "+" in model:
             plus = model["+"]
             assert isinstance(plus, list)  # pyright hint
-            model["+"] = [inline(n, path + ["+", i]) for i, n in enumerate(plus)]
+            model["+"] = [inline(n, path_list(path) + ["+", i]) for i, n in enumerate(plus)]
 
         return True
 
-    jm._model = recModel(jm._model, miFlt, noRwt, True)
+    jm._model = recModel(jm._model, miFlt, noRwt, True, lazy=True)
 
     log.debug(f"{jm._id}: merge inline {changes}")
 
@@ -71,7 +72,7 @@ def _mergeDistribute(jm: JsonModel):
     def isAlt(m: ModelType) -> bool:
         return isinstance(m, dict) and ("|" in m or "^" in m)
 
-    def mdFlt(model: ModelType, path: ModelPath) -> bool:
+    def mdFlt(model: ModelType, path: Path) -> bool:
         # +( |(A B) C ) -> |( +(A C) +(B C) )
         nonlocal changes
 
@@ -111,7 +112,7 @@ def _mergeDistribute(jm: JsonModel):
 
         return dive
 
-    jm._model = recModel(jm._model, mdFlt, noRwt)
+    jm._model = recModel(jm._model, mdFlt, noRwt, lazy=True)
 
     log.debug(f"{jm._id}: merge distribute {changes}")
 
@@ -122,14 +123,14 @@ def _mergeObjects(jm: JsonModel):
 
     changes = 0
 
-    def moRwt(model: ModelType, path: ModelPath) -> ModelType:
+    def moRwt(model: ModelType, path: Path) -> ModelType:
         nonlocal changes
         if not isinstance(model, dict) or "+" not in model:
             return model
         changes += 1
         plus = model["+"]
         assert isinstance(plus, list)  # pyright hint
-        merged = merge_objects(plus, path + ["+"])  # pyright: ignore
+        merged = merge_objects(plus, path_list(path) + ["+"])  # pyright: ignore
         del model["+"]
         if len(model) > 0:
             model["@"] = merged
@@ -138,7 +139,7 @@ def _mergeObjects(jm: JsonModel):
             model.update(merged)
         return model
 
-    jm._model = recModel(jm._model, builtFlt, moRwt)
+    jm._model = recModel(jm._model, builtFlt, moRwt, lazy=True)
 
     log.debug(f"{jm._id}: merge objects {changes}")
 
@@ -3,13 +3,16 @@
 #
 import copy
 
-from .mtypes import ModelPath, ModelType
+from typing import Callable
+
+from .mtypes import ModelPath, ModelType, LazyModelRewrite
 from .utils import log, is_cst, _structurally_distinct_models
 from .utils import constant_values, same_model, model_in_models, is_a_simple_object
-from .recurse import recModel, allFlt, builtFlt, noRwt
+from .recurse import recModel, allFlt, builtFlt, noRwt, subModels, renameKey, path_list
 from .model import JsonModel
 from .analyze import ultimate_type
 from .runtime import ConstSet
+from .runtime.types import Path
 
 def real_equal(i, j) -> bool:  # avoid True == 1 and 0.0 == 0…
     return type(i) is type(j) and i == j
@@ -87,12 +90,12 @@ def _simple_open_object(model: ModelType, jm: JsonModel, path: ModelPath) -> lis
     else:
         return None
 
-def and_not_simpler(jm: JsonModel) -> bool:
+def _and_not_simpler(jm: JsonModel) -> tuple[LazyModelRewrite, Callable[[], int]]:
     """Change and(X, xor(ANY, ...)) to xor(X, ...)."""
 
     changes = 0
 
-    def ansRwt(model: ModelType, path: ModelPath) -> ModelType:
+    def ansRwt(model: ModelType, path: Path) -> ModelType:
         nonlocal changes
         if isinstance(model, dict) and "&" in model:
             ands = model["&"]
@@ -111,22 +114,24 @@ def and_not_simpler(jm: JsonModel) -> bool:
             model["^"] = list(map(lambda i: contain if i == "$ANY" else i, m["^"]))
         return model
 
-    jm._model = recModel(jm._model, builtFlt, ansRwt)
+    return ansRwt, lambda: changes
 
-    log.debug(f"{jm._id}: ans {changes}")
-    return changes > 0
+def and_not_simpler(jm: JsonModel) -> bool:
+    """Change and(X, xor(ANY, ...)) to xor(X, ...)."""
+    return _sweep(jm, "and_not_simpler")
 
-def and_to_merge(jm: JsonModel) -> bool:
+def _and_to_merge(jm: JsonModel) -> tuple[LazyModelRewrite, Callable[[], int]]:
     """Change and to less costly merge if possible."""
 
     changes = 0
 
-    def a2mRwt(model: ModelType, path: ModelPath) -> ModelType:
+    def a2mRwt(model: ModelType, path: Path) -> ModelType:
         nonlocal changes
         if isinstance(model, dict) and "&" in model:
             land = model["&"]
             assert isinstance(land, list)
-            lobj: list[list[str]|None] = list(map(lambda i: _simple_open_object(i, jm, path), land))
+            lpath = path_list(path)
+            lobj: list[list[str]|None] = list(map(lambda i: _simple_open_object(i, jm, lpath), land))
             if all(map(lambda i: i is not None, lobj)):
                 # property intersection
                 sprops, nprops = set(), 0
@@ -142,20 +147,21 @@ def and_to_merge(jm: JsonModel) -> bool:
                 # else property collision, probably not safe
         return model
 
-    jm._model = recModel(jm._model, builtFlt, a2mRwt)
+    return a2mRwt, lambda: changes
 
-    log.debug(f"{jm._id}: a2m {changes}")
-    return changes > 0
+def and_to_merge(jm: JsonModel) -> bool:
+    """Change and to less costly merge if possible."""
+    return _sweep(jm, "and_to_merge")
 
-def xor_to_or(jm: JsonModel) -> bool:
+def _xor_to_or(jm: JsonModel) -> tuple[LazyModelRewrite, Callable[[], int]]:
     """Change xor to less coslty or if possible."""
 
     changes = 0
 
-    def x2oRwt(model: ModelType, path: ModelPath) -> ModelType:
+    def x2oRwt(model: ModelType, path: Path) -> ModelType:
         nonlocal changes
         if isinstance(model, dict) and "^" in model:
-            xor, lpath = model["^"], path + ["^"]
+            xor, lpath = model["^"], path_list(path) + ["^"]
             assert isinstance(xor, list) and "|" not in model
 
             consts = [constant_values(m, lpath + [i]) for i, m in enumerate(xor)]
@@ -192,21 +198,21 @@ def xor_to_or(jm: JsonModel) -> bool:
 
         return model
 
-    jm._model = recModel(jm._model, builtFlt, x2oRwt)
-
-    log.debug(f"{jm._id}: x2o {changes}")
+    return x2oRwt, lambda: changes
 
-    return changes > 0
+def xor_to_or(jm: JsonModel) -> bool:
+    """Change xor to less coslty or if possible."""
+    return _sweep(jm, "xor_to_or")
 
 def is_str_cst(m: ModelType) -> bool:
     return isinstance(m, str) and m and m[0] not in "$/="
 
 # TODO generalize if useful
-def notor_to_not(jm: JsonModel) -> bool:
+def _notor_to_not(jm: JsonModel) -> tuple[LazyModelRewrite, Callable[[], int]]:
     """Change xor(gen, or(constants…)) to xor(gen, constants…)"""
     changes = 0
 
-    def no2nRwt(model: ModelType, path: ModelPath) -> ModelType:
+    def no2nRwt(model: ModelType, path: Path) -> ModelType:
         nonlocal changes
         if isinstance(model, dict) and "^" in model:
             lox = model["^"]
@@ -226,17 +232,18 @@ def notor_to_not(jm: JsonModel) -> bool:
                 model["^"] = [lox[gen_idx]] + lor
         return model
 
-    jm._model = recModel(jm._model, builtFlt, no2nRwt)
+    return no2nRwt, lambda: changes
 
-    log.debug(f"{jm._id}: no2n {changes}")
-    return changes > 0
+def notor_to_not(jm: JsonModel) -> bool:
+    """Change xor(gen, or(constants…)) to xor(gen, constants…)"""
+    return _sweep(jm, "notor_to_not")
 
-def flatten(jm: JsonModel) -> bool:
+def _flatten(jm: JsonModel) -> tuple[LazyModelRewrite, Callable[[], int]]:
     """Flatten or, xor, and and merge operators."""
 
     changes = 0
 
-    def flatRwt(model: ModelType, path: ModelPath) -> ModelType:
+    def flatRwt(model: ModelType, path: Path) -> ModelType:
         nonlocal changes
         for op in ("|", "&", "^", "+"):
             if isinstance(model, dict) and op in model:
@@ -260,21 +267,21 @@ def flatten(jm: JsonModel) -> bool:
                     model[op] = nmodels
         return model
 
-    jm._model = recModel(jm._model, builtFlt, flatRwt)
-
-    log.debug(f"{jm._id}: flatten {changes}")
+    return flatRwt, lambda: changes
 
-    return changes > 0
+def flatten(jm: JsonModel) -> bool:
+    """Flatten or, xor, and and merge operators."""
+    return _sweep(jm, "flatten")
 
-def const_prop(jm: JsonModel):
+def _const_prop(jm: JsonModel) -> tuple[LazyModelRewrite, Callable[[], int]]:
     """Propagate constants and predefs to their references."""
 
     changes = 0
 
-    def cpRwt(model: ModelType, path: ModelPath) -> ModelType:
+    def cpRwt(model: ModelType, path: Path) -> ModelType:
         nonlocal changes
         if jm._isRef(model):
-            jmp = jm.resolveRef(model, path)
+            jmp = jm.resolveRef(model, path_list(path))
             if jm._isPredef(jmp._model):
                 changes += 1
                 return jmp._model
@@ -283,11 +290,11 @@ def const_prop(jm: JsonModel):
                 return jmp._model
         return model
 
-    jm._model = recModel(jm._model, allFlt, cpRwt, True)
-
-    log.debug(f"{jm._id}: constant propagation {changes}")
+    return cpRwt, lambda: changes
 
-    return changes > 0
+def const_prop(jm: JsonModel) -> bool:
+    """Propagate constants and predefs to their references."""
+    return _sweep(jm, "const_prop")
 
 # TODO normalization?
 ANY_PROP = [
@@ -296,7 +303,7 @@ ANY_PROP = [
     "/.*$/s", "/.*$/", "/.*/s", "/^.*/s", "/^.*/", "/^.*$/s", "/.*/", "//s", "//",
 ]
 
-def partial_eval(jm: JsonModel):
+def _partial_eval(jm: JsonModel) -> tuple[LazyModelRewrite, Callable[[], int]]:
     """Model partial evaluation."""
 
     changes = 0
@@ -307,17 +314,21 @@ def partial_eval(jm: JsonModel):
 
     def deduplicate(lv):
         # return list(set(l))  # too easy: {True, 1} == {True}
-        # TODO use an extended ConstSet?
-        n = []
+        # so scalars are tagged with their type, containers are scanned
+        n, seen = [], set()
         for i in lv:
-            if not any(map(lambda x: real_equal(x, i), n)):
+            if isinstance(i, (list, dict)):
+                if not any(map(lambda x: real_equal(x, i), n)):
+                    n.append(i)
+            elif (key := (type(i), i)) not in seen:
+                seen.add(key)
                 n.append(i)
         return n
 
-    def evalRwt(model: ModelType, path: ModelPath) -> ModelType:
+    def evalRwt(model: ModelType, path: Path) -> ModelType:
         nonlocal changes
         if isinstance(model, str) and jm._isRef(model):
-            jms = jm.resolveRef(model, path)
+            jms = jm.resolveRef(model, path_list(path))
             if isinstance(jms._model, str) and jms._isPredef(jm._model):
                 changes += 1
                 return jms._model
@@ -466,7 +477,7 @@ def partial_eval(jm: JsonModel):
                 # constraint without actual constraints
                 if not (set(model.keys()) - {"#", "~", "$", "%", "@"}):
                     # keep directives
-                    if path == [] and "#" in model:
+                    if not path and "#" in model:
                         assert isinstance(model["#"], str)
                         if "JSON_MODEL_" in model["#"]:
                             return model
@@ -542,10 +553,11 @@ def partial_eval(jm: JsonModel):
                     del model[kept]
         return model
 
-    jm._model = recModel(jm._model, allFlt, evalRwt)
+    return evalRwt, lambda: changes
 
-    log.debug(f"{jm._id}: eval {changes}")
-    return changes > 0
+def partial_eval(jm: JsonModel) -> bool:
+    """Model partial evaluation."""
+    return _sweep(jm, "partial_eval")
 
 # NOTE could also follow empty @
 # TODO think about handling externals?
@@ -565,23 +577,23 @@ def _contains_ref(model: ModelType, ref: str) -> bool:
     """Tell whether there is a reference inside model."""
     seen = False
 
-    def containFlt(m: ModelType, path: ModelPath) -> bool:
+    def containFlt(m: ModelType, path: Path) -> bool:
         nonlocal seen
         if isinstance(m, str) and m == ref:
             seen = True
         return not seen
 
-    recModel(model, containFlt, noRwt)
+    recModel(model, containFlt, noRwt, lazy=True)
 
     return seen
 
 # FIXME probably some corner case issues
-def simplify(jm: JsonModel):
+def _simplify(jm: JsonModel) -> tuple[LazyModelRewrite, Callable[[], int]]:
     """Simplify properties and constraints in some cases."""
 
     changes: int = 0
 
-    def simpRwt(model: ModelType, path: ModelPath) -> ModelType:
+    def simpRwt(model: ModelType, path: Path) -> ModelType:
         nonlocal changes
         if isinstance(model, dict):
             for old, new in [ ("//", ""), ("/^$/", "?")]:
@@ -601,7 +613,7 @@ def simplify(jm: JsonModel):
                     for op in ("<=", "<", "=", "!=", ">", ">="):
                         if op in model and isinstance(model[op], str):
                             # raise ModelError("str constraint for non str model")
-                            log.warning(f"unexpected str constraint at {path}")
+                            log.warning(f"unexpected str constraint at {path_list(path)}")
                             changes += 1
                             return "$NONE"
                 # detect redundant or infeasible int constraints
@@ -732,20 +744,98 @@ def simplify(jm: JsonModel):
                     del model[">="]
         return model
 
-    jm._model = recModel(jm._model, allFlt, simpRwt)
+    return simpRwt, lambda: changes
 
-    return changes > 0
+def simplify(jm: JsonModel) -> bool:
+    """Simplify properties and constraints in some cases."""
+    return _sweep(jm, "simplify")
+
+# rules in application order, with whether they apply to scalars and to key references
+RULES: dict[str, tuple[Callable[[JsonModel], tuple[LazyModelRewrite, Callable[[], int]]], bool, bool]] = {
+    "const_prop": (_const_prop, True, True),
+    "simplify": (_simplify, True, False),
+    "partial_eval": (_partial_eval, True, False),
+    "flatten": (_flatten, False, False),
+    "and_not_simpler": (_and_not_simpler, False, False),
+    "and_to_merge": (_and_to_merge, False, False),
+    "xor_to_or": (_xor_to_or, False, False),
+    "notor_to_not": (_notor_to_not, False, False),
+}
+
+def _sweep(jm: JsonModel, name: str) -> bool:
+    """Apply one rule once on the whole model."""
+    make, scalars, keys = RULES[name]
+    rwt, fired = make(jm)
+    jm._model = recModel(jm._model, allFlt if scalars else builtFlt, rwt, keys, lazy=True)
+    log.debug(f"{jm._id}: {name} {fired()}")
+    return fired() > 0
+
+def optimize(jm: JsonModel, *, debug: bool = False) -> tuple[int, int]:
+    """Optimize model up to a fixpoint of all rules, return rules fired and nodes visited.
+
+    Rules are applied in turn bottom-up as whole model sweeps, but a sweep skips
+    sub-models on which its rule did not fire and which did not change since,
+    so that only changed sub-models and their ancestors are revisited.
+    """
+    counts: list[Callable[[], int]] = []
+    # per rule, containers on which it does not fire, kept alive so that ids are not reused
+    clean: list[dict[int, ModelType]] = []
+    visited = 0
+
+    def dirty(model: ModelType):
+        for done in clean:
+            done.pop(id(model), None)
+
+    def sweeper(rwt: LazyModelRewrite, count: Callable[[], int], scalars: bool, keys: bool,
+                done: dict[int, ModelType]):
+        """Build bottom-up application of one rule on unclean sub-models."""
+
+        def sweep(model: ModelType, path: Path) -> tuple[ModelType, bool]:
+            """Apply rule, tell whether the model changed."""
+            nonlocal visited
+            visited += 1
+            changed = False
+            for key in subModels(model):
+                sub = model[key]  # type: ignore
+                if id(sub) in done or not scalars and not isinstance(sub, (list, dict)):
+                    continue
+                model[key], sub_changed = sweep(sub, (path, key))  # type: ignore
+                changed |= sub_changed
+            before = count()
+            if keys and isinstance(model, dict):
+                for prop in list(model.keys()):
+                    if prop != "" and prop[0] == "$":
+                        renameKey(model, prop, rwt(prop, (path, prop)), path_list((path, prop)))  # type: ignore
+            nmodel = rwt(model, path)
+            if count() != before:
+                changed = True
+                # the rule may have updated direct sub-models in place
+                for key in subModels(nmodel):
+                    dirty(nmodel[key])  # type: ignore
+            if changed:
+                dirty(model)
+                dirty(nmodel)
+            elif isinstance(nmodel, (list, dict)):
+                done[id(nmodel)] = nmodel
+            return nmodel, changed
+
+        return sweep
+
+    sweeps = []
+    for make, scalars, keys in RULES.values():
+        rwt, count = make(jm)
+        counts.append(count)
+        clean.append({})
+        sweeps.append((sweeper(rwt, count, scalars, keys, clean[-1]), scalars))
 
-def optimize(jm: JsonModel, *, debug: bool = False):
-    """Optimize model, probably not very efficient."""
     changed = True
     while changed:
         changed = False
-        changed |= const_prop(jm)
-        changed |= simplify(jm)
-        changed |= partial_eval(jm)
-        changed |= flatten(jm)
-        changed |= and_not_simpler(jm)
-        changed |= and_to_merge(jm)
-        changed |= xor_to_or(jm)
-        changed |= notor_to_not(jm)
+        for (sweep, scalars), done in zip(sweeps, clean):
+            if id(jm._model) not in done and (scalars or isinstance(jm._model, (list, dict))):
+                jm._model, rule_changed = sweep(jm._model, ())
+                changed |= rule_changed
+
+    fired = sum(count() for count in counts)
+    log.debug(f"{jm._id}: optimize fired {fired} rules on {visited} nodes")
+    return fired, visited
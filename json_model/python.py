@@ -1,4 +1,4 @@
-from .language import Language, Block, Var, PropMap, ConstList
+from .language import Language, Block, Var, PropMap, ConstList, StreamPlan
 from .language import BoolExpr, JsonExpr, Expr, IntExpr, PathExpr, JsonScalar, StrExpr
 from .mtypes import Number, TestHint, Conditionals
 # from .utils import log
@@ -9,16 +9,30 @@ class Python(Language):
 
     def __init__(self, *, relib: str = "re2",
                  debug: bool = False, with_report: bool = True, with_path: bool = True,
-                 with_predef: bool = True):
+                 with_predef: bool = True, regex_cache: int = 0, dual: bool = False,
+                 stream: bool = False, lazy: bool = False, with_profile: bool = False):
 
         super().__init__("Python", relib=relib, debug=debug,
-                         with_report=with_report, with_path=with_path, with_predef=with_predef)
+                         with_report=with_report, with_path=with_path, with_predef=with_predef,
+                         with_profile=with_profile)
 
         assert relib in ("re", "re2"), f"support for re and re2, not {relib}"
 
         # TODO check actual use to desactivate
         self._setmap_used = True
 
+        # per regex memoization of search results, 0 for none
+        self._regex_cache = regex_cache
+
+        # both fast and reporting check functions are generated
+        self._dual = dual
+
+        # entry point for incremental checks on raw JSON
+        self._stream = stream
+
+        # regexes are compiled on first use, and the module initializes itself on import
+        self._lazy = lazy
+
     def is_num(self, var: Var) -> BoolExpr:
         return f"isinstance({var}, (int, float)) and not isinstance({var}, bool)"
 
@@ -88,11 +102,17 @@ class Python(Language):
             f"__version__ = {self.esc(self.version())}",
             "",
         ]
-        code += self.file_load("python_entry.py")  # too early?
+        # too early?
+        code += self.file_load("python_dual_entry.py" if self._dual else "python_entry.py")
+        if self._stream:
+            code += self.file_load("python_stream_entry.py")
         return code
 
     def file_footer(self, exe: bool = True) -> Block:
-        return self.file_load("python_main.py") if exe else []
+        code: Block = self.file_load("python_lazy.py") if self._lazy else []
+        if exe:
+            code += self.file_load("python_dual_main.py" if self._dual else "python_main.py")
+        return code
 
     def clean_report(self) -> Block:
         return [ "rep is None or rep.clear()" ]
@@ -137,13 +157,11 @@ class Python(Language):
         # avoid nested if expressions
         pvar = f"({pvar})" if " if " in pvar else pvar
         sseg = pseg if is_var else self.esc(pseg) if is_prop else pseg
-        return f"({pvar} + [ {sseg} ]) if {pvar} is not None else None" if self._with_path else "None"
+        return f"({pvar}, {sseg}) if {pvar} is not None else None" if self._with_path else "None"
 
     def path_lvar(self, lvar: Var, rvar: Var) -> PathExpr:
-        # avoid nested if expressions
-        rvar = f"({rvar})" if " if " in rvar else rvar
-        lvar = f"({lvar})" if " if " in lvar else lvar
-        return f"{lvar} if {rvar} is not None else None" if self._with_path else "None"
+        # lvar is already None when rvar is None, see path_val
+        return lvar if self._with_path else "None"
 
     def is_reporting(self) -> BoolExpr:
         return "rep is not None"
@@ -194,6 +212,38 @@ class Python(Language):
                     for p, f in pmap.items()
                 ] + [ "}" ]
 
+    def _profiled(self, fun: str, key: str) -> Expr:
+        return f"profiled({fun}, {self.esc(key)})" if self._with_profile else fun
+
+    def sub_profile(self, name: str, raw: str, key: str) -> Block:
+        return [ f"{name} = {self._profiled(raw, key)}" ]
+
+    def _splan(self, plan: StreamPlan) -> Expr:
+        if plan is True:
+            return "True"
+        elif isinstance(plan, str):
+            return plan
+        elif isinstance(plan, list):
+            return f"[{self._splan(plan[0])}]"
+        props, must, other = plan
+        sprops = ", ".join(f"{self.esc(p)}: {self._splan(m)}" for p, m in props.items())
+        smust = "{" + ", ".join(self.esc(p) for p in must) + "}" if must else "set()"
+        sother = self._splan(other) if other is not None else "None"
+        return f"({{{sprops}}}, {smust}, {sother})"
+
+    def def_splan(self, name: str, plan: StreamPlan | dict[str, StreamPlan]) -> Block:
+        return [ f"{name}: " + ("dict[str, StreamPlan]" if isinstance(plan, dict) else "StreamPlan") ]
+
+    def ini_splan(self, name: str, plan: StreamPlan | dict[str, StreamPlan]) -> Block:
+        if not isinstance(plan, dict):
+            return [ f"global {name}", f"{name} = {self._splan(plan)}" ]
+        return [
+            f"global {name}",
+            f"{name} = {{" ] + [
+                (self._indent + self.esc(p) + ": " + self._splan(m) + ",")
+                    for p, m in plan.items()
+                ] + [ "}" ]
+
     def def_cset(self, name: str, constants: ConstList) -> Block:
         return [ f"{name}: set[str]" ]
 
@@ -220,6 +270,12 @@ class Python(Language):
         ] + self.indent(body)
 
     def def_re(self, name: str, regex: str, opts: str) -> Block:
+        if self._regex_cache:
+            return [
+                f"{name}_reco: object",
+                f"{name}_search: object",
+                f"{name}: RegexFun"
+            ]
         return [
             # NOTE re2 imported as re
             f"{name}_reco: object",
@@ -229,14 +285,32 @@ class Python(Language):
     def ini_re(self, name: str, regex: str, opts: str) -> Block:
         self._re_used = True
         sregex = self.esc((f"(?{opts})" if opts else "") + regex)
+        reco = f"LazyRegex(re, {sregex})" if self._lazy else f"re.compile({sregex})"
+        key = f"/{regex}/{opts}"
+        if self._regex_cache:
+            # search results (match objects) are memoized, which works with re2
+            # and with extended regex functions which extract groups
+            return [
+                f"global {name}_reco, {name}_search, {name}",
+                f"{name}_reco = {reco}",
+                f"{name}_search = cached_search({name}_reco, {self._regex_cache})",
+                f"{name} = " + self._profiled(f"lambda s, p, r: {name}_search(s) is not None", key)
+            ]
         return [
             f"global {name}_reco, {name}",
             # rex engine imported as re; may raise an exception
-            f"{name}_reco = re.compile({sregex})",
-            f"{name} = lambda s, p, r: {name}_reco.search(s) is not None"
+            f"{name}_reco = {reco}",
+            f"{name} = " + self._profiled(f"lambda s, p, r: {name}_reco.search(s) is not None", key)
         ]
 
     def del_re(self, name: str, regex: str, opts: str) -> Block:
+        if self._regex_cache:
+            return [
+                f"global {name}_reco, {name}_search, {name}",
+                f"{name}_reco = None",
+                f"{name}_search = None",
+                f"{name} = None"
+            ]
         return [
             f"global {name}_reco, {name}",
             f"{name}_reco = None",
@@ -244,7 +318,7 @@ class Python(Language):
         ]
 
     def match_re(self, name: str, var: str, regex: str, opts: str) -> BoolExpr:
-        return f"{name}_reco.search({var})"
+        return f"{name}_search({var})" if self._regex_cache else f"{name}_reco.search({var})"
 
     def match_val(self, mname: str, rname: str, sname: str, dname: str, declare: bool = False) -> Block:
         decl = ": str" if declare else ""
@@ -4,8 +4,10 @@
 # TODO multi recurse?
 # TODO allow extending the parameterization
 #
-from .mtypes import ModelType, ModelPath, ModelFilter, ModelRewrite, ModelError
+from .mtypes import ModelType, ModelPath, ModelFilter, ModelRewrite, LazyModelFilter, LazyModelRewrite, ModelError
 from .utils import log, is_obj_model
+from .runtime.types import Path
+from .runtime.support import _path_list as path_list
 
 ROOT_KEYWORDS = {"~", "$", "%"}
 # .mo and .in are extensions
@@ -21,109 +23,130 @@ ALL_KEYWORDS = NO_MODEL_KEYWORDS | MODEL_KEYWORD | MODEL_LIST_KEYWORDS | MODEL_V
 
 def _recModel(
         model: ModelType,
-        path: ModelPath,
-        flt: ModelFilter,
-        rwt: ModelRewrite,
+        path: ModelPath|Path,
+        flt: ModelFilter|LazyModelFilter,
+        rwt: ModelRewrite|LazyModelRewrite,
         keys: bool,
         root: bool,
+        lazy: bool = False,
     ) -> ModelType:
 
-    if not flt(model, path):
+    if not flt(model, path):  # type: ignore
         return model
 
     # log.debug(f"recurring at {path}")
 
     # actual recursion
     if isinstance(model, list):
-        return rwt([_recModel(m, path + [i], flt, rwt, keys, False) for i, m in enumerate(model)], path)
+        lmodel = [_recModel(m, (path, i) if lazy else path + [i], flt, rwt, keys, False, lazy)  # type: ignore
+                  for i, m in enumerate(model)]
+        return lmodel if rwt is noRwt else rwt(lmodel, path)  # type: ignore
     elif isinstance(model, dict):
         mkeys: list[str] = list(model.keys())
         for prop in mkeys:
             val = model[prop]
-            lpath = path + [prop]
-            assert isinstance(prop, str), f"properties are strings {lpath}"
+            lpath = (path, prop) if lazy else path + [prop]  # type: ignore
+            assert isinstance(prop, str), f"properties are strings {path_list(lpath)}"
             if prop in MODEL_KEYWORD:
                 okprops = {prop} | ANYWHERE_KEYWORDS | CONSTRAINT_KEYWORDS
                 if root:
                     okprops.update(ROOT_KEYWORDS)
-                assert is_obj_model(model, okprops), f"@ restricts other keywords {lpath}"
-                model[prop] = _recModel(val, lpath, flt, rwt, keys, False)
+                assert is_obj_model(model, okprops), f"@ restricts other keywords {path_list(lpath)}"
+                model[prop] = _recModel(val, lpath, flt, rwt, keys, False, lazy)
             elif prop in NO_MODEL_KEYWORDS:
                 # some sanity checks in passing
                 if prop == "#":
-                    assert isinstance(val, str), f"# is a string {lpath}"
+                    assert isinstance(val, str), f"# is a string {path_list(lpath)}"
                 elif prop == "~":
-                    assert root and isinstance(val, str), f"~ is a string at root {lpath}"
+                    assert root and isinstance(val, str), f"~ is a string at root {path_list(lpath)}"
                 elif prop == "!":
-                    assert isinstance(val, bool), f"! is a bool {lpath}"
+                    assert isinstance(val, bool), f"! is a bool {path_list(lpath)}"
                 elif prop == "/":
-                    assert isinstance(val, list), f"/ is a list {lpath}"
+                    assert isinstance(val, list), f"/ is a list {path_list(lpath)}"
                 continue
             elif prop in MODEL_LIST_KEYWORDS:
-                assert isinstance(val, list), f"{prop} is a list {lpath}"
-                model[prop] = _recModel(val, lpath, flt, rwt, keys, False)
+                assert isinstance(val, list), f"{prop} is a list {path_list(lpath)}"
+                model[prop] = _recModel(val, lpath, flt, rwt, keys, False, lazy)
                 okprops = {prop, "#"}
                 if root:
                     okprops.update(ROOT_KEYWORDS)
-                assert is_obj_model(model, okprops), f"{prop} restricts other keywords {lpath}"
+                assert is_obj_model(model, okprops), f"{prop} restricts other keywords {path_list(lpath)}"
             elif prop == "%":  # renames and rewrites
-                assert root and isinstance(val, dict), f"% transformations at root {lpath}"
+                assert root and isinstance(val, dict), f"% transformations at root {path_list(lpath)}"
                 for k, v in val.items():
-                    assert isinstance(k, str), f"% props are strings {lpath}"
+                    assert isinstance(k, str), f"% props are strings {path_list(lpath)}"
                     if k == "#":
-                        assert isinstance(v, str), f"# is a string {lpath}"
+                        assert isinstance(v, str), f"# is a string {path_list(lpath)}"
                     elif k == "<":
                         is_ref = lambda s: isinstance(s, str) and s and s[0] == "$"
                         assert is_ref(v) or isinstance(v, list) and all(map(is_ref, v)), \
                             "%.< is a reference or list of references"
                     elif k.startswith("."):  # rename
-                        assert isinstance(v, str), f"rename to a string {lpath + [k]}"
-                        assert v in ALL_KEYWORDS, f"rename to a valid keyword {lpath + [k]}"
+                        assert isinstance(v, str), f"rename to a string {path_list(lpath) + [k]}"
+                        assert v in ALL_KEYWORDS, f"rename to a valid keyword {path_list(lpath) + [k]}"
                     else:  # rewrite
                         # FIXME recurse or not?
                         # model[k] = _recModel(v, path + ["%", k], flt, rwt)
                         continue
             elif prop in MODEL_VALUE_KEYWORDS:
                 if prop == "$":
-                    assert root and isinstance(val, dict), f"$ definitions at root {lpath}"
-                model[prop] = _recModel(val, lpath, flt, rwt, keys, False)
+                    assert root and isinstance(val, dict), f"$ definitions at root {path_list(lpath)}"
+                model[prop] = _recModel(val, lpath, flt, rwt, keys, False, lazy)
             else:  # assume properties
-                model[prop] = _recModel(val, lpath, flt, rwt, keys, False)
+                model[prop] = _recModel(val, lpath, flt, rwt, keys, False, lazy)
             if keys:  # possibly rewrite key references
                 if prop != "" and prop[0] == "$":
                     log.debug(f"### considering key ref {prop}")
-                    nprop = _recModel(prop, lpath, flt, rwt, keys, False)
+                    nprop = _recModel(prop, lpath, flt, rwt, keys, False, lazy)
                     log.debug(f"nprop={nprop}")
-                    assert isinstance(nprop, str)
-                    # substitution to an optional string
-                    if nprop and nprop[0] not in ("$", "/", "="):
-                        nprop = "?" + (nprop[1:] if nprop[0] == "_" else nprop)
-                    if nprop != prop:
-                        if nprop in model:
-                            raise ModelError(f"cannot override key {prop}: {nprop} {lpath}")
-                        model[nprop] = model[prop]
-                        del model[prop]
+                    renameKey(model, prop, nprop, path_list(lpath))  # type: ignore
     else:  # sanity check
         # FIXME could/should recurse on str?
         assert model is None or isinstance(model, (bool, int, float, str))
 
-    return rwt(model, path)
+    return model if rwt is noRwt else rwt(model, path)  # type: ignore
 
-def allFlt(_m: ModelType, _p: ModelPath) -> bool:
+def renameKey(model: dict, prop: str, nprop: ModelType, path: ModelPath):
+    """Apply a rewritten key reference, possibly as an optional constant property."""
+    assert isinstance(nprop, str)
+    # substitution to an optional string
+    if nprop and nprop[0] not in ("$", "/", "="):
+        nprop = "?" + (nprop[1:] if nprop[0] == "_" else nprop)
+    if nprop != prop:
+        if nprop in model:
+            raise ModelError(f"cannot override key {prop}: {nprop} {path}")
+        model[nprop] = model[prop]
+        del model[prop]
+
+def subModels(model: ModelType) -> list[str|int]:
+    """Keys or indexes of direct sub-models, as followed by recModel."""
+    if isinstance(model, list):
+        return list(range(len(model)))
+    elif isinstance(model, dict):
+        return [prop for prop in model if prop not in NO_MODEL_KEYWORDS and prop != "%"]
+    else:
+        return []
+
+def allFlt(_m: ModelType, _p: ModelPath|Path) -> bool:
     return True
 
-def builtFlt(m: ModelType, _p: ModelPath) -> bool:
+def builtFlt(m: ModelType, _p: ModelPath|Path) -> bool:
     return isinstance(m, (list, dict))
 
-def noRwt(m: ModelType, _p: ModelPath) -> ModelType:
+def noRwt(m: ModelType, _p: ModelPath|Path) -> ModelType:
     return m
 
 def recModel(
         model: ModelType,
-        flt: ModelFilter = lambda _m, _p: True,
-        rwt: ModelRewrite = lambda m, _p: m,
+        flt: ModelFilter|LazyModelFilter = lambda _m, _p: True,
+        rwt: ModelRewrite|LazyModelRewrite = lambda m, _p: m,
         keys: bool = False,
         root: bool = True,
+        lazy: bool = False,
     ) -> ModelType:
+    """Recurse on a model, filtering sub-models and rewriting them bottom-up.
 
-    return _recModel(model, [], flt, rwt, keys, root)
+    With lazy, callbacks get a linked path extended in O(1) instead of a fresh
+    list at every node, to be materialized with path_list when actually needed.
+    """
+    return _recModel(model, () if lazy else [], flt, rwt, keys, root, lazy)
@@ -4,7 +4,7 @@ import yaml
 
 from .mtypes import ModelError, ModelPath, Jsonable
 from .url_cache import JsonURLCache
-from .utils import log, json_loads
+from .utils import log, json_loads, phase
 
 JSON_SUFFIX = ["", ".json", ".model", ".model.json"]
 YAML_SUFFIX = [".yaml", ".model.yaml", ".yml", ".model.yml"]
@@ -52,6 +52,10 @@ class Resolver:
 
     def __call__(self, url: str, *, path: ModelPath = [], follow: bool = True):
         """Resolve an external reference."""
+        with phase("resolve"):
+            return self._resolve(url, path=path, follow=follow)
+
+    def _resolve(self, url: str, *, path: ModelPath, follow: bool):
 
         assert "#" not in url, f"no fragment in {url}"
 
@@ -1,8 +1,12 @@
 from .types import (
     Jsonable,
     Path,
+    PathNode,
     Report,
+    Reports,
+    JsonValues,
     PropMap,
+    StreamPlan,
     CheckFun,
     RegexFun,
     EntryCheckFun,
@@ -13,6 +17,7 @@ from .support import (
     UNDEFINED,
     _tname,
     _path,
+    _path_list,
     _rep,
     Const,
     ConstSet,
@@ -22,12 +27,31 @@ from .support import (
     is_valid_datetime,
     is_valid_regex,
     is_valid_exreg,
+    LazyRegex,
+    cached_search,
     is_valid_url,
     is_valid_email,
     is_valid_uuid,
     is_valid_json,
     is_unique_array,
+    predef_cache,
+    predef_cache_info,
+    profiled,
+    profile_data,
+    profile_reset,
+    profile_table,
     check_constraint,
     value_len,
+    check_many,
+    check_many_parallel,
+    check_chunks,
+    check_chunks_parallel,
+    jsonl_lines,
     main,
 )
+
+from .stream import (
+    JsonTokens,
+    check_tokens,
+    check_stream,
+)
@@ -0,0 +1,166 @@
+#ifndef JSON_MODEL_PY_H_INCLUDED
+#define JSON_MODEL_PY_H_INCLUDED
+
+/*
+ * Jansson-compatible API over CPython objects, so that generated C checkers
+ * and the C runtime can walk dict, list, str, int, float, bool and None directly.
+ *
+ * Python.h must be included before any standard header.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <limits.h>
+#include <math.h>
+
+typedef PyObject json_t;
+
+// same order as Jansson, JSON_INVALID is for non JSON Python objects
+typedef enum {
+    JSON_OBJECT,
+    JSON_ARRAY,
+    JSON_STRING,
+    JSON_INTEGER,
+    JSON_REAL,
+    JSON_TRUE,
+    JSON_FALSE,
+    JSON_NULL,
+    JSON_INVALID
+} json_type;
+
+// first conversion error encountered while checking, reset by the entry point
+extern const char *jm_py_error;
+
+static inline json_type
+json_typeof(const json_t *val)
+{
+    PyObject *o = (PyObject *) val;
+    if (o == Py_None)
+        return JSON_NULL;
+    else if (o == Py_True)
+        return JSON_TRUE;
+    else if (o == Py_False)
+        return JSON_FALSE;
+    else if (PyUnicode_Check(o))
+        return JSON_STRING;
+    else if (PyLong_Check(o))
+        return JSON_INTEGER;
+    else if (PyFloat_Check(o))
+        return JSON_REAL;
+    else if (PyList_Check(o))
+        return JSON_ARRAY;
+    else if (PyDict_Check(o))
+        return JSON_OBJECT;
+    else
+        return JSON_INVALID;
+}
+
+#define json_is_null(v) (((PyObject *) (v)) == Py_None)
+#define json_is_true(v) (((PyObject *) (v)) == Py_True)
+#define json_is_false(v) (((PyObject *) (v)) == Py_False)
+#define json_is_boolean(v) PyBool_Check((PyObject *) (v))
+// NOTE bool is a subclass of int in Python
+#define json_is_integer(v) (PyLong_Check((PyObject *) (v)) && !PyBool_Check((PyObject *) (v)))
+#define json_is_real(v) PyFloat_Check((PyObject *) (v))
+#define json_is_number(v) (json_is_integer(v) || json_is_real(v))
+#define json_is_string(v) PyUnicode_Check((PyObject *) (v))
+#define json_is_array(v) PyList_Check((PyObject *) (v))
+#define json_is_object(v) PyDict_Check((PyObject *) (v))
+
+#define json_boolean_value(v) json_is_true(v)
+#define json_real_value(v) PyFloat_AS_DOUBLE((PyObject *) (v))
+
+// integers beyond 64 bits saturate just outside the 64 bits range,
+// so that comparisons with model constants, which fit in 64 bits, stay exact
+typedef __int128 jm_int_t;
+
+static inline jm_int_t
+json_integer_value(const json_t *val)
+{
+    int overflow;
+    long long i = PyLong_AsLongLongAndOverflow((PyObject *) val, &overflow);
+    return overflow > 0 ? (jm_int_t) LLONG_MAX + 1 : overflow < 0 ? (jm_int_t) LLONG_MIN - 1 : i;
+}
+
+// whether an integer fits in 64 bits
+#define jm_py_int_fits(v) (json_integer_value(v) == (int64_t) json_integer_value(v))
+
+static inline double
+json_number_value(const json_t *val)
+{
+    if (json_is_real(val))
+        return json_real_value(val);
+    else if (json_is_integer(val))
+    {
+        double d = PyLong_AsDouble((PyObject *) val);
+        if (d == -1.0 && PyErr_Occurred())
+        {
+            // too large for a double
+            PyErr_Clear();
+            d = json_integer_value(val) > 0 ? HUGE_VAL : -HUGE_VAL;
+        }
+        return d;
+    }
+    return 0.0;
+}
+
+// borrowed UTF-8 representation, cached within the string object
+static inline const char *
+jm_py_str(PyObject *str)
+{
+    const char *s = PyUnicode_AsUTF8(str);
+    if (s == NULL)
+    {
+        // eg lone surrogates
+        PyErr_Clear();
+        if (!jm_py_error)
+            jm_py_error = "string cannot be encoded as UTF-8";
+        return "";
+    }
+    return s;
+}
+
+#define json_string_value(v) jm_py_str((PyObject *) (v))
+
+#define json_array_size(a) ((size_t) PyList_GET_SIZE((PyObject *) (a)))
+#define json_array_get(a, i) \
+    (((size_t) (i)) < json_array_size(a) ? PyList_GET_ITEM((PyObject *) (a), (i)) : NULL)
+
+#define json_array_foreach(array, index, value) \
+    for (index = 0; \
+         index < json_array_size(array) && (value = PyList_GET_ITEM((PyObject *) (array), index)); \
+         index++)
+
+#define json_object_size(o) ((size_t) PyDict_GET_SIZE((PyObject *) (o)))
+#define json_object_get(o, k) PyDict_GetItemString((PyObject *) (o), k)
+
+// next object property, JSON object keys must be strings
+static inline bool
+jm_py_dict_next(PyObject *obj, Py_ssize_t *pos, const char **key, PyObject **value)
+{
+    PyObject *pkey;
+    if (!PyDict_Next(obj, pos, &pkey, value))
+        return false;
+    if (PyUnicode_Check(pkey))
+        *key = jm_py_str(pkey);
+    else
+    {
+        if (!jm_py_error)
+            jm_py_error = "object keys must be strings";
+        *key = "";
+    }
+    return true;
+}
+
+#define json_object_foreach(object, key, value) \
+    for (Py_ssize_t jm_pos = 0; jm_py_dict_next((PyObject *) (object), &jm_pos, &(key), &(value)); )
+
+// parse a JSON constant at initialization, with the json module
+extern json_t *jm_py_loads(const char *);
+
+#define json_loads(s, flags, error) jm_py_loads(s)
+#define json_decref(v) Py_XDECREF(v)
+
+#endif  // JSON_MODEL_PY_H_INCLUDED
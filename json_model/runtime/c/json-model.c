@@ -3,6 +3,7 @@
 #include <stdio.h>
 #include <ctype.h>
 #include <time.h>
+#include <inttypes.h>
 
 char *jm_version_string = "<unknown>";
 
@@ -118,7 +119,13 @@ jm_json_cmp(const json_t *v1, const json_t *v2)
             // one only value is equal to itself
             return 0;
         case JSON_INTEGER:
-            int64_t i1 = json_integer_value(v1), i2 = json_integer_value(v2);
+#if defined(JSON_MODEL_PYEXT)
+            // saturated values beyond 64 bits are compared exactly
+            if (!jm_py_int_fits(v1) || !jm_py_int_fits(v2))
+                return PyObject_RichCompareBool((PyObject *) v1, (PyObject *) v2, Py_LT) ? -1 :
+                       PyObject_RichCompareBool((PyObject *) v1, (PyObject *) v2, Py_EQ) ? 0 : 1;
+#endif  // JSON_MODEL_PYEXT
+            jm_int_t i1 = json_integer_value(v1), i2 = json_integer_value(v2);
             // do not substract to avoid overflows
             return i1 < i2 ? -1 : i1 == i2 ? 0 : 1;
         case JSON_REAL:
@@ -130,6 +137,11 @@ jm_json_cmp(const json_t *v1, const json_t *v2)
             return jm_json_array_cmp(v1, v2);
         case JSON_OBJECT:
             return jm_json_object_cmp(v1, v2);
+#if defined(JSON_MODEL_PYEXT)
+        case JSON_INVALID:
+            // non JSON objects are only equal to themselves
+            return v1 < v2 ? -1 : v1 == v2 ? 0 : 1;
+#endif  // JSON_MODEL_PYEXT
     }
 
     // default: panic, internal error
@@ -137,53 +149,140 @@ jm_json_cmp(const json_t *v1, const json_t *v2)
     return 0;
 }
 
-#if defined(_WIN64)
-#  define qsort_r qsort_s
-#endif
+// 64 bits finalizer, from splitmix64
+static inline uint64_t
+jm_hash_mix(uint64_t h)
+{
+    h ^= h >> 30;
+    h *= 0xbf58476d1ce4e5b9ULL;
+    h ^= h >> 27;
+    h *= 0x94d049bb133111ebULL;
+    h ^= h >> 31;
+    return h;
+}
 
-#if defined(_WIN64) || defined(__APPLE__)
-typedef int(*jm_cmp_r_fun_t)(void *, const void *, const void *);
-#else  // Linux, Unix, whatever
-typedef int(*jm_cmp_r_fun_t)(const void *, const void *, void *);
-#endif
+// FNV-1a string hash, up to the first NUL as strcmp
+static uint64_t
+jm_hash_str(const char *s)
+{
+    uint64_t h = 0xcbf29ce484222325ULL;
+    while (*s)
+        h = (h ^ (unsigned char) *s++) * 0x100000001b3ULL;
+    return h;
+}
 
-// FIXME this assumes ISO, and won't work on MacOS/BSD nor Windows
-// which have their own view of qsort_r, including different names and/or argument orders.
-// NOTE fast version which stops comparing once a duplicate has been seen:
-// hopefully an optimized qsort implementation can use this to return early.
-#if defined(_WIN64) || defined(__APPLE__)
-static int
-jm_json_cmp_r(void *duplicate, const json_t **v1, const json_t **v2)
-#else
-static int
-jm_json_cmp_r(const json_t **v1, const json_t **v2, void *duplicate)
-#endif
+// structural hash of a JSON value, consistent with jm_json_cmp equality
+static uint64_t
+jm_json_hash(const json_t *val)
 {
-    if (*((bool *) duplicate))
-        return 0;
-    int cmp = jm_json_cmp(*v1, *v2);
-    if (cmp == 0)
-        *((bool *) duplicate) = true;
-    return cmp;
+    const json_type type = json_typeof(val);
+    uint64_t h = jm_hash_mix((uint64_t) type + 1);
+
+    switch (type)
+    {
+        case JSON_NULL:
+        case JSON_FALSE:
+        case JSON_TRUE:
+            return h;
+        case JSON_INTEGER:
+            return jm_hash_mix(h ^ (uint64_t) json_integer_value(val));
+        case JSON_REAL:
+            double d = json_real_value(val);
+            if (d == 0.0)  // -0.0 == 0.0
+                d = 0.0;
+            uint64_t bits;
+            memcpy(&bits, &d, sizeof(bits));
+            return jm_hash_mix(h ^ bits);
+        case JSON_STRING:
+            return jm_hash_mix(h ^ jm_hash_str(json_string_value(val)));
+        case JSON_ARRAY:
+            // order dependent combination
+            size_t size = json_array_size(val);
+            for (size_t i = 0; i < size; i++)
+                h = jm_hash_mix(h * 31 + jm_json_hash(json_array_get(val, i)));
+            return h;
+        case JSON_OBJECT:
+            // order independent combination
+            const char *key;
+            json_t *value;
+            uint64_t sum = 0;
+            json_object_foreach((json_t *) val, key, value)
+                sum += jm_hash_mix(jm_hash_str(key) ^ (jm_json_hash(value) * 31));
+            return jm_hash_mix(h ^ sum);
+#if defined(JSON_MODEL_PYEXT)
+        case JSON_INVALID:
+            return jm_hash_mix(h ^ (uintptr_t) val);
+#endif  // JSON_MODEL_PYEXT
+    }
+
+    // default: panic, internal error
+    assert(false);
+    return 0;
+}
+
+// below this size, pairwise comparisons are cheaper than hashing
+#define JM_UNIQUE_SMALL 8
+
+typedef struct {
+    uint64_t hash;
+    const json_t *item;  // NULL for an empty slot
+} jm_unique_slot_t;
+
+// quadratic check, stops on the first duplicate
+static bool
+jm_json_array_unique_pairwise(const json_t *val, size_t size)
+{
+    for (size_t i = 1; i < size; i++)
+    {
+        const json_t *item = json_array_get(val, i);
+        for (size_t j = 0; j < i; j++)
+            if (jm_json_cmp(json_array_get(val, j), item) == 0)
+                return false;
+    }
+    return true;
 }
 
 // tell whether a JSON array holds distinct values.
+// items are inserted in an open addressing hash table, equal hashes are
+// confirmed with a full comparison, and the check stops on the first duplicate.
 bool
 jm_json_array_unique(const json_t *val)
 {
     assert(json_is_array(val));
-    // extract as an actual array for sorting
     size_t size = json_array_size(val);
-    const json_t *array[size];
-    // borrow array items
-    for (size_t i = 0; i < size; i++)
-        array[i] = json_array_get(val, i);
-    // relying only on qsort works because in the end
-    // all items have been compared to their neighbours
-    bool duplicate = false;
-    // life is fun
-    qsort_r(array, size, sizeof(json_t *), (jm_cmp_r_fun_t) jm_json_cmp_r, &duplicate);
-    return !duplicate;
+    if (size <= JM_UNIQUE_SMALL)
+        return jm_json_array_unique_pairwise(val, size);
+
+    // power of two capacity, at most half full
+    size_t capacity = 1;
+    while (capacity < 2 * size)
+        capacity <<= 1;
+    const size_t mask = capacity - 1;
+
+    jm_unique_slot_t *table = calloc(capacity, sizeof(jm_unique_slot_t));
+    if (unlikely(table == NULL))
+        return jm_json_array_unique_pairwise(val, size);
+
+    bool unique = true;
+    for (size_t i = 0; unique && i < size; i++)
+    {
+        const json_t *item = json_array_get(val, i);
+        uint64_t hash = jm_json_hash(item);
+        size_t slot = hash & mask;
+        while (table[slot].item != NULL)
+        {
+            if (table[slot].hash == hash && jm_json_cmp(table[slot].item, item) == 0)
+            {
+                unique = false;
+                break;
+            }
+            slot = (slot + 1) & mask;
+        }
+        table[slot] = (jm_unique_slot_t) { hash, item };
+    }
+
+    free(table);
+    return unique;
 }
 
 // idem with reporting
@@ -199,6 +298,50 @@ jm_array_is_unique(const json_t *val, jm_path_t *path, jm_report_t *rep)
 /*
  * reporting
  */
+#if defined(JSON_MODEL_PYEXT)
+// append a (message, path segments) tuple, as the generated Python code
+void
+jm_report_add_entry(jm_report_t* rep, const char *msg, jm_path_t *path)
+{
+    PyObject *segments = Py_None;
+    if (path)
+    {
+        // the root segment is implicit
+        size_t size = 0;
+        for (jm_path_t *current = path; current->prev != NULL; current = current->prev)
+            size++;
+        segments = PyList_New(size);
+        if (segments == NULL)
+            return;
+        for (jm_path_t *current = path; size > 0; current = current->prev)
+        {
+            PyObject *seg = current->name ? PyUnicode_FromString(current->name) :
+                                            PyLong_FromSize_t(current->index);
+            if (seg == NULL)
+            {
+                Py_DECREF(segments);
+                return;
+            }
+            PyList_SET_ITEM(segments, --size, seg);
+        }
+    }
+    else
+        Py_INCREF(segments);
+    // errors are checked by the entry point
+    PyObject *entry = Py_BuildValue("(sN)", msg, segments);
+    if (entry != NULL)
+    {
+        PyList_Append(rep->list, entry);
+        Py_DECREF(entry);
+    }
+}
+
+void
+jm_report_free_entries(jm_report_t *rep)
+{
+    PyList_SetSlice(rep->list, 0, PyList_GET_SIZE(rep->list), NULL);
+}
+#else
 void
 jm_report_add_entry(jm_report_t* rep, const char *msg, jm_path_t *path)
 {
@@ -258,6 +401,7 @@ jm_report_free_entries(jm_report_t *rep)
         entry = follow;
     }
 }
+#endif  // JSON_MODEL_PYEXT
 
 /*
  * property mapping management
@@ -296,6 +440,14 @@ jm_set_cst(jm_constant_t *c, const json_t *val)
             *c = (jm_constant_t) { strlen(s) + 1, { .s = s } };
             break;
         case JSON_INTEGER:
+#if defined(JSON_MODEL_PYEXT)
+            if (!jm_py_int_fits(val))
+            {
+                // beyond 64 bits, matches no constant
+                *c = (jm_constant_t) { 0, { .s = NULL } };
+                return false;
+            }
+#endif  // JSON_MODEL_PYEXT
             *c = (jm_constant_t) { cst_is_integer, { .i = json_integer_value(val) } };
             break;
         case JSON_REAL:
@@ -999,7 +1151,8 @@ jm_check_constraint(const json_t * val, jm_constraint_op_t op, const jm_constant
 
     if (cst->tag == cst_is_integer)
     {
-        int64_t icst = cst->val.i, ival = 0;
+        int64_t icst = cst->val.i;
+        jm_int_t ival = 0;
         if (json_is_object(val))
             ival = (int64_t) json_object_size(val);
         else if (json_is_array(val))
@@ -1140,7 +1293,37 @@ jm_check_constraint(const json_t * val, jm_constraint_op_t op, const jm_constant
     return false;
 }
 
+#if defined(JSON_MODEL_PYEXT)
+const char *jm_py_error = NULL;
 
+json_t *
+jm_py_loads(const char *s)
+{
+    PyObject *json = PyImport_ImportModule("json");
+    if (json == NULL)
+        return NULL;
+    PyObject *val = PyObject_CallMethod(json, "loads", "s", s);
+    Py_DECREF(json);
+    return val;
+}
+
+// call a check function with a string instead of a json objet.
+bool
+jm_check_fun_string(jm_check_fun_t fun, const char *val, jm_path_t *path, jm_report_t *rep)
+{
+    PyObject *holder = PyUnicode_FromString(val);
+    if (holder == NULL)
+    {
+        PyErr_Clear();
+        if (!jm_py_error)
+            jm_py_error = "cannot convert string";
+        return false;
+    }
+    bool res = fun(holder, path, rep);
+    Py_DECREF(holder);
+    return res;
+}
+#else
 // MUST BE CONSISTENT WITH "jansson_private.h"
 typedef struct {
     json_t  json;
@@ -1220,3 +1403,102 @@ jm_generic_entry(
 
     return valid;
 }
+#endif  // JSON_MODEL_PYEXT
+
+/*
+ * profiling of generated functions
+ */
+static jm_profile_t *jm_profiles = NULL;
+
+int64_t
+jm_profile_start(jm_profile_t *prof)
+{
+    // register on first call, calls are only counted on stop, so a recursive
+    // function would start again before its first stop
+    if (unlikely(!prof->registered))
+    {
+        prof->registered = true;
+        prof->next = jm_profiles;
+        jm_profiles = prof;
+    }
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return 1000000000 * (int64_t) ts.tv_sec + ts.tv_nsec;
+}
+
+void
+jm_profile_stop(jm_profile_t *prof, int64_t start, bool pass)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    prof->ns += 1000000000 * (int64_t) ts.tv_sec + ts.tv_nsec - start;
+    prof->calls++;
+    if (pass)
+        prof->passes++;
+}
+
+// decreasing cumulative time
+static int
+jm_cmp_profile(const jm_profile_t **p1, const jm_profile_t **p2)
+{
+    return (*p1)->ns < (*p2)->ns ? 1 : (*p1)->ns > (*p2)->ns ? -1 : strcmp((*p1)->key, (*p2)->key);
+}
+
+static void
+jm_dump_json_string(FILE *out, const char *s)
+{
+    fputc('"', out);
+    for (; *s; s++)
+        if (*s == '"' || *s == '\\')
+            fprintf(out, "\\%c", *s);
+        else if ((unsigned char) *s < 0x20)
+            fprintf(out, "\\u%04x", *s);
+        else
+            fputc(*s, out);
+    fputc('"', out);
+}
+
+void
+jm_profile_dump(FILE *out, bool json)
+{
+    size_t size = 0;
+    for (jm_profile_t *prof = jm_profiles; prof != NULL; prof = prof->next)
+        size++;
+
+    if (size == 0)
+    {
+        fprintf(out, json ? "{}\n" : "no profiling data\n");
+        return;
+    }
+
+    jm_profile_t **profs = malloc(size * sizeof(jm_profile_t *));
+    size_t i = 0;
+    for (jm_profile_t *prof = jm_profiles; prof != NULL; prof = prof->next)
+        profs[i++] = prof;
+    qsort(profs, size, sizeof(jm_profile_t *), (int (*)(const void *, const void *)) jm_cmp_profile);
+
+    if (!json)
+        fputs("     calls       pass       fail   total ms   µs/call  key\n", out);
+
+    for (i = 0; i < size; i++)
+    {
+        jm_profile_t *prof = profs[i];
+        if (json)
+        {
+            fputs(i == 0 ? "{" : ",", out);
+            jm_dump_json_string(out, prof->key);
+            fprintf(out, ":{\"calls\":%" PRId64 ",\"pass\":%" PRId64 ",\"fail\":%" PRId64
+                    ",\"ns\":%" PRId64 "}",
+                    prof->calls, prof->passes, prof->calls - prof->passes, prof->ns);
+        }
+        else
+            fprintf(out, "%10" PRId64 " %10" PRId64 " %10" PRId64 " %10.03f %9.03f  %s\n",
+                    prof->calls, prof->passes, prof->calls - prof->passes,
+                    1e-6 * prof->ns, 1e-3 * prof->ns / prof->calls, prof->key);
+    }
+
+    if (json)
+        fputs("}\n", out);
+
+    free(profs);
+}
@@ -1,15 +1,27 @@
 #ifndef JSON_MODEL_H_INCLUDED
 #define JSON_MODEL_H_INCLUDED
 
-#define _GNU_SOURCE  // for qsort_r?
+#if defined(JSON_MODEL_PYEXT)
+// CPython objects instead of Jansson values, must be included first
+#include <json-model-py.h>
+#else
+#define _GNU_SOURCE
+#endif  // JSON_MODEL_PYEXT
+
 #include <stdbool.h>
 #include <string.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <assert.h>
 
+#if !defined(JSON_MODEL_PYEXT)
+#include <stdint.h>
 #include <jansson.h>
 
+// integer values, wider with CPython objects
+typedef int64_t jm_int_t;
+#endif  // !JSON_MODEL_PYEXT
+
 /*
  * build generated API names
  */
@@ -81,7 +93,11 @@ typedef struct jm_report_entry {
 } jm_report_entry_t;
 
 typedef struct {
+#if defined(JSON_MODEL_PYEXT)
+  PyObject *list;  // of (message, path segments) tuples
+#else
   jm_report_entry_t *entry;
+#endif  // JSON_MODEL_PYEXT
 } jm_report_t;
 
 // path segment, name == NULL means use index
@@ -100,6 +116,20 @@ typedef bool (*jm_check_fun_t)(const json_t *, jm_path_t *, jm_report_t *);
 extern bool jm_check_fun_string(jm_check_fun_t, const char *, jm_path_t *, jm_report_t *);
 extern bool jm_array_is_unique(const json_t *, jm_path_t *, jm_report_t *);
 
+/*
+ * profiling of generated functions, see jmc --profile
+ */
+typedef struct jm_profile {
+    const char *key;          // model path or regex
+    int64_t calls, passes, ns;
+    struct jm_profile *next;  // registered profiles
+    bool registered;          // whether linked in registered profiles
+} jm_profile_t;
+
+extern int64_t jm_profile_start(jm_profile_t *);
+extern void jm_profile_stop(jm_profile_t *, int64_t, bool);
+extern void jm_profile_dump(FILE *, bool);
+
 /*
  * property mapping management
  */
@@ -233,8 +263,10 @@ jm_check_constraint(const json_t *, jm_constraint_op_t, const jm_constant_t *,
 /*
  * Shared high-level entry point
  */
+#if !defined(JSON_MODEL_PYEXT)
 extern bool jm_generic_entry(const char *(*)(void), jm_check_fun_t (*)(const char *),
                              const json_t *, const char *, bool *, char **);
+#endif  // !JSON_MODEL_PYEXT
 
 /*
  * Generated stuff
@@ -245,7 +277,9 @@ extern jm_propmap_t CHECK_map_tab[];
 extern jm_check_fun_t CHECK_fun(const char *);
 // high-level interface
 extern const char *CHECK_init(void);
+#if !defined(JSON_MODEL_PYEXT)
 extern bool CHECK(const json_t *, const char *, bool *, char **);
+#endif  // !JSON_MODEL_PYEXT
 extern void CHECK_free(void);
 
 #endif  // JSON_MODEL_H_INCLUDED
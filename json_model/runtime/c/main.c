@@ -267,6 +267,7 @@ int main(int argc, char* argv[])
     bool version = false;
     bool jsonschema_benchmark = false;
     int loop = 1;
+    char *profile = NULL;
 
     const struct option options[] = {
         { "help", no_argument, NULL, 'h' },
@@ -281,15 +282,16 @@ int main(int argc, char* argv[])
         { "slow", no_argument, NULL, 1001 },
         { "jsonschema-benchmark", no_argument, NULL, 1002 },
         { "no-report", no_argument, NULL, 1003 },
+        { "profile", required_argument, NULL, 'P' },
         { NULL, 0, NULL, 0 }
     };
 
-    while ((opt = getopt_long(argc, argv, "hvln:rtT:", options, &optind)) != -1)
+    while ((opt = getopt_long(argc, argv, "hvln:rtT:P:", options, &optind)) != -1)
     {
         switch (opt) {
             case 'h':  // FIXME expand help!
                 fprintf(stdout,
-                        "Usage: %s [-hvl] [-r] [-n name] [-t] [-T repeat] [files...]\n"
+                        "Usage: %s [-hvl] [-r] [-n name] [-t] [-T repeat] [-P json|table] [files...]\n"
                         "Check JSON values validity against a JSON model\n"
                         "Generated by jmc (JSON Model Compiler) version %s\n"
                         "see https://github.com/clairey-zx81/json-model\n",
@@ -331,6 +333,9 @@ int main(int argc, char* argv[])
             case 1003:
                 report = false;
                 break;
+            case 'P':
+                profile = optarg;
+                break;
             case '?':
             default:
                 fprintf(stdout, "unexpected option encountered\n");
@@ -345,6 +350,12 @@ int main(int argc, char* argv[])
         return 1;
     }
 
+    if (profile && strcmp(profile, "json") != 0 && strcmp(profile, "table") != 0)
+    {
+        fprintf(stderr, "Profile output format must be json or table: %s\n", profile);
+        return 1;
+    }
+
     // initialization
     const char *error;
     if ((error = CHECK_init()) != NULL)
@@ -492,6 +503,9 @@ int main(int argc, char* argv[])
         }
     }
 
+    if (profile)
+        jm_profile_dump(stderr, strcmp(profile, "json") == 0);
+
     CHECK_free();
 
     return errors? 4: 0;
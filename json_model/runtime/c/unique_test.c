@@ -0,0 +1,109 @@
+// $UNIQUE runtime tests, run with: make check
+//
+// The runtime is included to reach its static hash functions.
+#include "json-model.c"
+
+static int failures = 0;
+
+// check uniqueness of an array, as is and with padding items to use the hash table
+static void
+check_array(const char *name, json_t *val, bool expected)
+{
+    json_t *padded = json_array();
+    for (int i = 0; i < 2 * JM_UNIQUE_SMALL; i++)
+        json_array_append_new(padded, json_sprintf("pad %d", i));
+    json_array_extend(padded, val);
+
+    json_t *arrays[] = { val, padded };
+    for (size_t n = 0; n < 2; n++)
+    {
+        bool unique = jm_json_array_unique(arrays[n]);
+        if (unique != expected)
+        {
+            char *text = json_dumps(arrays[n], JSON_COMPACT);
+            fprintf(stderr, "%s: jm_json_array_unique(%s) = %d, want %d\n", name, text, unique, expected);
+            free(text);
+            failures++;
+        }
+    }
+
+    json_decref(padded);
+    json_decref(val);
+}
+
+// idem from JSON text
+static void
+check(const char *name, const char *text, bool expected)
+{
+    json_error_t error;
+    json_t *val = json_loads(text, 0, &error);
+    assert(val != NULL && json_is_array(val));
+    check_array(name, val, expected);
+}
+
+// distinct values with the same hash are not duplicates
+static void
+check_collisions(void)
+{
+    // an integer with the same hash as 1.0
+    double one = 1.0;
+    uint64_t bits;
+    memcpy(&bits, &one, sizeof(bits));
+    json_int_t i = (json_int_t) (jm_hash_mix(JSON_INTEGER + 1) ^ jm_hash_mix(JSON_REAL + 1) ^ bits);
+
+    json_t *ival = json_integer(i), *rval = json_real(1.0);
+    if (jm_json_hash(ival) != jm_json_hash(rval))
+    {
+        fprintf(stderr, "Collision: hash(%" JSON_INTEGER_FORMAT ") != hash(1.0)\n", i);
+        failures++;
+    }
+    json_decref(ival);
+    json_decref(rval);
+
+    check_array("Colliding Scalars", json_pack("[I, f]", i, 1.0), true);
+    check_array("Colliding Arrays", json_pack("[[I], [f]]", i, 1.0), true);
+    check_array("Colliding Objects", json_pack("[{s: I}, {s: f}]", "k", i, "k", 1.0), true);
+    check_array("Colliding Duplicate", json_pack("[I, f, I]", i, 1.0, i), false);
+}
+
+// many items, with probing in the table
+static void
+check_many(void)
+{
+    json_t *val = json_array();
+    for (int i = 0; i < 1000; i++)
+        json_array_append_new(val, i % 2 ? json_integer(i) : json_pack("[i, {s: i}]", i, "i", i));
+    json_incref(val);
+    check_array("Many", val, true);
+    json_array_append_new(val, json_pack("[i, {s: i}]", 500, "i", 500));
+    check_array("Many Duplicate", val, false);
+}
+
+int
+main(void)
+{
+    check("Empty", "[]", true);
+    check("Single", "[1.5]", true);
+    check("Numbers", "[1, 2, 3]", true);
+    check("Duplicate Number", "[1, 2, 1]", false);
+    // integers and reals are distinct types
+    check("Integer Real", "[1, 1.0]", true);
+    check("Zeros", "[0.0, -0.0]", false);
+    check("Mixed Scalars", "[null, false, 0, \"\"]", true);
+    check("Duplicate Null", "[null, null]", false);
+    check("Number String", "[1, \"1\"]", true);
+    check("Boolean Number", "[true, 1]", true);
+    check("Arrays", "[[1, 2], [2, 1]]", true);
+    check("Duplicate Array", "[[1, []], [1, []]]", false);
+    check("Nested Arrays", "[[1, [2, [3]]], [1, [2, [3]]]]", false);
+    check("Integer Real Arrays", "[[1], [1.0]]", true);
+    check("Objects", "[{\"a\": 1}, {\"b\": 1}]", true);
+    check("Duplicate Object", "[{\"a\": 1, \"b\": [true]}, {\"b\": [true], \"a\": 1}]", false);
+    check("Empty Compounds", "[[], {}]", true);
+    check_collisions();
+    check_many();
+
+    if (failures)
+        fprintf(stderr, "unique_test: %d failures\n", failures);
+    return failures ? 1 : 0;
+}
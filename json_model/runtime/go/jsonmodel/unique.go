@@ -0,0 +1,108 @@
+package jsonmodel
+
+import (
+	"hash/maphash"
+	"math"
+)
+
+var uniqueSeed = maphash.MakeSeed()
+
+// hashValue computes a structural hash consistent with equalValues.
+func hashValue(v any) uint64 {
+	switch t := v.(type) {
+	case nil:
+		return 1
+	case bool:
+		if t {
+			return 2
+		}
+		return 3
+	case float64:
+		if t == 0 { // -0 == 0
+			t = 0
+		}
+		return math.Float64bits(t) * 0x9e3779b97f4a7c15
+	case string:
+		return maphash.String(uniqueSeed, t)
+	case []any:
+		// order dependent
+		h := uint64(5)
+		for _, item := range t {
+			h = h*31 + hashValue(item)
+		}
+		return h
+	case map[string]any:
+		// order independent
+		h := uint64(7)
+		for k, item := range t {
+			h += maphash.String(uniqueSeed, k) ^ (hashValue(item) * 31)
+		}
+		return h
+	default:
+		return 0
+	}
+}
+
+// equalValues tells whether two JSON values are equal.
+func equalValues(v1, v2 any) bool {
+	switch t1 := v1.(type) {
+	case []any:
+		t2, ok := v2.([]any)
+		if !ok || len(t1) != len(t2) {
+			return false
+		}
+		for i := range t1 {
+			if !equalValues(t1[i], t2[i]) {
+				return false
+			}
+		}
+		return true
+	case map[string]any:
+		t2, ok := v2.(map[string]any)
+		if !ok || len(t1) != len(t2) {
+			return false
+		}
+		for k, item := range t1 {
+			other, exists := t2[k]
+			if !exists || !equalValues(item, other) {
+				return false
+			}
+		}
+		return true
+	default:
+		return v1 == v2
+	}
+}
+
+// ArrayIsUnique tells whether an array holds distinct values ($UNIQUE).
+// Mirrors jm_json_array_unique in json-model.c: items are bucketed by hash,
+// compared on collisions, and the check stops on the first duplicate.
+func ArrayIsUnique(v any) bool {
+	arr, ok := v.([]any)
+	if !ok {
+		return false
+	}
+	if len(arr) < 2 {
+		return true
+	}
+	scalars := make(map[any]struct{}, len(arr))
+	buckets := make(map[uint64][]any)
+	for _, item := range arr {
+		switch item.(type) {
+		case []any, map[string]any:
+			h := hashValue(item)
+			for _, other := range buckets[h] {
+				if equalValues(other, item) {
+					return false
+				}
+			}
+			buckets[h] = append(buckets[h], item)
+		default:
+			if _, seen := scalars[item]; seen {
+				return false
+			}
+			scalars[item] = struct{}{}
+		}
+	}
+	return true
+}
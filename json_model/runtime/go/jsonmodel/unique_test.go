@@ -0,0 +1,40 @@
+package jsonmodel
+
+import (
+	"math"
+	"testing"
+)
+
+func TestArrayIsUnique(t *testing.T) {
+	tests := []struct {
+		name     string
+		val      any
+		expected bool
+	}{
+		{"Not Array", "abc", false},
+		{"Empty", []any{}, true},
+		{"Single", []any{1.0}, true},
+		{"Numbers", []any{1.0, 2.0, 3.0}, true},
+		{"Duplicate Number", []any{1.0, 2.0, 1.0}, false},
+		{"Zeros", []any{0.0, math.Copysign(0, -1)}, false},
+		{"Mixed Scalars", []any{nil, false, 0.0, ""}, true},
+		{"Duplicate Null", []any{nil, nil}, false},
+		{"Number String", []any{1.0, "1"}, true},
+		{"Arrays", []any{[]any{1.0, 2.0}, []any{2.0, 1.0}}, true},
+		{"Duplicate Array", []any{[]any{1.0, []any{}}, []any{1.0, []any{}}}, false},
+		{"Objects", []any{map[string]any{"a": 1.0}, map[string]any{"b": 1.0}}, true},
+		{"Duplicate Object", []any{
+			map[string]any{"a": 1.0, "b": []any{true}},
+			map[string]any{"b": []any{true}, "a": 1.0},
+		}, false},
+		{"Empty Compounds", []any{[]any{}, map[string]any{}}, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := ArrayIsUnique(tt.val); got != tt.expected {
+				t.Errorf("ArrayIsUnique(%v) = %v, want %v", tt.val, got, tt.expected)
+			}
+		})
+	}
+}
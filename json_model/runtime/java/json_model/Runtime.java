@@ -4,7 +4,9 @@ import java.time.format.*;
 import java.util.regex.Pattern;
 import java.util.regex.Matcher;
 import java.util.Arrays;
-import java.util.Comparator;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
 import java.util.Iterator;
 import java.net.URI;
 import java.net.URL;
@@ -238,6 +240,38 @@ public class Runtime
         return 0;
     }
 
+    /** JSON thing structural hash, consistent with jcmp equality */
+    int jhash(Object o)
+    {
+        int t = json.type(o);
+        int h = 31 * t;
+        if (t == JSON.BOOLEAN)
+            return h + (json.asBoolean(o) ? 1 : 0);
+        if (t == JSON.INTEGER)
+            return h + Long.hashCode(json.asLong(o));
+        if (t == JSON.NUMBER) {
+            double d = json.asDouble(o);
+            return h + Double.hashCode(d == 0.0 ? 0.0 : d);  // -0.0 == 0.0
+        }
+        if (t == JSON.STRING)
+            return h + json.asString(o).hashCode();
+        if (t == JSON.ARRAY) {
+            // order dependent
+            int len = json.arrayLength(o);
+            for (int i = 0; i < len; i++)
+                h = 31 * h + jhash(json.arrayItem(o, i));
+        }
+        else if (t == JSON.OBJECT) {
+            // order independent
+            Iterator<String> props = json.objectIterator(o);
+            while (props.hasNext()) {
+                String p = props.next();
+                h += p.hashCode() ^ (31 * jhash(json.objectValue(o, p)));
+            }
+        }
+        return h;
+    }
+
     /** Is it a unique array? */
     public boolean array_is_unique(Object o, Path path, Report rep)
     {
@@ -247,25 +281,16 @@ public class Runtime
         if (length < 2)
             return true;
 
-        // extract array of things
-        Object[] array = new Object[length];
-        for (int i = 0; i < length; i++)
-            array[i] = json.arrayItem(o, i);
-
-        // sort
-        Arrays.sort(
-            array,
-            new Comparator<Object>() {
-                public int compare(Object o1, Object o2) {
-                    return jcmp(o1, o2);
-                }
-            }
-        );
-
-        // equal neighbors?
-        for (int i = 0; i < length - 1; i++)
-            if (this.jcmp(array[i], array[i+1]) == 0)
-                return false;
+        // bucket items per hash, compare on collisions, stop on first duplicate
+        HashMap<Integer, List<Object>> buckets = new HashMap<Integer, List<Object>>(2 * length);
+        for (int i = 0; i < length; i++) {
+            Object item = json.arrayItem(o, i);
+            List<Object> bucket = buckets.computeIfAbsent(jhash(item), h -> new ArrayList<Object>(1));
+            for (Object other: bucket)
+                if (jcmp(other, item) == 0)
+                    return false;
+            bucket.add(item);
+        }
 
         return true;
     }
@@ -0,0 +1,57 @@
+package json_model;
+
+/**
+ * $UNIQUE runtime tests, run with: make check
+ */
+public class UniqueTest
+{
+    static int failures = 0;
+
+    static void check(Runtime rt, JSON<Object> json, String name, String text, boolean expected)
+        throws JSON.Exception
+    {
+        boolean unique = rt.array_is_unique(json.fromJSON(text), null, null);
+        if (unique != expected) {
+            System.err.println(name + ": array_is_unique(" + text + ") = " + unique + ", want " + expected);
+            failures++;
+        }
+    }
+
+    public static void main(String[] args) throws JSON.Exception
+    {
+        JSON<Object> json = new GSON();
+        Runtime rt = new Runtime(json);
+
+        check(rt, json, "Not Array", "\"abc\"", false);
+        check(rt, json, "Empty", "[]", true);
+        check(rt, json, "Single", "[1.5]", true);
+        check(rt, json, "Numbers", "[1, 2, 3]", true);
+        check(rt, json, "Duplicate Number", "[1, 2, 1]", false);
+        // integers and doubles are distinct types
+        check(rt, json, "Integer Double", "[1, 1.0]", true);
+        check(rt, json, "Zeros", "[0.0, -0.0]", false);
+        check(rt, json, "Mixed Scalars", "[null, false, 0, \"\"]", true);
+        check(rt, json, "Duplicate Null", "[null, null]", false);
+        check(rt, json, "Number String", "[1, \"1\"]", true);
+        check(rt, json, "Boolean Number", "[true, 1]", true);
+        check(rt, json, "Arrays", "[[1, 2], [2, 1]]", true);
+        check(rt, json, "Duplicate Array", "[[1, []], [1, []]]", false);
+        check(rt, json, "Nested Arrays", "[[1, [2, [3]]], [1, [2, [3]]]]", false);
+        check(rt, json, "Objects", "[{\"a\": 1}, {\"b\": 1}]", true);
+        check(rt, json, "Duplicate Object", "[{\"a\": 1, \"b\": [true]}, {\"b\": [true], \"a\": 1}]", false);
+        check(rt, json, "Empty Compounds", "[[], {}]", true);
+
+        // distinct values with the same hash, as "Aa" and "BB" string hash codes
+        if (rt.jhash(json.fromJSON("[\"Aa\"]")) != rt.jhash(json.fromJSON("[\"BB\"]"))) {
+            System.err.println("Collision: jhash([\"Aa\"]) != jhash([\"BB\"])");
+            failures++;
+        }
+        check(rt, json, "Colliding Strings", "[\"Aa\", \"BB\"]", true);
+        check(rt, json, "Colliding Arrays", "[[\"Aa\"], [\"BB\"]]", true);
+        check(rt, json, "Colliding Objects", "[{\"k\": \"Aa\"}, {\"k\": \"BB\"}, {\"k\": \"Aa\"}]", false);
+
+        if (failures > 0)
+            System.err.println("UniqueTest: " + failures + " failures");
+        System.exit(failures > 0 ? 1 : 0);
+    }
+}
@@ -24,6 +24,26 @@ export function jm_is_valid_regex(pattern, extended, path, rep)
     }
 }
 
+// memoize regex exec results on strings, in a bounded LRU map
+export function jm_cached_exec(re, size)
+{
+    const cache = new Map()
+    return (s) => {
+        let match = cache.get(s)
+        if (match !== undefined) {
+            // move to most recently used
+            cache.delete(s)
+            cache.set(s, match)
+            return match
+        }
+        match = re.exec(s)
+        if (cache.size >= size)
+            cache.delete(cache.keys().next().value)
+        cache.set(s, match)
+        return match
+    }
+}
+
 // return whether date is a valid date ($DATE)
 const MONTH_DAYS = [ 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31 ];
 
@@ -208,13 +228,70 @@ export function jm_cmp(v1, v2)
     return jm_obj_cmp(v1, v2)
 }
 
-// works for anything
+// FNV-1a on 32 bits
+function jm_hash_str(s, h)
+{
+    for (let i = 0; i < s.length; i++)
+        h = Math.imul(h ^ s.charCodeAt(i), 16777619)
+    return h
+}
+
+// structural hash, consistent with jm_cmp equality
+export function jm_hash(val)
+{
+    const t = jm_typeof(val)
+    let h = jm_hash_str(t, 2166136261)
+    if (t === 'array')
+    {
+        // order dependent
+        for (const item of val)
+            h = (Math.imul(h, 31) + jm_hash(item)) | 0
+    }
+    else if (t === 'object')
+    {
+        // order independent
+        let sum = 0
+        for (const k of Object.keys(val))
+            sum = (sum + (jm_hash_str(k, 2166136261) ^ Math.imul(jm_hash(val[k]), 31))) | 0
+        h ^= sum
+    }
+    else if (t !== 'null')
+        h = jm_hash_str(String(val), h)  // String(-0) is "0"
+    return h
+}
+
+// works for anything, stops on the first duplicate
 export function jm_array_is_unique(arr)
 {
-    let sorted = arr.length > 2 ? arr.toSorted(jm_cmp) : arr
-    for (let i = 0; i < sorted.length - 1; i++)
-        if (jm_cmp(sorted[i], sorted[i+1]) == 0)
-            return false
+    if (arr.length < 2)
+        return true
+    // scalars are compared by value in a set
+    const scalars = new Set()
+    // arrays and objects are bucketed by hash, then compared
+    const buckets = new Map()
+    for (const item of arr)
+    {
+        if (item === null || typeof item !== 'object')
+        {
+            if (scalars.has(item))
+                return false
+            scalars.add(item)
+        }
+        else
+        {
+            const h = jm_hash(item)
+            const bucket = buckets.get(h)
+            if (bucket === undefined)
+                buckets.set(h, [item])
+            else
+            {
+                for (const other of bucket)
+                    if (jm_cmp(other, item) === 0)
+                        return false
+                bucket.push(item)
+            }
+        }
+    }
     return true
 }
 
@@ -237,3 +314,56 @@ export function jm_check_constraint(v1, op, v2, path, rep)
         return v >= v2
     throw `unexpected comparison operator ${op}`
 }
+
+// profiling data of instrumented check functions, by model path or regex
+const jm_profiles = new Map()
+
+// wrap a check function to collect calls, results, cumulative time
+// and property names of object values under key
+export function jm_profiled(fun, key)
+{
+    let stats = jm_profiles.get(key)
+    if (stats === undefined) {
+        stats = { calls: 0, pass: 0, fail: 0, ns: 0, props: new Map() }
+        jm_profiles.set(key, stats)
+    }
+    const props = stats.props
+    return (val, path, rep) => {
+        const start = performance.now()
+        const res = fun(val, path, rep)
+        stats.ns += Math.round(1000000.0 * (performance.now() - start))
+        stats.calls++
+        res ? stats.pass++ : stats.fail++
+        if (val !== null && typeof val === 'object' && !Array.isArray(val))
+            for (const prop in val)
+                props.set(prop, (props.get(prop) ?? 0) + 1)
+        return res
+    }
+}
+
+// profiling data of called check functions, by key
+export function jm_profile_data()
+{
+    const data = {}
+    for (const [key, stats] of jm_profiles)
+        if (stats.calls) {
+            const { props, ...counts } = stats
+            data[key] = counts
+            if (props.size)
+                data[key].props = Object.fromEntries(props)
+        }
+    return data
+}
+
+// profiling data as a table, by decreasing cumulative time
+export function jm_profile_table()
+{
+    const entries = Object.entries(jm_profile_data()).sort((a, b) => b[1].ns - a[1].ns)
+    let lines = [ `${'calls'.padStart(10)} ${'pass'.padStart(10)} ${'fail'.padStart(10)} ` +
+                  `${'total ms'.padStart(10)} ${'µs/call'.padStart(9)}  key` ]
+    for (const [key, s] of entries)
+        lines.push(`${String(s.calls).padStart(10)} ${String(s.pass).padStart(10)} ` +
+                   `${String(s.fail).padStart(10)} ${(s.ns / 1e6).toFixed(3).padStart(10)} ` +
+                   `${(s.ns / 1e3 / s.calls).toFixed(3).padStart(9)}  ${key}`)
+    return lines.join('\n')
+}
@@ -1,7 +1,7 @@
 import { parseArgs } from 'node:util'
 import fs from 'node:fs/promises'
 
-import { jm_set_rx } from 'json_model_runtime'
+import { jm_set_rx, jm_profile_data, jm_profile_table } from 'json_model_runtime'
 import { createRequire } from 'node:module';
 const require = createRequire(import.meta.url);
 
@@ -135,6 +135,7 @@ export default async function main(checker_init, checker, checker_free)
       're2': { type: 'boolean' },
       'regexp': { type: 'boolean' },
       'jsonschema-benchmark': { type: 'boolean', short: 'B' },
+      'profile': { type: 'string', short: 'P' },
     }
 
     const args = parseArgs({options, allowPositionals: true})
@@ -235,6 +236,12 @@ export default async function main(checker_init, checker, checker_free)
         }
     }
 
+    // profiling data of a checker generated with profiling
+    if (args.values.profile === 'json')
+        console.error(JSON.stringify(jm_profile_data(), null, 2))
+    else if (args.values.profile !== undefined)
+        console.error(jm_profile_table())
+
     checker_free()
     process.exit(errors ? 4 : 0)
 }
@@ -0,0 +1,38 @@
+// JSON Model Runtime tests, run with: node --test
+
+import { test } from 'node:test'
+import assert from 'node:assert/strict'
+import { jm_array_is_unique, jm_hash } from './index.js'
+
+test('jm_array_is_unique', () => {
+    const tests = [
+        ['Empty', [], true],
+        ['Single', [1.5], true],
+        ['Numbers', [1, 2, 3], true],
+        ['Duplicate Number', [1, 2, 1], false],
+        // 1 and 1.0 are the same number in JavaScript
+        ['Integer Float', [1, 1.0], false],
+        ['Zeros', [0, -0], false],
+        ['Mixed Scalars', [null, false, 0, ''], true],
+        ['Duplicate Null', [null, null], false],
+        ['Number String', [1, '1'], true],
+        ['Boolean Number', [true, 1], true],
+        ['Arrays', [[1, 2], [2, 1]], true],
+        ['Duplicate Array', [[1, []], [1, []]], false],
+        ['Nested Arrays', [[1, [2, [3]]], [1, [2, [3]]]], false],
+        ['Objects', [{a: 1}, {b: 1}], true],
+        ['Duplicate Object', [{a: 1, b: [true]}, {b: [true], a: 1}], false],
+        ['Empty Compounds', [[], {}], true],
+    ]
+    for (const [name, val, expected] of tests)
+        assert.equal(jm_array_is_unique(val), expected, name)
+})
+
+test('jm_array_is_unique collisions', () => {
+    // distinct values with the same 32 bits hash
+    assert.equal(jm_hash([65799]), jm_hash([513610]))
+    assert.equal(jm_hash({k: 65799}), jm_hash({k: 513610}))
+    assert.equal(jm_array_is_unique([[65799], [513610]]), true)
+    assert.equal(jm_array_is_unique([{k: 65799}, {k: 513610}]), true)
+    assert.equal(jm_array_is_unique([{k: 65799}, {k: 513610}, {k: 65799}]), false)
+})
@@ -0,0 +1,281 @@
+#
+# Event-driven validation of raw JSON bytes against compiled stream plans
+#
+# A stream plan mirrors the structure of a model:
+# - a check function: the value is materialized and checked as a whole
+# - True: any value, which is skipped
+# - [item]: an array whose items are checked incrementally with the item plan
+# - (props, must, other): an object whose properties are checked incrementally,
+#   with a plan per property name, the set of mandatory names and the plan for
+#   other properties, or None if the object is closed.
+#
+# Only the values of check function leaves are built, so memory is bounded by the
+# nesting depth of the plan and the size of leaf values, not by the document size.
+#
+import json
+import re
+
+from json_model.runtime.types import Path, Report, StreamPlan
+
+_WS = re.compile(rb"[ \t\n\r]*")
+_STR = re.compile(rb'"([^"\\\x00-\x1f]*)"')
+_ESC_STR = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_NUM = re.compile(rb"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+# skip to next structural byte
+_NOT_STRUCT = re.compile(rb'[^"\[\]{}]*')
+# strict string, as accepted by json, with an unrolled loop to match in linear time
+_JSON_STR_RE = rb'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+_JSON_STR = re.compile(_JSON_STR_RE)
+# next token of a skipped value: open, close, punctuation, string or scalar
+_TOKEN = re.compile(rb"[ \t\n\r]*(?:([\[{])|([\]}])|([,:])|(" + _JSON_STR_RE + rb")|"
+                    rb"(-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?|true|false|null))")
+# skipped container states
+_VALUE, _VALUE_OR_END, _KEY, _KEY_OR_END, _COLON, _NEXT = range(6)
+
+_LITERALS = {ord("t"): (b"true", True), ord("f"): (b"false", False), ord("n"): (b"null", None)}
+
+
+class JsonTokens:
+    """Pull tokenizer over raw JSON bytes."""
+
+    def __init__(self, data: bytes|bytearray|memoryview):
+        self._data = data
+        self._pos = 0
+
+    def _error(self, msg: str):
+        raise ValueError(f"invalid JSON at byte {self._pos}: {msg}")
+
+    def _peek(self) -> int:
+        """Skip white spaces and return the next byte, -1 at end."""
+        self._pos = _WS.match(self._data, self._pos).end()  # type: ignore
+        return self._data[self._pos] if self._pos < len(self._data) else -1
+
+    def take(self, byte: int) -> bool:
+        """Consume next byte if it is the expected one."""
+        if self._peek() == byte:
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, byte: int):
+        """Consume the expected next byte."""
+        if not self.take(byte):
+            self._error(f"expecting {chr(byte)!r}")
+
+    def string(self) -> str:
+        """Consume a string."""
+        if self._peek() != ord('"'):
+            self._error("expecting a string")
+        if match := _STR.match(self._data, self._pos):
+            self._pos = match.end()
+            return match.group(1).decode("UTF-8")
+        # with escapes, let json do the decoding and control checks
+        if match := _ESC_STR.match(self._data, self._pos):
+            self._pos = match.end()
+            return json.loads(match.group(0))
+        self._error("unterminated string")
+        return ""  # pragma: no cover
+
+    def key(self) -> str:
+        """Consume an object property name and its colon."""
+        name = self.string()
+        self.expect(ord(":"))
+        return name
+
+    def _check_str(self, string: bytes):
+        """Check that a skipped string is valid UTF-8."""
+        if not string.isascii():
+            try:
+                string.decode("UTF-8")
+            except UnicodeDecodeError:
+                self._error("invalid UTF-8 string")
+
+    def _skip_end(self, pos: int) -> int:
+        """Return the end position of the array or object at pos, checking its syntax."""
+        data, stack, state = self._data, bytearray(), _VALUE
+        while True:
+            match = _TOKEN.match(data, pos)
+            if not match:
+                self._pos = _WS.match(data, pos).end()  # type: ignore
+                self._error("invalid value" if self._pos < len(data) else "unterminated array or object")
+            opening, closing, punct, string, _scalar = match.groups()  # type: ignore
+            self._pos, pos = match.start(), match.end()  # type: ignore
+            if opening:
+                if state > _VALUE_OR_END:
+                    self._error("unexpected array or object")
+                stack.append(ord("]") if opening == b"[" else ord("}"))
+                state = _VALUE_OR_END if opening == b"[" else _KEY_OR_END
+            elif closing:
+                if state not in (_NEXT, _VALUE_OR_END, _KEY_OR_END) or stack[-1] != closing[0] or \
+                        state == _VALUE_OR_END and closing != b"]" or state == _KEY_OR_END and closing != b"}":
+                    self._error(f"unexpected {closing.decode()!r}")
+                stack.pop()
+                if not stack:
+                    return pos
+                state = _NEXT
+            elif punct == b",":
+                if state != _NEXT:
+                    self._error("unexpected ','")
+                state = _VALUE if stack[-1] == ord("]") else _KEY
+            elif punct == b":":
+                if state != _COLON:
+                    self._error("unexpected ':'")
+                state = _VALUE
+            elif string:
+                if state in (_KEY, _KEY_OR_END):
+                    state = _COLON
+                elif state in (_VALUE, _VALUE_OR_END):
+                    state = _NEXT
+                else:
+                    self._error("unexpected string")
+                self._check_str(string)
+            else:  # scalar
+                if state > _VALUE_OR_END:
+                    self._error("unexpected value")
+                state = _NEXT
+
+    def _end(self, check: bool = False) -> int:
+        """Return the end position of the next value, without consuming it.
+
+        Strings and containers are fully checked only if required, as built values
+        are checked when decoded.
+        """
+        byte = self._peek()
+        data, start = self._data, self._pos
+        if byte == ord('"'):
+            match = (_JSON_STR if check else _ESC_STR).match(data, start)
+            if not match:
+                self._error("invalid or unterminated string")
+            if check:
+                self._check_str(match.group(0))  # type: ignore
+            return match.end()  # type: ignore
+        elif byte in (ord("["), ord("{")) and check:
+            end = self._skip_end(start)
+            self._pos = start
+            return end
+        elif byte in (ord("["), ord("{")):
+            pos, depth = start, 0
+            while True:
+                pos = _NOT_STRUCT.match(data, pos).end()  # type: ignore
+                if pos >= len(data):
+                    self._error("unterminated array or object")
+                byte = data[pos]
+                if byte == ord('"'):
+                    match = _ESC_STR.match(data, pos)
+                    if not match:
+                        self._error("unterminated string")
+                    pos = match.end()  # type: ignore
+                    continue
+                depth += 1 if byte in (ord("["), ord("{")) else -1
+                pos += 1
+                if depth == 0:
+                    return pos
+        elif byte in _LITERALS:
+            literal = _LITERALS[byte][0]
+            if data[start:start + len(literal)] != literal:
+                self._error("unexpected literal")
+            return start + len(literal)
+        else:
+            match = _NUM.match(data, start)
+            if not match or match.end() == start:
+                self._error("expecting a value")
+            return match.end()  # type: ignore
+
+    def value(self):
+        """Consume and build the next value."""
+        end = self._end()
+        data, start = self._data, self._pos
+        self._pos = end
+        byte = data[start]
+        # scalar shortcuts
+        if byte in _LITERALS:
+            return _LITERALS[byte][1]
+        elif byte == ord('"'):
+            if match := _STR.match(data, start):
+                return match.group(1).decode("UTF-8")
+        elif byte not in (ord("["), ord("{")):
+            match = _NUM.match(data, start)
+            if not match.group(1) and not match.group(2):  # type: ignore
+                return int(data[start:end])
+        return json.loads(bytes(data[start:end]))
+
+    def skip(self):
+        """Consume the next value without building it, but checking it."""
+        self._pos = self._end(True)
+
+    def done(self):
+        """Check that there is no remaining data."""
+        if self._peek() != -1:
+            self._error("unexpected trailing data")
+
+
+def _fail(msg: str, path: Path, rep: Report) -> bool:
+    _ = rep is None or rep.append((msg, path))
+    return False
+
+
+def check_tokens(plan: StreamPlan, tokens: JsonTokens, path: Path, rep: Report = None) -> bool:
+    """Check the next value from a token stream, stopping on the first failure."""
+
+    if plan is True:
+        tokens.skip()
+        return True
+
+    if callable(plan):
+        return plan(tokens.value(), path, rep)
+
+    if isinstance(plan, list):
+        if not tokens.take(ord("[")):
+            return _fail("not array or unexpected array", path, rep)
+        item, idx = plan[0], 0
+        if tokens.take(ord("]")):
+            return True
+        while True:
+            if not check_tokens(item, tokens, (path, idx) if path is not None else None, rep):
+                return _fail("unexpected element", path, rep)
+            if tokens.take(ord("]")):
+                return True
+            tokens.expect(ord(","))
+            idx += 1
+
+    # else an object
+    props, must, other = plan
+    if not tokens.take(ord("{")):
+        return _fail("not an object", path, rep)
+    seen: set[str] = set()
+    if not tokens.take(ord("}")):
+        while True:
+            prop = tokens.key()
+            lpath = (path, prop) if path is not None else None
+            if prop in must:
+                seen.add(prop)
+                if not check_tokens(props[prop], tokens, lpath, rep):
+                    return _fail("invalid mandatory prop value", lpath, rep)
+            elif (pplan := props.get(prop, other)) is not None:
+                if not check_tokens(pplan, tokens, lpath, rep):
+                    return _fail("invalid optional prop value", lpath, rep)
+            else:
+                return _fail("unexpected prop", lpath, rep)
+            if tokens.take(ord("}")):
+                break
+            tokens.expect(ord(","))
+    if len(seen) != len(must):
+        missing = min(must - seen)
+        return _fail(f"missing mandatory prop <{missing}>", path, rep)
+    return True
+
+
+def check_stream(plan: StreamPlan, data: bytes|bytearray|memoryview,
+                 path: Path = (), rep: Report = None) -> bool:
+    """Check raw JSON data against a stream plan, without building the whole value.
+
+    Raise ValueError on invalid JSON, unless the data was rejected before.
+    """
+    tokens = JsonTokens(data)
+    valid = check_tokens(plan, tokens, path, rep)
+    if valid:
+        tokens.done()
+    return valid
+
+
+__all__ = ["JsonTokens", "check_stream", "check_tokens"]
@@ -1,12 +1,17 @@
-from collections.abc import MutableMapping, MutableSet
+from collections.abc import MutableMapping, MutableSet, Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+import collections
+import functools
+import itertools
+import mmap
+import os
 import datetime
 import time
-import validators
 import json
 import re  # FIXME re2?
 import math
 
-from json_model.runtime.types import Jsonable, JsonScalar, Report, Path, CheckFun
+from json_model.runtime.types import Jsonable, JsonScalar, Report, Reports, JsonValues, Path, CheckFun
 
 # special undefined value
 def UNDEFINED(v, p, r):
@@ -18,12 +23,25 @@ def _tname(value: Jsonable) -> str:
 
 # maybe add message to report
 def _rep(msg: str, rep: Report) -> bool:
-    _ = rep is None or rep.append((msg, []))
+    _ = rep is None or rep.append((msg, ()))
     return False
 
+# flatten linked path
+def _path_list(path: Path|list[int|str]) -> list[int|str]|None:
+    """Return path segments as a list, from root to leaf."""
+    if path is None or isinstance(path, list):
+        return path
+    segments: list[int|str] = []
+    while path:
+        path, segment = path
+        segments.append(segment)
+    segments.reverse()
+    return segments
+
 # generate path for display
-def _path(path: Path) -> str:
+def _path(path: Path|list[int|str]) -> str:
     """Show path as a JSON Path (RFC9535), with proper escaping when necessary."""
+    path = _path_list(path)
     if path is None:
         return ""
 
@@ -160,38 +178,80 @@ class ConstMap(MutableMapping[JsonScalar, CheckFun]):
 # PREDEFS HELPERS
 #
 
+# NOTE fast string checks return whether the value is valid, the reporting
+# slow path recomputes the error message on failures.
+
+def _is_date(value: str) -> bool:
+    # all iso formats start with a 4-digit year, skip costly exceptions
+    if not value[:4].isdigit():
+        return False
+    try:
+        datetime.date.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_time(value: str) -> bool:
+    # all iso formats start with a 2-digit hour, possibly after a "T"
+    if not (value[1:3] if value[:1] == "T" else value[:2]).isdigit():
+        return False
+    try:
+        datetime.time.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_datetime(value: str) -> bool:
+    # all iso formats start with a date
+    if not value[:4].isdigit():
+        return False
+    try:
+        datetime.datetime.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+
 def is_valid_date(value: Jsonable, path: Path, rep: Report = None) -> bool:
     if isinstance(value, str):
-        try:
-            datetime.date.fromisoformat(value)
+        if _predef["$DATE"](value):
             return True
-        except Exception as e:
-            _ = rep is None or rep.append((f"invalid date {value} ({e})", path))
-            return False
+        if rep is not None:
+            try:
+                datetime.date.fromisoformat(value)
+            except Exception as e:
+                rep.append((f"invalid date {value} ({e})", path))
+        return False
     _ = rep is None or rep.append((f"incompatible type {_tname(value)} for date", path))
     return False
 
 
 def is_valid_time(value: Jsonable, path: Path, rep: Report = None) -> bool:
     if isinstance(value, str):
-        try:
-            datetime.time.fromisoformat(value)
+        if _predef["$TIME"](value):
             return True
-        except Exception as e:
-            _ = rep is None or rep.append((f"invalid time {value} ({e})", path))
-            return False
+        if rep is not None:
+            try:
+                datetime.time.fromisoformat(value)
+            except Exception as e:
+                rep.append((f"invalid time {value} ({e})", path))
+        return False
     _ = rep is None or rep.append((f"incompatible type {_tname(value)} for time", path))
     return False
 
 
 def is_valid_datetime(value: Jsonable, path: Path, rep: Report = None) -> bool:
     if isinstance(value, str):
-        try:
-            datetime.datetime.fromisoformat(value)
+        if _predef["$DATETIME"](value):
             return True
-        except Exception as e:
-            _ = rep is None or rep.append((f"invalid datetime {value} ({e})", path))
-            return False
+        if rep is not None:
+            try:
+                datetime.datetime.fromisoformat(value)
+            except Exception as e:
+                rep.append((f"invalid datetime {value} ({e})", path))
+        return False
     _ = rep is None or rep.append((f"incompatible type {_tname(value)} for datetime", path))
     return False
 
@@ -220,18 +280,41 @@ def is_valid_uuid(value: Jsonable, path: Path, rep: Report = None) -> bool:
         return False
 
 
-def is_valid_url(value: Jsonable, path: Path, rep: Report = None) -> bool:
+# common url and email forms, which are accepted by validators as well
+_LABEL_RE = r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+_DOMAIN_RE = rf"(?:{_LABEL_RE}\.)+[A-Za-z]{{2,63}}"
+_QPARAM_RE = r"[A-Za-z0-9._~-]+=[A-Za-z0-9._~-]+"
+_URL_FAST = re.compile(
+    rf"https?://{_DOMAIN_RE}(?:/[A-Za-z0-9._~/-]*)?(?:\?{_QPARAM_RE}(?:&{_QPARAM_RE})*)?"
+).fullmatch
+_EMAIL_FAST = re.compile(rf"(?=[^@]{{1,64}}@)[A-Za-z0-9_+-]+(?:\.[A-Za-z0-9_+-]+)*@{_DOMAIN_RE}").fullmatch
+
+def _is_url(value: str) -> bool:
     # NOTE urllib.parse accepts any garbage…
     # NOTE simple_host required to accept "localhost"
     # FIXME file:// is not a url…
-    valid = isinstance(value, str) and validators.url(value, simple_host=True) is True
+    if len(value) <= 253 and _URL_FAST(value) is not None:
+        return True
+    import validators  # costly, imported on the first slow path
+    return validators.url(value, simple_host=True) is True
+
+
+def _is_email(value: str) -> bool:
+    if len(value) <= 253 and _EMAIL_FAST(value) is not None:
+        return True
+    import validators
+    return validators.email(value) is True
+
+
+def is_valid_url(value: Jsonable, path: Path, rep: Report = None) -> bool:
+    valid = isinstance(value, str) and _predef["$URL"](value)
     if not valid:
         _ = rep is None or rep.append((f"invalid url {value}", path))
     return valid
 
 
 def is_valid_email(value: Jsonable, path: Path, rep: Report = None) -> bool:
-    valid = isinstance(value, str) and validators.email(value) is True
+    valid = isinstance(value, str) and _predef["$EMAIL"](value)
     if not valid:
         _ = rep is None or rep.append((f"invalid email {value}", path))
     return valid
@@ -250,14 +333,24 @@ def is_valid_json(value: Jsonable, path: Path, rep: Report = None) -> bool:
 
 
 # quite inefficient but safe
+def _is_regex(value: str) -> bool:
+    try:
+        re.compile(value)
+        return True
+    except Exception:
+        return False
+
+
 def is_valid_regex(value: Jsonable, path: Path, rep: Report = None) -> bool:
     if isinstance(value, str):
-        try:
-            re.compile(value)
+        if _predef["$REGEX"](value):
             return True
-        except Exception as e:
-            _ = rep is None or rep.append((f"regex {value} compile error ({e})", path))
-            return False
+        if rep is not None:
+            try:
+                re.compile(value)
+            except Exception as e:
+                rep.append((f"regex {value} compile error ({e})", path))
+        return False
     # other types cannot be valid regex
     _ = rep is None or rep.append((f"incompatible type for regex: {_tname(value)}", path))
     return False
@@ -276,10 +369,131 @@ def is_valid_exreg(value: Jsonable, path: Path, rep: Report = None) -> bool:
     return is_valid_regex(value, path, rep)
 
 
+class LazyRegex:
+    """Regular expression compiled on its first search, for lazy initialization."""
+
+    def __init__(self, relib, pattern: str):
+        self._relib, self._pattern, self._reco = relib, pattern, None
+
+    def search(self, s: str):
+        if self._reco is None:
+            self._reco = self._relib.compile(self._pattern)
+            # later calls through the instance go straight to the compiled regex
+            self.search = self._reco.search
+        return self._reco.search(s)
+
+
+def cached_search(reco, maxsize: int) -> Callable[[str], object]:
+    """Memoize a compiled regex search on strings in a bounded LRU cache.
+
+    Match objects are immutable, so that they can be shared between calls.
+    """
+    return functools.lru_cache(maxsize=maxsize)(reco.search)
+
+
+# string predef checks, possibly wrapped in LRU caches
+_PREDEF_CHECKS: dict[str, Callable[[str], bool]] = {
+    "$DATE": _is_date,
+    "$TIME": _is_time,
+    "$DATETIME": _is_datetime,
+    "$URL": _is_url,
+    "$EMAIL": _is_email,
+    "$REGEX": _is_regex,
+}
+
+_predef: dict[str, Callable[[str], bool]] = dict(_PREDEF_CHECKS)
+
+def predef_cache(maxsize: int = 1024):
+    """Cache string predef results in bounded LRU caches, 0 to disable, -1 for unbounded."""
+    for name, check in _PREDEF_CHECKS.items():
+        _predef[name] = check if maxsize == 0 else \
+            functools.lru_cache(maxsize=None if maxsize < 0 else maxsize)(check)
+
+
+def predef_cache_info() -> dict[str, dict[str, int|float|None]]:
+    """Per predef cache hits, misses, size and hit rate, empty if caching is disabled."""
+    info = {}
+    for name, check in _predef.items():
+        if hasattr(check, "cache_info"):
+            ci = check.cache_info()
+            calls = ci.hits + ci.misses
+            info[name] = {"hits": ci.hits, "misses": ci.misses,
+                          "size": ci.currsize, "maxsize": ci.maxsize,
+                          "rate": ci.hits / calls if calls else 0.0}
+    return info
+
+
+# profiling data of instrumented check functions, by model path or regex:
+# calls, passes, fails, cumulative nanoseconds
+_profiles: dict[str, list] = {}
+
+def profiled(fun: Callable, key: str) -> Callable:
+    """Wrap a check function to collect calls, results, cumulative time and
+    property names of object values under key."""
+    stats = _profiles.setdefault(key, [0, 0, 0, 0, {}])
+    perf = time.perf_counter_ns
+    props = stats[4]
+
+    def profiled_fun(val, path, rep):
+        start = perf()
+        res = fun(val, path, rep)
+        stats[3] += perf() - start
+        stats[0] += 1
+        stats[1 if res else 2] += 1
+        if type(val) is dict:
+            for prop in val:
+                props[prop] = props.get(prop, 0) + 1
+        return res
+
+    return profiled_fun
+
+
+def profile_data() -> dict[str, dict[str, Jsonable]]:
+    """Profiling data of called check functions, by key."""
+    data: dict[str, dict[str, Jsonable]] = {}
+    for key, s in _profiles.items():
+        if s[0]:
+            data[key] = {"calls": s[0], "pass": s[1], "fail": s[2], "ns": s[3]}
+            if s[4]:
+                data[key]["props"] = dict(s[4])
+    return data
+
+
+def profile_reset():
+    """Reset profiling data."""
+    for stats in _profiles.values():
+        stats[:4] = [0, 0, 0, 0]
+        stats[4].clear()
+
+
+def profile_table() -> str:
+    """Profiling data as a table, by decreasing cumulative time."""
+    lines = [f"{'calls':>10} {'pass':>10} {'fail':>10} {'total ms':>10} {'µs/call':>9}  key"]
+    for key, s in sorted(profile_data().items(), key=lambda ks: -ks[1]["ns"]):
+        lines.append(f"{s['calls']:10d} {s['pass']:10d} {s['fail']:10d} {s['ns'] / 1e6:10.3f} "
+                     f"{s['ns'] / 1e3 / s['calls']:9.3f}  {key}")
+    return "\n".join(lines)
+
+
+def _unique_key(value: Jsonable):
+    """Hashable key of a JSON value, 1, 1.0 and True are kept distinct."""
+    if isinstance(value, list):
+        return (list, tuple(_unique_key(i) for i in value))
+    if isinstance(value, dict):
+        return (dict, frozenset((k, _unique_key(v)) for k, v in value.items()))
+    return (type(value), value)
+
 def is_unique_array(value: Jsonable, path: Path, rep: Report = None) -> bool:
     if isinstance(value, list):
-        # that costs but works in all cases…
-        unique = len(set(json.dumps(i, sort_keys=True) for i in value)) == len(value)
+        seen: set = set()
+        unique = True
+        for item in value:
+            # strings cannot collide with tuple keys
+            key = item if type(item) is str else _unique_key(item)
+            if key in seen:
+                unique = False
+                break
+            seen.add(key)
         if not unique:
             _ = rep is None or rep.append(("non unique array", path))
         return unique
@@ -336,8 +550,120 @@ def check_constraint(value: Jsonable, op: str, cst: int|float|str, path: Path, r
     return cmp
 
 
-def main(jm_fun, jm_map, jmc_version):
-    """Possibly run as a script: $0 values..."""
+#
+# BATCH VALIDATION
+#
+def check_many(checker: CheckFun, values: JsonValues, reports: Reports|None = None,
+               rchecker: CheckFun|None = None) -> bytearray:
+    """Check values in a tight loop, return one byte per value: 1 for pass, 0 for fail.
+
+    If reports is not None, failed values are checked again to collect their report,
+    stored by value index, with rchecker if provided, eg a reporting variant of checker.
+    """
+    results = bytearray()
+    append = results.append
+    if reports is None:
+        for val in values:
+            append(checker(val, None, None))
+    else:
+        rchecker = rchecker or checker
+        for index, val in enumerate(values):
+            if checker(val, None, None):
+                append(1)
+            else:
+                append(0)
+                rep: Report = []
+                rchecker(val, (), rep)
+                reports[index] = rep
+    return results
+
+# worker process checker for parallel validation
+_worker_fun: Callable[..., CheckFun]|None = None
+_worker_dual: bool = False
+
+def _worker_init(jm_init: Callable[[], None]|None, jm_fun: Callable[..., CheckFun],
+                 cache_size: int = 0, dual: bool = False):
+    """Initialize a worker process, once."""
+    global _worker_fun, _worker_dual
+    if cache_size:
+        predef_cache(cache_size)
+    if jm_init is not None:
+        jm_init()
+    _worker_fun, _worker_dual = jm_fun, dual
+
+def _worker_check(name: str, values: Iterable, report: bool,
+                  loads: Callable[[str], Jsonable]|None):
+    """Check a chunk of values in a worker process, possibly parsing them first."""
+    assert _worker_fun is not None, "worker is initialized"
+    if loads is not None:
+        values = [loads(v) for v in values]
+    reports: Reports|None = {} if report else None
+    rchecker = _worker_fun(name, True) if report and _worker_dual else None
+    return check_many(_worker_fun(name), values, reports, rchecker), reports
+
+def check_chunks(checker: CheckFun, values: Iterable, report: bool = False,
+                 *, loads: Callable[[str], Jsonable]|None = None,
+                 chunk_size: int = 1000,
+                 rchecker: CheckFun|None = None) -> Iterator[tuple[bytearray, Reports|None]]:
+    """Check values by chunks, yield each chunk results and reports indexed within the chunk.
+
+    If loads is provided, values are JSON strings parsed chunk by chunk, so that
+    memory is bounded by the chunk size when values are read from a stream.
+    """
+    for chunk in itertools.batched(values, chunk_size):
+        if loads is not None:
+            chunk = [loads(v) for v in chunk]
+        reports: Reports|None = {} if report else None
+        yield check_many(checker, chunk, reports, rchecker), reports
+
+def check_chunks_parallel(pool: Executor, name: str, values: Iterable, report: bool = False,
+                          *, loads: Callable[[str], Jsonable]|None = None,
+                          chunk_size: int = 1000,
+                          window: int = 64) -> Iterator[tuple[bytearray, Reports|None]]:
+    """Check values by chunks with a process pool, see check_chunks.
+
+    The pool workers must have been initialized with _worker_init.
+    If loads is provided, values are JSON strings parsed by the workers.
+    At most window chunks are in flight, and results are yielded in order.
+    """
+    pending: collections.deque[Future] = collections.deque()
+    for chunk in itertools.batched(values, chunk_size):
+        pending.append(pool.submit(_worker_check, name, chunk, report, loads))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def check_many_parallel(pool: Executor, name: str, values: JsonValues, reports: Reports|None = None,
+                        *, loads: Callable[[str], Jsonable]|None = None,
+                        chunk_size: int = 1000, window: int = 64) -> bytearray:
+    """Check values in chunks with a process pool, with the same results as check_many."""
+    results = bytearray()
+    for oks, reps in check_chunks_parallel(pool, name, values, reports is not None,
+                                           loads=loads, chunk_size=chunk_size, window=window):
+        if reps:
+            start = len(results)
+            reports.update((start + index, rep) for index, rep in reps.items())  # type: ignore
+        results.extend(oks)
+    return results
+
+def jsonl_lines(fn: str, use_mmap: bool = False) -> Iterator[bytes]:
+    """Iterate over the non blank lines of a JSONL file, possibly through a memory map."""
+    with open(fn, "rb") as f:
+        if not use_mmap:
+            yield from (line for line in f if not line.isspace())
+        elif os.fstat(f.fileno()).st_size > 0:  # empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                yield from (line for line in iter(mm.readline, b"") if not line.isspace())
+
+
+def main(jm_fun, jm_map, jmc_version, jm_init=None, dual=False):
+    """Possibly run as a script: $0 values...
+
+    In dual mode, jm_fun(name, True) returns the reporting variant of a check function.
+    """
 
     import json
     import sys
@@ -362,6 +688,14 @@ def main(jm_fun, jm_map, jmc_version):
     ap.add_argument("--jsonl", "-L", action="store_true", default=False, help="assume JSONL files")
     ap.add_argument("--jsonschema-benchmark", action="store_true", default=False,
                     help="specific JSON Schema Benchmark run")
+    ap.add_argument("--jobs", "-j", type=int, default=1,
+                    help="number of worker processes for JSONL and test vector files")
+    ap.add_argument("--mmap", "-m", action="store_true", default=False,
+                    help="read JSONL files through a memory map")
+    ap.add_argument("--predef-cache", "-C", type=int, default=0,
+                    help="cache predef results for this many strings, -1 for unbounded")
+    ap.add_argument("--profile", "-P", choices=["json", "table"], default=None,
+                    help="show profiling data of a checker generated with profiling")
     ap.add_argument("values", nargs="*", help="JSON files")
     args = ap.parse_args()
 
@@ -376,11 +710,70 @@ def main(jm_fun, jm_map, jmc_version):
     if args.jsonschema_benchmark:
         args.jsonl = True
 
+    if args.predef_cache:
+        predef_cache(args.predef_cache)
+
+    # parallel validation of batches
+    pool: Executor|None = None
+    if args.jobs > 1:
+        if args.time > 1 or args.jsonschema_benchmark or args.profile:
+            log.warning("ignoring --jobs when timing or profiling")
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(args.jobs, initializer=_worker_init,
+                                       initargs=(jm_init, jm_fun, args.predef_cache, dual))
+
+    def rep_fun(name: str) -> CheckFun:
+        """Return reporting check function."""
+        return jm_fun(name, True) if dual else jm_fun(name)
+
+    def show(fn: str, info: str, expect: bool|None, valid: bool, reasons: Report) -> int:
+        """Display one result, return number of errors."""
+        result = "PASS" if valid else "FAIL"
+        if expect is not None and valid != expect:
+            print(f"{fn}{info}: ERROR unexpected {result}")
+            return 1
+        elif valid:
+            print(f"{fn}{info}: PASS")
+        elif reasons:
+            msg = "; ".join(f"{_path(p)}: {m}" for m, p in reversed(reasons))
+            print(f"{fn}{info}: FAIL ({msg})")
+        else:
+            print(f"{fn}{info}: FAIL")
+        return 0
+
+    def stream_jsonl(fn: str) -> int:
+        """Check JSONL values line by line with bounded memory, return number of errors."""
+        try:
+            checker: CheckFun = jm_fun(args.name)
+        except Exception as e:
+            log.debug(e, exc_info=args.debug)
+            log.error(f"no such model \"{args.name}\": {e}")
+            print(f"{fn}: ERROR unexpected name {args.name}")
+            return 1
+        lines = jsonl_lines(fn, args.mmap)
+        if pool is not None:
+            chunks = check_chunks_parallel(pool, args.name, lines, args.report, loads=json.loads)
+        else:
+            chunks = check_chunks(checker, lines, args.report, loads=json.loads,
+                                  rchecker=rep_fun(args.name) if args.report and dual else None)
+        index = 0
+        for oks, reports in chunks:
+            for pos, ok in enumerate(oks):
+                index += 1
+                show(fn, f"[{index}]", None, ok == 1, reports.get(pos) if reports else None)
+        return 0
+
     errors = 0
 
     for fn in args.values:
 
         try:
+            # streaming, results are shown as they come
+            if args.jsonl and args.time <= 1 and not args.jsonschema_benchmark:
+                errors += stream_jsonl(fn)
+                continue
+
             # load json data
             if args.jsonl:
                 with open(fn) as f:
@@ -433,6 +826,13 @@ def main(jm_fun, jm_map, jmc_version):
             if args.jsonl:
                 values = [[None, j] for j in values]
 
+            # test vectors are checked in batch per model name, unless timing
+            batch = args.time <= 1 and (args.jsonl or args.test)
+            checkers: dict[str, CheckFun|None] = {}
+            groups: dict[str, list[Jsonable]] = {}
+            # messages or (info, expect, name, position in group), for ordered display
+            entries: list[str|tuple[str, bool|None, str, int]] = []
+
             index, item = 0, -1
             for tvect in values:
                 item += 1
@@ -442,7 +842,7 @@ def main(jm_fun, jm_map, jmc_version):
 
                 if not isinstance(tvect, list) or len(tvect) not in (2, 3):
                     log.error(f"unexpected test vector: {tvect}")
-                    print("{fn}[{item}]: ERROR bad test vector")
+                    entries.append(f"{fn}[{item}]: ERROR bad test vector")
                     errors += 1
                     continue
 
@@ -454,14 +854,32 @@ def main(jm_fun, jm_map, jmc_version):
 
                 info = f"[{index+1}]" if args.jsonl else f"[{index}]" if args.test else ""
 
-                try:
-                    checker: CheckFun = jm_fun(name)
-                except Exception as e:
-                    log.debug(e, exc_info=args.debug)
-                    log.error(f"no such model \"{name}\": {e}")
-                    print(f"{fn}{info}: ERROR unexpected name {name}")
+                if name not in checkers:
+                    try:
+                        checkers[name] = jm_fun(name)
+                    except Exception as e:
+                        log.debug(e, exc_info=args.debug)
+                        log.error(f"no such model \"{name}\": {e}")
+                        checkers[name] = None
+
+                checker = checkers[name]
+                if checker is None:
+                    entries.append(f"{fn}{info}: ERROR unexpected name {name}")
                     errors += 1
                     continue
+                rchecker = rep_fun(name) if args.report and dual else checker
+
+                if batch:
+                    group = groups.setdefault(name, [])
+                    entries.append((info, expect, name, len(group)))
+                    group.append(val)
+                    index += 1
+                    continue
+
+                # flush pending messages
+                for entry in entries:
+                    print(entry)
+                entries.clear()
 
                 valid: bool
                 empty, sum1, sum2 = 0.0, 0.0, 0.0
@@ -480,8 +898,8 @@ def main(jm_fun, jm_map, jmc_version):
                     if args.report:
                         for _ in range(args.time):
                             start = time.clock_gettime(0)
-                            reasons, path = [], []
-                            valid = checker(val, path, reasons)
+                            reasons, path = [], ()
+                            valid = rchecker(val, path, reasons)
                             del reasons
                             del path
                             end = time.clock_gettime(0)
@@ -508,30 +926,56 @@ def main(jm_fun, jm_map, jmc_version):
 
                 # collect results for actual display
                 if args.report:
-                    reasons, path = [], []
-                    valid = checker(val, path, reasons)
+                    reasons, path = [], ()
+                    valid = rchecker(val, path, reasons)
                 else:
                     reasons, path = None, None
                     valid = checker(val, None, None)
 
-                result = "PASS" if valid else "FAIL"
-
-                if expect is not None and valid != expect:
-                    print(f"{fn}{info}: ERROR unexpected {result}")
-                    errors += 1
-                elif valid:
-                    print(f"{fn}{info}: PASS")
-                elif reasons:
-                    msg = "; ".join(f"{_path(p)}: {m}" for m, p in reversed(reasons))
-                    print(f"{fn}{info}: FAIL ({msg})")
-                else:
-                    print(f"{fn}{info}: FAIL")
+                errors += show(fn, info, expect, valid, reasons)
 
                 index += 1
 
+            # check batches in tight loops
+            results: dict[str, tuple[bytearray, Reports|None]] = {}
+            for name, group in groups.items():
+                reports: Reports|None = {} if args.report else None
+                if pool is not None:
+                    oks = check_many_parallel(pool, name, group, reports)
+                else:
+                    oks = check_many(checkers[name], group, reports,  # type: ignore
+                                     rep_fun(name) if args.report and dual else None)
+                results[name] = (oks, reports)
+
+            # ordered display of batch results and pending messages
+            for entry in entries:
+                if isinstance(entry, str):
+                    print(entry)
+                    continue
+                info, expect, name, pos = entry
+                oks, reports = results[name]
+                errors += show(fn, info, expect, oks[pos] == 1,
+                               reports.get(pos) if reports else None)
+
         except Exception as e:
             log.debug(e, exc_info=args.debug)
             print(f"{fn}: ERROR ({e})")
             errors += 1
 
+    if pool is not None:
+        pool.shutdown()
+
+    for name, stats in predef_cache_info().items():
+        if stats["hits"] or stats["misses"]:
+            log.debug(f"predef cache {name}: {stats['hits']} hits, {stats['misses']} misses, "
+                      f"rate {stats['rate']:.3f}")
+
+    if args.profile:
+        if not _profiles:
+            log.warning("no profiling data, generate the checker with profiling")
+        elif args.profile == "json":
+            print(json.dumps(profile_data(), indent=2), file=sys.stderr)
+        else:
+            print(profile_table(), file=sys.stderr)
+
     sys.exit(1 if errors else 0)
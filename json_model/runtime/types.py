@@ -2,15 +2,23 @@
 # type declarations for python jm runtime
 #
 from typing import Callable
+from collections.abc import Iterable
 
 type JsonScalar = None|bool|int|float|str
 type Jsonable = JsonScalar|list[Jsonable]|dict[str, Jsonable]
 
-type Path = list[int|str]|None
+# persistent linked path: root is (), extended in O(1) as (parent, segment)
+type PathNode = tuple[()]|tuple[PathNode, int|str]
+type Path = PathNode|None
 type Report = list[tuple[str, Path]]|None
+# reports of failed values by index, for batch validation
+type Reports = dict[int, list[tuple[str, Path]]]
+type JsonValues = Iterable[Jsonable]
 
 type CheckFun = Callable[[Jsonable, Path, Report], bool]
 type RegexFun = Callable[[str, Path, Report], bool]
 type PropMap = dict[str, CheckFun]
+# incremental checks on raw JSON: leaf check, any, array item plan or object plan
+type StreamPlan = CheckFun|bool|list[StreamPlan]|tuple[dict[str, StreamPlan], set[str], StreamPlan|None]
 
 type EntryCheckFun = Callable[[Jsonable, str, Report], bool]
@@ -1,30 +1,48 @@
+import copy
+import functools
+import hashlib
 import json
 import logging
+import marshal
+import multiprocessing
 import os
 import re
+import shutil
 import subprocess
 import sys
+import sysconfig
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from importlib.metadata import version as pkg_version
 from importlib.resources import files
 from pathlib import Path
+from types import CodeType
+from typing import Any
 
 import yaml
 
 from . import analyze, objmerge, optim
+from .code_cache import ArtifactCache, CodeCache, DefinitionCache
 from .export import model2python
 from .model import JsonModel
 from .mtypes import Jsonable, JsonSchema, ModelError
 from .resolver import Resolver
 from .runtime.support import _path as json_path
-from .runtime.types import EntryCheckFun, Report
-from .utils import json_loads, load_data_file, log, tname
+from .runtime.support import _worker_init, check_many_parallel
+from .runtime.support import check_chunks, check_chunks_parallel, jsonl_lines
+from .runtime.support import profile_table
+from .runtime.types import EntryCheckFun, Report, Reports
+from .utils import json_loads, load_data_file, log, tname, __version__
+from .utils import phase, timings_start, timings_stop
 from .xstatic import xstatic_compile
 
 # language short name to display name
 LANG = {
     "py": "Python",
     "c": "C",
+    "pyext": "CPython extension",
     "js": "JavaScript",
     "plpgsql": "PL/pgSQL",
     "pl": "Perl",
@@ -50,37 +68,49 @@ def process_model(
     all_models = list(sorted(model._models.values(), key=lambda m: m._id))
 
     if debug or check:
-        for m in all_models:
-            if not analyze.valid(m):
-                raise ModelError(f"invalid initial model {m._id}")
+        with phase("check"):
+            for m in all_models:
+                if not analyze.valid(m):
+                    raise ModelError(f"invalid initial model {m._id}")
+
+    # rules fired and nodes visited by the optimizer
+    fired, visited = 0, 0
 
     # simplify before merging
     if optimize:
-        for m in all_models:
-            optim.optimize(m)
+        with phase("optimize"):
+            for m in all_models:
+                f, v = optim.optimize(m)
+                fired, visited = fired + f, visited + v
 
     # check after initial optimize
     if debug or check:
         # log.debug(json.dumps(model.toJSON(), sort_keys=True, indent=2))
-        for m in all_models:
-            if not analyze.valid(m):
-                raise ModelError(f"invalid optimized model {m._id}")
+        with phase("check"):
+            for m in all_models:
+                if not analyze.valid(m):
+                    raise ModelError(f"invalid optimized model {m._id}")
 
     # merge in reverse order to move alts up before inlining?!
     if merge:
-        for m in reversed(all_models):
-            objmerge.merge(m)
+        with phase("merge"):
+            for m in reversed(all_models):
+                objmerge.merge(m)
 
     # optimize again?
     if optimize:
-        for m in all_models:
-            optim.optimize(m)
+        with phase("optimize"):
+            for m in all_models:
+                f, v = optim.optimize(m)
+                fired, visited = fired + f, visited + v
+        log.info(f"optimize: {fired} rules fired, {visited} nodes visited")
 
     # check after merge & optimize
     if debug or check:
-        for m in all_models:
-            if not analyze.valid(m):
-                raise ModelError(f"invalid merged model {m._id}")
+        with phase("check"):
+            for m in all_models:
+                if not analyze.valid(m):
+                    raise ModelError(f"invalid merged model {m._id}")
 
 
 def model_from_json(
@@ -121,9 +151,10 @@ def model_from_json(
                 log.info(f"auto adding url map: {upref} -> {fpref}")
                 resolver._maps[upref] = fpref
 
-    jm = JsonModel(
-        mjson, resolver, url=murl, debug=debug, loose_int=loose_int, loose_float=loose_float
-    )
+    with phase("model"):
+        jm = JsonModel(
+            mjson, resolver, url=murl, debug=debug, loose_int=loose_int, loose_float=loose_float
+        )
 
     if check or merge or optimize:
         process_model(jm, check=check, merge=merge, optimize=optimize, debug=debug)
@@ -193,19 +224,48 @@ def model_from_str(
     )
 
 
+def _checker_code(jm: JsonModel, *, debug: bool = False) -> CodeType:
+    """Generate and compile Python checker code."""
+    source = str(xstatic_compile(jm, lang="py", debug=debug))
+    return compile(source, f"<json-model {jm._url}>", "exec")
+
+
 # it is unclear if this tricks actually works
-def _model_checker(jm: JsonModel, *, debug: bool = False):
-    code = xstatic_compile(jm, lang="py", debug=debug)
+def _model_checker(code: CodeType):
     env = {}
-    exec(str(code), env)
+    exec(code, env)
     env["check_model_init"]()
     yield env["check_model"]
     env["check_model_free"]()
 
 
-def model_checker(jm: JsonModel, *, debug: bool = False) -> EntryCheckFun:
+def _cached_checker(jm: JsonModel, cache: CodeCache, *, debug: bool = False) -> EntryCheckFun:
+    """Return a checker from cache, or preprocess and compile the model if needed.
+
+    The model must not have been preprocessed yet, so that a cache hit skips it.
+    """
+    key = cache.key(jm, lang="py", debug=debug)
+    code = cache.load(key)
+    if code is None:
+        process_model(jm, debug=debug)
+        code = _checker_code(jm, debug=debug)
+        cache.store(key, code)
+    return next(_model_checker(code))
+
+
+def model_checker(
+    jm: JsonModel, *, debug: bool = False, cache: CodeCache | None = None
+) -> EntryCheckFun:
     """Return an executable model checker from a JsonModel."""
-    return next(_model_checker(jm, debug=debug))
+    if cache is not None:
+        key = cache.key(jm, lang="py", debug=debug)
+        code = cache.load(key)
+        if code is None:
+            code = _checker_code(jm, debug=debug)
+            cache.store(key, code)
+    else:
+        code = _checker_code(jm, debug=debug)
+    return next(_model_checker(code))
 
 
 def model_checker_from_json(
@@ -216,8 +276,11 @@ def model_checker_from_json(
     resolver: Resolver | None = None,
     loose_int: bool | None = None,
     loose_float: bool | None = None,
+    cache: CodeCache | None = None,
 ) -> EntryCheckFun:
     """Return an executable model checker from a URL."""
+    # with a cache, preprocessing is delayed until a miss
+    process = cache is None
     jm = model_from_json(
         mjson,
         auto=auto,
@@ -225,7 +288,12 @@ def model_checker_from_json(
         resolver=resolver,
         loose_int=loose_int,
         loose_float=loose_float,
+        check=process,
+        merge=process,
+        optimize=process,
     )
+    if cache is not None:
+        return _cached_checker(jm, cache, debug=debug > 0)
     return model_checker(jm, debug=debug > 0)
 
 
@@ -238,8 +306,11 @@ def model_checker_from_url(
     follow: bool = True,
     loose_int: bool | None = None,
     loose_float: bool | None = None,
+    cache: CodeCache | None = None,
 ) -> EntryCheckFun:
     """Return an executable model checker from a URL."""
+    # with a cache, preprocessing is delayed until a miss
+    process = cache is None
     jm = model_from_url(
         murl,
         auto=auto,
@@ -248,10 +319,129 @@ def model_checker_from_url(
         follow=follow,
         loose_int=loose_int,
         loose_float=loose_float,
+        check=process,
+        merge=process,
+        optimize=process,
     )
+    if cache is not None:
+        return _cached_checker(jm, cache, debug=debug > 0)
     return model_checker(jm, debug=debug > 0)
 
 
+class CheckerRegistry:
+    """In-process LRU registry of dynamically built checkers.
+
+    Checkers are keyed by a hash of the canonical model JSON and options, so that
+    the same model submitted again reuses the already built checker.
+    Referenced external models are assumed not to change while registered.
+    Least recently used checkers are evicted beyond a count or approximate memory
+    limit, where memory is estimated from the size of the compiled code.
+    """
+
+    def __init__(self, max_count: int = 128, max_memory: int = 0):
+        assert max_count >= 0 and max_memory >= 0
+        self._max_count = max_count  # 0 for unbounded
+        self._max_memory = max_memory  # 0 for unbounded
+        self._lock = threading.Lock()
+        # key -> (checker, estimated size)
+        self._checkers: OrderedDict[str, tuple[EntryCheckFun, int]] = OrderedDict()
+        self._memory = 0
+        # statistics
+        self._hits, self._misses, self._evictions = 0, 0, 0
+
+    @staticmethod
+    def key(mjson: Jsonable, **options) -> str:
+        """Hash canonical model JSON with options."""
+        data = {"version": __version__, "options": options, "model": mjson}
+        sdata = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha3_256(sdata.encode("UTF-8")).hexdigest()
+
+    def _evict(self):
+        """Remove least recently used entries beyond limits, lock must be held."""
+        while self._checkers and (
+            (self._max_count and len(self._checkers) > self._max_count) or
+            (self._max_memory and self._memory > self._max_memory)
+        ):
+            _, (_, size) = self._checkers.popitem(last=False)
+            self._memory -= size
+            self._evictions += 1
+
+    def from_json(
+        self,
+        mjson: Jsonable,
+        *,
+        murl: str = "",
+        auto: bool = False,
+        debug: int = 0,
+        resolver: Resolver | None = None,
+        loose_int: bool | None = None,
+        loose_float: bool | None = None,
+    ) -> EntryCheckFun:
+        """Return a registered checker for a JSON model, building it if needed."""
+        key = self.key(mjson, murl=murl, auto=auto, debug=debug,
+                       loose_int=loose_int, loose_float=loose_float)
+
+        with self._lock:
+            if key in self._checkers:
+                self._checkers.move_to_end(key)
+                self._hits += 1
+                return self._checkers[key][0]
+            self._misses += 1
+
+        # build outside of the lock, concurrent misses on the same model may happen
+        jm = model_from_json(mjson, murl=murl, auto=auto, debug=debug, resolver=resolver,
+                             loose_int=loose_int, loose_float=loose_float)
+        code = _checker_code(jm, debug=debug > 0)
+        checker = next(_model_checker(code))
+        size = len(marshal.dumps(code))
+
+        with self._lock:
+            if key not in self._checkers:
+                self._checkers[key] = (checker, size)
+                self._memory += size
+                self._evict()
+
+        return checker
+
+    def from_url(
+        self,
+        murl: str,
+        *,
+        auto: bool = False,
+        debug: int = 0,
+        resolver: Resolver | None = None,
+        follow: bool = True,
+        loose_int: bool | None = None,
+        loose_float: bool | None = None,
+    ) -> EntryCheckFun:
+        """Return a registered checker for a model URL, building it if needed."""
+        if resolver is None:
+            resolver = Resolver()
+        mjson = resolver(murl, follow=follow)
+        return self.from_json(mjson, murl=murl, auto=auto, debug=debug, resolver=resolver,
+                              loose_int=loose_int, loose_float=loose_float)
+
+    def clear(self):
+        """Remove all registered checkers, statistics are kept."""
+        with self._lock:
+            self._checkers.clear()
+            self._memory = 0
+
+    def __len__(self) -> int:
+        return len(self._checkers)
+
+    def stats(self) -> dict[str, int]:
+        """Registry statistics."""
+        with self._lock:
+            return {
+                "count": len(self._checkers),
+                "memory": self._memory,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
 def create_model(
     murl: str,
     resolver: Resolver,
@@ -288,10 +478,13 @@ DEFAULT_CFLAGS = (
 DEFAULT_LDFLAGS_PCRE2 = "-ljansson -lpcre2-8 -lm"
 # pkgconf --libs cre2
 DEFAULT_LDFLAGS_CRE2 = "-L/usr/local/lib -ljansson -lcre2 -lpthread -lre2 -lm -lstdc++"
+# CPython extensions do not need jansson
+DEFAULT_LDFLAGS_PYEXT_PCRE2 = "-lpcre2-8 -lm"
+DEFAULT_LDFLAGS_PYEXT_CRE2 = "-L/usr/local/lib -lcre2 -lpthread -lre2 -lm -lstdc++"
 
 
 def clang_compile(c_code: str, args):
-    """Generate an actual executable or object file."""
+    """Generate an actual executable, object file or CPython extension module."""
 
     tmp_dir = os.environ.get("TMPDIR", "/dev/shm")
 
@@ -309,24 +502,41 @@ def clang_compile(c_code: str, args):
         args.cppflags
         or f"-I{rt_dir}/c -I/usr/local/linclude -DCHECK_FUNCTION_NAME=check_model {d_engine}"
     )
+    pyext = args.format == "pyext"
+    if args.output == "-":
+        output = args.entry + sysconfig.get_config_var("EXT_SUFFIX") if pyext else "a.out"
+    else:
+        output = args.output
+    if pyext:
+        # the module is named after the output file
+        module = Path(output).name.split(".")[0]
+        cppflags += (
+            f" -I{sysconfig.get_path('include')}"
+            f" -DJSON_MODEL_PYEXT -DJSON_MODEL_PYEXT_MODULE={module}"
+        )
     if args.define:
         cppflags = " ".join(f"-D{d}" for d in args.define) + " " + cppflags
     if args.include:
         cppflags = " ".join(f"-I{i}" for i in args.include) + " " + cppflags
-    ldflags = args.ldflags or (
-        DEFAULT_LDFLAGS_PCRE2 if args.regex_engine == "pcre2" else DEFAULT_LDFLAGS_CRE2
-    )
+    if pyext:
+        ldflags = args.ldflags or (
+            DEFAULT_LDFLAGS_PYEXT_PCRE2 if args.regex_engine == "pcre2" else DEFAULT_LDFLAGS_PYEXT_CRE2
+        )
+    else:
+        ldflags = args.ldflags or (
+            DEFAULT_LDFLAGS_PCRE2 if args.regex_engine == "pcre2" else DEFAULT_LDFLAGS_CRE2
+        )
     if args.library:
         ldflags = " -L".join([""] + args.library) + " " + ldflags
     if args.static:
         ldflags += " --static"
 
-    output = "a.out" if args.output == "-" else args.output
-
     with tempfile.NamedTemporaryFile(dir=tmp_dir, suffix=".c") as tmp:
         tmp.write(c_code.encode("UTF-8"))
         tmp.flush()
-        if args.gen == "exec":
+        if pyext:
+            command = f"{cc} {cppflags} {cflags} -shared -fPIC -o {output} {lib} {tmp.name} {ldflags}"
+        elif args.gen == "exec":
             command = f"{cc} {cppflags} {cflags} -o {output} {lib} {tmp.name} {main} {ldflags}"
         else:
             command = f"{cc} {cppflags} {cflags} -o {output} -c {tmp.name}"
@@ -387,6 +597,240 @@ def go_compile(go_code: str, args):
     assert status == 0, f"Go compilation succeeded: {command}"
 
 
+# jmc options which do not change its outputs, for the artifact cache
+ARTIFACT_IGNORE = (
+    "output", "values", "timings", "verbose", "quiet", "jobs", "doc", "version",
+    "cache_dir", "cache_ignore", "cache_clear", "artifact_cache", "artifact_cache_size",
+    "cache_stats",
+)
+
+
+def _artifact_inputs(args) -> dict[str, Any]:
+    """Inputs which may change jmc outputs, but for models."""
+    inputs = {k: v for k, v in vars(args).items() if k not in ARTIFACT_IGNORE}
+    # the output file name may name modules or classes
+    inputs["output"] = Path(args.output).name
+    inputs["env"] = {var: os.environ.get(var) for var in ("CC", "CFLAGS")}
+    # native compiler identity, as ccache default compiler check
+    if args.op == "C" and args.gen in ("exec", "module"):
+        cc = args.cc or os.environ.get("CC", DEFAULT_CC)
+        compiler = {"c": cc, "pyext": cc, "java": args.javac or "javac", "go": args.go or "go"}
+        if args.format in compiler and (path := shutil.which(compiler[args.format].split()[0])):
+            st = os.stat(path)
+            inputs["compiler"] = [path, st.st_size, st.st_mtime_ns]
+    return inputs
+
+
+def _artifact_files(args) -> list[Path]:
+    """Output files of a jmc run."""
+    output = Path(args.output)
+    files = [output]
+    if args.op == "C" and args.format == "java" and args.gen in ("exec", "module"):
+        # javac generates one file per class, including nested ones
+        files += sorted(output.parent.glob(f"{output.stem}.class"))
+        files += sorted(output.parent.glob(f"{output.stem}$*.class"))
+    return [f for f in dict.fromkeys(files) if f.is_file()]
+
+
+def _artifact_restore(args, afiles: dict[str, tuple[int, bytes]]):
+    """Write cached output files next to the output."""
+    out_dir = Path(args.output).parent
+    for name, (mode, data) in afiles.items():
+        # write to a temporary file and rename, for concurrent processes
+        fd, tmp = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, mode)
+        os.replace(tmp, out_dir / name)
+
+
+def _guess_output(args):
+    """Guess format, operation and generation from the output file suffix."""
+    if args.output != "-":
+        if args.output.endswith(".c"):
+            args.format = args.format or "c"
+            args.op = args.op or "C"
+            args.gen = args.gen or "source"
+        elif args.output.endswith(".o"):
+            args.format = args.format or "c"
+            args.op = args.op or "C"
+            args.gen = args.gen or "module"
+        elif args.output.endswith(".out"):
+            args.format = args.format or "c"
+            args.op = args.op or "C"
+            args.gen = args.gen or "exec"
+        elif args.output.endswith(".so"):
+            args.format = args.format or "pyext"
+            args.op = args.op or "C"
+            args.gen = args.gen or "module"
+        elif args.output.endswith(".py"):
+            args.format = args.format or "py"
+            args.op = args.op or "C"
+            args.gen = args.gen or "exec"
+        elif args.output.endswith(".mpy"):
+            args.format = args.format or "py"
+            args.op = args.op or "C"
+            args.gen = args.gen or "module"
+        elif args.output.endswith(".js"):
+            args.format = args.format or "js"
+            args.op = args.op or "C"
+            args.gen = args.gen or "exec"
+        elif args.output.endswith(".mjs"):
+            args.format = args.format or "js"
+            args.op = args.op or "C"
+            args.gen = args.gen or "module"
+        elif args.output.endswith(".sql"):
+            args.format = args.format or "plpgsql"
+            args.op = args.op or "C"
+            args.gen = args.gen or "module"
+        elif args.output.endswith(".pl"):
+            args.format = args.format or "pl"
+            args.op = args.op or "C"
+            args.gen = args.gen or "exec"
+        elif args.output.endswith(".pm"):
+            args.format = args.format or "pl"
+            args.op = args.op or "C"
+            args.gen = args.gen or "module"
+            args.package = args.package or Path(args.output).stem
+        elif args.output.endswith(".java"):
+            args.format = args.format or "java"
+            args.op = args.op or "C"
+            args.gen = args.gen or "source"
+            args.entry = args.entry or Path(args.output).stem.replace("-", "_")
+        elif args.output.endswith(".class"):
+            args.format = args.format or "java"
+            args.op = args.op or "C"
+            args.gen = args.gen or "exec"
+            stem = Path(args.output).stem
+            if "-" in stem:
+                log.error(f"java class files cannot contain '-': {args.output}")
+                sys.exit(1)
+            args.entry = args.entry or Path(args.output).stem.replace("-", "_")
+        elif args.output.endswith(".go"):
+            args.format = args.format or "go"
+            args.op = args.op or "C"
+            args.gen = args.gen or "source"
+        elif args.output.endswith(".schema.json"):
+            args.format = args.format or "json"
+            args.op = args.op or "E"
+        elif args.output.endswith(".model.json"):
+            args.format = args.format or "json"
+            args.op = args.op or "P"
+        elif args.output.endswith(".ir.json"):
+            args.format = args.format or "json"
+            args.op = args.op or "C"
+        elif args.output.endswith(".json"):
+            args.format = args.format or "json"
+            args.op = args.op or "U"
+
+
+def _generate(model: JsonModel, args, pgo: dict | None, output) -> str:
+    """Generate code for one output language, compile it natively if needed."""
+    with_main = args.gen == "exec" or args.gen == "source" and args.format in ("java", "go")
+
+    # FIXME PL/pgSQL?
+    if args.format in ("plpgsql", "js", "pl") and (
+        not model._loose_int or not model._loose_float
+    ):
+        log.warning(
+            f"{args.model}: {LANG[args.format]} backend does not support strict numbers"
+        )
+
+    # compile to source
+    code = xstatic_compile(
+        model,
+        args.entry,
+        lang=args.format,
+        execute=with_main,
+        map_threshold=args.map_threshold,
+        map_share=args.map_share,
+        obj_share=args.obj_share,
+        debug=args.debug,
+        report=args.reporting,
+        relib=args.regex_engine,
+        short_version=args.short_version,
+        package=args.package,
+        predef=args.predef,
+        inline=args.inline,
+        ir_optimize=args.ir_optimize,
+        strcmp=args.strcmp_opt,
+        byte_order=args.byte_order,
+        may_must_open_threshold=args.may_must_open_threshold,
+        must_only_threshold=args.must_only_threshold,
+        partition_threshold=args.partition_threshold,
+        or_must_prop=args.or_must_prop,
+        sort_must=args.sort_must,
+        sort_may=args.sort_may,
+        max_strcmp_cset=args.max_strcmp_cset,
+        regex_cache=args.regex_cache,
+        dual=args.dual,
+        stream=args.stream,
+        lazy=args.lazy,
+        profile=args.profile,
+        pgo=pgo,
+        def_cache=DefinitionCache() if args.incremental else None,
+    )
+    with phase("render"):
+        source = str(code)
+
+    # source to executable for C, Java and Go
+    if args.format in ("c", "pyext") and args.gen in ("exec", "module"):
+        with phase("cc"):
+            clang_compile(source, args)
+    elif args.format == "java" and args.gen in ("exec", "module"):
+        with phase("javac"):
+            java_compile(source, args)
+    elif args.format == "go" and args.gen in ("exec", "module"):
+        with phase("go"):
+            go_compile(source, args)
+    elif args.gen != "none":
+        print(source, file=output, end="", flush=True)
+        if args.output != "-" and args.gen == "exec":
+            # executable script file: rwxr-xr-w
+            os.chmod(args.output, 0o755)
+
+    return source
+
+
+# model shared with forked target workers
+_TARGETS_MODEL: JsonModel | None = None
+
+
+def _generate_target(args, pgo: dict | None):
+    """Generate one target from the shared model, possibly in a forked worker."""
+    assert _TARGETS_MODEL is not None
+    if args.format in ("c", "pyext", "java", "go") and args.gen in ("exec", "module"):
+        _generate(_TARGETS_MODEL, args, pgo, None)
+    else:
+        with open(args.output, "w") as output:
+            _generate(_TARGETS_MODEL, args, pgo, output)
+
+
+def _generate_targets(model: JsonModel, targets: list, pgo: dict | None):
+    """Generate several targets from one preprocessed model, in parallel if possible."""
+    global _TARGETS_MODEL
+    _TARGETS_MODEL = model
+    try:
+        # forked workers inherit the model instead of pickling it
+        workers = min(len(targets), os.cpu_count() or 1)
+        if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork")) as pool:
+                for future in [pool.submit(_generate_target, targs, pgo) for targs in targets]:
+                    future.result()
+        else:
+            for targs in targets:
+                _generate_target(targs, pgo)
+    finally:
+        _TARGETS_MODEL = None
+
+
+def _jobs_init(source: str, entry: str, dual: bool = False):
+    """Initialize a jmc worker process with generated Python code."""
+    env = {}
+    exec(source, env)
+    _worker_init(env[entry + "_init"], env[entry + "_fun"], dual=dual)
+
+
 def jmc_script():
     import argparse
 
@@ -468,6 +912,14 @@ def jmc_script():
 
     # (code) output options
     arg("--output", "-o", default="-", help="output file")
+    arg(
+        "--target",
+        "-T",
+        action="append",
+        default=[],
+        metavar="[FORMAT:]FILE",
+        help="generate code to several files from one model, in parallel",
+    )
     arg("--package", "-p", default=None, help="generated module name, if appropriate")
     arg("--entry", "-e", help="name prefix of generated functions")
     arg(
@@ -492,6 +944,50 @@ def jmc_script():
         action="store_false",
         help="remove reporting capabilities",
     )
+    arg(
+        "--dual",
+        action="store_true",
+        default=False,
+        help="generate both fast and reporting check functions (py)",
+    )
+    arg(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="generate incremental checks on raw JSON, used for checking values (py)",
+    )
+    arg(
+        "--lazy",
+        action="store_true",
+        default=False,
+        help="compile regexes on first use and initialize on import (py)",
+    )
+    arg(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="instrument check functions with calls, results and time (py, c, js)",
+    )
+    arg(
+        "--timings",
+        choices=["text", "json"],
+        nargs="?",
+        const="text",
+        default=None,
+        help="show wall time, calls and peak memory per compilation phase on stderr",
+    )
+    arg(
+        "--pgo",
+        type=str,
+        default=None,
+        help="order checks and hints from JSON profiling data of an instrumented checker",
+    )
+    arg(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="reuse code generated for unchanged definitions across runs",
+    )
     arg(
         "--short-version",
         action="store_true",
@@ -539,7 +1035,7 @@ def jmc_script():
     arg(
         "--format",
         "-F",
-        choices=["json", "yaml", "py", "c", "js", "plpgsql", "pl", "java", "go"],
+        choices=["json", "yaml", "py", "c", "pyext", "js", "plpgsql", "pl", "java", "go"],
         default=None,
         help="output language",
     )
@@ -599,6 +1095,18 @@ def jmc_script():
         default=False,
         help="accept value file in JSONL format",
     )
+    arg(
+        "--mmap",
+        action="store_true",
+        default=False,
+        help="read JSONL value files through a memory map",
+    )
+    arg(
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes for test vector and JSONL files",
+    )
     arg("--report", "-r", action="store_true", default=False, help="report reasons on fail")
     arg(
         "--no-report",
@@ -630,6 +1138,15 @@ def jmc_script():
         action="store_false",
         help="no property map sharing",
     )
+    arg("--obj-share", "-os", default=False, action="store_true",
+        help="share check functions of identical objects")
+    arg(
+        "--no-obj-share",
+        "-nos",
+        dest="obj_share",
+        action="store_false",
+        help="no object check function sharing",
+    )
     arg(
         "--may-must-open-threshold",
         "-mmot",
@@ -686,6 +1203,12 @@ def jmc_script():
         help="do not optimize string comparisons",
     )
     arg("--byte-order", choices=["le", "be", "dpd"], default="le", help="set endian-ness")
+    arg(
+        "--regex-cache",
+        default=0,
+        type=int,
+        help="memoize this many string results per regex (py and js, default 0 for none)",
+    )
 
     # IR optimizations (if simplification, call skipping?)
     arg(
@@ -741,6 +1264,21 @@ def jmc_script():
     arg("--cache-ignore", default=False, action="store_true", help="ignore cache contents")
     arg("--cache-clear", default=False, action="store_true", help="cleanup cache contents and exit")
 
+    # output cache management
+    arg(
+        "--artifact-cache",
+        default=False,
+        action="store_true",
+        help="reuse outputs of previous runs with the same models and options",
+    )
+    arg(
+        "--artifact-cache-size",
+        type=int,
+        default=1024,
+        help="artifact cache size limit in MiB, 0 for unbounded",
+    )
+    arg("--cache-stats", default=False, action="store_true", help="show artifact cache statistics and exit")
+
     # parameters
     arg("model", default="-", nargs="?", help='JSON model source (file or url or "-" for stdin)')
     arg("values", nargs="*", help="JSON values to testing")
@@ -763,78 +1301,30 @@ def jmc_script():
         sys.exit(0)
 
     # format/operation/gen guessing
-    if args.output != "-":
-        if args.output.endswith(".c"):
-            args.format = args.format or "c"
-            args.op = args.op or "C"
-            args.gen = args.gen or "source"
-        elif args.output.endswith(".o"):
-            args.format = args.format or "c"
-            args.op = args.op or "C"
-            args.gen = args.gen or "module"
-        elif args.output.endswith(".out"):
-            args.format = args.format or "c"
-            args.op = args.op or "C"
-            args.gen = args.gen or "exec"
-        elif args.output.endswith(".py"):
-            args.format = args.format or "py"
-            args.op = args.op or "C"
-            args.gen = args.gen or "exec"
-        elif args.output.endswith(".mpy"):
-            args.format = args.format or "py"
-            args.op = args.op or "C"
-            args.gen = args.gen or "module"
-        elif args.output.endswith(".js"):
-            args.format = args.format or "js"
-            args.op = args.op or "C"
-            args.gen = args.gen or "exec"
-        elif args.output.endswith(".mjs"):
-            args.format = args.format or "js"
-            args.op = args.op or "C"
-            args.gen = args.gen or "module"
-        elif args.output.endswith(".sql"):
-            args.format = args.format or "plpgsql"
-            args.op = args.op or "C"
-            args.gen = args.gen or "module"
-        elif args.output.endswith(".pl"):
-            args.format = args.format or "pl"
-            args.op = args.op or "C"
-            args.gen = args.gen or "exec"
-        elif args.output.endswith(".pm"):
-            args.format = args.format or "pl"
-            args.op = args.op or "C"
-            args.gen = args.gen or "module"
-            args.package = args.package or Path(args.output).stem
-        elif args.output.endswith(".java"):
-            args.format = args.format or "java"
-            args.op = args.op or "C"
-            args.gen = args.gen or "source"
-            args.entry = args.entry or Path(args.output).stem.replace("-", "_")
-        elif args.output.endswith(".class"):
-            args.format = args.format or "java"
-            args.op = args.op or "C"
-            args.gen = args.gen or "exec"
-            stem = Path(args.output).stem
-            if "-" in stem:
-                log.error(f"java class files cannot contain '-': {args.output}")
-                sys.exit(1)
-            args.entry = args.entry or Path(args.output).stem.replace("-", "_")
-        elif args.output.endswith(".go"):
-            args.format = args.format or "go"
-            args.op = args.op or "C"
-            args.gen = args.gen or "source"
-        elif args.output.endswith(".schema.json"):
-            args.format = args.format or "json"
-            args.op = args.op or "E"
-        elif args.output.endswith(".model.json"):
-            args.format = args.format or "json"
-            args.op = args.op or "P"
-        elif args.output.endswith(".ir.json"):
-            args.format = args.format or "json"
-            args.op = args.op or "C"
-        elif args.output.endswith(".json"):
-            args.format = args.format or "json"
-            args.op = args.op or "U"
+    _guess_output(args)
+
+    # several code generation targets from one model
+    targets: list = []
+    for target in args.target:
+        targs = copy.copy(args)
+        if (m := re.match(r"(\w+):(.+)$", target)) and m.group(1) in LANG:
+            targs.format, targs.output = m.group(1), m.group(2)
+        else:
+            targs.output = target
+        _guess_output(targs)
+        if targs.format not in LANG or targs.op not in (None, "C"):
+            log.error(f"unexpected target, code generation language is needed: {target}")
+            sys.exit(1)
+        targs.op, targs.gen = "C", targs.gen or "source"
+        targs.entry = targs.entry or "check_model"
+        if targs.reporting is None:
+            targs.reporting = False if targs.format == "plpgsql" else True
+        targets.append(targs)
+    if targets:
+        if args.output != "-" or args.values or args.op not in (None, "C"):
+            log.error("--target requires code generation, without --output nor values")
+            sys.exit(1)
+        args.op, args.format, args.gen = "C", targets[0].format, "none"
 
     args.entry = args.entry or "check_model"
 
@@ -846,8 +1336,47 @@ def jmc_script():
     if args.reporting is None:
         args.reporting = False if args.format == "plpgsql" else True
 
+    if args.dual and (args.format != "py" or not args.reporting):
+        log.warning("ignoring --dual, which requires Python with reporting")
+        args.dual = False
+
+    if args.stream and (args.format != "py" or args.dual):
+        log.warning("ignoring --stream, which requires Python without --dual")
+        args.stream = False
+
+    if args.incremental and args.stream:
+        log.warning("ignoring --incremental, which is incompatible with --stream")
+        args.incremental = False
+
+    if args.artifact_cache and (args.output == "-" or args.model == "-" or args.values):
+        log.warning("ignoring --artifact-cache, which requires model and output files without values")
+        args.artifact_cache = False
+
+    if args.lazy and args.format != "py":
+        log.warning("ignoring --lazy, which requires Python")
+        args.lazy = False
+
+    if args.profile and args.format not in ("py", "c", "js"):
+        log.warning("ignoring --profile, which requires Python, C or JavaScript")
+        args.profile = False
+
+    if args.profile and args.jobs > 1:
+        log.warning("ignoring --jobs, profiling data are collected in this process")
+        args.jobs = 1
+
+    # profile-guided optimization data
+    pgo = None
+    if args.pgo:
+        try:
+            with open(args.pgo) as fh:
+                pgo = json.load(fh)
+            assert isinstance(pgo, dict), "profiling data must be a JSON object"
+        except Exception as e:
+            log.error(f"cannot load profiling data {args.pgo}: {e}")
+            sys.exit(1)
+
     if args.op is None:
-        args.op = "C" if args.format in ("c", "py", "js", "java", "plpgsql", "pl", "go") else "P"
+        args.op = "C" if args.format in ("c", "pyext", "py", "js", "java", "plpgsql", "pl", "go") else "P"
 
     # update op-dependent default
     if args.gen is None:
@@ -893,11 +1422,19 @@ def jmc_script():
         else:
             log.warning("keeping float strictness as already set")
 
-    with_main = args.gen == "exec" or args.gen == "source" and args.format in ("java", "go")
-
     # debug
     log.setLevel(logging.DEBUG if args.debug else logging.INFO if args.verbose else logging.WARNING)
 
+    if args.timings:
+        timings_start()
+
+    def show_timings():
+        if timings := timings_stop():
+            if args.timings == "json":
+                print(json.dumps(timings.toJSON(), indent=2), file=sys.stderr)
+            else:
+                print(timings, file=sys.stderr)
+
     # resolver
     maps: dict[str, str] = {}
     for m in args.maps:
@@ -911,6 +1448,22 @@ def jmc_script():
         resolver.clear()
         sys.exit(0)
 
+    # skip the whole pipeline if outputs are available
+    artifacts: ArtifactCache | None = None
+    if args.artifact_cache or args.cache_stats:
+        artifacts = ArtifactCache(max_size=args.artifact_cache_size * 1024 * 1024)
+    if artifacts is not None and args.cache_stats:
+        for name, value in artifacts.stats().items():
+            print(f"{name}: {value}")
+        sys.exit(0)
+    if artifacts is not None:
+        akey = artifacts.key(**_artifact_inputs(args))
+        if (afiles := artifacts.lookup(akey, resolver)) is not None:
+            log.info(f"reusing cached outputs: {akey}")
+            _artifact_restore(args, afiles)
+            show_timings()
+            sys.exit(0)
+
     log.info(f"processing {args.model}")
 
     # CREATE FROM FILE OR URL
@@ -943,7 +1496,8 @@ def jmc_script():
     # OUTPUT
     # TODO check overwrite?!
     output = open(args.output, "w") if args.output != "-" and args.format != "out" else sys.stdout
-    checker = None  # pyright: ignore
+    checker = checker_many = checker_fun = stream_checker = None  # pyright: ignore
+    pool: Executor | None = None
 
     # convert json to a string using prettyprint options
     def json2str(j: Jsonable) -> str:
@@ -973,57 +1527,13 @@ def jmc_script():
     elif args.op == "P":  # preprocessed model
         show = model.toModel(True)
         print(json2str(show), file=output)
+    elif args.op == "C" and targets:
+        with phase("targets"):
+            _generate_targets(model, targets, pgo)
     elif args.op == "C":
         assert args.format in LANG, f"valid output language {args.format}"
 
-        # FIXME PL/pgSQL?
-        if args.format in ("plpgsql", "js", "pl") and (
-            not model._loose_int or not model._loose_float
-        ):
-            log.warning(
-                f"{args.model}: {LANG[args.format]} backend does not support strict numbers"
-            )
-
-        # compile to source
-        code = xstatic_compile(
-            model,
-            args.entry,
-            lang=args.format,
-            execute=with_main,
-            map_threshold=args.map_threshold,
-            map_share=args.map_share,
-            debug=args.debug,
-            report=args.reporting,
-            relib=args.regex_engine,
-            short_version=args.short_version,
-            package=args.package,
-            predef=args.predef,
-            inline=args.inline,
-            ir_optimize=args.ir_optimize,
-            strcmp=args.strcmp_opt,
-            byte_order=args.byte_order,
-            may_must_open_threshold=args.may_must_open_threshold,
-            must_only_threshold=args.must_only_threshold,
-            partition_threshold=args.partition_threshold,
-            or_must_prop=args.or_must_prop,
-            sort_must=args.sort_must,
-            sort_may=args.sort_may,
-            max_strcmp_cset=args.max_strcmp_cset,
-        )
-        source = str(code)
-
-        # source to executable for C, Java and Go
-        if args.format == "c" and args.gen in ("exec", "module"):
-            clang_compile(source, args)
-        elif args.format == "java" and args.gen in ("exec", "module"):
-            java_compile(source, args)
-        elif args.format == "go" and args.gen in ("exec", "module"):
-            go_compile(source, args)
-        elif args.gen != "none":
-            print(source, file=output, end="", flush=True)
-            if args.output != "-" and args.gen == "exec":
-                # executable script file: rwxr-xr-w
-                os.chmod(args.output, 0o755)
+        source = _generate(model, args, pgo, output)
 
         # import for checks
         if args.format == "py" and args.values:
@@ -1034,6 +1544,24 @@ def jmc_script():
             def checker(v: Jsonable, model: str, rep: Report = None) -> bool:
                 return env[args.entry](v, model, rep)
 
+            def checker_many(vs: list[Jsonable], model: str, reps: Reports | None) -> bytearray:
+                return env[args.entry + "_many"](vs, model, reps)
+
+            checker_fun = env[args.entry + "_fun"]
+
+            if args.stream:
+                stream_checker = env[args.entry + "_stream"]
+
+            # parallel checks, workers compile the generated code once
+            if args.jobs > 1 and (args.test_vector or args.jsonl):
+                pool = ProcessPoolExecutor(
+                    args.jobs, initializer=_jobs_init, initargs=(source, args.entry, args.dual)
+                )
+
+                def checker_many(vs: list[Jsonable], model: str, reps: Reports | None) -> bytearray:
+                    checker_fun(model)  # raise on unexpected name
+                    return check_many_parallel(pool, model, vs, reps)
+
     elif args.op == "E":
         if args.format in ("json", "yaml"):
             if not model._loose_int or not model._loose_float:
@@ -1061,6 +1589,10 @@ def jmc_script():
         """Process a value and report to output depending on args, return if as expected."""
         reasons = [] if args.report else None
         okay = checker(value, model, reasons)
+        return _display(okay, reasons, fid, expect, output)
+
+    def _display(okay: bool, reasons: Report, fid: str, expect: bool | None, output) -> bool:
+        """Report a result to output depending on args, return if as expected."""
         sokay = "PASS" if okay else "FAIL"
         if expect is None or args.verbose or fid[-1] == "]":
             msg = f"{fid}: {sokay}"
@@ -1075,40 +1607,100 @@ def jmc_script():
                 return False
         return True
 
+    if artifacts is not None:
+        output.flush()
+        artifacts.save(
+            akey, resolver, {f.name: (f.stat().st_mode & 0o777, f.read_bytes()) for f in _artifact_files(args)}
+        )
+
+    show_timings()
+
     # values
     nerrors = 0
+    loads = functools.partial(json_loads, allow_duplicates=args.allow_duplicates)
     for fn in args.values:
         assert checker
         with open(fn) as fh:
             try:
-                contents = fh.read()
-                # parse JSON
                 if args.jsonl:
-                    lines = contents.split("\n")[:-1]
-                    value = [
-                        [None, json_loads(line, allow_duplicates=args.allow_duplicates)]
-                        for line in lines
-                    ]
-                else:
-                    value = json_loads(contents, allow_duplicates=args.allow_duplicates)
+                    # streaming with bounded memory, lines are parsed by chunks or by workers
+                    lines = jsonl_lines(fn, args.mmap)
+                    if pool is not None:
+                        chunks = check_chunks_parallel(
+                            pool, args.name, lines, args.report, loads=loads
+                        )
+                    else:
+                        chunks = check_chunks(
+                            checker_fun(args.name), lines, args.report, loads=loads,
+                            rchecker=checker_fun(args.name, True) if args.dual else None,
+                        )
+                    idx = 0
+                    for oks, reports in chunks:
+                        for pos, ok in enumerate(oks):
+                            reasons = reports.get(pos) if reports is not None else None
+                            if not _display(ok == 1, reasons, f"{fn}[{idx}]", None, output):
+                                nerrors += 1
+                            idx += 1
+                    continue
+                if stream_checker is not None and not args.test_vector:
+                    # incremental check of raw JSON, the value is not built
+                    with open(fn, "rb") as bh:
+                        if not _process(stream_checker, args.name, bh.read(), fn, args.expect, output):
+                            nerrors += 1
+                    continue
+                # parse JSON
+                value = json_loads(fh.read(), allow_duplicates=args.allow_duplicates)
                 # process values
-                if args.test_vector or args.jsonl:
+                if args.test_vector:
                     assert isinstance(value, list), "array test vector"
-                    for idx, test in enumerate(value):
-                        assert isinstance(test, list) and len(test) in (2, 3), "2 or 3 tuple test"
-
-                        if len(test) == 2:
-                            expect, val = test
-                            model = args.name
+                    # group values per model name for batch checking
+                    groups: dict[str, list[Jsonable]] = {}
+                    tests: list[tuple[bool | None, str, int]] = []
+                    error: Exception | None = None
+                    try:
+                        for idx, test in enumerate(value):
+                            assert isinstance(test, list) and len(test) in (2, 3), "2 or 3 tuple test"
+
+                            if len(test) == 2:
+                                expect, val = test
+                                model = args.name
+                            else:
+                                assert len(test) == 3
+                                expect, model, val = test
+                            assert expect is None or isinstance(expect, bool), "expect is null or bool"
+                            assert isinstance(model, str), "model name is a string"
+
+                            group = groups.setdefault(model, [])
+                            tests.append((expect, model, len(group)))
+                            group.append(val)
+                    except AssertionError as e:
+                        # still show the tests before the invalid one
+                        error = e
+
+                    results: dict[str, tuple[bytearray, Reports | None] | None] = {}
+                    for model, group in groups.items():
+                        reports: Reports | None = {} if args.report else None
+                        try:
+                            results[model] = (checker_many(group, model, reports), reports)
+                        except Exception as e:
+                            # eg unknown model, check this group one value at a time below
+                            log.debug(e, exc_info=args.verbose)
+                            results[model] = None
+
+                    for idx, (expect, model, pos) in enumerate(tests):
+                        result = results[model]
+                        if result is None:
+                            okay = _process(checker, model, groups[model][pos], f"{fn}[{idx}]", expect, output)
                         else:
-                            assert len(test) == 3
-                            expect, model, val = test
-                        assert expect is None or isinstance(expect, bool), "expect is null or bool"
-                        assert isinstance(model, str), "model name is a string"
-
-                        if not _process(checker, model, val, f"{fn}[{idx}]", expect, output):
+                            oks, reports = result
+                            reasons = reports.get(pos) if reports is not None else None
+                            okay = _display(oks[pos] == 1, reasons, f"{fn}[{idx}]", expect, output)
+                        if not okay:
                             nerrors += 1
 
+                    if error is not None:
+                        raise error
+
                 else:  # direct value testing
                     if not _process(checker, args.name, value, fn, args.expect, output):  # type: ignore
                         nerrors += 1
@@ -1117,4 +1709,10 @@ def jmc_script():
                 log.debug(e, exc_info=args.verbose)
                 print(f"{fn}: ERROR")
 
+    if pool is not None:
+        pool.shutdown()
+
+    if args.profile and args.format == "py" and args.values:
+        print(profile_table(), file=sys.stderr)
+
     sys.exit(4 if nerrors > 0 else 0)
@@ -4,6 +4,10 @@
 import sys
 import re
 import json
+import time
+import tracemalloc
+import contextlib
+from collections.abc import Callable, Iterator
 from importlib.metadata import version as pkg_version
 from importlib.resources import files as data_files
 import logging
@@ -16,6 +20,110 @@ __version__ = pkg_version("json_model_compiler")
 log = logging.getLogger("json-model")
 # log.setLevel(logging.DEBUG)
 
+#
+# per-phase compilation timings, see jmc --timings
+#
+type TimingsHook = Callable[[str, float, int | None], None]
+
+class Timings:
+    """Collect wall time, call counts and peak memory per compilation phase.
+
+    Phases may be nested, so times and peaks are inclusive.
+    The peak is the process maximum resident set size at the end of the phase,
+    or with trace the peak of allocations traced during the phase, which is precise
+    but slows down compilation significantly.  Without trace, it is unknown (None)
+    on systems without the resource module such as Windows.
+    The optional hook is called on each phase exit with the phase name,
+    its elapsed seconds and its peak bytes.
+    """
+
+    def __init__(self, *, trace: bool = False, hook: TimingsHook | None = None):
+        self._trace = trace
+        self._hook = hook
+        # phase -> [calls, seconds, peak]
+        self._phases: dict[str, list] = {}
+        # peaks of active phases
+        self._peaks: list[int] = []
+        # whether tracemalloc was started for these timings
+        self._tracing = False
+
+    @staticmethod
+    def _maxrss() -> int | None:
+        try:
+            import resource
+        except ImportError:  # Unix only
+            return None
+        # KiB on Linux, bytes on MacOS
+        return (1 if sys.platform == "darwin" else 1024) * resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        peak: int | None
+        if self._trace:
+            # tracemalloc keeps only one peak, which is propagated to enclosing phases
+            peak = tracemalloc.get_traced_memory()[1]
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            self._peaks.append(0)
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if self._trace:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                tracemalloc.reset_peak()
+            else:
+                peak = self._maxrss()
+            stats = self._phases.setdefault(name, [0, 0.0, None])
+            stats[0] += 1
+            stats[1] += elapsed
+            if peak is not None:
+                stats[2] = peak if stats[2] is None else max(stats[2], peak)
+            if self._hook:
+                self._hook(name, elapsed, peak)
+
+    def toJSON(self) -> JsonObject:
+        """Timings by phase, in order of first occurrence."""
+        return {
+            name: {"calls": s[0], "seconds": s[1], "peak": s[2]}
+            for name, s in self._phases.items()
+        }
+
+    def __str__(self) -> str:
+        lines = [f"{'phase':<12} {'calls':>6} {'ms':>10} {'peak KiB':>10}"]
+        for name, s in self._phases.items():
+            peak = f"{s[2] / 1024:10.1f}" if s[2] is not None else f"{'-':>10}"
+            lines.append(f"{name:<12} {s[0]:6d} {1000 * s[1]:10.3f} {peak}")
+        return "\n".join(lines)
+
+# current collector, if any
+_timings: Timings | None = None
+
+def timings_start(*, trace: bool = False, hook: TimingsHook | None = None) -> Timings:
+    """Start collecting compilation timings, possibly with traced peaks and a hook."""
+    global _timings
+    _timings = Timings(trace=trace, hook=hook)
+    if trace and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _timings._tracing = True
+    return _timings
+
+def timings_stop() -> Timings | None:
+    """Stop collecting compilation timings and return them."""
+    global _timings
+    timings, _timings = _timings, None
+    if timings and timings._tracing:
+        tracemalloc.stop()
+    return timings
+
+def phase(name: str) -> contextlib.AbstractContextManager:
+    """Context of a compilation phase, timed only if timings are being collected."""
+    return _timings.phase(name) if _timings else contextlib.nullcontext()
+
 MODEL_PREDEFS = {
     "$ANY", "$NONE", "$NULL", "$BOOL", "$BOOLEAN",
     "$INT", "$INTEGER", "$I32", "$I64", "$U32", "$U64",
@@ -111,9 +219,44 @@ def one(lb) -> bool:
             seen = True   # first
     return seen
 
+# canonical structural key of a model, see model_key
+type ModelKey = tuple
+
+_SCALARS = (type(None), bool, int, float, str)
+
+def model_key(model: ModelType, memo: dict[int, ModelKey]|None = None) -> ModelKey:
+    """Hashable canonical key of a model, equal iff models are model_eq.
+
+    Scalars are tagged with their type to keep True, 1 and 1.0 apart, and
+    object comments and meta keys (#, %, $) are ignored.
+    Objects become frozensets, which cache their hash, so repeated lookups
+    of the same key are cheap.
+    The optional memo maps ids of containers to their key: it is only valid
+    while the models are not modified and kept alive by the caller.
+    """
+    tm = type(model)
+    if tm in _SCALARS:
+        return (tm, model)
+    if memo is not None and (key := memo.get(id(model))) is not None:
+        return key
+    if tm is list:
+        assert isinstance(model, list)  # type hint
+        key = (list, tuple(model_key(m, memo) for m in model))
+    elif tm is dict:
+        assert isinstance(model, dict)  # type hint
+        key = (dict, frozenset((p, model_key(m, memo))
+                               for p, m in model.items() if p not in ("#", "%", "$")))
+    else:
+        raise ModelError(f"unexpected model element type ({tm.__name__})")
+    if memo is not None:
+        memo[id(model)] = key
+    return key
+
 def model_eq(m1: ModelType, m2: ModelType) -> bool:
     """Recursively compare two models…"""
     # TODO resolve @ and $
+    if m1 is m2 and type(m1) in (list, dict):
+        return True
     t1, t2 = type(m1), type(m2)
     if t1 is not t2:
         return False
@@ -153,6 +296,7 @@ def same_model(m1: ModelType, m2: ModelType) -> bool:
     return model_eq(m1, m2)
 
 def model_in_models(m: ModelType, lm: list[ModelType]) -> bool:
+    # a single lookup does not pay for building keys, see model_key for repeated ones
     for i in lm:
         if model_eq(i, m):
             return True
@@ -393,9 +537,10 @@ def openfiles(args: list[str] = []):
                 yield fn, fh
 
 def _dedup_models(models: list[ModelType]) -> list[ModelType]:
-    dedups = []
+    dedups, seen, memo = [], set(), {}
     for m in models:
-        if not model_in_models(m, dedups):
+        if (key := model_key(m, memo)) not in seen:
+            seen.add(key)
             dedups.append(m)
     return dedups
 
@@ -1,12 +1,18 @@
 # experimental static (ecstatic?) compiler
 
+import copy
 import json
 import re
+import hashlib
+from typing import Any, Callable
 
 from .analyze import disjunct_analyse, distinct_prop_objects, ultimate_type
-from .irep import IRep, evaluate, optimizeIR
-from .language import Block, BoolExpr, Code, JsonExpr, Language, PathExpr, PropMap, StrExpr, Var
+from .irep import IRNode, IRep, evaluate, optimizeIR
+from .language import (
+    Block, BoolExpr, Code, JsonExpr, Language, PathExpr, PropMap, StrExpr, StreamPlan, Var
+)
 from .model import JsonModel
+from .code_cache import DefinitionCache
 from .mtypes import (
     Jsonable,
     JsonScalar,
@@ -21,12 +27,14 @@ from .mtypes import (
 from .runtime.support import _path as json_path
 from .utils import (
     MODEL_PREDEFS,
+    ModelKey,
     all_model_type,
     constant_value,
     is_a_simple_object,
     log,
-    model_in_models,
+    model_key,
     partition,
+    phase,
     split_object,
     tname,
 )
@@ -52,14 +60,20 @@ class CodeGenerator:
     - execute: true for executable, false for module.
     - fname: entry function name.
     - prefix: use this prefix for file-level identifiers.
+    - model_prefix: use this prefix for model check functions.
+    - map_suffix: suffix of the entry name for the public mapping of model check functions.
     - map_threshold: whether to inline property name checks (up to threshold) or use a map.
     - map_share: whether to share property maps
+    - obj_share: whether to share check functions of structurally identical objects
     - may_must_open_threshold: max number of optional props to mmop scheme, default 5
     - must_only_threshold: max number of mandatory props for must-only scheme, default 5
     - partition_threshold: max number of strings without search partitioning, 0 for no partitioning
     - or_must_prop: threshold to try or-list shortcut based on mandatory properties
     - sort_must: whether to sort must properties, default True
     - sort_may: whether to sort may properties, default True
+    - pgo: profiling data by model path, to order checks and hints by observed statistics.
+    - def_cache: cache of generated code per model, with keys by model id and an optional
+      IR optimizer applied to units before they are stored.
     - report: whether to report rejection reasons.
     - path: whether to keep track of value path while checking.
     - debug: verbose debug mode.
@@ -72,8 +86,11 @@ class CodeGenerator:
         fname: str = "check_model",
         *,
         prefix: str = "",
+        model_prefix: str = "json_model_",
+        map_suffix: str = "_map",
         map_threshold: int = 3,
         map_share: bool = False,
+        obj_share: bool = False,
         may_must_open_threshold: int = 5,
         must_only_threshold: int = 5,
         sort_must: bool = True,
@@ -84,6 +101,10 @@ class CodeGenerator:
         report: bool = True,
         path: bool = True,
         package: str | None = None,
+        stream: bool = False,
+        profile: bool = False,
+        pgo: dict[str, Jsonable] | None = None,
+        def_cache: tuple[DefinitionCache, dict[int, str], Callable[[Code], None] | None] | None = None,
         debug: bool = False,
     ):
         super().__init__()
@@ -91,6 +112,8 @@ class CodeGenerator:
         self._globs = globs
         self._lang = language
         self._prefix = prefix
+        self._model_prefix = model_prefix
+        self._map_suffix = map_suffix
         self._map_threshold = map_threshold
         self._may_must_open_threshold = may_must_open_threshold
         self._must_only_threshold = must_only_threshold
@@ -98,10 +121,15 @@ class CodeGenerator:
         self._sort_may = sort_may
         self._partition_threshold = partition_threshold
         self._map_share = map_share
+        self._obj_share = obj_share
         self._or_must_prop = or_must_prop
         self._report = report
         self._path = path
         self._package = package
+        self._stream = stream
+        self._profile = profile
+        self._pgo = pgo
+        self._def_cache = def_cache
         self._debug = debug
 
         self._code = Code(language, fname, executable=execute, package=package)
@@ -121,6 +149,14 @@ class CodeGenerator:
         self._to_compile: dict[int, tuple[JsonModel, str]] = {}
         # already generated property maps: serialized to function name
         self._generated_maps: dict[str, str] = {}
+        # already generated object checks: scope and structure to function name
+        self._generated_objs: dict[tuple, str] = {}
+        # model path length of the shared object check being generated, if any
+        self._mroot: int | None = None
+        # stream plans: named shared plans in dependency order, and per entry
+        self._splans: list[tuple[str, StreamPlan]] = []
+        self._smap: dict[str, StreamPlan] = {}
+        self._splan_names: dict[int, str] = {}
         self.reset()
 
     def reset(self):
@@ -132,6 +168,10 @@ class CodeGenerator:
         self._compiled.clear()
         self._to_compile.clear()
         self._generated_maps.clear()
+        self._generated_objs.clear()
+        self._splans.clear()
+        self._smap.clear()
+        self._splan_names.clear()
 
     def _exreg(
         self,
@@ -141,7 +181,6 @@ class CodeGenerator:
         remap: dict[str, str],
         regex: str,
         opts: str,
-        path: str,
     ) -> Block:
         """Generate post regex code for extended regular expression."""
         gen = self._lang
@@ -156,7 +195,8 @@ class CodeGenerator:
         for sname, ref in remap.items():
             checks += gen.match_val("match", rname, sname, "extract", declare=first)
             checks += gen.if_stmt(
-                gen.not_op(self._dollarExpr(jm, ref, "extract", path, is_raw=True)),
+                # the string function is shared, use its own path parameter
+                gen.not_op(self._dollarExpr(jm, ref, "extract", "path", is_raw=True)),
                 gen.ret(gen.false()),
             )
             first = False
@@ -224,7 +264,7 @@ class CodeGenerator:
             if remap:
                 fun = gen.ident(self._prefix + "xre")
                 self._code.regex(fun + "_re", pattern, ropts)
-                self._exreg(jm, fun, fun + "_re", remap, pattern, ropts, path)
+                self._exreg(jm, fun, fun + "_re", remap, pattern, ropts)
             else:
                 fun = gen.ident(self._prefix + "re")
                 self._code.regex(fun, pattern, ropts)
@@ -294,7 +334,7 @@ class CodeGenerator:
 
         # TODO make it a function?
         assert isinstance(model, dict) and "@" in model
-        smpath = json_path(mpath)
+        smpath = self._spath(mpath)
         gen = self._lang
 
         tmodel = ultimate_type(jm, model["@"])  # type: ignore
@@ -465,7 +505,7 @@ class CodeGenerator:
 
         # disjunct: [(tag name, tag type, [0])], 0 -> p -> csts, 0 -> model
         disjuncts, all_const_props, others = dis
-        smpath = json_path(mpath)
+        smpath = self._spath(mpath)
         gen = self._lang
 
         assert disjuncts, "non empty disjunction"
@@ -624,6 +664,77 @@ class CodeGenerator:
             self._generated_maps[smodel] = default
             return default
 
+    def _objshare_key(self, jm: JsonModel, model: ModelObject) -> tuple | None:
+        """Key of an object check function for reuse, if it can be shared.
+
+        Reference resolution and number looseness depend on the model scope.
+        Profiling and profile-guided optimizations are per model path, so no
+        sharing there, whereas reports use paths relative to the object.
+        """
+        if not self._obj_share or self._profile or self._pgo or "%" in model or "$" in model:
+            return None
+        scope = (id(jm._defs), jm._url.split("#", 1)[0], jm._loose_int, jm._loose_float)
+        return (scope, model_key(model))
+
+    def _spath(self, mpath: ModelPath) -> str:
+        """Model path for messages.
+
+        Within a shared object check, paths are relative to the object, as ``@``,
+        and the caller reports its own path on failure.
+        """
+        if self._mroot is None:
+            return json_path(mpath)
+        rpath = mpath[self._mroot:]
+        return "@" + json_path(rpath) if rpath else "@"
+
+    #
+    # profile-guided optimizations
+    #
+    def _pgoStats(self, key: str) -> dict[str, Jsonable] | None:
+        """Observed statistics of a check function, if any."""
+        stats = self._pgo.get(key) if self._pgo else None
+        return stats if isinstance(stats, dict) and stats.get("calls") else None
+
+    def _pgoKey(self, jm: JsonModel, model: ModelType, mpath: ModelPath) -> str:
+        """Profile key of the check function of a model, the definition path for references."""
+        if isinstance(model, str) and jm._isRef(model):
+            try:
+                return json_path([jm._defs.gget(model)])
+            except KeyError:
+                pass
+        return json_path(mpath)
+
+    def _pgoProps(self, mpath: ModelPath) -> dict[str, float] | None:
+        """Observed average occurrences of property names in an object, if any."""
+        stats = self._pgoStats(json_path(mpath))
+        if stats is None:
+            return None
+        calls, props = stats["calls"], stats.get("props", {})
+        assert isinstance(calls, int) and isinstance(props, dict)  # pyright hint
+        return {p: n / calls for p, n in props.items()}  # type: ignore
+
+    def _pgoOrder(self, jm: JsonModel, models: ModelArray, mpath: ModelPath) -> list[int]:
+        """Order or-alternatives by observed passes per time unit.
+
+        Alternatives without statistics, such as inlined scalars, keep their position.
+        """
+        order = list(range(len(models)))
+        if not self._pgo:
+            return order
+        rate: dict[int, float] = {}
+        for i, m in enumerate(models):
+            if stats := self._pgoStats(self._pgoKey(jm, m, mpath + [i])):
+                rate[i] = stats["pass"] / max(stats["ns"], 1)  # type: ignore
+        for slot, i in zip(sorted(rate), sorted(rate, key=lambda i: -rate[i])):
+            order[slot] = i
+        return order
+
+    def _pgoFailing(self, jm: JsonModel, model: ModelType, mpath: ModelPath) -> bool | None:
+        """Likely hint about an or-alternative failure."""
+        if stats := self._pgoStats(self._pgoKey(jm, model, mpath)):
+            return is_likely(stats["fail"] / stats["calls"], 0.5)  # type: ignore
+        return None
+
     def _propmap_gen(self, jm: JsonModel, model: ModelObject, name: str, mpath: ModelPath):
         """Generate property map for sub-model."""
         assert isinstance(model, dict)
@@ -657,7 +768,7 @@ class CodeGenerator:
 
         assert isinstance(must, dict)
         gen = self._lang
-        smpath = json_path(mpath)
+        smpath = self._spath(mpath)
 
         code = (
             gen.lcom("check close must only props")
@@ -736,7 +847,7 @@ class CodeGenerator:
 
         assert isinstance(must, dict)
         gen = self._lang
-        smpath = json_path(mpath)
+        smpath = self._spath(mpath)
 
         code = gen.lcom("check open must/may only props") + gen.if_stmt(
             gen.not_op(gen.is_a(val, dict)),
@@ -783,10 +894,15 @@ class CodeGenerator:
                 )
 
         expected_nprops = MAY_P * len(may)
+        freqs = self._pgoProps(mpath)
 
         for prop, pmodel in may.items():
             if pmodel != "$ANY":
-                likely = is_likely(MAY_P, 0.5 * expected_nprops)
+                if freqs is not None:
+                    # observed probability of the property
+                    likely = is_likely(freqs.get(prop, 0.0), 0.5)
+                else:
+                    likely = is_likely(MAY_P, 0.5 * expected_nprops)
                 expected_nprops -= MAY_P
                 check_value: Block = gen.path_var("lpath", gen.path_val(vpath, prop, True, False))
                 has_prop: str
@@ -828,7 +944,7 @@ class CodeGenerator:
 
         # separate properties
         must, may, defs, regs, oth = split_object(model, mpath)
-        smpath = json_path(mpath)
+        smpath = self._spath(mpath)
 
         # generated code helpers
         code: Block = []
@@ -883,8 +999,21 @@ class CodeGenerator:
         ):
             return self._closeMuObject(jm, must, mpath, oname, res, val, vpath)
 
+        # observed average occurrences of properties, if available
+        freqs = self._pgoProps(mpath)
+
+        def may_p(p: str) -> float:
+            return freqs.get(p, 0.0) if freqs is not None else MAY_P
+
+        def must_p(p: str) -> float:
+            return freqs.get(p, 0.0) if freqs is not None else 1.0
+
+        def by_freq(pms: list[tuple[str, ModelType]]) -> list[tuple[str, ModelType]]:
+            # most frequent first, stable wrt static order
+            return sorted(pms, key=lambda pm: -may_p(pm[0])) if freqs else pms
+
         # used for evaluating likely-ness
-        expected_nprops = (
+        expected_nprops = sum(freqs.values()) if freqs is not None else (
             len(must)
             + MAY_P * len(may)
             + DEF_E * len(defs)
@@ -950,10 +1079,11 @@ class CodeGenerator:
                     must_pm = [(p, m) for p, m in must.items() if prop_part[p] == part]
                     if self._sort_must:
                         must_pm = sorted(must_pm, key=lambda pm: (len(pm[0]), pm[0]))
+                    must_pm = by_freq(must_pm)
 
                     for p, m in must_pm:
-                        likely = is_likely(1, 0.5 * expected_nprops)
-                        expected_nprops -= 1
+                        likely = is_likely(must_p(p), 0.5 * expected_nprops)
+                        expected_nprops -= must_p(p)
 
                         # TODO likely hint under partitioning?
                         if partitioned:
@@ -967,7 +1097,7 @@ class CodeGenerator:
                             + gen.if_stmt(
                                 gen.not_op(res),
                                 self._gen_fail(
-                                    f"invalid mandatory prop value [{json_path(mpath + [p])}]",
+                                    f"invalid mandatory prop value [{self._spath(mpath + [p])}]",
                                     lpath_ref,
                                 ),
                                 likely=False,
@@ -988,8 +1118,9 @@ class CodeGenerator:
                     body_code += gen.mif_stmt(part_mif[255])
 
             else:  # generic code with a map above threshold
-                likely = is_likely(len(must), 0.5 * expected_nprops)
-                expected_nprops -= len(must)
+                must_e = sum(map(must_p, must))
+                likely = is_likely(must_e, 0.5 * expected_nprops)
+                expected_nprops -= must_e
 
                 candidate = f"{oname}_mup"
                 prop_must = self._propmap_name(must, candidate)
@@ -1057,10 +1188,11 @@ class CodeGenerator:
                     may_pm = [(p, m) for p, m in may.items() if prop_part[p] == part]
                     if self._sort_may:
                         may_pm = sorted(may_pm, key=lambda pm: (len(pm[0]), pm[0]))
+                    may_pm = by_freq(may_pm)
 
                     for p, m in may_pm:
-                        likely = is_likely(MAY_P, 0.5 * expected_nprops)
-                        expected_nprops -= MAY_P
+                        likely = is_likely(may_p(p), 0.5 * expected_nprops)
+                        expected_nprops -= may_p(p)
 
                         if partitioned:
                             likely = None
@@ -1072,7 +1204,7 @@ class CodeGenerator:
                             + gen.if_stmt(
                                 gen.not_op(res),
                                 self._gen_fail(
-                                    f"invalid optional prop value [{json_path(mpath + [p])}]",
+                                    f"invalid optional prop value [{self._spath(mpath + [p])}]",
                                     lpath_ref,
                                 ),
                                 likely=False,
@@ -1104,8 +1236,9 @@ class CodeGenerator:
                     body_code += gen.mif_stmt(part_mif[255])
 
             else:  # generic code
-                likely = is_likely(MAY_P * len(may), 0.5 * expected_nprops)
-                expected_nprops -= MAY_P * len(may)
+                may_e = sum(map(may_p, may))
+                likely = is_likely(may_e, 0.5 * expected_nprops)
+                expected_nprops -= may_e
 
                 candidate = f"{oname}_map"
                 prop_may = self._propmap_name(may, candidate)
@@ -1176,7 +1309,7 @@ class CodeGenerator:
         ot_code: Block
         if oth:
             omodel = oth[""]
-            smpath = json_path(mpath + [""])
+            smpath = self._spath(mpath + [""])
             if omodel != "$ANY":
                 ot_code = (
                     gen.lcom("handle other props")
@@ -1186,7 +1319,7 @@ class CodeGenerator:
             else:  # optimized "": "$ANY" case
                 ot_code = gen.lcom("accept any other props") + gen.nope()
         else:  # no catch all
-            smpath = json_path(mpath)
+            smpath = self._spath(mpath)
             ot_code = self._gen_fail(f"unexpected prop [{smpath}]", lpath_ref)
 
         code += gen.obj_loop(
@@ -1232,7 +1365,7 @@ class CodeGenerator:
 
         code = []
         gen = self._lang
-        smpath = json_path(mpath)
+        smpath = self._spath(mpath)
 
         # direct empty list
         if not models:
@@ -1325,10 +1458,13 @@ class CodeGenerator:
 
         # build code sequence in reverse order
         icode = []
-        for i, m in reversed(list(enumerate(models))):
+        for i in reversed(self._pgoOrder(jm, models, mpath)):
+            m = models[i]
             # add a test if needed before the next check
             if icode and not (mandatory_props[i] and mandatory_props[i][1]):
-                icode = gen.if_stmt(gen.not_op(res), icode)
+                icode = gen.if_stmt(
+                    gen.not_op(res), icode, likely=self._pgoFailing(jm, m, mpath + [i])
+                )
             # current model code
             m_code = self._compileModel(jm, m, mpath + [i], res, val, vpath, or_known)
             # use the mandatory property test to reduce object checks
@@ -1379,7 +1515,7 @@ class CodeGenerator:
 
         assert isinstance(models, list)  # pyright hint
         gen = self._lang
-        smpath = json_path(mpath)
+        smpath = self._spath(mpath)
         code = []
 
         # NOTE optimized out under -O
@@ -1395,20 +1531,20 @@ class CodeGenerator:
 
         # optimize out repeated models
         if len(models) >= 2:
-            seen, dups, kept = [], [], []
-            seen_i, dups_i, kept_i = [], [], []
+            # first occurrence index of each distinct model
+            seen: dict[ModelKey, int] = {}
+            dupkeys: dict[ModelKey, int] = {}
+            memo: dict[int, ModelKey] = {}
             for i, m in enumerate(models):
-                if model_in_models(m, seen):
-                    if not model_in_models(m, dups):
-                        dups.append(m)
-                        dups_i.append(i)
+                key = model_key(m, memo)
+                if key in seen:
+                    dupkeys.setdefault(key, i)
                 else:
-                    seen.append(m)
-                    seen_i.append(i)
-            for i, m in zip(seen_i, seen):
-                if not model_in_models(m, dups):
-                    kept.append(m)
-                    kept_i.append(i)
+                    seen[key] = i
+            dups_i = list(dupkeys.values())
+            dups = [models[i] for i in dups_i]
+            kept_i = [i for k, i in seen.items() if k not in dupkeys]
+            kept = [models[i] for i in kept_i]
 
             # direct false if in dups
             if dups:
@@ -1512,7 +1648,7 @@ class CodeGenerator:
 
         gen = self._lang
         and_known: set[BoolExpr] = set(known or [])
-        smpath = json_path(mpath)
+        smpath = self._spath(mpath)
         code = []
 
         if not models:  # empty & list
@@ -1556,7 +1692,7 @@ class CodeGenerator:
         # known = expression already verified
         log.debug(f"mpath={mpath} model={model} res={res} val={val} vpath={vpath}")
         assert isinstance(mpath, list)
-        smpath = json_path(mpath)
+        smpath = self._spath(mpath)
         gen = self._lang
         known = known or set()
 
@@ -1598,7 +1734,7 @@ class CodeGenerator:
                     )
                     expr = gen.and_op(expr, compare) if expr else compare
                 else:
-                    raise ModelError(f"unexpected int value {model} at {smpath}")
+                    raise ModelError(f"unexpected int value {model} at {json_path(mpath)}")
                 if expr:
                     looseness = "loose" if jm._loose_int else "strict"
                     code += gen.bool_var(res, expr) + self._gen_report(
@@ -1717,7 +1853,7 @@ class CodeGenerator:
 
             case list():
                 expr: BoolExpr | None = gen.is_a(val, list)
-                smpath = json_path(mpath)
+                smpath = self._spath(mpath)
 
                 if known is not None:
                     if expr in known:
@@ -1863,15 +1999,30 @@ class CodeGenerator:
                     if name:
                         objid = name
                         code += self._compileObject(jm, model, mpath, name, res, val, vpath)
+                    elif (okey := self._objshare_key(jm, model)) in self._generated_objs:
+                        # reuse the function of a structurally identical object
+                        objid = self._generated_objs[okey]  # type: ignore
+                        code += gen.bool_var(res, gen.check_call(objid, val, vpath))
+                        code += self._gen_report(res, f"unexpected element [{smpath}]", vpath)
                     else:
                         # new function to check the object
                         objid = gen.ident(self._prefix + "obj")
+                        mroot = self._mroot
+                        if okey is not None:
+                            self._mroot = len(mpath)
+                        try:
+                            ocode = self._compileObject(jm, model, mpath, objid, "res", "val", "path")
+                        finally:
+                            self._mroot = mroot
                         self._code.sub(
                             objid,
-                            self._compileObject(jm, model, mpath, objid, "res", "val", "path"),
+                            ocode,
                             comment=f"object {json_path(mpath)}",
                             inline=True,
+                            profile=json_path(mpath) if self._profile else None,
                         )
+                        if okey is not None:
+                            self._generated_objs[okey] = objid
 
                         # call object check and possibly report
                         code += gen.bool_var(res, gen.check_call(objid, val, vpath))
@@ -1917,7 +2068,7 @@ class CodeGenerator:
             jm = self._globs[gref]  # type: ignore
             if jm._id not in self._compiled:
                 self._to_compile[jm._id] = (jm, gref)
-            self._names[gref] = f"json_model_{jm._id}"
+            self._names[gref] = f"{self._model_prefix}{jm._id}"
 
         # log.debug(f"name ref: ref={ref} gref={gref} at {path}: {self._names[gref]}")
         return self._names[gref]
@@ -1952,7 +2103,8 @@ class CodeGenerator:
                 + self._lang.ret("res")
             )
 
-        self._code.sub(fun, body, comment=f"check {name} ({json_path(mpath)})")
+        self._code.sub(fun, body, comment=f"check {name} ({json_path(mpath)})",
+                       profile=json_path(mpath) if self._profile else None)
 
         if fun2 and fun2 != fun:
             raise NotImplementedError("2 functions for one?!")
@@ -1975,7 +2127,7 @@ class CodeGenerator:
         shortcuts: dict[str, str] = {}
 
         for ref, jm0 in head._globs.items():
-            mid, fun0, fun, jm = jm0._id, f"json_model_{jm0._id}", None, jm0
+            mid, fun0, fun, jm = jm0._id, f"{self._model_prefix}{jm0._id}", None, jm0
 
             if ref == "$#" or fun0 in shortcuts:
                 continue
@@ -1987,7 +2139,7 @@ class CodeGenerator:
                 jm = jm.resolveRef(jm._model, [])
                 if jm._id == jm0._id:  # oops direct reference
                     raise Exception("infinite reference loop")
-                fun = f"json_model_{jm._id}" if jm else fun0
+                fun = f"{self._model_prefix}{jm._id}" if jm else fun0
 
             if fun in shortcuts:
                 fun = shortcuts[fun]
@@ -2007,16 +2159,209 @@ class CodeGenerator:
         # log.debug(f"shortcuts: {shortcuts}")
         return shortcuts
 
+    def _streamLeaf(self, jm: JsonModel, model: ModelType, mpath: ModelPath) -> StreamPlan:
+        """Check function for a sub-model, which is materialized and checked as a whole."""
+        if isinstance(model, str) and jm._isRef(model):
+            return self._getNameRef(jm, model, mpath)
+        hpath = tuple(mpath)
+        if hpath not in self._paths:
+            self._compileName(jm, f"stream {json_path(mpath)}", model, mpath, True)
+        return self._paths[hpath]
+
+    def _streamPlan(self, jm: JsonModel, model: ModelType, mpath: ModelPath,
+                    stack: set[int]) -> StreamPlan:
+        """Build the incremental check plan for a model, down to check function leaves."""
+
+        if model == "$ANY":
+            return True
+
+        # follow references to plan-able models, but not recursions
+        if isinstance(model, str) and jm._isRef(model):
+            rjm = jm.resolveRef(model, mpath)
+            if rjm._id in stack:
+                return self._getNameRef(jm, model, mpath)
+            if rjm._id not in self._splan_names:
+                try:
+                    gref = jm._defs.gget(model)
+                except KeyError:
+                    gref = model
+                stack.add(rjm._id)
+                plan = self._streamPlan(rjm, rjm._model, [gref], stack)
+                stack.remove(rjm._id)
+                if isinstance(plan, (list, tuple)):
+                    # share plan
+                    name = self._lang.ident(self._prefix + "splan")
+                    self._splans.append((name, plan))
+                    plan = name
+                else:
+                    plan = self._getNameRef(jm, model, mpath)
+                self._splan_names[rjm._id] = plan
+            return self._splan_names[rjm._id]
+
+        # array of one item type
+        if isinstance(model, list) and len(model) == 1:
+            return [self._streamPlan(jm, model[0], mpath + [0], stack)]
+
+        # object with only plain property names
+        if is_a_simple_object(model) and "%" not in model:
+            assert isinstance(model, dict)  # pyright hint
+            must, _, refs, regs, _ = split_object(model, mpath)
+            if not refs and not regs:
+                props: dict[str, StreamPlan] = {}
+                other: StreamPlan | None = None
+                for key, val in model.items():
+                    if key in ("$", "#"):
+                        continue
+                    elif key == "":
+                        other = self._streamPlan(jm, val, mpath + [key], stack)
+                    else:
+                        prop = key[1:] if key[0] in ("_", "!", "?") else key
+                        props[prop] = self._streamPlan(jm, val, mpath + [key], stack)
+                return (props, sorted(must.keys()), other)
+
+        return self._streamLeaf(jm, model, mpath)
+
+    def compileStreamPlans(self, model: JsonModel, entries: PropMap):
+        """Build the incremental check plans of entries."""
+        for name, fun in entries.items():
+            if name == "":
+                jm, mpath = model, []
+            else:
+                jm, mpath = model._defs[name], ["$" + name]
+                if fun != f"{self._model_prefix}{jm._id}":
+                    # alias to another function
+                    self._smap[name] = fun
+                    continue
+            self._smap[name] = self._streamPlan(jm, jm._model, mpath, {jm._id})
+
     def compileOneJsonModel(self, jm: JsonModel, name: str, path: ModelPath, local: bool = False):
         if jm._id not in self._compiled:
             self._compiled.add(jm._id)
             if name not in self._names:
-                self._names[name] = "json_model_" + str(jm._id)
+                self._names[name] = self._model_prefix + str(jm._id)
+            if self._def_cache and jm._id in self._def_cache[1]:
+                self._compileUnit(jm, name, path, local)
+            else:
+                self._compileName(jm, name, jm._model, path, local)
+
+    def _compileUnit(self, jm: JsonModel, name: str, path: ModelPath, local: bool):
+        """Compile a model independently of others, or replay it from the definition cache."""
+        assert self._def_cache
+        cache, keys, optimize = self._def_cache
+        sdata = json.dumps([keys[jm._id], name, path, local])
+        key = hashlib.sha3_256(sdata.encode("UTF-8")).hexdigest()
+
+        unit = cache.load(key)
+        if unit is not None:
+            try:
+                unit = self._unitIds(unit, False)
+            except KeyError:  # a reference is not resolved anymore
+                unit = None
+        if unit is None:
+            unit = self._generateUnit(jm, name, path, local, optimize)
+            try:
+                cache.store(key, self._unitIds(unit, True))
+            except ValueError:  # identifiers cannot be normalized, do not cache
+                pass
+
+        # append unit code and merge generator state
+        self._code.defs(unit["defs"])
+        self._code.inis(unit["inis"])
+        self._code.dels(unit["dels"])
+        if unit["subs"]:
+            self._code.subs(unit["subs"])
+        for n, f in unit["names"].items():
+            self._names.setdefault(n, f)
+        for p, f in unit["paths"].items():
+            self._paths.setdefault(p, f)
+        self._generated |= unit["generated"]
+        if optimize:
+            for block in (unit["defs"], unit["inis"], unit["dels"], unit["subs"]):
+                self._code._optimized.update(id(ins) for ins in block)
+        for mid, gref in unit["todo"].items():
+            if mid not in self._compiled:
+                self._to_compile.setdefault(mid, (self._globs[gref], gref))  # type: ignore
+
+    def _generateUnit(self, jm: JsonModel, name: str, path: ModelPath, local: bool,
+                      optimize: Callable[[Code], None] | None) -> dict[str, Any]:
+        """Generate a unit into a separate code and state, with unit-specific identifiers,
+        so that it does not depend on other units."""
+        saved = (self._code, self._prefix, self._lang._idcounts, self._names, self._regs,
+                 self._paths, self._generated, self._to_compile, self._generated_maps,
+                 self._generated_objs)
+        self._code = Code(self._lang, self._code._entry, self._code._executable, self._code._package)
+        self._prefix, self._lang._idcounts = f"{self._prefix}{jm._id}_", {}
+        self._names = {n: self._names[n] for n in ("$#", "", name)}
+        self._regs, self._paths, self._generated, self._to_compile, self._generated_maps, \
+            self._generated_objs = {}, {}, set(), {}, {}, {}
+        try:
             self._compileName(jm, name, jm._model, path, local)
+            if optimize:
+                optimize(self._code)
+            return {
+                "defs": self._code._defs,
+                "inis": self._code._inis,
+                "dels": self._code._dels,
+                "subs": self._code._subs,
+                "names": self._names,
+                "paths": self._paths,
+                "generated": self._generated,
+                "todo": {mid: gref for mid, (_, gref) in self._to_compile.items()},
+            }
+        finally:
+            (self._code, self._prefix, self._lang._idcounts, self._names, self._regs,
+             self._paths, self._generated, self._to_compile, self._generated_maps,
+             self._generated_objs) = saved
+
+    def _unitIds(self, unit: dict[str, Any], store: bool) -> dict[str, Any]:
+        """Convert model ids in a unit to and from global references, for storage.
+
+        Ids are sequential, so they change whenever a definition is added before.
+        Identifiers of model functions and unit prefixes are stored with a NUL-delimited
+        reference to the model instead, as found in the unit names.
+        """
+        if store:
+            mprefix, uprefix = self._model_prefix, self._prefix
+            ids: dict[int, str] = {}
+            for gref, fun in sorted(unit["names"].items()):
+                if gref and fun.startswith(mprefix) and fun[len(mprefix):].isdigit():
+                    ids.setdefault(int(fun[len(mprefix):]), gref)
+            mprefix, uprefix = re.escape(mprefix), re.escape(uprefix)
+            id_re = re.compile(rf"(?<!\w)({mprefix})(\d+)(?!\w)|(?<!\w)({uprefix})(\d+)_")
+
+            def ref(match: re.Match) -> str:
+                mid = int(match[2] or match[4])
+                if mid not in ids:
+                    raise ValueError(f"unexpected model id: {mid}")
+                return f"{match[1] or match[3]}\x00{ids[mid]}\x00" + ("" if match[2] else "_")
+
+            def convert(s: str) -> str:
+                if "\x00" in s:
+                    raise ValueError("unexpected NUL in identifier or constant")
+                return id_re.sub(ref, s)
+
+            stored = _map_strings({k: v for k, v in unit.items() if k != "todo"}, convert)
+            stored["todo"] = sorted(unit["todo"].values())
+            return stored
+
+        ref_re = re.compile("\x00([^\x00]*)\x00")
+
+        def back(s: str) -> str:
+            return ref_re.sub(lambda m: str(self._globs[m[1]]._id), s) if "\x00" in s else s  # type: ignore
+
+        loaded = _map_strings({k: v for k, v in unit.items() if k != "todo"}, back)
+        loaded["todo"] = {self._globs[gref]._id: gref for gref in unit["todo"]}  # type: ignore
+        return loaded
+
+    def _compileTodo(self):
+        """Compile encountered references."""
+        while todo := set(self._to_compile.keys()) - self._compiled:
+            jm, gref = self._to_compile[min(todo)]
+            self.compileOneJsonModel(jm, gref, [gref], True)
 
     def compileJsonModelHead(self, model: JsonModel):
         # $# special handing
-        head_model_fun = f"json_model_{model._head._id}"
+        head_model_fun = f"{self._model_prefix}{model._head._id}"
         self._names["$#"] = head_model_fun
         self._names[""] = head_model_fun
 
@@ -2031,10 +2376,10 @@ class CodeGenerator:
             # eg "foo": "$bla"
             if dn in self._globs and self._globs[dn]._id != jm._id:  # type: ignore
                 # skip compilation and point to other function
-                entries[n] = f"json_model_{self._globs[dn]._id}"  # type: ignore
+                entries[n] = f"{self._model_prefix}{self._globs[dn]._id}"  # type: ignore
             else:
                 # actual compilation of a new function
-                entries[n] = f"json_model_{jm._id}"
+                entries[n] = f"{self._model_prefix}{jm._id}"
                 self.compileOneJsonModel(jm, dn, ["$" + n], False)
             log.debug(f"after {n} ({jm._id}): {self._names}")
 
@@ -2044,9 +2389,12 @@ class CodeGenerator:
         # TODO possibly add entries for referenced models? under an option?
 
         # compile other encountered references
-        while todo := set(self._to_compile.keys()) - self._compiled:
-            jm, gref = self._to_compile[min(todo)]
-            self.compileOneJsonModel(jm, gref, [gref], True)
+        self._compileTodo()
+
+        # plans may require new functions and references
+        if self._stream:
+            self.compileStreamPlans(model, entries)
+            self._compileTodo()
 
         # for skip call optimization
         self._code._shortcuts = self.computeShortcuts(model)
@@ -2056,12 +2404,47 @@ class CodeGenerator:
             if fun in self._code._shortcuts:
                 entries[name] = self._code._shortcuts[fun]
 
+        # and on stream plans
+        if self._stream:
+            self._splans[:] = [(n, _splan_shortcut(p, self._code._shortcuts)) for n, p in self._splans]
+            for name, plan in self._smap.items():
+                self._smap[name] = _splan_shortcut(plan, self._code._shortcuts)
+
         # generate mapping, beware of name consistency
-        self._code.pmap(f"{self._code._entry}_map", entries, True)
+        self._code.pmap(f"{self._code._entry}{self._map_suffix}", entries, True)
 
         return self._code
 
 
+def _splan_shortcut(plan: StreamPlan, shortcuts: dict[str, str]) -> StreamPlan:
+    """Apply function shortcuts to stream plan leaves."""
+    if isinstance(plan, str):
+        return shortcuts.get(plan, plan)
+    elif isinstance(plan, list):
+        return [_splan_shortcut(plan[0], shortcuts)]
+    elif isinstance(plan, tuple):
+        props, must, other = plan
+        return (
+            {p: _splan_shortcut(m, shortcuts) for p, m in props.items()},
+            must,
+            _splan_shortcut(other, shortcuts) if other is not None else None,
+        )
+    return plan
+
+
+def _map_strings(data: Any, fun: Callable[[str], str]) -> Any:
+    """Copy nested code or generator state, applying fun to all strings."""
+    if isinstance(data, str):
+        return fun(data)
+    elif isinstance(data, IRNode):
+        return IRNode({k: _map_strings(v, fun) for k, v in data.items()})
+    elif isinstance(data, dict):
+        return {_map_strings(k, fun): _map_strings(v, fun) for k, v in data.items()}
+    elif isinstance(data, (list, tuple, set)):
+        return type(data)(_map_strings(v, fun) for v in data)
+    return data
+
+
 def xstatic_compile(
     model: JsonModel,
     fname: str = "check_model",
@@ -2071,6 +2454,7 @@ def xstatic_compile(
     relib: str | None = None,
     map_threshold: int | None = None,
     map_share: bool = False,
+    obj_share: bool = False,
     may_must_open_threshold: int | None = None,
     must_only_threshold: int | None = None,
     sort_must: bool = True,
@@ -2089,15 +2473,23 @@ def xstatic_compile(
     strcmp: bool = True,
     max_strcmp_cset: int = 64,
     byte_order: str = "le",
+    regex_cache: int = 0,
+    dual: bool = False,
+    stream: bool = False,
+    lazy: bool = False,
+    profile: bool = False,
+    pgo: dict[str, Jsonable] | None = None,
+    def_cache: DefinitionCache | None = None,
 ) -> Code:
     """Generate the check source code for a model.
 
     - model: JSON Model root to compile.
     - fname: target function name.
-    - lang: name of target language.
+    - lang: name of target language, pyext for C as a CPython extension module.
     - prefix: prefix for generated functions.
     - map_threshold: inline property checks under this threshold.
     - map_share: share generated property maps.
+    - obj_share: share check functions of structurally identical objects.
     - may_must_open_threshold: mmop scheme if below threshold opt props
     - must_only_threshold: must-only scheme if below threshold mandatory props
     - sort_must: whether to sort must properties
@@ -2115,10 +2507,24 @@ def xstatic_compile(
     - strcmp: whether to optimize some string comparisons
     - max_strcmp_cset: max size for direct str constant set
     - byte_order: le, be or dpd
+    - regex_cache: memoize this many results per regex (py and js), 0 for none
+    - dual: generate both fast no-report and reporting check functions (py),
+      the fast ones sharing the checks of identical objects
+    - stream: generate incremental checks on raw JSON data (py)
+    - lazy: compile regexes on first use and initialize on import (py)
+    - profile: instrument check functions with calls, results and time (py, c, js)
+    - pgo: profiling data, as dumped by instrumented checkers, to order or-alternatives and
+      property checks and to set likely hints from observed statistics
+    - def_cache: reuse code generated for unchanged models and their dependencies across
+      compilations, with unit-specific identifiers (not with stream)
     """
+    # all code generation options, for definition cache keys
+    options = {k: v for k, v in locals().items() if k not in ("model", "def_cache")}
+
     # set default threshold for must-only scheme
     MUST_ONLY_THRESHOLD: dict[str, int] = {
         "c": 0,  # never good enough vs unroll
+        "pyext": 0,  # same as c
         "js": 256,  # no cutoff?
         "py": 256,  # no cutoff?
         "pl": 128,  # ?
@@ -2133,6 +2539,7 @@ def xstatic_compile(
     # set default threshold for may-must-open scheme
     MAY_MUST_OPEN_THRESHOLD: dict[str, int] = {
         "c": 0,  # never good enough vs unroll, but faster than map
+        "pyext": 0,  # same as c
         # FIXME this is only beneficial the number of value props is significant on mays?
         # there is no cutoff in that case, but otherwise it reduces performance
         # TODO decision process should also involve may/must ratio or take into account
@@ -2152,6 +2559,7 @@ def xstatic_compile(
     # set default map threshold depending on target language
     MAP_THRESHOLD: dict[str, int] = {
         "c": 256,  # NOTE the actual cutoff is _very_ far, probably over 1000/1300
+        "pyext": 256,  # same as c
         # FIXME unclear… 40 -> 20 for now
         "js": 20,
         "py": 10,
@@ -2167,6 +2575,7 @@ def xstatic_compile(
     # partition threshold to generate a dichotomy on unrolled tests
     PARTITION_THRESHOLD: dict[str, int] = {
         "c": 6,
+        "pyext": 6,
         "go": 0,
         # TODO other languages once tested
     }
@@ -2176,9 +2585,36 @@ def xstatic_compile(
         log.warning(f"partitioning not implemented for {lang}, ignoring")
         partition_threshold = 0
 
+    if dual and lang != "py":
+        log.warning(f"dual code generation not implemented for {lang}, ignoring")
+        dual = False
+    if dual and not report:
+        log.warning("dual code generation requires reporting, ignoring")
+        dual = False
+
+    if stream and lang != "py":
+        log.warning(f"stream checks not implemented for {lang}, ignoring")
+        stream = False
+    if stream and dual:
+        log.warning("stream checks not implemented with dual code generation, ignoring")
+        stream = False
+
+    if profile and lang not in ("py", "c", "js"):
+        log.warning(f"profiling not implemented for {lang}, ignoring")
+        profile = False
+
+    if lazy and lang != "py":
+        log.warning(f"lazy initialization not implemented for {lang}, ignoring")
+        lazy = False
+
+    if regex_cache and lang not in ("py", "js"):
+        log.warning(f"regex cache not implemented for {lang}, ignoring")
+        regex_cache = 0
+
     # length threshold about whether to shortcut or-list based on mandatory properties
     OR_MUST_PROP: dict[str, bool] = {
         "c": 4,
+        "pyext": 4,
         "js": 2,
         "py": 2,
         "java": 2,
@@ -2206,8 +2642,13 @@ def xstatic_compile(
             with_path=report,
             with_predef=predef,
             relib=relib or "re2",
+            regex_cache=regex_cache,
+            dual=dual,
+            stream=stream,
+            lazy=lazy,
+            with_profile=profile,
         )
-    elif lang == "c":
+    elif lang in ("c", "pyext"):
         from .clang import CLangJansson
 
         language = CLangJansson(
@@ -2221,6 +2662,8 @@ def xstatic_compile(
             byte_order=byte_order,
             max_strcmp_cset=max_strcmp_cset,
             partition_threshold=strcmp_cset_partition_threshold,
+            pyext=lang == "pyext",
+            with_profile=profile,
         )
     elif lang == "js":
         from .javascript import JavaScript
@@ -2231,6 +2674,8 @@ def xstatic_compile(
             with_path=report,
             with_predef=predef,
             relib=relib or "re",
+            regex_cache=regex_cache,
+            with_profile=profile,
         )
     elif lang in ("plpgsql", "sql"):
         from .plpgsql import PLpgSQL
@@ -2283,48 +2728,95 @@ def xstatic_compile(
     else:
         raise NotImplementedError(f"no support yet for language: {lang}")
 
-    # intermediate representation if needed
-    if ir_optimize or language is None:
-        target = IRep(debug=debug, lang=language)
-        if language:
-            language._short_version = short_version
-            target.set_caps = language.set_caps
-    else:  # not needed
-        target = language
-
-    # cold override
-    target._short_version = short_version
-
-    # source code generator
-    gen = CodeGenerator(
-        model._globs,  # type: ignore
-        target,
-        fname,
-        prefix=prefix,
-        map_share=map_share,
-        map_threshold=map_threshold,
-        may_must_open_threshold=may_must_open_threshold,
-        must_only_threshold=must_only_threshold,
-        partition_threshold=partition_threshold,
-        or_must_prop=or_must_prop,
-        sort_must=sort_must,
-        sort_may=sort_may,
-        execute=execute,
-        debug=debug,
-        report=report,
-        package=package,
-    )
+    def generate(language: Language|None, report: bool, prefix: str,
+                 model_prefix: str = "json_model_", map_suffix: str = "_map",
+                 share: bool = obj_share) -> Code:
+        """Generate code for one variant of check functions."""
+
+        def optimize(code: Code, shortcuts: dict[str, str]):
+            """Optimize IR code sections in place."""
+            done = code._optimized
+            optimizeIR(code._subs, if_optim=True, shortcuts=shortcuts, reporting=report, done=done)
+            optimizeIR(code._defs, if_optim=False, shortcuts=shortcuts, reporting=report, done=done)
+            optimizeIR(code._inis, if_optim=False, shortcuts=shortcuts, reporting=report, done=done)
+            optimizeIR(code._dels, if_optim=False, shortcuts=shortcuts, reporting=report, done=done)
+
+        # intermediate representation if needed
+        if ir_optimize or language is None:
+            target = IRep(debug=debug, lang=language)
+            if language:
+                language._short_version = short_version
+                target.set_caps = language.set_caps
+        else:  # not needed
+            target = language
+
+        # cold override
+        target._short_version = short_version
+
+        # per-model keys under this variant
+        unit_keys = None
+        if def_cache is not None and not stream:
+            variant = {"report": report, "prefix": prefix, "model_prefix": model_prefix, "map_suffix": map_suffix,
+                       "obj_share": share}
+            unit_keys = def_cache, def_cache.keys(model, **(options | variant)), \
+                (lambda code: optimize(code, {})) if ir_optimize else None
+
+        # source code generator
+        gen = CodeGenerator(
+            model._globs,  # type: ignore
+            target,
+            fname,
+            prefix=prefix,
+            model_prefix=model_prefix,
+            map_suffix=map_suffix,
+            map_share=map_share,
+            obj_share=share,
+            map_threshold=map_threshold,
+            may_must_open_threshold=may_must_open_threshold,
+            must_only_threshold=must_only_threshold,
+            partition_threshold=partition_threshold,
+            or_must_prop=or_must_prop,
+            sort_must=sort_must,
+            sort_may=sort_may,
+            execute=execute,
+            debug=debug,
+            report=report,
+            package=package,
+            stream=stream,
+            profile=profile,
+            pgo=pgo,
+            def_cache=unit_keys,
+        )
+
+        # generate IR or final code
+        with phase("generate"):
+            code: Code = gen.compileJsonModelHead(model)
+
+        # optimize IR
+        if ir_optimize:
+            with phase("optimizeIR"):
+                optimize(code, code._shortcuts)
+            if language:
+                with phase("evaluate"):
+                    code = evaluate(code, language)
+
+        # stream plans refer to generated functions
+        if stream and language:
+            for name, plan in gen._splans:
+                code.splan(name, plan)
+            code.splan(f"{fname}_stream{map_suffix}", gen._smap)
+
+        return code
+
+    if not dual:
+        return generate(language, report, prefix)
 
-    # generate IR or final code
-    code: Code = gen.compileJsonModelHead(model)
-
-    # optimize IR
-    if ir_optimize:
-        optimizeIR(code._subs, if_optim=True, shortcuts=code._shortcuts, reporting=report)
-        optimizeIR(code._defs, if_optim=False, shortcuts=code._shortcuts, reporting=report)
-        optimizeIR(code._inis, if_optim=False, shortcuts=code._shortcuts, reporting=report)
-        optimizeIR(code._dels, if_optim=False, shortcuts=code._shortcuts, reporting=report)
-        if language:
-            code = evaluate(code, language)
+    # fast variant without reporting nor path, exposed in the usual map,
+    # where identical objects can always share their check function
+    fast = copy.deepcopy(language)
+    fast._with_report = fast._with_path = False
+    code = generate(fast, False, prefix, share=True)
+    # reporting variant, with distinct names
+    code.extend(generate(language, True, prefix + "r_", "json_report_", "_rmap"))
 
     return code
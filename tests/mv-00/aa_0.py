@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -28,19 +41,19 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .0
             res = isinstance(arr_0_item, list)
             if res:
                 for arr_1_idx, arr_1_item in enumerate(arr_0_item):
-                    arr_1_lpath: Path = ((arr_0_lpath if path is not None else None) + [ arr_1_idx ]) if (arr_0_lpath if path is not None else None) is not None else None
+                    arr_1_lpath: Path = (arr_0_lpath, arr_1_idx) if arr_0_lpath is not None else None
                     # .0.0
                     res = isinstance(arr_1_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.0.0]", arr_1_lpath if (arr_0_lpath if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.0.0]", arr_1_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.0]", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.]", path))
@@ -68,5 +81,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
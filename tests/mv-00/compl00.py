@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -71,5 +84,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
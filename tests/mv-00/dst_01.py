@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -37,32 +50,32 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'|'.5]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'|'.5.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'|'.5.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.5]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'|'.5.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.5]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.'|'.5]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .'|'.5.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.5.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'|'.5]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.5.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'|'.5]", lpath))
         return False
     if not ((pval := val.get("f", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <f> [.'|'.5]", path))
         return False
-    lpath = (path + [ "f" ]) if path is not None else None
+    lpath = (path, "f") if path is not None else None
     # .'|'.5.f
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.5.f]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <f> [.'|'.5]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.5.f]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <f> [.'|'.5]", lpath))
         return False
     return True
 
@@ -81,32 +94,32 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'|'.4]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'|'.4.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'|'.4.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.4]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'|'.4.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.4]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.'|'.4]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .'|'.4.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.4.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'|'.4]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.4.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'|'.4]", lpath))
         return False
     if not ((pval := val.get("e", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <e> [.'|'.4]", path))
         return False
-    lpath = (path + [ "e" ]) if path is not None else None
+    lpath = (path, "e") if path is not None else None
     # .'|'.4.e
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.4.e]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <e> [.'|'.4]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.4.e]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <e> [.'|'.4]", lpath))
         return False
     return True
 
@@ -125,32 +138,32 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'|'.3]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'|'.3.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'|'.3.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'|'.3.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.3]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.'|'.3]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .'|'.3.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.3.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.3.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'|'.3]", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.'|'.3]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .'|'.3.d
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.3.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.3.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.3]", lpath))
         return False
     return True
 
@@ -169,32 +182,32 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'|'.2]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'|'.2.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'|'.2.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'|'.2.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.2]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.'|'.2]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .'|'.2.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.2.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.2.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'|'.2]", lpath))
         return False
     if not ((pval := val.get("f", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <f> [.'|'.2]", path))
         return False
-    lpath = (path + [ "f" ]) if path is not None else None
+    lpath = (path, "f") if path is not None else None
     # .'|'.2.f
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.2.f]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <f> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.2.f]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <f> [.'|'.2]", lpath))
         return False
     return True
 
@@ -213,32 +226,32 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'|'.1]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'|'.1.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'|'.1.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'|'.1.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.1]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.'|'.1]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .'|'.1.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.1.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.1.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'|'.1]", lpath))
         return False
     if not ((pval := val.get("e", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <e> [.'|'.1]", path))
         return False
-    lpath = (path + [ "e" ]) if path is not None else None
+    lpath = (path, "e") if path is not None else None
     # .'|'.1.e
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.1.e]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <e> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.1.e]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <e> [.'|'.1]", lpath))
         return False
     return True
 
@@ -257,32 +270,32 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'|'.0]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'|'.0.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'|'.0.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'|'.0.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.0]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.'|'.0]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .'|'.0.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.0.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.0.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'|'.0]", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.'|'.0]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .'|'.0.d
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.0.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.0.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.0]", lpath))
         return False
     return True
 
@@ -368,5 +381,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
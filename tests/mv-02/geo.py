@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: dict[str, str]
 _jm_map_1: dict[str, str]
@@ -31,11 +44,11 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$position'.'@'.0
             res = isinstance(arr_0_item, (int, float)) and not isinstance(arr_0_item, bool)
             if not res:
-                rep is None or rep.append(("not a -1.0 loose float [.'$position'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("not a -1.0 loose float [.'$position'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -53,11 +66,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$coord_array'.'@'.0
-            res = json_model_2(arr_1_item, arr_1_lpath if path is not None else None, rep)
+            res = json_model_2(arr_1_item, arr_1_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $position [.'$coord_array'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $position [.'$coord_array'.'@'.0]", arr_1_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -75,11 +88,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$linear_ring'.'@'.0
-            res = json_model_2(arr_2_item, arr_2_lpath if path is not None else None, rep)
+            res = json_model_2(arr_2_item, arr_2_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $position [.'$linear_ring'.'@'.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $position [.'$linear_ring'.'@'.0]", arr_2_lpath))
                 break
     if res:
         ival_2: int = len(val)
@@ -99,25 +112,25 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Point'.type
             res = isinstance(pval, str) and pval == "Point"
             if not res:
-                rep is None or rep.append(("unexpected Point [.'$Point'.type]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Point'.type]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected Point [.'$Point'.type]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Point'.type]", lpath_0))
                 return False
             continue
         elif prop == "coordinates":
             # handle must coordinates property
             must_count += 1
             # .'$Point'.coordinates
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $position [.'$Point'.coordinates]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Point'.coordinates]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $position [.'$Point'.coordinates]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Point'.coordinates]", lpath_0))
                 return False
             continue
         if prop == "bbox":
@@ -126,18 +139,18 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_3_idx, arr_3_item in enumerate(pval):
-                    arr_3_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_3_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                    arr_3_lpath: Path = (lpath_0, arr_3_idx) if lpath_0 is not None else None
                     # .'$Point'.bbox.0
                     res = isinstance(arr_3_item, (int, float)) and not isinstance(arr_3_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a -1.0 loose float [.'$Point'.bbox.0]", arr_3_lpath if (lpath_0 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a -1.0 loose float [.'$Point'.bbox.0]", arr_3_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Point'.bbox]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Point'.bbox]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Point'.bbox]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Point'.bbox]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Point']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Point']", lpath_0))
         return False
     if must_count != 2:
         if rep is not None:
@@ -157,15 +170,15 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$MultiPoint'.type
             res = isinstance(pval, str) and pval == "MultiPoint"
             if not res:
-                rep is None or rep.append(("unexpected MultiPoint [.'$MultiPoint'.type]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$MultiPoint'.type]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected MultiPoint [.'$MultiPoint'.type]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$MultiPoint'.type]", lpath_1))
                 return False
             continue
         elif prop == "coordinates":
@@ -175,15 +188,15 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_4_idx, arr_4_item in enumerate(pval):
-                    arr_4_lpath: Path = ((lpath_1 if path is not None else None) + [ arr_4_idx ]) if (lpath_1 if path is not None else None) is not None else None
+                    arr_4_lpath: Path = (lpath_1, arr_4_idx) if lpath_1 is not None else None
                     # .'$MultiPoint'.coordinates.0
-                    res = json_model_2(arr_4_item, arr_4_lpath if (lpath_1 if path is not None else None) is not None else None, rep)
+                    res = json_model_2(arr_4_item, arr_4_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $position [.'$MultiPoint'.coordinates.0]", arr_4_lpath if (lpath_1 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $position [.'$MultiPoint'.coordinates.0]", arr_4_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$MultiPoint'.coordinates]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$MultiPoint'.coordinates]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$MultiPoint'.coordinates]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$MultiPoint'.coordinates]", lpath_1))
                 return False
             continue
         if prop == "bbox":
@@ -192,18 +205,18 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_5_idx, arr_5_item in enumerate(pval):
-                    arr_5_lpath: Path = ((lpath_1 if path is not None else None) + [ arr_5_idx ]) if (lpath_1 if path is not None else None) is not None else None
+                    arr_5_lpath: Path = (lpath_1, arr_5_idx) if lpath_1 is not None else None
                     # .'$MultiPoint'.bbox.0
                     res = isinstance(arr_5_item, (int, float)) and not isinstance(arr_5_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a -1.0 loose float [.'$MultiPoint'.bbox.0]", arr_5_lpath if (lpath_1 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a -1.0 loose float [.'$MultiPoint'.bbox.0]", arr_5_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$MultiPoint'.bbox]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MultiPoint'.bbox]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$MultiPoint'.bbox]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$MultiPoint'.bbox]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$MultiPoint']", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$MultiPoint']", lpath_1))
         return False
     if must_count != 2:
         if rep is not None:
@@ -223,25 +236,25 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$LineString'.type
             res = isinstance(pval, str) and pval == "LineString"
             if not res:
-                rep is None or rep.append(("unexpected LineString [.'$LineString'.type]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$LineString'.type]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected LineString [.'$LineString'.type]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$LineString'.type]", lpath_2))
                 return False
             continue
         elif prop == "coordinates":
             # handle must coordinates property
             must_count += 1
             # .'$LineString'.coordinates
-            res = json_model_3(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $coord_array [.'$LineString'.coordinates]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$LineString'.coordinates]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $coord_array [.'$LineString'.coordinates]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$LineString'.coordinates]", lpath_2))
                 return False
             continue
         if prop == "bbox":
@@ -250,18 +263,18 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_6_idx, arr_6_item in enumerate(pval):
-                    arr_6_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_6_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_6_lpath: Path = (lpath_2, arr_6_idx) if lpath_2 is not None else None
                     # .'$LineString'.bbox.0
                     res = isinstance(arr_6_item, (int, float)) and not isinstance(arr_6_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a -1.0 loose float [.'$LineString'.bbox.0]", arr_6_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a -1.0 loose float [.'$LineString'.bbox.0]", arr_6_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$LineString'.bbox]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$LineString'.bbox]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$LineString'.bbox]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$LineString'.bbox]", lpath_2))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$LineString']", lpath_2 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$LineString']", lpath_2))
         return False
     if must_count != 2:
         if rep is not None:
@@ -281,15 +294,15 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$MultiLineString'.type
             res = isinstance(pval, str) and pval == "MultiLineString"
             if not res:
-                rep is None or rep.append(("unexpected MultiLineString [.'$MultiLineString'.type]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$MultiLineString'.type]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected MultiLineString [.'$MultiLineString'.type]", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$MultiLineString'.type]", lpath_3))
                 return False
             continue
         elif prop == "coordinates":
@@ -299,15 +312,15 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_7_idx, arr_7_item in enumerate(pval):
-                    arr_7_lpath: Path = ((lpath_3 if path is not None else None) + [ arr_7_idx ]) if (lpath_3 if path is not None else None) is not None else None
+                    arr_7_lpath: Path = (lpath_3, arr_7_idx) if lpath_3 is not None else None
                     # .'$MultiLineString'.coordinates.0
-                    res = json_model_3(arr_7_item, arr_7_lpath if (lpath_3 if path is not None else None) is not None else None, rep)
+                    res = json_model_3(arr_7_item, arr_7_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $coord_array [.'$MultiLineString'.coordinates.0]", arr_7_lpath if (lpath_3 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $coord_array [.'$MultiLineString'.coordinates.0]", arr_7_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$MultiLineString'.coordinates]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$MultiLineString'.coordinates]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$MultiLineString'.coordinates]", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$MultiLineString'.coordinates]", lpath_3))
                 return False
             continue
         if prop == "bbox":
@@ -316,18 +329,18 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_8_idx, arr_8_item in enumerate(pval):
-                    arr_8_lpath: Path = ((lpath_3 if path is not None else None) + [ arr_8_idx ]) if (lpath_3 if path is not None else None) is not None else None
+                    arr_8_lpath: Path = (lpath_3, arr_8_idx) if lpath_3 is not None else None
                     # .'$MultiLineString'.bbox.0
                     res = isinstance(arr_8_item, (int, float)) and not isinstance(arr_8_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a -1.0 loose float [.'$MultiLineString'.bbox.0]", arr_8_lpath if (lpath_3 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a -1.0 loose float [.'$MultiLineString'.bbox.0]", arr_8_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$MultiLineString'.bbox]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MultiLineString'.bbox]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$MultiLineString'.bbox]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$MultiLineString'.bbox]", lpath_3))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$MultiLineString']", lpath_3 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$MultiLineString']", lpath_3))
         return False
     if must_count != 2:
         if rep is not None:
@@ -347,15 +360,15 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Polygon'.type
             res = isinstance(pval, str) and pval == "Polygon"
             if not res:
-                rep is None or rep.append(("unexpected Polygon [.'$Polygon'.type]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Polygon'.type]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected Polygon [.'$Polygon'.type]", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Polygon'.type]", lpath_4))
                 return False
             continue
         elif prop == "coordinates":
@@ -365,15 +378,15 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_9_idx, arr_9_item in enumerate(pval):
-                    arr_9_lpath: Path = ((lpath_4 if path is not None else None) + [ arr_9_idx ]) if (lpath_4 if path is not None else None) is not None else None
+                    arr_9_lpath: Path = (lpath_4, arr_9_idx) if lpath_4 is not None else None
                     # .'$Polygon'.coordinates.0
-                    res = json_model_4(arr_9_item, arr_9_lpath if (lpath_4 if path is not None else None) is not None else None, rep)
+                    res = json_model_4(arr_9_item, arr_9_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $linear_ring [.'$Polygon'.coordinates.0]", arr_9_lpath if (lpath_4 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $linear_ring [.'$Polygon'.coordinates.0]", arr_9_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Polygon'.coordinates]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Polygon'.coordinates]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Polygon'.coordinates]", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Polygon'.coordinates]", lpath_4))
                 return False
             continue
         if prop == "bbox":
@@ -382,18 +395,18 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_10_idx, arr_10_item in enumerate(pval):
-                    arr_10_lpath: Path = ((lpath_4 if path is not None else None) + [ arr_10_idx ]) if (lpath_4 if path is not None else None) is not None else None
+                    arr_10_lpath: Path = (lpath_4, arr_10_idx) if lpath_4 is not None else None
                     # .'$Polygon'.bbox.0
                     res = isinstance(arr_10_item, (int, float)) and not isinstance(arr_10_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a -1.0 loose float [.'$Polygon'.bbox.0]", arr_10_lpath if (lpath_4 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a -1.0 loose float [.'$Polygon'.bbox.0]", arr_10_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Polygon'.bbox]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Polygon'.bbox]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Polygon'.bbox]", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Polygon'.bbox]", lpath_4))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Polygon']", lpath_4 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Polygon']", lpath_4))
         return False
     if must_count != 2:
         if rep is not None:
@@ -413,15 +426,15 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$MultiPolygon'.type
             res = isinstance(pval, str) and pval == "MultiPolygon"
             if not res:
-                rep is None or rep.append(("unexpected MultiPolygon [.'$MultiPolygon'.type]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$MultiPolygon'.type]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected MultiPolygon [.'$MultiPolygon'.type]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$MultiPolygon'.type]", lpath_5))
                 return False
             continue
         elif prop == "coordinates":
@@ -431,23 +444,23 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_11_idx, arr_11_item in enumerate(pval):
-                    arr_11_lpath: Path = ((lpath_5 if path is not None else None) + [ arr_11_idx ]) if (lpath_5 if path is not None else None) is not None else None
+                    arr_11_lpath: Path = (lpath_5, arr_11_idx) if lpath_5 is not None else None
                     # .'$MultiPolygon'.coordinates.0
                     res = isinstance(arr_11_item, list)
                     if res:
                         for arr_12_idx, arr_12_item in enumerate(arr_11_item):
-                            arr_12_lpath: Path = ((arr_11_lpath if (lpath_5 if path is not None else None) is not None else None) + [ arr_12_idx ]) if (arr_11_lpath if (lpath_5 if path is not None else None) is not None else None) is not None else None
+                            arr_12_lpath: Path = (arr_11_lpath, arr_12_idx) if arr_11_lpath is not None else None
                             # .'$MultiPolygon'.coordinates.0.0
-                            res = json_model_4(arr_12_item, arr_12_lpath if (arr_11_lpath if (lpath_5 if path is not None else None) is not None else None) is not None else None, rep)
+                            res = json_model_4(arr_12_item, arr_12_lpath, rep)
                             if not res:
-                                rep is None or rep.append(("unexpected $linear_ring [.'$MultiPolygon'.coordinates.0.0]", arr_12_lpath if (arr_11_lpath if (lpath_5 if path is not None else None) is not None else None) is not None else None))
+                                rep is None or rep.append(("unexpected $linear_ring [.'$MultiPolygon'.coordinates.0.0]", arr_12_lpath))
                                 break
                     if not res:
-                        rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.coordinates.0]", arr_11_lpath if (lpath_5 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.coordinates.0]", arr_11_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.coordinates]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$MultiPolygon'.coordinates]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.coordinates]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$MultiPolygon'.coordinates]", lpath_5))
                 return False
             continue
         if prop == "bbox":
@@ -456,18 +469,18 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_13_idx, arr_13_item in enumerate(pval):
-                    arr_13_lpath: Path = ((lpath_5 if path is not None else None) + [ arr_13_idx ]) if (lpath_5 if path is not None else None) is not None else None
+                    arr_13_lpath: Path = (lpath_5, arr_13_idx) if lpath_5 is not None else None
                     # .'$MultiPolygon'.bbox.0
                     res = isinstance(arr_13_item, (int, float)) and not isinstance(arr_13_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a -1.0 loose float [.'$MultiPolygon'.bbox.0]", arr_13_lpath if (lpath_5 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a -1.0 loose float [.'$MultiPolygon'.bbox.0]", arr_13_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.bbox]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MultiPolygon'.bbox]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.bbox]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$MultiPolygon'.bbox]", lpath_5))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$MultiPolygon']", lpath_5 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$MultiPolygon']", lpath_5))
         return False
     if must_count != 2:
         if rep is not None:
@@ -490,38 +503,38 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$geometry'.'|'.0]", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$geometry'.'|'.0.type
     res = isinstance(pval, str) and pval == "Point"
     if not res:
-        rep is None or rep.append(("unexpected Point [.'$geometry'.'|'.0.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected Point [.'$geometry'.'|'.0.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.0]", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$geometry'.'|'.0]", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$geometry'.'|'.0.coordinates
-    res = json_model_2(pval, lpath if path is not None else None, rep)
+    res = json_model_2(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $position [.'$geometry'.'|'.0.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $position [.'$geometry'.'|'.0.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.0]", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$geometry'.'|'.0.bbox
         res = isinstance(pval, list)
         if res:
             for arr_14_idx, arr_14_item in enumerate(pval):
-                arr_14_lpath: Path = ((lpath if path is not None else None) + [ arr_14_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_14_lpath: Path = (lpath, arr_14_idx) if lpath is not None else None
                 # .'$geometry'.'|'.0.bbox.0
                 res = isinstance(arr_14_item, (int, float)) and not isinstance(arr_14_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.0.bbox.0]", arr_14_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.0.bbox.0]", arr_14_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.0.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.0]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.0.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.0]", lpath))
             return False
     return True
 
@@ -537,46 +550,46 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$geometry'.'|'.1]", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$geometry'.'|'.1.type
     res = isinstance(pval, str) and pval == "MultiPoint"
     if not res:
-        rep is None or rep.append(("unexpected MultiPoint [.'$geometry'.'|'.1.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected MultiPoint [.'$geometry'.'|'.1.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.1]", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$geometry'.'|'.1]", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$geometry'.'|'.1.coordinates
     res = isinstance(pval, list)
     if res:
         for arr_15_idx, arr_15_item in enumerate(pval):
-            arr_15_lpath: Path = ((lpath if path is not None else None) + [ arr_15_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_15_lpath: Path = (lpath, arr_15_idx) if lpath is not None else None
             # .'$geometry'.'|'.1.coordinates.0
-            res = json_model_2(arr_15_item, arr_15_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_2(arr_15_item, arr_15_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $position [.'$geometry'.'|'.1.coordinates.0]", arr_15_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $position [.'$geometry'.'|'.1.coordinates.0]", arr_15_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.1.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.1.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.1]", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$geometry'.'|'.1.bbox
         res = isinstance(pval, list)
         if res:
             for arr_16_idx, arr_16_item in enumerate(pval):
-                arr_16_lpath: Path = ((lpath if path is not None else None) + [ arr_16_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_16_lpath: Path = (lpath, arr_16_idx) if lpath is not None else None
                 # .'$geometry'.'|'.1.bbox.0
                 res = isinstance(arr_16_item, (int, float)) and not isinstance(arr_16_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.1.bbox.0]", arr_16_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.1.bbox.0]", arr_16_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.1.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.1]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.1.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.1]", lpath))
             return False
     return True
 
@@ -592,38 +605,38 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$geometry'.'|'.2]", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$geometry'.'|'.2.type
     res = isinstance(pval, str) and pval == "LineString"
     if not res:
-        rep is None or rep.append(("unexpected LineString [.'$geometry'.'|'.2.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected LineString [.'$geometry'.'|'.2.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.2]", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$geometry'.'|'.2]", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$geometry'.'|'.2.coordinates
-    res = json_model_3(pval, lpath if path is not None else None, rep)
+    res = json_model_3(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $coord_array [.'$geometry'.'|'.2.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $coord_array [.'$geometry'.'|'.2.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.2]", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$geometry'.'|'.2.bbox
         res = isinstance(pval, list)
         if res:
             for arr_17_idx, arr_17_item in enumerate(pval):
-                arr_17_lpath: Path = ((lpath if path is not None else None) + [ arr_17_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_17_lpath: Path = (lpath, arr_17_idx) if lpath is not None else None
                 # .'$geometry'.'|'.2.bbox.0
                 res = isinstance(arr_17_item, (int, float)) and not isinstance(arr_17_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.2.bbox.0]", arr_17_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.2.bbox.0]", arr_17_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.2.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.2]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.2.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.2]", lpath))
             return False
     return True
 
@@ -639,46 +652,46 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$geometry'.'|'.3]", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$geometry'.'|'.3.type
     res = isinstance(pval, str) and pval == "MultiLineString"
     if not res:
-        rep is None or rep.append(("unexpected MultiLineString [.'$geometry'.'|'.3.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected MultiLineString [.'$geometry'.'|'.3.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.3]", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$geometry'.'|'.3]", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$geometry'.'|'.3.coordinates
     res = isinstance(pval, list)
     if res:
         for arr_18_idx, arr_18_item in enumerate(pval):
-            arr_18_lpath: Path = ((lpath if path is not None else None) + [ arr_18_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_18_lpath: Path = (lpath, arr_18_idx) if lpath is not None else None
             # .'$geometry'.'|'.3.coordinates.0
-            res = json_model_3(arr_18_item, arr_18_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_3(arr_18_item, arr_18_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $coord_array [.'$geometry'.'|'.3.coordinates.0]", arr_18_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $coord_array [.'$geometry'.'|'.3.coordinates.0]", arr_18_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.3.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.3.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.3]", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$geometry'.'|'.3.bbox
         res = isinstance(pval, list)
         if res:
             for arr_19_idx, arr_19_item in enumerate(pval):
-                arr_19_lpath: Path = ((lpath if path is not None else None) + [ arr_19_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_19_lpath: Path = (lpath, arr_19_idx) if lpath is not None else None
                 # .'$geometry'.'|'.3.bbox.0
                 res = isinstance(arr_19_item, (int, float)) and not isinstance(arr_19_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.3.bbox.0]", arr_19_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.3.bbox.0]", arr_19_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.3.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.3]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.3.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.3]", lpath))
             return False
     return True
 
@@ -694,46 +707,46 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$geometry'.'|'.4]", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$geometry'.'|'.4.type
     res = isinstance(pval, str) and pval == "Polygon"
     if not res:
-        rep is None or rep.append(("unexpected Polygon [.'$geometry'.'|'.4.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.4]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected Polygon [.'$geometry'.'|'.4.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.4]", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$geometry'.'|'.4]", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$geometry'.'|'.4.coordinates
     res = isinstance(pval, list)
     if res:
         for arr_20_idx, arr_20_item in enumerate(pval):
-            arr_20_lpath: Path = ((lpath if path is not None else None) + [ arr_20_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_20_lpath: Path = (lpath, arr_20_idx) if lpath is not None else None
             # .'$geometry'.'|'.4.coordinates.0
-            res = json_model_4(arr_20_item, arr_20_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_4(arr_20_item, arr_20_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $linear_ring [.'$geometry'.'|'.4.coordinates.0]", arr_20_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $linear_ring [.'$geometry'.'|'.4.coordinates.0]", arr_20_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.4.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.4]", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.4.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.4]", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$geometry'.'|'.4.bbox
         res = isinstance(pval, list)
         if res:
             for arr_21_idx, arr_21_item in enumerate(pval):
-                arr_21_lpath: Path = ((lpath if path is not None else None) + [ arr_21_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_21_lpath: Path = (lpath, arr_21_idx) if lpath is not None else None
                 # .'$geometry'.'|'.4.bbox.0
                 res = isinstance(arr_21_item, (int, float)) and not isinstance(arr_21_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.4.bbox.0]", arr_21_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.4.bbox.0]", arr_21_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.4.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.4]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.4.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.4]", lpath))
             return False
     return True
 
@@ -749,54 +762,54 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$geometry'.'|'.5]", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$geometry'.'|'.5.type
     res = isinstance(pval, str) and pval == "MultiPolygon"
     if not res:
-        rep is None or rep.append(("unexpected MultiPolygon [.'$geometry'.'|'.5.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.5]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected MultiPolygon [.'$geometry'.'|'.5.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$geometry'.'|'.5]", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$geometry'.'|'.5]", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$geometry'.'|'.5.coordinates
     res = isinstance(pval, list)
     if res:
         for arr_22_idx, arr_22_item in enumerate(pval):
-            arr_22_lpath: Path = ((lpath if path is not None else None) + [ arr_22_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_22_lpath: Path = (lpath, arr_22_idx) if lpath is not None else None
             # .'$geometry'.'|'.5.coordinates.0
             res = isinstance(arr_22_item, list)
             if res:
                 for arr_23_idx, arr_23_item in enumerate(arr_22_item):
-                    arr_23_lpath: Path = ((arr_22_lpath if (lpath if path is not None else None) is not None else None) + [ arr_23_idx ]) if (arr_22_lpath if (lpath if path is not None else None) is not None else None) is not None else None
+                    arr_23_lpath: Path = (arr_22_lpath, arr_23_idx) if arr_22_lpath is not None else None
                     # .'$geometry'.'|'.5.coordinates.0.0
-                    res = json_model_4(arr_23_item, arr_23_lpath if (arr_22_lpath if (lpath if path is not None else None) is not None else None) is not None else None, rep)
+                    res = json_model_4(arr_23_item, arr_23_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $linear_ring [.'$geometry'.'|'.5.coordinates.0.0]", arr_23_lpath if (arr_22_lpath if (lpath if path is not None else None) is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $linear_ring [.'$geometry'.'|'.5.coordinates.0.0]", arr_23_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.5.coordinates.0]", arr_22_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.5.coordinates.0]", arr_22_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.5.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.5]", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.5.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$geometry'.'|'.5]", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$geometry'.'|'.5.bbox
         res = isinstance(pval, list)
         if res:
             for arr_24_idx, arr_24_item in enumerate(pval):
-                arr_24_lpath: Path = ((lpath if path is not None else None) + [ arr_24_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_24_lpath: Path = (lpath, arr_24_idx) if lpath is not None else None
                 # .'$geometry'.'|'.5.bbox.0
                 res = isinstance(arr_24_item, (int, float)) and not isinstance(arr_24_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.5.bbox.0]", arr_24_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$geometry'.'|'.5.bbox.0]", arr_24_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.5.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.5]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$geometry'.'|'.5.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$geometry'.'|'.5]", lpath))
             return False
     return True
 
@@ -836,46 +849,46 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$GeometryCollection']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$GeometryCollection'.type
     res = isinstance(pval, str) and pval == "GeometryCollection"
     if not res:
-        rep is None or rep.append(("unexpected GeometryCollection [.'$GeometryCollection'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$GeometryCollection']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected GeometryCollection [.'$GeometryCollection'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$GeometryCollection']", lpath))
         return False
     if not ((pval := val.get("geometries", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <geometries> [.'$GeometryCollection']", path))
         return False
-    lpath = (path + [ "geometries" ]) if path is not None else None
+    lpath = (path, "geometries") if path is not None else None
     # .'$GeometryCollection'.geometries
     res = isinstance(pval, list)
     if res:
         for arr_25_idx, arr_25_item in enumerate(pval):
-            arr_25_lpath: Path = ((lpath if path is not None else None) + [ arr_25_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_25_lpath: Path = (lpath, arr_25_idx) if lpath is not None else None
             # .'$GeometryCollection'.geometries.0
-            res = json_model_11(arr_25_item, arr_25_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_11(arr_25_item, arr_25_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $geometry [.'$GeometryCollection'.geometries.0]", arr_25_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $geometry [.'$GeometryCollection'.geometries.0]", arr_25_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$GeometryCollection'.geometries]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <geometries> [.'$GeometryCollection']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$GeometryCollection'.geometries]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <geometries> [.'$GeometryCollection']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$GeometryCollection'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_26_idx, arr_26_item in enumerate(pval):
-                arr_26_lpath: Path = ((lpath if path is not None else None) + [ arr_26_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_26_lpath: Path = (lpath, arr_26_idx) if lpath is not None else None
                 # .'$GeometryCollection'.bbox.0
                 res = isinstance(arr_26_item, (int, float)) and not isinstance(arr_26_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$GeometryCollection'.bbox.0]", arr_26_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$GeometryCollection'.bbox.0]", arr_26_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$GeometryCollection'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$GeometryCollection']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$GeometryCollection'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$GeometryCollection']", lpath))
             return False
     return True
 
@@ -900,87 +913,87 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$Feature']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$Feature'.type
     res = isinstance(pval, str) and pval == "Feature"
     if not res:
-        rep is None or rep.append(("unexpected Feature [.'$Feature'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Feature']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected Feature [.'$Feature'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Feature']", lpath))
         return False
     if not ((pval := val.get("geometry", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <geometry> [.'$Feature']", path))
         return False
-    lpath = (path + [ "geometry" ]) if path is not None else None
+    lpath = (path, "geometry") if path is not None else None
     # .'$Feature'.geometry
     # .'$Feature'.geometry.'|'.0
     res = pval is None
     if not res:
-        rep is None or rep.append(("not null [.'$Feature'.geometry.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not null [.'$Feature'.geometry.'|'.0]", lpath))
         # .'$Feature'.geometry.'|'.1
-        res = json_model_11(pval, lpath if path is not None else None, rep)
+        res = json_model_11(pval, lpath, rep)
         if not res:
-            rep is None or rep.append(("unexpected $geometry [.'$Feature'.geometry.'|'.1]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected $geometry [.'$Feature'.geometry.'|'.1]", lpath))
             # .'$Feature'.geometry.'|'.2
-            res = json_model_12(pval, lpath if path is not None else None, rep)
+            res = json_model_12(pval, lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $GeometryCollection [.'$Feature'.geometry.'|'.2]", lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $GeometryCollection [.'$Feature'.geometry.'|'.2]", lpath))
     if res:
         rep is None or rep.clear()
     else:
-        rep is None or rep.append(("no model matched [.'$Feature'.geometry.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <geometry> [.'$Feature']", lpath if path is not None else None))
+        rep is None or rep.append(("no model matched [.'$Feature'.geometry.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <geometry> [.'$Feature']", lpath))
         return False
     if not ((pval := val.get("properties", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <properties> [.'$Feature']", path))
         return False
-    lpath = (path + [ "properties" ]) if path is not None else None
+    lpath = (path, "properties") if path is not None else None
     # .'$Feature'.properties
     # .'$Feature'.properties.'|'.0
     res = pval is None
     if not res:
-        rep is None or rep.append(("not null [.'$Feature'.properties.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not null [.'$Feature'.properties.'|'.0]", lpath))
         # .'$Feature'.properties.'|'.1
-        res = _jm_obj_6(pval, lpath if path is not None else None, rep)
+        res = _jm_obj_6(pval, lpath, rep)
         if not res:
-            rep is None or rep.append(("unexpected element [.'$Feature'.properties.'|'.1]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected element [.'$Feature'.properties.'|'.1]", lpath))
     if res:
         rep is None or rep.clear()
     else:
-        rep is None or rep.append(("no model matched [.'$Feature'.properties.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <properties> [.'$Feature']", lpath if path is not None else None))
+        rep is None or rep.append(("no model matched [.'$Feature'.properties.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <properties> [.'$Feature']", lpath))
         return False
     if (pval := val.get("id", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "id" ]) if path is not None else None
+        lpath = (path, "id") if path is not None else None
         # .'$Feature'.id
         # .'$Feature'.id.'|'.0
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$Feature'.id.'|'.0]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$Feature'.id.'|'.0]", lpath))
             # .'$Feature'.id.'|'.1
             res = isinstance(pval, (int, float)) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1.0 loose float [.'$Feature'.id.'|'.1]", lpath if path is not None else None))
+                rep is None or rep.append(("not a -1.0 loose float [.'$Feature'.id.'|'.1]", lpath))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Feature'.id.'|']", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <id> [.'$Feature']", lpath if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Feature'.id.'|']", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <id> [.'$Feature']", lpath))
             return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$Feature'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_27_idx, arr_27_item in enumerate(pval):
-                arr_27_lpath: Path = ((lpath if path is not None else None) + [ arr_27_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_27_lpath: Path = (lpath, arr_27_idx) if lpath is not None else None
                 # .'$Feature'.bbox.0
                 res = isinstance(arr_27_item, (int, float)) and not isinstance(arr_27_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$Feature'.bbox.0]", arr_27_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$Feature'.bbox.0]", arr_27_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$Feature'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$Feature']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$Feature'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$Feature']", lpath))
             return False
     return True
 
@@ -997,46 +1010,46 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$FeatureCollection']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$FeatureCollection'.type
     res = isinstance(pval, str) and pval == "FeatureCollection"
     if not res:
-        rep is None or rep.append(("unexpected FeatureCollection [.'$FeatureCollection'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$FeatureCollection']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected FeatureCollection [.'$FeatureCollection'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$FeatureCollection']", lpath))
         return False
     if not ((pval := val.get("features", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <features> [.'$FeatureCollection']", path))
         return False
-    lpath = (path + [ "features" ]) if path is not None else None
+    lpath = (path, "features") if path is not None else None
     # .'$FeatureCollection'.features
     res = isinstance(pval, list)
     if res:
         for arr_28_idx, arr_28_item in enumerate(pval):
-            arr_28_lpath: Path = ((lpath if path is not None else None) + [ arr_28_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_28_lpath: Path = (lpath, arr_28_idx) if lpath is not None else None
             # .'$FeatureCollection'.features.0
-            res = json_model_13(arr_28_item, arr_28_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_13(arr_28_item, arr_28_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Feature [.'$FeatureCollection'.features.0]", arr_28_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $Feature [.'$FeatureCollection'.features.0]", arr_28_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$FeatureCollection'.features]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <features> [.'$FeatureCollection']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$FeatureCollection'.features]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <features> [.'$FeatureCollection']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$FeatureCollection'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_29_idx, arr_29_item in enumerate(pval):
-                arr_29_lpath: Path = ((lpath if path is not None else None) + [ arr_29_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_29_lpath: Path = (lpath, arr_29_idx) if lpath is not None else None
                 # .'$FeatureCollection'.bbox.0
                 res = isinstance(arr_29_item, (int, float)) and not isinstance(arr_29_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$FeatureCollection'.bbox.0]", arr_29_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$FeatureCollection'.bbox.0]", arr_29_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$FeatureCollection'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$FeatureCollection']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$FeatureCollection'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$FeatureCollection']", lpath))
             return False
     return True
 
@@ -1114,5 +1127,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
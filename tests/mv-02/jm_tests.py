@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -28,50 +41,50 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .0
             # .0.'|'.0
             res = isinstance(arr_0_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.0.'|'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.0.'|'.0]", arr_0_lpath))
                 # .0.'|'.1
                 res = isinstance(arr_0_item, list) and len(arr_0_item) == 2
                 if res:
-                    lpath_1: Path = ((arr_0_lpath if path is not None else None) + [ 0 ]) if (arr_0_lpath if path is not None else None) is not None else None
+                    lpath_1: Path = (arr_0_lpath, 0) if arr_0_lpath is not None else None
                     # .0.'|'.1.0
                     res = isinstance(arr_0_item[0], bool)
                     if res:
-                        lpath_1 = ((arr_0_lpath if path is not None else None) + [ 1 ]) if (arr_0_lpath if path is not None else None) is not None else None
+                        lpath_1 = (arr_0_lpath, 1) if arr_0_lpath is not None else None
                         # .0.'|'.1.1
                         res = True
                     else:
-                        rep is None or rep.append(("not a bool [.0.'|'.1.0]", lpath_1 if (arr_0_lpath if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a bool [.0.'|'.1.0]", lpath_1))
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.0.'|'.1]", arr_0_lpath if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.0.'|'.1]", arr_0_lpath))
                     # .0.'|'.2
                     res = isinstance(arr_0_item, list) and len(arr_0_item) == 3
                     if res:
-                        lpath_0: Path = ((arr_0_lpath if path is not None else None) + [ 0 ]) if (arr_0_lpath if path is not None else None) is not None else None
+                        lpath_0: Path = (arr_0_lpath, 0) if arr_0_lpath is not None else None
                         # .0.'|'.2.0
                         res = isinstance(arr_0_item[0], bool)
                         if res:
-                            lpath_0 = ((arr_0_lpath if path is not None else None) + [ 1 ]) if (arr_0_lpath if path is not None else None) is not None else None
+                            lpath_0 = (arr_0_lpath, 1) if arr_0_lpath is not None else None
                             # .0.'|'.2.1
                             res = isinstance(arr_0_item[1], str)
                             if res:
-                                lpath_0 = ((arr_0_lpath if path is not None else None) + [ 2 ]) if (arr_0_lpath if path is not None else None) is not None else None
+                                lpath_0 = (arr_0_lpath, 2) if arr_0_lpath is not None else None
                                 # .0.'|'.2.2
                                 res = True
                             else:
-                                rep is None or rep.append(("unexpected string [.0.'|'.2.1]", lpath_0 if (arr_0_lpath if path is not None else None) is not None else None))
+                                rep is None or rep.append(("unexpected string [.0.'|'.2.1]", lpath_0))
                         else:
-                            rep is None or rep.append(("not a bool [.0.'|'.2.0]", lpath_0 if (arr_0_lpath if path is not None else None) is not None else None))
+                            rep is None or rep.append(("not a bool [.0.'|'.2.0]", lpath_0))
                     if not res:
-                        rep is None or rep.append(("not array or unexpected array [.0.'|'.2]", arr_0_lpath if path is not None else None))
+                        rep is None or rep.append(("not array or unexpected array [.0.'|'.2]", arr_0_lpath))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.0.'|']", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("no model matched [.0.'|']", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.]", path))
@@ -99,5 +112,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
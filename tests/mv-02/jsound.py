@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: dict[str, str]
 _jm_cst_0: set[str]
@@ -33,14 +46,14 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "date":
             # handle may date property
             # .'$Schema'.metadata.date
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Schema'.metadata.date]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata.date]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Schema'.metadata.date]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata.date]", lpath_1))
                 return False
             continue
         elif prop == "name":
@@ -48,8 +61,8 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Schema'.metadata.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Schema'.metadata.name]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata.name]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Schema'.metadata.name]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata.name]", lpath_1))
                 return False
             continue
         elif prop == "authors":
@@ -58,15 +71,15 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_1_idx, arr_1_item in enumerate(pval):
-                    arr_1_lpath: Path = ((lpath_1 if path is not None else None) + [ arr_1_idx ]) if (lpath_1 if path is not None else None) is not None else None
+                    arr_1_lpath: Path = (lpath_1, arr_1_idx) if lpath_1 is not None else None
                     # .'$Schema'.metadata.authors.0
                     res = isinstance(arr_1_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$Schema'.metadata.authors.0]", arr_1_lpath if (lpath_1 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$Schema'.metadata.authors.0]", arr_1_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Schema'.metadata.authors]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata.authors]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Schema'.metadata.authors]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata.authors]", lpath_1))
                 return False
             continue
         elif prop == "previous":
@@ -74,11 +87,11 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Schema'.metadata.previous
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Schema'.metadata.previous]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata.previous]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Schema'.metadata.previous]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata.previous]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Schema'.metadata]", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Schema'.metadata]", lpath_1))
         return False
     return True
 
@@ -91,7 +104,7 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "types":
             # handle must types property
             must_count += 1
@@ -99,27 +112,27 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_0_idx, arr_0_item in enumerate(pval):
-                    arr_0_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_0_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                    arr_0_lpath: Path = (lpath_0, arr_0_idx) if lpath_0 is not None else None
                     # .'$Schema'.types.0
-                    res = json_model_3(arr_0_item, arr_0_lpath if (lpath_0 if path is not None else None) is not None else None, rep)
+                    res = json_model_3(arr_0_item, arr_0_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $Type [.'$Schema'.types.0]", arr_0_lpath if (lpath_0 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $Type [.'$Schema'.types.0]", arr_0_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Schema'.types]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Schema'.types]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Schema'.types]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Schema'.types]", lpath_0))
                 return False
             continue
         if prop == "metadata":
             # handle may metadata property
             # .'$Schema'.metadata
-            res = _jm_obj_0(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Schema'.metadata]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Schema'.metadata]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Schema'.metadata]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Schema']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Schema']", lpath_0))
         return False
     if must_count != 1:
         if rep is not None:
@@ -195,11 +208,11 @@ def _jm_f_0(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$Atomic'.enumeration.0
-            res = json_model_5(arr_2_item, arr_2_lpath if path is not None else None, rep)
+            res = json_model_5(arr_2_item, arr_2_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $atomic [.'$Atomic'.enumeration.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $atomic [.'$Atomic'.enumeration.0]", arr_2_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Atomic'.enumeration]", path))
@@ -282,34 +295,34 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "kind":
             # handle must kind property
             must_count += 1
             # .'$Atomic'.kind
             res = isinstance(pval, str) and pval == "atomic"
             if not res:
-                rep is None or rep.append(("unexpected atomic [.'$Atomic'.kind]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Atomic'.kind]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected atomic [.'$Atomic'.kind]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Atomic'.kind]", lpath_2))
                 return False
             continue
         elif prop == "baseType":
             # handle must baseType property
             must_count += 1
             # .'$Atomic'.baseType
-            res = json_model_4(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $atomic-types [.'$Atomic'.baseType]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Atomic'.baseType]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $atomic-types [.'$Atomic'.baseType]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Atomic'.baseType]", lpath_2))
                 return False
             continue
         if pfun := json_model_6_map.get(prop):
             # handle 13 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_2 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Atomic']", lpath_2 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_2, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Atomic']", lpath_2))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Atomic']", lpath_2 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Atomic']", lpath_2))
         return False
     if must_count != 2:
         if rep is not None:
@@ -329,15 +342,15 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "kind":
             # handle must kind property
             must_count += 1
             # .'$Object'.kind
             res = isinstance(pval, str) and pval == "object"
             if not res:
-                rep is None or rep.append(("unexpected object [.'$Object'.kind]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Object'.kind]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected object [.'$Object'.kind]", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Object'.kind]", lpath_3))
                 return False
             continue
         if prop == "name":
@@ -345,8 +358,8 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Object'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Object'.name]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.name]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Object'.name]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.name]", lpath_3))
                 return False
             continue
         elif prop == "closed":
@@ -354,8 +367,8 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Object'.closed
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Object'.closed]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.closed]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Object'.closed]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.closed]", lpath_3))
                 return False
             continue
         elif prop == "content":
@@ -364,15 +377,15 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_3_idx, arr_3_item in enumerate(pval):
-                    arr_3_lpath: Path = ((lpath_3 if path is not None else None) + [ arr_3_idx ]) if (lpath_3 if path is not None else None) is not None else None
+                    arr_3_lpath: Path = (lpath_3, arr_3_idx) if lpath_3 is not None else None
                     # .'$Object'.content.0
-                    res = json_model_8(arr_3_item, arr_3_lpath if (lpath_3 if path is not None else None) is not None else None, rep)
+                    res = json_model_8(arr_3_item, arr_3_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $Fields [.'$Object'.content.0]", arr_3_lpath if (lpath_3 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $Fields [.'$Object'.content.0]", arr_3_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Object'.content]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.content]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Object'.content]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.content]", lpath_3))
                 return False
             continue
         elif prop == "baseType":
@@ -380,11 +393,11 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Object'.baseType
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Object'.baseType]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.baseType]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Object'.baseType]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.baseType]", lpath_3))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Object']", lpath_3 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Object']", lpath_3))
         return False
     if must_count != 1:
         if rep is not None:
@@ -402,25 +415,25 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle must name property
             must_count += 1
             # .'$Fields'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Fields'.name]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Fields'.name]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Fields'.name]", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Fields'.name]", lpath_4))
                 return False
             continue
         elif prop == "type":
             # handle must type property
             must_count += 1
             # .'$Fields'.type
-            res = json_model_11(pval, lpath_4 if path is not None else None, rep)
+            res = json_model_11(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $type-or-ref [.'$Fields'.type]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Fields'.type]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $type-or-ref [.'$Fields'.type]", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Fields'.type]", lpath_4))
                 return False
             continue
         if prop == "unique":
@@ -428,8 +441,8 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Fields'.unique
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Fields'.unique]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Fields'.unique]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Fields'.unique]", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Fields'.unique]", lpath_4))
                 return False
             continue
         elif prop == "default":
@@ -442,11 +455,11 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Fields'.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Fields'.required]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Fields'.required]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Fields'.required]", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Fields'.required]", lpath_4))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Fields']", lpath_4 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Fields']", lpath_4))
         return False
     if must_count != 2:
         if rep is not None:
@@ -467,15 +480,15 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "kind":
             # handle must kind property
             must_count += 1
             # .'$Array'.kind
             res = isinstance(pval, str) and pval == "array"
             if not res:
-                rep is None or rep.append(("unexpected array [.'$Array'.kind]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Array'.kind]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected array [.'$Array'.kind]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Array'.kind]", lpath_5))
                 return False
             continue
         if prop == "name":
@@ -483,17 +496,17 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Array'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Array'.name]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.name]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Array'.name]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.name]", lpath_5))
                 return False
             continue
         elif prop == "content":
             # handle may content property
             # .'$Array'.content
-            res = json_model_11(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_11(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $type-or-ref [.'$Array'.content]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.content]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $type-or-ref [.'$Array'.content]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.content]", lpath_5))
                 return False
             continue
         elif prop == "baseType":
@@ -501,8 +514,8 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Array'.baseType
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Array'.baseType]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.baseType]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Array'.baseType]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.baseType]", lpath_5))
                 return False
             continue
         elif prop == "maxLength":
@@ -510,8 +523,8 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Array'.maxLength
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Array'.maxLength]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.maxLength]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Array'.maxLength]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.maxLength]", lpath_5))
                 return False
             continue
         elif prop == "minLength":
@@ -519,11 +532,11 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Array'.minLength
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Array'.minLength]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.minLength]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Array'.minLength]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.minLength]", lpath_5))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Array']", lpath_5 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Array']", lpath_5))
         return False
     if must_count != 1:
         if rep is not None:
@@ -542,15 +555,15 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "kind":
             # handle must kind property
             must_count += 1
             # .'$Union'.kind
             res = isinstance(pval, str) and pval == "union"
             if not res:
-                rep is None or rep.append(("unexpected union [.'$Union'.kind]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Union'.kind]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected union [.'$Union'.kind]", lpath_6))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Union'.kind]", lpath_6))
                 return False
             continue
         elif prop == "name":
@@ -559,8 +572,8 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Union'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Union'.name]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Union'.name]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Union'.name]", lpath_6))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Union'.name]", lpath_6))
                 return False
             continue
         elif prop == "content":
@@ -570,15 +583,15 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_4_idx, arr_4_item in enumerate(pval):
-                    arr_4_lpath: Path = ((lpath_6 if path is not None else None) + [ arr_4_idx ]) if (lpath_6 if path is not None else None) is not None else None
+                    arr_4_lpath: Path = (lpath_6, arr_4_idx) if lpath_6 is not None else None
                     # .'$Union'.content.0
-                    res = json_model_11(arr_4_item, arr_4_lpath if (lpath_6 if path is not None else None) is not None else None, rep)
+                    res = json_model_11(arr_4_item, arr_4_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $type-or-ref [.'$Union'.content.0]", arr_4_lpath if (lpath_6 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $type-or-ref [.'$Union'.content.0]", arr_4_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Union'.content]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Union'.content]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Union'.content]", lpath_6))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Union'.content]", lpath_6))
                 return False
             continue
         if prop == "baseType":
@@ -586,11 +599,11 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Union'.baseType
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Union'.baseType]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Union'.baseType]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Union'.baseType]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Union'.baseType]", lpath_6))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Union']", lpath_6 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Union']", lpath_6))
         return False
     if must_count != 3:
         if rep is not None:
@@ -687,5 +700,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -46,16 +59,16 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_0 if path is not None else None, rep):
+        lpath_0: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_0, rep):
             # handle 1 key props
             # .'$map'.'$URL'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Val [.'$map'.'$URL']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Val [.'$map'.'$URL']", lpath_0))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$map']", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$map']", lpath_0))
             return False
     return True
 
@@ -114,5 +127,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -46,25 +59,25 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Ex09'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ex09'.'#']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ex09'.'#']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ex09'.'#']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Ex09'.'#']", lpath_0))
                 return False
             continue
-        if is_valid_url(prop, lpath_0 if path is not None else None, rep):
+        if is_valid_url(prop, lpath_0, rep):
             # handle 1 key props
             # .'$Ex09'.'$URL'
-            res = json_model_6(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $ex08#Val [.'$Ex09'.'$URL']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $ex08#Val [.'$Ex09'.'$URL']", lpath_0))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Ex09']", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Ex09']", lpath_0))
             return False
     return True
 
@@ -113,16 +126,16 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_1 if path is not None else None, rep):
+        lpath_1: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_1, rep):
             # handle 1 key props
             # .'$ex08#map'.'$URL'
-            res = json_model_6(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Val [.'$ex08#map'.'$URL']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Val [.'$ex08#map'.'$URL']", lpath_1))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$ex08#map']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$ex08#map']", lpath_1))
             return False
     return True
 
@@ -151,5 +164,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
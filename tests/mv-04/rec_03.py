@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -31,34 +44,34 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "foo":
             # handle may foo property
             # .foo
             # .foo.'|'.0
-            res = json_model_1(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_1(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $root [.foo.'|'.0]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $root [.foo.'|'.0]", lpath_0))
                 # .foo.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_0_idx, arr_0_item in enumerate(pval):
-                        arr_0_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_0_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                        arr_0_lpath: Path = (lpath_0, arr_0_idx) if lpath_0 is not None else None
                         # .foo.'|'.1.0
-                        res = json_model_1(arr_0_item, arr_0_lpath if (lpath_0 if path is not None else None) is not None else None, rep)
+                        res = json_model_1(arr_0_item, arr_0_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $root [.foo.'|'.1.0]", arr_0_lpath if (lpath_0 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $root [.foo.'|'.1.0]", arr_0_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.foo.'|'.1]", lpath_0 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.foo.'|'.1]", lpath_0))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.foo.'|']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.foo]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("no model matched [.foo.'|']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.foo]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.]", lpath_0))
         return False
     return True
 
@@ -85,5 +98,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -31,17 +44,17 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     # .'$r'
     res: bool = isinstance(val, list) and len(val) == 2
     if res:
-        lpath_0: Path = (path + [ 0 ]) if path is not None else None
+        lpath_0: Path = (path, 0) if path is not None else None
         # .'$r'.0
-        res = json_model_5(val[0], lpath_0 if path is not None else None, rep)
+        res = json_model_5(val[0], lpath_0, rep)
         if res:
-            lpath_0 = (path + [ 1 ]) if path is not None else None
+            lpath_0 = (path, 1) if path is not None else None
             # .'$r'.1
-            res = json_model_5(val[1], lpath_0 if path is not None else None, rep)
+            res = json_model_5(val[1], lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $s [.'$r'.1]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $s [.'$r'.1]", lpath_0))
         else:
-            rep is None or rep.append(("unexpected $s [.'$r'.0]", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected $s [.'$r'.0]", lpath_0))
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$r']", path))
     return res
@@ -120,5 +133,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
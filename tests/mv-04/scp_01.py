@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -46,17 +59,17 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "a":
             # handle may a property
             # .'$Rr'.a
-            res = json_model_7(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Aa [.'$Rr'.a]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Rr'.a]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Aa [.'$Rr'.a]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Rr'.a]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Rr']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Rr']", lpath_0))
         return False
     return True
 
@@ -69,36 +82,36 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "RA":
             # handle must RA property
             must_count += 1
             # .RA
-            res = json_model_5(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_5(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Rr [.RA]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.RA]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Rr [.RA]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.RA]", lpath_1))
                 return False
             continue
         if prop == "a":
             # handle may a property
             # .a
-            res = json_model_7(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Rr#Aa [.a]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.a]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Rr#Aa [.a]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.a]", lpath_1))
                 return False
             continue
         elif prop == "b":
             # handle may b property
             # .b
-            res = json_model_3(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Bb [.b]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.b]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Bb [.b]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.b]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.]", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.]", lpath_1))
         return False
     if must_count != 1:
         if rep is not None:
@@ -140,5 +153,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
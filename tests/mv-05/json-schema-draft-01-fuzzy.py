@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 json_model_3_map: PropMap
 _jm_cst_0: set[str]
@@ -83,11 +96,11 @@ def _jm_f_5(val: Jsonable, path: Path, rep: Report) -> bool:
         res = isinstance(val, list)
         if res:
             for arr_0_idx, arr_0_item in enumerate(val):
-                arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+                arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
                 # .'$schema'.disallow.'|'.1.0
                 res = isinstance(arr_0_item, str)
                 if not res:
-                    rep is None or rep.append(("unexpected string [.'$schema'.disallow.'|'.1.0]", arr_0_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected string [.'$schema'.disallow.'|'.1.0]", arr_0_lpath))
                     break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$schema'.disallow.'|'.1]", path))
@@ -124,11 +137,11 @@ def _jm_f_7(val: Jsonable, path: Path, rep: Report) -> bool:
         res = isinstance(val, list)
         if res:
             for arr_1_idx, arr_1_item in enumerate(val):
-                arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+                arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
                 # .'$schema'.extends.'|'.1.0
-                res = json_model_3(arr_1_item, arr_1_lpath if path is not None else None, rep)
+                res = json_model_3(arr_1_item, arr_1_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Schema [.'$schema'.extends.'|'.1.0]", arr_1_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected $Schema [.'$schema'.extends.'|'.1.0]", arr_1_lpath))
                     break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$schema'.extends.'|'.1]", path))
@@ -165,11 +178,11 @@ def _jm_f_10(val: Jsonable, path: Path, rep: Report) -> bool:
         res = isinstance(val, list)
         if res:
             for arr_2_idx, arr_2_item in enumerate(val):
-                arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+                arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
                 # .'$schema'.items.'|'.1.0
-                res = json_model_3(arr_2_item, arr_2_lpath if path is not None else None, rep)
+                res = json_model_3(arr_2_item, arr_2_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Schema [.'$schema'.items.'|'.1.0]", arr_2_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected $Schema [.'$schema'.items.'|'.1.0]", arr_2_lpath))
                     break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$schema'.items.'|'.1]", path))
@@ -275,12 +288,12 @@ def _jm_f_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema'.properties.''
-        res = json_model_3(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_3(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema'.properties.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema'.properties.'']", lpath_1))
             return False
     return True
 
@@ -320,20 +333,20 @@ def _jm_f_25(val: Jsonable, path: Path, rep: Report) -> bool:
         res = isinstance(val, list)
         if res:
             for arr_3_idx, arr_3_item in enumerate(val):
-                arr_3_lpath: Path = (path + [ arr_3_idx ]) if path is not None else None
+                arr_3_lpath: Path = (path, arr_3_idx) if path is not None else None
                 # .'$schema'.type.'|'.1.0
                 # .'$schema'.type.'|'.1.0.'|'.0
                 res = isinstance(arr_3_item, str)
                 if not res:
-                    rep is None or rep.append(("unexpected string [.'$schema'.type.'|'.1.0.'|'.0]", arr_3_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected string [.'$schema'.type.'|'.1.0.'|'.0]", arr_3_lpath))
                     # .'$schema'.type.'|'.1.0.'|'.1
-                    res = json_model_3(arr_3_item, arr_3_lpath if path is not None else None, rep)
+                    res = json_model_3(arr_3_item, arr_3_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $Schema [.'$schema'.type.'|'.1.0.'|'.1]", arr_3_lpath if path is not None else None))
+                        rep is None or rep.append(("unexpected $Schema [.'$schema'.type.'|'.1.0.'|'.1]", arr_3_lpath))
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.'$schema'.type.'|'.1.0.'|']", arr_3_lpath if path is not None else None))
+                    rep is None or rep.append(("no model matched [.'$schema'.type.'|'.1.0.'|']", arr_3_lpath))
                     break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$schema'.type.'|'.1]", path))
@@ -353,11 +366,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if pfun := json_model_3_map.get(prop):
             # handle 26 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_0 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$schema']", lpath_0 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_0, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$schema']", lpath_0))
                 return False
             continue
         # accept any other props
@@ -435,5 +448,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 json_model_3_map: PropMap
 _jm_cst_0: set[str]
@@ -89,33 +102,33 @@ def _jm_f_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema'.dependencies.''
         # .'$schema'.dependencies.''.'|'.0
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$schema'.dependencies.''.'|'.0]", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$schema'.dependencies.''.'|'.0]", lpath_1))
             # .'$schema'.dependencies.''.'|'.1
             res = isinstance(pval, list)
             if res:
                 for arr_0_idx, arr_0_item in enumerate(pval):
-                    arr_0_lpath: Path = ((lpath_1 if path is not None else None) + [ arr_0_idx ]) if (lpath_1 if path is not None else None) is not None else None
+                    arr_0_lpath: Path = (lpath_1, arr_0_idx) if lpath_1 is not None else None
                     # .'$schema'.dependencies.''.'|'.1.0
                     res = isinstance(arr_0_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$schema'.dependencies.''.'|'.1.0]", arr_0_lpath if (lpath_1 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$schema'.dependencies.''.'|'.1.0]", arr_0_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$schema'.dependencies.''.'|'.1]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$schema'.dependencies.''.'|'.1]", lpath_1))
                 # .'$schema'.dependencies.''.'|'.2
-                res = json_model_3(pval, lpath_1 if path is not None else None, rep)
+                res = json_model_3(pval, lpath_1, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Schema [.'$schema'.dependencies.''.'|'.2]", lpath_1 if path is not None else None))
+                    rep is None or rep.append(("unexpected $Schema [.'$schema'.dependencies.''.'|'.2]", lpath_1))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$schema'.dependencies.''.'|']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$schema'.dependencies.''.'|']", lpath_1))
             return False
     return True
 
@@ -195,11 +208,11 @@ def _jm_f_12(val: Jsonable, path: Path, rep: Report) -> bool:
         res = isinstance(val, list)
         if res:
             for arr_1_idx, arr_1_item in enumerate(val):
-                arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+                arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
                 # .'$schema'.extends.'|'.1.0
-                res = json_model_3(arr_1_item, arr_1_lpath if path is not None else None, rep)
+                res = json_model_3(arr_1_item, arr_1_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Schema [.'$schema'.extends.'|'.1.0]", arr_1_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected $Schema [.'$schema'.extends.'|'.1.0]", arr_1_lpath))
                     break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$schema'.extends.'|'.1]", path))
@@ -236,11 +249,11 @@ def _jm_f_15(val: Jsonable, path: Path, rep: Report) -> bool:
         res = isinstance(val, list)
         if res:
             for arr_2_idx, arr_2_item in enumerate(val):
-                arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+                arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
                 # .'$schema'.items.'|'.1.0
-                res = json_model_3(arr_2_item, arr_2_lpath if path is not None else None, rep)
+                res = json_model_3(arr_2_item, arr_2_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Schema [.'$schema'.items.'|'.1.0]", arr_2_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected $Schema [.'$schema'.items.'|'.1.0]", arr_2_lpath))
                     break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$schema'.items.'|'.1]", path))
@@ -314,12 +327,12 @@ def _jm_f_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema'.patternProperties.''
-        res = json_model_3(pval, lpath_2 if path is not None else None, rep)
+        res = json_model_3(pval, lpath_2, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema'.patternProperties.'']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema'.patternProperties.'']", lpath_2))
             return False
     return True
 
@@ -331,12 +344,12 @@ def _jm_f_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema'.properties.''
-        res = json_model_3(pval, lpath_3 if path is not None else None, rep)
+        res = json_model_3(pval, lpath_3, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema'.properties.'']", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema'.properties.'']", lpath_3))
             return False
     return True
 
@@ -367,20 +380,20 @@ def _jm_f_27(val: Jsonable, path: Path, rep: Report) -> bool:
         res = isinstance(val, list)
         if res:
             for arr_3_idx, arr_3_item in enumerate(val):
-                arr_3_lpath: Path = (path + [ arr_3_idx ]) if path is not None else None
+                arr_3_lpath: Path = (path, arr_3_idx) if path is not None else None
                 # .'$schema'.type.'|'.1.0
                 # .'$schema'.type.'|'.1.0.'|'.0
                 res = isinstance(arr_3_item, str)
                 if not res:
-                    rep is None or rep.append(("unexpected string [.'$schema'.type.'|'.1.0.'|'.0]", arr_3_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected string [.'$schema'.type.'|'.1.0.'|'.0]", arr_3_lpath))
                     # .'$schema'.type.'|'.1.0.'|'.1
-                    res = json_model_3(arr_3_item, arr_3_lpath if path is not None else None, rep)
+                    res = json_model_3(arr_3_item, arr_3_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $Schema [.'$schema'.type.'|'.1.0.'|'.1]", arr_3_lpath if path is not None else None))
+                        rep is None or rep.append(("unexpected $Schema [.'$schema'.type.'|'.1.0.'|'.1]", arr_3_lpath))
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.'$schema'.type.'|'.1.0.'|']", arr_3_lpath if path is not None else None))
+                    rep is None or rep.append(("no model matched [.'$schema'.type.'|'.1.0.'|']", arr_3_lpath))
                     break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$schema'.type.'|'.1]", path))
@@ -408,11 +421,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if pfun := json_model_3_map.get(prop):
             # handle 29 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_0 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$schema']", lpath_0 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_0, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$schema']", lpath_0))
                 return False
             continue
         # accept any other props
@@ -443,20 +456,20 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_4_idx, arr_4_item in enumerate(val):
-            arr_4_lpath: Path = (path + [ arr_4_idx ]) if path is not None else None
+            arr_4_lpath: Path = (path, arr_4_idx) if path is not None else None
             # .'$schema#distinctSchemaArray'.'@'.0
             # .'$schema#distinctSchemaArray'.'@'.0.'|'.0
             res = isinstance(arr_4_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$schema#distinctSchemaArray'.'@'.0.'|'.0]", arr_4_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$schema#distinctSchemaArray'.'@'.0.'|'.0]", arr_4_lpath))
                 # .'$schema#distinctSchemaArray'.'@'.0.'|'.1
-                res = json_model_3(arr_4_item, arr_4_lpath if path is not None else None, rep)
+                res = json_model_3(arr_4_item, arr_4_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Schema [.'$schema#distinctSchemaArray'.'@'.0.'|'.1]", arr_4_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected $Schema [.'$schema#distinctSchemaArray'.'@'.0.'|'.1]", arr_4_lpath))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$schema#distinctSchemaArray'.'@'.0.'|']", arr_4_lpath if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$schema#distinctSchemaArray'.'@'.0.'|']", arr_4_lpath))
                 break
     if res:
         res = is_unique_array(val, path, rep)
@@ -523,5 +536,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 json_model_3_map: PropMap
 _jm_cst_0: set[str]
@@ -89,12 +102,12 @@ def _jm_f_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema'.definitions.''
-        res = json_model_3(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_3(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema'.definitions.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema'.definitions.'']", lpath_1))
             return False
     return True
 
@@ -106,21 +119,21 @@ def _jm_f_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema'.dependencies.''
         # .'$schema'.dependencies.''.'|'.0
-        res = json_model_3(pval, lpath_2 if path is not None else None, rep)
+        res = json_model_3(pval, lpath_2, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema'.dependencies.''.'|'.0]", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema'.dependencies.''.'|'.0]", lpath_2))
             # .'$schema'.dependencies.''.'|'.1
-            res = json_model_6(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $stringArray [.'$schema'.dependencies.''.'|'.1]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $stringArray [.'$schema'.dependencies.''.'|'.1]", lpath_2))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$schema'.dependencies.''.'|']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$schema'.dependencies.''.'|']", lpath_2))
             return False
     return True
 
@@ -285,12 +298,12 @@ def _jm_f_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema'.patternProperties.''
-        res = json_model_3(pval, lpath_3 if path is not None else None, rep)
+        res = json_model_3(pval, lpath_3, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema'.patternProperties.'']", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema'.patternProperties.'']", lpath_3))
             return False
     return True
 
@@ -302,12 +315,12 @@ def _jm_f_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema'.properties.''
-        res = json_model_3(pval, lpath_4 if path is not None else None, rep)
+        res = json_model_3(pval, lpath_4, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema'.properties.'']", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema'.properties.'']", lpath_4))
             return False
     return True
 
@@ -354,11 +367,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if pfun := json_model_3_map.get(prop):
             # handle 34 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_0 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$schema']", lpath_0 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_0, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$schema']", lpath_0))
                 return False
             continue
         # accept any other props
@@ -380,11 +393,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$schema#schemaArray'.'@'.0
-            res = json_model_3(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_3(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schema#schemaArray'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schema#schemaArray'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -411,11 +424,11 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$schema#stringArray'.'@'.0
             res = isinstance(arr_1_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$schema#stringArray'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$schema#stringArray'.'@'.0]", arr_1_lpath))
                 break
     if res:
         ival_2: int = len(val)
@@ -433,11 +446,11 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$schema#typeArray'.'@'.0
-            res = json_model_5(arr_2_item, arr_2_lpath if path is not None else None, rep)
+            res = json_model_5(arr_2_item, arr_2_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $simpleTypes [.'$schema#typeArray'.'@'.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $simpleTypes [.'$schema#typeArray'.'@'.0]", arr_2_lpath))
                 break
     if res:
         ival_3: int = len(val)
@@ -510,5 +523,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
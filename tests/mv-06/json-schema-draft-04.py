@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 json_model_1_map: PropMap
@@ -31,11 +44,11 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$schemaArray'.'@'.0
-            res = json_model_1(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_1(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -62,11 +75,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$stringArray'.'@'.0
             res = isinstance(arr_1_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$stringArray'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$stringArray'.'@'.0]", arr_1_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -84,11 +97,11 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$typeArray'.'@'.0
-            res = json_model_3(arr_2_item, arr_2_lpath if path is not None else None, rep)
+            res = json_model_3(arr_2_item, arr_2_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $simpleTypes [.'$typeArray'.'@'.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $simpleTypes [.'$typeArray'.'@'.0]", arr_2_lpath))
                 break
     if res:
         ival_2: int = len(val)
@@ -164,12 +177,12 @@ def _jm_f_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .definitions.''
-        res = json_model_1(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_1(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.definitions.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.definitions.'']", lpath_1))
             return False
     return True
 
@@ -181,21 +194,21 @@ def _jm_f_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         # handle other props
         # .dependencies.''
         # .dependencies.''.'|'.0
-        res = json_model_1(pval, lpath_2 if path is not None else None, rep)
+        res = json_model_1(pval, lpath_2, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.dependencies.''.'|'.0]", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.dependencies.''.'|'.0]", lpath_2))
             # .dependencies.''.'|'.1
-            res = json_model_4(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $stringArray [.dependencies.''.'|'.1]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $stringArray [.dependencies.''.'|'.1]", lpath_2))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.dependencies.''.'|']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("no model matched [.dependencies.''.'|']", lpath_2))
             return False
     return True
 
@@ -360,12 +373,12 @@ def _jm_f_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         # handle other props
         # .patternProperties.''
-        res = json_model_1(pval, lpath_3 if path is not None else None, rep)
+        res = json_model_1(pval, lpath_3, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.patternProperties.'']", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.patternProperties.'']", lpath_3))
             return False
     return True
 
@@ -377,12 +390,12 @@ def _jm_f_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         # handle other props
         # .properties.''
-        res = json_model_1(pval, lpath_4 if path is not None else None, rep)
+        res = json_model_1(pval, lpath_4, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.properties.'']", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.properties.'']", lpath_4))
             return False
     return True
 
@@ -429,14 +442,14 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if pfun := json_model_1_map.get(prop):
             # handle 34 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_0 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.]", lpath_0 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_0, rep):
+                rep is None or rep.append(("invalid optional prop value [.]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.]", lpath_0))
         return False
     return True
 
@@ -506,5 +519,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
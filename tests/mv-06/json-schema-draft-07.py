@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 json_model_6_map: PropMap
@@ -39,11 +52,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$schemaArray'.'@'.0
-            res = json_model_7(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_7(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -70,11 +83,11 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$arrayTypes'.'@'.0
-            res = json_model_4(arr_1_item, arr_1_lpath if path is not None else None, rep)
+            res = json_model_4(arr_1_item, arr_1_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $simpleTypes [.'$arrayTypes'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $simpleTypes [.'$arrayTypes'.'@'.0]", arr_1_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -139,12 +152,12 @@ def _jm_f_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$ObjectSchema'.definitions.''
-        res = json_model_7(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_7(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.definitions.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.definitions.'']", lpath_1))
             return False
     return True
 
@@ -156,29 +169,29 @@ def _jm_f_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$ObjectSchema'.dependencies.''
         # .'$ObjectSchema'.dependencies.''.'|'.0
-        res = json_model_7(pval, lpath_2 if path is not None else None, rep)
+        res = json_model_7(pval, lpath_2, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.dependencies.''.'|'.0]", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.dependencies.''.'|'.0]", lpath_2))
             # .'$ObjectSchema'.dependencies.''.'|'.1
             res = isinstance(pval, list)
             if res:
                 for arr_2_idx, arr_2_item in enumerate(pval):
-                    arr_2_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_2_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_2_lpath: Path = (lpath_2, arr_2_idx) if lpath_2 is not None else None
                     # .'$ObjectSchema'.dependencies.''.'|'.1.0
                     res = isinstance(arr_2_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$ObjectSchema'.dependencies.''.'|'.1.0]", arr_2_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$ObjectSchema'.dependencies.''.'|'.1.0]", arr_2_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$ObjectSchema'.dependencies.''.'|'.1]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$ObjectSchema'.dependencies.''.'|'.1]", lpath_2))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$ObjectSchema'.dependencies.''.'|']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$ObjectSchema'.dependencies.''.'|']", lpath_2))
             return False
     return True
 
@@ -343,16 +356,16 @@ def _jm_f_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_3 if path is not None else None, rep):
+        lpath_3: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_3, rep):
             # handle 1 key props
             # .'$ObjectSchema'.patternProperties.'$REGEX'
-            res = json_model_7(pval, lpath_3 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.patternProperties.'$REGEX']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.patternProperties.'$REGEX']", lpath_3))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$ObjectSchema'.patternProperties]", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$ObjectSchema'.patternProperties]", lpath_3))
             return False
     return True
 
@@ -364,12 +377,12 @@ def _jm_f_26(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$ObjectSchema'.properties.''
-        res = json_model_7(pval, lpath_4 if path is not None else None, rep)
+        res = json_model_7(pval, lpath_4, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.properties.'']", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.properties.'']", lpath_4))
             return False
     return True
 
@@ -387,11 +400,11 @@ def _jm_f_28(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_3_idx, arr_3_item in enumerate(val):
-            arr_3_lpath: Path = (path + [ arr_3_idx ]) if path is not None else None
+            arr_3_lpath: Path = (path, arr_3_idx) if path is not None else None
             # .'$ObjectSchema'.required.0
             res = isinstance(arr_3_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$ObjectSchema'.required.0]", arr_3_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$ObjectSchema'.required.0]", arr_3_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$ObjectSchema'.required]", path))
@@ -447,14 +460,14 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if pfun := json_model_6_map.get(prop):
             # handle 46 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_0 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$ObjectSchema']", lpath_0 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_0, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$ObjectSchema']", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$ObjectSchema']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$ObjectSchema']", lpath_0))
         return False
     return True
 
@@ -564,5 +577,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 json_model_17_map: PropMap
 _jm_cst_0: set[str]
@@ -75,12 +88,12 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.'$defs'.''
-        res = json_model_18(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_18(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.'$defs'.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.'$defs'.'']", lpath_1))
             return False
     return True
 
@@ -100,16 +113,16 @@ def _jm_f_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_2 if path is not None else None, rep):
+        lpath_2: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_2, rep):
             # handle 1 key props
             # .'$schema#ObjectSchema'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$schema#ObjectSchema'.'$vocabulary'.'$URI']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$schema#ObjectSchema'.'$vocabulary'.'$URI']", lpath_2))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$schema#ObjectSchema'.'$vocabulary']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$schema#ObjectSchema'.'$vocabulary']", lpath_2))
             return False
     return True
 
@@ -151,12 +164,12 @@ def _jm_f_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.definitions.''
-        res = json_model_18(pval, lpath_3 if path is not None else None, rep)
+        res = json_model_18(pval, lpath_3, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.definitions.'']", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.definitions.'']", lpath_3))
             return False
     return True
 
@@ -168,21 +181,21 @@ def _jm_f_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.dependencies.''
         # .'$schema#ObjectSchema'.dependencies.''.'|'.0
-        res = json_model_18(pval, lpath_4 if path is not None else None, rep)
+        res = json_model_18(pval, lpath_4, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.dependencies.''.'|'.0]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.dependencies.''.'|'.0]", lpath_4))
             # .'$schema#ObjectSchema'.dependencies.''.'|'.1
-            res = json_model_12(pval, lpath_4 if path is not None else None, rep)
+            res = json_model_12(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $stringArray [.'$schema#ObjectSchema'.dependencies.''.'|'.1]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $stringArray [.'$schema#ObjectSchema'.dependencies.''.'|'.1]", lpath_4))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$schema#ObjectSchema'.dependencies.''.'|']", lpath_4 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$schema#ObjectSchema'.dependencies.''.'|']", lpath_4))
             return False
     return True
 
@@ -194,12 +207,12 @@ def _jm_f_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.dependentRequired.''
-        res = json_model_12(pval, lpath_5 if path is not None else None, rep)
+        res = json_model_12(pval, lpath_5, rep)
         if not res:
-            rep is None or rep.append(("unexpected $stringArray [.'$schema#ObjectSchema'.dependentRequired.'']", lpath_5 if path is not None else None))
+            rep is None or rep.append(("unexpected $stringArray [.'$schema#ObjectSchema'.dependentRequired.'']", lpath_5))
             return False
     return True
 
@@ -211,12 +224,12 @@ def _jm_f_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.dependentSchemas.''
-        res = json_model_18(pval, lpath_6 if path is not None else None, rep)
+        res = json_model_18(pval, lpath_6, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.dependentSchemas.'']", lpath_6 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.dependentSchemas.'']", lpath_6))
             return False
     return True
 
@@ -316,12 +329,12 @@ def _jm_f_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.patternProperties.''
-        res = json_model_18(pval, lpath_7 if path is not None else None, rep)
+        res = json_model_18(pval, lpath_7, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.patternProperties.'']", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.patternProperties.'']", lpath_7))
             return False
     return True
 
@@ -333,12 +346,12 @@ def _jm_f_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.properties.''
-        res = json_model_18(pval, lpath_8 if path is not None else None, rep)
+        res = json_model_18(pval, lpath_8, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.properties.'']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.properties.'']", lpath_8))
             return False
     return True
 
@@ -349,12 +362,12 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.propertyDependencies.''.''
-        res = json_model_18(pval, lpath_10 if path is not None else None, rep)
+        res = json_model_18(pval, lpath_10, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.propertyDependencies.''.'']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.propertyDependencies.''.'']", lpath_10))
             return False
     return True
 
@@ -366,12 +379,12 @@ def _jm_f_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.propertyDependencies.''
-        res = _jm_obj_0(pval, lpath_9 if path is not None else None, rep)
+        res = _jm_obj_0(pval, lpath_9, rep)
         if not res:
-            rep is None or rep.append(("unexpected element [.'$schema#ObjectSchema'.propertyDependencies.'']", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected element [.'$schema#ObjectSchema'.propertyDependencies.'']", lpath_9))
             return False
     return True
 
@@ -433,11 +446,11 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if pfun := json_model_17_map.get(prop):
             # handle 60 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_0 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$schema#ObjectSchema']", lpath_0 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_0, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$schema#ObjectSchema']", lpath_0))
                 return False
             continue
         # accept any other props
@@ -468,11 +481,11 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$schema#simpleTypesArray'.'@'.0
-            res = json_model_10(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_10(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $simpleTypes [.'$schema#simpleTypesArray'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $simpleTypes [.'$schema#simpleTypesArray'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -490,11 +503,11 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$schema#stringArray'.'@'.0
             res = isinstance(arr_1_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$schema#stringArray'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$schema#stringArray'.'@'.0]", arr_1_lpath))
                 break
     if res:
         res = is_unique_array(val, path, rep)
@@ -519,11 +532,11 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$schema#schemaArray'.'@'.0
-            res = json_model_18(arr_2_item, arr_2_lpath if path is not None else None, rep)
+            res = json_model_18(arr_2_item, arr_2_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schema#schemaArray'.'@'.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schema#schemaArray'.'@'.0]", arr_2_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -622,5 +635,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
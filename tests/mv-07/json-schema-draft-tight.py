@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 json_model_9_map: PropMap
@@ -76,31 +89,31 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if res:
         # .'$enum'.'|'.0
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$enum'.'|'.0.0
             res = isinstance(arr_2_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$enum'.'|'.0.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$enum'.'|'.0.0]", arr_2_lpath))
                 break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$enum'.'|'.0]", path))
             # .'$enum'.'|'.1
             for arr_1_idx, arr_1_item in enumerate(val):
-                arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+                arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
                 # .'$enum'.'|'.1.0
                 res = isinstance(arr_1_item, int) and not isinstance(arr_1_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1 strict int [.'$enum'.'|'.1.0]", arr_1_lpath if path is not None else None))
+                    rep is None or rep.append(("not a -1 strict int [.'$enum'.'|'.1.0]", arr_1_lpath))
                     break
             if not res:
                 rep is None or rep.append(("not array or unexpected array [.'$enum'.'|'.1]", path))
                 # .'$enum'.'|'.2
                 for arr_0_idx, arr_0_item in enumerate(val):
-                    arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+                    arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
                     # .'$enum'.'|'.2.0
                     res = isinstance(arr_0_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a bool [.'$enum'.'|'.2.0]", arr_0_lpath if path is not None else None))
+                        rep is None or rep.append(("not a bool [.'$enum'.'|'.2.0]", arr_0_lpath))
                         break
                 if not res:
                     rep is None or rep.append(("not array or unexpected array [.'$enum'.'|'.2]", path))
@@ -118,11 +131,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_3_idx, arr_3_item in enumerate(val):
-            arr_3_lpath: Path = (path + [ arr_3_idx ]) if path is not None else None
+            arr_3_lpath: Path = (path, arr_3_idx) if path is not None else None
             # .'$schemaArray'.0
-            res = json_model_25(arr_3_item, arr_3_lpath if path is not None else None, rep)
+            res = json_model_25(arr_3_item, arr_3_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.0]", arr_3_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.0]", arr_3_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$schemaArray']", path))
@@ -137,23 +150,23 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "format":
             # handle may format property
             # .'$stringKeywords'.format
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_0
             if not res:
-                rep is None or rep.append(("value not in enum [.'$stringKeywords'.format.'|']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.format]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.'$stringKeywords'.format.'|']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.format]", lpath_0))
                 return False
             continue
         elif prop == "pattern":
             # handle may pattern property
             # .'$stringKeywords'.pattern
-            res = is_valid_regex(pval, lpath_0 if path is not None else None, rep)
+            res = is_valid_regex(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $REGEX [.'$stringKeywords'.pattern]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.pattern]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $REGEX [.'$stringKeywords'.pattern]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.pattern]", lpath_0))
                 return False
             continue
         elif prop == "maxLength":
@@ -161,8 +174,8 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$stringKeywords'.maxLength
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$stringKeywords'.maxLength]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.maxLength]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$stringKeywords'.maxLength]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.maxLength]", lpath_0))
                 return False
             continue
         elif prop == "minLength":
@@ -170,11 +183,11 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$stringKeywords'.minLength
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$stringKeywords'.minLength]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.minLength]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$stringKeywords'.minLength]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.minLength]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$stringKeywords']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$stringKeywords']", lpath_0))
         return False
     return True
 
@@ -187,23 +200,23 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "items":
             # handle may items property
             # .'$arrayKeywords'.items
             # .'$arrayKeywords'.items.'|'.0
-            res = json_model_25(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_25(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.items.'|'.0]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.items.'|'.0]", lpath_1))
                 # .'$arrayKeywords'.items.'|'.1
-                res = json_model_4(pval, lpath_1 if path is not None else None, rep)
+                res = json_model_4(pval, lpath_1, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $schemaArray [.'$arrayKeywords'.items.'|'.1]", lpath_1 if path is not None else None))
+                    rep is None or rep.append(("unexpected $schemaArray [.'$arrayKeywords'.items.'|'.1]", lpath_1))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$arrayKeywords'.items.'|']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.items]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$arrayKeywords'.items.'|']", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.items]", lpath_1))
                 return False
             continue
         elif prop == "maxItems":
@@ -211,8 +224,8 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$arrayKeywords'.maxItems
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$arrayKeywords'.maxItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.maxItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$arrayKeywords'.maxItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.maxItems]", lpath_1))
                 return False
             continue
         elif prop == "minItems":
@@ -220,17 +233,17 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$arrayKeywords'.minItems
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$arrayKeywords'.minItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.minItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$arrayKeywords'.minItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.minItems]", lpath_1))
                 return False
             continue
         elif prop == "prefixItems":
             # handle may prefixItems property
             # .'$arrayKeywords'.prefixItems
-            res = json_model_4(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$arrayKeywords'.prefixItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.prefixItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$arrayKeywords'.prefixItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.prefixItems]", lpath_1))
                 return False
             continue
         elif prop == "uniqueItems":
@@ -238,29 +251,29 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$arrayKeywords'.uniqueItems
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$arrayKeywords'.uniqueItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.uniqueItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$arrayKeywords'.uniqueItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.uniqueItems]", lpath_1))
                 return False
             continue
         elif prop == "additionalItems":
             # handle may additionalItems property
             # .'$arrayKeywords'.additionalItems
-            res = json_model_25(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_25(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.additionalItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.additionalItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.additionalItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.additionalItems]", lpath_1))
                 return False
             continue
         elif prop == "unevaluatedItems":
             # handle may unevaluatedItems property
             # .'$arrayKeywords'.unevaluatedItems
-            res = json_model_25(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_25(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.unevaluatedItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.unevaluatedItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.unevaluatedItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.unevaluatedItems]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$arrayKeywords']", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$arrayKeywords']", lpath_1))
         return False
     return True
 
@@ -271,12 +284,12 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$objectKeywords'.properties.''
-        res = json_model_25(pval, lpath_3 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_3, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.properties.'']", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.properties.'']", lpath_3))
             return False
     return True
 
@@ -287,16 +300,16 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_4 if path is not None else None, rep):
+        lpath_4: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_4, rep):
             # handle 1 key props
             # .'$objectKeywords'.patternProperties.'$REGEX'
-            res = json_model_25(pval, lpath_4 if path is not None else None, rep)
+            res = json_model_25(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.patternProperties.'$REGEX']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.patternProperties.'$REGEX']", lpath_4))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$objectKeywords'.patternProperties]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$objectKeywords'.patternProperties]", lpath_4))
             return False
     return True
 
@@ -309,31 +322,31 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "required":
             # handle may required property
             # .'$objectKeywords'.required
             res = isinstance(pval, list)
             if res:
                 for arr_4_idx, arr_4_item in enumerate(pval):
-                    arr_4_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_4_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_4_lpath: Path = (lpath_2, arr_4_idx) if lpath_2 is not None else None
                     # .'$objectKeywords'.required.0
                     res = isinstance(arr_4_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$objectKeywords'.required.0]", arr_4_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$objectKeywords'.required.0]", arr_4_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$objectKeywords'.required]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.required]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$objectKeywords'.required]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.required]", lpath_2))
                 return False
             continue
         elif prop == "properties":
             # handle may properties property
             # .'$objectKeywords'.properties
-            res = _jm_obj_0(pval, lpath_2 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$objectKeywords'.properties]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.properties]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$objectKeywords'.properties]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.properties]", lpath_2))
                 return False
             continue
         elif prop == "maxProperties":
@@ -341,8 +354,8 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$objectKeywords'.maxProperties
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$objectKeywords'.maxProperties]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.maxProperties]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$objectKeywords'.maxProperties]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.maxProperties]", lpath_2))
                 return False
             continue
         elif prop == "minProperties":
@@ -350,47 +363,47 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$objectKeywords'.minProperties
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$objectKeywords'.minProperties]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.minProperties]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$objectKeywords'.minProperties]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.minProperties]", lpath_2))
                 return False
             continue
         elif prop == "propertyNames":
             # handle may propertyNames property
             # .'$objectKeywords'.propertyNames
-            res = json_model_24(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_24(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $ObjectSchema [.'$objectKeywords'.propertyNames]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.propertyNames]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $ObjectSchema [.'$objectKeywords'.propertyNames]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.propertyNames]", lpath_2))
                 return False
             continue
         elif prop == "patternProperties":
             # handle may patternProperties property
             # .'$objectKeywords'.patternProperties
-            res = _jm_obj_1(pval, lpath_2 if path is not None else None, rep)
+            res = _jm_obj_1(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$objectKeywords'.patternProperties]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.patternProperties]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$objectKeywords'.patternProperties]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.patternProperties]", lpath_2))
                 return False
             continue
         elif prop == "additionalProperties":
             # handle may additionalProperties property
             # .'$objectKeywords'.additionalProperties
-            res = json_model_25(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_25(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.additionalProperties]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.additionalProperties]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.additionalProperties]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.additionalProperties]", lpath_2))
                 return False
             continue
         elif prop == "unevaluatedProperties":
             # handle may unevaluatedProperties property
             # .'$objectKeywords'.unevaluatedProperties
-            res = json_model_25(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_25(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.unevaluatedProperties]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.unevaluatedProperties]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.unevaluatedProperties]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.unevaluatedProperties]", lpath_2))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$objectKeywords']", lpath_2 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$objectKeywords']", lpath_2))
         return False
     return True
 
@@ -403,14 +416,14 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "maximum":
             # handle may maximum property
             # .'$numberKeywords'.maximum
             res = isinstance(pval, float)
             if not res:
-                rep is None or rep.append(("not a -1.0 strict float [.'$numberKeywords'.maximum]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$numberKeywords'.maximum]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a -1.0 strict float [.'$numberKeywords'.maximum]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$numberKeywords'.maximum]", lpath_5))
                 return False
             continue
         elif prop == "minimum":
@@ -418,11 +431,11 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$numberKeywords'.minimum
             res = isinstance(pval, float)
             if not res:
-                rep is None or rep.append(("not a -1.0 strict float [.'$numberKeywords'.minimum]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$numberKeywords'.minimum]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a -1.0 strict float [.'$numberKeywords'.minimum]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$numberKeywords'.minimum]", lpath_5))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$numberKeywords']", lpath_5 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$numberKeywords']", lpath_5))
         return False
     return True
 
@@ -450,12 +463,12 @@ def _jm_f_2(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$metas'.'$defs'.''
-        res = json_model_25(pval, lpath_7 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_7, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$metas'.'$defs'.'']", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$metas'.'$defs'.'']", lpath_7))
             return False
     return True
 
@@ -491,16 +504,16 @@ def _jm_f_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_8 if path is not None else None, rep):
+        lpath_8: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_8, rep):
             # handle 1 key props
             # .'$metas'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$metas'.'$vocabulary'.'$URI']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$metas'.'$vocabulary'.'$URI']", lpath_8))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$metas'.'$vocabulary']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$metas'.'$vocabulary']", lpath_8))
             return False
     return True
 
@@ -519,12 +532,12 @@ def _jm_f_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$metas'.definitions.''
-        res = json_model_25(pval, lpath_9 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_9, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$metas'.definitions.'']", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$metas'.definitions.'']", lpath_9))
             return False
     return True
 
@@ -594,14 +607,14 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if pfun := json_model_9_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_6 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$metas']", lpath_6 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_6, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$metas']", lpath_6))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$metas']", lpath_6 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$metas']", lpath_6))
         return False
     return True
 
@@ -629,12 +642,12 @@ def _jm_f_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$String'.'$defs'.''
-        res = json_model_25(pval, lpath_11 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_11, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$String'.'$defs'.'']", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$String'.'$defs'.'']", lpath_11))
             return False
     return True
 
@@ -670,16 +683,16 @@ def _jm_f_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_12 if path is not None else None, rep):
+        lpath_12: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_12, rep):
             # handle 1 key props
             # .'$String'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$String'.'$vocabulary'.'$URI']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$String'.'$vocabulary'.'$URI']", lpath_12))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$String'.'$vocabulary']", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$String'.'$vocabulary']", lpath_12))
             return False
     return True
 
@@ -698,12 +711,12 @@ def _jm_f_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$String'.definitions.''
-        res = json_model_25(pval, lpath_13 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_13, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$String'.definitions.'']", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$String'.definitions.'']", lpath_13))
             return False
     return True
 
@@ -807,24 +820,24 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$String'.type
             res = isinstance(pval, str) and pval == "string"
             if not res:
-                rep is None or rep.append(("unexpected string [.'$String'.type]", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$String'.type]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$String'.type]", lpath_10))
+                rep is None or rep.append(("invalid mandatory prop value [.'$String'.type]", lpath_10))
                 return False
             continue
         if pfun := json_model_10_map.get(prop):
             # handle 20 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_10 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$String']", lpath_10 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_10, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$String']", lpath_10))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$String']", lpath_10 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$String']", lpath_10))
         return False
     if must_count != 1:
         if rep is not None:
@@ -857,12 +870,12 @@ def _jm_f_38(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Array'.'$defs'.''
-        res = json_model_25(pval, lpath_15 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_15, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Array'.'$defs'.'']", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Array'.'$defs'.'']", lpath_15))
             return False
     return True
 
@@ -898,16 +911,16 @@ def _jm_f_42(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_16 if path is not None else None, rep):
+        lpath_16: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_16, rep):
             # handle 1 key props
             # .'$Array'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Array'.'$vocabulary'.'$URI']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Array'.'$vocabulary'.'$URI']", lpath_16))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Array'.'$vocabulary']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Array'.'$vocabulary']", lpath_16))
             return False
     return True
 
@@ -926,12 +939,12 @@ def _jm_f_44(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Array'.definitions.''
-        res = json_model_25(pval, lpath_17 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_17, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Array'.definitions.'']", lpath_17 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Array'.definitions.'']", lpath_17))
             return False
     return True
 
@@ -1043,24 +1056,24 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Array'.type
             res = isinstance(pval, str) and pval == "array"
             if not res:
-                rep is None or rep.append(("unexpected array [.'$Array'.type]", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Array'.type]", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected array [.'$Array'.type]", lpath_14))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Array'.type]", lpath_14))
                 return False
             continue
         if pfun := json_model_11_map.get(prop):
             # handle 23 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_14 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Array']", lpath_14 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_14, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Array']", lpath_14))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Array']", lpath_14 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Array']", lpath_14))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1093,12 +1106,12 @@ def _jm_f_58(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Object'.'$defs'.''
-        res = json_model_25(pval, lpath_19 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_19, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Object'.'$defs'.'']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Object'.'$defs'.'']", lpath_19))
             return False
     return True
 
@@ -1134,16 +1147,16 @@ def _jm_f_62(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_20 if path is not None else None, rep):
+        lpath_20: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_20, rep):
             # handle 1 key props
             # .'$Object'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Object'.'$vocabulary'.'$URI']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Object'.'$vocabulary'.'$URI']", lpath_20))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Object'.'$vocabulary']", lpath_20 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Object'.'$vocabulary']", lpath_20))
             return False
     return True
 
@@ -1162,12 +1175,12 @@ def _jm_f_64(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Object'.definitions.''
-        res = json_model_25(pval, lpath_21 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_21, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Object'.definitions.'']", lpath_21 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Object'.definitions.'']", lpath_21))
             return False
     return True
 
@@ -1227,16 +1240,16 @@ def _jm_f_71(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_22 if path is not None else None, rep):
+        lpath_22: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_22, rep):
             # handle 1 key props
             # .'$Object'.patternProperties.'$REGEX'
-            res = json_model_25(pval, lpath_22 if path is not None else None, rep)
+            res = json_model_25(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Object'.patternProperties.'$REGEX']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Object'.patternProperties.'$REGEX']", lpath_22))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Object'.patternProperties]", lpath_22 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Object'.patternProperties]", lpath_22))
             return False
     return True
 
@@ -1248,12 +1261,12 @@ def _jm_f_72(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Object'.properties.''
-        res = json_model_25(pval, lpath_23 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_23, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Object'.properties.'']", lpath_23 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Object'.properties.'']", lpath_23))
             return False
     return True
 
@@ -1271,11 +1284,11 @@ def _jm_f_74(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_5_idx, arr_5_item in enumerate(val):
-            arr_5_lpath: Path = (path + [ arr_5_idx ]) if path is not None else None
+            arr_5_lpath: Path = (path, arr_5_idx) if path is not None else None
             # .'$Object'.required.0
             res = isinstance(arr_5_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Object'.required.0]", arr_5_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Object'.required.0]", arr_5_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Object'.required]", path))
@@ -1308,24 +1321,24 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Object'.type
             res = isinstance(pval, str) and pval == "object"
             if not res:
-                rep is None or rep.append(("unexpected object [.'$Object'.type]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Object'.type]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected object [.'$Object'.type]", lpath_18))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Object'.type]", lpath_18))
                 return False
             continue
         if pfun := json_model_12_map.get(prop):
             # handle 24 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_18 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Object']", lpath_18 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_18, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Object']", lpath_18))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Object']", lpath_18 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Object']", lpath_18))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1358,12 +1371,12 @@ def _jm_f_79(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Integer'.'$defs'.''
-        res = json_model_25(pval, lpath_25 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_25, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Integer'.'$defs'.'']", lpath_25 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Integer'.'$defs'.'']", lpath_25))
             return False
     return True
 
@@ -1399,16 +1412,16 @@ def _jm_f_83(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_26: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_26 if path is not None else None, rep):
+        lpath_26: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_26, rep):
             # handle 1 key props
             # .'$Integer'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Integer'.'$vocabulary'.'$URI']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Integer'.'$vocabulary'.'$URI']", lpath_26))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Integer'.'$vocabulary']", lpath_26 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Integer'.'$vocabulary']", lpath_26))
             return False
     return True
 
@@ -1427,12 +1440,12 @@ def _jm_f_85(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_27: Path = (path + [ prop ]) if path is not None else None
+        lpath_27: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Integer'.definitions.''
-        res = json_model_25(pval, lpath_27 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_27, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Integer'.definitions.'']", lpath_27 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Integer'.definitions.'']", lpath_27))
             return False
     return True
 
@@ -1519,24 +1532,24 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Integer'.type
             res = isinstance(pval, str) and pval == "integer"
             if not res:
-                rep is None or rep.append(("unexpected integer [.'$Integer'.type]", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Integer'.type]", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected integer [.'$Integer'.type]", lpath_24))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Integer'.type]", lpath_24))
                 return False
             continue
         if pfun := json_model_13_map.get(prop):
             # handle 18 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_24 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Integer']", lpath_24 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_24, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Integer']", lpath_24))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Integer']", lpath_24 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Integer']", lpath_24))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1569,12 +1582,12 @@ def _jm_f_97(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_29: Path = (path + [ prop ]) if path is not None else None
+        lpath_29: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Number'.'$defs'.''
-        res = json_model_25(pval, lpath_29 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_29, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Number'.'$defs'.'']", lpath_29 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Number'.'$defs'.'']", lpath_29))
             return False
     return True
 
@@ -1610,16 +1623,16 @@ def _jm_f_101(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_30: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_30 if path is not None else None, rep):
+        lpath_30: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_30, rep):
             # handle 1 key props
             # .'$Number'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Number'.'$vocabulary'.'$URI']", lpath_30 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Number'.'$vocabulary'.'$URI']", lpath_30))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Number'.'$vocabulary']", lpath_30 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Number'.'$vocabulary']", lpath_30))
             return False
     return True
 
@@ -1638,12 +1651,12 @@ def _jm_f_103(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_31: Path = (path + [ prop ]) if path is not None else None
+        lpath_31: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Number'.definitions.''
-        res = json_model_25(pval, lpath_31 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_31, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Number'.definitions.'']", lpath_31 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Number'.definitions.'']", lpath_31))
             return False
     return True
 
@@ -1730,24 +1743,24 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_28: Path = (path + [ prop ]) if path is not None else None
+        lpath_28: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Number'.type
             res = isinstance(pval, str) and pval == "number"
             if not res:
-                rep is None or rep.append(("unexpected number [.'$Number'.type]", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Number'.type]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected number [.'$Number'.type]", lpath_28))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Number'.type]", lpath_28))
                 return False
             continue
         if pfun := json_model_14_map.get(prop):
             # handle 18 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_28 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Number']", lpath_28 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_28, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Number']", lpath_28))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Number']", lpath_28 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Number']", lpath_28))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1780,12 +1793,12 @@ def _jm_f_115(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_33: Path = (path + [ prop ]) if path is not None else None
+        lpath_33: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Bool'.'$defs'.''
-        res = json_model_25(pval, lpath_33 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_33, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Bool'.'$defs'.'']", lpath_33 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Bool'.'$defs'.'']", lpath_33))
             return False
     return True
 
@@ -1821,16 +1834,16 @@ def _jm_f_119(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_34: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_34 if path is not None else None, rep):
+        lpath_34: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_34, rep):
             # handle 1 key props
             # .'$Bool'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Bool'.'$vocabulary'.'$URI']", lpath_34 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Bool'.'$vocabulary'.'$URI']", lpath_34))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Bool'.'$vocabulary']", lpath_34 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Bool'.'$vocabulary']", lpath_34))
             return False
     return True
 
@@ -1849,12 +1862,12 @@ def _jm_f_121(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_35: Path = (path + [ prop ]) if path is not None else None
+        lpath_35: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Bool'.definitions.''
-        res = json_model_25(pval, lpath_35 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_35, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Bool'.definitions.'']", lpath_35 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Bool'.definitions.'']", lpath_35))
             return False
     return True
 
@@ -1925,24 +1938,24 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_32: Path = (path + [ prop ]) if path is not None else None
+        lpath_32: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Bool'.type
             res = isinstance(pval, str) and pval == "boolean"
             if not res:
-                rep is None or rep.append(("unexpected boolean [.'$Bool'.type]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Bool'.type]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected boolean [.'$Bool'.type]", lpath_32))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Bool'.type]", lpath_32))
                 return False
             continue
         if pfun := json_model_15_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_32 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Bool']", lpath_32 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_32, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Bool']", lpath_32))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Bool']", lpath_32 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Bool']", lpath_32))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1975,12 +1988,12 @@ def _jm_f_131(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_37: Path = (path + [ prop ]) if path is not None else None
+        lpath_37: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Null'.'$defs'.''
-        res = json_model_25(pval, lpath_37 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_37, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Null'.'$defs'.'']", lpath_37 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Null'.'$defs'.'']", lpath_37))
             return False
     return True
 
@@ -2016,16 +2029,16 @@ def _jm_f_135(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_38: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_38 if path is not None else None, rep):
+        lpath_38: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_38, rep):
             # handle 1 key props
             # .'$Null'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Null'.'$vocabulary'.'$URI']", lpath_38 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Null'.'$vocabulary'.'$URI']", lpath_38))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Null'.'$vocabulary']", lpath_38 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Null'.'$vocabulary']", lpath_38))
             return False
     return True
 
@@ -2044,12 +2057,12 @@ def _jm_f_137(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_39: Path = (path + [ prop ]) if path is not None else None
+        lpath_39: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Null'.definitions.''
-        res = json_model_25(pval, lpath_39 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_39, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Null'.definitions.'']", lpath_39 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Null'.definitions.'']", lpath_39))
             return False
     return True
 
@@ -2120,24 +2133,24 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_36: Path = (path + [ prop ]) if path is not None else None
+        lpath_36: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Null'.type
             res = isinstance(pval, str) and pval == "null"
             if not res:
-                rep is None or rep.append(("unexpected null [.'$Null'.type]", lpath_36 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Null'.type]", lpath_36 if path is not None else None))
+                rep is None or rep.append(("unexpected null [.'$Null'.type]", lpath_36))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Null'.type]", lpath_36))
                 return False
             continue
         if pfun := json_model_16_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_36 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Null']", lpath_36 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_36, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Null']", lpath_36))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Null']", lpath_36 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Null']", lpath_36))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2170,12 +2183,12 @@ def _jm_f_147(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_41: Path = (path + [ prop ]) if path is not None else None
+        lpath_41: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$AllOf'.'$defs'.''
-        res = json_model_25(pval, lpath_41 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_41, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$AllOf'.'$defs'.'']", lpath_41 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$AllOf'.'$defs'.'']", lpath_41))
             return False
     return True
 
@@ -2211,16 +2224,16 @@ def _jm_f_151(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_42: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_42 if path is not None else None, rep):
+        lpath_42: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_42, rep):
             # handle 1 key props
             # .'$AllOf'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$AllOf'.'$vocabulary'.'$URI']", lpath_42 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$AllOf'.'$vocabulary'.'$URI']", lpath_42))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$AllOf'.'$vocabulary']", lpath_42 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$AllOf'.'$vocabulary']", lpath_42))
             return False
     return True
 
@@ -2239,12 +2252,12 @@ def _jm_f_153(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_43: Path = (path + [ prop ]) if path is not None else None
+        lpath_43: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$AllOf'.definitions.''
-        res = json_model_25(pval, lpath_43 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_43, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$AllOf'.definitions.'']", lpath_43 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$AllOf'.definitions.'']", lpath_43))
             return False
     return True
 
@@ -2315,24 +2328,24 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_40: Path = (path + [ prop ]) if path is not None else None
+        lpath_40: Path = (path, prop) if path is not None else None
         if prop == "allOf":
             # handle must allOf property
             must_count += 1
             # .'$AllOf'.allOf
-            res = json_model_4(pval, lpath_40 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_40, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$AllOf'.allOf]", lpath_40 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$AllOf'.allOf]", lpath_40 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$AllOf'.allOf]", lpath_40))
+                rep is None or rep.append(("invalid mandatory prop value [.'$AllOf'.allOf]", lpath_40))
                 return False
             continue
         if pfun := json_model_17_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_40 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf']", lpath_40 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_40, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf']", lpath_40))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AllOf']", lpath_40 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AllOf']", lpath_40))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2365,12 +2378,12 @@ def _jm_f_163(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_45: Path = (path + [ prop ]) if path is not None else None
+        lpath_45: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$AnyOf'.'$defs'.''
-        res = json_model_25(pval, lpath_45 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_45, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$AnyOf'.'$defs'.'']", lpath_45 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$AnyOf'.'$defs'.'']", lpath_45))
             return False
     return True
 
@@ -2406,16 +2419,16 @@ def _jm_f_167(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_46: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_46 if path is not None else None, rep):
+        lpath_46: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_46, rep):
             # handle 1 key props
             # .'$AnyOf'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$AnyOf'.'$vocabulary'.'$URI']", lpath_46 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$AnyOf'.'$vocabulary'.'$URI']", lpath_46))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$AnyOf'.'$vocabulary']", lpath_46 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$AnyOf'.'$vocabulary']", lpath_46))
             return False
     return True
 
@@ -2434,12 +2447,12 @@ def _jm_f_169(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_47: Path = (path + [ prop ]) if path is not None else None
+        lpath_47: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$AnyOf'.definitions.''
-        res = json_model_25(pval, lpath_47 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_47, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$AnyOf'.definitions.'']", lpath_47 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$AnyOf'.definitions.'']", lpath_47))
             return False
     return True
 
@@ -2510,24 +2523,24 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_44: Path = (path + [ prop ]) if path is not None else None
+        lpath_44: Path = (path, prop) if path is not None else None
         if prop == "anyOf":
             # handle must anyOf property
             must_count += 1
             # .'$AnyOf'.anyOf
-            res = json_model_4(pval, lpath_44 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_44, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$AnyOf'.anyOf]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$AnyOf'.anyOf]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$AnyOf'.anyOf]", lpath_44))
+                rep is None or rep.append(("invalid mandatory prop value [.'$AnyOf'.anyOf]", lpath_44))
                 return False
             continue
         if pfun := json_model_18_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_44 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf']", lpath_44 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_44, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf']", lpath_44))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AnyOf']", lpath_44 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AnyOf']", lpath_44))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2560,12 +2573,12 @@ def _jm_f_179(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_49: Path = (path + [ prop ]) if path is not None else None
+        lpath_49: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$OneOf'.'$defs'.''
-        res = json_model_25(pval, lpath_49 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_49, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$OneOf'.'$defs'.'']", lpath_49 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$OneOf'.'$defs'.'']", lpath_49))
             return False
     return True
 
@@ -2601,16 +2614,16 @@ def _jm_f_183(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_50: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_50 if path is not None else None, rep):
+        lpath_50: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_50, rep):
             # handle 1 key props
             # .'$OneOf'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$OneOf'.'$vocabulary'.'$URI']", lpath_50 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$OneOf'.'$vocabulary'.'$URI']", lpath_50))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$OneOf'.'$vocabulary']", lpath_50 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$OneOf'.'$vocabulary']", lpath_50))
             return False
     return True
 
@@ -2629,12 +2642,12 @@ def _jm_f_185(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_51: Path = (path + [ prop ]) if path is not None else None
+        lpath_51: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$OneOf'.definitions.''
-        res = json_model_25(pval, lpath_51 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_51, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$OneOf'.definitions.'']", lpath_51 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$OneOf'.definitions.'']", lpath_51))
             return False
     return True
 
@@ -2705,24 +2718,24 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_48: Path = (path + [ prop ]) if path is not None else None
+        lpath_48: Path = (path, prop) if path is not None else None
         if prop == "oneOf":
             # handle must oneOf property
             must_count += 1
             # .'$OneOf'.oneOf
-            res = json_model_4(pval, lpath_48 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_48, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$OneOf'.oneOf]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$OneOf'.oneOf]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$OneOf'.oneOf]", lpath_48))
+                rep is None or rep.append(("invalid mandatory prop value [.'$OneOf'.oneOf]", lpath_48))
                 return False
             continue
         if pfun := json_model_19_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_48 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf']", lpath_48 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_48, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf']", lpath_48))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$OneOf']", lpath_48 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$OneOf']", lpath_48))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2755,12 +2768,12 @@ def _jm_f_195(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_53: Path = (path + [ prop ]) if path is not None else None
+        lpath_53: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Enum'.'$defs'.''
-        res = json_model_25(pval, lpath_53 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_53, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Enum'.'$defs'.'']", lpath_53 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Enum'.'$defs'.'']", lpath_53))
             return False
     return True
 
@@ -2796,16 +2809,16 @@ def _jm_f_199(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_54: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_54 if path is not None else None, rep):
+        lpath_54: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_54, rep):
             # handle 1 key props
             # .'$Enum'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Enum'.'$vocabulary'.'$URI']", lpath_54 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Enum'.'$vocabulary'.'$URI']", lpath_54))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Enum'.'$vocabulary']", lpath_54 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Enum'.'$vocabulary']", lpath_54))
             return False
     return True
 
@@ -2824,12 +2837,12 @@ def _jm_f_201(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_55: Path = (path + [ prop ]) if path is not None else None
+        lpath_55: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Enum'.definitions.''
-        res = json_model_25(pval, lpath_55 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_55, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Enum'.definitions.'']", lpath_55 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Enum'.definitions.'']", lpath_55))
             return False
     return True
 
@@ -2900,24 +2913,24 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_52: Path = (path + [ prop ]) if path is not None else None
+        lpath_52: Path = (path, prop) if path is not None else None
         if prop == "enum":
             # handle must enum property
             must_count += 1
             # .'$Enum'.enum
-            res = json_model_3(pval, lpath_52 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_52, rep)
             if not res:
-                rep is None or rep.append(("unexpected $enum [.'$Enum'.enum]", lpath_52 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Enum'.enum]", lpath_52 if path is not None else None))
+                rep is None or rep.append(("unexpected $enum [.'$Enum'.enum]", lpath_52))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Enum'.enum]", lpath_52))
                 return False
             continue
         if pfun := json_model_20_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_52 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Enum']", lpath_52 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_52, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Enum']", lpath_52))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Enum']", lpath_52 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Enum']", lpath_52))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2950,12 +2963,12 @@ def _jm_f_211(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_57: Path = (path + [ prop ]) if path is not None else None
+        lpath_57: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Const'.'$defs'.''
-        res = json_model_25(pval, lpath_57 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_57, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Const'.'$defs'.'']", lpath_57 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Const'.'$defs'.'']", lpath_57))
             return False
     return True
 
@@ -2991,16 +3004,16 @@ def _jm_f_215(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_58: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_58 if path is not None else None, rep):
+        lpath_58: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_58, rep):
             # handle 1 key props
             # .'$Const'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Const'.'$vocabulary'.'$URI']", lpath_58 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Const'.'$vocabulary'.'$URI']", lpath_58))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Const'.'$vocabulary']", lpath_58 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Const'.'$vocabulary']", lpath_58))
             return False
     return True
 
@@ -3019,12 +3032,12 @@ def _jm_f_217(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_59: Path = (path + [ prop ]) if path is not None else None
+        lpath_59: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Const'.definitions.''
-        res = json_model_25(pval, lpath_59 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_59, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Const'.definitions.'']", lpath_59 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Const'.definitions.'']", lpath_59))
             return False
     return True
 
@@ -3095,24 +3108,24 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_56: Path = (path + [ prop ]) if path is not None else None
+        lpath_56: Path = (path, prop) if path is not None else None
         if prop == "const":
             # handle must const property
             must_count += 1
             # .'$Const'.const
-            res = json_model_2(pval, lpath_56 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_56, rep)
             if not res:
-                rep is None or rep.append(("unexpected $const [.'$Const'.const]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Const'.const]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected $const [.'$Const'.const]", lpath_56))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Const'.const]", lpath_56))
                 return False
             continue
         if pfun := json_model_21_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_56 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Const']", lpath_56 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_56, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Const']", lpath_56))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Const']", lpath_56 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Const']", lpath_56))
         return False
     if must_count != 1:
         if rep is not None:
@@ -3145,12 +3158,12 @@ def _jm_f_227(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_61: Path = (path + [ prop ]) if path is not None else None
+        lpath_61: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Ref'.'$defs'.''
-        res = json_model_25(pval, lpath_61 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_61, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Ref'.'$defs'.'']", lpath_61 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Ref'.'$defs'.'']", lpath_61))
             return False
     return True
 
@@ -3186,16 +3199,16 @@ def _jm_f_231(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_62: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_62 if path is not None else None, rep):
+        lpath_62: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_62, rep):
             # handle 1 key props
             # .'$Ref'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Ref'.'$vocabulary'.'$URI']", lpath_62 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Ref'.'$vocabulary'.'$URI']", lpath_62))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Ref'.'$vocabulary']", lpath_62 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Ref'.'$vocabulary']", lpath_62))
             return False
     return True
 
@@ -3214,12 +3227,12 @@ def _jm_f_233(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_63: Path = (path + [ prop ]) if path is not None else None
+        lpath_63: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Ref'.definitions.''
-        res = json_model_25(pval, lpath_63 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_63, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Ref'.definitions.'']", lpath_63 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Ref'.definitions.'']", lpath_63))
             return False
     return True
 
@@ -3290,24 +3303,24 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_60: Path = (path + [ prop ]) if path is not None else None
+        lpath_60: Path = (path, prop) if path is not None else None
         if prop == "$ref":
             # handle must $ref property
             must_count += 1
             # .'$Ref'.'$ref'
-            res = is_valid_url(pval, lpath_60 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_60, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI [.'$Ref'.'$ref']", lpath_60 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Ref'.'$ref']", lpath_60 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI [.'$Ref'.'$ref']", lpath_60))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Ref'.'$ref']", lpath_60))
                 return False
             continue
         if pfun := json_model_22_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_60 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Ref']", lpath_60 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_60, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Ref']", lpath_60))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Ref']", lpath_60 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Ref']", lpath_60))
         return False
     if must_count != 1:
         if rep is not None:
@@ -3340,12 +3353,12 @@ def _jm_f_243(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_65: Path = (path + [ prop ]) if path is not None else None
+        lpath_65: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$DynRef'.'$defs'.''
-        res = json_model_25(pval, lpath_65 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_65, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$DynRef'.'$defs'.'']", lpath_65 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$DynRef'.'$defs'.'']", lpath_65))
             return False
     return True
 
@@ -3381,16 +3394,16 @@ def _jm_f_247(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_66: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_66 if path is not None else None, rep):
+        lpath_66: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_66, rep):
             # handle 1 key props
             # .'$DynRef'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$DynRef'.'$vocabulary'.'$URI']", lpath_66 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$DynRef'.'$vocabulary'.'$URI']", lpath_66))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$DynRef'.'$vocabulary']", lpath_66 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$DynRef'.'$vocabulary']", lpath_66))
             return False
     return True
 
@@ -3409,12 +3422,12 @@ def _jm_f_249(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_67: Path = (path + [ prop ]) if path is not None else None
+        lpath_67: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$DynRef'.definitions.''
-        res = json_model_25(pval, lpath_67 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_67, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$DynRef'.definitions.'']", lpath_67 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$DynRef'.definitions.'']", lpath_67))
             return False
     return True
 
@@ -3485,24 +3498,24 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_64: Path = (path + [ prop ]) if path is not None else None
+        lpath_64: Path = (path, prop) if path is not None else None
         if prop == "$dynamicRef":
             # handle must $dynamicRef property
             must_count += 1
             # .'$DynRef'.'$dynamicRef'
-            res = is_valid_url(pval, lpath_64 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_64, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI [.'$DynRef'.'$dynamicRef']", lpath_64 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$DynRef'.'$dynamicRef']", lpath_64 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI [.'$DynRef'.'$dynamicRef']", lpath_64))
+                rep is None or rep.append(("invalid mandatory prop value [.'$DynRef'.'$dynamicRef']", lpath_64))
                 return False
             continue
         if pfun := json_model_23_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_64 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$DynRef']", lpath_64 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_64, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$DynRef']", lpath_64))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$DynRef']", lpath_64 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$DynRef']", lpath_64))
         return False
     if must_count != 1:
         if rep is not None:
@@ -3564,12 +3577,12 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("$schema", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <$schema> [.'$RootSchema'.'&'.0]", path))
         return False
-    lpath = (path + [ "$schema" ]) if path is not None else None
+    lpath = (path, "$schema") if path is not None else None
     # .'$RootSchema'.'&'.0.'$schema'
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$RootSchema'.'&'.0.'$schema']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <$schema> [.'$RootSchema'.'&'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$RootSchema'.'&'.0.'$schema']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <$schema> [.'$RootSchema'.'&'.0]", lpath))
         return False
     return True
 
@@ -3971,5 +3984,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: dict[str, str]
 _jm_cst_0: set[str]
@@ -57,12 +70,12 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("$schema", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <$schema> [.'$tight#RootSchema'.'&'.0]", path))
         return False
-    lpath = (path + [ "$schema" ]) if path is not None else None
+    lpath = (path, "$schema") if path is not None else None
     # .'$tight#RootSchema'.'&'.0.'$schema'
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$tight#RootSchema'.'&'.0.'$schema']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <$schema> [.'$tight#RootSchema'.'&'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$tight#RootSchema'.'&'.0.'$schema']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <$schema> [.'$tight#RootSchema'.'&'.0]", lpath))
         return False
     return True
 
@@ -118,12 +131,12 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#metas'.'$defs'.''
-        res = json_model_26(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#metas'.'$defs'.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#metas'.'$defs'.'']", lpath_1))
             return False
     return True
 
@@ -134,12 +147,12 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#metas'.definitions.''
-        res = json_model_26(pval, lpath_2 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_2, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#metas'.definitions.'']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#metas'.definitions.'']", lpath_2))
             return False
     return True
 
@@ -152,14 +165,14 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "id":
             # handle may id property
             # .'$tight#metas'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#metas'.id]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.id]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#metas'.id]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.id]", lpath_0))
                 return False
             continue
         elif prop == "$id":
@@ -167,17 +180,17 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#metas'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#metas'.'$id']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.'$id']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#metas'.'$id']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.'$id']", lpath_0))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#metas'.'$defs'
-            res = _jm_obj_1(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_1(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#metas'.'$defs']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.'$defs']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#metas'.'$defs']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.'$defs']", lpath_0))
                 return False
             continue
         elif prop == "title":
@@ -185,8 +198,8 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#metas'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#metas'.title]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.title]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#metas'.title]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.title]", lpath_0))
                 return False
             continue
         elif prop == "$schema":
@@ -194,8 +207,8 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#metas'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#metas'.'$schema']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.'$schema']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#metas'.'$schema']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.'$schema']", lpath_0))
                 return False
             continue
         elif prop == "default":
@@ -208,8 +221,8 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#metas'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#metas'.'$comment']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.'$comment']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#metas'.'$comment']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.'$comment']", lpath_0))
                 return False
             continue
         elif prop == "examples":
@@ -217,17 +230,17 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#metas'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#metas'.examples]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.examples]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#metas'.examples]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.examples]", lpath_0))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#metas'.definitions
-            res = _jm_obj_2(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#metas'.definitions]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.definitions]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#metas'.definitions]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.definitions]", lpath_0))
                 return False
             continue
         elif prop == "description":
@@ -235,11 +248,11 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#metas'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#metas'.description]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.description]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#metas'.description]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#metas'.description]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#metas']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#metas']", lpath_0))
         return False
     return True
 
@@ -259,12 +272,12 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#String'.'$defs'.''
-        res = json_model_26(pval, lpath_4 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_4, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#String'.'$defs'.'']", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#String'.'$defs'.'']", lpath_4))
             return False
     return True
 
@@ -299,12 +312,12 @@ def _jm_f_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#String'.definitions.''
-        res = json_model_26(pval, lpath_5 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_5, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#String'.definitions.'']", lpath_5 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#String'.definitions.'']", lpath_5))
             return False
     return True
 
@@ -384,24 +397,24 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#String'.type
             res = isinstance(pval, str) and pval == "string"
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#String'.type]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#String'.type]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#String'.type]", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#String'.type]", lpath_3))
                 return False
             continue
         if pfun := json_model_12_map.get(prop):
             # handle 14 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_3 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$tight#String']", lpath_3 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_3, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$tight#String']", lpath_3))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#String']", lpath_3 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#String']", lpath_3))
         return False
     if must_count != 1:
         if rep is not None:
@@ -426,12 +439,12 @@ def _jm_f_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Array'.'$defs'.''
-        res = json_model_26(pval, lpath_7 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_7, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Array'.'$defs'.'']", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Array'.'$defs'.'']", lpath_7))
             return False
     return True
 
@@ -466,12 +479,12 @@ def _jm_f_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Array'.definitions.''
-        res = json_model_26(pval, lpath_8 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_8, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Array'.definitions.'']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Array'.definitions.'']", lpath_8))
             return False
     return True
 
@@ -559,24 +572,24 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#Array'.type
             res = isinstance(pval, str) and pval == "array"
             if not res:
-                rep is None or rep.append(("unexpected array [.'$tight#Array'.type]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Array'.type]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected array [.'$tight#Array'.type]", lpath_6))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Array'.type]", lpath_6))
                 return False
             continue
         if pfun := json_model_13_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_6 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Array']", lpath_6 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_6, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Array']", lpath_6))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#Array']", lpath_6 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#Array']", lpath_6))
         return False
     if must_count != 1:
         if rep is not None:
@@ -591,11 +604,11 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$tight#schemaArray'.0
-            res = json_model_26(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_26(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$tight#schemaArray'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$tight#schemaArray'.0]", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$tight#schemaArray']", path))
@@ -617,12 +630,12 @@ def _jm_f_29(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Object'.'$defs'.''
-        res = json_model_26(pval, lpath_10 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_10, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Object'.'$defs'.'']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Object'.'$defs'.'']", lpath_10))
             return False
     return True
 
@@ -657,12 +670,12 @@ def _jm_f_33(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Object'.definitions.''
-        res = json_model_26(pval, lpath_11 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_11, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Object'.definitions.'']", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Object'.definitions.'']", lpath_11))
             return False
     return True
 
@@ -698,16 +711,16 @@ def _jm_f_37(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_12 if path is not None else None, rep):
+        lpath_12: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_12, rep):
             # handle 1 key props
             # .'$tight#Object'.patternProperties.'$REGEX'
-            res = json_model_26(pval, lpath_12 if path is not None else None, rep)
+            res = json_model_26(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$tight#Object'.patternProperties.'$REGEX']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$tight#Object'.patternProperties.'$REGEX']", lpath_12))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$tight#Object'.patternProperties]", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$tight#Object'.patternProperties]", lpath_12))
             return False
     return True
 
@@ -719,12 +732,12 @@ def _jm_f_38(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Object'.properties.''
-        res = json_model_26(pval, lpath_13 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_13, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Object'.properties.'']", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Object'.properties.'']", lpath_13))
             return False
     return True
 
@@ -734,11 +747,11 @@ def _jm_f_39(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$tight#Object'.required.0
             res = isinstance(arr_1_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Object'.required.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Object'.required.0]", arr_1_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$tight#Object'.required]", path))
@@ -763,24 +776,24 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#Object'.type
             res = isinstance(pval, str) and pval == "object"
             if not res:
-                rep is None or rep.append(("unexpected object [.'$tight#Object'.type]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Object'.type]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected object [.'$tight#Object'.type]", lpath_9))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Object'.type]", lpath_9))
                 return False
             continue
         if pfun := json_model_14_map.get(prop):
             # handle 14 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_9 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Object']", lpath_9 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_9, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Object']", lpath_9))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#Object']", lpath_9 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#Object']", lpath_9))
         return False
     if must_count != 1:
         if rep is not None:
@@ -805,12 +818,12 @@ def _jm_f_42(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Integer'.'$defs'.''
-        res = json_model_26(pval, lpath_15 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_15, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Integer'.'$defs'.'']", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Integer'.'$defs'.'']", lpath_15))
             return False
     return True
 
@@ -845,12 +858,12 @@ def _jm_f_46(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Integer'.definitions.''
-        res = json_model_26(pval, lpath_16 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_16, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Integer'.definitions.'']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Integer'.definitions.'']", lpath_16))
             return False
     return True
 
@@ -913,24 +926,24 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#Integer'.type
             res = isinstance(pval, str) and pval == "integer"
             if not res:
-                rep is None or rep.append(("unexpected integer [.'$tight#Integer'.type]", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Integer'.type]", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected integer [.'$tight#Integer'.type]", lpath_14))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Integer'.type]", lpath_14))
                 return False
             continue
         if pfun := json_model_15_map.get(prop):
             # handle 12 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_14 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Integer']", lpath_14 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_14, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Integer']", lpath_14))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#Integer']", lpath_14 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#Integer']", lpath_14))
         return False
     if must_count != 1:
         if rep is not None:
@@ -955,12 +968,12 @@ def _jm_f_54(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Number'.'$defs'.''
-        res = json_model_26(pval, lpath_18 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_18, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Number'.'$defs'.'']", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Number'.'$defs'.'']", lpath_18))
             return False
     return True
 
@@ -995,12 +1008,12 @@ def _jm_f_58(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Number'.definitions.''
-        res = json_model_26(pval, lpath_19 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_19, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Number'.definitions.'']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Number'.definitions.'']", lpath_19))
             return False
     return True
 
@@ -1063,24 +1076,24 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#Number'.type
             res = isinstance(pval, str) and pval == "number"
             if not res:
-                rep is None or rep.append(("unexpected number [.'$tight#Number'.type]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Number'.type]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected number [.'$tight#Number'.type]", lpath_17))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Number'.type]", lpath_17))
                 return False
             continue
         if pfun := json_model_16_map.get(prop):
             # handle 12 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_17 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Number']", lpath_17 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_17, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Number']", lpath_17))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#Number']", lpath_17 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#Number']", lpath_17))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1096,12 +1109,12 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Bool'.'$defs'.''
-        res = json_model_26(pval, lpath_21 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_21, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Bool'.'$defs'.'']", lpath_21 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Bool'.'$defs'.'']", lpath_21))
             return False
     return True
 
@@ -1112,12 +1125,12 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
+        lpath_22: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Bool'.definitions.''
-        res = json_model_26(pval, lpath_22 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_22, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Bool'.definitions.'']", lpath_22 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Bool'.definitions.'']", lpath_22))
             return False
     return True
 
@@ -1130,15 +1143,15 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#Bool'.type
             res = isinstance(pval, str) and pval == "boolean"
             if not res:
-                rep is None or rep.append(("unexpected boolean [.'$tight#Bool'.type]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Bool'.type]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected boolean [.'$tight#Bool'.type]", lpath_20))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Bool'.type]", lpath_20))
                 return False
             continue
         if prop == "id":
@@ -1146,8 +1159,8 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Bool'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Bool'.id]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.id]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Bool'.id]", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.id]", lpath_20))
                 return False
             continue
         elif prop == "$id":
@@ -1155,17 +1168,17 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Bool'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Bool'.'$id']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.'$id']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Bool'.'$id']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.'$id']", lpath_20))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#Bool'.'$defs'
-            res = _jm_obj_3(pval, lpath_20 if path is not None else None, rep)
+            res = _jm_obj_3(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Bool'.'$defs']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.'$defs']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Bool'.'$defs']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.'$defs']", lpath_20))
                 return False
             continue
         elif prop == "title":
@@ -1173,8 +1186,8 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Bool'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Bool'.title]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.title]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Bool'.title]", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.title]", lpath_20))
                 return False
             continue
         elif prop == "$schema":
@@ -1182,8 +1195,8 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Bool'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Bool'.'$schema']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.'$schema']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Bool'.'$schema']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.'$schema']", lpath_20))
                 return False
             continue
         elif prop == "default":
@@ -1196,8 +1209,8 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Bool'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Bool'.'$comment']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.'$comment']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Bool'.'$comment']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.'$comment']", lpath_20))
                 return False
             continue
         elif prop == "examples":
@@ -1205,17 +1218,17 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Bool'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#Bool'.examples]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.examples]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#Bool'.examples]", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.examples]", lpath_20))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#Bool'.definitions
-            res = _jm_obj_4(pval, lpath_20 if path is not None else None, rep)
+            res = _jm_obj_4(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Bool'.definitions]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.definitions]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Bool'.definitions]", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.definitions]", lpath_20))
                 return False
             continue
         elif prop == "description":
@@ -1223,11 +1236,11 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Bool'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Bool'.description]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.description]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Bool'.description]", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Bool'.description]", lpath_20))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#Bool']", lpath_20 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#Bool']", lpath_20))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1243,12 +1256,12 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Null'.'$defs'.''
-        res = json_model_26(pval, lpath_24 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_24, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Null'.'$defs'.'']", lpath_24 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Null'.'$defs'.'']", lpath_24))
             return False
     return True
 
@@ -1259,12 +1272,12 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Null'.definitions.''
-        res = json_model_26(pval, lpath_25 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_25, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Null'.definitions.'']", lpath_25 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Null'.definitions.'']", lpath_25))
             return False
     return True
 
@@ -1277,15 +1290,15 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#Null'.type
             res = isinstance(pval, str) and pval == "null"
             if not res:
-                rep is None or rep.append(("unexpected null [.'$tight#Null'.type]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Null'.type]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected null [.'$tight#Null'.type]", lpath_23))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Null'.type]", lpath_23))
                 return False
             continue
         if prop == "id":
@@ -1293,8 +1306,8 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Null'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Null'.id]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.id]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Null'.id]", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.id]", lpath_23))
                 return False
             continue
         elif prop == "$id":
@@ -1302,17 +1315,17 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Null'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Null'.'$id']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.'$id']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Null'.'$id']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.'$id']", lpath_23))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#Null'.'$defs'
-            res = _jm_obj_5(pval, lpath_23 if path is not None else None, rep)
+            res = _jm_obj_5(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Null'.'$defs']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.'$defs']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Null'.'$defs']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.'$defs']", lpath_23))
                 return False
             continue
         elif prop == "title":
@@ -1320,8 +1333,8 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Null'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Null'.title]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.title]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Null'.title]", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.title]", lpath_23))
                 return False
             continue
         elif prop == "$schema":
@@ -1329,8 +1342,8 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Null'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Null'.'$schema']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.'$schema']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Null'.'$schema']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.'$schema']", lpath_23))
                 return False
             continue
         elif prop == "default":
@@ -1343,8 +1356,8 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Null'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Null'.'$comment']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.'$comment']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Null'.'$comment']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.'$comment']", lpath_23))
                 return False
             continue
         elif prop == "examples":
@@ -1352,17 +1365,17 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Null'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#Null'.examples]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.examples]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#Null'.examples]", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.examples]", lpath_23))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#Null'.definitions
-            res = _jm_obj_6(pval, lpath_23 if path is not None else None, rep)
+            res = _jm_obj_6(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Null'.definitions]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.definitions]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Null'.definitions]", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.definitions]", lpath_23))
                 return False
             continue
         elif prop == "description":
@@ -1370,11 +1383,11 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Null'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Null'.description]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.description]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Null'.description]", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Null'.description]", lpath_23))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#Null']", lpath_23 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#Null']", lpath_23))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1390,12 +1403,12 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_27: Path = (path + [ prop ]) if path is not None else None
+        lpath_27: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#AllOf'.'$defs'.''
-        res = json_model_26(pval, lpath_27 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_27, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#AllOf'.'$defs'.'']", lpath_27 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#AllOf'.'$defs'.'']", lpath_27))
             return False
     return True
 
@@ -1406,12 +1419,12 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_28: Path = (path + [ prop ]) if path is not None else None
+        lpath_28: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#AllOf'.definitions.''
-        res = json_model_26(pval, lpath_28 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_28, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#AllOf'.definitions.'']", lpath_28 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#AllOf'.definitions.'']", lpath_28))
             return False
     return True
 
@@ -1424,15 +1437,15 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_26: Path = (path + [ prop ]) if path is not None else None
+        lpath_26: Path = (path, prop) if path is not None else None
         if prop == "allOf":
             # handle must allOf property
             must_count += 1
             # .'$tight#AllOf'.allOf
-            res = json_model_6(pval, lpath_26 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$tight#AllOf'.allOf]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#AllOf'.allOf]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$tight#AllOf'.allOf]", lpath_26))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#AllOf'.allOf]", lpath_26))
                 return False
             continue
         if prop == "id":
@@ -1440,8 +1453,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AllOf'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.id]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.id]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.id]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.id]", lpath_26))
                 return False
             continue
         elif prop == "$id":
@@ -1449,17 +1462,17 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AllOf'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.'$id']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.'$id']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.'$id']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.'$id']", lpath_26))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#AllOf'.'$defs'
-            res = _jm_obj_7(pval, lpath_26 if path is not None else None, rep)
+            res = _jm_obj_7(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#AllOf'.'$defs']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.'$defs']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#AllOf'.'$defs']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.'$defs']", lpath_26))
                 return False
             continue
         elif prop == "title":
@@ -1467,8 +1480,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AllOf'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.title]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.title]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.title]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.title]", lpath_26))
                 return False
             continue
         elif prop == "$schema":
@@ -1476,8 +1489,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AllOf'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.'$schema']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.'$schema']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.'$schema']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.'$schema']", lpath_26))
                 return False
             continue
         elif prop == "default":
@@ -1490,8 +1503,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AllOf'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.'$comment']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.'$comment']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.'$comment']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.'$comment']", lpath_26))
                 return False
             continue
         elif prop == "examples":
@@ -1499,17 +1512,17 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AllOf'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#AllOf'.examples]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.examples]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#AllOf'.examples]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.examples]", lpath_26))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#AllOf'.definitions
-            res = _jm_obj_8(pval, lpath_26 if path is not None else None, rep)
+            res = _jm_obj_8(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#AllOf'.definitions]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.definitions]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#AllOf'.definitions]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.definitions]", lpath_26))
                 return False
             continue
         elif prop == "description":
@@ -1517,11 +1530,11 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AllOf'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.description]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.description]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AllOf'.description]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AllOf'.description]", lpath_26))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#AllOf']", lpath_26 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#AllOf']", lpath_26))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1537,12 +1550,12 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_30: Path = (path + [ prop ]) if path is not None else None
+        lpath_30: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#AnyOf'.'$defs'.''
-        res = json_model_26(pval, lpath_30 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_30, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#AnyOf'.'$defs'.'']", lpath_30 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#AnyOf'.'$defs'.'']", lpath_30))
             return False
     return True
 
@@ -1553,12 +1566,12 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_31: Path = (path + [ prop ]) if path is not None else None
+        lpath_31: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#AnyOf'.definitions.''
-        res = json_model_26(pval, lpath_31 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_31, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#AnyOf'.definitions.'']", lpath_31 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#AnyOf'.definitions.'']", lpath_31))
             return False
     return True
 
@@ -1571,15 +1584,15 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_29: Path = (path + [ prop ]) if path is not None else None
+        lpath_29: Path = (path, prop) if path is not None else None
         if prop == "anyOf":
             # handle must anyOf property
             must_count += 1
             # .'$tight#AnyOf'.anyOf
-            res = json_model_6(pval, lpath_29 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$tight#AnyOf'.anyOf]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#AnyOf'.anyOf]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$tight#AnyOf'.anyOf]", lpath_29))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#AnyOf'.anyOf]", lpath_29))
                 return False
             continue
         if prop == "id":
@@ -1587,8 +1600,8 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AnyOf'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.id]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.id]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.id]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.id]", lpath_29))
                 return False
             continue
         elif prop == "$id":
@@ -1596,17 +1609,17 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AnyOf'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.'$id']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.'$id']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.'$id']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.'$id']", lpath_29))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#AnyOf'.'$defs'
-            res = _jm_obj_9(pval, lpath_29 if path is not None else None, rep)
+            res = _jm_obj_9(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#AnyOf'.'$defs']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.'$defs']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#AnyOf'.'$defs']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.'$defs']", lpath_29))
                 return False
             continue
         elif prop == "title":
@@ -1614,8 +1627,8 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AnyOf'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.title]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.title]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.title]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.title]", lpath_29))
                 return False
             continue
         elif prop == "$schema":
@@ -1623,8 +1636,8 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AnyOf'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.'$schema']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.'$schema']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.'$schema']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.'$schema']", lpath_29))
                 return False
             continue
         elif prop == "default":
@@ -1637,8 +1650,8 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AnyOf'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.'$comment']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.'$comment']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.'$comment']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.'$comment']", lpath_29))
                 return False
             continue
         elif prop == "examples":
@@ -1646,17 +1659,17 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AnyOf'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#AnyOf'.examples]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.examples]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#AnyOf'.examples]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.examples]", lpath_29))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#AnyOf'.definitions
-            res = _jm_obj_10(pval, lpath_29 if path is not None else None, rep)
+            res = _jm_obj_10(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#AnyOf'.definitions]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.definitions]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#AnyOf'.definitions]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.definitions]", lpath_29))
                 return False
             continue
         elif prop == "description":
@@ -1664,11 +1677,11 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#AnyOf'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.description]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.description]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#AnyOf'.description]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#AnyOf'.description]", lpath_29))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#AnyOf']", lpath_29 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#AnyOf']", lpath_29))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1684,12 +1697,12 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_33: Path = (path + [ prop ]) if path is not None else None
+        lpath_33: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#OneOf'.'$defs'.''
-        res = json_model_26(pval, lpath_33 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_33, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#OneOf'.'$defs'.'']", lpath_33 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#OneOf'.'$defs'.'']", lpath_33))
             return False
     return True
 
@@ -1700,12 +1713,12 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_34: Path = (path + [ prop ]) if path is not None else None
+        lpath_34: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#OneOf'.definitions.''
-        res = json_model_26(pval, lpath_34 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_34, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#OneOf'.definitions.'']", lpath_34 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#OneOf'.definitions.'']", lpath_34))
             return False
     return True
 
@@ -1718,15 +1731,15 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_32: Path = (path + [ prop ]) if path is not None else None
+        lpath_32: Path = (path, prop) if path is not None else None
         if prop == "oneOf":
             # handle must oneOf property
             must_count += 1
             # .'$tight#OneOf'.oneOf
-            res = json_model_6(pval, lpath_32 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_32, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$tight#OneOf'.oneOf]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#OneOf'.oneOf]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$tight#OneOf'.oneOf]", lpath_32))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#OneOf'.oneOf]", lpath_32))
                 return False
             continue
         if prop == "id":
@@ -1734,8 +1747,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#OneOf'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.id]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.id]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.id]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.id]", lpath_32))
                 return False
             continue
         elif prop == "$id":
@@ -1743,17 +1756,17 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#OneOf'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.'$id']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.'$id']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.'$id']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.'$id']", lpath_32))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#OneOf'.'$defs'
-            res = _jm_obj_11(pval, lpath_32 if path is not None else None, rep)
+            res = _jm_obj_11(pval, lpath_32, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#OneOf'.'$defs']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.'$defs']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#OneOf'.'$defs']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.'$defs']", lpath_32))
                 return False
             continue
         elif prop == "title":
@@ -1761,8 +1774,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#OneOf'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.title]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.title]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.title]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.title]", lpath_32))
                 return False
             continue
         elif prop == "$schema":
@@ -1770,8 +1783,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#OneOf'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.'$schema']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.'$schema']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.'$schema']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.'$schema']", lpath_32))
                 return False
             continue
         elif prop == "default":
@@ -1784,8 +1797,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#OneOf'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.'$comment']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.'$comment']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.'$comment']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.'$comment']", lpath_32))
                 return False
             continue
         elif prop == "examples":
@@ -1793,17 +1806,17 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#OneOf'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#OneOf'.examples]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.examples]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#OneOf'.examples]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.examples]", lpath_32))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#OneOf'.definitions
-            res = _jm_obj_12(pval, lpath_32 if path is not None else None, rep)
+            res = _jm_obj_12(pval, lpath_32, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#OneOf'.definitions]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.definitions]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#OneOf'.definitions]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.definitions]", lpath_32))
                 return False
             continue
         elif prop == "description":
@@ -1811,11 +1824,11 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#OneOf'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.description]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.description]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#OneOf'.description]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#OneOf'.description]", lpath_32))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#OneOf']", lpath_32 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#OneOf']", lpath_32))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1831,12 +1844,12 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_36: Path = (path + [ prop ]) if path is not None else None
+        lpath_36: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Enum'.'$defs'.''
-        res = json_model_26(pval, lpath_36 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_36, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Enum'.'$defs'.'']", lpath_36 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Enum'.'$defs'.'']", lpath_36))
             return False
     return True
 
@@ -1847,12 +1860,12 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_37: Path = (path + [ prop ]) if path is not None else None
+        lpath_37: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Enum'.definitions.''
-        res = json_model_26(pval, lpath_37 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_37, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Enum'.definitions.'']", lpath_37 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Enum'.definitions.'']", lpath_37))
             return False
     return True
 
@@ -1865,15 +1878,15 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_35: Path = (path + [ prop ]) if path is not None else None
+        lpath_35: Path = (path, prop) if path is not None else None
         if prop == "enum":
             # handle must enum property
             must_count += 1
             # .'$tight#Enum'.enum
-            res = json_model_5(pval, lpath_35 if path is not None else None, rep)
+            res = json_model_5(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected $enum [.'$tight#Enum'.enum]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Enum'.enum]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected $enum [.'$tight#Enum'.enum]", lpath_35))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Enum'.enum]", lpath_35))
                 return False
             continue
         if prop == "id":
@@ -1881,8 +1894,8 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Enum'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Enum'.id]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.id]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Enum'.id]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.id]", lpath_35))
                 return False
             continue
         elif prop == "$id":
@@ -1890,17 +1903,17 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Enum'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Enum'.'$id']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.'$id']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Enum'.'$id']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.'$id']", lpath_35))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#Enum'.'$defs'
-            res = _jm_obj_13(pval, lpath_35 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Enum'.'$defs']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.'$defs']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Enum'.'$defs']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.'$defs']", lpath_35))
                 return False
             continue
         elif prop == "title":
@@ -1908,8 +1921,8 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Enum'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Enum'.title]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.title]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Enum'.title]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.title]", lpath_35))
                 return False
             continue
         elif prop == "$schema":
@@ -1917,8 +1930,8 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Enum'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Enum'.'$schema']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.'$schema']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Enum'.'$schema']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.'$schema']", lpath_35))
                 return False
             continue
         elif prop == "default":
@@ -1931,8 +1944,8 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Enum'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Enum'.'$comment']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.'$comment']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Enum'.'$comment']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.'$comment']", lpath_35))
                 return False
             continue
         elif prop == "examples":
@@ -1940,17 +1953,17 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Enum'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#Enum'.examples]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.examples]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#Enum'.examples]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.examples]", lpath_35))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#Enum'.definitions
-            res = _jm_obj_14(pval, lpath_35 if path is not None else None, rep)
+            res = _jm_obj_14(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Enum'.definitions]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.definitions]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Enum'.definitions]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.definitions]", lpath_35))
                 return False
             continue
         elif prop == "description":
@@ -1958,11 +1971,11 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Enum'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Enum'.description]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.description]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Enum'.description]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Enum'.description]", lpath_35))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#Enum']", lpath_35 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#Enum']", lpath_35))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1978,31 +1991,31 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if res:
         # .'$tight#enum'.'|'.0
         for arr_4_idx, arr_4_item in enumerate(val):
-            arr_4_lpath: Path = (path + [ arr_4_idx ]) if path is not None else None
+            arr_4_lpath: Path = (path, arr_4_idx) if path is not None else None
             # .'$tight#enum'.'|'.0.0
             res = isinstance(arr_4_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#enum'.'|'.0.0]", arr_4_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#enum'.'|'.0.0]", arr_4_lpath))
                 break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$tight#enum'.'|'.0]", path))
             # .'$tight#enum'.'|'.1
             for arr_3_idx, arr_3_item in enumerate(val):
-                arr_3_lpath: Path = (path + [ arr_3_idx ]) if path is not None else None
+                arr_3_lpath: Path = (path, arr_3_idx) if path is not None else None
                 # .'$tight#enum'.'|'.1.0
                 res = isinstance(arr_3_item, int) and not isinstance(arr_3_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1 strict int [.'$tight#enum'.'|'.1.0]", arr_3_lpath if path is not None else None))
+                    rep is None or rep.append(("not a -1 strict int [.'$tight#enum'.'|'.1.0]", arr_3_lpath))
                     break
             if not res:
                 rep is None or rep.append(("not array or unexpected array [.'$tight#enum'.'|'.1]", path))
                 # .'$tight#enum'.'|'.2
                 for arr_2_idx, arr_2_item in enumerate(val):
-                    arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+                    arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
                     # .'$tight#enum'.'|'.2.0
                     res = isinstance(arr_2_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a bool [.'$tight#enum'.'|'.2.0]", arr_2_lpath if path is not None else None))
+                        rep is None or rep.append(("not a bool [.'$tight#enum'.'|'.2.0]", arr_2_lpath))
                         break
                 if not res:
                     rep is None or rep.append(("not array or unexpected array [.'$tight#enum'.'|'.2]", path))
@@ -2021,12 +2034,12 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_39: Path = (path + [ prop ]) if path is not None else None
+        lpath_39: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Const'.'$defs'.''
-        res = json_model_26(pval, lpath_39 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_39, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Const'.'$defs'.'']", lpath_39 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Const'.'$defs'.'']", lpath_39))
             return False
     return True
 
@@ -2037,12 +2050,12 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_40: Path = (path + [ prop ]) if path is not None else None
+        lpath_40: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Const'.definitions.''
-        res = json_model_26(pval, lpath_40 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_40, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Const'.definitions.'']", lpath_40 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Const'.definitions.'']", lpath_40))
             return False
     return True
 
@@ -2055,15 +2068,15 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_38: Path = (path + [ prop ]) if path is not None else None
+        lpath_38: Path = (path, prop) if path is not None else None
         if prop == "const":
             # handle must const property
             must_count += 1
             # .'$tight#Const'.const
-            res = json_model_4(pval, lpath_38 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_38, rep)
             if not res:
-                rep is None or rep.append(("unexpected $const [.'$tight#Const'.const]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Const'.const]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected $const [.'$tight#Const'.const]", lpath_38))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Const'.const]", lpath_38))
                 return False
             continue
         if prop == "id":
@@ -2071,8 +2084,8 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Const'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Const'.id]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.id]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Const'.id]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.id]", lpath_38))
                 return False
             continue
         elif prop == "$id":
@@ -2080,17 +2093,17 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Const'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Const'.'$id']", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.'$id']", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Const'.'$id']", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.'$id']", lpath_38))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#Const'.'$defs'
-            res = _jm_obj_15(pval, lpath_38 if path is not None else None, rep)
+            res = _jm_obj_15(pval, lpath_38, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Const'.'$defs']", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.'$defs']", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Const'.'$defs']", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.'$defs']", lpath_38))
                 return False
             continue
         elif prop == "title":
@@ -2098,8 +2111,8 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Const'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Const'.title]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.title]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Const'.title]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.title]", lpath_38))
                 return False
             continue
         elif prop == "$schema":
@@ -2107,8 +2120,8 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Const'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Const'.'$schema']", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.'$schema']", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Const'.'$schema']", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.'$schema']", lpath_38))
                 return False
             continue
         elif prop == "default":
@@ -2121,8 +2134,8 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Const'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Const'.'$comment']", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.'$comment']", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Const'.'$comment']", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.'$comment']", lpath_38))
                 return False
             continue
         elif prop == "examples":
@@ -2130,17 +2143,17 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Const'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#Const'.examples]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.examples]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#Const'.examples]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.examples]", lpath_38))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#Const'.definitions
-            res = _jm_obj_16(pval, lpath_38 if path is not None else None, rep)
+            res = _jm_obj_16(pval, lpath_38, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Const'.definitions]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.definitions]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Const'.definitions]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.definitions]", lpath_38))
                 return False
             continue
         elif prop == "description":
@@ -2148,11 +2161,11 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Const'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Const'.description]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.description]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Const'.description]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Const'.description]", lpath_38))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#Const']", lpath_38 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#Const']", lpath_38))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2197,12 +2210,12 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_42: Path = (path + [ prop ]) if path is not None else None
+        lpath_42: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Ref'.'$defs'.''
-        res = json_model_26(pval, lpath_42 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_42, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Ref'.'$defs'.'']", lpath_42 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Ref'.'$defs'.'']", lpath_42))
             return False
     return True
 
@@ -2213,12 +2226,12 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_43: Path = (path + [ prop ]) if path is not None else None
+        lpath_43: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#Ref'.definitions.''
-        res = json_model_26(pval, lpath_43 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_43, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#Ref'.definitions.'']", lpath_43 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#Ref'.definitions.'']", lpath_43))
             return False
     return True
 
@@ -2231,15 +2244,15 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_41: Path = (path + [ prop ]) if path is not None else None
+        lpath_41: Path = (path, prop) if path is not None else None
         if prop == "$ref":
             # handle must $ref property
             must_count += 1
             # .'$tight#Ref'.'$ref'
-            res = is_valid_url(pval, lpath_41 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_41, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$tight#Ref'.'$ref']", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Ref'.'$ref']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$tight#Ref'.'$ref']", lpath_41))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#Ref'.'$ref']", lpath_41))
                 return False
             continue
         if prop == "id":
@@ -2247,8 +2260,8 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Ref'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Ref'.id]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.id]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Ref'.id]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.id]", lpath_41))
                 return False
             continue
         elif prop == "$id":
@@ -2256,17 +2269,17 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Ref'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Ref'.'$id']", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.'$id']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Ref'.'$id']", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.'$id']", lpath_41))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#Ref'.'$defs'
-            res = _jm_obj_17(pval, lpath_41 if path is not None else None, rep)
+            res = _jm_obj_17(pval, lpath_41, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Ref'.'$defs']", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.'$defs']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Ref'.'$defs']", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.'$defs']", lpath_41))
                 return False
             continue
         elif prop == "title":
@@ -2274,8 +2287,8 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Ref'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Ref'.title]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.title]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Ref'.title]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.title]", lpath_41))
                 return False
             continue
         elif prop == "$schema":
@@ -2283,8 +2296,8 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Ref'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Ref'.'$schema']", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.'$schema']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Ref'.'$schema']", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.'$schema']", lpath_41))
                 return False
             continue
         elif prop == "default":
@@ -2297,8 +2310,8 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Ref'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Ref'.'$comment']", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.'$comment']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Ref'.'$comment']", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.'$comment']", lpath_41))
                 return False
             continue
         elif prop == "examples":
@@ -2306,17 +2319,17 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Ref'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#Ref'.examples]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.examples]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#Ref'.examples]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.examples]", lpath_41))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#Ref'.definitions
-            res = _jm_obj_18(pval, lpath_41 if path is not None else None, rep)
+            res = _jm_obj_18(pval, lpath_41, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#Ref'.definitions]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.definitions]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#Ref'.definitions]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.definitions]", lpath_41))
                 return False
             continue
         elif prop == "description":
@@ -2324,11 +2337,11 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#Ref'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#Ref'.description]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.description]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#Ref'.description]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#Ref'.description]", lpath_41))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#Ref']", lpath_41 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#Ref']", lpath_41))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2361,12 +2374,12 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_45: Path = (path + [ prop ]) if path is not None else None
+        lpath_45: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#EnumString'.'$defs'.''
-        res = json_model_26(pval, lpath_45 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_45, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumString'.'$defs'.'']", lpath_45 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumString'.'$defs'.'']", lpath_45))
             return False
     return True
 
@@ -2377,12 +2390,12 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_46: Path = (path + [ prop ]) if path is not None else None
+        lpath_46: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#EnumString'.definitions.''
-        res = json_model_26(pval, lpath_46 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_46, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumString'.definitions.'']", lpath_46 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumString'.definitions.'']", lpath_46))
             return False
     return True
 
@@ -2395,7 +2408,7 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_44: Path = (path + [ prop ]) if path is not None else None
+        lpath_44: Path = (path, prop) if path is not None else None
         if prop == "enum":
             # handle must enum property
             must_count += 1
@@ -2403,15 +2416,15 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_5_idx, arr_5_item in enumerate(pval):
-                    arr_5_lpath: Path = ((lpath_44 if path is not None else None) + [ arr_5_idx ]) if (lpath_44 if path is not None else None) is not None else None
+                    arr_5_lpath: Path = (lpath_44, arr_5_idx) if lpath_44 is not None else None
                     # .'$tight#EnumString'.enum.0
                     res = isinstance(arr_5_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$tight#EnumString'.enum.0]", arr_5_lpath if (lpath_44 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$tight#EnumString'.enum.0]", arr_5_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumString'.enum]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumString'.enum]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumString'.enum]", lpath_44))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumString'.enum]", lpath_44))
                 return False
             continue
         elif prop == "type":
@@ -2420,8 +2433,8 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumString'.type
             res = isinstance(pval, str) and pval == "string"
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.type]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumString'.type]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.type]", lpath_44))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumString'.type]", lpath_44))
                 return False
             continue
         if prop == "id":
@@ -2429,8 +2442,8 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumString'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.id]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.id]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.id]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.id]", lpath_44))
                 return False
             continue
         elif prop == "$id":
@@ -2438,17 +2451,17 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumString'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.'$id']", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.'$id']", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.'$id']", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.'$id']", lpath_44))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#EnumString'.'$defs'
-            res = _jm_obj_19(pval, lpath_44 if path is not None else None, rep)
+            res = _jm_obj_19(pval, lpath_44, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#EnumString'.'$defs']", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.'$defs']", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#EnumString'.'$defs']", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.'$defs']", lpath_44))
                 return False
             continue
         elif prop == "title":
@@ -2456,8 +2469,8 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumString'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.title]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.title]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.title]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.title]", lpath_44))
                 return False
             continue
         elif prop == "$schema":
@@ -2465,8 +2478,8 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumString'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.'$schema']", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.'$schema']", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.'$schema']", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.'$schema']", lpath_44))
                 return False
             continue
         elif prop == "default":
@@ -2479,8 +2492,8 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumString'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.'$comment']", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.'$comment']", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.'$comment']", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.'$comment']", lpath_44))
                 return False
             continue
         elif prop == "examples":
@@ -2488,17 +2501,17 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumString'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumString'.examples]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.examples]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumString'.examples]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.examples]", lpath_44))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#EnumString'.definitions
-            res = _jm_obj_20(pval, lpath_44 if path is not None else None, rep)
+            res = _jm_obj_20(pval, lpath_44, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#EnumString'.definitions]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.definitions]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#EnumString'.definitions]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.definitions]", lpath_44))
                 return False
             continue
         elif prop == "description":
@@ -2506,11 +2519,11 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumString'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.description]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.description]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumString'.description]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumString'.description]", lpath_44))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#EnumString']", lpath_44 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#EnumString']", lpath_44))
         return False
     if must_count != 2:
         if rep is not None:
@@ -2528,12 +2541,12 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_48: Path = (path + [ prop ]) if path is not None else None
+        lpath_48: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#EnumNum'.'$defs'.''
-        res = json_model_26(pval, lpath_48 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_48, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumNum'.'$defs'.'']", lpath_48 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumNum'.'$defs'.'']", lpath_48))
             return False
     return True
 
@@ -2544,12 +2557,12 @@ def _jm_obj_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_49: Path = (path + [ prop ]) if path is not None else None
+        lpath_49: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#EnumNum'.definitions.''
-        res = json_model_26(pval, lpath_49 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_49, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumNum'.definitions.'']", lpath_49 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumNum'.definitions.'']", lpath_49))
             return False
     return True
 
@@ -2562,7 +2575,7 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_47: Path = (path + [ prop ]) if path is not None else None
+        lpath_47: Path = (path, prop) if path is not None else None
         if prop == "enum":
             # handle must enum property
             must_count += 1
@@ -2570,15 +2583,15 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_6_idx, arr_6_item in enumerate(pval):
-                    arr_6_lpath: Path = ((lpath_47 if path is not None else None) + [ arr_6_idx ]) if (lpath_47 if path is not None else None) is not None else None
+                    arr_6_lpath: Path = (lpath_47, arr_6_idx) if lpath_47 is not None else None
                     # .'$tight#EnumNum'.enum.0
                     res = isinstance(arr_6_item, float)
                     if not res:
-                        rep is None or rep.append(("not a -1.0 strict float [.'$tight#EnumNum'.enum.0]", arr_6_lpath if (lpath_47 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a -1.0 strict float [.'$tight#EnumNum'.enum.0]", arr_6_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumNum'.enum]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumNum'.enum]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumNum'.enum]", lpath_47))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumNum'.enum]", lpath_47))
                 return False
             continue
         elif prop == "type":
@@ -2587,8 +2600,8 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumNum'.type
             res = isinstance(pval, str) and pval == "number"
             if not res:
-                rep is None or rep.append(("unexpected number [.'$tight#EnumNum'.type]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumNum'.type]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected number [.'$tight#EnumNum'.type]", lpath_47))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumNum'.type]", lpath_47))
                 return False
             continue
         if prop == "id":
@@ -2596,8 +2609,8 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumNum'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.id]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.id]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.id]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.id]", lpath_47))
                 return False
             continue
         elif prop == "$id":
@@ -2605,17 +2618,17 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumNum'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.'$id']", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.'$id']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.'$id']", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.'$id']", lpath_47))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#EnumNum'.'$defs'
-            res = _jm_obj_21(pval, lpath_47 if path is not None else None, rep)
+            res = _jm_obj_21(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#EnumNum'.'$defs']", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.'$defs']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#EnumNum'.'$defs']", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.'$defs']", lpath_47))
                 return False
             continue
         elif prop == "title":
@@ -2623,8 +2636,8 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumNum'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.title]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.title]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.title]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.title]", lpath_47))
                 return False
             continue
         elif prop == "$schema":
@@ -2632,8 +2645,8 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumNum'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.'$schema']", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.'$schema']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.'$schema']", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.'$schema']", lpath_47))
                 return False
             continue
         elif prop == "default":
@@ -2646,8 +2659,8 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumNum'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.'$comment']", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.'$comment']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.'$comment']", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.'$comment']", lpath_47))
                 return False
             continue
         elif prop == "examples":
@@ -2655,17 +2668,17 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumNum'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumNum'.examples]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.examples]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumNum'.examples]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.examples]", lpath_47))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#EnumNum'.definitions
-            res = _jm_obj_22(pval, lpath_47 if path is not None else None, rep)
+            res = _jm_obj_22(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#EnumNum'.definitions]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.definitions]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#EnumNum'.definitions]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.definitions]", lpath_47))
                 return False
             continue
         elif prop == "description":
@@ -2673,11 +2686,11 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumNum'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.description]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.description]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumNum'.description]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumNum'.description]", lpath_47))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#EnumNum']", lpath_47 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#EnumNum']", lpath_47))
         return False
     if must_count != 2:
         if rep is not None:
@@ -2695,12 +2708,12 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_51: Path = (path + [ prop ]) if path is not None else None
+        lpath_51: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#EnumInt'.'$defs'.''
-        res = json_model_26(pval, lpath_51 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_51, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumInt'.'$defs'.'']", lpath_51 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumInt'.'$defs'.'']", lpath_51))
             return False
     return True
 
@@ -2711,12 +2724,12 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_52: Path = (path + [ prop ]) if path is not None else None
+        lpath_52: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#EnumInt'.definitions.''
-        res = json_model_26(pval, lpath_52 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_52, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumInt'.definitions.'']", lpath_52 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#EnumInt'.definitions.'']", lpath_52))
             return False
     return True
 
@@ -2729,7 +2742,7 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_50: Path = (path + [ prop ]) if path is not None else None
+        lpath_50: Path = (path, prop) if path is not None else None
         if prop == "enum":
             # handle must enum property
             must_count += 1
@@ -2737,15 +2750,15 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_7_idx, arr_7_item in enumerate(pval):
-                    arr_7_lpath: Path = ((lpath_50 if path is not None else None) + [ arr_7_idx ]) if (lpath_50 if path is not None else None) is not None else None
+                    arr_7_lpath: Path = (lpath_50, arr_7_idx) if lpath_50 is not None else None
                     # .'$tight#EnumInt'.enum.0
                     res = isinstance(arr_7_item, int) and not isinstance(arr_7_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a -1 strict int [.'$tight#EnumInt'.enum.0]", arr_7_lpath if (lpath_50 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a -1 strict int [.'$tight#EnumInt'.enum.0]", arr_7_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumInt'.enum]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumInt'.enum]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumInt'.enum]", lpath_50))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumInt'.enum]", lpath_50))
                 return False
             continue
         elif prop == "type":
@@ -2754,8 +2767,8 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumInt'.type
             res = isinstance(pval, str) and pval == "integer"
             if not res:
-                rep is None or rep.append(("unexpected integer [.'$tight#EnumInt'.type]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumInt'.type]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected integer [.'$tight#EnumInt'.type]", lpath_50))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#EnumInt'.type]", lpath_50))
                 return False
             continue
         if prop == "id":
@@ -2763,8 +2776,8 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumInt'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.id]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.id]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.id]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.id]", lpath_50))
                 return False
             continue
         elif prop == "$id":
@@ -2772,17 +2785,17 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumInt'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.'$id']", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.'$id']", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.'$id']", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.'$id']", lpath_50))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#EnumInt'.'$defs'
-            res = _jm_obj_23(pval, lpath_50 if path is not None else None, rep)
+            res = _jm_obj_23(pval, lpath_50, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#EnumInt'.'$defs']", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.'$defs']", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#EnumInt'.'$defs']", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.'$defs']", lpath_50))
                 return False
             continue
         elif prop == "title":
@@ -2790,8 +2803,8 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumInt'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.title]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.title]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.title]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.title]", lpath_50))
                 return False
             continue
         elif prop == "$schema":
@@ -2799,8 +2812,8 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumInt'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.'$schema']", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.'$schema']", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.'$schema']", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.'$schema']", lpath_50))
                 return False
             continue
         elif prop == "default":
@@ -2813,8 +2826,8 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumInt'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.'$comment']", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.'$comment']", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.'$comment']", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.'$comment']", lpath_50))
                 return False
             continue
         elif prop == "examples":
@@ -2822,17 +2835,17 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumInt'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumInt'.examples]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.examples]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#EnumInt'.examples]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.examples]", lpath_50))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#EnumInt'.definitions
-            res = _jm_obj_24(pval, lpath_50 if path is not None else None, rep)
+            res = _jm_obj_24(pval, lpath_50, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#EnumInt'.definitions]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.definitions]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#EnumInt'.definitions]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.definitions]", lpath_50))
                 return False
             continue
         elif prop == "description":
@@ -2840,11 +2853,11 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#EnumInt'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.description]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.description]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#EnumInt'.description]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#EnumInt'.description]", lpath_50))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#EnumInt']", lpath_50 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#EnumInt']", lpath_50))
         return False
     if must_count != 2:
         if rep is not None:
@@ -2862,12 +2875,12 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_54: Path = (path + [ prop ]) if path is not None else None
+        lpath_54: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#ConstString'.'$defs'.''
-        res = json_model_26(pval, lpath_54 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_54, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstString'.'$defs'.'']", lpath_54 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstString'.'$defs'.'']", lpath_54))
             return False
     return True
 
@@ -2878,12 +2891,12 @@ def _jm_obj_26(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_55: Path = (path + [ prop ]) if path is not None else None
+        lpath_55: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#ConstString'.definitions.''
-        res = json_model_26(pval, lpath_55 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_55, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstString'.definitions.'']", lpath_55 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstString'.definitions.'']", lpath_55))
             return False
     return True
 
@@ -2896,15 +2909,15 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_53: Path = (path + [ prop ]) if path is not None else None
+        lpath_53: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#ConstString'.type
             res = isinstance(pval, str) and pval == "string"
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.type]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstString'.type]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.type]", lpath_53))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstString'.type]", lpath_53))
                 return False
             continue
         elif prop == "const":
@@ -2913,8 +2926,8 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstString'.const
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.const]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstString'.const]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.const]", lpath_53))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstString'.const]", lpath_53))
                 return False
             continue
         if prop == "id":
@@ -2922,8 +2935,8 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstString'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.id]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.id]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.id]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.id]", lpath_53))
                 return False
             continue
         elif prop == "$id":
@@ -2931,17 +2944,17 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstString'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.'$id']", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.'$id']", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.'$id']", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.'$id']", lpath_53))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#ConstString'.'$defs'
-            res = _jm_obj_25(pval, lpath_53 if path is not None else None, rep)
+            res = _jm_obj_25(pval, lpath_53, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#ConstString'.'$defs']", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.'$defs']", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#ConstString'.'$defs']", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.'$defs']", lpath_53))
                 return False
             continue
         elif prop == "title":
@@ -2949,8 +2962,8 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstString'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.title]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.title]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.title]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.title]", lpath_53))
                 return False
             continue
         elif prop == "$schema":
@@ -2958,8 +2971,8 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstString'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.'$schema']", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.'$schema']", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.'$schema']", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.'$schema']", lpath_53))
                 return False
             continue
         elif prop == "default":
@@ -2972,8 +2985,8 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstString'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.'$comment']", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.'$comment']", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.'$comment']", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.'$comment']", lpath_53))
                 return False
             continue
         elif prop == "examples":
@@ -2981,17 +2994,17 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstString'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#ConstString'.examples]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.examples]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#ConstString'.examples]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.examples]", lpath_53))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#ConstString'.definitions
-            res = _jm_obj_26(pval, lpath_53 if path is not None else None, rep)
+            res = _jm_obj_26(pval, lpath_53, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#ConstString'.definitions]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.definitions]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#ConstString'.definitions]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.definitions]", lpath_53))
                 return False
             continue
         elif prop == "description":
@@ -2999,11 +3012,11 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstString'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.description]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.description]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstString'.description]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstString'.description]", lpath_53))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#ConstString']", lpath_53 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#ConstString']", lpath_53))
         return False
     if must_count != 2:
         if rep is not None:
@@ -3021,12 +3034,12 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_57: Path = (path + [ prop ]) if path is not None else None
+        lpath_57: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#ConstNum'.'$defs'.''
-        res = json_model_26(pval, lpath_57 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_57, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstNum'.'$defs'.'']", lpath_57 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstNum'.'$defs'.'']", lpath_57))
             return False
     return True
 
@@ -3037,12 +3050,12 @@ def _jm_obj_28(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_58: Path = (path + [ prop ]) if path is not None else None
+        lpath_58: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#ConstNum'.definitions.''
-        res = json_model_26(pval, lpath_58 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_58, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstNum'.definitions.'']", lpath_58 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstNum'.definitions.'']", lpath_58))
             return False
     return True
 
@@ -3055,15 +3068,15 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_56: Path = (path + [ prop ]) if path is not None else None
+        lpath_56: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#ConstNum'.type
             res = isinstance(pval, str) and pval == "number"
             if not res:
-                rep is None or rep.append(("unexpected number [.'$tight#ConstNum'.type]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstNum'.type]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected number [.'$tight#ConstNum'.type]", lpath_56))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstNum'.type]", lpath_56))
                 return False
             continue
         elif prop == "const":
@@ -3072,8 +3085,8 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstNum'.const
             res = isinstance(pval, float)
             if not res:
-                rep is None or rep.append(("not a -1.0 strict float [.'$tight#ConstNum'.const]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstNum'.const]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("not a -1.0 strict float [.'$tight#ConstNum'.const]", lpath_56))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstNum'.const]", lpath_56))
                 return False
             continue
         if prop == "id":
@@ -3081,8 +3094,8 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstNum'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.id]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.id]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.id]", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.id]", lpath_56))
                 return False
             continue
         elif prop == "$id":
@@ -3090,17 +3103,17 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstNum'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.'$id']", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.'$id']", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.'$id']", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.'$id']", lpath_56))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#ConstNum'.'$defs'
-            res = _jm_obj_27(pval, lpath_56 if path is not None else None, rep)
+            res = _jm_obj_27(pval, lpath_56, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#ConstNum'.'$defs']", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.'$defs']", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#ConstNum'.'$defs']", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.'$defs']", lpath_56))
                 return False
             continue
         elif prop == "title":
@@ -3108,8 +3121,8 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstNum'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.title]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.title]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.title]", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.title]", lpath_56))
                 return False
             continue
         elif prop == "$schema":
@@ -3117,8 +3130,8 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstNum'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.'$schema']", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.'$schema']", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.'$schema']", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.'$schema']", lpath_56))
                 return False
             continue
         elif prop == "default":
@@ -3131,8 +3144,8 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstNum'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.'$comment']", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.'$comment']", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.'$comment']", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.'$comment']", lpath_56))
                 return False
             continue
         elif prop == "examples":
@@ -3140,17 +3153,17 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstNum'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#ConstNum'.examples]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.examples]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#ConstNum'.examples]", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.examples]", lpath_56))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#ConstNum'.definitions
-            res = _jm_obj_28(pval, lpath_56 if path is not None else None, rep)
+            res = _jm_obj_28(pval, lpath_56, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#ConstNum'.definitions]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.definitions]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#ConstNum'.definitions]", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.definitions]", lpath_56))
                 return False
             continue
         elif prop == "description":
@@ -3158,11 +3171,11 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstNum'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.description]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.description]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstNum'.description]", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstNum'.description]", lpath_56))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#ConstNum']", lpath_56 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#ConstNum']", lpath_56))
         return False
     if must_count != 2:
         if rep is not None:
@@ -3180,12 +3193,12 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_60: Path = (path + [ prop ]) if path is not None else None
+        lpath_60: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#ConstInt'.'$defs'.''
-        res = json_model_26(pval, lpath_60 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_60, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstInt'.'$defs'.'']", lpath_60 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstInt'.'$defs'.'']", lpath_60))
             return False
     return True
 
@@ -3196,12 +3209,12 @@ def _jm_obj_30(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_61: Path = (path + [ prop ]) if path is not None else None
+        lpath_61: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#ConstInt'.definitions.''
-        res = json_model_26(pval, lpath_61 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_61, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstInt'.definitions.'']", lpath_61 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstInt'.definitions.'']", lpath_61))
             return False
     return True
 
@@ -3214,15 +3227,15 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_59: Path = (path + [ prop ]) if path is not None else None
+        lpath_59: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#ConstInt'.type
             res = isinstance(pval, str) and pval == "integer"
             if not res:
-                rep is None or rep.append(("unexpected integer [.'$tight#ConstInt'.type]", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstInt'.type]", lpath_59 if path is not None else None))
+                rep is None or rep.append(("unexpected integer [.'$tight#ConstInt'.type]", lpath_59))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstInt'.type]", lpath_59))
                 return False
             continue
         elif prop == "const":
@@ -3231,8 +3244,8 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstInt'.const
             res = isinstance(pval, int) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'$tight#ConstInt'.const]", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstInt'.const]", lpath_59 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'$tight#ConstInt'.const]", lpath_59))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstInt'.const]", lpath_59))
                 return False
             continue
         if prop == "id":
@@ -3240,8 +3253,8 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstInt'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.id]", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.id]", lpath_59 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.id]", lpath_59))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.id]", lpath_59))
                 return False
             continue
         elif prop == "$id":
@@ -3249,17 +3262,17 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstInt'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.'$id']", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.'$id']", lpath_59 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.'$id']", lpath_59))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.'$id']", lpath_59))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#ConstInt'.'$defs'
-            res = _jm_obj_29(pval, lpath_59 if path is not None else None, rep)
+            res = _jm_obj_29(pval, lpath_59, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#ConstInt'.'$defs']", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.'$defs']", lpath_59 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#ConstInt'.'$defs']", lpath_59))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.'$defs']", lpath_59))
                 return False
             continue
         elif prop == "title":
@@ -3267,8 +3280,8 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstInt'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.title]", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.title]", lpath_59 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.title]", lpath_59))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.title]", lpath_59))
                 return False
             continue
         elif prop == "$schema":
@@ -3276,8 +3289,8 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstInt'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.'$schema']", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.'$schema']", lpath_59 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.'$schema']", lpath_59))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.'$schema']", lpath_59))
                 return False
             continue
         elif prop == "default":
@@ -3290,8 +3303,8 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstInt'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.'$comment']", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.'$comment']", lpath_59 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.'$comment']", lpath_59))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.'$comment']", lpath_59))
                 return False
             continue
         elif prop == "examples":
@@ -3299,17 +3312,17 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstInt'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#ConstInt'.examples]", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.examples]", lpath_59 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#ConstInt'.examples]", lpath_59))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.examples]", lpath_59))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#ConstInt'.definitions
-            res = _jm_obj_30(pval, lpath_59 if path is not None else None, rep)
+            res = _jm_obj_30(pval, lpath_59, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#ConstInt'.definitions]", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.definitions]", lpath_59 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#ConstInt'.definitions]", lpath_59))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.definitions]", lpath_59))
                 return False
             continue
         elif prop == "description":
@@ -3317,11 +3330,11 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstInt'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.description]", lpath_59 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.description]", lpath_59 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstInt'.description]", lpath_59))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstInt'.description]", lpath_59))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#ConstInt']", lpath_59 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#ConstInt']", lpath_59))
         return False
     if must_count != 2:
         if rep is not None:
@@ -3339,12 +3352,12 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_63: Path = (path + [ prop ]) if path is not None else None
+        lpath_63: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#ConstBool'.'$defs'.''
-        res = json_model_26(pval, lpath_63 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_63, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstBool'.'$defs'.'']", lpath_63 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstBool'.'$defs'.'']", lpath_63))
             return False
     return True
 
@@ -3355,12 +3368,12 @@ def _jm_obj_32(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_64: Path = (path + [ prop ]) if path is not None else None
+        lpath_64: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$tight#ConstBool'.definitions.''
-        res = json_model_26(pval, lpath_64 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_64, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstBool'.definitions.'']", lpath_64 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$tight#ConstBool'.definitions.'']", lpath_64))
             return False
     return True
 
@@ -3373,15 +3386,15 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_62: Path = (path + [ prop ]) if path is not None else None
+        lpath_62: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$tight#ConstBool'.type
             res = isinstance(pval, str) and pval == "boolean"
             if not res:
-                rep is None or rep.append(("unexpected boolean [.'$tight#ConstBool'.type]", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstBool'.type]", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected boolean [.'$tight#ConstBool'.type]", lpath_62))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstBool'.type]", lpath_62))
                 return False
             continue
         elif prop == "const":
@@ -3390,8 +3403,8 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstBool'.const
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$tight#ConstBool'.const]", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstBool'.const]", lpath_62 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$tight#ConstBool'.const]", lpath_62))
+                rep is None or rep.append(("invalid mandatory prop value [.'$tight#ConstBool'.const]", lpath_62))
                 return False
             continue
         if prop == "id":
@@ -3399,8 +3412,8 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstBool'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.id]", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.id]", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.id]", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.id]", lpath_62))
                 return False
             continue
         elif prop == "$id":
@@ -3408,17 +3421,17 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstBool'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.'$id']", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.'$id']", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.'$id']", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.'$id']", lpath_62))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$tight#ConstBool'.'$defs'
-            res = _jm_obj_31(pval, lpath_62 if path is not None else None, rep)
+            res = _jm_obj_31(pval, lpath_62, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#ConstBool'.'$defs']", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.'$defs']", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#ConstBool'.'$defs']", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.'$defs']", lpath_62))
                 return False
             continue
         elif prop == "title":
@@ -3426,8 +3439,8 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstBool'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.title]", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.title]", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.title]", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.title]", lpath_62))
                 return False
             continue
         elif prop == "$schema":
@@ -3435,8 +3448,8 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstBool'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.'$schema']", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.'$schema']", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.'$schema']", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.'$schema']", lpath_62))
                 return False
             continue
         elif prop == "default":
@@ -3449,8 +3462,8 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstBool'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.'$comment']", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.'$comment']", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.'$comment']", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.'$comment']", lpath_62))
                 return False
             continue
         elif prop == "examples":
@@ -3458,17 +3471,17 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstBool'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$tight#ConstBool'.examples]", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.examples]", lpath_62 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$tight#ConstBool'.examples]", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.examples]", lpath_62))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$tight#ConstBool'.definitions
-            res = _jm_obj_32(pval, lpath_62 if path is not None else None, rep)
+            res = _jm_obj_32(pval, lpath_62, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$tight#ConstBool'.definitions]", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.definitions]", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$tight#ConstBool'.definitions]", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.definitions]", lpath_62))
                 return False
             continue
         elif prop == "description":
@@ -3476,11 +3489,11 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$tight#ConstBool'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.description]", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.description]", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$tight#ConstBool'.description]", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$tight#ConstBool'.description]", lpath_62))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$tight#ConstBool']", lpath_62 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$tight#ConstBool']", lpath_62))
         return False
     if must_count != 2:
         if rep is not None:
@@ -3609,5 +3622,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 _jm_cst_1: set[str]
@@ -66,31 +79,31 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if res:
         # .'$enum'.'|'.0
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$enum'.'|'.0.0
             res = isinstance(arr_2_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$enum'.'|'.0.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$enum'.'|'.0.0]", arr_2_lpath))
                 break
         if not res:
             rep is None or rep.append(("not array or unexpected array [.'$enum'.'|'.0]", path))
             # .'$enum'.'|'.1
             for arr_1_idx, arr_1_item in enumerate(val):
-                arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+                arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
                 # .'$enum'.'|'.1.0
                 res = isinstance(arr_1_item, int) and not isinstance(arr_1_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1 strict int [.'$enum'.'|'.1.0]", arr_1_lpath if path is not None else None))
+                    rep is None or rep.append(("not a -1 strict int [.'$enum'.'|'.1.0]", arr_1_lpath))
                     break
             if not res:
                 rep is None or rep.append(("not array or unexpected array [.'$enum'.'|'.1]", path))
                 # .'$enum'.'|'.2
                 for arr_0_idx, arr_0_item in enumerate(val):
-                    arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+                    arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
                     # .'$enum'.'|'.2.0
                     res = isinstance(arr_0_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a bool [.'$enum'.'|'.2.0]", arr_0_lpath if path is not None else None))
+                        rep is None or rep.append(("not a bool [.'$enum'.'|'.2.0]", arr_0_lpath))
                         break
                 if not res:
                     rep is None or rep.append(("not array or unexpected array [.'$enum'.'|'.2]", path))
@@ -108,11 +121,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_3_idx, arr_3_item in enumerate(val):
-            arr_3_lpath: Path = (path + [ arr_3_idx ]) if path is not None else None
+            arr_3_lpath: Path = (path, arr_3_idx) if path is not None else None
             # .'$schemaArray'.0
-            res = json_model_24(arr_3_item, arr_3_lpath if path is not None else None, rep)
+            res = json_model_24(arr_3_item, arr_3_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.0]", arr_3_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.0]", arr_3_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$schemaArray']", path))
@@ -127,23 +140,23 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "format":
             # handle may format property
             # .'$stringKeywords'.format
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_0
             if not res:
-                rep is None or rep.append(("value not in enum [.'$stringKeywords'.format.'|']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.format]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.'$stringKeywords'.format.'|']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.format]", lpath_0))
                 return False
             continue
         elif prop == "pattern":
             # handle may pattern property
             # .'$stringKeywords'.pattern
-            res = is_valid_regex(pval, lpath_0 if path is not None else None, rep)
+            res = is_valid_regex(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $REGEX [.'$stringKeywords'.pattern]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.pattern]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $REGEX [.'$stringKeywords'.pattern]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.pattern]", lpath_0))
                 return False
             continue
         elif prop == "maxLength":
@@ -151,8 +164,8 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$stringKeywords'.maxLength
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$stringKeywords'.maxLength]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.maxLength]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$stringKeywords'.maxLength]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.maxLength]", lpath_0))
                 return False
             continue
         elif prop == "minLength":
@@ -160,11 +173,11 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$stringKeywords'.minLength
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$stringKeywords'.minLength]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.minLength]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$stringKeywords'.minLength]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$stringKeywords'.minLength]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$stringKeywords']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$stringKeywords']", lpath_0))
         return False
     return True
 
@@ -177,23 +190,23 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "items":
             # handle may items property
             # .'$arrayKeywords'.items
             # .'$arrayKeywords'.items.'|'.0
-            res = json_model_24(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_24(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.items.'|'.0]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.items.'|'.0]", lpath_1))
                 # .'$arrayKeywords'.items.'|'.1
-                res = json_model_4(pval, lpath_1 if path is not None else None, rep)
+                res = json_model_4(pval, lpath_1, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $schemaArray [.'$arrayKeywords'.items.'|'.1]", lpath_1 if path is not None else None))
+                    rep is None or rep.append(("unexpected $schemaArray [.'$arrayKeywords'.items.'|'.1]", lpath_1))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$arrayKeywords'.items.'|']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.items]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$arrayKeywords'.items.'|']", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.items]", lpath_1))
                 return False
             continue
         elif prop == "maxItems":
@@ -201,8 +214,8 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$arrayKeywords'.maxItems
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$arrayKeywords'.maxItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.maxItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$arrayKeywords'.maxItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.maxItems]", lpath_1))
                 return False
             continue
         elif prop == "minItems":
@@ -210,17 +223,17 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$arrayKeywords'.minItems
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$arrayKeywords'.minItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.minItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$arrayKeywords'.minItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.minItems]", lpath_1))
                 return False
             continue
         elif prop == "prefixItems":
             # handle may prefixItems property
             # .'$arrayKeywords'.prefixItems
-            res = json_model_4(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$arrayKeywords'.prefixItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.prefixItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$arrayKeywords'.prefixItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.prefixItems]", lpath_1))
                 return False
             continue
         elif prop == "uniqueItems":
@@ -228,20 +241,20 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$arrayKeywords'.uniqueItems
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$arrayKeywords'.uniqueItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.uniqueItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$arrayKeywords'.uniqueItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.uniqueItems]", lpath_1))
                 return False
             continue
         elif prop == "additionalItems":
             # handle may additionalItems property
             # .'$arrayKeywords'.additionalItems
-            res = json_model_24(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_24(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.additionalItems]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.additionalItems]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$arrayKeywords'.additionalItems]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$arrayKeywords'.additionalItems]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$arrayKeywords']", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$arrayKeywords']", lpath_1))
         return False
     return True
 
@@ -252,12 +265,12 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$objectKeywords'.properties.''
-        res = json_model_24(pval, lpath_3 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_3, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.properties.'']", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.properties.'']", lpath_3))
             return False
     return True
 
@@ -268,16 +281,16 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_4 if path is not None else None, rep):
+        lpath_4: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_4, rep):
             # handle 1 key props
             # .'$objectKeywords'.patternProperties.'$REGEX'
-            res = json_model_24(pval, lpath_4 if path is not None else None, rep)
+            res = json_model_24(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.patternProperties.'$REGEX']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.patternProperties.'$REGEX']", lpath_4))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$objectKeywords'.patternProperties]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$objectKeywords'.patternProperties]", lpath_4))
             return False
     return True
 
@@ -290,52 +303,52 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "required":
             # handle may required property
             # .'$objectKeywords'.required
             res = isinstance(pval, list)
             if res:
                 for arr_4_idx, arr_4_item in enumerate(pval):
-                    arr_4_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_4_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_4_lpath: Path = (lpath_2, arr_4_idx) if lpath_2 is not None else None
                     # .'$objectKeywords'.required.0
                     res = isinstance(arr_4_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$objectKeywords'.required.0]", arr_4_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$objectKeywords'.required.0]", arr_4_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$objectKeywords'.required]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.required]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$objectKeywords'.required]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.required]", lpath_2))
                 return False
             continue
         elif prop == "properties":
             # handle may properties property
             # .'$objectKeywords'.properties
-            res = _jm_obj_0(pval, lpath_2 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$objectKeywords'.properties]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.properties]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$objectKeywords'.properties]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.properties]", lpath_2))
                 return False
             continue
         elif prop == "patternProperties":
             # handle may patternProperties property
             # .'$objectKeywords'.patternProperties
-            res = _jm_obj_1(pval, lpath_2 if path is not None else None, rep)
+            res = _jm_obj_1(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$objectKeywords'.patternProperties]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.patternProperties]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$objectKeywords'.patternProperties]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.patternProperties]", lpath_2))
                 return False
             continue
         elif prop == "additionalProperties":
             # handle may additionalProperties property
             # .'$objectKeywords'.additionalProperties
-            res = json_model_24(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_24(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.additionalProperties]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.additionalProperties]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$objectKeywords'.additionalProperties]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$objectKeywords'.additionalProperties]", lpath_2))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$objectKeywords']", lpath_2 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$objectKeywords']", lpath_2))
         return False
     return True
 
@@ -348,14 +361,14 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "maximum":
             # handle may maximum property
             # .'$numberKeywords'.maximum
             res = isinstance(pval, float)
             if not res:
-                rep is None or rep.append(("not a -1.0 strict float [.'$numberKeywords'.maximum]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$numberKeywords'.maximum]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a -1.0 strict float [.'$numberKeywords'.maximum]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$numberKeywords'.maximum]", lpath_5))
                 return False
             continue
         elif prop == "minimum":
@@ -363,11 +376,11 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$numberKeywords'.minimum
             res = isinstance(pval, float)
             if not res:
-                rep is None or rep.append(("not a -1.0 strict float [.'$numberKeywords'.minimum]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$numberKeywords'.minimum]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a -1.0 strict float [.'$numberKeywords'.minimum]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$numberKeywords'.minimum]", lpath_5))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$numberKeywords']", lpath_5 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$numberKeywords']", lpath_5))
         return False
     return True
 
@@ -378,12 +391,12 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$metas'.'$defs'.''
-        res = json_model_24(pval, lpath_7 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_7, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$metas'.'$defs'.'']", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$metas'.'$defs'.'']", lpath_7))
             return False
     return True
 
@@ -394,12 +407,12 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$metas'.definitions.''
-        res = json_model_24(pval, lpath_8 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_8, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$metas'.definitions.'']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$metas'.definitions.'']", lpath_8))
             return False
     return True
 
@@ -412,14 +425,14 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "id":
             # handle may id property
             # .'$metas'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$metas'.id]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$metas'.id]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$metas'.id]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$metas'.id]", lpath_6))
                 return False
             continue
         elif prop == "$id":
@@ -427,17 +440,17 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$metas'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$metas'.'$id']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$metas'.'$id']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$metas'.'$id']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$metas'.'$id']", lpath_6))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$metas'.'$defs'
-            res = _jm_obj_2(pval, lpath_6 if path is not None else None, rep)
+            res = _jm_obj_2(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$metas'.'$defs']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$metas'.'$defs']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$metas'.'$defs']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$metas'.'$defs']", lpath_6))
                 return False
             continue
         elif prop == "title":
@@ -445,8 +458,8 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$metas'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$metas'.title]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$metas'.title]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$metas'.title]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$metas'.title]", lpath_6))
                 return False
             continue
         elif prop == "$schema":
@@ -454,8 +467,8 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$metas'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$metas'.'$schema']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$metas'.'$schema']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$metas'.'$schema']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$metas'.'$schema']", lpath_6))
                 return False
             continue
         elif prop == "default":
@@ -468,8 +481,8 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$metas'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$metas'.'$comment']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$metas'.'$comment']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$metas'.'$comment']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$metas'.'$comment']", lpath_6))
                 return False
             continue
         elif prop == "examples":
@@ -477,17 +490,17 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$metas'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$metas'.examples]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$metas'.examples]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$metas'.examples]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$metas'.examples]", lpath_6))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$metas'.definitions
-            res = _jm_obj_3(pval, lpath_6 if path is not None else None, rep)
+            res = _jm_obj_3(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$metas'.definitions]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$metas'.definitions]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$metas'.definitions]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$metas'.definitions]", lpath_6))
                 return False
             continue
         elif prop == "description":
@@ -495,11 +508,11 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$metas'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$metas'.description]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$metas'.description]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$metas'.description]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$metas'.description]", lpath_6))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$metas']", lpath_6 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$metas']", lpath_6))
         return False
     return True
 
@@ -519,12 +532,12 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$String'.'$defs'.''
-        res = json_model_24(pval, lpath_10 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_10, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$String'.'$defs'.'']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$String'.'$defs'.'']", lpath_10))
             return False
     return True
 
@@ -559,12 +572,12 @@ def _jm_f_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$String'.definitions.''
-        res = json_model_24(pval, lpath_11 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_11, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$String'.definitions.'']", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$String'.definitions.'']", lpath_11))
             return False
     return True
 
@@ -644,24 +657,24 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$String'.type
             res = isinstance(pval, str) and pval == "string"
             if not res:
-                rep is None or rep.append(("unexpected string [.'$String'.type]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$String'.type]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$String'.type]", lpath_9))
+                rep is None or rep.append(("invalid mandatory prop value [.'$String'.type]", lpath_9))
                 return False
             continue
         if pfun := json_model_10_map.get(prop):
             # handle 14 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_9 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$String']", lpath_9 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_9, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$String']", lpath_9))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$String']", lpath_9 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$String']", lpath_9))
         return False
     if must_count != 1:
         if rep is not None:
@@ -686,12 +699,12 @@ def _jm_f_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Array'.'$defs'.''
-        res = json_model_24(pval, lpath_13 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_13, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Array'.'$defs'.'']", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Array'.'$defs'.'']", lpath_13))
             return False
     return True
 
@@ -726,12 +739,12 @@ def _jm_f_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Array'.definitions.''
-        res = json_model_24(pval, lpath_14 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_14, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Array'.definitions.'']", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Array'.definitions.'']", lpath_14))
             return False
     return True
 
@@ -819,24 +832,24 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Array'.type
             res = isinstance(pval, str) and pval == "array"
             if not res:
-                rep is None or rep.append(("unexpected array [.'$Array'.type]", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Array'.type]", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected array [.'$Array'.type]", lpath_12))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Array'.type]", lpath_12))
                 return False
             continue
         if pfun := json_model_11_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_12 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Array']", lpath_12 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_12, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Array']", lpath_12))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Array']", lpath_12 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Array']", lpath_12))
         return False
     if must_count != 1:
         if rep is not None:
@@ -861,12 +874,12 @@ def _jm_f_29(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Object'.'$defs'.''
-        res = json_model_24(pval, lpath_16 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_16, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Object'.'$defs'.'']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Object'.'$defs'.'']", lpath_16))
             return False
     return True
 
@@ -901,12 +914,12 @@ def _jm_f_33(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Object'.definitions.''
-        res = json_model_24(pval, lpath_17 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_17, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Object'.definitions.'']", lpath_17 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Object'.definitions.'']", lpath_17))
             return False
     return True
 
@@ -942,16 +955,16 @@ def _jm_f_37(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_18 if path is not None else None, rep):
+        lpath_18: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_18, rep):
             # handle 1 key props
             # .'$Object'.patternProperties.'$REGEX'
-            res = json_model_24(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_24(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Object'.patternProperties.'$REGEX']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Object'.patternProperties.'$REGEX']", lpath_18))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Object'.patternProperties]", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Object'.patternProperties]", lpath_18))
             return False
     return True
 
@@ -963,12 +976,12 @@ def _jm_f_38(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Object'.properties.''
-        res = json_model_24(pval, lpath_19 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_19, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Object'.properties.'']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Object'.properties.'']", lpath_19))
             return False
     return True
 
@@ -978,11 +991,11 @@ def _jm_f_39(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_5_idx, arr_5_item in enumerate(val):
-            arr_5_lpath: Path = (path + [ arr_5_idx ]) if path is not None else None
+            arr_5_lpath: Path = (path, arr_5_idx) if path is not None else None
             # .'$Object'.required.0
             res = isinstance(arr_5_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Object'.required.0]", arr_5_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Object'.required.0]", arr_5_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Object'.required]", path))
@@ -1007,24 +1020,24 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Object'.type
             res = isinstance(pval, str) and pval == "object"
             if not res:
-                rep is None or rep.append(("unexpected object [.'$Object'.type]", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Object'.type]", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected object [.'$Object'.type]", lpath_15))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Object'.type]", lpath_15))
                 return False
             continue
         if pfun := json_model_12_map.get(prop):
             # handle 14 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_15 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Object']", lpath_15 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_15, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Object']", lpath_15))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Object']", lpath_15 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Object']", lpath_15))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1049,12 +1062,12 @@ def _jm_f_42(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Integer'.'$defs'.''
-        res = json_model_24(pval, lpath_21 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_21, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Integer'.'$defs'.'']", lpath_21 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Integer'.'$defs'.'']", lpath_21))
             return False
     return True
 
@@ -1089,12 +1102,12 @@ def _jm_f_46(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
+        lpath_22: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Integer'.definitions.''
-        res = json_model_24(pval, lpath_22 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_22, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Integer'.definitions.'']", lpath_22 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Integer'.definitions.'']", lpath_22))
             return False
     return True
 
@@ -1157,24 +1170,24 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Integer'.type
             res = isinstance(pval, str) and pval == "integer"
             if not res:
-                rep is None or rep.append(("unexpected integer [.'$Integer'.type]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Integer'.type]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected integer [.'$Integer'.type]", lpath_20))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Integer'.type]", lpath_20))
                 return False
             continue
         if pfun := json_model_13_map.get(prop):
             # handle 12 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_20 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Integer']", lpath_20 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_20, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Integer']", lpath_20))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Integer']", lpath_20 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Integer']", lpath_20))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1199,12 +1212,12 @@ def _jm_f_54(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Number'.'$defs'.''
-        res = json_model_24(pval, lpath_24 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_24, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Number'.'$defs'.'']", lpath_24 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Number'.'$defs'.'']", lpath_24))
             return False
     return True
 
@@ -1239,12 +1252,12 @@ def _jm_f_58(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Number'.definitions.''
-        res = json_model_24(pval, lpath_25 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_25, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Number'.definitions.'']", lpath_25 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Number'.definitions.'']", lpath_25))
             return False
     return True
 
@@ -1307,24 +1320,24 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Number'.type
             res = isinstance(pval, str) and pval == "number"
             if not res:
-                rep is None or rep.append(("unexpected number [.'$Number'.type]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Number'.type]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected number [.'$Number'.type]", lpath_23))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Number'.type]", lpath_23))
                 return False
             continue
         if pfun := json_model_14_map.get(prop):
             # handle 12 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_23 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Number']", lpath_23 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_23, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Number']", lpath_23))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Number']", lpath_23 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Number']", lpath_23))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1340,12 +1353,12 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_27: Path = (path + [ prop ]) if path is not None else None
+        lpath_27: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Bool'.'$defs'.''
-        res = json_model_24(pval, lpath_27 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_27, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Bool'.'$defs'.'']", lpath_27 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Bool'.'$defs'.'']", lpath_27))
             return False
     return True
 
@@ -1356,12 +1369,12 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_28: Path = (path + [ prop ]) if path is not None else None
+        lpath_28: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Bool'.definitions.''
-        res = json_model_24(pval, lpath_28 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_28, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Bool'.definitions.'']", lpath_28 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Bool'.definitions.'']", lpath_28))
             return False
     return True
 
@@ -1374,15 +1387,15 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_26: Path = (path + [ prop ]) if path is not None else None
+        lpath_26: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Bool'.type
             res = isinstance(pval, str) and pval == "boolean"
             if not res:
-                rep is None or rep.append(("unexpected boolean [.'$Bool'.type]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Bool'.type]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected boolean [.'$Bool'.type]", lpath_26))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Bool'.type]", lpath_26))
                 return False
             continue
         if prop == "id":
@@ -1390,8 +1403,8 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Bool'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Bool'.id]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Bool'.id]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Bool'.id]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Bool'.id]", lpath_26))
                 return False
             continue
         elif prop == "$id":
@@ -1399,17 +1412,17 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Bool'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Bool'.'$id']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Bool'.'$id']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Bool'.'$id']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Bool'.'$id']", lpath_26))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$Bool'.'$defs'
-            res = _jm_obj_4(pval, lpath_26 if path is not None else None, rep)
+            res = _jm_obj_4(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Bool'.'$defs']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Bool'.'$defs']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Bool'.'$defs']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Bool'.'$defs']", lpath_26))
                 return False
             continue
         elif prop == "title":
@@ -1417,8 +1430,8 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Bool'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Bool'.title]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Bool'.title]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Bool'.title]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Bool'.title]", lpath_26))
                 return False
             continue
         elif prop == "$schema":
@@ -1426,8 +1439,8 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Bool'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Bool'.'$schema']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Bool'.'$schema']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Bool'.'$schema']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Bool'.'$schema']", lpath_26))
                 return False
             continue
         elif prop == "default":
@@ -1440,8 +1453,8 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Bool'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Bool'.'$comment']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Bool'.'$comment']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Bool'.'$comment']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Bool'.'$comment']", lpath_26))
                 return False
             continue
         elif prop == "examples":
@@ -1449,17 +1462,17 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Bool'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Bool'.examples]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Bool'.examples]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Bool'.examples]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Bool'.examples]", lpath_26))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$Bool'.definitions
-            res = _jm_obj_5(pval, lpath_26 if path is not None else None, rep)
+            res = _jm_obj_5(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Bool'.definitions]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Bool'.definitions]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Bool'.definitions]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Bool'.definitions]", lpath_26))
                 return False
             continue
         elif prop == "description":
@@ -1467,11 +1480,11 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Bool'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Bool'.description]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Bool'.description]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Bool'.description]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Bool'.description]", lpath_26))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Bool']", lpath_26 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Bool']", lpath_26))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1487,12 +1500,12 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_30: Path = (path + [ prop ]) if path is not None else None
+        lpath_30: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Null'.'$defs'.''
-        res = json_model_24(pval, lpath_30 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_30, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Null'.'$defs'.'']", lpath_30 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Null'.'$defs'.'']", lpath_30))
             return False
     return True
 
@@ -1503,12 +1516,12 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_31: Path = (path + [ prop ]) if path is not None else None
+        lpath_31: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Null'.definitions.''
-        res = json_model_24(pval, lpath_31 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_31, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Null'.definitions.'']", lpath_31 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Null'.definitions.'']", lpath_31))
             return False
     return True
 
@@ -1521,15 +1534,15 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_29: Path = (path + [ prop ]) if path is not None else None
+        lpath_29: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Null'.type
             res = isinstance(pval, str) and pval == "null"
             if not res:
-                rep is None or rep.append(("unexpected null [.'$Null'.type]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Null'.type]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected null [.'$Null'.type]", lpath_29))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Null'.type]", lpath_29))
                 return False
             continue
         if prop == "id":
@@ -1537,8 +1550,8 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Null'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Null'.id]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Null'.id]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Null'.id]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Null'.id]", lpath_29))
                 return False
             continue
         elif prop == "$id":
@@ -1546,17 +1559,17 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Null'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Null'.'$id']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Null'.'$id']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Null'.'$id']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Null'.'$id']", lpath_29))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$Null'.'$defs'
-            res = _jm_obj_6(pval, lpath_29 if path is not None else None, rep)
+            res = _jm_obj_6(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Null'.'$defs']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Null'.'$defs']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Null'.'$defs']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Null'.'$defs']", lpath_29))
                 return False
             continue
         elif prop == "title":
@@ -1564,8 +1577,8 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Null'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Null'.title]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Null'.title]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Null'.title]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Null'.title]", lpath_29))
                 return False
             continue
         elif prop == "$schema":
@@ -1573,8 +1586,8 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Null'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Null'.'$schema']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Null'.'$schema']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Null'.'$schema']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Null'.'$schema']", lpath_29))
                 return False
             continue
         elif prop == "default":
@@ -1587,8 +1600,8 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Null'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Null'.'$comment']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Null'.'$comment']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Null'.'$comment']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Null'.'$comment']", lpath_29))
                 return False
             continue
         elif prop == "examples":
@@ -1596,17 +1609,17 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Null'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Null'.examples]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Null'.examples]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Null'.examples]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Null'.examples]", lpath_29))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$Null'.definitions
-            res = _jm_obj_7(pval, lpath_29 if path is not None else None, rep)
+            res = _jm_obj_7(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Null'.definitions]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Null'.definitions]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Null'.definitions]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Null'.definitions]", lpath_29))
                 return False
             continue
         elif prop == "description":
@@ -1614,11 +1627,11 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Null'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Null'.description]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Null'.description]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Null'.description]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Null'.description]", lpath_29))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Null']", lpath_29 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Null']", lpath_29))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1634,12 +1647,12 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_33: Path = (path + [ prop ]) if path is not None else None
+        lpath_33: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$AllOf'.'$defs'.''
-        res = json_model_24(pval, lpath_33 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_33, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$AllOf'.'$defs'.'']", lpath_33 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$AllOf'.'$defs'.'']", lpath_33))
             return False
     return True
 
@@ -1650,12 +1663,12 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_34: Path = (path + [ prop ]) if path is not None else None
+        lpath_34: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$AllOf'.definitions.''
-        res = json_model_24(pval, lpath_34 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_34, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$AllOf'.definitions.'']", lpath_34 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$AllOf'.definitions.'']", lpath_34))
             return False
     return True
 
@@ -1668,15 +1681,15 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_32: Path = (path + [ prop ]) if path is not None else None
+        lpath_32: Path = (path, prop) if path is not None else None
         if prop == "allOf":
             # handle must allOf property
             must_count += 1
             # .'$AllOf'.allOf
-            res = json_model_4(pval, lpath_32 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_32, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$AllOf'.allOf]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$AllOf'.allOf]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$AllOf'.allOf]", lpath_32))
+                rep is None or rep.append(("invalid mandatory prop value [.'$AllOf'.allOf]", lpath_32))
                 return False
             continue
         if prop == "id":
@@ -1684,8 +1697,8 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AllOf'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AllOf'.id]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.id]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AllOf'.id]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.id]", lpath_32))
                 return False
             continue
         elif prop == "$id":
@@ -1693,17 +1706,17 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AllOf'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AllOf'.'$id']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.'$id']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AllOf'.'$id']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.'$id']", lpath_32))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$AllOf'.'$defs'
-            res = _jm_obj_8(pval, lpath_32 if path is not None else None, rep)
+            res = _jm_obj_8(pval, lpath_32, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$AllOf'.'$defs']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.'$defs']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$AllOf'.'$defs']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.'$defs']", lpath_32))
                 return False
             continue
         elif prop == "title":
@@ -1711,8 +1724,8 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AllOf'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AllOf'.title]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.title]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AllOf'.title]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.title]", lpath_32))
                 return False
             continue
         elif prop == "$schema":
@@ -1720,8 +1733,8 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AllOf'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AllOf'.'$schema']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.'$schema']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AllOf'.'$schema']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.'$schema']", lpath_32))
                 return False
             continue
         elif prop == "default":
@@ -1734,8 +1747,8 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AllOf'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AllOf'.'$comment']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.'$comment']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AllOf'.'$comment']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.'$comment']", lpath_32))
                 return False
             continue
         elif prop == "examples":
@@ -1743,17 +1756,17 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AllOf'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$AllOf'.examples]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.examples]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$AllOf'.examples]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.examples]", lpath_32))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$AllOf'.definitions
-            res = _jm_obj_9(pval, lpath_32 if path is not None else None, rep)
+            res = _jm_obj_9(pval, lpath_32, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$AllOf'.definitions]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.definitions]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$AllOf'.definitions]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.definitions]", lpath_32))
                 return False
             continue
         elif prop == "description":
@@ -1761,11 +1774,11 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AllOf'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AllOf'.description]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.description]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AllOf'.description]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$AllOf'.description]", lpath_32))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AllOf']", lpath_32 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AllOf']", lpath_32))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1781,12 +1794,12 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_36: Path = (path + [ prop ]) if path is not None else None
+        lpath_36: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$AnyOf'.'$defs'.''
-        res = json_model_24(pval, lpath_36 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_36, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$AnyOf'.'$defs'.'']", lpath_36 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$AnyOf'.'$defs'.'']", lpath_36))
             return False
     return True
 
@@ -1797,12 +1810,12 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_37: Path = (path + [ prop ]) if path is not None else None
+        lpath_37: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$AnyOf'.definitions.''
-        res = json_model_24(pval, lpath_37 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_37, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$AnyOf'.definitions.'']", lpath_37 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$AnyOf'.definitions.'']", lpath_37))
             return False
     return True
 
@@ -1815,15 +1828,15 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_35: Path = (path + [ prop ]) if path is not None else None
+        lpath_35: Path = (path, prop) if path is not None else None
         if prop == "anyOf":
             # handle must anyOf property
             must_count += 1
             # .'$AnyOf'.anyOf
-            res = json_model_4(pval, lpath_35 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$AnyOf'.anyOf]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$AnyOf'.anyOf]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$AnyOf'.anyOf]", lpath_35))
+                rep is None or rep.append(("invalid mandatory prop value [.'$AnyOf'.anyOf]", lpath_35))
                 return False
             continue
         if prop == "id":
@@ -1831,8 +1844,8 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AnyOf'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AnyOf'.id]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.id]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AnyOf'.id]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.id]", lpath_35))
                 return False
             continue
         elif prop == "$id":
@@ -1840,17 +1853,17 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AnyOf'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AnyOf'.'$id']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.'$id']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AnyOf'.'$id']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.'$id']", lpath_35))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$AnyOf'.'$defs'
-            res = _jm_obj_10(pval, lpath_35 if path is not None else None, rep)
+            res = _jm_obj_10(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$AnyOf'.'$defs']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.'$defs']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$AnyOf'.'$defs']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.'$defs']", lpath_35))
                 return False
             continue
         elif prop == "title":
@@ -1858,8 +1871,8 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AnyOf'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AnyOf'.title]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.title]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AnyOf'.title]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.title]", lpath_35))
                 return False
             continue
         elif prop == "$schema":
@@ -1867,8 +1880,8 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AnyOf'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AnyOf'.'$schema']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.'$schema']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AnyOf'.'$schema']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.'$schema']", lpath_35))
                 return False
             continue
         elif prop == "default":
@@ -1881,8 +1894,8 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AnyOf'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AnyOf'.'$comment']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.'$comment']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AnyOf'.'$comment']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.'$comment']", lpath_35))
                 return False
             continue
         elif prop == "examples":
@@ -1890,17 +1903,17 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AnyOf'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$AnyOf'.examples]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.examples]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$AnyOf'.examples]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.examples]", lpath_35))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$AnyOf'.definitions
-            res = _jm_obj_11(pval, lpath_35 if path is not None else None, rep)
+            res = _jm_obj_11(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$AnyOf'.definitions]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.definitions]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$AnyOf'.definitions]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.definitions]", lpath_35))
                 return False
             continue
         elif prop == "description":
@@ -1908,11 +1921,11 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AnyOf'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$AnyOf'.description]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.description]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$AnyOf'.description]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$AnyOf'.description]", lpath_35))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AnyOf']", lpath_35 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AnyOf']", lpath_35))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1928,12 +1941,12 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_39: Path = (path + [ prop ]) if path is not None else None
+        lpath_39: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$OneOf'.'$defs'.''
-        res = json_model_24(pval, lpath_39 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_39, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$OneOf'.'$defs'.'']", lpath_39 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$OneOf'.'$defs'.'']", lpath_39))
             return False
     return True
 
@@ -1944,12 +1957,12 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_40: Path = (path + [ prop ]) if path is not None else None
+        lpath_40: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$OneOf'.definitions.''
-        res = json_model_24(pval, lpath_40 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_40, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$OneOf'.definitions.'']", lpath_40 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$OneOf'.definitions.'']", lpath_40))
             return False
     return True
 
@@ -1962,15 +1975,15 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_38: Path = (path + [ prop ]) if path is not None else None
+        lpath_38: Path = (path, prop) if path is not None else None
         if prop == "oneOf":
             # handle must oneOf property
             must_count += 1
             # .'$OneOf'.oneOf
-            res = json_model_4(pval, lpath_38 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_38, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$OneOf'.oneOf]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$OneOf'.oneOf]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$OneOf'.oneOf]", lpath_38))
+                rep is None or rep.append(("invalid mandatory prop value [.'$OneOf'.oneOf]", lpath_38))
                 return False
             continue
         if prop == "id":
@@ -1978,8 +1991,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OneOf'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$OneOf'.id]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.id]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$OneOf'.id]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.id]", lpath_38))
                 return False
             continue
         elif prop == "$id":
@@ -1987,17 +2000,17 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OneOf'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$OneOf'.'$id']", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.'$id']", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$OneOf'.'$id']", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.'$id']", lpath_38))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$OneOf'.'$defs'
-            res = _jm_obj_12(pval, lpath_38 if path is not None else None, rep)
+            res = _jm_obj_12(pval, lpath_38, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$OneOf'.'$defs']", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.'$defs']", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$OneOf'.'$defs']", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.'$defs']", lpath_38))
                 return False
             continue
         elif prop == "title":
@@ -2005,8 +2018,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OneOf'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$OneOf'.title]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.title]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$OneOf'.title]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.title]", lpath_38))
                 return False
             continue
         elif prop == "$schema":
@@ -2014,8 +2027,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OneOf'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$OneOf'.'$schema']", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.'$schema']", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$OneOf'.'$schema']", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.'$schema']", lpath_38))
                 return False
             continue
         elif prop == "default":
@@ -2028,8 +2041,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OneOf'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$OneOf'.'$comment']", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.'$comment']", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$OneOf'.'$comment']", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.'$comment']", lpath_38))
                 return False
             continue
         elif prop == "examples":
@@ -2037,17 +2050,17 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OneOf'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$OneOf'.examples]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.examples]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$OneOf'.examples]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.examples]", lpath_38))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$OneOf'.definitions
-            res = _jm_obj_13(pval, lpath_38 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_38, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$OneOf'.definitions]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.definitions]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$OneOf'.definitions]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.definitions]", lpath_38))
                 return False
             continue
         elif prop == "description":
@@ -2055,11 +2068,11 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OneOf'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$OneOf'.description]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.description]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$OneOf'.description]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$OneOf'.description]", lpath_38))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$OneOf']", lpath_38 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$OneOf']", lpath_38))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2075,12 +2088,12 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_42: Path = (path + [ prop ]) if path is not None else None
+        lpath_42: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Enum'.'$defs'.''
-        res = json_model_24(pval, lpath_42 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_42, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Enum'.'$defs'.'']", lpath_42 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Enum'.'$defs'.'']", lpath_42))
             return False
     return True
 
@@ -2091,12 +2104,12 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_43: Path = (path + [ prop ]) if path is not None else None
+        lpath_43: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Enum'.definitions.''
-        res = json_model_24(pval, lpath_43 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_43, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Enum'.definitions.'']", lpath_43 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Enum'.definitions.'']", lpath_43))
             return False
     return True
 
@@ -2109,15 +2122,15 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_41: Path = (path + [ prop ]) if path is not None else None
+        lpath_41: Path = (path, prop) if path is not None else None
         if prop == "enum":
             # handle must enum property
             must_count += 1
             # .'$Enum'.enum
-            res = json_model_3(pval, lpath_41 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_41, rep)
             if not res:
-                rep is None or rep.append(("unexpected $enum [.'$Enum'.enum]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Enum'.enum]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected $enum [.'$Enum'.enum]", lpath_41))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Enum'.enum]", lpath_41))
                 return False
             continue
         if prop == "id":
@@ -2125,8 +2138,8 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Enum'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Enum'.id]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Enum'.id]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Enum'.id]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$Enum'.id]", lpath_41))
                 return False
             continue
         elif prop == "$id":
@@ -2134,17 +2147,17 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Enum'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Enum'.'$id']", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Enum'.'$id']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Enum'.'$id']", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$Enum'.'$id']", lpath_41))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$Enum'.'$defs'
-            res = _jm_obj_14(pval, lpath_41 if path is not None else None, rep)
+            res = _jm_obj_14(pval, lpath_41, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Enum'.'$defs']", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Enum'.'$defs']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Enum'.'$defs']", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$Enum'.'$defs']", lpath_41))
                 return False
             continue
         elif prop == "title":
@@ -2152,8 +2165,8 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Enum'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Enum'.title]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Enum'.title]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Enum'.title]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$Enum'.title]", lpath_41))
                 return False
             continue
         elif prop == "$schema":
@@ -2161,8 +2174,8 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Enum'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Enum'.'$schema']", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Enum'.'$schema']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Enum'.'$schema']", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$Enum'.'$schema']", lpath_41))
                 return False
             continue
         elif prop == "default":
@@ -2175,8 +2188,8 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Enum'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Enum'.'$comment']", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Enum'.'$comment']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Enum'.'$comment']", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$Enum'.'$comment']", lpath_41))
                 return False
             continue
         elif prop == "examples":
@@ -2184,17 +2197,17 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Enum'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Enum'.examples]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Enum'.examples]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Enum'.examples]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$Enum'.examples]", lpath_41))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$Enum'.definitions
-            res = _jm_obj_15(pval, lpath_41 if path is not None else None, rep)
+            res = _jm_obj_15(pval, lpath_41, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Enum'.definitions]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Enum'.definitions]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Enum'.definitions]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$Enum'.definitions]", lpath_41))
                 return False
             continue
         elif prop == "description":
@@ -2202,11 +2215,11 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Enum'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Enum'.description]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Enum'.description]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Enum'.description]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$Enum'.description]", lpath_41))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Enum']", lpath_41 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Enum']", lpath_41))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2222,12 +2235,12 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_45: Path = (path + [ prop ]) if path is not None else None
+        lpath_45: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Const'.'$defs'.''
-        res = json_model_24(pval, lpath_45 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_45, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Const'.'$defs'.'']", lpath_45 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Const'.'$defs'.'']", lpath_45))
             return False
     return True
 
@@ -2238,12 +2251,12 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_46: Path = (path + [ prop ]) if path is not None else None
+        lpath_46: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Const'.definitions.''
-        res = json_model_24(pval, lpath_46 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_46, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Const'.definitions.'']", lpath_46 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Const'.definitions.'']", lpath_46))
             return False
     return True
 
@@ -2256,15 +2269,15 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_44: Path = (path + [ prop ]) if path is not None else None
+        lpath_44: Path = (path, prop) if path is not None else None
         if prop == "const":
             # handle must const property
             must_count += 1
             # .'$Const'.const
-            res = json_model_2(pval, lpath_44 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_44, rep)
             if not res:
-                rep is None or rep.append(("unexpected $const [.'$Const'.const]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Const'.const]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected $const [.'$Const'.const]", lpath_44))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Const'.const]", lpath_44))
                 return False
             continue
         if prop == "id":
@@ -2272,8 +2285,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Const'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Const'.id]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Const'.id]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Const'.id]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$Const'.id]", lpath_44))
                 return False
             continue
         elif prop == "$id":
@@ -2281,17 +2294,17 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Const'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Const'.'$id']", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Const'.'$id']", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Const'.'$id']", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$Const'.'$id']", lpath_44))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$Const'.'$defs'
-            res = _jm_obj_16(pval, lpath_44 if path is not None else None, rep)
+            res = _jm_obj_16(pval, lpath_44, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Const'.'$defs']", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Const'.'$defs']", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Const'.'$defs']", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$Const'.'$defs']", lpath_44))
                 return False
             continue
         elif prop == "title":
@@ -2299,8 +2312,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Const'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Const'.title]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Const'.title]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Const'.title]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$Const'.title]", lpath_44))
                 return False
             continue
         elif prop == "$schema":
@@ -2308,8 +2321,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Const'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Const'.'$schema']", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Const'.'$schema']", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Const'.'$schema']", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$Const'.'$schema']", lpath_44))
                 return False
             continue
         elif prop == "default":
@@ -2322,8 +2335,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Const'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Const'.'$comment']", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Const'.'$comment']", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Const'.'$comment']", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$Const'.'$comment']", lpath_44))
                 return False
             continue
         elif prop == "examples":
@@ -2331,17 +2344,17 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Const'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Const'.examples]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Const'.examples]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Const'.examples]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$Const'.examples]", lpath_44))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$Const'.definitions
-            res = _jm_obj_17(pval, lpath_44 if path is not None else None, rep)
+            res = _jm_obj_17(pval, lpath_44, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Const'.definitions]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Const'.definitions]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Const'.definitions]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$Const'.definitions]", lpath_44))
                 return False
             continue
         elif prop == "description":
@@ -2349,11 +2362,11 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Const'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Const'.description]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Const'.description]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Const'.description]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$Const'.description]", lpath_44))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Const']", lpath_44 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Const']", lpath_44))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2369,12 +2382,12 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_48: Path = (path + [ prop ]) if path is not None else None
+        lpath_48: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Ref'.'$defs'.''
-        res = json_model_24(pval, lpath_48 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_48, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Ref'.'$defs'.'']", lpath_48 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Ref'.'$defs'.'']", lpath_48))
             return False
     return True
 
@@ -2385,12 +2398,12 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_49: Path = (path + [ prop ]) if path is not None else None
+        lpath_49: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Ref'.definitions.''
-        res = json_model_24(pval, lpath_49 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_49, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Ref'.definitions.'']", lpath_49 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Ref'.definitions.'']", lpath_49))
             return False
     return True
 
@@ -2403,15 +2416,15 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_47: Path = (path + [ prop ]) if path is not None else None
+        lpath_47: Path = (path, prop) if path is not None else None
         if prop == "$ref":
             # handle must $ref property
             must_count += 1
             # .'$Ref'.'$ref'
-            res = is_valid_url(pval, lpath_47 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$Ref'.'$ref']", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Ref'.'$ref']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$Ref'.'$ref']", lpath_47))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Ref'.'$ref']", lpath_47))
                 return False
             continue
         if prop == "id":
@@ -2419,8 +2432,8 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Ref'.id
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ref'.id]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ref'.id]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ref'.id]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$Ref'.id]", lpath_47))
                 return False
             continue
         elif prop == "$id":
@@ -2428,17 +2441,17 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Ref'.'$id'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ref'.'$id']", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ref'.'$id']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ref'.'$id']", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$Ref'.'$id']", lpath_47))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$Ref'.'$defs'
-            res = _jm_obj_18(pval, lpath_47 if path is not None else None, rep)
+            res = _jm_obj_18(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Ref'.'$defs']", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ref'.'$defs']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Ref'.'$defs']", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$Ref'.'$defs']", lpath_47))
                 return False
             continue
         elif prop == "title":
@@ -2446,8 +2459,8 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Ref'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ref'.title]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ref'.title]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ref'.title]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$Ref'.title]", lpath_47))
                 return False
             continue
         elif prop == "$schema":
@@ -2455,8 +2468,8 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Ref'.'$schema'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ref'.'$schema']", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ref'.'$schema']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ref'.'$schema']", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$Ref'.'$schema']", lpath_47))
                 return False
             continue
         elif prop == "default":
@@ -2469,8 +2482,8 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Ref'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ref'.'$comment']", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ref'.'$comment']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ref'.'$comment']", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$Ref'.'$comment']", lpath_47))
                 return False
             continue
         elif prop == "examples":
@@ -2478,17 +2491,17 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Ref'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Ref'.examples]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ref'.examples]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Ref'.examples]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$Ref'.examples]", lpath_47))
                 return False
             continue
         elif prop == "definitions":
             # handle may definitions property
             # .'$Ref'.definitions
-            res = _jm_obj_19(pval, lpath_47 if path is not None else None, rep)
+            res = _jm_obj_19(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Ref'.definitions]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ref'.definitions]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Ref'.definitions]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$Ref'.definitions]", lpath_47))
                 return False
             continue
         elif prop == "description":
@@ -2496,11 +2509,11 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Ref'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ref'.description]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ref'.description]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ref'.description]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$Ref'.description]", lpath_47))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Ref']", lpath_47 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Ref']", lpath_47))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2562,12 +2575,12 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("$schema", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <$schema> [.'$RootSchema'.'&'.0]", path))
         return False
-    lpath = (path + [ "$schema" ]) if path is not None else None
+    lpath = (path, "$schema") if path is not None else None
     # .'$RootSchema'.'&'.0.'$schema'
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$RootSchema'.'&'.0.'$schema']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <$schema> [.'$RootSchema'.'&'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$RootSchema'.'&'.0.'$schema']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <$schema> [.'$RootSchema'.'&'.0]", lpath))
         return False
     return True
 
@@ -2743,5 +2756,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -28,11 +41,11 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$li0'.0
             res = isinstance(arr_0_item, int) and not isinstance(arr_0_item, bool) and arr_0_item >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$li0'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$li0'.0]", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$li0']", path))
@@ -44,11 +57,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$ls0'.0
-            res = is_valid_url(arr_1_item, arr_1_lpath if path is not None else None, rep)
+            res = is_valid_url(arr_1_item, arr_1_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$ls0'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$ls0'.0]", arr_1_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$ls0']", path))
@@ -60,11 +73,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$lb0'.0
             res = isinstance(arr_2_item, bool)
             if not res:
-                rep is None or rep.append(("unexpected $BOOL [.'$lb0'.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $BOOL [.'$lb0'.0]", arr_2_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$lb0']", path))
@@ -76,11 +89,11 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_3_idx, arr_3_item in enumerate(val):
-            arr_3_lpath: Path = (path + [ arr_3_idx ]) if path is not None else None
+            arr_3_lpath: Path = (path, arr_3_idx) if path is not None else None
             # .'$lf0'.0
             res = isinstance(arr_3_item, float) and arr_3_item >= 0.0
             if not res:
-                rep is None or rep.append(("not a 0.0 strict float [.'$lf0'.0]", arr_3_lpath if path is not None else None))
+                rep is None or rep.append(("not a 0.0 strict float [.'$lf0'.0]", arr_3_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$lf0']", path))
@@ -137,5 +150,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -50,12 +63,12 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$OpenAPI'.webhooks.''
-        res = json_model_10(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_10(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $PathItem [.'$OpenAPI'.webhooks.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $PathItem [.'$OpenAPI'.webhooks.'']", lpath_1))
             return False
     return True
 
@@ -68,15 +81,15 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "info":
             # handle must info property
             must_count += 1
             # .'$OpenAPI'.info
-            res = json_model_3(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Info [.'$OpenAPI'.info]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$OpenAPI'.info]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Info [.'$OpenAPI'.info]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$OpenAPI'.info]", lpath_0))
                 return False
             continue
         elif prop == "openapi":
@@ -84,10 +97,10 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             must_count += 1
             # .'$OpenAPI'.openapi
             # "/^3\\.1\\.\\d+(-.+)?$/"
-            res = isinstance(pval, str) and _jm_re_0(pval, lpath_0 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_0(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^3\\.1\\.\\d+(-.+)?$/ [.'$OpenAPI'.openapi]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$OpenAPI'.openapi]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected /^3\\.1\\.\\d+(-.+)?$/ [.'$OpenAPI'.openapi]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$OpenAPI'.openapi]", lpath_0))
                 return False
             continue
         if prop == "tags":
@@ -96,24 +109,24 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_0_idx, arr_0_item in enumerate(pval):
-                    arr_0_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_0_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                    arr_0_lpath: Path = (lpath_0, arr_0_idx) if lpath_0 is not None else None
                     # .'$OpenAPI'.tags.0
-                    res = json_model_29(arr_0_item, arr_0_lpath if (lpath_0 if path is not None else None) is not None else None, rep)
+                    res = json_model_29(arr_0_item, arr_0_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $Tag [.'$OpenAPI'.tags.0]", arr_0_lpath if (lpath_0 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $Tag [.'$OpenAPI'.tags.0]", arr_0_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$OpenAPI'.tags]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.tags]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$OpenAPI'.tags]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.tags]", lpath_0))
                 return False
             continue
         elif prop == "paths":
             # handle may paths property
             # .'$OpenAPI'.paths
-            res = json_model_9(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Paths [.'$OpenAPI'.paths]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.paths]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Paths [.'$OpenAPI'.paths]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.paths]", lpath_0))
                 return False
             continue
         elif prop == "servers":
@@ -122,15 +135,15 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_1_idx, arr_1_item in enumerate(pval):
-                    arr_1_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_1_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                    arr_1_lpath: Path = (lpath_0, arr_1_idx) if lpath_0 is not None else None
                     # .'$OpenAPI'.servers.0
-                    res = json_model_6(arr_1_item, arr_1_lpath if (lpath_0 if path is not None else None) is not None else None, rep)
+                    res = json_model_6(arr_1_item, arr_1_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $Server [.'$OpenAPI'.servers.0]", arr_1_lpath if (lpath_0 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $Server [.'$OpenAPI'.servers.0]", arr_1_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$OpenAPI'.servers]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.servers]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$OpenAPI'.servers]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.servers]", lpath_0))
                 return False
             continue
         elif prop == "security":
@@ -139,51 +152,51 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_2_idx, arr_2_item in enumerate(pval):
-                    arr_2_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_2_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                    arr_2_lpath: Path = (lpath_0, arr_2_idx) if lpath_0 is not None else None
                     # .'$OpenAPI'.security.0
-                    res = json_model_43(arr_2_item, arr_2_lpath if (lpath_0 if path is not None else None) is not None else None, rep)
+                    res = json_model_43(arr_2_item, arr_2_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $SecurityRequirement [.'$OpenAPI'.security.0]", arr_2_lpath if (lpath_0 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $SecurityRequirement [.'$OpenAPI'.security.0]", arr_2_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$OpenAPI'.security]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.security]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$OpenAPI'.security]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.security]", lpath_0))
                 return False
             continue
         elif prop == "webhooks":
             # handle may webhooks property
             # .'$OpenAPI'.webhooks
-            res = _jm_obj_0(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$OpenAPI'.webhooks]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.webhooks]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$OpenAPI'.webhooks]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.webhooks]", lpath_0))
                 return False
             continue
         elif prop == "components":
             # handle may components property
             # .'$OpenAPI'.components
-            res = json_model_8(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_8(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Components [.'$OpenAPI'.components]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.components]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Components [.'$OpenAPI'.components]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.components]", lpath_0))
                 return False
             continue
         elif prop == "externalDocs":
             # handle may externalDocs property
             # .'$OpenAPI'.externalDocs
-            res = json_model_12(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_12(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $ExternalDocumentation [.'$OpenAPI'.externalDocs]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.externalDocs]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $ExternalDocumentation [.'$OpenAPI'.externalDocs]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.externalDocs]", lpath_0))
                 return False
             continue
         elif prop == "jsonSchemaDialect":
             # handle may jsonSchemaDialect property
             # .'$OpenAPI'.jsonSchemaDialect
-            res = is_valid_url(pval, lpath_0 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$OpenAPI'.jsonSchemaDialect]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.jsonSchemaDialect]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$OpenAPI'.jsonSchemaDialect]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenAPI'.jsonSchemaDialect]", lpath_0))
                 return False
             continue
         if prop.startswith("x-"):
@@ -191,7 +204,7 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OpenAPI'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$OpenAPI']", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$OpenAPI']", lpath_0))
             return False
     if must_count != 2:
         if rep is not None:
@@ -211,15 +224,15 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "title":
             # handle must title property
             must_count += 1
             # .'$Info'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Info'.title]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Info'.title]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Info'.title]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Info'.title]", lpath_2))
                 return False
             continue
         elif prop == "version":
@@ -228,26 +241,26 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Info'.version
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Info'.version]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Info'.version]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Info'.version]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Info'.version]", lpath_2))
                 return False
             continue
         if prop == "contact":
             # handle may contact property
             # .'$Info'.contact
-            res = json_model_4(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Contact [.'$Info'.contact]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Info'.contact]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $Contact [.'$Info'.contact]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Info'.contact]", lpath_2))
                 return False
             continue
         elif prop == "license":
             # handle may license property
             # .'$Info'.license
-            res = json_model_5(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_5(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $License [.'$Info'.license]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Info'.license]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $License [.'$Info'.license]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Info'.license]", lpath_2))
                 return False
             continue
         elif prop == "summary":
@@ -255,8 +268,8 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Info'.summary
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Info'.summary]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Info'.summary]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Info'.summary]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Info'.summary]", lpath_2))
                 return False
             continue
         elif prop == "description":
@@ -264,8 +277,8 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Info'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Info'.description]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Info'.description]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Info'.description]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Info'.description]", lpath_2))
                 return False
             continue
         elif prop == "termsOfService":
@@ -273,8 +286,8 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Info'.termsOfService
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Info'.termsOfService]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Info'.termsOfService]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Info'.termsOfService]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Info'.termsOfService]", lpath_2))
                 return False
             continue
         if prop.startswith("x-"):
@@ -282,7 +295,7 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Info'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Info']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Info']", lpath_2))
             return False
     if must_count != 2:
         if rep is not None:
@@ -301,14 +314,14 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "url":
             # handle may url property
             # .'$Contact'.url
-            res = is_valid_url(pval, lpath_3 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$Contact'.url]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Contact'.url]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$Contact'.url]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Contact'.url]", lpath_3))
                 return False
             continue
         elif prop == "name":
@@ -316,8 +329,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Contact'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Contact'.name]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Contact'.name]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Contact'.name]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Contact'.name]", lpath_3))
                 return False
             continue
         elif prop == "email":
@@ -325,8 +338,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Contact'.email
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Contact'.email]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Contact'.email]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Contact'.email]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Contact'.email]", lpath_3))
                 return False
             continue
         if prop.startswith("x-"):
@@ -334,7 +347,7 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Contact'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Contact']", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Contact']", lpath_3))
             return False
     return True
 
@@ -347,15 +360,15 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "url":
             # handle must url property
             must_count += 1
             # .'$License'.'|'.1.url
-            res = is_valid_url(pval, lpath_4 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$License'.'|'.1.url]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$License'.'|'.1.url]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$License'.'|'.1.url]", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$License'.'|'.1.url]", lpath_4))
                 return False
             continue
         elif prop == "name":
@@ -364,8 +377,8 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$License'.'|'.1.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$License'.'|'.1.name]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$License'.'|'.1.name]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$License'.'|'.1.name]", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$License'.'|'.1.name]", lpath_4))
                 return False
             continue
         if _jm_re_1(prop, path, rep):
@@ -373,7 +386,7 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$License'.'|'.1.'/^x\\-.*$/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$License'.'|'.1]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$License'.'|'.1]", lpath_4))
             return False
     if must_count != 2:
         if rep is not None:
@@ -392,15 +405,15 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle must name property
             must_count += 1
             # .'$License'.'|'.0.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$License'.'|'.0.name]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$License'.'|'.0.name]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$License'.'|'.0.name]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$License'.'|'.0.name]", lpath_5))
                 return False
             continue
         elif prop == "identifier":
@@ -409,8 +422,8 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$License'.'|'.0.identifier
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$License'.'|'.0.identifier]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$License'.'|'.0.identifier]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$License'.'|'.0.identifier]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$License'.'|'.0.identifier]", lpath_5))
                 return False
             continue
         if _jm_re_1(prop, path, rep):
@@ -418,7 +431,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$License'.'|'.0.'/^x\\-.*$/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$License'.'|'.0]", lpath_5 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$License'.'|'.0]", lpath_5))
             return False
     if must_count != 2:
         if rep is not None:
@@ -457,12 +470,12 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Server'.variables.''
-        res = json_model_7(pval, lpath_7 if path is not None else None, rep)
+        res = json_model_7(pval, lpath_7, rep)
         if not res:
-            rep is None or rep.append(("unexpected $ServerVariable [.'$Server'.variables.'']", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected $ServerVariable [.'$Server'.variables.'']", lpath_7))
             return False
     return True
 
@@ -475,24 +488,24 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "url":
             # handle must url property
             must_count += 1
             # .'$Server'.url
-            res = is_valid_url(pval, lpath_6 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$Server'.url]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Server'.url]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$Server'.url]", lpath_6))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Server'.url]", lpath_6))
                 return False
             continue
         if prop == "variables":
             # handle may variables property
             # .'$Server'.variables
-            res = _jm_obj_3(pval, lpath_6 if path is not None else None, rep)
+            res = _jm_obj_3(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Server'.variables]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Server'.variables]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Server'.variables]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Server'.variables]", lpath_6))
                 return False
             continue
         elif prop == "description":
@@ -500,8 +513,8 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Server'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Server'.description]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Server'.description]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Server'.description]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Server'.description]", lpath_6))
                 return False
             continue
         if prop.startswith("x-"):
@@ -509,7 +522,7 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Server'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Server']", lpath_6 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Server']", lpath_6))
             return False
     if must_count != 1:
         if rep is not None:
@@ -527,15 +540,15 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "default":
             # handle must default property
             must_count += 1
             # .'$ServerVariable'.default
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$ServerVariable'.default]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$ServerVariable'.default]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$ServerVariable'.default]", lpath_8))
+                rep is None or rep.append(("invalid mandatory prop value [.'$ServerVariable'.default]", lpath_8))
                 return False
             continue
         if prop == "enum":
@@ -544,15 +557,15 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_3_idx, arr_3_item in enumerate(pval):
-                    arr_3_lpath: Path = ((lpath_8 if path is not None else None) + [ arr_3_idx ]) if (lpath_8 if path is not None else None) is not None else None
+                    arr_3_lpath: Path = (lpath_8, arr_3_idx) if lpath_8 is not None else None
                     # .'$ServerVariable'.enum.0
                     res = isinstance(arr_3_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$ServerVariable'.enum.0]", arr_3_lpath if (lpath_8 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$ServerVariable'.enum.0]", arr_3_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$ServerVariable'.enum]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ServerVariable'.enum]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$ServerVariable'.enum]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$ServerVariable'.enum]", lpath_8))
                 return False
             continue
         elif prop == "description":
@@ -560,8 +573,8 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$ServerVariable'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$ServerVariable'.description]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ServerVariable'.description]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$ServerVariable'.description]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$ServerVariable'.description]", lpath_8))
                 return False
             continue
         if prop.startswith("x-"):
@@ -569,7 +582,7 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$ServerVariable'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$ServerVariable']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$ServerVariable']", lpath_8))
             return False
     if must_count != 1:
         if rep is not None:
@@ -585,21 +598,21 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.links.''
         # .'$Components'.links.''.'|'.0
-        res = json_model_27(pval, lpath_10 if path is not None else None, rep)
+        res = json_model_27(pval, lpath_10, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Link [.'$Components'.links.''.'|'.0]", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected $Link [.'$Components'.links.''.'|'.0]", lpath_10))
             # .'$Components'.links.''.'|'.1
-            res = json_model_30(pval, lpath_10 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Components'.links.''.'|'.1]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Components'.links.''.'|'.1]", lpath_10))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Components'.links.''.'|']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Components'.links.''.'|']", lpath_10))
             return False
     return True
 
@@ -610,21 +623,21 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.headers.''
         # .'$Components'.headers.''.'|'.0
-        res = json_model_28(pval, lpath_11 if path is not None else None, rep)
+        res = json_model_28(pval, lpath_11, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Header [.'$Components'.headers.''.'|'.0]", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected $Header [.'$Components'.headers.''.'|'.0]", lpath_11))
             # .'$Components'.headers.''.'|'.1
-            res = json_model_30(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Components'.headers.''.'|'.1]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Components'.headers.''.'|'.1]", lpath_11))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Components'.headers.''.'|']", lpath_11 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Components'.headers.''.'|']", lpath_11))
             return False
     return True
 
@@ -635,12 +648,12 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.schemas.''
-        res = json_model_32(pval, lpath_12 if path is not None else None, rep)
+        res = json_model_32(pval, lpath_12, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Components'.schemas.'']", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Components'.schemas.'']", lpath_12))
             return False
     return True
 
@@ -651,21 +664,21 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.examples.''
         # .'$Components'.examples.''.'|'.0
-        res = json_model_25(pval, lpath_13 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_13, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Example [.'$Components'.examples.''.'|'.0]", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected $Example [.'$Components'.examples.''.'|'.0]", lpath_13))
             # .'$Components'.examples.''.'|'.1
-            res = json_model_30(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Components'.examples.''.'|'.1]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Components'.examples.''.'|'.1]", lpath_13))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Components'.examples.''.'|']", lpath_13 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Components'.examples.''.'|']", lpath_13))
             return False
     return True
 
@@ -676,21 +689,21 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.callbacks.''
         # .'$Components'.callbacks.''.'|'.0
-        res = json_model_24(pval, lpath_14 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_14, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Callback [.'$Components'.callbacks.''.'|'.0]", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected $Callback [.'$Components'.callbacks.''.'|'.0]", lpath_14))
             # .'$Components'.callbacks.''.'|'.1
-            res = json_model_30(pval, lpath_14 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Components'.callbacks.''.'|'.1]", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Components'.callbacks.''.'|'.1]", lpath_14))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Components'.callbacks.''.'|']", lpath_14 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Components'.callbacks.''.'|']", lpath_14))
             return False
     return True
 
@@ -701,21 +714,21 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.pathItems.''
         # .'$Components'.pathItems.''.'|'.0
-        res = json_model_10(pval, lpath_15 if path is not None else None, rep)
+        res = json_model_10(pval, lpath_15, rep)
         if not res:
-            rep is None or rep.append(("unexpected $PathItem [.'$Components'.pathItems.''.'|'.0]", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected $PathItem [.'$Components'.pathItems.''.'|'.0]", lpath_15))
             # .'$Components'.pathItems.''.'|'.1
-            res = json_model_30(pval, lpath_15 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Components'.pathItems.''.'|'.1]", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Components'.pathItems.''.'|'.1]", lpath_15))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Components'.pathItems.''.'|']", lpath_15 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Components'.pathItems.''.'|']", lpath_15))
             return False
     return True
 
@@ -726,21 +739,21 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.responses.''
         # .'$Components'.responses.''.'|'.0
-        res = json_model_23(pval, lpath_16 if path is not None else None, rep)
+        res = json_model_23(pval, lpath_16, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Response [.'$Components'.responses.''.'|'.0]", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected $Response [.'$Components'.responses.''.'|'.0]", lpath_16))
             # .'$Components'.responses.''.'|'.1
-            res = json_model_30(pval, lpath_16 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Components'.responses.''.'|'.1]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Components'.responses.''.'|'.1]", lpath_16))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Components'.responses.''.'|']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Components'.responses.''.'|']", lpath_16))
             return False
     return True
 
@@ -751,21 +764,21 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.parameters.''
         # .'$Components'.parameters.''.'|'.0
-        res = json_model_18(pval, lpath_17 if path is not None else None, rep)
+        res = json_model_18(pval, lpath_17, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Parameter [.'$Components'.parameters.''.'|'.0]", lpath_17 if path is not None else None))
+            rep is None or rep.append(("unexpected $Parameter [.'$Components'.parameters.''.'|'.0]", lpath_17))
             # .'$Components'.parameters.''.'|'.1
-            res = json_model_30(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Components'.parameters.''.'|'.1]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Components'.parameters.''.'|'.1]", lpath_17))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Components'.parameters.''.'|']", lpath_17 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Components'.parameters.''.'|']", lpath_17))
             return False
     return True
 
@@ -776,21 +789,21 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.requestBodies.''
         # .'$Components'.requestBodies.''.'|'.0
-        res = json_model_19(pval, lpath_18 if path is not None else None, rep)
+        res = json_model_19(pval, lpath_18, rep)
         if not res:
-            rep is None or rep.append(("unexpected $RequestBody [.'$Components'.requestBodies.''.'|'.0]", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected $RequestBody [.'$Components'.requestBodies.''.'|'.0]", lpath_18))
             # .'$Components'.requestBodies.''.'|'.1
-            res = json_model_30(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Components'.requestBodies.''.'|'.1]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Components'.requestBodies.''.'|'.1]", lpath_18))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Components'.requestBodies.''.'|']", lpath_18 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Components'.requestBodies.''.'|']", lpath_18))
             return False
     return True
 
@@ -801,21 +814,21 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Components'.securitySchemes.''
         # .'$Components'.securitySchemes.''.'|'.0
-        res = json_model_40(pval, lpath_19 if path is not None else None, rep)
+        res = json_model_40(pval, lpath_19, rep)
         if not res:
-            rep is None or rep.append(("unexpected $SecurityScheme [.'$Components'.securitySchemes.''.'|'.0]", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected $SecurityScheme [.'$Components'.securitySchemes.''.'|'.0]", lpath_19))
             # .'$Components'.securitySchemes.''.'|'.1
-            res = json_model_30(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Components'.securitySchemes.''.'|'.1]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Components'.securitySchemes.''.'|'.1]", lpath_19))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Components'.securitySchemes.''.'|']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Components'.securitySchemes.''.'|']", lpath_19))
             return False
     return True
 
@@ -827,95 +840,95 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "links":
             # handle may links property
             # .'$Components'.links
-            res = _jm_obj_4(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_4(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.links]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.links]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.links]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.links]", lpath_9))
                 return False
             continue
         elif prop == "headers":
             # handle may headers property
             # .'$Components'.headers
-            res = _jm_obj_5(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_5(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.headers]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.headers]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.headers]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.headers]", lpath_9))
                 return False
             continue
         elif prop == "schemas":
             # handle may schemas property
             # .'$Components'.schemas
-            res = _jm_obj_6(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_6(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.schemas]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.schemas]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.schemas]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.schemas]", lpath_9))
                 return False
             continue
         elif prop == "examples":
             # handle may examples property
             # .'$Components'.examples
-            res = _jm_obj_7(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_7(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.examples]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.examples]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.examples]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.examples]", lpath_9))
                 return False
             continue
         elif prop == "callbacks":
             # handle may callbacks property
             # .'$Components'.callbacks
-            res = _jm_obj_8(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_8(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.callbacks]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.callbacks]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.callbacks]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.callbacks]", lpath_9))
                 return False
             continue
         elif prop == "pathItems":
             # handle may pathItems property
             # .'$Components'.pathItems
-            res = _jm_obj_9(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_9(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.pathItems]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.pathItems]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.pathItems]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.pathItems]", lpath_9))
                 return False
             continue
         elif prop == "responses":
             # handle may responses property
             # .'$Components'.responses
-            res = _jm_obj_10(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_10(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.responses]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.responses]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.responses]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.responses]", lpath_9))
                 return False
             continue
         elif prop == "parameters":
             # handle may parameters property
             # .'$Components'.parameters
-            res = _jm_obj_11(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_11(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.parameters]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.parameters]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.parameters]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.parameters]", lpath_9))
                 return False
             continue
         elif prop == "requestBodies":
             # handle may requestBodies property
             # .'$Components'.requestBodies
-            res = _jm_obj_12(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_12(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.requestBodies]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.requestBodies]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.requestBodies]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.requestBodies]", lpath_9))
                 return False
             continue
         elif prop == "securitySchemes":
             # handle may securitySchemes property
             # .'$Components'.securitySchemes
-            res = _jm_obj_13(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Components'.securitySchemes]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Components'.securitySchemes]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Components'.securitySchemes]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Components'.securitySchemes]", lpath_9))
                 return False
             continue
         if prop.startswith("x-"):
@@ -923,7 +936,7 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Components'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Components']", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Components']", lpath_9))
             return False
     return True
 
@@ -935,20 +948,20 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if prop.startswith("/"):
             # handle 2 re props
             # .'$Paths'.'/^//'
-            res = json_model_10(pval, lpath_20 if path is not None else None, rep)
+            res = json_model_10(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected $PathItem [.'$Paths'.'/^//']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected $PathItem [.'$Paths'.'/^//']", lpath_20))
                 return False
         elif prop.startswith("x-"):
             # handle 2 re props
             # .'$Paths'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Paths']", lpath_20 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Paths']", lpath_20))
             return False
     return True
 
@@ -974,20 +987,20 @@ def _jm_f_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_4_idx, arr_4_item in enumerate(val):
-            arr_4_lpath: Path = (path + [ arr_4_idx ]) if path is not None else None
+            arr_4_lpath: Path = (path, arr_4_idx) if path is not None else None
             # .'$PathItem'.parameters.0
             # .'$PathItem'.parameters.0.'|'.0
-            res = json_model_18(arr_4_item, arr_4_lpath if path is not None else None, rep)
+            res = json_model_18(arr_4_item, arr_4_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Parameter [.'$PathItem'.parameters.0.'|'.0]", arr_4_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Parameter [.'$PathItem'.parameters.0.'|'.0]", arr_4_lpath))
                 # .'$PathItem'.parameters.0.'|'.1
-                res = json_model_30(arr_4_item, arr_4_lpath if path is not None else None, rep)
+                res = json_model_30(arr_4_item, arr_4_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$PathItem'.parameters.0.'|'.1]", arr_4_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$PathItem'.parameters.0.'|'.1]", arr_4_lpath))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$PathItem'.parameters.0.'|']", arr_4_lpath if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$PathItem'.parameters.0.'|']", arr_4_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$PathItem'.parameters]", path))
@@ -999,11 +1012,11 @@ def _jm_f_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_5_idx, arr_5_item in enumerate(val):
-            arr_5_lpath: Path = (path + [ arr_5_idx ]) if path is not None else None
+            arr_5_lpath: Path = (path, arr_5_idx) if path is not None else None
             # .'$PathItem'.servers.0
-            res = json_model_11(arr_5_item, arr_5_lpath if path is not None else None, rep)
+            res = json_model_11(arr_5_item, arr_5_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Operation [.'$PathItem'.servers.0]", arr_5_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Operation [.'$PathItem'.servers.0]", arr_5_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$PathItem'.servers]", path))
@@ -1027,11 +1040,11 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         if pfun := json_model_10_map.get(prop):
             # handle 13 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_21 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$PathItem']", lpath_21 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_21, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$PathItem']", lpath_21))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1039,7 +1052,7 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$PathItem'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$PathItem']", lpath_21 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$PathItem']", lpath_21))
             return False
     return True
 
@@ -1051,21 +1064,21 @@ def _jm_f_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Operation'.callbacks.''
         # .'$Operation'.callbacks.''.'|'.0
-        res = json_model_24(pval, lpath_23 if path is not None else None, rep)
+        res = json_model_24(pval, lpath_23, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Callback [.'$Operation'.callbacks.''.'|'.0]", lpath_23 if path is not None else None))
+            rep is None or rep.append(("unexpected $Callback [.'$Operation'.callbacks.''.'|'.0]", lpath_23))
             # .'$Operation'.callbacks.''.'|'.1
-            res = json_model_30(pval, lpath_23 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Operation'.callbacks.''.'|'.1]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Operation'.callbacks.''.'|'.1]", lpath_23))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Operation'.callbacks.''.'|']", lpath_23 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Operation'.callbacks.''.'|']", lpath_23))
             return False
     return True
 
@@ -1099,20 +1112,20 @@ def _jm_f_9(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_6_idx, arr_6_item in enumerate(val):
-            arr_6_lpath: Path = (path + [ arr_6_idx ]) if path is not None else None
+            arr_6_lpath: Path = (path, arr_6_idx) if path is not None else None
             # .'$Operation'.parameters.0
             # .'$Operation'.parameters.0.'|'.0
-            res = json_model_18(arr_6_item, arr_6_lpath if path is not None else None, rep)
+            res = json_model_18(arr_6_item, arr_6_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Parameter [.'$Operation'.parameters.0.'|'.0]", arr_6_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Parameter [.'$Operation'.parameters.0.'|'.0]", arr_6_lpath))
                 # .'$Operation'.parameters.0.'|'.1
-                res = json_model_30(arr_6_item, arr_6_lpath if path is not None else None, rep)
+                res = json_model_30(arr_6_item, arr_6_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$Operation'.parameters.0.'|'.1]", arr_6_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$Operation'.parameters.0.'|'.1]", arr_6_lpath))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Operation'.parameters.0.'|']", arr_6_lpath if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Operation'.parameters.0.'|']", arr_6_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Operation'.parameters]", path))
@@ -1141,11 +1154,11 @@ def _jm_f_11(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_7_idx, arr_7_item in enumerate(val):
-            arr_7_lpath: Path = (path + [ arr_7_idx ]) if path is not None else None
+            arr_7_lpath: Path = (path, arr_7_idx) if path is not None else None
             # .'$Operation'.security.0
-            res = json_model_43(arr_7_item, arr_7_lpath if path is not None else None, rep)
+            res = json_model_43(arr_7_item, arr_7_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $SecurityRequirement [.'$Operation'.security.0]", arr_7_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $SecurityRequirement [.'$Operation'.security.0]", arr_7_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Operation'.security]", path))
@@ -1157,11 +1170,11 @@ def _jm_f_12(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_8_idx, arr_8_item in enumerate(val):
-            arr_8_lpath: Path = (path + [ arr_8_idx ]) if path is not None else None
+            arr_8_lpath: Path = (path, arr_8_idx) if path is not None else None
             # .'$Operation'.servers.0
-            res = json_model_6(arr_8_item, arr_8_lpath if path is not None else None, rep)
+            res = json_model_6(arr_8_item, arr_8_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Server [.'$Operation'.servers.0]", arr_8_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Server [.'$Operation'.servers.0]", arr_8_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Operation'.servers]", path))
@@ -1181,11 +1194,11 @@ def _jm_f_14(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_9_idx, arr_9_item in enumerate(val):
-            arr_9_lpath: Path = (path + [ arr_9_idx ]) if path is not None else None
+            arr_9_lpath: Path = (path, arr_9_idx) if path is not None else None
             # .'$Operation'.tags.0
             res = isinstance(arr_9_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Operation'.tags.0]", arr_9_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Operation'.tags.0]", arr_9_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Operation'.tags]", path))
@@ -1201,11 +1214,11 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
+        lpath_22: Path = (path, prop) if path is not None else None
         if pfun := json_model_11_map.get(prop):
             # handle 12 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_22 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Operation']", lpath_22 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_22, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Operation']", lpath_22))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1213,7 +1226,7 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Operation'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Operation']", lpath_22 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Operation']", lpath_22))
             return False
     return True
 
@@ -1226,15 +1239,15 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         if prop == "url":
             # handle must url property
             must_count += 1
             # .'$ExternalDocumentation'.url
-            res = is_valid_url(pval, lpath_24 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_24, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$ExternalDocumentation'.url]", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$ExternalDocumentation'.url]", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$ExternalDocumentation'.url]", lpath_24))
+                rep is None or rep.append(("invalid mandatory prop value [.'$ExternalDocumentation'.url]", lpath_24))
                 return False
             continue
         if prop == "description":
@@ -1242,8 +1255,8 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$ExternalDocumentation'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$ExternalDocumentation'.description]", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ExternalDocumentation'.description]", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$ExternalDocumentation'.description]", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$ExternalDocumentation'.description]", lpath_24))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1251,7 +1264,7 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$ExternalDocumentation'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$ExternalDocumentation']", lpath_24 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$ExternalDocumentation']", lpath_24))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1268,14 +1281,14 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         if prop == "required":
             # handle may required property
             # .'$parameterShare'.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$parameterShare'.required]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterShare'.required]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$parameterShare'.required]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterShare'.required]", lpath_25))
                 return False
             continue
         elif prop == "deprecated":
@@ -1283,8 +1296,8 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$parameterShare'.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$parameterShare'.deprecated]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterShare'.deprecated]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$parameterShare'.deprecated]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterShare'.deprecated]", lpath_25))
                 return False
             continue
         elif prop == "description":
@@ -1292,8 +1305,8 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$parameterShare'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$parameterShare'.description]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterShare'.description]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$parameterShare'.description]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterShare'.description]", lpath_25))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -1301,8 +1314,8 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$parameterShare'.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$parameterShare'.allowEmptyValue]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterShare'.allowEmptyValue]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$parameterShare'.allowEmptyValue]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterShare'.allowEmptyValue]", lpath_25))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1310,7 +1323,7 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$parameterShare'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$parameterShare']", lpath_25 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$parameterShare']", lpath_25))
             return False
     return True
 
@@ -1324,15 +1337,15 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_26: Path = (path + [ prop ]) if path is not None else None
+        lpath_26: Path = (path, prop) if path is not None else None
         if prop == "in":
             # handle must in property
             must_count += 1
             # .'$commonParameter'.in
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_0
             if not res:
-                rep is None or rep.append(("value not in enum [.'$commonParameter'.in.'|']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$commonParameter'.in]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.'$commonParameter'.in.'|']", lpath_26))
+                rep is None or rep.append(("invalid mandatory prop value [.'$commonParameter'.in]", lpath_26))
                 return False
             continue
         elif prop == "name":
@@ -1341,8 +1354,8 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$commonParameter'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$commonParameter'.name]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$commonParameter'.name]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$commonParameter'.name]", lpath_26))
+                rep is None or rep.append(("invalid mandatory prop value [.'$commonParameter'.name]", lpath_26))
                 return False
             continue
         if prop == "required":
@@ -1350,8 +1363,8 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$commonParameter'.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$commonParameter'.required]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$commonParameter'.required]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$commonParameter'.required]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$commonParameter'.required]", lpath_26))
                 return False
             continue
         elif prop == "deprecated":
@@ -1359,8 +1372,8 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$commonParameter'.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$commonParameter'.deprecated]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$commonParameter'.deprecated]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$commonParameter'.deprecated]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$commonParameter'.deprecated]", lpath_26))
                 return False
             continue
         elif prop == "description":
@@ -1368,8 +1381,8 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$commonParameter'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$commonParameter'.description]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$commonParameter'.description]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$commonParameter'.description]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$commonParameter'.description]", lpath_26))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -1377,8 +1390,8 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$commonParameter'.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$commonParameter'.allowEmptyValue]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$commonParameter'.allowEmptyValue]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$commonParameter'.allowEmptyValue]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$commonParameter'.allowEmptyValue]", lpath_26))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1386,7 +1399,7 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$commonParameter'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$commonParameter']", lpath_26 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$commonParameter']", lpath_26))
             return False
     if must_count != 2:
         if rep is not None:
@@ -1414,21 +1427,21 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_28: Path = (path + [ prop ]) if path is not None else None
+        lpath_28: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$parameterSchemaOnly'.examples.''
         # .'$parameterSchemaOnly'.examples.''.'|'.0
-        res = json_model_25(pval, lpath_28 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_28, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Example [.'$parameterSchemaOnly'.examples.''.'|'.0]", lpath_28 if path is not None else None))
+            rep is None or rep.append(("unexpected $Example [.'$parameterSchemaOnly'.examples.''.'|'.0]", lpath_28))
             # .'$parameterSchemaOnly'.examples.''.'|'.1
-            res = json_model_30(pval, lpath_28 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_28, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$parameterSchemaOnly'.examples.''.'|'.1]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$parameterSchemaOnly'.examples.''.'|'.1]", lpath_28))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$parameterSchemaOnly'.examples.''.'|']", lpath_28 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$parameterSchemaOnly'.examples.''.'|']", lpath_28))
             return False
     return True
 
@@ -1440,23 +1453,23 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_27: Path = (path + [ prop ]) if path is not None else None
+        lpath_27: Path = (path, prop) if path is not None else None
         if prop == "style":
             # handle may style property
             # .'$parameterSchemaOnly'.style
-            res = json_model_15(pval, lpath_27 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_27, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Style [.'$parameterSchemaOnly'.style]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.style]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected $Style [.'$parameterSchemaOnly'.style]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.style]", lpath_27))
                 return False
             continue
         elif prop == "schema":
             # handle may schema property
             # .'$parameterSchemaOnly'.schema
-            res = json_model_32(pval, lpath_27 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_27, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$parameterSchemaOnly'.schema]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.schema]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$parameterSchemaOnly'.schema]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.schema]", lpath_27))
                 return False
             continue
         elif prop == "example":
@@ -1469,17 +1482,17 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$parameterSchemaOnly'.explode
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$parameterSchemaOnly'.explode]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.explode]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$parameterSchemaOnly'.explode]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.explode]", lpath_27))
                 return False
             continue
         elif prop == "examples":
             # handle may examples property
             # .'$parameterSchemaOnly'.examples
-            res = _jm_obj_14(pval, lpath_27 if path is not None else None, rep)
+            res = _jm_obj_14(pval, lpath_27, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$parameterSchemaOnly'.examples]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.examples]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$parameterSchemaOnly'.examples]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.examples]", lpath_27))
                 return False
             continue
         elif prop == "allowReserved":
@@ -1487,11 +1500,11 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$parameterSchemaOnly'.allowReserved
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$parameterSchemaOnly'.allowReserved]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.allowReserved]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$parameterSchemaOnly'.allowReserved]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterSchemaOnly'.allowReserved]", lpath_27))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$parameterSchemaOnly']", lpath_27 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$parameterSchemaOnly']", lpath_27))
         return False
     return True
 
@@ -1502,12 +1515,12 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_30: Path = (path + [ prop ]) if path is not None else None
+        lpath_30: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$parameterContentOnly'.content.''
-        res = json_model_20(pval, lpath_30 if path is not None else None, rep)
+        res = json_model_20(pval, lpath_30, rep)
         if not res:
-            rep is None or rep.append(("unexpected $MediaType [.'$parameterContentOnly'.content.'']", lpath_30 if path is not None else None))
+            rep is None or rep.append(("unexpected $MediaType [.'$parameterContentOnly'.content.'']", lpath_30))
             return False
     return True
 
@@ -1519,17 +1532,17 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_29: Path = (path + [ prop ]) if path is not None else None
+        lpath_29: Path = (path, prop) if path is not None else None
         if prop == "content":
             # handle may content property
             # .'$parameterContentOnly'.content
-            res = _jm_obj_15(pval, lpath_29 if path is not None else None, rep)
+            res = _jm_obj_15(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$parameterContentOnly'.content]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$parameterContentOnly'.content]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$parameterContentOnly'.content]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$parameterContentOnly'.content]", lpath_29))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$parameterContentOnly']", lpath_29 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$parameterContentOnly']", lpath_29))
         return False
     return True
 
@@ -1541,12 +1554,12 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_32: Path = (path + [ prop ]) if path is not None else None
+        lpath_32: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Parameter'.'|'.1.content.''
-        res = json_model_20(pval, lpath_32 if path is not None else None, rep)
+        res = json_model_20(pval, lpath_32, rep)
         if not res:
-            rep is None or rep.append(("unexpected $MediaType [.'$Parameter'.'|'.1.content.'']", lpath_32 if path is not None else None))
+            rep is None or rep.append(("unexpected $MediaType [.'$Parameter'.'|'.1.content.'']", lpath_32))
             return False
     return True
 
@@ -1558,15 +1571,15 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_31: Path = (path + [ prop ]) if path is not None else None
+        lpath_31: Path = (path, prop) if path is not None else None
         if prop == "in":
             # handle must in property
             must_count += 1
             # .'$Parameter'.'|'.1.in
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_2
             if not res:
-                rep is None or rep.append(("value not in enum [.'$Parameter'.'|'.1.in.'|']", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Parameter'.'|'.1.in]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.'$Parameter'.'|'.1.in.'|']", lpath_31))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Parameter'.'|'.1.in]", lpath_31))
                 return False
             continue
         elif prop == "name":
@@ -1575,17 +1588,17 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.1.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Parameter'.'|'.1.name]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Parameter'.'|'.1.name]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Parameter'.'|'.1.name]", lpath_31))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Parameter'.'|'.1.name]", lpath_31))
                 return False
             continue
         if prop == "content":
             # handle may content property
             # .'$Parameter'.'|'.1.content
-            res = _jm_obj_17(pval, lpath_31 if path is not None else None, rep)
+            res = _jm_obj_17(pval, lpath_31, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Parameter'.'|'.1.content]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.content]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Parameter'.'|'.1.content]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.content]", lpath_31))
                 return False
             continue
         elif prop == "required":
@@ -1593,8 +1606,8 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.1.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.1.required]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.required]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.1.required]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.required]", lpath_31))
                 return False
             continue
         elif prop == "deprecated":
@@ -1602,8 +1615,8 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.1.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.1.deprecated]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.deprecated]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.1.deprecated]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.deprecated]", lpath_31))
                 return False
             continue
         elif prop == "description":
@@ -1611,8 +1624,8 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.1.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Parameter'.'|'.1.description]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.description]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Parameter'.'|'.1.description]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.description]", lpath_31))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -1620,8 +1633,8 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.1.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.1.allowEmptyValue]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.allowEmptyValue]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.1.allowEmptyValue]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.1.allowEmptyValue]", lpath_31))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1629,7 +1642,7 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.1.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Parameter'.'|'.1]", lpath_31 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Parameter'.'|'.1]", lpath_31))
             return False
     if must_count != 2:
         if rep is not None:
@@ -1648,21 +1661,21 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_34: Path = (path + [ prop ]) if path is not None else None
+        lpath_34: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Parameter'.'|'.0.examples.''
         # .'$Parameter'.'|'.0.examples.''.'|'.0
-        res = json_model_25(pval, lpath_34 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_34, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Example [.'$Parameter'.'|'.0.examples.''.'|'.0]", lpath_34 if path is not None else None))
+            rep is None or rep.append(("unexpected $Example [.'$Parameter'.'|'.0.examples.''.'|'.0]", lpath_34))
             # .'$Parameter'.'|'.0.examples.''.'|'.1
-            res = json_model_30(pval, lpath_34 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_34, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Parameter'.'|'.0.examples.''.'|'.1]", lpath_34 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Parameter'.'|'.0.examples.''.'|'.1]", lpath_34))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Parameter'.'|'.0.examples.''.'|']", lpath_34 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Parameter'.'|'.0.examples.''.'|']", lpath_34))
             return False
     return True
 
@@ -1674,15 +1687,15 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_33: Path = (path + [ prop ]) if path is not None else None
+        lpath_33: Path = (path, prop) if path is not None else None
         if prop == "in":
             # handle must in property
             must_count += 1
             # .'$Parameter'.'|'.0.in
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_3
             if not res:
-                rep is None or rep.append(("value not in enum [.'$Parameter'.'|'.0.in.'|']", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Parameter'.'|'.0.in]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.'$Parameter'.'|'.0.in.'|']", lpath_33))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Parameter'.'|'.0.in]", lpath_33))
                 return False
             continue
         elif prop == "name":
@@ -1691,26 +1704,26 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.0.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Parameter'.'|'.0.name]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Parameter'.'|'.0.name]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Parameter'.'|'.0.name]", lpath_33))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Parameter'.'|'.0.name]", lpath_33))
                 return False
             continue
         if prop == "style":
             # handle may style property
             # .'$Parameter'.'|'.0.style
-            res = json_model_15(pval, lpath_33 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_33, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Style [.'$Parameter'.'|'.0.style]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.style]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected $Style [.'$Parameter'.'|'.0.style]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.style]", lpath_33))
                 return False
             continue
         elif prop == "schema":
             # handle may schema property
             # .'$Parameter'.'|'.0.schema
-            res = json_model_32(pval, lpath_33 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_33, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Parameter'.'|'.0.schema]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.schema]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Parameter'.'|'.0.schema]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.schema]", lpath_33))
                 return False
             continue
         elif prop == "example":
@@ -1723,17 +1736,17 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.0.explode
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.explode]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.explode]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.explode]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.explode]", lpath_33))
                 return False
             continue
         elif prop == "examples":
             # handle may examples property
             # .'$Parameter'.'|'.0.examples
-            res = _jm_obj_19(pval, lpath_33 if path is not None else None, rep)
+            res = _jm_obj_19(pval, lpath_33, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Parameter'.'|'.0.examples]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.examples]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Parameter'.'|'.0.examples]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.examples]", lpath_33))
                 return False
             continue
         elif prop == "required":
@@ -1741,8 +1754,8 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.0.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.required]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.required]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.required]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.required]", lpath_33))
                 return False
             continue
         elif prop == "deprecated":
@@ -1750,8 +1763,8 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.0.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.deprecated]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.deprecated]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.deprecated]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.deprecated]", lpath_33))
                 return False
             continue
         elif prop == "description":
@@ -1759,8 +1772,8 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Parameter'.'|'.0.description]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.description]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Parameter'.'|'.0.description]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.description]", lpath_33))
                 return False
             continue
         elif prop == "allowReserved":
@@ -1768,8 +1781,8 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.0.allowReserved
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.allowReserved]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.allowReserved]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.allowReserved]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.allowReserved]", lpath_33))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -1777,8 +1790,8 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.0.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.allowEmptyValue]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.allowEmptyValue]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Parameter'.'|'.0.allowEmptyValue]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Parameter'.'|'.0.allowEmptyValue]", lpath_33))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1786,7 +1799,7 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Parameter'.'|'.0.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Parameter'.'|'.0]", lpath_33 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Parameter'.'|'.0]", lpath_33))
             return False
     if must_count != 2:
         if rep is not None:
@@ -1825,12 +1838,12 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_36: Path = (path + [ prop ]) if path is not None else None
+        lpath_36: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$RequestBody'.content.''
-        res = json_model_20(pval, lpath_36 if path is not None else None, rep)
+        res = json_model_20(pval, lpath_36, rep)
         if not res:
-            rep is None or rep.append(("unexpected $MediaType [.'$RequestBody'.content.'']", lpath_36 if path is not None else None))
+            rep is None or rep.append(("unexpected $MediaType [.'$RequestBody'.content.'']", lpath_36))
             return False
     return True
 
@@ -1842,14 +1855,14 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_35: Path = (path + [ prop ]) if path is not None else None
+        lpath_35: Path = (path, prop) if path is not None else None
         if prop == "content":
             # handle may content property
             # .'$RequestBody'.content
-            res = _jm_obj_20(pval, lpath_35 if path is not None else None, rep)
+            res = _jm_obj_20(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$RequestBody'.content]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RequestBody'.content]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$RequestBody'.content]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$RequestBody'.content]", lpath_35))
                 return False
             continue
         elif prop == "required":
@@ -1857,8 +1870,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$RequestBody'.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$RequestBody'.required]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RequestBody'.required]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$RequestBody'.required]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$RequestBody'.required]", lpath_35))
                 return False
             continue
         elif prop == "description":
@@ -1866,8 +1879,8 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$RequestBody'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$RequestBody'.description]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RequestBody'.description]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$RequestBody'.description]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$RequestBody'.description]", lpath_35))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1875,7 +1888,7 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$RequestBody'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$RequestBody']", lpath_35 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$RequestBody']", lpath_35))
             return False
     return True
 
@@ -1886,12 +1899,12 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_38: Path = (path + [ prop ]) if path is not None else None
+        lpath_38: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$MediaType'.encoding.''
-        res = json_model_21(pval, lpath_38 if path is not None else None, rep)
+        res = json_model_21(pval, lpath_38, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Encoding [.'$MediaType'.encoding.'']", lpath_38 if path is not None else None))
+            rep is None or rep.append(("unexpected $Encoding [.'$MediaType'.encoding.'']", lpath_38))
             return False
     return True
 
@@ -1902,21 +1915,21 @@ def _jm_obj_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_39: Path = (path + [ prop ]) if path is not None else None
+        lpath_39: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$MediaType'.examples.''
         # .'$MediaType'.examples.''.'|'.0
-        res = json_model_25(pval, lpath_39 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_39, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Example [.'$MediaType'.examples.''.'|'.0]", lpath_39 if path is not None else None))
+            rep is None or rep.append(("unexpected $Example [.'$MediaType'.examples.''.'|'.0]", lpath_39))
             # .'$MediaType'.examples.''.'|'.1
-            res = json_model_30(pval, lpath_39 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_39, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$MediaType'.examples.''.'|'.1]", lpath_39 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$MediaType'.examples.''.'|'.1]", lpath_39))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$MediaType'.examples.''.'|']", lpath_39 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$MediaType'.examples.''.'|']", lpath_39))
             return False
     return True
 
@@ -1928,14 +1941,14 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_37: Path = (path + [ prop ]) if path is not None else None
+        lpath_37: Path = (path, prop) if path is not None else None
         if prop == "schema":
             # handle may schema property
             # .'$MediaType'.schema
-            res = json_model_32(pval, lpath_37 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$MediaType'.schema]", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MediaType'.schema]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$MediaType'.schema]", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$MediaType'.schema]", lpath_37))
                 return False
             continue
         elif prop == "example":
@@ -1946,19 +1959,19 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
         elif prop == "encoding":
             # handle may encoding property
             # .'$MediaType'.encoding
-            res = _jm_obj_21(pval, lpath_37 if path is not None else None, rep)
+            res = _jm_obj_21(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$MediaType'.encoding]", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MediaType'.encoding]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$MediaType'.encoding]", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$MediaType'.encoding]", lpath_37))
                 return False
             continue
         elif prop == "examples":
             # handle may examples property
             # .'$MediaType'.examples
-            res = _jm_obj_22(pval, lpath_37 if path is not None else None, rep)
+            res = _jm_obj_22(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$MediaType'.examples]", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MediaType'.examples]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$MediaType'.examples]", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$MediaType'.examples]", lpath_37))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1966,7 +1979,7 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$MediaType'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$MediaType']", lpath_37 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$MediaType']", lpath_37))
             return False
     return True
 
@@ -1977,21 +1990,21 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_41: Path = (path + [ prop ]) if path is not None else None
+        lpath_41: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Encoding'.headers.''
         # .'$Encoding'.headers.''.'|'.0
-        res = json_model_28(pval, lpath_41 if path is not None else None, rep)
+        res = json_model_28(pval, lpath_41, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Header [.'$Encoding'.headers.''.'|'.0]", lpath_41 if path is not None else None))
+            rep is None or rep.append(("unexpected $Header [.'$Encoding'.headers.''.'|'.0]", lpath_41))
             # .'$Encoding'.headers.''.'|'.1
-            res = json_model_30(pval, lpath_41 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_41, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Encoding'.headers.''.'|'.1]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Encoding'.headers.''.'|'.1]", lpath_41))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Encoding'.headers.''.'|']", lpath_41 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Encoding'.headers.''.'|']", lpath_41))
             return False
     return True
 
@@ -2003,14 +2016,14 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_40: Path = (path + [ prop ]) if path is not None else None
+        lpath_40: Path = (path, prop) if path is not None else None
         if prop == "style":
             # handle may style property
             # .'$Encoding'.style
-            res = json_model_15(pval, lpath_40 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_40, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Style [.'$Encoding'.style]", lpath_40 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.style]", lpath_40 if path is not None else None))
+                rep is None or rep.append(("unexpected $Style [.'$Encoding'.style]", lpath_40))
+                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.style]", lpath_40))
                 return False
             continue
         elif prop == "explode":
@@ -2018,17 +2031,17 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Encoding'.explode
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Encoding'.explode]", lpath_40 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.explode]", lpath_40 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Encoding'.explode]", lpath_40))
+                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.explode]", lpath_40))
                 return False
             continue
         elif prop == "headers":
             # handle may headers property
             # .'$Encoding'.headers
-            res = _jm_obj_23(pval, lpath_40 if path is not None else None, rep)
+            res = _jm_obj_23(pval, lpath_40, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Encoding'.headers]", lpath_40 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.headers]", lpath_40 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Encoding'.headers]", lpath_40))
+                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.headers]", lpath_40))
                 return False
             continue
         elif prop == "contentType":
@@ -2036,8 +2049,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Encoding'.contentType
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Encoding'.contentType]", lpath_40 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.contentType]", lpath_40 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Encoding'.contentType]", lpath_40))
+                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.contentType]", lpath_40))
                 return False
             continue
         elif prop == "allowReserved":
@@ -2045,8 +2058,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Encoding'.allowReserved
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Encoding'.allowReserved]", lpath_40 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.allowReserved]", lpath_40 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Encoding'.allowReserved]", lpath_40))
+                rep is None or rep.append(("invalid optional prop value [.'$Encoding'.allowReserved]", lpath_40))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2054,7 +2067,7 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Encoding'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Encoding']", lpath_40 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Encoding']", lpath_40))
             return False
     return True
 
@@ -2067,47 +2080,47 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_42: Path = (path + [ prop ]) if path is not None else None
+        lpath_42: Path = (path, prop) if path is not None else None
         if prop == "default":
             # handle may default property
             # .'$Responses'.default
             # .'$Responses'.default.'|'.0
-            res = json_model_23(pval, lpath_42 if path is not None else None, rep)
+            res = json_model_23(pval, lpath_42, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Response [.'$Responses'.default.'|'.0]", lpath_42 if path is not None else None))
+                rep is None or rep.append(("unexpected $Response [.'$Responses'.default.'|'.0]", lpath_42))
                 # .'$Responses'.default.'|'.1
-                res = json_model_30(pval, lpath_42 if path is not None else None, rep)
+                res = json_model_30(pval, lpath_42, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$Responses'.default.'|'.1]", lpath_42 if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$Responses'.default.'|'.1]", lpath_42))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Responses'.default.'|']", lpath_42 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Responses'.default]", lpath_42 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Responses'.default.'|']", lpath_42))
+                rep is None or rep.append(("invalid optional prop value [.'$Responses'.default]", lpath_42))
                 return False
             continue
         if _jm_re_2(prop, path, rep):
             # handle 2 re props
             # .'$Responses'.'/^[1-5](\\d\\d|XX)$/'
             # .'$Responses'.'/^[1-5](\\d\\d|XX)$/'.'|'.0
-            res = json_model_23(pval, lpath_42 if path is not None else None, rep)
+            res = json_model_23(pval, lpath_42, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Response [.'$Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|'.0]", lpath_42 if path is not None else None))
+                rep is None or rep.append(("unexpected $Response [.'$Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|'.0]", lpath_42))
                 # .'$Responses'.'/^[1-5](\\d\\d|XX)$/'.'|'.1
-                res = json_model_30(pval, lpath_42 if path is not None else None, rep)
+                res = json_model_30(pval, lpath_42, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|'.1]", lpath_42 if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|'.1]", lpath_42))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|']", lpath_42 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|']", lpath_42))
                 return False
         elif prop.startswith("x-"):
             # handle 2 re props
             # .'$Responses'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Responses']", lpath_42 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Responses']", lpath_42))
             return False
     return True
 
@@ -2118,21 +2131,21 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_44: Path = (path + [ prop ]) if path is not None else None
+        lpath_44: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Response'.links.''
         # .'$Response'.links.''.'|'.0
-        res = json_model_27(pval, lpath_44 if path is not None else None, rep)
+        res = json_model_27(pval, lpath_44, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Link [.'$Response'.links.''.'|'.0]", lpath_44 if path is not None else None))
+            rep is None or rep.append(("unexpected $Link [.'$Response'.links.''.'|'.0]", lpath_44))
             # .'$Response'.links.''.'|'.1
-            res = json_model_30(pval, lpath_44 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_44, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Response'.links.''.'|'.1]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Response'.links.''.'|'.1]", lpath_44))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Response'.links.''.'|']", lpath_44 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Response'.links.''.'|']", lpath_44))
             return False
     return True
 
@@ -2143,12 +2156,12 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_45: Path = (path + [ prop ]) if path is not None else None
+        lpath_45: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Response'.content.''
-        res = json_model_20(pval, lpath_45 if path is not None else None, rep)
+        res = json_model_20(pval, lpath_45, rep)
         if not res:
-            rep is None or rep.append(("unexpected $MediaType [.'$Response'.content.'']", lpath_45 if path is not None else None))
+            rep is None or rep.append(("unexpected $MediaType [.'$Response'.content.'']", lpath_45))
             return False
     return True
 
@@ -2159,21 +2172,21 @@ def _jm_obj_26(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_46: Path = (path + [ prop ]) if path is not None else None
+        lpath_46: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Response'.headers.''
         # .'$Response'.headers.''.'|'.0
-        res = json_model_28(pval, lpath_46 if path is not None else None, rep)
+        res = json_model_28(pval, lpath_46, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Header [.'$Response'.headers.''.'|'.0]", lpath_46 if path is not None else None))
+            rep is None or rep.append(("unexpected $Header [.'$Response'.headers.''.'|'.0]", lpath_46))
             # .'$Response'.headers.''.'|'.1
-            res = json_model_30(pval, lpath_46 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_46, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Response'.headers.''.'|'.1]", lpath_46 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Response'.headers.''.'|'.1]", lpath_46))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Response'.headers.''.'|']", lpath_46 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Response'.headers.''.'|']", lpath_46))
             return False
     return True
 
@@ -2185,32 +2198,32 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_43: Path = (path + [ prop ]) if path is not None else None
+        lpath_43: Path = (path, prop) if path is not None else None
         if prop == "links":
             # handle may links property
             # .'$Response'.links
-            res = _jm_obj_24(pval, lpath_43 if path is not None else None, rep)
+            res = _jm_obj_24(pval, lpath_43, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Response'.links]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Response'.links]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Response'.links]", lpath_43))
+                rep is None or rep.append(("invalid optional prop value [.'$Response'.links]", lpath_43))
                 return False
             continue
         elif prop == "content":
             # handle may content property
             # .'$Response'.content
-            res = _jm_obj_25(pval, lpath_43 if path is not None else None, rep)
+            res = _jm_obj_25(pval, lpath_43, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Response'.content]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Response'.content]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Response'.content]", lpath_43))
+                rep is None or rep.append(("invalid optional prop value [.'$Response'.content]", lpath_43))
                 return False
             continue
         elif prop == "headers":
             # handle may headers property
             # .'$Response'.headers
-            res = _jm_obj_26(pval, lpath_43 if path is not None else None, rep)
+            res = _jm_obj_26(pval, lpath_43, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Response'.headers]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Response'.headers]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Response'.headers]", lpath_43))
+                rep is None or rep.append(("invalid optional prop value [.'$Response'.headers]", lpath_43))
                 return False
             continue
         elif prop == "description":
@@ -2218,8 +2231,8 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Response'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Response'.description]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Response'.description]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Response'.description]", lpath_43))
+                rep is None or rep.append(("invalid optional prop value [.'$Response'.description]", lpath_43))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2227,7 +2240,7 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Response'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Response']", lpath_43 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Response']", lpath_43))
             return False
     return True
 
@@ -2239,29 +2252,29 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_47: Path = (path + [ prop ]) if path is not None else None
-        if json_model_26(prop, lpath_47 if path is not None else None, rep):
+        lpath_47: Path = (path, prop) if path is not None else None
+        if json_model_26(prop, lpath_47, rep):
             # handle 1 key props
             # .'$Callback'.'$Expression'
             # .'$Callback'.'$Expression'.'|'.0
-            res = json_model_10(pval, lpath_47 if path is not None else None, rep)
+            res = json_model_10(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected $PathItem [.'$Callback'.'$Expression'.'|'.0]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected $PathItem [.'$Callback'.'$Expression'.'|'.0]", lpath_47))
                 # .'$Callback'.'$Expression'.'|'.1
-                res = json_model_30(pval, lpath_47 if path is not None else None, rep)
+                res = json_model_30(pval, lpath_47, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$Callback'.'$Expression'.'|'.1]", lpath_47 if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$Callback'.'$Expression'.'|'.1]", lpath_47))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Callback'.'$Expression'.'|']", lpath_47 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Callback'.'$Expression'.'|']", lpath_47))
                 return False
         elif prop.startswith("x-"):
             # handle 1 re props
             # .'$Callback'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Callback']", lpath_47 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Callback']", lpath_47))
             return False
     return True
 
@@ -2273,7 +2286,7 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_48: Path = (path + [ prop ]) if path is not None else None
+        lpath_48: Path = (path, prop) if path is not None else None
         if prop == "value":
             # handle may value property
             # .'$Example'.value
@@ -2284,8 +2297,8 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Example'.summary
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Example'.summary]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Example'.summary]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Example'.summary]", lpath_48))
+                rep is None or rep.append(("invalid optional prop value [.'$Example'.summary]", lpath_48))
                 return False
             continue
         elif prop == "description":
@@ -2293,8 +2306,8 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Example'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Example'.description]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Example'.description]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Example'.description]", lpath_48))
+                rep is None or rep.append(("invalid optional prop value [.'$Example'.description]", lpath_48))
                 return False
             continue
         elif prop == "externalValue":
@@ -2302,8 +2315,8 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Example'.externalValue
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Example'.externalValue]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Example'.externalValue]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Example'.externalValue]", lpath_48))
+                rep is None or rep.append(("invalid optional prop value [.'$Example'.externalValue]", lpath_48))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2311,7 +2324,7 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Example'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Example']", lpath_48 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Example']", lpath_48))
             return False
     return True
 
@@ -2339,33 +2352,33 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_49: Path = (path + [ prop ]) if path is not None else None
+        lpath_49: Path = (path, prop) if path is not None else None
         if prop == "operationId":
             # handle must operationId property
             must_count += 1
             # .'$Link'.'|'.1.operationId
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Link'.'|'.1.operationId]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Link'.'|'.1.operationId]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Link'.'|'.1.operationId]", lpath_49))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Link'.'|'.1.operationId]", lpath_49))
                 return False
             continue
         if prop == "server":
             # handle may server property
             # .'$Link'.'|'.1.server
-            res = json_model_6(pval, lpath_49 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_49, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Server [.'$Link'.'|'.1.server]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.1.server]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected $Server [.'$Link'.'|'.1.server]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.1.server]", lpath_49))
                 return False
             continue
         elif prop == "parameters":
             # handle may parameters property
             # .'$Link'.'|'.1.parameters
-            res = _jm_obj_28(pval, lpath_49 if path is not None else None, rep)
+            res = _jm_obj_28(pval, lpath_49, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Link'.'|'.1.parameters]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.1.parameters]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Link'.'|'.1.parameters]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.1.parameters]", lpath_49))
                 return False
             continue
         elif prop == "description":
@@ -2373,8 +2386,8 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Link'.'|'.1.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Link'.'|'.1.description]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.1.description]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Link'.'|'.1.description]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.1.description]", lpath_49))
                 return False
             continue
         elif prop == "requestBody":
@@ -2387,7 +2400,7 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Link'.'|'.1.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Link'.'|'.1]", lpath_49 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Link'.'|'.1]", lpath_49))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2412,33 +2425,33 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_50: Path = (path + [ prop ]) if path is not None else None
+        lpath_50: Path = (path, prop) if path is not None else None
         if prop == "operationRef":
             # handle must operationRef property
             must_count += 1
             # .'$Link'.'|'.0.operationRef
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Link'.'|'.0.operationRef]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Link'.'|'.0.operationRef]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Link'.'|'.0.operationRef]", lpath_50))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Link'.'|'.0.operationRef]", lpath_50))
                 return False
             continue
         if prop == "server":
             # handle may server property
             # .'$Link'.'|'.0.server
-            res = json_model_6(pval, lpath_50 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_50, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Server [.'$Link'.'|'.0.server]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.0.server]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected $Server [.'$Link'.'|'.0.server]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.0.server]", lpath_50))
                 return False
             continue
         elif prop == "parameters":
             # handle may parameters property
             # .'$Link'.'|'.0.parameters
-            res = _jm_obj_30(pval, lpath_50 if path is not None else None, rep)
+            res = _jm_obj_30(pval, lpath_50, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Link'.'|'.0.parameters]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.0.parameters]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Link'.'|'.0.parameters]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.0.parameters]", lpath_50))
                 return False
             continue
         elif prop == "description":
@@ -2446,8 +2459,8 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Link'.'|'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Link'.'|'.0.description]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.0.description]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Link'.'|'.0.description]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$Link'.'|'.0.description]", lpath_50))
                 return False
             continue
         elif prop == "requestBody":
@@ -2460,7 +2473,7 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Link'.'|'.0.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Link'.'|'.0]", lpath_50 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Link'.'|'.0]", lpath_50))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2497,12 +2510,12 @@ def _jm_obj_32(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_52: Path = (path + [ prop ]) if path is not None else None
+        lpath_52: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Header'.'|'.1.content.''
-        res = json_model_20(pval, lpath_52 if path is not None else None, rep)
+        res = json_model_20(pval, lpath_52, rep)
         if not res:
-            rep is None or rep.append(("unexpected $MediaType [.'$Header'.'|'.1.content.'']", lpath_52 if path is not None else None))
+            rep is None or rep.append(("unexpected $MediaType [.'$Header'.'|'.1.content.'']", lpath_52))
             return False
     return True
 
@@ -2513,14 +2526,14 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_51: Path = (path + [ prop ]) if path is not None else None
+        lpath_51: Path = (path, prop) if path is not None else None
         if prop == "content":
             # handle may content property
             # .'$Header'.'|'.1.content
-            res = _jm_obj_32(pval, lpath_51 if path is not None else None, rep)
+            res = _jm_obj_32(pval, lpath_51, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Header'.'|'.1.content]", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.content]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Header'.'|'.1.content]", lpath_51))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.content]", lpath_51))
                 return False
             continue
         elif prop == "required":
@@ -2528,8 +2541,8 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.1.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Header'.'|'.1.required]", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.required]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Header'.'|'.1.required]", lpath_51))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.required]", lpath_51))
                 return False
             continue
         elif prop == "deprecated":
@@ -2537,8 +2550,8 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.1.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Header'.'|'.1.deprecated]", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.deprecated]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Header'.'|'.1.deprecated]", lpath_51))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.deprecated]", lpath_51))
                 return False
             continue
         elif prop == "description":
@@ -2546,8 +2559,8 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.1.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Header'.'|'.1.description]", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.description]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Header'.'|'.1.description]", lpath_51))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.description]", lpath_51))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -2555,8 +2568,8 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.1.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Header'.'|'.1.allowEmptyValue]", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.allowEmptyValue]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Header'.'|'.1.allowEmptyValue]", lpath_51))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.1.allowEmptyValue]", lpath_51))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2564,7 +2577,7 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.1.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Header'.'|'.1]", lpath_51 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Header'.'|'.1]", lpath_51))
             return False
     return True
 
@@ -2575,21 +2588,21 @@ def _jm_obj_34(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_54: Path = (path + [ prop ]) if path is not None else None
+        lpath_54: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Header'.'|'.0.examples.''
         # .'$Header'.'|'.0.examples.''.'|'.0
-        res = json_model_25(pval, lpath_54 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_54, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Example [.'$Header'.'|'.0.examples.''.'|'.0]", lpath_54 if path is not None else None))
+            rep is None or rep.append(("unexpected $Example [.'$Header'.'|'.0.examples.''.'|'.0]", lpath_54))
             # .'$Header'.'|'.0.examples.''.'|'.1
-            res = json_model_30(pval, lpath_54 if path is not None else None, rep)
+            res = json_model_30(pval, lpath_54, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$Header'.'|'.0.examples.''.'|'.1]", lpath_54 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$Header'.'|'.0.examples.''.'|'.1]", lpath_54))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Header'.'|'.0.examples.''.'|']", lpath_54 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Header'.'|'.0.examples.''.'|']", lpath_54))
             return False
     return True
 
@@ -2600,23 +2613,23 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_53: Path = (path + [ prop ]) if path is not None else None
+        lpath_53: Path = (path, prop) if path is not None else None
         if prop == "style":
             # handle may style property
             # .'$Header'.'|'.0.style
-            res = json_model_15(pval, lpath_53 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_53, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Style [.'$Header'.'|'.0.style]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.style]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected $Style [.'$Header'.'|'.0.style]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.style]", lpath_53))
                 return False
             continue
         elif prop == "schema":
             # handle may schema property
             # .'$Header'.'|'.0.schema
-            res = json_model_32(pval, lpath_53 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_53, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Header'.'|'.0.schema]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.schema]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Header'.'|'.0.schema]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.schema]", lpath_53))
                 return False
             continue
         elif prop == "example":
@@ -2629,17 +2642,17 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.0.explode
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.explode]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.explode]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.explode]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.explode]", lpath_53))
                 return False
             continue
         elif prop == "examples":
             # handle may examples property
             # .'$Header'.'|'.0.examples
-            res = _jm_obj_34(pval, lpath_53 if path is not None else None, rep)
+            res = _jm_obj_34(pval, lpath_53, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Header'.'|'.0.examples]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.examples]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Header'.'|'.0.examples]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.examples]", lpath_53))
                 return False
             continue
         elif prop == "required":
@@ -2647,8 +2660,8 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.0.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.required]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.required]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.required]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.required]", lpath_53))
                 return False
             continue
         elif prop == "deprecated":
@@ -2656,8 +2669,8 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.0.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.deprecated]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.deprecated]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.deprecated]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.deprecated]", lpath_53))
                 return False
             continue
         elif prop == "description":
@@ -2665,8 +2678,8 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Header'.'|'.0.description]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.description]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Header'.'|'.0.description]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.description]", lpath_53))
                 return False
             continue
         elif prop == "allowReserved":
@@ -2674,8 +2687,8 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.0.allowReserved
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.allowReserved]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.allowReserved]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.allowReserved]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.allowReserved]", lpath_53))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -2683,8 +2696,8 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.0.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.allowEmptyValue]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.allowEmptyValue]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Header'.'|'.0.allowEmptyValue]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$Header'.'|'.0.allowEmptyValue]", lpath_53))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2692,7 +2705,7 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Header'.'|'.0.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Header'.'|'.0]", lpath_53 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Header'.'|'.0]", lpath_53))
             return False
     return True
 
@@ -2727,15 +2740,15 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_55: Path = (path + [ prop ]) if path is not None else None
+        lpath_55: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle must name property
             must_count += 1
             # .'$Tag'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Tag'.name]", lpath_55 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Tag'.name]", lpath_55 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Tag'.name]", lpath_55))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Tag'.name]", lpath_55))
                 return False
             continue
         if prop == "description":
@@ -2743,17 +2756,17 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Tag'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Tag'.description]", lpath_55 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Tag'.description]", lpath_55 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Tag'.description]", lpath_55))
+                rep is None or rep.append(("invalid optional prop value [.'$Tag'.description]", lpath_55))
                 return False
             continue
         elif prop == "externalDocs":
             # handle may externalDocs property
             # .'$Tag'.externalDocs
-            res = json_model_12(pval, lpath_55 if path is not None else None, rep)
+            res = json_model_12(pval, lpath_55, rep)
             if not res:
-                rep is None or rep.append(("unexpected $ExternalDocumentation [.'$Tag'.externalDocs]", lpath_55 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Tag'.externalDocs]", lpath_55 if path is not None else None))
+                rep is None or rep.append(("unexpected $ExternalDocumentation [.'$Tag'.externalDocs]", lpath_55))
+                rep is None or rep.append(("invalid optional prop value [.'$Tag'.externalDocs]", lpath_55))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2761,7 +2774,7 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Tag'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Tag']", lpath_55 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Tag']", lpath_55))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2779,15 +2792,15 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_56: Path = (path + [ prop ]) if path is not None else None
+        lpath_56: Path = (path, prop) if path is not None else None
         if prop == "$ref":
             # handle must $ref property
             must_count += 1
             # .'$Reference'.'$ref'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Reference'.'$ref']", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Reference'.'$ref']", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Reference'.'$ref']", lpath_56))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Reference'.'$ref']", lpath_56))
                 return False
             continue
         if prop == "summary":
@@ -2795,8 +2808,8 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Reference'.summary
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Reference'.summary]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Reference'.summary]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Reference'.summary]", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$Reference'.summary]", lpath_56))
                 return False
             continue
         elif prop == "description":
@@ -2804,11 +2817,11 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Reference'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Reference'.description]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Reference'.description]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Reference'.description]", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$Reference'.description]", lpath_56))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Reference']", lpath_56 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Reference']", lpath_56))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2843,12 +2856,12 @@ def _jm_f_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_58: Path = (path + [ prop ]) if path is not None else None
+        lpath_58: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Schema'.'$defs'.''
-        res = json_model_60(pval, lpath_58 if path is not None else None, rep)
+        res = json_model_60(pval, lpath_58, rep)
         if not res:
-            rep is None or rep.append(("unexpected $schema#Schema [.'$Schema'.'$defs'.'']", lpath_58 if path is not None else None))
+            rep is None or rep.append(("unexpected $schema#Schema [.'$Schema'.'$defs'.'']", lpath_58))
             return False
     return True
 
@@ -2868,16 +2881,16 @@ def _jm_f_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_59: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_59 if path is not None else None, rep):
+        lpath_59: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_59, rep):
             # handle 1 key props
             # .'$Schema'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Schema'.'$vocabulary'.'$URI']", lpath_59 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Schema'.'$vocabulary'.'$URI']", lpath_59))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Schema'.'$vocabulary']", lpath_59 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Schema'.'$vocabulary']", lpath_59))
             return False
     return True
 
@@ -2919,12 +2932,12 @@ def _jm_f_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_60: Path = (path + [ prop ]) if path is not None else None
+        lpath_60: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Schema'.dependentRequired.''
-        res = json_model_54(pval, lpath_60 if path is not None else None, rep)
+        res = json_model_54(pval, lpath_60, rep)
         if not res:
-            rep is None or rep.append(("unexpected $schema#stringArray [.'$Schema'.dependentRequired.'']", lpath_60 if path is not None else None))
+            rep is None or rep.append(("unexpected $schema#stringArray [.'$Schema'.dependentRequired.'']", lpath_60))
             return False
     return True
 
@@ -2936,12 +2949,12 @@ def _jm_f_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_61: Path = (path + [ prop ]) if path is not None else None
+        lpath_61: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Schema'.dependentSchemas.''
-        res = json_model_60(pval, lpath_61 if path is not None else None, rep)
+        res = json_model_60(pval, lpath_61, rep)
         if not res:
-            rep is None or rep.append(("unexpected $schema#Schema [.'$Schema'.dependentSchemas.'']", lpath_61 if path is not None else None))
+            rep is None or rep.append(("unexpected $schema#Schema [.'$Schema'.dependentSchemas.'']", lpath_61))
             return False
     return True
 
@@ -3048,16 +3061,16 @@ def _jm_f_37(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_62: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_62 if path is not None else None, rep):
+        lpath_62: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_62, rep):
             # handle 1 key props
             # .'$Schema'.patternProperties.'$REGEX'
-            res = json_model_60(pval, lpath_62 if path is not None else None, rep)
+            res = json_model_60(pval, lpath_62, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schema#Schema [.'$Schema'.patternProperties.'$REGEX']", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected $schema#Schema [.'$Schema'.patternProperties.'$REGEX']", lpath_62))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Schema'.patternProperties]", lpath_62 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Schema'.patternProperties]", lpath_62))
             return False
     return True
 
@@ -3069,12 +3082,12 @@ def _jm_f_38(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_63: Path = (path + [ prop ]) if path is not None else None
+        lpath_63: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Schema'.properties.''
-        res = json_model_60(pval, lpath_63 if path is not None else None, rep)
+        res = json_model_60(pval, lpath_63, rep)
         if not res:
-            rep is None or rep.append(("unexpected $schema#Schema [.'$Schema'.properties.'']", lpath_63 if path is not None else None))
+            rep is None or rep.append(("unexpected $schema#Schema [.'$Schema'.properties.'']", lpath_63))
             return False
     return True
 
@@ -3136,14 +3149,14 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_57: Path = (path + [ prop ]) if path is not None else None
+        lpath_57: Path = (path, prop) if path is not None else None
         if pfun := json_model_32_map.get(prop):
             # handle 61 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_57 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$Schema']", lpath_57 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_57, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$Schema']", lpath_57))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Schema']", lpath_57 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Schema']", lpath_57))
         return False
     return True
 
@@ -3154,12 +3167,12 @@ def _jm_obj_35(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_65: Path = (path + [ prop ]) if path is not None else None
+        lpath_65: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Discriminator'.mapping.''
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$Discriminator'.mapping.'']", lpath_65 if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$Discriminator'.mapping.'']", lpath_65))
             return False
     return True
 
@@ -3172,24 +3185,24 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_64: Path = (path + [ prop ]) if path is not None else None
+        lpath_64: Path = (path, prop) if path is not None else None
         if prop == "propertyName":
             # handle must propertyName property
             must_count += 1
             # .'$Discriminator'.propertyName
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Discriminator'.propertyName]", lpath_64 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Discriminator'.propertyName]", lpath_64 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Discriminator'.propertyName]", lpath_64))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Discriminator'.propertyName]", lpath_64))
                 return False
             continue
         if prop == "mapping":
             # handle may mapping property
             # .'$Discriminator'.mapping
-            res = _jm_obj_35(pval, lpath_64 if path is not None else None, rep)
+            res = _jm_obj_35(pval, lpath_64, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Discriminator'.mapping]", lpath_64 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Discriminator'.mapping]", lpath_64 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Discriminator'.mapping]", lpath_64))
+                rep is None or rep.append(("invalid optional prop value [.'$Discriminator'.mapping]", lpath_64))
                 return False
             continue
         if prop.startswith("x-"):
@@ -3197,7 +3210,7 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Discriminator'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Discriminator']", lpath_64 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Discriminator']", lpath_64))
             return False
     if must_count != 1:
         if rep is not None:
@@ -3214,14 +3227,14 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_66: Path = (path + [ prop ]) if path is not None else None
+        lpath_66: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$xml'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$xml'.name]", lpath_66 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$xml'.name]", lpath_66 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$xml'.name]", lpath_66))
+                rep is None or rep.append(("invalid optional prop value [.'$xml'.name]", lpath_66))
                 return False
             continue
         elif prop == "prefix":
@@ -3229,8 +3242,8 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$xml'.prefix
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$xml'.prefix]", lpath_66 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$xml'.prefix]", lpath_66 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$xml'.prefix]", lpath_66))
+                rep is None or rep.append(("invalid optional prop value [.'$xml'.prefix]", lpath_66))
                 return False
             continue
         elif prop == "wrapped":
@@ -3238,8 +3251,8 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$xml'.wrapped
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$xml'.wrapped]", lpath_66 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$xml'.wrapped]", lpath_66 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$xml'.wrapped]", lpath_66))
+                rep is None or rep.append(("invalid optional prop value [.'$xml'.wrapped]", lpath_66))
                 return False
             continue
         elif prop == "attribute":
@@ -3247,8 +3260,8 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$xml'.attribute
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$xml'.attribute]", lpath_66 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$xml'.attribute]", lpath_66 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$xml'.attribute]", lpath_66))
+                rep is None or rep.append(("invalid optional prop value [.'$xml'.attribute]", lpath_66))
                 return False
             continue
         elif prop == "namespace":
@@ -3256,8 +3269,8 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$xml'.namespace
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$xml'.namespace]", lpath_66 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$xml'.namespace]", lpath_66 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$xml'.namespace]", lpath_66))
+                rep is None or rep.append(("invalid optional prop value [.'$xml'.namespace]", lpath_66))
                 return False
             continue
         if prop.startswith("x-"):
@@ -3265,7 +3278,7 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$xml'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$xml']", lpath_66 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$xml']", lpath_66))
             return False
     return True
 
@@ -3286,32 +3299,32 @@ def json_model_35(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$SS-apikey']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$SS-apikey'.type
     res = isinstance(pval, str) and pval == "apiKey"
     if not res:
-        rep is None or rep.append(("unexpected _apiKey [.'$SS-apikey'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$SS-apikey']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _apiKey [.'$SS-apikey'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$SS-apikey']", lpath))
         return False
     if not ((pval := val.get("name", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <name> [.'$SS-apikey']", path))
         return False
-    lpath = (path + [ "name" ]) if path is not None else None
+    lpath = (path, "name") if path is not None else None
     # .'$SS-apikey'.name
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$SS-apikey'.name]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <name> [.'$SS-apikey']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$SS-apikey'.name]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <name> [.'$SS-apikey']", lpath))
         return False
     if not ((pval := val.get("in", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <in> [.'$SS-apikey']", path))
         return False
-    lpath = (path + [ "in" ]) if path is not None else None
+    lpath = (path, "in") if path is not None else None
     # .'$SS-apikey'.in
     res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_4
     if not res:
-        rep is None or rep.append(("value not in enum [.'$SS-apikey'.in.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <in> [.'$SS-apikey']", lpath if path is not None else None))
+        rep is None or rep.append(("value not in enum [.'$SS-apikey'.in.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <in> [.'$SS-apikey']", lpath))
         return False
     return True
 
@@ -3331,22 +3344,22 @@ def json_model_36(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$SS-http']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$SS-http'.type
     res = isinstance(pval, str) and pval == "http"
     if not res:
-        rep is None or rep.append(("unexpected _http [.'$SS-http'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$SS-http']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _http [.'$SS-http'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$SS-http']", lpath))
         return False
     if not ((pval := val.get("scheme", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <scheme> [.'$SS-http']", path))
         return False
-    lpath = (path + [ "scheme" ]) if path is not None else None
+    lpath = (path, "scheme") if path is not None else None
     # .'$SS-http'.scheme
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$SS-http'.scheme]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <scheme> [.'$SS-http']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$SS-http'.scheme]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <scheme> [.'$SS-http']", lpath))
         return False
     return True
 
@@ -3360,15 +3373,15 @@ def json_model_37(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_67: Path = (path + [ prop ]) if path is not None else None
+        lpath_67: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$SS-http-bearer'.type
             res = isinstance(pval, str) and pval == "http"
             if not res:
-                rep is None or rep.append(("unexpected _http [.'$SS-http-bearer'.type]", lpath_67 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SS-http-bearer'.type]", lpath_67 if path is not None else None))
+                rep is None or rep.append(("unexpected _http [.'$SS-http-bearer'.type]", lpath_67))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SS-http-bearer'.type]", lpath_67))
                 return False
             continue
         elif prop == "scheme":
@@ -3376,10 +3389,10 @@ def json_model_37(val: Jsonable, path: Path, rep: Report) -> bool:
             must_count += 1
             # .'$SS-http-bearer'.scheme
             # "/bearer/i"
-            res = isinstance(pval, str) and _jm_re_3(pval, lpath_67 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_3(pval, lpath_67, rep)
             if not res:
-                rep is None or rep.append(("unexpected /bearer/i [.'$SS-http-bearer'.scheme]", lpath_67 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SS-http-bearer'.scheme]", lpath_67 if path is not None else None))
+                rep is None or rep.append(("unexpected /bearer/i [.'$SS-http-bearer'.scheme]", lpath_67))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SS-http-bearer'.scheme]", lpath_67))
                 return False
             continue
         if prop == "bearerFormat":
@@ -3387,11 +3400,11 @@ def json_model_37(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SS-http-bearer'.bearerFormat
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SS-http-bearer'.bearerFormat]", lpath_67 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SS-http-bearer'.bearerFormat]", lpath_67 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SS-http-bearer'.bearerFormat]", lpath_67))
+                rep is None or rep.append(("invalid optional prop value [.'$SS-http-bearer'.bearerFormat]", lpath_67))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SS-http-bearer']", lpath_67 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SS-http-bearer']", lpath_67))
         return False
     if must_count != 2:
         if rep is not None:
@@ -3418,22 +3431,22 @@ def json_model_38(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$SS-oauth2']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$SS-oauth2'.type
     res = isinstance(pval, str) and pval == "oauth2"
     if not res:
-        rep is None or rep.append(("unexpected _oauth2 [.'$SS-oauth2'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$SS-oauth2']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _oauth2 [.'$SS-oauth2'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$SS-oauth2']", lpath))
         return False
     if not ((pval := val.get("flows", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <flows> [.'$SS-oauth2']", path))
         return False
-    lpath = (path + [ "flows" ]) if path is not None else None
+    lpath = (path, "flows") if path is not None else None
     # .'$SS-oauth2'.flows
-    res = json_model_41(pval, lpath if path is not None else None, rep)
+    res = json_model_41(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $OAuthFlows [.'$SS-oauth2'.flows]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <flows> [.'$SS-oauth2']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $OAuthFlows [.'$SS-oauth2'.flows]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <flows> [.'$SS-oauth2']", lpath))
         return False
     return True
 
@@ -3453,22 +3466,22 @@ def json_model_39(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$SS-oic']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$SS-oic'.type
     res = isinstance(pval, str) and pval == "openIdConnect"
     if not res:
-        rep is None or rep.append(("unexpected _openIdConnect [.'$SS-oic'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$SS-oic']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _openIdConnect [.'$SS-oic'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$SS-oic']", lpath))
         return False
     if not ((pval := val.get("openIdConnectUrl", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <openIdConnectUrl> [.'$SS-oic']", path))
         return False
-    lpath = (path + [ "openIdConnectUrl" ]) if path is not None else None
+    lpath = (path, "openIdConnectUrl") if path is not None else None
     # .'$SS-oic'.openIdConnectUrl
-    res = is_valid_url(pval, lpath if path is not None else None, rep)
+    res = is_valid_url(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $URL [.'$SS-oic'.openIdConnectUrl]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <openIdConnectUrl> [.'$SS-oic']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $URL [.'$SS-oic'.openIdConnectUrl]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <openIdConnectUrl> [.'$SS-oic']", lpath))
         return False
     return True
 
@@ -3481,15 +3494,15 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_68: Path = (path + [ prop ]) if path is not None else None
+        lpath_68: Path = (path, prop) if path is not None else None
         if prop == "in":
             # handle must in property
             must_count += 1
             # .'$SecurityScheme'.'|'.0.in
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_5
             if not res:
-                rep is None or rep.append(("value not in enum [.'$SecurityScheme'.'|'.0.in.'|']", lpath_68 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.0.in]", lpath_68 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.'$SecurityScheme'.'|'.0.in.'|']", lpath_68))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.0.in]", lpath_68))
                 return False
             continue
         elif prop == "name":
@@ -3498,8 +3511,8 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.0.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.0.name]", lpath_68 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.0.name]", lpath_68 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.0.name]", lpath_68))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.0.name]", lpath_68))
                 return False
             continue
         elif prop == "type":
@@ -3508,8 +3521,8 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.0.type
             res = isinstance(pval, str) and pval == "apiKey"
             if not res:
-                rep is None or rep.append(("unexpected _apiKey [.'$SecurityScheme'.'|'.0.type]", lpath_68 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.0.type]", lpath_68 if path is not None else None))
+                rep is None or rep.append(("unexpected _apiKey [.'$SecurityScheme'.'|'.0.type]", lpath_68))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.0.type]", lpath_68))
                 return False
             continue
         if prop == "description":
@@ -3517,11 +3530,11 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.0.description]", lpath_68 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.0.description]", lpath_68 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.0.description]", lpath_68))
+                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.0.description]", lpath_68))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.0]", lpath_68 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.0]", lpath_68))
         return False
     if must_count != 3:
         if rep is not None:
@@ -3542,15 +3555,15 @@ def _jm_obj_37(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_69: Path = (path + [ prop ]) if path is not None else None
+        lpath_69: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$SecurityScheme'.'|'.1.type
             res = isinstance(pval, str) and pval == "http"
             if not res:
-                rep is None or rep.append(("unexpected _http [.'$SecurityScheme'.'|'.1.type]", lpath_69 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.1.type]", lpath_69 if path is not None else None))
+                rep is None or rep.append(("unexpected _http [.'$SecurityScheme'.'|'.1.type]", lpath_69))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.1.type]", lpath_69))
                 return False
             continue
         elif prop == "scheme":
@@ -3558,10 +3571,10 @@ def _jm_obj_37(val: Jsonable, path: Path, rep: Report) -> bool:
             must_count += 1
             # .'$SecurityScheme'.'|'.1.scheme
             # "/bearer/i"
-            res = isinstance(pval, str) and _jm_re_3(pval, lpath_69 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_3(pval, lpath_69, rep)
             if not res:
-                rep is None or rep.append(("unexpected /bearer/i [.'$SecurityScheme'.'|'.1.scheme]", lpath_69 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.1.scheme]", lpath_69 if path is not None else None))
+                rep is None or rep.append(("unexpected /bearer/i [.'$SecurityScheme'.'|'.1.scheme]", lpath_69))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.1.scheme]", lpath_69))
                 return False
             continue
         if prop == "description":
@@ -3569,8 +3582,8 @@ def _jm_obj_37(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.1.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.1.description]", lpath_69 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.1.description]", lpath_69 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.1.description]", lpath_69))
+                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.1.description]", lpath_69))
                 return False
             continue
         elif prop == "bearerFormat":
@@ -3578,11 +3591,11 @@ def _jm_obj_37(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.1.bearerFormat
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.1.bearerFormat]", lpath_69 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.1.bearerFormat]", lpath_69 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.1.bearerFormat]", lpath_69))
+                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.1.bearerFormat]", lpath_69))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.1]", lpath_69 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.1]", lpath_69))
         return False
     if must_count != 2:
         if rep is not None:
@@ -3601,15 +3614,15 @@ def _jm_obj_38(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_70: Path = (path + [ prop ]) if path is not None else None
+        lpath_70: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$SecurityScheme'.'|'.2.type
             res = isinstance(pval, str) and pval == "http"
             if not res:
-                rep is None or rep.append(("unexpected _http [.'$SecurityScheme'.'|'.2.type]", lpath_70 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.2.type]", lpath_70 if path is not None else None))
+                rep is None or rep.append(("unexpected _http [.'$SecurityScheme'.'|'.2.type]", lpath_70))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.2.type]", lpath_70))
                 return False
             continue
         elif prop == "scheme":
@@ -3618,8 +3631,8 @@ def _jm_obj_38(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.2.scheme
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.2.scheme]", lpath_70 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.2.scheme]", lpath_70 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.2.scheme]", lpath_70))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.2.scheme]", lpath_70))
                 return False
             continue
         if prop == "description":
@@ -3627,11 +3640,11 @@ def _jm_obj_38(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.2.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.2.description]", lpath_70 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.2.description]", lpath_70 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.2.description]", lpath_70))
+                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.2.description]", lpath_70))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.2]", lpath_70 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.2]", lpath_70))
         return False
     if must_count != 2:
         if rep is not None:
@@ -3650,25 +3663,25 @@ def _jm_obj_39(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_71: Path = (path + [ prop ]) if path is not None else None
+        lpath_71: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$SecurityScheme'.'|'.3.type
             res = isinstance(pval, str) and pval == "oauth2"
             if not res:
-                rep is None or rep.append(("unexpected _oauth2 [.'$SecurityScheme'.'|'.3.type]", lpath_71 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.3.type]", lpath_71 if path is not None else None))
+                rep is None or rep.append(("unexpected _oauth2 [.'$SecurityScheme'.'|'.3.type]", lpath_71))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.3.type]", lpath_71))
                 return False
             continue
         elif prop == "flows":
             # handle must flows property
             must_count += 1
             # .'$SecurityScheme'.'|'.3.flows
-            res = json_model_41(pval, lpath_71 if path is not None else None, rep)
+            res = json_model_41(pval, lpath_71, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlows [.'$SecurityScheme'.'|'.3.flows]", lpath_71 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.3.flows]", lpath_71 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlows [.'$SecurityScheme'.'|'.3.flows]", lpath_71))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.3.flows]", lpath_71))
                 return False
             continue
         if prop == "description":
@@ -3676,11 +3689,11 @@ def _jm_obj_39(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.3.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.3.description]", lpath_71 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.3.description]", lpath_71 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.3.description]", lpath_71))
+                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.3.description]", lpath_71))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.3]", lpath_71 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.3]", lpath_71))
         return False
     if must_count != 2:
         if rep is not None:
@@ -3699,25 +3712,25 @@ def _jm_obj_40(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_72: Path = (path + [ prop ]) if path is not None else None
+        lpath_72: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$SecurityScheme'.'|'.4.type
             res = isinstance(pval, str) and pval == "openIdConnect"
             if not res:
-                rep is None or rep.append(("unexpected _openIdConnect [.'$SecurityScheme'.'|'.4.type]", lpath_72 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.4.type]", lpath_72 if path is not None else None))
+                rep is None or rep.append(("unexpected _openIdConnect [.'$SecurityScheme'.'|'.4.type]", lpath_72))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.4.type]", lpath_72))
                 return False
             continue
         elif prop == "openIdConnectUrl":
             # handle must openIdConnectUrl property
             must_count += 1
             # .'$SecurityScheme'.'|'.4.openIdConnectUrl
-            res = is_valid_url(pval, lpath_72 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_72, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$SecurityScheme'.'|'.4.openIdConnectUrl]", lpath_72 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.4.openIdConnectUrl]", lpath_72 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$SecurityScheme'.'|'.4.openIdConnectUrl]", lpath_72))
+                rep is None or rep.append(("invalid mandatory prop value [.'$SecurityScheme'.'|'.4.openIdConnectUrl]", lpath_72))
                 return False
             continue
         if prop == "description":
@@ -3725,11 +3738,11 @@ def _jm_obj_40(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.4.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.4.description]", lpath_72 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.4.description]", lpath_72 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.4.description]", lpath_72))
+                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.4.description]", lpath_72))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.4]", lpath_72 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.4]", lpath_72))
         return False
     if must_count != 2:
         if rep is not None:
@@ -3747,14 +3760,14 @@ def _jm_obj_41(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_73: Path = (path + [ prop ]) if path is not None else None
+        lpath_73: Path = (path, prop) if path is not None else None
         if prop == "description":
             # handle may description property
             # .'$SecurityScheme'.'|'.5.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.5.description]", lpath_73 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.5.description]", lpath_73 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$SecurityScheme'.'|'.5.description]", lpath_73))
+                rep is None or rep.append(("invalid optional prop value [.'$SecurityScheme'.'|'.5.description]", lpath_73))
                 return False
             continue
         if prop.startswith("x-"):
@@ -3762,7 +3775,7 @@ def _jm_obj_41(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$SecurityScheme'.'|'.5.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.5]", lpath_73 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$SecurityScheme'.'|'.5]", lpath_73))
             return False
     return True
 
@@ -3806,41 +3819,41 @@ def json_model_41(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_74: Path = (path + [ prop ]) if path is not None else None
+        lpath_74: Path = (path, prop) if path is not None else None
         if prop == "implicit":
             # handle may implicit property
             # .'$OAuthFlows'.implicit
-            res = json_model_42(pval, lpath_74 if path is not None else None, rep)
+            res = json_model_42(pval, lpath_74, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlow [.'$OAuthFlows'.implicit]", lpath_74 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlows'.implicit]", lpath_74 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlow [.'$OAuthFlows'.implicit]", lpath_74))
+                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlows'.implicit]", lpath_74))
                 return False
             continue
         elif prop == "password":
             # handle may password property
             # .'$OAuthFlows'.password
-            res = json_model_42(pval, lpath_74 if path is not None else None, rep)
+            res = json_model_42(pval, lpath_74, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlow [.'$OAuthFlows'.password]", lpath_74 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlows'.password]", lpath_74 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlow [.'$OAuthFlows'.password]", lpath_74))
+                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlows'.password]", lpath_74))
                 return False
             continue
         elif prop == "authorizationCode":
             # handle may authorizationCode property
             # .'$OAuthFlows'.authorizationCode
-            res = json_model_42(pval, lpath_74 if path is not None else None, rep)
+            res = json_model_42(pval, lpath_74, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlow [.'$OAuthFlows'.authorizationCode]", lpath_74 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlows'.authorizationCode]", lpath_74 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlow [.'$OAuthFlows'.authorizationCode]", lpath_74))
+                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlows'.authorizationCode]", lpath_74))
                 return False
             continue
         elif prop == "clientCredentials":
             # handle may clientCredentials property
             # .'$OAuthFlows'.clientCredentials
-            res = json_model_42(pval, lpath_74 if path is not None else None, rep)
+            res = json_model_42(pval, lpath_74, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlow [.'$OAuthFlows'.clientCredentials]", lpath_74 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlows'.clientCredentials]", lpath_74 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlow [.'$OAuthFlows'.clientCredentials]", lpath_74))
+                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlows'.clientCredentials]", lpath_74))
                 return False
             continue
         if prop.startswith("x-"):
@@ -3848,7 +3861,7 @@ def json_model_41(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OAuthFlows'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$OAuthFlows']", lpath_74 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$OAuthFlows']", lpath_74))
             return False
     return True
 
@@ -3859,12 +3872,12 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_76: Path = (path + [ prop ]) if path is not None else None
+        lpath_76: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$OAuthFlow'.scopes.''
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$OAuthFlow'.scopes.'']", lpath_76 if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$OAuthFlow'.scopes.'']", lpath_76))
             return False
     return True
 
@@ -3877,44 +3890,44 @@ def json_model_42(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_75: Path = (path + [ prop ]) if path is not None else None
+        lpath_75: Path = (path, prop) if path is not None else None
         if prop == "scopes":
             # handle must scopes property
             must_count += 1
             # .'$OAuthFlow'.scopes
-            res = _jm_obj_42(pval, lpath_75 if path is not None else None, rep)
+            res = _jm_obj_42(pval, lpath_75, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$OAuthFlow'.scopes]", lpath_75 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$OAuthFlow'.scopes]", lpath_75 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$OAuthFlow'.scopes]", lpath_75))
+                rep is None or rep.append(("invalid mandatory prop value [.'$OAuthFlow'.scopes]", lpath_75))
                 return False
             continue
         elif prop == "tokenUrl":
             # handle must tokenUrl property
             must_count += 1
             # .'$OAuthFlow'.tokenUrl
-            res = is_valid_url(pval, lpath_75 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_75, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$OAuthFlow'.tokenUrl]", lpath_75 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$OAuthFlow'.tokenUrl]", lpath_75 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$OAuthFlow'.tokenUrl]", lpath_75))
+                rep is None or rep.append(("invalid mandatory prop value [.'$OAuthFlow'.tokenUrl]", lpath_75))
                 return False
             continue
         elif prop == "authorizationUrl":
             # handle must authorizationUrl property
             must_count += 1
             # .'$OAuthFlow'.authorizationUrl
-            res = is_valid_url(pval, lpath_75 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_75, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$OAuthFlow'.authorizationUrl]", lpath_75 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$OAuthFlow'.authorizationUrl]", lpath_75 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$OAuthFlow'.authorizationUrl]", lpath_75))
+                rep is None or rep.append(("invalid mandatory prop value [.'$OAuthFlow'.authorizationUrl]", lpath_75))
                 return False
             continue
         if prop == "refreshUrl":
             # handle may refreshUrl property
             # .'$OAuthFlow'.refreshUrl
-            res = is_valid_url(pval, lpath_75 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_75, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$OAuthFlow'.refreshUrl]", lpath_75 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlow'.refreshUrl]", lpath_75 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$OAuthFlow'.refreshUrl]", lpath_75))
+                rep is None or rep.append(("invalid optional prop value [.'$OAuthFlow'.refreshUrl]", lpath_75))
                 return False
             continue
         if prop.startswith("x-"):
@@ -3922,7 +3935,7 @@ def json_model_42(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$OAuthFlow'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$OAuthFlow']", lpath_75 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$OAuthFlow']", lpath_75))
             return False
     if must_count != 3:
         if rep is not None:
@@ -3943,20 +3956,20 @@ def json_model_43(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_77: Path = (path + [ prop ]) if path is not None else None
+        lpath_77: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$SecurityRequirement'.''
         res = isinstance(pval, list)
         if res:
             for arr_10_idx, arr_10_item in enumerate(pval):
-                arr_10_lpath: Path = ((lpath_77 if path is not None else None) + [ arr_10_idx ]) if (lpath_77 if path is not None else None) is not None else None
+                arr_10_lpath: Path = (lpath_77, arr_10_idx) if lpath_77 is not None else None
                 # .'$SecurityRequirement'.''.0
                 res = isinstance(arr_10_item, str)
                 if not res:
-                    rep is None or rep.append(("unexpected string [.'$SecurityRequirement'.''.0]", arr_10_lpath if (lpath_77 if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected string [.'$SecurityRequirement'.''.0]", arr_10_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$SecurityRequirement'.'']", lpath_77 if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$SecurityRequirement'.'']", lpath_77))
             return False
     return True
 
@@ -3968,13 +3981,13 @@ def json_model_44(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_78: Path = (path + [ prop ]) if path is not None else None
+        lpath_78: Path = (path, prop) if path is not None else None
         if prop.startswith("x-"):
             # handle 1 re props
             # .'$Extension'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Extension']", lpath_78 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Extension']", lpath_78))
             return False
     return True
 
@@ -4010,11 +4023,11 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_11_idx, arr_11_item in enumerate(val):
-            arr_11_lpath: Path = (path + [ arr_11_idx ]) if path is not None else None
+            arr_11_lpath: Path = (path, arr_11_idx) if path is not None else None
             # .'$schema#simpleTypesArray'.'@'.0
-            res = json_model_52(arr_11_item, arr_11_lpath if path is not None else None, rep)
+            res = json_model_52(arr_11_item, arr_11_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $simpleTypes [.'$schema#simpleTypesArray'.'@'.0]", arr_11_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $simpleTypes [.'$schema#simpleTypesArray'.'@'.0]", arr_11_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -4032,11 +4045,11 @@ def json_model_54(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_12_idx, arr_12_item in enumerate(val):
-            arr_12_lpath: Path = (path + [ arr_12_idx ]) if path is not None else None
+            arr_12_lpath: Path = (path, arr_12_idx) if path is not None else None
             # .'$schema#stringArray'.'@'.0
             res = isinstance(arr_12_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$schema#stringArray'.'@'.0]", arr_12_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$schema#stringArray'.'@'.0]", arr_12_lpath))
                 break
     if res:
         res = is_unique_array(val, path, rep)
@@ -4061,11 +4074,11 @@ def json_model_57(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_13_idx, arr_13_item in enumerate(val):
-            arr_13_lpath: Path = (path + [ arr_13_idx ]) if path is not None else None
+            arr_13_lpath: Path = (path, arr_13_idx) if path is not None else None
             # .'$schema#schemaArray'.'@'.0
-            res = json_model_60(arr_13_item, arr_13_lpath if path is not None else None, rep)
+            res = json_model_60(arr_13_item, arr_13_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schema#schemaArray'.'@'.0]", arr_13_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schema#schemaArray'.'@'.0]", arr_13_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -4109,12 +4122,12 @@ def _jm_f_45(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_80: Path = (path + [ prop ]) if path is not None else None
+        lpath_80: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.'$defs'.''
-        res = json_model_60(pval, lpath_80 if path is not None else None, rep)
+        res = json_model_60(pval, lpath_80, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.'$defs'.'']", lpath_80 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.'$defs'.'']", lpath_80))
             return False
     return True
 
@@ -4134,16 +4147,16 @@ def _jm_f_47(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_81: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_81 if path is not None else None, rep):
+        lpath_81: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_81, rep):
             # handle 1 key props
             # .'$schema#ObjectSchema'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$schema#ObjectSchema'.'$vocabulary'.'$URI']", lpath_81 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$schema#ObjectSchema'.'$vocabulary'.'$URI']", lpath_81))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$schema#ObjectSchema'.'$vocabulary']", lpath_81 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$schema#ObjectSchema'.'$vocabulary']", lpath_81))
             return False
     return True
 
@@ -4185,12 +4198,12 @@ def _jm_f_52(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_82: Path = (path + [ prop ]) if path is not None else None
+        lpath_82: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.dependentRequired.''
-        res = json_model_54(pval, lpath_82 if path is not None else None, rep)
+        res = json_model_54(pval, lpath_82, rep)
         if not res:
-            rep is None or rep.append(("unexpected $stringArray [.'$schema#ObjectSchema'.dependentRequired.'']", lpath_82 if path is not None else None))
+            rep is None or rep.append(("unexpected $stringArray [.'$schema#ObjectSchema'.dependentRequired.'']", lpath_82))
             return False
     return True
 
@@ -4202,12 +4215,12 @@ def _jm_f_53(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_83: Path = (path + [ prop ]) if path is not None else None
+        lpath_83: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.dependentSchemas.''
-        res = json_model_60(pval, lpath_83 if path is not None else None, rep)
+        res = json_model_60(pval, lpath_83, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.dependentSchemas.'']", lpath_83 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.dependentSchemas.'']", lpath_83))
             return False
     return True
 
@@ -4307,16 +4320,16 @@ def _jm_f_65(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_84: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_84 if path is not None else None, rep):
+        lpath_84: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_84, rep):
             # handle 1 key props
             # .'$schema#ObjectSchema'.patternProperties.'$REGEX'
-            res = json_model_60(pval, lpath_84 if path is not None else None, rep)
+            res = json_model_60(pval, lpath_84, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.patternProperties.'$REGEX']", lpath_84 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.patternProperties.'$REGEX']", lpath_84))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$schema#ObjectSchema'.patternProperties]", lpath_84 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$schema#ObjectSchema'.patternProperties]", lpath_84))
             return False
     return True
 
@@ -4328,12 +4341,12 @@ def _jm_f_66(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_85: Path = (path + [ prop ]) if path is not None else None
+        lpath_85: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$schema#ObjectSchema'.properties.''
-        res = json_model_60(pval, lpath_85 if path is not None else None, rep)
+        res = json_model_60(pval, lpath_85, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.properties.'']", lpath_85 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$schema#ObjectSchema'.properties.'']", lpath_85))
             return False
     return True
 
@@ -4395,14 +4408,14 @@ def json_model_59(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_79: Path = (path + [ prop ]) if path is not None else None
+        lpath_79: Path = (path, prop) if path is not None else None
         if pfun := json_model_59_map.get(prop):
             # handle 57 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_79 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$schema#ObjectSchema']", lpath_79 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_79, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$schema#ObjectSchema']", lpath_79))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$schema#ObjectSchema']", lpath_79 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$schema#ObjectSchema']", lpath_79))
         return False
     return True
 
@@ -4671,5 +4684,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -27,29 +40,29 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     # .
     res: bool = isinstance(val, list) and len(val) == 4
     if res:
-        lpath_0: Path = (path + [ 0 ]) if path is not None else None
+        lpath_0: Path = (path, 0) if path is not None else None
         # .0
         res = isinstance(val[0], str)
         if res:
-            lpath_0 = (path + [ 1 ]) if path is not None else None
+            lpath_0 = (path, 1) if path is not None else None
             # .1
             res = isinstance(val[1], int) and not isinstance(val[1], bool) and val[1] >= 0
             if res:
-                lpath_0 = (path + [ 2 ]) if path is not None else None
+                lpath_0 = (path, 2) if path is not None else None
                 # .2
                 res = isinstance(val[2], bool)
                 if res:
-                    lpath_0 = (path + [ 3 ]) if path is not None else None
+                    lpath_0 = (path, 3) if path is not None else None
                     # .3
                     res = isinstance(val[3], float) and val[3] >= 0.0
                     if not res:
-                        rep is None or rep.append(("not a 0.0 strict float [.3]", lpath_0 if path is not None else None))
+                        rep is None or rep.append(("not a 0.0 strict float [.3]", lpath_0))
                 else:
-                    rep is None or rep.append(("not a bool [.2]", lpath_0 if path is not None else None))
+                    rep is None or rep.append(("not a bool [.2]", lpath_0))
             else:
-                rep is None or rep.append(("not a 0 strict int [.1]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.1]", lpath_0))
         else:
-            rep is None or rep.append(("unexpected string [.0]", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected string [.0]", lpath_0))
     if not res:
         rep is None or rep.append(("not array or unexpected array [.]", path))
     return res
@@ -76,5 +89,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -38,20 +51,20 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("bibi", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <bibi> [.'$bibi']", path))
         return False
-    lpath = (path + [ "bibi" ]) if path is not None else None
+    lpath = (path, "bibi") if path is not None else None
     # .'$bibi'.bibi
     res = isinstance(pval, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(pval):
-            arr_0_lpath: Path = ((lpath if path is not None else None) + [ arr_0_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_0_lpath: Path = (lpath, arr_0_idx) if lpath is not None else None
             # .'$bibi'.bibi.0
-            res = json_model_2(arr_0_item, arr_0_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_2(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $bibi [.'$bibi'.bibi.0]", arr_0_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $bibi [.'$bibi'.bibi.0]", arr_0_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$bibi'.bibi]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <bibi> [.'$bibi']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$bibi'.bibi]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <bibi> [.'$bibi']", lpath))
         return False
     return True
 
@@ -86,5 +99,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -31,15 +44,15 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "!":
             # handle must ! property
             must_count += 1
             # .'!'
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'!']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'!']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'!']", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'!']", lpath_0))
                 return False
             continue
         elif prop == "/":
@@ -48,8 +61,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'/'
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 17
             if not res:
-                rep is None or rep.append(("unexpected =17 [.'/']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'/']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected =17 [.'/']", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'/']", lpath_0))
                 return False
             continue
         elif prop == "?":
@@ -58,8 +71,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'?'
             res = isinstance(pval, float) and pval >= 0.0
             if not res:
-                rep is None or rep.append(("not a 0.0 strict float [.'?']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'?']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0.0 strict float [.'?']", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'?']", lpath_0))
                 return False
             continue
         elif prop == "_":
@@ -68,8 +81,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # ._
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [._]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [._]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a bool [._]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [._]", lpath_0))
                 return False
             continue
         elif prop == "a":
@@ -78,8 +91,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .a
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.a]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.a]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.a]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.a]", lpath_0))
                 return False
             continue
         if prop == "b":
@@ -87,11 +100,11 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .b
             res = pval is None
             if not res:
-                rep is None or rep.append(("not null [.b]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.b]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not null [.b]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.b]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.]", lpath_0))
         return False
     if must_count != 5:
         if rep is not None:
@@ -130,5 +143,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -38,42 +51,42 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .c
     res = isinstance(pval, bool)
     if not res:
-        rep is None or rep.append(("not a bool [.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("not a bool [.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.]", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .d
     res = isinstance(pval, int) and not isinstance(pval, bool)
     if not res:
-        rep is None or rep.append(("not a -1 strict int [.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("not a -1 strict int [.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.]", lpath))
         return False
     return True
 
@@ -99,5 +112,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -46,42 +59,42 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'$r']", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'$r'.a
     res = isinstance(pval, str) and pval == "cst_01"
     if not res:
-        rep is None or rep.append(("unexpected _cst_01 [.'$r'.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'$r']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_01 [.'$r'.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'$r']", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.'$r']", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .'$r'.b
     res = isinstance(pval, str) and pval == "cst_01"
     if not res:
-        rep is None or rep.append(("unexpected _cst_01 [.'$r'.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'$r']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_01 [.'$r'.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'$r']", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.'$r']", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .'$r'.c
     res = isinstance(pval, str) and pval == "cst_01"
     if not res:
-        rep is None or rep.append(("unexpected _cst_01 [.'$r'.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'$r']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_01 [.'$r'.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'$r']", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.'$r']", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .'$r'.d
     res = isinstance(pval, str) and pval == "cst_01"
     if not res:
-        rep is None or rep.append(("unexpected _cst_01 [.'$r'.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'$r']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_01 [.'$r'.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'$r']", lpath))
         return False
     return True
 
@@ -101,22 +114,22 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("e", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <e> [.'$z']", path))
         return False
-    lpath = (path + [ "e" ]) if path is not None else None
+    lpath = (path, "e") if path is not None else None
     # .'$z'.e
     res = isinstance(pval, str) and pval == "cst_02"
     if not res:
-        rep is None or rep.append(("unexpected _cst_02 [.'$z'.e]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <e> [.'$z']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_02 [.'$z'.e]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <e> [.'$z']", lpath))
         return False
     if not ((pval := val.get("f", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <f> [.'$z']", path))
         return False
-    lpath = (path + [ "f" ]) if path is not None else None
+    lpath = (path, "f") if path is not None else None
     # .'$z'.f
     res = isinstance(pval, str) and pval == "cst_02"
     if not res:
-        rep is None or rep.append(("unexpected _cst_02 [.'$z'.f]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <f> [.'$z']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_02 [.'$z'.f]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <f> [.'$z']", lpath))
         return False
     return True
 
@@ -136,62 +149,62 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .a
     res = isinstance(pval, str) and pval == "cst_01"
     if not res:
-        rep is None or rep.append(("unexpected _cst_01 [.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_01 [.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .b
     res = isinstance(pval, str) and pval == "cst_01"
     if not res:
-        rep is None or rep.append(("unexpected _cst_01 [.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_01 [.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.]", lpath))
         return False
     if not ((pval := val.get("e", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <e> [.]", path))
         return False
-    lpath = (path + [ "e" ]) if path is not None else None
+    lpath = (path, "e") if path is not None else None
     # .e
     res = isinstance(pval, str) and pval == "cst_02"
     if not res:
-        rep is None or rep.append(("unexpected _cst_02 [.e]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <e> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_02 [.e]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <e> [.]", lpath))
         return False
     if not ((pval := val.get("f", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <f> [.]", path))
         return False
-    lpath = (path + [ "f" ]) if path is not None else None
+    lpath = (path, "f") if path is not None else None
     # .f
     res = isinstance(pval, str) and pval == "cst_02"
     if not res:
-        rep is None or rep.append(("unexpected _cst_02 [.f]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <f> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_02 [.f]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <f> [.]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .c
     res = isinstance(pval, str) and pval == "cst_01"
     if not res:
-        rep is None or rep.append(("unexpected _cst_01 [.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_01 [.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.]", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .d
     res = isinstance(pval, str) and pval == "cst_01"
     if not res:
-        rep is None or rep.append(("unexpected _cst_01 [.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _cst_01 [.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.]", lpath))
         return False
     return True
 
@@ -220,5 +233,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: dict[str, str]
 check_model_map: PropMap
@@ -38,22 +51,22 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.movie.'|'.0]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .movie.'|'.0.t
     res = isinstance(pval, str) and pval == "fr"
     if not res:
-        rep is None or rep.append(("unexpected fr [.movie.'|'.0.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.movie.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected fr [.movie.'|'.0.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.movie.'|'.0]", lpath))
         return False
     if not ((pval := val.get("titre", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <titre> [.movie.'|'.0]", path))
         return False
-    lpath = (path + [ "titre" ]) if path is not None else None
+    lpath = (path, "titre") if path is not None else None
     # .movie.'|'.0.titre
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.movie.'|'.0.titre]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <titre> [.movie.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.movie.'|'.0.titre]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <titre> [.movie.'|'.0]", lpath))
         return False
     return True
 
@@ -72,22 +85,22 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.movie.'|'.1]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .movie.'|'.1.t
     res = isinstance(pval, str) and pval == "en"
     if not res:
-        rep is None or rep.append(("unexpected en [.movie.'|'.1.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.movie.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected en [.movie.'|'.1.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.movie.'|'.1]", lpath))
         return False
     if not ((pval := val.get("title", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <title> [.movie.'|'.1]", path))
         return False
-    lpath = (path + [ "title" ]) if path is not None else None
+    lpath = (path, "title") if path is not None else None
     # .movie.'|'.1.title
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.movie.'|'.1.title]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <title> [.movie.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.movie.'|'.1.title]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <title> [.movie.'|'.1]", lpath))
         return False
     return True
 
@@ -106,22 +119,22 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.movie.'|'.2]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .movie.'|'.2.t
     res = isinstance(pval, str) and pval == "de"
     if not res:
-        rep is None or rep.append(("unexpected de [.movie.'|'.2.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.movie.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected de [.movie.'|'.2.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.movie.'|'.2]", lpath))
         return False
     if not ((pval := val.get("Title", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <Title> [.movie.'|'.2]", path))
         return False
-    lpath = (path + [ "Title" ]) if path is not None else None
+    lpath = (path, "Title") if path is not None else None
     # .movie.'|'.2.Title
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.movie.'|'.2.Title]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <Title> [.movie.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.movie.'|'.2.Title]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <Title> [.movie.'|'.2]", lpath))
         return False
     return True
 
@@ -140,22 +153,22 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.movie.'|'.3]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .movie.'|'.3.t
     res = isinstance(pval, str) and pval == "ru"
     if not res:
-        rep is None or rep.append(("unexpected ru [.movie.'|'.3.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.movie.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected ru [.movie.'|'.3.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.movie.'|'.3]", lpath))
         return False
     if not ((pval := val.get("suti", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <suti> [.movie.'|'.3]", path))
         return False
-    lpath = (path + [ "suti" ]) if path is not None else None
+    lpath = (path, "suti") if path is not None else None
     # .movie.'|'.3.suti
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.movie.'|'.3.suti]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <suti> [.movie.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.movie.'|'.3.suti]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <suti> [.movie.'|'.3]", lpath))
         return False
     return True
 
@@ -176,7 +189,7 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("movie", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <movie> [.]", path))
         return False
-    lpath = (path + [ "movie" ]) if path is not None else None
+    lpath = (path, "movie") if path is not None else None
     # .movie
     iso_0: bool = isinstance(pval, dict)
     res = iso_0
@@ -185,17 +198,17 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             tag_0: Jsonable = pval.get("t", UNDEFINED)
             fun_0: CheckFun = _jm_map_0.get(tag_0, UNDEFINED)
             if fun_0 != UNDEFINED:
-                res = fun_0(pval, lpath if path is not None else None, rep)
+                res = fun_0(pval, lpath, rep)
             else:
                 res = False
-                rep is None or rep.append(("tag <t> value not found [.movie.'|']", lpath if path is not None else None))
+                rep is None or rep.append(("tag <t> value not found [.movie.'|']", lpath))
         else:
             res = False
-            rep is None or rep.append(("tag prop <t> is missing [.movie.'|']", lpath if path is not None else None))
+            rep is None or rep.append(("tag prop <t> is missing [.movie.'|']", lpath))
     else:
-        rep is None or rep.append(("value is not an object [.movie.'|']", lpath if path is not None else None))
+        rep is None or rep.append(("value is not an object [.movie.'|']", lpath))
     if not res:
-        rep is None or rep.append(("unexpected value for mandatory prop <movie> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected value for mandatory prop <movie> [.]", lpath))
         return False
     return True
 
@@ -228,5 +241,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -55,12 +68,12 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("X", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <X> [.'$Xx']", path))
         return False
-    lpath = (path + [ "X" ]) if path is not None else None
+    lpath = (path, "X") if path is not None else None
     # .'$Xx'.X
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$Xx'.X]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <X> [.'$Xx']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$Xx'.X]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <X> [.'$Xx']", lpath))
         return False
     return True
 
@@ -80,12 +93,12 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("Y", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <Y> [.'$Yy']", path))
         return False
-    lpath = (path + [ "Y" ]) if path is not None else None
+    lpath = (path, "Y") if path is not None else None
     # .'$Yy'.Y
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$Yy'.Y]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <Y> [.'$Yy']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$Yy'.Y]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <Y> [.'$Yy']", lpath))
         return False
     return True
 
@@ -97,15 +110,15 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "Y":
             # handle must Y property
             must_count += 1
             # .'$Ee'.'|'.1.Y
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ee'.'|'.1.Y]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Ee'.'|'.1.Y]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ee'.'|'.1.Y]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Ee'.'|'.1.Y]", lpath_0))
                 return False
             continue
         if prop == "Z":
@@ -113,11 +126,11 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Ee'.'|'.1.Z
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ee'.'|'.1.Z]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ee'.'|'.1.Z]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ee'.'|'.1.Z]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Ee'.'|'.1.Z]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Ee'.'|'.1]", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Ee'.'|'.1]", lpath_0))
         return False
     if must_count != 1:
         if rep is not None:
@@ -134,15 +147,15 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "X":
             # handle must X property
             must_count += 1
             # .'$Ee'.'|'.0.X
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ee'.'|'.0.X]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Ee'.'|'.0.X]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ee'.'|'.0.X]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Ee'.'|'.0.X]", lpath_1))
                 return False
             continue
         if prop == "Z":
@@ -150,11 +163,11 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Ee'.'|'.0.Z
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Ee'.'|'.0.Z]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Ee'.'|'.0.Z]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Ee'.'|'.0.Z]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Ee'.'|'.0.Z]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Ee'.'|'.0]", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Ee'.'|'.0]", lpath_1))
         return False
     if must_count != 1:
         if rep is not None:
@@ -241,5 +254,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -30,22 +43,22 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "b":
             # handle must b property
             must_count += 1
             # .'|'.1.b
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'|'.1.b]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'|'.1.b]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'|'.1.b]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'|'.1.b]", lpath_0))
                 return False
             continue
         # handle other props
         # .'|'.1.''
         res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
         if not res:
-            rep is None or rep.append(("not a 0 strict int [.'|'.1.'']", lpath_0 if path is not None else None))
+            rep is None or rep.append(("not a 0 strict int [.'|'.1.'']", lpath_0))
             return False
     if must_count != 1:
         if rep is not None:
@@ -62,22 +75,22 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "a":
             # handle must a property
             must_count += 1
             # .'|'.0.a
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'|'.0.a]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'|'.0.a]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'|'.0.a]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'|'.0.a]", lpath_1))
                 return False
             continue
         # handle other props
         # .'|'.0.''
         res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
         if not res:
-            rep is None or rep.append(("not a 0 strict int [.'|'.0.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("not a 0 strict int [.'|'.0.'']", lpath_1))
             return False
     if must_count != 1:
         if rep is not None:
@@ -130,5 +143,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -32,16 +45,16 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if _jm_re_0(prop, path, rep):
             # handle 1 re props
             # .'^'.0.'/a/'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'^'.0.'/a/']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'^'.0.'/a/']", lpath_0))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'^'.0]", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'^'.0]", lpath_0))
             return False
     return True
 
@@ -52,17 +65,17 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "a":
             # handle may a property
             # .'^'.1.a
             res = pval is None
             if not res:
-                rep is None or rep.append(("not null [.'^'.1.a]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'^'.1.a]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not null [.'^'.1.a]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'^'.1.a]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'^'.1]", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'^'.1]", lpath_1))
         return False
     return True
 
@@ -120,5 +133,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: dict[str, str]
 check_model_map: PropMap
@@ -38,22 +51,22 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("tag", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <tag> [.'|'.0]", path))
         return False
-    lpath = (path + [ "tag" ]) if path is not None else None
+    lpath = (path, "tag") if path is not None else None
     # .'|'.0.tag
     res = isinstance(pval, str) and pval == "a"
     if not res:
-        rep is None or rep.append(("unexpected a [.'|'.0.tag]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <tag> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected a [.'|'.0.tag]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <tag> [.'|'.0]", lpath))
         return False
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'|'.0]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'|'.0.a
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.0.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.0.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'|'.0]", lpath))
         return False
     return True
 
@@ -72,22 +85,22 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("tag", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <tag> [.'|'.1]", path))
         return False
-    lpath = (path + [ "tag" ]) if path is not None else None
+    lpath = (path, "tag") if path is not None else None
     # .'|'.1.tag
     res = isinstance(pval, str) and pval == "b"
     if not res:
-        rep is None or rep.append(("unexpected b [.'|'.1.tag]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <tag> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected b [.'|'.1.tag]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <tag> [.'|'.1]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.'|'.1]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .'|'.1.b
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.1.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.1.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'|'.1]", lpath))
         return False
     return True
 
@@ -106,22 +119,22 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("tag", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <tag> [.'|'.2]", path))
         return False
-    lpath = (path + [ "tag" ]) if path is not None else None
+    lpath = (path, "tag") if path is not None else None
     # .'|'.2.tag
     res = isinstance(pval, str) and pval == "c"
     if not res:
-        rep is None or rep.append(("unexpected c [.'|'.2.tag]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <tag> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected c [.'|'.2.tag]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <tag> [.'|'.2]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.'|'.2]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .'|'.2.c
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.2.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.2.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'|'.2]", lpath))
         return False
     return True
 
@@ -177,5 +190,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: ConstMap = ConstMap()
 check_model_map: PropMap
@@ -38,22 +51,22 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.0]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.0.t
     res = isinstance(pval, float) and pval == 3.1415927
     if not res:
-        rep is None or rep.append(("unexpected =3.1415927 [.'|'.0.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =3.1415927 [.'|'.0.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath))
         return False
     if not ((pval := val.get("pi", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <pi> [.'|'.0]", path))
         return False
-    lpath = (path + [ "pi" ]) if path is not None else None
+    lpath = (path, "pi") if path is not None else None
     # .'|'.0.pi
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.0.pi]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <pi> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.0.pi]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <pi> [.'|'.0]", lpath))
         return False
     return True
 
@@ -72,22 +85,22 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.1]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.1.t
     res = isinstance(pval, float) and pval == 1.0
     if not res:
-        rep is None or rep.append(("unexpected =1.0 [.'|'.1.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =1.0 [.'|'.1.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath))
         return False
     if not ((pval := val.get("one", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <one> [.'|'.1]", path))
         return False
-    lpath = (path + [ "one" ]) if path is not None else None
+    lpath = (path, "one") if path is not None else None
     # .'|'.1.one
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.1.one]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <one> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.1.one]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <one> [.'|'.1]", lpath))
         return False
     return True
 
@@ -106,22 +119,22 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.2]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.2.t
     res = isinstance(pval, float) and pval == 0.5
     if not res:
-        rep is None or rep.append(("unexpected =0.5 [.'|'.2.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =0.5 [.'|'.2.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.2]", lpath))
         return False
     if not ((pval := val.get("half", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <half> [.'|'.2]", path))
         return False
-    lpath = (path + [ "half" ]) if path is not None else None
+    lpath = (path, "half") if path is not None else None
     # .'|'.2.half
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.2.half]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <half> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.2.half]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <half> [.'|'.2]", lpath))
         return False
     return True
 
@@ -175,5 +188,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
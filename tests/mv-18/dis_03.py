@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: ConstMap = ConstMap()
 check_model_map: PropMap
@@ -38,22 +51,22 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("discriminator", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <discriminator> [.'|'.0]", path))
         return False
-    lpath = (path + [ "discriminator" ]) if path is not None else None
+    lpath = (path, "discriminator") if path is not None else None
     # .'|'.0.discriminator
     res = isinstance(pval, bool) and pval == True
     if not res:
-        rep is None or rep.append(("unexpected =true [.'|'.0.discriminator]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <discriminator> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =true [.'|'.0.discriminator]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <discriminator> [.'|'.0]", lpath))
         return False
     if not ((pval := val.get("x", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <x> [.'|'.0]", path))
         return False
-    lpath = (path + [ "x" ]) if path is not None else None
+    lpath = (path, "x") if path is not None else None
     # .'|'.0.x
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.0.x]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <x> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.0.x]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <x> [.'|'.0]", lpath))
         return False
     return True
 
@@ -72,22 +85,22 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("discriminator", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <discriminator> [.'|'.1]", path))
         return False
-    lpath = (path + [ "discriminator" ]) if path is not None else None
+    lpath = (path, "discriminator") if path is not None else None
     # .'|'.1.discriminator
     res = isinstance(pval, bool) and pval == False
     if not res:
-        rep is None or rep.append(("unexpected =false [.'|'.1.discriminator]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <discriminator> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =false [.'|'.1.discriminator]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <discriminator> [.'|'.1]", lpath))
         return False
     if not ((pval := val.get("y", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <y> [.'|'.1]", path))
         return False
-    lpath = (path + [ "y" ]) if path is not None else None
+    lpath = (path, "y") if path is not None else None
     # .'|'.1.y
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.1.y]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <y> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.1.y]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <y> [.'|'.1]", lpath))
         return False
     return True
 
@@ -140,5 +153,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
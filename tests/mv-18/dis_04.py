@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -37,23 +50,23 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.5]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.5.t
     res = isinstance(pval, str) and pval == "t"
     if not res:
-        rep is None or rep.append(("unexpected t [.'|'.5.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.5]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected t [.'|'.5.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.5]", lpath))
         return False
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'|'.5]", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'|'.5.v
     # "/./s"
     res = isinstance(pval, str) and len(pval) > 0
     if not res:
-        rep is None or rep.append(("unexpected /./s [.'|'.5.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.5]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected /./s [.'|'.5.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.5]", lpath))
         return False
     return True
 
@@ -72,22 +85,22 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.4]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.4.t
     res = isinstance(pval, str) and pval == "s"
     if not res:
-        rep is None or rep.append(("unexpected s [.'|'.4.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.4]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected s [.'|'.4.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.4]", lpath))
         return False
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'|'.4]", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'|'.4.v
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.4.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.4]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.4.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.4]", lpath))
         return False
     return True
 
@@ -106,22 +119,22 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.3]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.3.t
     res = isinstance(pval, float) and pval == 0.0
     if not res:
-        rep is None or rep.append(("unexpected =0.0 [.'|'.3.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =0.0 [.'|'.3.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.3]", lpath))
         return False
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'|'.3]", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'|'.3.v
     res = isinstance(pval, float) and pval >= 0.0
     if not res:
-        rep is None or rep.append(("not a 0.0 strict float [.'|'.3.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0.0 strict float [.'|'.3.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.3]", lpath))
         return False
     return True
 
@@ -140,22 +153,22 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.2]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.2.t
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 0
     if not res:
-        rep is None or rep.append(("unexpected =0 [.'|'.2.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =0 [.'|'.2.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.2]", lpath))
         return False
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'|'.2]", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'|'.2.v
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'|'.2.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'|'.2.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.2]", lpath))
         return False
     return True
 
@@ -174,22 +187,22 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.1]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.1.t
     res = isinstance(pval, bool) and pval == True
     if not res:
-        rep is None or rep.append(("unexpected =true [.'|'.1.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =true [.'|'.1.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath))
         return False
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'|'.1]", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'|'.1.v
     res = isinstance(pval, bool)
     if not res:
-        rep is None or rep.append(("not a bool [.'|'.1.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a bool [.'|'.1.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.1]", lpath))
         return False
     return True
 
@@ -208,22 +221,22 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.0]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.0.t
     res = pval is None
     if not res:
-        rep is None or rep.append(("unexpected =null [.'|'.0.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =null [.'|'.0.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath))
         return False
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'|'.0]", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'|'.0.v
     res = pval is None
     if not res:
-        rep is None or rep.append(("not null [.'|'.0.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not null [.'|'.0.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'|'.0]", lpath))
         return False
     return True
 
@@ -287,5 +300,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -38,22 +51,22 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("hello", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <hello> [.]", path))
         return False
-    lpath = (path + [ "hello" ]) if path is not None else None
+    lpath = (path, "hello") if path is not None else None
     # .hello
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.hello]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <hello> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.hello]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <hello> [.]", lpath))
         return False
     if not ((pval := val.get("world", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <world> [.]", path))
         return False
-    lpath = (path + [ "world" ]) if path is not None else None
+    lpath = (path, "world") if path is not None else None
     # .world
     res = isinstance(pval, bool)
     if not res:
-        rep is None or rep.append(("not a bool [.world]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <world> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("not a bool [.world]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <world> [.]", lpath))
         return False
     return True
 
@@ -79,5 +92,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -38,22 +51,22 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("name", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <name> [.]", path))
         return False
-    lpath = (path + [ "name" ]) if path is not None else None
+    lpath = (path, "name") if path is not None else None
     # .name
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.name]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <name> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.name]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <name> [.]", lpath))
         return False
     if not ((pval := val.get("age", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <age> [.]", path))
         return False
-    lpath = (path + [ "age" ]) if path is not None else None
+    lpath = (path, "age") if path is not None else None
     # .age
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.age]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <age> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.age]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <age> [.]", lpath))
         return False
     return True
 
@@ -79,5 +92,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
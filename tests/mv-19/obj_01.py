@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 _jm_re_0_reco: object
@@ -45,15 +58,15 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "foo":
             # handle must foo property
             must_count += 1
             # .foo
-            res = is_valid_date(pval, lpath_0 if path is not None else None, rep)
+            res = is_valid_date(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $DATE [.foo]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.foo]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $DATE [.foo]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.foo]", lpath_0))
                 return False
             continue
         if prop == "bla":
@@ -61,30 +74,30 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .bla
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.bla]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.bla]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a bool [.bla]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.bla]", lpath_0))
                 return False
             continue
-        if json_model_2(prop, lpath_0 if path is not None else None, rep):
+        if json_model_2(prop, lpath_0, rep):
             # handle 1 key props
             # .'$Xxx'
             res = isinstance(pval, float) and pval >= 0.0
             if not res:
-                rep is None or rep.append(("not a 0.0 strict float [.'$Xxx']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0.0 strict float [.'$Xxx']", lpath_0))
                 return False
         elif _jm_re_0(prop, path, rep):
             # handle 1 re props
             # .'/^[0-9]+$/'
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'/^[0-9]+$/']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'/^[0-9]+$/']", lpath_0))
                 return False
         else:
             # handle other props
             # .''
             res = pval is None
             if not res:
-                rep is None or rep.append(("not null [.'']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not null [.'']", lpath_0))
                 return False
     if must_count != 1:
         if rep is not None:
@@ -124,5 +137,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -34,16 +47,16 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if _jm_re_0(prop, path, rep):
             # handle 1 re props
             # .'/^[A-Z]$/'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'/^[A-Z]$/']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'/^[A-Z]$/']", lpath_0))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.]", lpath_0))
             return False
     return True
 
@@ -75,5 +88,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
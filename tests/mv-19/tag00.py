@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: ConstMap = ConstMap()
 check_model_map: PropMap
@@ -39,22 +52,22 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'$Aa']", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'$Aa'.t
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 1
     if not res:
-        rep is None or rep.append(("unexpected =1 [.'$Aa'.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$Aa']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =1 [.'$Aa'.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$Aa']", lpath))
         return False
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'$Aa']", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'$Aa'.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$Aa'.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'$Aa']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$Aa'.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'$Aa']", lpath))
         return False
     return True
 
@@ -74,22 +87,22 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'$Bb']", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'$Bb'.t
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 2
     if not res:
-        rep is None or rep.append(("unexpected =2 [.'$Bb'.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$Bb']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =2 [.'$Bb'.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$Bb']", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.'$Bb']", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .'$Bb'.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$Bb'.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'$Bb']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$Bb'.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'$Bb']", lpath))
         return False
     return True
 
@@ -143,5 +156,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: ConstMap = ConstMap()
 check_model_map: PropMap
@@ -38,22 +51,22 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.'|'.0]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .'|'.0.d
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 1
     if not res:
-        rep is None or rep.append(("unexpected =1 [.'|'.0.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =1 [.'|'.0.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.0]", lpath))
         return False
     if not ((pval := val.get("val", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <val> [.'|'.0]", path))
         return False
-    lpath = (path + [ "val" ]) if path is not None else None
+    lpath = (path, "val") if path is not None else None
     # .'|'.0.val
     res = isinstance(pval, int) and not isinstance(pval, bool)
     if not res:
-        rep is None or rep.append(("not a -1 strict int [.'|'.0.val]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <val> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a -1 strict int [.'|'.0.val]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <val> [.'|'.0]", lpath))
         return False
     return True
 
@@ -72,22 +85,22 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.'|'.1]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .'|'.1.d
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 2
     if not res:
-        rep is None or rep.append(("unexpected =2 [.'|'.1.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =2 [.'|'.1.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.1]", lpath))
         return False
     if not ((pval := val.get("val", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <val> [.'|'.1]", path))
         return False
-    lpath = (path + [ "val" ]) if path is not None else None
+    lpath = (path, "val") if path is not None else None
     # .'|'.1.val
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'|'.1.val]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <val> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.1.val]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <val> [.'|'.1]", lpath))
         return False
     return True
 
@@ -106,22 +119,22 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.'|'.2]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .'|'.2.d
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 3
     if not res:
-        rep is None or rep.append(("unexpected =3 [.'|'.2.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =3 [.'|'.2.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.2]", lpath))
         return False
     if not ((pval := val.get("val", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <val> [.'|'.2]", path))
         return False
-    lpath = (path + [ "val" ]) if path is not None else None
+    lpath = (path, "val") if path is not None else None
     # .'|'.2.val
     res = isinstance(pval, bool)
     if not res:
-        rep is None or rep.append(("not a bool [.'|'.2.val]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <val> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("not a bool [.'|'.2.val]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <val> [.'|'.2]", lpath))
         return False
     return True
 
@@ -175,5 +188,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
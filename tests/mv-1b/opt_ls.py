@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -39,22 +52,22 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("i", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <i> [.]", path))
         return False
-    lpath = (path + [ "i" ]) if path is not None else None
+    lpath = (path, "i") if path is not None else None
     # .i
     res = (isinstance(pval, int) and not isinstance(pval, bool) or isinstance(pval, float) and pval == int(pval))
     if not res:
-        rep is None or rep.append(("not a -1 loose int [.i]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <i> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("not a -1 loose int [.i]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <i> [.]", lpath))
         return False
     if not ((pval := val.get("f", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <f> [.]", path))
         return False
-    lpath = (path + [ "f" ]) if path is not None else None
+    lpath = (path, "f") if path is not None else None
     # .f
     res = isinstance(pval, float)
     if not res:
-        rep is None or rep.append(("not a -1.0 strict float [.f]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <f> [.]", lpath if path is not None else None))
+        rep is None or rep.append(("not a -1.0 strict float [.f]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <f> [.]", lpath))
         return False
     return True
 
@@ -80,5 +93,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
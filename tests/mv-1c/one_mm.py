@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -31,15 +44,15 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "must":
             # handle must must property
             must_count += 1
             # .must
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.must]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.must]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.must]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.must]", lpath_0))
                 return False
             continue
         if prop == "may":
@@ -47,11 +60,11 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .may
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.may]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.may]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a bool [.may]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.may]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.]", lpath_0))
         return False
     if must_count != 1:
         if rep is not None:
@@ -82,5 +95,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -82,12 +95,12 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#OpenAPI'.webhooks.''
-        res = json_model_12(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_12(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $PathItem [.'$openapi#OpenAPI'.webhooks.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $PathItem [.'$openapi#OpenAPI'.webhooks.'']", lpath_1))
             return False
     return True
 
@@ -100,15 +113,15 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "info":
             # handle must info property
             must_count += 1
             # .'$openapi#OpenAPI'.info
-            res = json_model_5(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_5(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Info [.'$openapi#OpenAPI'.info]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OpenAPI'.info]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Info [.'$openapi#OpenAPI'.info]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OpenAPI'.info]", lpath_0))
                 return False
             continue
         elif prop == "openapi":
@@ -116,10 +129,10 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             must_count += 1
             # .'$openapi#OpenAPI'.openapi
             # "/^3\\.1\\.\\d+(-.+)?$/"
-            res = isinstance(pval, str) and _jm_re_0(pval, lpath_0 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_0(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^3\\.1\\.\\d+(-.+)?$/ [.'$openapi#OpenAPI'.openapi]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OpenAPI'.openapi]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected /^3\\.1\\.\\d+(-.+)?$/ [.'$openapi#OpenAPI'.openapi]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OpenAPI'.openapi]", lpath_0))
                 return False
             continue
         if prop == "tags":
@@ -128,24 +141,24 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_0_idx, arr_0_item in enumerate(pval):
-                    arr_0_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_0_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                    arr_0_lpath: Path = (lpath_0, arr_0_idx) if lpath_0 is not None else None
                     # .'$openapi#OpenAPI'.tags.0
-                    res = json_model_31(arr_0_item, arr_0_lpath if (lpath_0 if path is not None else None) is not None else None, rep)
+                    res = json_model_31(arr_0_item, arr_0_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $Tag [.'$openapi#OpenAPI'.tags.0]", arr_0_lpath if (lpath_0 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $Tag [.'$openapi#OpenAPI'.tags.0]", arr_0_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$openapi#OpenAPI'.tags]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.tags]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$openapi#OpenAPI'.tags]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.tags]", lpath_0))
                 return False
             continue
         elif prop == "paths":
             # handle may paths property
             # .'$openapi#OpenAPI'.paths
-            res = json_model_11(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_11(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Paths [.'$openapi#OpenAPI'.paths]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.paths]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Paths [.'$openapi#OpenAPI'.paths]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.paths]", lpath_0))
                 return False
             continue
         elif prop == "servers":
@@ -154,15 +167,15 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_1_idx, arr_1_item in enumerate(pval):
-                    arr_1_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_1_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                    arr_1_lpath: Path = (lpath_0, arr_1_idx) if lpath_0 is not None else None
                     # .'$openapi#OpenAPI'.servers.0
-                    res = json_model_8(arr_1_item, arr_1_lpath if (lpath_0 if path is not None else None) is not None else None, rep)
+                    res = json_model_8(arr_1_item, arr_1_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $Server [.'$openapi#OpenAPI'.servers.0]", arr_1_lpath if (lpath_0 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $Server [.'$openapi#OpenAPI'.servers.0]", arr_1_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$openapi#OpenAPI'.servers]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.servers]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$openapi#OpenAPI'.servers]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.servers]", lpath_0))
                 return False
             continue
         elif prop == "security":
@@ -171,51 +184,51 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_2_idx, arr_2_item in enumerate(pval):
-                    arr_2_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_2_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                    arr_2_lpath: Path = (lpath_0, arr_2_idx) if lpath_0 is not None else None
                     # .'$openapi#OpenAPI'.security.0
-                    res = json_model_45(arr_2_item, arr_2_lpath if (lpath_0 if path is not None else None) is not None else None, rep)
+                    res = json_model_45(arr_2_item, arr_2_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $SecurityRequirement [.'$openapi#OpenAPI'.security.0]", arr_2_lpath if (lpath_0 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $SecurityRequirement [.'$openapi#OpenAPI'.security.0]", arr_2_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$openapi#OpenAPI'.security]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.security]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$openapi#OpenAPI'.security]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.security]", lpath_0))
                 return False
             continue
         elif prop == "webhooks":
             # handle may webhooks property
             # .'$openapi#OpenAPI'.webhooks
-            res = _jm_obj_0(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#OpenAPI'.webhooks]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.webhooks]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#OpenAPI'.webhooks]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.webhooks]", lpath_0))
                 return False
             continue
         elif prop == "components":
             # handle may components property
             # .'$openapi#OpenAPI'.components
-            res = json_model_10(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_10(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Components [.'$openapi#OpenAPI'.components]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.components]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Components [.'$openapi#OpenAPI'.components]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.components]", lpath_0))
                 return False
             continue
         elif prop == "externalDocs":
             # handle may externalDocs property
             # .'$openapi#OpenAPI'.externalDocs
-            res = json_model_14(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_14(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $ExternalDocumentation [.'$openapi#OpenAPI'.externalDocs]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.externalDocs]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $ExternalDocumentation [.'$openapi#OpenAPI'.externalDocs]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.externalDocs]", lpath_0))
                 return False
             continue
         elif prop == "jsonModelVersion":
             # handle may jsonModelVersion property
             # .'$openapi#OpenAPI'.jsonModelVersion
-            res = is_valid_url(pval, lpath_0 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$openapi#OpenAPI'.jsonModelVersion]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.jsonModelVersion]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$openapi#OpenAPI'.jsonModelVersion]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OpenAPI'.jsonModelVersion]", lpath_0))
                 return False
             continue
         if prop.startswith("x-"):
@@ -223,7 +236,7 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#OpenAPI'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#OpenAPI']", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#OpenAPI']", lpath_0))
             return False
     if must_count != 2:
         if rep is not None:
@@ -243,15 +256,15 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "title":
             # handle must title property
             must_count += 1
             # .'$openapi#Info'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Info'.title]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Info'.title]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Info'.title]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Info'.title]", lpath_2))
                 return False
             continue
         elif prop == "version":
@@ -260,26 +273,26 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Info'.version
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Info'.version]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Info'.version]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Info'.version]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Info'.version]", lpath_2))
                 return False
             continue
         if prop == "contact":
             # handle may contact property
             # .'$openapi#Info'.contact
-            res = json_model_6(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Contact [.'$openapi#Info'.contact]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.contact]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $Contact [.'$openapi#Info'.contact]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.contact]", lpath_2))
                 return False
             continue
         elif prop == "license":
             # handle may license property
             # .'$openapi#Info'.license
-            res = json_model_7(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $License [.'$openapi#Info'.license]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.license]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $License [.'$openapi#Info'.license]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.license]", lpath_2))
                 return False
             continue
         elif prop == "summary":
@@ -287,8 +300,8 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Info'.summary
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Info'.summary]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.summary]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Info'.summary]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.summary]", lpath_2))
                 return False
             continue
         elif prop == "description":
@@ -296,8 +309,8 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Info'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Info'.description]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.description]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Info'.description]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.description]", lpath_2))
                 return False
             continue
         elif prop == "termsOfService":
@@ -305,8 +318,8 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Info'.termsOfService
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Info'.termsOfService]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.termsOfService]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Info'.termsOfService]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Info'.termsOfService]", lpath_2))
                 return False
             continue
         if prop.startswith("x-"):
@@ -314,7 +327,7 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Info'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Info']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Info']", lpath_2))
             return False
     if must_count != 2:
         if rep is not None:
@@ -333,14 +346,14 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "url":
             # handle may url property
             # .'$openapi#Contact'.url
-            res = is_valid_url(pval, lpath_3 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$openapi#Contact'.url]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Contact'.url]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$openapi#Contact'.url]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Contact'.url]", lpath_3))
                 return False
             continue
         elif prop == "name":
@@ -348,8 +361,8 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Contact'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Contact'.name]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Contact'.name]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Contact'.name]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Contact'.name]", lpath_3))
                 return False
             continue
         elif prop == "email":
@@ -357,8 +370,8 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Contact'.email
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Contact'.email]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Contact'.email]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Contact'.email]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Contact'.email]", lpath_3))
                 return False
             continue
         if prop.startswith("x-"):
@@ -366,7 +379,7 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Contact'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Contact']", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Contact']", lpath_3))
             return False
     return True
 
@@ -379,15 +392,15 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "url":
             # handle must url property
             must_count += 1
             # .'$openapi#License'.'|'.1.url
-            res = is_valid_url(pval, lpath_4 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$openapi#License'.'|'.1.url]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#License'.'|'.1.url]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$openapi#License'.'|'.1.url]", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#License'.'|'.1.url]", lpath_4))
                 return False
             continue
         elif prop == "name":
@@ -396,8 +409,8 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#License'.'|'.1.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#License'.'|'.1.name]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#License'.'|'.1.name]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#License'.'|'.1.name]", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#License'.'|'.1.name]", lpath_4))
                 return False
             continue
         if _jm_re_1(prop, path, rep):
@@ -405,7 +418,7 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#License'.'|'.1.'/^x\\-.*$/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#License'.'|'.1]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#License'.'|'.1]", lpath_4))
             return False
     if must_count != 2:
         if rep is not None:
@@ -424,15 +437,15 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle must name property
             must_count += 1
             # .'$openapi#License'.'|'.0.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#License'.'|'.0.name]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#License'.'|'.0.name]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#License'.'|'.0.name]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#License'.'|'.0.name]", lpath_5))
                 return False
             continue
         elif prop == "identifier":
@@ -441,8 +454,8 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#License'.'|'.0.identifier
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#License'.'|'.0.identifier]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#License'.'|'.0.identifier]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#License'.'|'.0.identifier]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#License'.'|'.0.identifier]", lpath_5))
                 return False
             continue
         if _jm_re_1(prop, path, rep):
@@ -450,7 +463,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#License'.'|'.0.'/^x\\-.*$/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#License'.'|'.0]", lpath_5 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#License'.'|'.0]", lpath_5))
             return False
     if must_count != 2:
         if rep is not None:
@@ -489,12 +502,12 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Server'.variables.''
-        res = json_model_9(pval, lpath_7 if path is not None else None, rep)
+        res = json_model_9(pval, lpath_7, rep)
         if not res:
-            rep is None or rep.append(("unexpected $ServerVariable [.'$openapi#Server'.variables.'']", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected $ServerVariable [.'$openapi#Server'.variables.'']", lpath_7))
             return False
     return True
 
@@ -507,24 +520,24 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "url":
             # handle must url property
             must_count += 1
             # .'$openapi#Server'.url
-            res = is_valid_url(pval, lpath_6 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$openapi#Server'.url]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Server'.url]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$openapi#Server'.url]", lpath_6))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Server'.url]", lpath_6))
                 return False
             continue
         if prop == "variables":
             # handle may variables property
             # .'$openapi#Server'.variables
-            res = _jm_obj_3(pval, lpath_6 if path is not None else None, rep)
+            res = _jm_obj_3(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Server'.variables]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Server'.variables]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Server'.variables]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Server'.variables]", lpath_6))
                 return False
             continue
         elif prop == "description":
@@ -532,8 +545,8 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Server'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Server'.description]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Server'.description]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Server'.description]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Server'.description]", lpath_6))
                 return False
             continue
         if prop.startswith("x-"):
@@ -541,7 +554,7 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Server'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Server']", lpath_6 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Server']", lpath_6))
             return False
     if must_count != 1:
         if rep is not None:
@@ -559,15 +572,15 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "default":
             # handle must default property
             must_count += 1
             # .'$openapi#ServerVariable'.default
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#ServerVariable'.default]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#ServerVariable'.default]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#ServerVariable'.default]", lpath_8))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#ServerVariable'.default]", lpath_8))
                 return False
             continue
         if prop == "enum":
@@ -576,15 +589,15 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_3_idx, arr_3_item in enumerate(pval):
-                    arr_3_lpath: Path = ((lpath_8 if path is not None else None) + [ arr_3_idx ]) if (lpath_8 if path is not None else None) is not None else None
+                    arr_3_lpath: Path = (lpath_8, arr_3_idx) if lpath_8 is not None else None
                     # .'$openapi#ServerVariable'.enum.0
                     res = isinstance(arr_3_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$openapi#ServerVariable'.enum.0]", arr_3_lpath if (lpath_8 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$openapi#ServerVariable'.enum.0]", arr_3_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$openapi#ServerVariable'.enum]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#ServerVariable'.enum]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$openapi#ServerVariable'.enum]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#ServerVariable'.enum]", lpath_8))
                 return False
             continue
         elif prop == "description":
@@ -592,8 +605,8 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#ServerVariable'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#ServerVariable'.description]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#ServerVariable'.description]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#ServerVariable'.description]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#ServerVariable'.description]", lpath_8))
                 return False
             continue
         if prop.startswith("x-"):
@@ -601,7 +614,7 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#ServerVariable'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#ServerVariable']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#ServerVariable']", lpath_8))
             return False
     if must_count != 1:
         if rep is not None:
@@ -617,21 +630,21 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.links.''
         # .'$openapi#Components'.links.''.'|'.0
-        res = json_model_29(pval, lpath_10 if path is not None else None, rep)
+        res = json_model_29(pval, lpath_10, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Link [.'$openapi#Components'.links.''.'|'.0]", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected $Link [.'$openapi#Components'.links.''.'|'.0]", lpath_10))
             # .'$openapi#Components'.links.''.'|'.1
-            res = json_model_32(pval, lpath_10 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.links.''.'|'.1]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.links.''.'|'.1]", lpath_10))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Components'.links.''.'|']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Components'.links.''.'|']", lpath_10))
             return False
     return True
 
@@ -642,12 +655,12 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.models.''
-        res = json_model_97(pval, lpath_11 if path is not None else None, rep)
+        res = json_model_97(pval, lpath_11, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Model [.'$openapi#Components'.models.'']", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected $Model [.'$openapi#Components'.models.'']", lpath_11))
             return False
     return True
 
@@ -658,21 +671,21 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.headers.''
         # .'$openapi#Components'.headers.''.'|'.0
-        res = json_model_30(pval, lpath_12 if path is not None else None, rep)
+        res = json_model_30(pval, lpath_12, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Header [.'$openapi#Components'.headers.''.'|'.0]", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected $Header [.'$openapi#Components'.headers.''.'|'.0]", lpath_12))
             # .'$openapi#Components'.headers.''.'|'.1
-            res = json_model_32(pval, lpath_12 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.headers.''.'|'.1]", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.headers.''.'|'.1]", lpath_12))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Components'.headers.''.'|']", lpath_12 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Components'.headers.''.'|']", lpath_12))
             return False
     return True
 
@@ -683,21 +696,21 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.examples.''
         # .'$openapi#Components'.examples.''.'|'.0
-        res = json_model_27(pval, lpath_13 if path is not None else None, rep)
+        res = json_model_27(pval, lpath_13, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Example [.'$openapi#Components'.examples.''.'|'.0]", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected $Example [.'$openapi#Components'.examples.''.'|'.0]", lpath_13))
             # .'$openapi#Components'.examples.''.'|'.1
-            res = json_model_32(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.examples.''.'|'.1]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.examples.''.'|'.1]", lpath_13))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Components'.examples.''.'|']", lpath_13 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Components'.examples.''.'|']", lpath_13))
             return False
     return True
 
@@ -708,21 +721,21 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.callbacks.''
         # .'$openapi#Components'.callbacks.''.'|'.0
-        res = json_model_26(pval, lpath_14 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_14, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Callback [.'$openapi#Components'.callbacks.''.'|'.0]", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected $Callback [.'$openapi#Components'.callbacks.''.'|'.0]", lpath_14))
             # .'$openapi#Components'.callbacks.''.'|'.1
-            res = json_model_32(pval, lpath_14 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.callbacks.''.'|'.1]", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.callbacks.''.'|'.1]", lpath_14))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Components'.callbacks.''.'|']", lpath_14 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Components'.callbacks.''.'|']", lpath_14))
             return False
     return True
 
@@ -733,21 +746,21 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.pathItems.''
         # .'$openapi#Components'.pathItems.''.'|'.0
-        res = json_model_12(pval, lpath_15 if path is not None else None, rep)
+        res = json_model_12(pval, lpath_15, rep)
         if not res:
-            rep is None or rep.append(("unexpected $PathItem [.'$openapi#Components'.pathItems.''.'|'.0]", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected $PathItem [.'$openapi#Components'.pathItems.''.'|'.0]", lpath_15))
             # .'$openapi#Components'.pathItems.''.'|'.1
-            res = json_model_32(pval, lpath_15 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.pathItems.''.'|'.1]", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.pathItems.''.'|'.1]", lpath_15))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Components'.pathItems.''.'|']", lpath_15 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Components'.pathItems.''.'|']", lpath_15))
             return False
     return True
 
@@ -758,21 +771,21 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.responses.''
         # .'$openapi#Components'.responses.''.'|'.0
-        res = json_model_25(pval, lpath_16 if path is not None else None, rep)
+        res = json_model_25(pval, lpath_16, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Response [.'$openapi#Components'.responses.''.'|'.0]", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected $Response [.'$openapi#Components'.responses.''.'|'.0]", lpath_16))
             # .'$openapi#Components'.responses.''.'|'.1
-            res = json_model_32(pval, lpath_16 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.responses.''.'|'.1]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.responses.''.'|'.1]", lpath_16))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Components'.responses.''.'|']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Components'.responses.''.'|']", lpath_16))
             return False
     return True
 
@@ -783,21 +796,21 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.parameters.''
         # .'$openapi#Components'.parameters.''.'|'.0
-        res = json_model_20(pval, lpath_17 if path is not None else None, rep)
+        res = json_model_20(pval, lpath_17, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Parameter [.'$openapi#Components'.parameters.''.'|'.0]", lpath_17 if path is not None else None))
+            rep is None or rep.append(("unexpected $Parameter [.'$openapi#Components'.parameters.''.'|'.0]", lpath_17))
             # .'$openapi#Components'.parameters.''.'|'.1
-            res = json_model_32(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.parameters.''.'|'.1]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.parameters.''.'|'.1]", lpath_17))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Components'.parameters.''.'|']", lpath_17 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Components'.parameters.''.'|']", lpath_17))
             return False
     return True
 
@@ -808,21 +821,21 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.requestBodies.''
         # .'$openapi#Components'.requestBodies.''.'|'.0
-        res = json_model_21(pval, lpath_18 if path is not None else None, rep)
+        res = json_model_21(pval, lpath_18, rep)
         if not res:
-            rep is None or rep.append(("unexpected $RequestBody [.'$openapi#Components'.requestBodies.''.'|'.0]", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected $RequestBody [.'$openapi#Components'.requestBodies.''.'|'.0]", lpath_18))
             # .'$openapi#Components'.requestBodies.''.'|'.1
-            res = json_model_32(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.requestBodies.''.'|'.1]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.requestBodies.''.'|'.1]", lpath_18))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Components'.requestBodies.''.'|']", lpath_18 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Components'.requestBodies.''.'|']", lpath_18))
             return False
     return True
 
@@ -833,21 +846,21 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Components'.securitySchemes.''
         # .'$openapi#Components'.securitySchemes.''.'|'.0
-        res = json_model_42(pval, lpath_19 if path is not None else None, rep)
+        res = json_model_42(pval, lpath_19, rep)
         if not res:
-            rep is None or rep.append(("unexpected $SecurityScheme [.'$openapi#Components'.securitySchemes.''.'|'.0]", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected $SecurityScheme [.'$openapi#Components'.securitySchemes.''.'|'.0]", lpath_19))
             # .'$openapi#Components'.securitySchemes.''.'|'.1
-            res = json_model_32(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.securitySchemes.''.'|'.1]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Components'.securitySchemes.''.'|'.1]", lpath_19))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Components'.securitySchemes.''.'|']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Components'.securitySchemes.''.'|']", lpath_19))
             return False
     return True
 
@@ -859,95 +872,95 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "links":
             # handle may links property
             # .'$openapi#Components'.links
-            res = _jm_obj_4(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_4(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.links]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.links]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.links]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.links]", lpath_9))
                 return False
             continue
         elif prop == "models":
             # handle may models property
             # .'$openapi#Components'.models
-            res = _jm_obj_5(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_5(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.models]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.models]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.models]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.models]", lpath_9))
                 return False
             continue
         elif prop == "headers":
             # handle may headers property
             # .'$openapi#Components'.headers
-            res = _jm_obj_6(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_6(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.headers]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.headers]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.headers]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.headers]", lpath_9))
                 return False
             continue
         elif prop == "examples":
             # handle may examples property
             # .'$openapi#Components'.examples
-            res = _jm_obj_7(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_7(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.examples]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.examples]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.examples]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.examples]", lpath_9))
                 return False
             continue
         elif prop == "callbacks":
             # handle may callbacks property
             # .'$openapi#Components'.callbacks
-            res = _jm_obj_8(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_8(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.callbacks]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.callbacks]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.callbacks]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.callbacks]", lpath_9))
                 return False
             continue
         elif prop == "pathItems":
             # handle may pathItems property
             # .'$openapi#Components'.pathItems
-            res = _jm_obj_9(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_9(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.pathItems]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.pathItems]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.pathItems]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.pathItems]", lpath_9))
                 return False
             continue
         elif prop == "responses":
             # handle may responses property
             # .'$openapi#Components'.responses
-            res = _jm_obj_10(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_10(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.responses]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.responses]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.responses]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.responses]", lpath_9))
                 return False
             continue
         elif prop == "parameters":
             # handle may parameters property
             # .'$openapi#Components'.parameters
-            res = _jm_obj_11(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_11(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.parameters]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.parameters]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.parameters]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.parameters]", lpath_9))
                 return False
             continue
         elif prop == "requestBodies":
             # handle may requestBodies property
             # .'$openapi#Components'.requestBodies
-            res = _jm_obj_12(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_12(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.requestBodies]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.requestBodies]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.requestBodies]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.requestBodies]", lpath_9))
                 return False
             continue
         elif prop == "securitySchemes":
             # handle may securitySchemes property
             # .'$openapi#Components'.securitySchemes
-            res = _jm_obj_13(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Components'.securitySchemes]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.securitySchemes]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Components'.securitySchemes]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Components'.securitySchemes]", lpath_9))
                 return False
             continue
         if prop.startswith("x-"):
@@ -955,7 +968,7 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Components'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Components']", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Components']", lpath_9))
             return False
     return True
 
@@ -967,20 +980,20 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if prop.startswith("/"):
             # handle 2 re props
             # .'$openapi#Paths'.'/^//'
-            res = json_model_12(pval, lpath_20 if path is not None else None, rep)
+            res = json_model_12(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected $PathItem [.'$openapi#Paths'.'/^//']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected $PathItem [.'$openapi#Paths'.'/^//']", lpath_20))
                 return False
         elif prop.startswith("x-"):
             # handle 2 re props
             # .'$openapi#Paths'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Paths']", lpath_20 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Paths']", lpath_20))
             return False
     return True
 
@@ -1006,20 +1019,20 @@ def _jm_f_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_4_idx, arr_4_item in enumerate(val):
-            arr_4_lpath: Path = (path + [ arr_4_idx ]) if path is not None else None
+            arr_4_lpath: Path = (path, arr_4_idx) if path is not None else None
             # .'$openapi#PathItem'.parameters.0
             # .'$openapi#PathItem'.parameters.0.'|'.0
-            res = json_model_20(arr_4_item, arr_4_lpath if path is not None else None, rep)
+            res = json_model_20(arr_4_item, arr_4_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Parameter [.'$openapi#PathItem'.parameters.0.'|'.0]", arr_4_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Parameter [.'$openapi#PathItem'.parameters.0.'|'.0]", arr_4_lpath))
                 # .'$openapi#PathItem'.parameters.0.'|'.1
-                res = json_model_32(arr_4_item, arr_4_lpath if path is not None else None, rep)
+                res = json_model_32(arr_4_item, arr_4_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$openapi#PathItem'.parameters.0.'|'.1]", arr_4_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$openapi#PathItem'.parameters.0.'|'.1]", arr_4_lpath))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$openapi#PathItem'.parameters.0.'|']", arr_4_lpath if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$openapi#PathItem'.parameters.0.'|']", arr_4_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$openapi#PathItem'.parameters]", path))
@@ -1031,11 +1044,11 @@ def _jm_f_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_5_idx, arr_5_item in enumerate(val):
-            arr_5_lpath: Path = (path + [ arr_5_idx ]) if path is not None else None
+            arr_5_lpath: Path = (path, arr_5_idx) if path is not None else None
             # .'$openapi#PathItem'.servers.0
-            res = json_model_13(arr_5_item, arr_5_lpath if path is not None else None, rep)
+            res = json_model_13(arr_5_item, arr_5_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Operation [.'$openapi#PathItem'.servers.0]", arr_5_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Operation [.'$openapi#PathItem'.servers.0]", arr_5_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$openapi#PathItem'.servers]", path))
@@ -1059,11 +1072,11 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         if pfun := json_model_12_map.get(prop):
             # handle 13 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_21 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#PathItem']", lpath_21 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_21, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#PathItem']", lpath_21))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1071,7 +1084,7 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#PathItem'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#PathItem']", lpath_21 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#PathItem']", lpath_21))
             return False
     return True
 
@@ -1083,21 +1096,21 @@ def _jm_f_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Operation'.callbacks.''
         # .'$openapi#Operation'.callbacks.''.'|'.0
-        res = json_model_26(pval, lpath_23 if path is not None else None, rep)
+        res = json_model_26(pval, lpath_23, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Callback [.'$openapi#Operation'.callbacks.''.'|'.0]", lpath_23 if path is not None else None))
+            rep is None or rep.append(("unexpected $Callback [.'$openapi#Operation'.callbacks.''.'|'.0]", lpath_23))
             # .'$openapi#Operation'.callbacks.''.'|'.1
-            res = json_model_32(pval, lpath_23 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Operation'.callbacks.''.'|'.1]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Operation'.callbacks.''.'|'.1]", lpath_23))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Operation'.callbacks.''.'|']", lpath_23 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Operation'.callbacks.''.'|']", lpath_23))
             return False
     return True
 
@@ -1131,20 +1144,20 @@ def _jm_f_9(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_6_idx, arr_6_item in enumerate(val):
-            arr_6_lpath: Path = (path + [ arr_6_idx ]) if path is not None else None
+            arr_6_lpath: Path = (path, arr_6_idx) if path is not None else None
             # .'$openapi#Operation'.parameters.0
             # .'$openapi#Operation'.parameters.0.'|'.0
-            res = json_model_20(arr_6_item, arr_6_lpath if path is not None else None, rep)
+            res = json_model_20(arr_6_item, arr_6_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Parameter [.'$openapi#Operation'.parameters.0.'|'.0]", arr_6_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Parameter [.'$openapi#Operation'.parameters.0.'|'.0]", arr_6_lpath))
                 # .'$openapi#Operation'.parameters.0.'|'.1
-                res = json_model_32(arr_6_item, arr_6_lpath if path is not None else None, rep)
+                res = json_model_32(arr_6_item, arr_6_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$openapi#Operation'.parameters.0.'|'.1]", arr_6_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$openapi#Operation'.parameters.0.'|'.1]", arr_6_lpath))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$openapi#Operation'.parameters.0.'|']", arr_6_lpath if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$openapi#Operation'.parameters.0.'|']", arr_6_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$openapi#Operation'.parameters]", path))
@@ -1173,11 +1186,11 @@ def _jm_f_11(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_7_idx, arr_7_item in enumerate(val):
-            arr_7_lpath: Path = (path + [ arr_7_idx ]) if path is not None else None
+            arr_7_lpath: Path = (path, arr_7_idx) if path is not None else None
             # .'$openapi#Operation'.security.0
-            res = json_model_45(arr_7_item, arr_7_lpath if path is not None else None, rep)
+            res = json_model_45(arr_7_item, arr_7_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $SecurityRequirement [.'$openapi#Operation'.security.0]", arr_7_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $SecurityRequirement [.'$openapi#Operation'.security.0]", arr_7_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$openapi#Operation'.security]", path))
@@ -1189,11 +1202,11 @@ def _jm_f_12(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_8_idx, arr_8_item in enumerate(val):
-            arr_8_lpath: Path = (path + [ arr_8_idx ]) if path is not None else None
+            arr_8_lpath: Path = (path, arr_8_idx) if path is not None else None
             # .'$openapi#Operation'.servers.0
-            res = json_model_8(arr_8_item, arr_8_lpath if path is not None else None, rep)
+            res = json_model_8(arr_8_item, arr_8_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Server [.'$openapi#Operation'.servers.0]", arr_8_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Server [.'$openapi#Operation'.servers.0]", arr_8_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$openapi#Operation'.servers]", path))
@@ -1213,11 +1226,11 @@ def _jm_f_14(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_9_idx, arr_9_item in enumerate(val):
-            arr_9_lpath: Path = (path + [ arr_9_idx ]) if path is not None else None
+            arr_9_lpath: Path = (path, arr_9_idx) if path is not None else None
             # .'$openapi#Operation'.tags.0
             res = isinstance(arr_9_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Operation'.tags.0]", arr_9_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Operation'.tags.0]", arr_9_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$openapi#Operation'.tags]", path))
@@ -1233,11 +1246,11 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
+        lpath_22: Path = (path, prop) if path is not None else None
         if pfun := json_model_13_map.get(prop):
             # handle 12 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_22 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Operation']", lpath_22 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_22, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Operation']", lpath_22))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1245,7 +1258,7 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Operation'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Operation']", lpath_22 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Operation']", lpath_22))
             return False
     return True
 
@@ -1258,15 +1271,15 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         if prop == "url":
             # handle must url property
             must_count += 1
             # .'$openapi#ExternalDocumentation'.url
-            res = is_valid_url(pval, lpath_24 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_24, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$openapi#ExternalDocumentation'.url]", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#ExternalDocumentation'.url]", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$openapi#ExternalDocumentation'.url]", lpath_24))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#ExternalDocumentation'.url]", lpath_24))
                 return False
             continue
         if prop == "description":
@@ -1274,8 +1287,8 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#ExternalDocumentation'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#ExternalDocumentation'.description]", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#ExternalDocumentation'.description]", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#ExternalDocumentation'.description]", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#ExternalDocumentation'.description]", lpath_24))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1283,7 +1296,7 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#ExternalDocumentation'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#ExternalDocumentation']", lpath_24 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#ExternalDocumentation']", lpath_24))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1300,12 +1313,12 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_26: Path = (path + [ prop ]) if path is not None else None
+        lpath_26: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Parameter'.'|'.1.content.''
-        res = json_model_22(pval, lpath_26 if path is not None else None, rep)
+        res = json_model_22(pval, lpath_26, rep)
         if not res:
-            rep is None or rep.append(("unexpected $MediaType [.'$openapi#Parameter'.'|'.1.content.'']", lpath_26 if path is not None else None))
+            rep is None or rep.append(("unexpected $MediaType [.'$openapi#Parameter'.'|'.1.content.'']", lpath_26))
             return False
     return True
 
@@ -1317,15 +1330,15 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         if prop == "in":
             # handle must in property
             must_count += 1
             # .'$openapi#Parameter'.'|'.1.in
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_0
             if not res:
-                rep is None or rep.append(("value not in enum [.'$openapi#Parameter'.'|'.1.in.'|']", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Parameter'.'|'.1.in]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.'$openapi#Parameter'.'|'.1.in.'|']", lpath_25))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Parameter'.'|'.1.in]", lpath_25))
                 return False
             continue
         elif prop == "name":
@@ -1334,17 +1347,17 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.1.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Parameter'.'|'.1.name]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Parameter'.'|'.1.name]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Parameter'.'|'.1.name]", lpath_25))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Parameter'.'|'.1.name]", lpath_25))
                 return False
             continue
         if prop == "content":
             # handle may content property
             # .'$openapi#Parameter'.'|'.1.content
-            res = _jm_obj_15(pval, lpath_25 if path is not None else None, rep)
+            res = _jm_obj_15(pval, lpath_25, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Parameter'.'|'.1.content]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.content]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Parameter'.'|'.1.content]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.content]", lpath_25))
                 return False
             continue
         elif prop == "required":
@@ -1352,8 +1365,8 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.1.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.1.required]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.required]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.1.required]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.required]", lpath_25))
                 return False
             continue
         elif prop == "deprecated":
@@ -1361,8 +1374,8 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.1.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.1.deprecated]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.deprecated]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.1.deprecated]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.deprecated]", lpath_25))
                 return False
             continue
         elif prop == "description":
@@ -1370,8 +1383,8 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.1.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Parameter'.'|'.1.description]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.description]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Parameter'.'|'.1.description]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.description]", lpath_25))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -1379,8 +1392,8 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.1.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.1.allowEmptyValue]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.allowEmptyValue]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.1.allowEmptyValue]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.1.allowEmptyValue]", lpath_25))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1388,7 +1401,7 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.1.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Parameter'.'|'.1]", lpath_25 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Parameter'.'|'.1]", lpath_25))
             return False
     if must_count != 2:
         if rep is not None:
@@ -1407,21 +1420,21 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_28: Path = (path + [ prop ]) if path is not None else None
+        lpath_28: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Parameter'.'|'.0.examples.''
         # .'$openapi#Parameter'.'|'.0.examples.''.'|'.0
-        res = json_model_27(pval, lpath_28 if path is not None else None, rep)
+        res = json_model_27(pval, lpath_28, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Example [.'$openapi#Parameter'.'|'.0.examples.''.'|'.0]", lpath_28 if path is not None else None))
+            rep is None or rep.append(("unexpected $Example [.'$openapi#Parameter'.'|'.0.examples.''.'|'.0]", lpath_28))
             # .'$openapi#Parameter'.'|'.0.examples.''.'|'.1
-            res = json_model_32(pval, lpath_28 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_28, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Parameter'.'|'.0.examples.''.'|'.1]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Parameter'.'|'.0.examples.''.'|'.1]", lpath_28))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Parameter'.'|'.0.examples.''.'|']", lpath_28 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Parameter'.'|'.0.examples.''.'|']", lpath_28))
             return False
     return True
 
@@ -1433,15 +1446,15 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_27: Path = (path + [ prop ]) if path is not None else None
+        lpath_27: Path = (path, prop) if path is not None else None
         if prop == "in":
             # handle must in property
             must_count += 1
             # .'$openapi#Parameter'.'|'.0.in
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_1
             if not res:
-                rep is None or rep.append(("value not in enum [.'$openapi#Parameter'.'|'.0.in.'|']", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Parameter'.'|'.0.in]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.'$openapi#Parameter'.'|'.0.in.'|']", lpath_27))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Parameter'.'|'.0.in]", lpath_27))
                 return False
             continue
         elif prop == "name":
@@ -1450,26 +1463,26 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.0.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Parameter'.'|'.0.name]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Parameter'.'|'.0.name]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Parameter'.'|'.0.name]", lpath_27))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Parameter'.'|'.0.name]", lpath_27))
                 return False
             continue
         if prop == "model":
             # handle may model property
             # .'$openapi#Parameter'.'|'.0.model
-            res = json_model_97(pval, lpath_27 if path is not None else None, rep)
+            res = json_model_97(pval, lpath_27, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$openapi#Parameter'.'|'.0.model]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.model]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$openapi#Parameter'.'|'.0.model]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.model]", lpath_27))
                 return False
             continue
         elif prop == "style":
             # handle may style property
             # .'$openapi#Parameter'.'|'.0.style
-            res = json_model_17(pval, lpath_27 if path is not None else None, rep)
+            res = json_model_17(pval, lpath_27, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Style [.'$openapi#Parameter'.'|'.0.style]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.style]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected $Style [.'$openapi#Parameter'.'|'.0.style]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.style]", lpath_27))
                 return False
             continue
         elif prop == "example":
@@ -1482,17 +1495,17 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.0.explode
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.explode]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.explode]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.explode]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.explode]", lpath_27))
                 return False
             continue
         elif prop == "examples":
             # handle may examples property
             # .'$openapi#Parameter'.'|'.0.examples
-            res = _jm_obj_17(pval, lpath_27 if path is not None else None, rep)
+            res = _jm_obj_17(pval, lpath_27, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Parameter'.'|'.0.examples]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.examples]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Parameter'.'|'.0.examples]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.examples]", lpath_27))
                 return False
             continue
         elif prop == "required":
@@ -1500,8 +1513,8 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.0.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.required]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.required]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.required]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.required]", lpath_27))
                 return False
             continue
         elif prop == "deprecated":
@@ -1509,8 +1522,8 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.0.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.deprecated]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.deprecated]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.deprecated]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.deprecated]", lpath_27))
                 return False
             continue
         elif prop == "description":
@@ -1518,8 +1531,8 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Parameter'.'|'.0.description]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.description]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Parameter'.'|'.0.description]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.description]", lpath_27))
                 return False
             continue
         elif prop == "allowReserved":
@@ -1527,8 +1540,8 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.0.allowReserved
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.allowReserved]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.allowReserved]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.allowReserved]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.allowReserved]", lpath_27))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -1536,8 +1549,8 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.0.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.allowEmptyValue]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.allowEmptyValue]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Parameter'.'|'.0.allowEmptyValue]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Parameter'.'|'.0.allowEmptyValue]", lpath_27))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1545,7 +1558,7 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Parameter'.'|'.0.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Parameter'.'|'.0]", lpath_27 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Parameter'.'|'.0]", lpath_27))
             return False
     if must_count != 2:
         if rep is not None:
@@ -1594,12 +1607,12 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_30: Path = (path + [ prop ]) if path is not None else None
+        lpath_30: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#RequestBody'.content.''
-        res = json_model_22(pval, lpath_30 if path is not None else None, rep)
+        res = json_model_22(pval, lpath_30, rep)
         if not res:
-            rep is None or rep.append(("unexpected $MediaType [.'$openapi#RequestBody'.content.'']", lpath_30 if path is not None else None))
+            rep is None or rep.append(("unexpected $MediaType [.'$openapi#RequestBody'.content.'']", lpath_30))
             return False
     return True
 
@@ -1611,14 +1624,14 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_29: Path = (path + [ prop ]) if path is not None else None
+        lpath_29: Path = (path, prop) if path is not None else None
         if prop == "content":
             # handle may content property
             # .'$openapi#RequestBody'.content
-            res = _jm_obj_18(pval, lpath_29 if path is not None else None, rep)
+            res = _jm_obj_18(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#RequestBody'.content]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#RequestBody'.content]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#RequestBody'.content]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#RequestBody'.content]", lpath_29))
                 return False
             continue
         elif prop == "required":
@@ -1626,8 +1639,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#RequestBody'.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#RequestBody'.required]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#RequestBody'.required]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#RequestBody'.required]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#RequestBody'.required]", lpath_29))
                 return False
             continue
         elif prop == "description":
@@ -1635,8 +1648,8 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#RequestBody'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#RequestBody'.description]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#RequestBody'.description]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#RequestBody'.description]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#RequestBody'.description]", lpath_29))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1644,7 +1657,7 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#RequestBody'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#RequestBody']", lpath_29 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#RequestBody']", lpath_29))
             return False
     return True
 
@@ -1655,12 +1668,12 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_32: Path = (path + [ prop ]) if path is not None else None
+        lpath_32: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#MediaType'.encoding.''
-        res = json_model_23(pval, lpath_32 if path is not None else None, rep)
+        res = json_model_23(pval, lpath_32, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Encoding [.'$openapi#MediaType'.encoding.'']", lpath_32 if path is not None else None))
+            rep is None or rep.append(("unexpected $Encoding [.'$openapi#MediaType'.encoding.'']", lpath_32))
             return False
     return True
 
@@ -1671,21 +1684,21 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_33: Path = (path + [ prop ]) if path is not None else None
+        lpath_33: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#MediaType'.examples.''
         # .'$openapi#MediaType'.examples.''.'|'.0
-        res = json_model_27(pval, lpath_33 if path is not None else None, rep)
+        res = json_model_27(pval, lpath_33, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Example [.'$openapi#MediaType'.examples.''.'|'.0]", lpath_33 if path is not None else None))
+            rep is None or rep.append(("unexpected $Example [.'$openapi#MediaType'.examples.''.'|'.0]", lpath_33))
             # .'$openapi#MediaType'.examples.''.'|'.1
-            res = json_model_32(pval, lpath_33 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_33, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#MediaType'.examples.''.'|'.1]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#MediaType'.examples.''.'|'.1]", lpath_33))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#MediaType'.examples.''.'|']", lpath_33 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#MediaType'.examples.''.'|']", lpath_33))
             return False
     return True
 
@@ -1697,14 +1710,14 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_31: Path = (path + [ prop ]) if path is not None else None
+        lpath_31: Path = (path, prop) if path is not None else None
         if prop == "model":
             # handle may model property
             # .'$openapi#MediaType'.model
-            res = json_model_97(pval, lpath_31 if path is not None else None, rep)
+            res = json_model_97(pval, lpath_31, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$openapi#MediaType'.model]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#MediaType'.model]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$openapi#MediaType'.model]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#MediaType'.model]", lpath_31))
                 return False
             continue
         elif prop == "example":
@@ -1715,19 +1728,19 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
         elif prop == "encoding":
             # handle may encoding property
             # .'$openapi#MediaType'.encoding
-            res = _jm_obj_19(pval, lpath_31 if path is not None else None, rep)
+            res = _jm_obj_19(pval, lpath_31, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#MediaType'.encoding]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#MediaType'.encoding]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#MediaType'.encoding]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#MediaType'.encoding]", lpath_31))
                 return False
             continue
         elif prop == "examples":
             # handle may examples property
             # .'$openapi#MediaType'.examples
-            res = _jm_obj_20(pval, lpath_31 if path is not None else None, rep)
+            res = _jm_obj_20(pval, lpath_31, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#MediaType'.examples]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#MediaType'.examples]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#MediaType'.examples]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#MediaType'.examples]", lpath_31))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1735,7 +1748,7 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#MediaType'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#MediaType']", lpath_31 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#MediaType']", lpath_31))
             return False
     return True
 
@@ -1746,21 +1759,21 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_35: Path = (path + [ prop ]) if path is not None else None
+        lpath_35: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Encoding'.headers.''
         # .'$openapi#Encoding'.headers.''.'|'.0
-        res = json_model_30(pval, lpath_35 if path is not None else None, rep)
+        res = json_model_30(pval, lpath_35, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Header [.'$openapi#Encoding'.headers.''.'|'.0]", lpath_35 if path is not None else None))
+            rep is None or rep.append(("unexpected $Header [.'$openapi#Encoding'.headers.''.'|'.0]", lpath_35))
             # .'$openapi#Encoding'.headers.''.'|'.1
-            res = json_model_32(pval, lpath_35 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Encoding'.headers.''.'|'.1]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Encoding'.headers.''.'|'.1]", lpath_35))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Encoding'.headers.''.'|']", lpath_35 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Encoding'.headers.''.'|']", lpath_35))
             return False
     return True
 
@@ -1772,14 +1785,14 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_34: Path = (path + [ prop ]) if path is not None else None
+        lpath_34: Path = (path, prop) if path is not None else None
         if prop == "style":
             # handle may style property
             # .'$openapi#Encoding'.style
-            res = json_model_17(pval, lpath_34 if path is not None else None, rep)
+            res = json_model_17(pval, lpath_34, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Style [.'$openapi#Encoding'.style]", lpath_34 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.style]", lpath_34 if path is not None else None))
+                rep is None or rep.append(("unexpected $Style [.'$openapi#Encoding'.style]", lpath_34))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.style]", lpath_34))
                 return False
             continue
         elif prop == "explode":
@@ -1787,17 +1800,17 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Encoding'.explode
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Encoding'.explode]", lpath_34 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.explode]", lpath_34 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Encoding'.explode]", lpath_34))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.explode]", lpath_34))
                 return False
             continue
         elif prop == "headers":
             # handle may headers property
             # .'$openapi#Encoding'.headers
-            res = _jm_obj_21(pval, lpath_34 if path is not None else None, rep)
+            res = _jm_obj_21(pval, lpath_34, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Encoding'.headers]", lpath_34 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.headers]", lpath_34 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Encoding'.headers]", lpath_34))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.headers]", lpath_34))
                 return False
             continue
         elif prop == "contentType":
@@ -1805,8 +1818,8 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Encoding'.contentType
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Encoding'.contentType]", lpath_34 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.contentType]", lpath_34 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Encoding'.contentType]", lpath_34))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.contentType]", lpath_34))
                 return False
             continue
         elif prop == "allowReserved":
@@ -1814,8 +1827,8 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Encoding'.allowReserved
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Encoding'.allowReserved]", lpath_34 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.allowReserved]", lpath_34 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Encoding'.allowReserved]", lpath_34))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Encoding'.allowReserved]", lpath_34))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1823,7 +1836,7 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Encoding'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Encoding']", lpath_34 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Encoding']", lpath_34))
             return False
     return True
 
@@ -1836,47 +1849,47 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_36: Path = (path + [ prop ]) if path is not None else None
+        lpath_36: Path = (path, prop) if path is not None else None
         if prop == "default":
             # handle may default property
             # .'$openapi#Responses'.default
             # .'$openapi#Responses'.default.'|'.0
-            res = json_model_25(pval, lpath_36 if path is not None else None, rep)
+            res = json_model_25(pval, lpath_36, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Response [.'$openapi#Responses'.default.'|'.0]", lpath_36 if path is not None else None))
+                rep is None or rep.append(("unexpected $Response [.'$openapi#Responses'.default.'|'.0]", lpath_36))
                 # .'$openapi#Responses'.default.'|'.1
-                res = json_model_32(pval, lpath_36 if path is not None else None, rep)
+                res = json_model_32(pval, lpath_36, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$openapi#Responses'.default.'|'.1]", lpath_36 if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$openapi#Responses'.default.'|'.1]", lpath_36))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$openapi#Responses'.default.'|']", lpath_36 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Responses'.default]", lpath_36 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$openapi#Responses'.default.'|']", lpath_36))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Responses'.default]", lpath_36))
                 return False
             continue
         if _jm_re_2(prop, path, rep):
             # handle 2 re props
             # .'$openapi#Responses'.'/^[1-5](\\d\\d|XX)$/'
             # .'$openapi#Responses'.'/^[1-5](\\d\\d|XX)$/'.'|'.0
-            res = json_model_25(pval, lpath_36 if path is not None else None, rep)
+            res = json_model_25(pval, lpath_36, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Response [.'$openapi#Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|'.0]", lpath_36 if path is not None else None))
+                rep is None or rep.append(("unexpected $Response [.'$openapi#Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|'.0]", lpath_36))
                 # .'$openapi#Responses'.'/^[1-5](\\d\\d|XX)$/'.'|'.1
-                res = json_model_32(pval, lpath_36 if path is not None else None, rep)
+                res = json_model_32(pval, lpath_36, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$openapi#Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|'.1]", lpath_36 if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$openapi#Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|'.1]", lpath_36))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$openapi#Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|']", lpath_36 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$openapi#Responses'.'/^[1-5](\\\\d\\\\d|XX)$/'.'|']", lpath_36))
                 return False
         elif prop.startswith("x-"):
             # handle 2 re props
             # .'$openapi#Responses'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Responses']", lpath_36 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Responses']", lpath_36))
             return False
     return True
 
@@ -1887,21 +1900,21 @@ def _jm_obj_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_38: Path = (path + [ prop ]) if path is not None else None
+        lpath_38: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Response'.links.''
         # .'$openapi#Response'.links.''.'|'.0
-        res = json_model_29(pval, lpath_38 if path is not None else None, rep)
+        res = json_model_29(pval, lpath_38, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Link [.'$openapi#Response'.links.''.'|'.0]", lpath_38 if path is not None else None))
+            rep is None or rep.append(("unexpected $Link [.'$openapi#Response'.links.''.'|'.0]", lpath_38))
             # .'$openapi#Response'.links.''.'|'.1
-            res = json_model_32(pval, lpath_38 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_38, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Response'.links.''.'|'.1]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Response'.links.''.'|'.1]", lpath_38))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Response'.links.''.'|']", lpath_38 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Response'.links.''.'|']", lpath_38))
             return False
     return True
 
@@ -1912,12 +1925,12 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_39: Path = (path + [ prop ]) if path is not None else None
+        lpath_39: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Response'.content.''
-        res = json_model_22(pval, lpath_39 if path is not None else None, rep)
+        res = json_model_22(pval, lpath_39, rep)
         if not res:
-            rep is None or rep.append(("unexpected $MediaType [.'$openapi#Response'.content.'']", lpath_39 if path is not None else None))
+            rep is None or rep.append(("unexpected $MediaType [.'$openapi#Response'.content.'']", lpath_39))
             return False
     return True
 
@@ -1928,21 +1941,21 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_40: Path = (path + [ prop ]) if path is not None else None
+        lpath_40: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Response'.headers.''
         # .'$openapi#Response'.headers.''.'|'.0
-        res = json_model_30(pval, lpath_40 if path is not None else None, rep)
+        res = json_model_30(pval, lpath_40, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Header [.'$openapi#Response'.headers.''.'|'.0]", lpath_40 if path is not None else None))
+            rep is None or rep.append(("unexpected $Header [.'$openapi#Response'.headers.''.'|'.0]", lpath_40))
             # .'$openapi#Response'.headers.''.'|'.1
-            res = json_model_32(pval, lpath_40 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_40, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Response'.headers.''.'|'.1]", lpath_40 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Response'.headers.''.'|'.1]", lpath_40))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Response'.headers.''.'|']", lpath_40 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Response'.headers.''.'|']", lpath_40))
             return False
     return True
 
@@ -1954,32 +1967,32 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_37: Path = (path + [ prop ]) if path is not None else None
+        lpath_37: Path = (path, prop) if path is not None else None
         if prop == "links":
             # handle may links property
             # .'$openapi#Response'.links
-            res = _jm_obj_22(pval, lpath_37 if path is not None else None, rep)
+            res = _jm_obj_22(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Response'.links]", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Response'.links]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Response'.links]", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Response'.links]", lpath_37))
                 return False
             continue
         elif prop == "content":
             # handle may content property
             # .'$openapi#Response'.content
-            res = _jm_obj_23(pval, lpath_37 if path is not None else None, rep)
+            res = _jm_obj_23(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Response'.content]", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Response'.content]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Response'.content]", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Response'.content]", lpath_37))
                 return False
             continue
         elif prop == "headers":
             # handle may headers property
             # .'$openapi#Response'.headers
-            res = _jm_obj_24(pval, lpath_37 if path is not None else None, rep)
+            res = _jm_obj_24(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Response'.headers]", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Response'.headers]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Response'.headers]", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Response'.headers]", lpath_37))
                 return False
             continue
         elif prop == "description":
@@ -1987,8 +2000,8 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Response'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Response'.description]", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Response'.description]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Response'.description]", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Response'.description]", lpath_37))
                 return False
             continue
         if prop.startswith("x-"):
@@ -1996,7 +2009,7 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Response'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Response']", lpath_37 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Response']", lpath_37))
             return False
     return True
 
@@ -2008,29 +2021,29 @@ def json_model_26(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_41: Path = (path + [ prop ]) if path is not None else None
-        if json_model_28(prop, lpath_41 if path is not None else None, rep):
+        lpath_41: Path = (path, prop) if path is not None else None
+        if json_model_28(prop, lpath_41, rep):
             # handle 1 key props
             # .'$openapi#Callback'.'$Expression'
             # .'$openapi#Callback'.'$Expression'.'|'.0
-            res = json_model_12(pval, lpath_41 if path is not None else None, rep)
+            res = json_model_12(pval, lpath_41, rep)
             if not res:
-                rep is None or rep.append(("unexpected $PathItem [.'$openapi#Callback'.'$Expression'.'|'.0]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected $PathItem [.'$openapi#Callback'.'$Expression'.'|'.0]", lpath_41))
                 # .'$openapi#Callback'.'$Expression'.'|'.1
-                res = json_model_32(pval, lpath_41 if path is not None else None, rep)
+                res = json_model_32(pval, lpath_41, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $Reference [.'$openapi#Callback'.'$Expression'.'|'.1]", lpath_41 if path is not None else None))
+                    rep is None or rep.append(("unexpected $Reference [.'$openapi#Callback'.'$Expression'.'|'.1]", lpath_41))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$openapi#Callback'.'$Expression'.'|']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$openapi#Callback'.'$Expression'.'|']", lpath_41))
                 return False
         elif prop.startswith("x-"):
             # handle 1 re props
             # .'$openapi#Callback'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Callback']", lpath_41 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Callback']", lpath_41))
             return False
     return True
 
@@ -2042,7 +2055,7 @@ def json_model_27(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_42: Path = (path + [ prop ]) if path is not None else None
+        lpath_42: Path = (path, prop) if path is not None else None
         if prop == "value":
             # handle may value property
             # .'$openapi#Example'.value
@@ -2053,8 +2066,8 @@ def json_model_27(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Example'.summary
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Example'.summary]", lpath_42 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Example'.summary]", lpath_42 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Example'.summary]", lpath_42))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Example'.summary]", lpath_42))
                 return False
             continue
         elif prop == "description":
@@ -2062,8 +2075,8 @@ def json_model_27(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Example'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Example'.description]", lpath_42 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Example'.description]", lpath_42 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Example'.description]", lpath_42))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Example'.description]", lpath_42))
                 return False
             continue
         elif prop == "externalValue":
@@ -2071,8 +2084,8 @@ def json_model_27(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Example'.externalValue
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Example'.externalValue]", lpath_42 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Example'.externalValue]", lpath_42 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Example'.externalValue]", lpath_42))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Example'.externalValue]", lpath_42))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2080,7 +2093,7 @@ def json_model_27(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Example'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Example']", lpath_42 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Example']", lpath_42))
             return False
     return True
 
@@ -2108,33 +2121,33 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_43: Path = (path + [ prop ]) if path is not None else None
+        lpath_43: Path = (path, prop) if path is not None else None
         if prop == "operationId":
             # handle must operationId property
             must_count += 1
             # .'$openapi#Link'.'|'.1.operationId
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Link'.'|'.1.operationId]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Link'.'|'.1.operationId]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Link'.'|'.1.operationId]", lpath_43))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Link'.'|'.1.operationId]", lpath_43))
                 return False
             continue
         if prop == "server":
             # handle may server property
             # .'$openapi#Link'.'|'.1.server
-            res = json_model_8(pval, lpath_43 if path is not None else None, rep)
+            res = json_model_8(pval, lpath_43, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Server [.'$openapi#Link'.'|'.1.server]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.1.server]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("unexpected $Server [.'$openapi#Link'.'|'.1.server]", lpath_43))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.1.server]", lpath_43))
                 return False
             continue
         elif prop == "parameters":
             # handle may parameters property
             # .'$openapi#Link'.'|'.1.parameters
-            res = _jm_obj_26(pval, lpath_43 if path is not None else None, rep)
+            res = _jm_obj_26(pval, lpath_43, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Link'.'|'.1.parameters]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.1.parameters]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Link'.'|'.1.parameters]", lpath_43))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.1.parameters]", lpath_43))
                 return False
             continue
         elif prop == "description":
@@ -2142,8 +2155,8 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Link'.'|'.1.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Link'.'|'.1.description]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.1.description]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Link'.'|'.1.description]", lpath_43))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.1.description]", lpath_43))
                 return False
             continue
         elif prop == "requestBody":
@@ -2156,7 +2169,7 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Link'.'|'.1.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Link'.'|'.1]", lpath_43 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Link'.'|'.1]", lpath_43))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2181,33 +2194,33 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_44: Path = (path + [ prop ]) if path is not None else None
+        lpath_44: Path = (path, prop) if path is not None else None
         if prop == "operationRef":
             # handle must operationRef property
             must_count += 1
             # .'$openapi#Link'.'|'.0.operationRef
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Link'.'|'.0.operationRef]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Link'.'|'.0.operationRef]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Link'.'|'.0.operationRef]", lpath_44))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Link'.'|'.0.operationRef]", lpath_44))
                 return False
             continue
         if prop == "server":
             # handle may server property
             # .'$openapi#Link'.'|'.0.server
-            res = json_model_8(pval, lpath_44 if path is not None else None, rep)
+            res = json_model_8(pval, lpath_44, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Server [.'$openapi#Link'.'|'.0.server]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.0.server]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected $Server [.'$openapi#Link'.'|'.0.server]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.0.server]", lpath_44))
                 return False
             continue
         elif prop == "parameters":
             # handle may parameters property
             # .'$openapi#Link'.'|'.0.parameters
-            res = _jm_obj_28(pval, lpath_44 if path is not None else None, rep)
+            res = _jm_obj_28(pval, lpath_44, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Link'.'|'.0.parameters]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.0.parameters]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Link'.'|'.0.parameters]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.0.parameters]", lpath_44))
                 return False
             continue
         elif prop == "description":
@@ -2215,8 +2228,8 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Link'.'|'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Link'.'|'.0.description]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.0.description]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Link'.'|'.0.description]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Link'.'|'.0.description]", lpath_44))
                 return False
             continue
         elif prop == "requestBody":
@@ -2229,7 +2242,7 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Link'.'|'.0.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Link'.'|'.0]", lpath_44 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Link'.'|'.0]", lpath_44))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2266,12 +2279,12 @@ def _jm_obj_30(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_46: Path = (path + [ prop ]) if path is not None else None
+        lpath_46: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Header'.'|'.1.content.''
-        res = json_model_22(pval, lpath_46 if path is not None else None, rep)
+        res = json_model_22(pval, lpath_46, rep)
         if not res:
-            rep is None or rep.append(("unexpected $MediaType [.'$openapi#Header'.'|'.1.content.'']", lpath_46 if path is not None else None))
+            rep is None or rep.append(("unexpected $MediaType [.'$openapi#Header'.'|'.1.content.'']", lpath_46))
             return False
     return True
 
@@ -2282,14 +2295,14 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_45: Path = (path + [ prop ]) if path is not None else None
+        lpath_45: Path = (path, prop) if path is not None else None
         if prop == "content":
             # handle may content property
             # .'$openapi#Header'.'|'.1.content
-            res = _jm_obj_30(pval, lpath_45 if path is not None else None, rep)
+            res = _jm_obj_30(pval, lpath_45, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Header'.'|'.1.content]", lpath_45 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.content]", lpath_45 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Header'.'|'.1.content]", lpath_45))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.content]", lpath_45))
                 return False
             continue
         elif prop == "required":
@@ -2297,8 +2310,8 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.1.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.1.required]", lpath_45 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.required]", lpath_45 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.1.required]", lpath_45))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.required]", lpath_45))
                 return False
             continue
         elif prop == "deprecated":
@@ -2306,8 +2319,8 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.1.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.1.deprecated]", lpath_45 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.deprecated]", lpath_45 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.1.deprecated]", lpath_45))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.deprecated]", lpath_45))
                 return False
             continue
         elif prop == "description":
@@ -2315,8 +2328,8 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.1.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Header'.'|'.1.description]", lpath_45 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.description]", lpath_45 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Header'.'|'.1.description]", lpath_45))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.description]", lpath_45))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -2324,8 +2337,8 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.1.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.1.allowEmptyValue]", lpath_45 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.allowEmptyValue]", lpath_45 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.1.allowEmptyValue]", lpath_45))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.1.allowEmptyValue]", lpath_45))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2333,7 +2346,7 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.1.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Header'.'|'.1]", lpath_45 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Header'.'|'.1]", lpath_45))
             return False
     return True
 
@@ -2344,21 +2357,21 @@ def _jm_obj_32(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_48: Path = (path + [ prop ]) if path is not None else None
+        lpath_48: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#Header'.'|'.0.examples.''
         # .'$openapi#Header'.'|'.0.examples.''.'|'.0
-        res = json_model_27(pval, lpath_48 if path is not None else None, rep)
+        res = json_model_27(pval, lpath_48, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Example [.'$openapi#Header'.'|'.0.examples.''.'|'.0]", lpath_48 if path is not None else None))
+            rep is None or rep.append(("unexpected $Example [.'$openapi#Header'.'|'.0.examples.''.'|'.0]", lpath_48))
             # .'$openapi#Header'.'|'.0.examples.''.'|'.1
-            res = json_model_32(pval, lpath_48 if path is not None else None, rep)
+            res = json_model_32(pval, lpath_48, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Reference [.'$openapi#Header'.'|'.0.examples.''.'|'.1]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected $Reference [.'$openapi#Header'.'|'.0.examples.''.'|'.1]", lpath_48))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$openapi#Header'.'|'.0.examples.''.'|']", lpath_48 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$openapi#Header'.'|'.0.examples.''.'|']", lpath_48))
             return False
     return True
 
@@ -2369,23 +2382,23 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_47: Path = (path + [ prop ]) if path is not None else None
+        lpath_47: Path = (path, prop) if path is not None else None
         if prop == "model":
             # handle may model property
             # .'$openapi#Header'.'|'.0.model
-            res = json_model_97(pval, lpath_47 if path is not None else None, rep)
+            res = json_model_97(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$openapi#Header'.'|'.0.model]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.model]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$openapi#Header'.'|'.0.model]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.model]", lpath_47))
                 return False
             continue
         elif prop == "style":
             # handle may style property
             # .'$openapi#Header'.'|'.0.style
-            res = json_model_17(pval, lpath_47 if path is not None else None, rep)
+            res = json_model_17(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Style [.'$openapi#Header'.'|'.0.style]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.style]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected $Style [.'$openapi#Header'.'|'.0.style]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.style]", lpath_47))
                 return False
             continue
         elif prop == "example":
@@ -2398,17 +2411,17 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.0.explode
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.explode]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.explode]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.explode]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.explode]", lpath_47))
                 return False
             continue
         elif prop == "examples":
             # handle may examples property
             # .'$openapi#Header'.'|'.0.examples
-            res = _jm_obj_32(pval, lpath_47 if path is not None else None, rep)
+            res = _jm_obj_32(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#Header'.'|'.0.examples]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.examples]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#Header'.'|'.0.examples]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.examples]", lpath_47))
                 return False
             continue
         elif prop == "required":
@@ -2416,8 +2429,8 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.0.required
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.required]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.required]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.required]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.required]", lpath_47))
                 return False
             continue
         elif prop == "deprecated":
@@ -2425,8 +2438,8 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.0.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.deprecated]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.deprecated]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.deprecated]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.deprecated]", lpath_47))
                 return False
             continue
         elif prop == "description":
@@ -2434,8 +2447,8 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Header'.'|'.0.description]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.description]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Header'.'|'.0.description]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.description]", lpath_47))
                 return False
             continue
         elif prop == "allowReserved":
@@ -2443,8 +2456,8 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.0.allowReserved
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.allowReserved]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.allowReserved]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.allowReserved]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.allowReserved]", lpath_47))
                 return False
             continue
         elif prop == "allowEmptyValue":
@@ -2452,8 +2465,8 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.0.allowEmptyValue
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.allowEmptyValue]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.allowEmptyValue]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#Header'.'|'.0.allowEmptyValue]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Header'.'|'.0.allowEmptyValue]", lpath_47))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2461,7 +2474,7 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Header'.'|'.0.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Header'.'|'.0]", lpath_47 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Header'.'|'.0]", lpath_47))
             return False
     return True
 
@@ -2496,15 +2509,15 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_49: Path = (path + [ prop ]) if path is not None else None
+        lpath_49: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle must name property
             must_count += 1
             # .'$openapi#Tag'.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Tag'.name]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Tag'.name]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Tag'.name]", lpath_49))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Tag'.name]", lpath_49))
                 return False
             continue
         if prop == "description":
@@ -2512,17 +2525,17 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Tag'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Tag'.description]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Tag'.description]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Tag'.description]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Tag'.description]", lpath_49))
                 return False
             continue
         elif prop == "externalDocs":
             # handle may externalDocs property
             # .'$openapi#Tag'.externalDocs
-            res = json_model_14(pval, lpath_49 if path is not None else None, rep)
+            res = json_model_14(pval, lpath_49, rep)
             if not res:
-                rep is None or rep.append(("unexpected $ExternalDocumentation [.'$openapi#Tag'.externalDocs]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Tag'.externalDocs]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected $ExternalDocumentation [.'$openapi#Tag'.externalDocs]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Tag'.externalDocs]", lpath_49))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2530,7 +2543,7 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Tag'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#Tag']", lpath_49 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#Tag']", lpath_49))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2548,15 +2561,15 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_50: Path = (path + [ prop ]) if path is not None else None
+        lpath_50: Path = (path, prop) if path is not None else None
         if prop == "$ref":
             # handle must $ref property
             must_count += 1
             # .'$openapi#Reference'.'$ref'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Reference'.'$ref']", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Reference'.'$ref']", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Reference'.'$ref']", lpath_50))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#Reference'.'$ref']", lpath_50))
                 return False
             continue
         if prop == "summary":
@@ -2564,8 +2577,8 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Reference'.summary
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Reference'.summary]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Reference'.summary]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Reference'.summary]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Reference'.summary]", lpath_50))
                 return False
             continue
         elif prop == "description":
@@ -2573,11 +2586,11 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#Reference'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#Reference'.description]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#Reference'.description]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#Reference'.description]", lpath_50))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#Reference'.description]", lpath_50))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$openapi#Reference']", lpath_50 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$openapi#Reference']", lpath_50))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2595,15 +2608,15 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_51: Path = (path + [ prop ]) if path is not None else None
+        lpath_51: Path = (path, prop) if path is not None else None
         if prop == "in":
             # handle must in property
             must_count += 1
             # .'$openapi#SecurityScheme'.'|'.0.in
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_3
             if not res:
-                rep is None or rep.append(("value not in enum [.'$openapi#SecurityScheme'.'|'.0.in.'|']", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.0.in]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.'$openapi#SecurityScheme'.'|'.0.in.'|']", lpath_51))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.0.in]", lpath_51))
                 return False
             continue
         elif prop == "name":
@@ -2612,8 +2625,8 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.0.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.0.name]", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.0.name]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.0.name]", lpath_51))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.0.name]", lpath_51))
                 return False
             continue
         elif prop == "type":
@@ -2622,8 +2635,8 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.0.type
             res = isinstance(pval, str) and pval == "apiKey"
             if not res:
-                rep is None or rep.append(("unexpected _apiKey [.'$openapi#SecurityScheme'.'|'.0.type]", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.0.type]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("unexpected _apiKey [.'$openapi#SecurityScheme'.'|'.0.type]", lpath_51))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.0.type]", lpath_51))
                 return False
             continue
         if prop == "description":
@@ -2631,11 +2644,11 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.0.description]", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.0.description]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.0.description]", lpath_51))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.0.description]", lpath_51))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.0]", lpath_51 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.0]", lpath_51))
         return False
     if must_count != 3:
         if rep is not None:
@@ -2657,15 +2670,15 @@ def _jm_obj_34(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_52: Path = (path + [ prop ]) if path is not None else None
+        lpath_52: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$openapi#SecurityScheme'.'|'.1.type
             res = isinstance(pval, str) and pval == "http"
             if not res:
-                rep is None or rep.append(("unexpected _http [.'$openapi#SecurityScheme'.'|'.1.type]", lpath_52 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.1.type]", lpath_52 if path is not None else None))
+                rep is None or rep.append(("unexpected _http [.'$openapi#SecurityScheme'.'|'.1.type]", lpath_52))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.1.type]", lpath_52))
                 return False
             continue
         elif prop == "scheme":
@@ -2673,10 +2686,10 @@ def _jm_obj_34(val: Jsonable, path: Path, rep: Report) -> bool:
             must_count += 1
             # .'$openapi#SecurityScheme'.'|'.1.scheme
             # "/bearer/i"
-            res = isinstance(pval, str) and _jm_re_3(pval, lpath_52 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_3(pval, lpath_52, rep)
             if not res:
-                rep is None or rep.append(("unexpected /bearer/i [.'$openapi#SecurityScheme'.'|'.1.scheme]", lpath_52 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.1.scheme]", lpath_52 if path is not None else None))
+                rep is None or rep.append(("unexpected /bearer/i [.'$openapi#SecurityScheme'.'|'.1.scheme]", lpath_52))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.1.scheme]", lpath_52))
                 return False
             continue
         if prop == "description":
@@ -2684,8 +2697,8 @@ def _jm_obj_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.1.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.1.description]", lpath_52 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.1.description]", lpath_52 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.1.description]", lpath_52))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.1.description]", lpath_52))
                 return False
             continue
         elif prop == "bearerFormat":
@@ -2693,11 +2706,11 @@ def _jm_obj_34(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.1.bearerFormat
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.1.bearerFormat]", lpath_52 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.1.bearerFormat]", lpath_52 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.1.bearerFormat]", lpath_52))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.1.bearerFormat]", lpath_52))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.1]", lpath_52 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.1]", lpath_52))
         return False
     if must_count != 2:
         if rep is not None:
@@ -2716,15 +2729,15 @@ def _jm_obj_35(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_53: Path = (path + [ prop ]) if path is not None else None
+        lpath_53: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$openapi#SecurityScheme'.'|'.2.type
             res = isinstance(pval, str) and pval == "http"
             if not res:
-                rep is None or rep.append(("unexpected _http [.'$openapi#SecurityScheme'.'|'.2.type]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.2.type]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected _http [.'$openapi#SecurityScheme'.'|'.2.type]", lpath_53))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.2.type]", lpath_53))
                 return False
             continue
         elif prop == "scheme":
@@ -2733,8 +2746,8 @@ def _jm_obj_35(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.2.scheme
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.2.scheme]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.2.scheme]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.2.scheme]", lpath_53))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.2.scheme]", lpath_53))
                 return False
             continue
         if prop == "description":
@@ -2742,11 +2755,11 @@ def _jm_obj_35(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.2.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.2.description]", lpath_53 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.2.description]", lpath_53 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.2.description]", lpath_53))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.2.description]", lpath_53))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.2]", lpath_53 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.2]", lpath_53))
         return False
     if must_count != 2:
         if rep is not None:
@@ -2765,25 +2778,25 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_54: Path = (path + [ prop ]) if path is not None else None
+        lpath_54: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$openapi#SecurityScheme'.'|'.3.type
             res = isinstance(pval, str) and pval == "oauth2"
             if not res:
-                rep is None or rep.append(("unexpected _oauth2 [.'$openapi#SecurityScheme'.'|'.3.type]", lpath_54 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.3.type]", lpath_54 if path is not None else None))
+                rep is None or rep.append(("unexpected _oauth2 [.'$openapi#SecurityScheme'.'|'.3.type]", lpath_54))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.3.type]", lpath_54))
                 return False
             continue
         elif prop == "flows":
             # handle must flows property
             must_count += 1
             # .'$openapi#SecurityScheme'.'|'.3.flows
-            res = json_model_43(pval, lpath_54 if path is not None else None, rep)
+            res = json_model_43(pval, lpath_54, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlows [.'$openapi#SecurityScheme'.'|'.3.flows]", lpath_54 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.3.flows]", lpath_54 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlows [.'$openapi#SecurityScheme'.'|'.3.flows]", lpath_54))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.3.flows]", lpath_54))
                 return False
             continue
         if prop == "description":
@@ -2791,11 +2804,11 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.3.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.3.description]", lpath_54 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.3.description]", lpath_54 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.3.description]", lpath_54))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.3.description]", lpath_54))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.3]", lpath_54 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.3]", lpath_54))
         return False
     if must_count != 2:
         if rep is not None:
@@ -2814,25 +2827,25 @@ def _jm_obj_37(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_55: Path = (path + [ prop ]) if path is not None else None
+        lpath_55: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$openapi#SecurityScheme'.'|'.4.type
             res = isinstance(pval, str) and pval == "openIdConnect"
             if not res:
-                rep is None or rep.append(("unexpected _openIdConnect [.'$openapi#SecurityScheme'.'|'.4.type]", lpath_55 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.4.type]", lpath_55 if path is not None else None))
+                rep is None or rep.append(("unexpected _openIdConnect [.'$openapi#SecurityScheme'.'|'.4.type]", lpath_55))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.4.type]", lpath_55))
                 return False
             continue
         elif prop == "openIdConnectUrl":
             # handle must openIdConnectUrl property
             must_count += 1
             # .'$openapi#SecurityScheme'.'|'.4.openIdConnectUrl
-            res = is_valid_url(pval, lpath_55 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_55, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$openapi#SecurityScheme'.'|'.4.openIdConnectUrl]", lpath_55 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.4.openIdConnectUrl]", lpath_55 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$openapi#SecurityScheme'.'|'.4.openIdConnectUrl]", lpath_55))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#SecurityScheme'.'|'.4.openIdConnectUrl]", lpath_55))
                 return False
             continue
         if prop == "description":
@@ -2840,11 +2853,11 @@ def _jm_obj_37(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.4.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.4.description]", lpath_55 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.4.description]", lpath_55 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.4.description]", lpath_55))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.4.description]", lpath_55))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.4]", lpath_55 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.4]", lpath_55))
         return False
     if must_count != 2:
         if rep is not None:
@@ -2862,14 +2875,14 @@ def _jm_obj_38(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_56: Path = (path + [ prop ]) if path is not None else None
+        lpath_56: Path = (path, prop) if path is not None else None
         if prop == "description":
             # handle may description property
             # .'$openapi#SecurityScheme'.'|'.5.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.5.description]", lpath_56 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.5.description]", lpath_56 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#SecurityScheme'.'|'.5.description]", lpath_56))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#SecurityScheme'.'|'.5.description]", lpath_56))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2877,7 +2890,7 @@ def _jm_obj_38(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#SecurityScheme'.'|'.5.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.5]", lpath_56 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#SecurityScheme'.'|'.5]", lpath_56))
             return False
     return True
 
@@ -2921,41 +2934,41 @@ def json_model_43(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_57: Path = (path + [ prop ]) if path is not None else None
+        lpath_57: Path = (path, prop) if path is not None else None
         if prop == "implicit":
             # handle may implicit property
             # .'$openapi#OAuthFlows'.implicit
-            res = json_model_44(pval, lpath_57 if path is not None else None, rep)
+            res = json_model_44(pval, lpath_57, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlow [.'$openapi#OAuthFlows'.implicit]", lpath_57 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlows'.implicit]", lpath_57 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlow [.'$openapi#OAuthFlows'.implicit]", lpath_57))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlows'.implicit]", lpath_57))
                 return False
             continue
         elif prop == "password":
             # handle may password property
             # .'$openapi#OAuthFlows'.password
-            res = json_model_44(pval, lpath_57 if path is not None else None, rep)
+            res = json_model_44(pval, lpath_57, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlow [.'$openapi#OAuthFlows'.password]", lpath_57 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlows'.password]", lpath_57 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlow [.'$openapi#OAuthFlows'.password]", lpath_57))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlows'.password]", lpath_57))
                 return False
             continue
         elif prop == "authorizationCode":
             # handle may authorizationCode property
             # .'$openapi#OAuthFlows'.authorizationCode
-            res = json_model_44(pval, lpath_57 if path is not None else None, rep)
+            res = json_model_44(pval, lpath_57, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlow [.'$openapi#OAuthFlows'.authorizationCode]", lpath_57 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlows'.authorizationCode]", lpath_57 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlow [.'$openapi#OAuthFlows'.authorizationCode]", lpath_57))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlows'.authorizationCode]", lpath_57))
                 return False
             continue
         elif prop == "clientCredentials":
             # handle may clientCredentials property
             # .'$openapi#OAuthFlows'.clientCredentials
-            res = json_model_44(pval, lpath_57 if path is not None else None, rep)
+            res = json_model_44(pval, lpath_57, rep)
             if not res:
-                rep is None or rep.append(("unexpected $OAuthFlow [.'$openapi#OAuthFlows'.clientCredentials]", lpath_57 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlows'.clientCredentials]", lpath_57 if path is not None else None))
+                rep is None or rep.append(("unexpected $OAuthFlow [.'$openapi#OAuthFlows'.clientCredentials]", lpath_57))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlows'.clientCredentials]", lpath_57))
                 return False
             continue
         if prop.startswith("x-"):
@@ -2963,7 +2976,7 @@ def json_model_43(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#OAuthFlows'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#OAuthFlows']", lpath_57 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#OAuthFlows']", lpath_57))
             return False
     return True
 
@@ -2974,12 +2987,12 @@ def _jm_obj_39(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_59: Path = (path + [ prop ]) if path is not None else None
+        lpath_59: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#OAuthFlow'.scopes.''
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$openapi#OAuthFlow'.scopes.'']", lpath_59 if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$openapi#OAuthFlow'.scopes.'']", lpath_59))
             return False
     return True
 
@@ -2992,44 +3005,44 @@ def json_model_44(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_58: Path = (path + [ prop ]) if path is not None else None
+        lpath_58: Path = (path, prop) if path is not None else None
         if prop == "scopes":
             # handle must scopes property
             must_count += 1
             # .'$openapi#OAuthFlow'.scopes
-            res = _jm_obj_39(pval, lpath_58 if path is not None else None, rep)
+            res = _jm_obj_39(pval, lpath_58, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$openapi#OAuthFlow'.scopes]", lpath_58 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OAuthFlow'.scopes]", lpath_58 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$openapi#OAuthFlow'.scopes]", lpath_58))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OAuthFlow'.scopes]", lpath_58))
                 return False
             continue
         elif prop == "tokenUrl":
             # handle must tokenUrl property
             must_count += 1
             # .'$openapi#OAuthFlow'.tokenUrl
-            res = is_valid_url(pval, lpath_58 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_58, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$openapi#OAuthFlow'.tokenUrl]", lpath_58 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OAuthFlow'.tokenUrl]", lpath_58 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$openapi#OAuthFlow'.tokenUrl]", lpath_58))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OAuthFlow'.tokenUrl]", lpath_58))
                 return False
             continue
         elif prop == "authorizationUrl":
             # handle must authorizationUrl property
             must_count += 1
             # .'$openapi#OAuthFlow'.authorizationUrl
-            res = is_valid_url(pval, lpath_58 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_58, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$openapi#OAuthFlow'.authorizationUrl]", lpath_58 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OAuthFlow'.authorizationUrl]", lpath_58 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$openapi#OAuthFlow'.authorizationUrl]", lpath_58))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#OAuthFlow'.authorizationUrl]", lpath_58))
                 return False
             continue
         if prop == "refreshUrl":
             # handle may refreshUrl property
             # .'$openapi#OAuthFlow'.refreshUrl
-            res = is_valid_url(pval, lpath_58 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_58, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$openapi#OAuthFlow'.refreshUrl]", lpath_58 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlow'.refreshUrl]", lpath_58 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$openapi#OAuthFlow'.refreshUrl]", lpath_58))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#OAuthFlow'.refreshUrl]", lpath_58))
                 return False
             continue
         if prop.startswith("x-"):
@@ -3037,7 +3050,7 @@ def json_model_44(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#OAuthFlow'.'/^x-/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#OAuthFlow']", lpath_58 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#OAuthFlow']", lpath_58))
             return False
     if must_count != 3:
         if rep is not None:
@@ -3058,20 +3071,20 @@ def json_model_45(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_60: Path = (path + [ prop ]) if path is not None else None
+        lpath_60: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$openapi#SecurityRequirement'.''
         res = isinstance(pval, list)
         if res:
             for arr_10_idx, arr_10_item in enumerate(pval):
-                arr_10_lpath: Path = ((lpath_60 if path is not None else None) + [ arr_10_idx ]) if (lpath_60 if path is not None else None) is not None else None
+                arr_10_lpath: Path = (lpath_60, arr_10_idx) if lpath_60 is not None else None
                 # .'$openapi#SecurityRequirement'.''.0
                 res = isinstance(arr_10_item, str)
                 if not res:
-                    rep is None or rep.append(("unexpected string [.'$openapi#SecurityRequirement'.''.0]", arr_10_lpath if (lpath_60 if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected string [.'$openapi#SecurityRequirement'.''.0]", arr_10_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$openapi#SecurityRequirement'.'']", lpath_60 if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$openapi#SecurityRequirement'.'']", lpath_60))
             return False
     return True
 
@@ -3110,11 +3123,11 @@ def json_model_83(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_11_idx, arr_11_item in enumerate(val):
-            arr_11_lpath: Path = (path + [ arr_11_idx ]) if path is not None else None
+            arr_11_lpath: Path = (path, arr_11_idx) if path is not None else None
             # .'$openapi#model#Array'.0
-            res = json_model_82(arr_11_item, arr_11_lpath if path is not None else None, rep)
+            res = json_model_82(arr_11_item, arr_11_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Array'.0]", arr_11_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Array'.0]", arr_11_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$openapi#model#Array']", path))
@@ -3153,29 +3166,29 @@ def _jm_obj_40(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_61: Path = (path + [ prop ]) if path is not None else None
+        lpath_61: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$openapi#model#Element'.'|'.5.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.5.'#']", lpath_61 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.5.'#']", lpath_61 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.5.'#']", lpath_61))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.5.'#']", lpath_61))
                 return False
             continue
-        if json_model_90(prop, lpath_61 if path is not None else None, rep):
+        if json_model_90(prop, lpath_61, rep):
             # handle 1 key props
             # .'$openapi#model#Element'.'|'.5.'$Prop'
-            res = json_model_97(pval, lpath_61 if path is not None else None, rep)
+            res = json_model_97(pval, lpath_61, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$openapi#model#Element'.'|'.5.'$Prop']", lpath_61 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$openapi#model#Element'.'|'.5.'$Prop']", lpath_61))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$openapi#model#Element'.'|'.5.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.5]", lpath_61 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.5]", lpath_61))
             return False
     return True
 
@@ -3187,7 +3200,7 @@ def _jm_obj_41(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_62: Path = (path + [ prop ]) if path is not None else None
+        lpath_62: Path = (path, prop) if path is not None else None
         if prop == "+":
             # handle must + property
             must_count += 1
@@ -3195,15 +3208,15 @@ def _jm_obj_41(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_12_idx, arr_12_item in enumerate(pval):
-                    arr_12_lpath: Path = ((lpath_62 if path is not None else None) + [ arr_12_idx ]) if (lpath_62 if path is not None else None) is not None else None
+                    arr_12_lpath: Path = (lpath_62, arr_12_idx) if lpath_62 is not None else None
                     # .'$openapi#model#Element'.'|'.4.'+'.0
-                    res = json_model_82(arr_12_item, arr_12_lpath if (lpath_62 if path is not None else None) is not None else None, rep)
+                    res = json_model_82(arr_12_item, arr_12_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Element'.'|'.4.'+'.0]", arr_12_lpath if (lpath_62 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Element'.'|'.4.'+'.0]", arr_12_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$openapi#model#Element'.'|'.4.'+']", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.4.'+']", lpath_62 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$openapi#model#Element'.'|'.4.'+']", lpath_62))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.4.'+']", lpath_62))
                 return False
             continue
         if prop == "#":
@@ -3211,8 +3224,8 @@ def _jm_obj_41(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.4.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.4.'#']", lpath_62 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.4.'#']", lpath_62 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.4.'#']", lpath_62))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.4.'#']", lpath_62))
                 return False
             continue
         if prop.startswith("#"):
@@ -3220,7 +3233,7 @@ def _jm_obj_41(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.4.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.4]", lpath_62 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.4]", lpath_62))
             return False
     if must_count != 1:
         if rep is not None:
@@ -3237,7 +3250,7 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_63: Path = (path + [ prop ]) if path is not None else None
+        lpath_63: Path = (path, prop) if path is not None else None
         if prop == "^":
             # handle must ^ property
             must_count += 1
@@ -3245,15 +3258,15 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_13_idx, arr_13_item in enumerate(pval):
-                    arr_13_lpath: Path = ((lpath_63 if path is not None else None) + [ arr_13_idx ]) if (lpath_63 if path is not None else None) is not None else None
+                    arr_13_lpath: Path = (lpath_63, arr_13_idx) if lpath_63 is not None else None
                     # .'$openapi#model#Element'.'|'.3.'^'.0
-                    res = json_model_82(arr_13_item, arr_13_lpath if (lpath_63 if path is not None else None) is not None else None, rep)
+                    res = json_model_82(arr_13_item, arr_13_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Element'.'|'.3.'^'.0]", arr_13_lpath if (lpath_63 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Element'.'|'.3.'^'.0]", arr_13_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$openapi#model#Element'.'|'.3.'^']", lpath_63 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.3.'^']", lpath_63 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$openapi#model#Element'.'|'.3.'^']", lpath_63))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.3.'^']", lpath_63))
                 return False
             continue
         if prop == "#":
@@ -3261,8 +3274,8 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.3.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.3.'#']", lpath_63 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.3.'#']", lpath_63 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.3.'#']", lpath_63))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.3.'#']", lpath_63))
                 return False
             continue
         if prop.startswith("#"):
@@ -3270,7 +3283,7 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.3.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.3]", lpath_63 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.3]", lpath_63))
             return False
     if must_count != 1:
         if rep is not None:
@@ -3287,7 +3300,7 @@ def _jm_obj_43(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_64: Path = (path + [ prop ]) if path is not None else None
+        lpath_64: Path = (path, prop) if path is not None else None
         if prop == "&":
             # handle must & property
             must_count += 1
@@ -3295,15 +3308,15 @@ def _jm_obj_43(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_14_idx, arr_14_item in enumerate(pval):
-                    arr_14_lpath: Path = ((lpath_64 if path is not None else None) + [ arr_14_idx ]) if (lpath_64 if path is not None else None) is not None else None
+                    arr_14_lpath: Path = (lpath_64, arr_14_idx) if lpath_64 is not None else None
                     # .'$openapi#model#Element'.'|'.2.'&'.0
-                    res = json_model_82(arr_14_item, arr_14_lpath if (lpath_64 if path is not None else None) is not None else None, rep)
+                    res = json_model_82(arr_14_item, arr_14_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Element'.'|'.2.'&'.0]", arr_14_lpath if (lpath_64 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Element'.'|'.2.'&'.0]", arr_14_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$openapi#model#Element'.'|'.2.'&']", lpath_64 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.2.'&']", lpath_64 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$openapi#model#Element'.'|'.2.'&']", lpath_64))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.2.'&']", lpath_64))
                 return False
             continue
         if prop == "#":
@@ -3311,8 +3324,8 @@ def _jm_obj_43(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.2.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.2.'#']", lpath_64 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.2.'#']", lpath_64 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.2.'#']", lpath_64))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.2.'#']", lpath_64))
                 return False
             continue
         if prop.startswith("#"):
@@ -3320,7 +3333,7 @@ def _jm_obj_43(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.2.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.2]", lpath_64 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.2]", lpath_64))
             return False
     if must_count != 1:
         if rep is not None:
@@ -3337,7 +3350,7 @@ def _jm_obj_44(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_65: Path = (path + [ prop ]) if path is not None else None
+        lpath_65: Path = (path, prop) if path is not None else None
         if prop == "|":
             # handle must | property
             must_count += 1
@@ -3345,15 +3358,15 @@ def _jm_obj_44(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_15_idx, arr_15_item in enumerate(pval):
-                    arr_15_lpath: Path = ((lpath_65 if path is not None else None) + [ arr_15_idx ]) if (lpath_65 if path is not None else None) is not None else None
+                    arr_15_lpath: Path = (lpath_65, arr_15_idx) if lpath_65 is not None else None
                     # .'$openapi#model#Element'.'|'.1.'|'.0
-                    res = json_model_82(arr_15_item, arr_15_lpath if (lpath_65 if path is not None else None) is not None else None, rep)
+                    res = json_model_82(arr_15_item, arr_15_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Element'.'|'.1.'|'.0]", arr_15_lpath if (lpath_65 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$openapi#model#Element'.'|'.1.'|'.0]", arr_15_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$openapi#model#Element'.'|'.1.'|']", lpath_65 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.1.'|']", lpath_65 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$openapi#model#Element'.'|'.1.'|']", lpath_65))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.1.'|']", lpath_65))
                 return False
             continue
         if prop == "#":
@@ -3361,8 +3374,8 @@ def _jm_obj_44(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.1.'#']", lpath_65 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.1.'#']", lpath_65 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.1.'#']", lpath_65))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.1.'#']", lpath_65))
                 return False
             continue
         if prop.startswith("#"):
@@ -3370,7 +3383,7 @@ def _jm_obj_44(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.1]", lpath_65 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.1]", lpath_65))
             return False
     if must_count != 1:
         if rep is not None:
@@ -3389,15 +3402,15 @@ def _jm_obj_45(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_66: Path = (path + [ prop ]) if path is not None else None
+        lpath_66: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$openapi#model#Element'.'|'.0.'@'
-            res = json_model_97(pval, lpath_66 if path is not None else None, rep)
+            res = json_model_97(pval, lpath_66, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$openapi#model#Element'.'|'.0.'@']", lpath_66 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.0.'@']", lpath_66 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$openapi#model#Element'.'|'.0.'@']", lpath_66))
+                rep is None or rep.append(("invalid mandatory prop value [.'$openapi#model#Element'.'|'.0.'@']", lpath_66))
                 return False
             continue
         if prop == "!":
@@ -3405,8 +3418,8 @@ def _jm_obj_45(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.0.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$openapi#model#Element'.'|'.0.'!']", lpath_66 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.0.'!']", lpath_66 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$openapi#model#Element'.'|'.0.'!']", lpath_66))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.0.'!']", lpath_66))
                 return False
             continue
         elif prop == "#":
@@ -3414,8 +3427,8 @@ def _jm_obj_45(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$openapi#model#Element'.'|'.0.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.0.'#']", lpath_66 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.0.'#']", lpath_66 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$openapi#model#Element'.'|'.0.'#']", lpath_66))
+                rep is None or rep.append(("invalid optional prop value [.'$openapi#model#Element'.'|'.0.'#']", lpath_66))
                 return False
             continue
         if prop.startswith("#"):
@@ -3425,19 +3438,19 @@ def _jm_obj_45(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_4(prop, path, rep):
             # handle 3 re props
             # .'$openapi#model#Element'.'|'.0.'/^(<=|>=|<|>)$/'
-            res = json_model_76(pval, lpath_66 if path is not None else None, rep)
+            res = json_model_76(pval, lpath_66, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$openapi#model#Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_66 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$openapi#model#Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_66))
                 return False
         elif _jm_re_5(prop, path, rep):
             # handle 3 re props
             # .'$openapi#model#Element'.'|'.0.'/^(=|!=)$/'
-            res = json_model_77(pval, lpath_66 if path is not None else None, rep)
+            res = json_model_77(pval, lpath_66, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$openapi#model#Element'.'|'.0.'/^(=|!=)$/']", lpath_66 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$openapi#model#Element'.'|'.0.'/^(=|!=)$/']", lpath_66))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.0]", lpath_66 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$openapi#model#Element'.'|'.0]", lpath_66))
             return False
     if must_count != 1:
         if rep is not None:
@@ -3894,5 +3907,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
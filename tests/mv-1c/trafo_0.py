@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -38,22 +51,22 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("za", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <za> [.'$zero']", path))
         return False
-    lpath = (path + [ "za" ]) if path is not None else None
+    lpath = (path, "za") if path is not None else None
     # .'$zero'.za
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$zero'.za]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <za> [.'$zero']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$zero'.za]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <za> [.'$zero']", lpath))
         return False
     if not ((pval := val.get("zb", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <zb> [.'$zero']", path))
         return False
-    lpath = (path + [ "zb" ]) if path is not None else None
+    lpath = (path, "zb") if path is not None else None
     # .'$zero'.zb
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$zero'.zb]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <zb> [.'$zero']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$zero'.zb]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <zb> [.'$zero']", lpath))
         return False
     return True
 
@@ -88,5 +101,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
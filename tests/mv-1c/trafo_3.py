@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -44,11 +57,11 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$Dd#l'.0
-            res = json_model_12(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_12(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $u [.'$Dd#l'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $u [.'$Dd#l'.0]", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Dd#l']", path))
@@ -78,22 +91,22 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("ua", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <ua> [.'$Dd#Uu#un']", path))
         return False
-    lpath = (path + [ "ua" ]) if path is not None else None
+    lpath = (path, "ua") if path is not None else None
     # .'$Dd#Uu#un'.ua
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$Dd#Uu#un'.ua]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <ua> [.'$Dd#Uu#un']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$Dd#Uu#un'.ua]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <ua> [.'$Dd#Uu#un']", lpath))
         return False
     if not ((pval := val.get("ub", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <ub> [.'$Dd#Uu#un']", path))
         return False
-    lpath = (path + [ "ub" ]) if path is not None else None
+    lpath = (path, "ub") if path is not None else None
     # .'$Dd#Uu#un'.ub
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$Dd#Uu#un'.ub]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <ub> [.'$Dd#Uu#un']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$Dd#Uu#un'.ub]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <ub> [.'$Dd#Uu#un']", lpath))
         return False
     return True
 
@@ -120,5 +133,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
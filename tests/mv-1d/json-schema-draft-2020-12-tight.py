@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_obj_6_map: PropMap
 _jm_obj_7_map: PropMap
@@ -46,12 +59,12 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$core'.'$defs'.''
-        res = json_model_16(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$core'.'$defs'.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$core'.'$defs'.'']", lpath_1))
             return False
     return True
 
@@ -62,16 +75,16 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_2 if path is not None else None, rep):
+        lpath_2: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_2, rep):
             # handle 1 key props
             # .'$core'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$core'.'$vocabulary'.'$URI']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$core'.'$vocabulary'.'$URI']", lpath_2))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$core'.'$vocabulary']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$core'.'$vocabulary']", lpath_2))
             return False
     return True
 
@@ -83,50 +96,50 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "$id":
             # handle may $id property
             # .'$core'.'$id'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$id']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$id']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$id']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$id']", lpath_0))
                 return False
             continue
         elif prop == "$ref":
             # handle may $ref property
             # .'$core'.'$ref'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$ref']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$ref']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$ref']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$ref']", lpath_0))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$core'.'$defs'
-            res = _jm_obj_0(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$core'.'$defs']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$defs']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$core'.'$defs']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$defs']", lpath_0))
                 return False
             continue
         elif prop == "$anchor":
             # handle may $anchor property
             # .'$core'.'$anchor'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$anchor']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$anchor']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$anchor']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$anchor']", lpath_0))
                 return False
             continue
         elif prop == "$schema":
             # handle may $schema property
             # .'$core'.'$schema'
-            res = is_valid_url(pval, lpath_0 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI [.'$core'.'$schema']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$schema']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI [.'$core'.'$schema']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$schema']", lpath_0))
                 return False
             continue
         elif prop == "$comment":
@@ -134,38 +147,38 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$core'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$core'.'$comment']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$comment']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$core'.'$comment']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$comment']", lpath_0))
                 return False
             continue
         elif prop == "$dynamicRef":
             # handle may $dynamicRef property
             # .'$core'.'$dynamicRef'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$dynamicRef']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$dynamicRef']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$dynamicRef']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$dynamicRef']", lpath_0))
                 return False
             continue
         elif prop == "$vocabulary":
             # handle may $vocabulary property
             # .'$core'.'$vocabulary'
-            res = _jm_obj_1(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_1(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$core'.'$vocabulary']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$vocabulary']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$core'.'$vocabulary']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$vocabulary']", lpath_0))
                 return False
             continue
         elif prop == "$dynamicAnchor":
             # handle may $dynamicAnchor property
             # .'$core'.'$dynamicAnchor'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$dynamicAnchor']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$dynamicAnchor']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$dynamicAnchor']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$dynamicAnchor']", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$core']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$core']", lpath_0))
         return False
     return True
 
@@ -177,14 +190,14 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "title":
             # handle may title property
             # .'$meta'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$meta'.title]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.title]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$meta'.title]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.title]", lpath_3))
                 return False
             continue
         elif prop == "default":
@@ -197,8 +210,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$meta'.examples]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.examples]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$meta'.examples]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.examples]", lpath_3))
                 return False
             continue
         elif prop == "readOnly":
@@ -206,8 +219,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.readOnly
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$meta'.readOnly]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.readOnly]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$meta'.readOnly]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.readOnly]", lpath_3))
                 return False
             continue
         elif prop == "writeOnly":
@@ -215,8 +228,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.writeOnly
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$meta'.writeOnly]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.writeOnly]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$meta'.writeOnly]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.writeOnly]", lpath_3))
                 return False
             continue
         elif prop == "deprecated":
@@ -224,8 +237,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$meta'.deprecated]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.deprecated]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$meta'.deprecated]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.deprecated]", lpath_3))
                 return False
             continue
         elif prop == "description":
@@ -233,11 +246,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$meta'.description]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.description]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$meta'.description]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.description]", lpath_3))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$meta']", lpath_3 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$meta']", lpath_3))
         return False
     return True
 
@@ -257,12 +270,12 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$Null']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$Null'.type
     res = isinstance(pval, str) and pval == "null"
     if not res:
-        rep is None or rep.append(("unexpected _null [.'$Null'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Null']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _null [.'$Null'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Null']", lpath))
         return False
     return True
 
@@ -282,12 +295,12 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$Boolean']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$Boolean'.type
     res = isinstance(pval, str) and pval == "boolean"
     if not res:
-        rep is None or rep.append(("unexpected _boolean [.'$Boolean'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Boolean']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _boolean [.'$Boolean'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Boolean']", lpath))
         return False
     return True
 
@@ -300,15 +313,15 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Number'.type
             res = isinstance(pval, str) and pval == "number"
             if not res:
-                rep is None or rep.append(("unexpected _number [.'$Number'.type]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Number'.type]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected _number [.'$Number'.type]", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Number'.type]", lpath_4))
                 return False
             continue
         if prop == "maximum":
@@ -317,16 +330,16 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Number'.maximum.'|'.0
             res = isinstance(pval, int) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'$Number'.maximum.'|'.0]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'$Number'.maximum.'|'.0]", lpath_4))
                 # .'$Number'.maximum.'|'.1
                 res = isinstance(pval, float)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 strict float [.'$Number'.maximum.'|'.1]", lpath_4 if path is not None else None))
+                    rep is None or rep.append(("not a -1.0 strict float [.'$Number'.maximum.'|'.1]", lpath_4))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Number'.maximum.'|']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Number'.maximum]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Number'.maximum.'|']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Number'.maximum]", lpath_4))
                 return False
             continue
         elif prop == "minimum":
@@ -335,16 +348,16 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Number'.minimum.'|'.0
             res = isinstance(pval, int) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'$Number'.minimum.'|'.0]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'$Number'.minimum.'|'.0]", lpath_4))
                 # .'$Number'.minimum.'|'.1
                 res = isinstance(pval, float)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 strict float [.'$Number'.minimum.'|'.1]", lpath_4 if path is not None else None))
+                    rep is None or rep.append(("not a -1.0 strict float [.'$Number'.minimum.'|'.1]", lpath_4))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Number'.minimum.'|']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Number'.minimum]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Number'.minimum.'|']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Number'.minimum]", lpath_4))
                 return False
             continue
         elif prop == "multipleOf":
@@ -353,16 +366,16 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Number'.multipleOf.'|'.0
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
             if not res:
-                rep is None or rep.append(("not a 1 strict int [.'$Number'.multipleOf.'|'.0]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not a 1 strict int [.'$Number'.multipleOf.'|'.0]", lpath_4))
                 # .'$Number'.multipleOf.'|'.1
                 res = isinstance(pval, float) and pval > 0.0
                 if not res:
-                    rep is None or rep.append(("not a 1.0 strict float [.'$Number'.multipleOf.'|'.1]", lpath_4 if path is not None else None))
+                    rep is None or rep.append(("not a 1.0 strict float [.'$Number'.multipleOf.'|'.1]", lpath_4))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Number'.multipleOf.'|']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Number'.multipleOf]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Number'.multipleOf.'|']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Number'.multipleOf]", lpath_4))
                 return False
             continue
         elif prop == "exclusiveMaximum":
@@ -371,16 +384,16 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Number'.exclusiveMaximum.'|'.0
             res = isinstance(pval, int) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'$Number'.exclusiveMaximum.'|'.0]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'$Number'.exclusiveMaximum.'|'.0]", lpath_4))
                 # .'$Number'.exclusiveMaximum.'|'.1
                 res = isinstance(pval, float)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 strict float [.'$Number'.exclusiveMaximum.'|'.1]", lpath_4 if path is not None else None))
+                    rep is None or rep.append(("not a -1.0 strict float [.'$Number'.exclusiveMaximum.'|'.1]", lpath_4))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Number'.exclusiveMaximum.'|']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Number'.exclusiveMaximum]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Number'.exclusiveMaximum.'|']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Number'.exclusiveMaximum]", lpath_4))
                 return False
             continue
         elif prop == "exclusiveMinimum":
@@ -389,19 +402,19 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Number'.exclusiveMinimum.'|'.0
             res = isinstance(pval, int) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'$Number'.exclusiveMinimum.'|'.0]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'$Number'.exclusiveMinimum.'|'.0]", lpath_4))
                 # .'$Number'.exclusiveMinimum.'|'.1
                 res = isinstance(pval, float)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 strict float [.'$Number'.exclusiveMinimum.'|'.1]", lpath_4 if path is not None else None))
+                    rep is None or rep.append(("not a -1.0 strict float [.'$Number'.exclusiveMinimum.'|'.1]", lpath_4))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Number'.exclusiveMinimum.'|']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Number'.exclusiveMinimum]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Number'.exclusiveMinimum.'|']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Number'.exclusiveMinimum]", lpath_4))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Number']", lpath_4 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Number']", lpath_4))
         return False
     if must_count != 1:
         if rep is not None:
@@ -419,15 +432,15 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Integer'.type
             res = isinstance(pval, str) and pval == "integer"
             if not res:
-                rep is None or rep.append(("unexpected _integer [.'$Integer'.type]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Integer'.type]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected _integer [.'$Integer'.type]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Integer'.type]", lpath_5))
                 return False
             continue
         if prop == "maximum":
@@ -435,8 +448,8 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Integer'.maximum
             res = isinstance(pval, int) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'$Integer'.maximum]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Integer'.maximum]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'$Integer'.maximum]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Integer'.maximum]", lpath_5))
                 return False
             continue
         elif prop == "minimum":
@@ -444,8 +457,8 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Integer'.minimum
             res = isinstance(pval, int) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'$Integer'.minimum]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Integer'.minimum]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'$Integer'.minimum]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Integer'.minimum]", lpath_5))
                 return False
             continue
         elif prop == "multipleOf":
@@ -453,8 +466,8 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Integer'.multipleOf
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
             if not res:
-                rep is None or rep.append(("not a 1 strict int [.'$Integer'.multipleOf]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Integer'.multipleOf]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a 1 strict int [.'$Integer'.multipleOf]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Integer'.multipleOf]", lpath_5))
                 return False
             continue
         elif prop == "exclusiveMaximum":
@@ -462,8 +475,8 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Integer'.exclusiveMaximum
             res = isinstance(pval, int) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'$Integer'.exclusiveMaximum]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Integer'.exclusiveMaximum]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'$Integer'.exclusiveMaximum]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Integer'.exclusiveMaximum]", lpath_5))
                 return False
             continue
         elif prop == "exclusiveMinimum":
@@ -471,11 +484,11 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Integer'.exclusiveMinimum
             res = isinstance(pval, int) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'$Integer'.exclusiveMinimum]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Integer'.exclusiveMinimum]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'$Integer'.exclusiveMinimum]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Integer'.exclusiveMinimum]", lpath_5))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Integer']", lpath_5 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Integer']", lpath_5))
         return False
     if must_count != 1:
         if rep is not None:
@@ -493,15 +506,15 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$String'.type
             res = isinstance(pval, str) and pval == "string"
             if not res:
-                rep is None or rep.append(("unexpected _string [.'$String'.type]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$String'.type]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected _string [.'$String'.type]", lpath_6))
+                rep is None or rep.append(("invalid mandatory prop value [.'$String'.type]", lpath_6))
                 return False
             continue
         if prop == "format":
@@ -509,17 +522,17 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$String'.format
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$String'.format]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$String'.format]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$String'.format]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$String'.format]", lpath_6))
                 return False
             continue
         elif prop == "pattern":
             # handle may pattern property
             # .'$String'.pattern
-            res = is_valid_regex(pval, lpath_6 if path is not None else None, rep)
+            res = is_valid_regex(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $REGEX [.'$String'.pattern]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$String'.pattern]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $REGEX [.'$String'.pattern]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$String'.pattern]", lpath_6))
                 return False
             continue
         elif prop == "maxLength":
@@ -527,8 +540,8 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$String'.maxLength
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$String'.maxLength]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$String'.maxLength]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$String'.maxLength]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$String'.maxLength]", lpath_6))
                 return False
             continue
         elif prop == "minLength":
@@ -536,17 +549,17 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$String'.minLength
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$String'.minLength]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$String'.minLength]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$String'.minLength]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$String'.minLength]", lpath_6))
                 return False
             continue
         elif prop == "contentSchema":
             # handle may contentSchema property
             # .'$String'.contentSchema
-            res = json_model_16(pval, lpath_6 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$String'.contentSchema]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$String'.contentSchema]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$String'.contentSchema]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$String'.contentSchema]", lpath_6))
                 return False
             continue
         elif prop == "contentEncoding":
@@ -554,8 +567,8 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$String'.contentEncoding
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$String'.contentEncoding]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$String'.contentEncoding]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$String'.contentEncoding]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$String'.contentEncoding]", lpath_6))
                 return False
             continue
         elif prop == "contentMediaType":
@@ -563,11 +576,11 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$String'.contentMediaType
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$String'.contentMediaType]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$String'.contentMediaType]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$String'.contentMediaType]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$String'.contentMediaType]", lpath_6))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$String']", lpath_6 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$String']", lpath_6))
         return False
     if must_count != 1:
         if rep is not None:
@@ -583,11 +596,11 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$stringArray'.'@'.0
             res = isinstance(arr_0_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$stringArray'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$stringArray'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -605,11 +618,11 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$schemaArray'.'@'.0
-            res = json_model_16(arr_1_item, arr_1_lpath if path is not None else None, rep)
+            res = json_model_16(arr_1_item, arr_1_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.'@'.0]", arr_1_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -629,33 +642,33 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Array'.type
             res = isinstance(pval, str) and pval == "array"
             if not res:
-                rep is None or rep.append(("unexpected _array [.'$Array'.type]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Array'.type]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected _array [.'$Array'.type]", lpath_7))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Array'.type]", lpath_7))
                 return False
             continue
         if prop == "items":
             # handle may items property
             # .'$Array'.items
-            res = json_model_16(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Array'.items]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.items]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Array'.items]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.items]", lpath_7))
                 return False
             continue
         elif prop == "contains":
             # handle may contains property
             # .'$Array'.contains
-            res = json_model_16(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Array'.contains]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.contains]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Array'.contains]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.contains]", lpath_7))
                 return False
             continue
         elif prop == "maxItems":
@@ -663,8 +676,8 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Array'.maxItems
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Array'.maxItems]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.maxItems]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Array'.maxItems]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.maxItems]", lpath_7))
                 return False
             continue
         elif prop == "minItems":
@@ -672,8 +685,8 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Array'.minItems
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Array'.minItems]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.minItems]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Array'.minItems]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.minItems]", lpath_7))
                 return False
             continue
         elif prop == "maxContains":
@@ -681,8 +694,8 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Array'.maxContains
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Array'.maxContains]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.maxContains]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Array'.maxContains]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.maxContains]", lpath_7))
                 return False
             continue
         elif prop == "minContains":
@@ -690,17 +703,17 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Array'.minContains
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Array'.minContains]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.minContains]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Array'.minContains]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.minContains]", lpath_7))
                 return False
             continue
         elif prop == "prefixItems":
             # handle may prefixItems property
             # .'$Array'.prefixItems
-            res = json_model_11(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_11(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$Array'.prefixItems]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.prefixItems]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$Array'.prefixItems]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.prefixItems]", lpath_7))
                 return False
             continue
         elif prop == "uniqueItems":
@@ -708,20 +721,20 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Array'.uniqueItems
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Array'.uniqueItems]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.uniqueItems]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Array'.uniqueItems]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.uniqueItems]", lpath_7))
                 return False
             continue
         elif prop == "unevaluatedItems":
             # handle may unevaluatedItems property
             # .'$Array'.unevaluatedItems
-            res = json_model_16(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Array'.unevaluatedItems]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Array'.unevaluatedItems]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Array'.unevaluatedItems]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Array'.unevaluatedItems]", lpath_7))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Array']", lpath_7 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Array']", lpath_7))
         return False
     if must_count != 1:
         if rep is not None:
@@ -737,12 +750,12 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Object'.properties.''
-        res = json_model_16(pval, lpath_9 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_9, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Object'.properties.'']", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Object'.properties.'']", lpath_9))
             return False
     return True
 
@@ -753,12 +766,12 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Object'.dependentSchemas.''
-        res = json_model_16(pval, lpath_10 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_10, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$Object'.dependentSchemas.'']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$Object'.dependentSchemas.'']", lpath_10))
             return False
     return True
 
@@ -769,12 +782,12 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Object'.dependentRequired.''
-        res = json_model_10(pval, lpath_11 if path is not None else None, rep)
+        res = json_model_10(pval, lpath_11, rep)
         if not res:
-            rep is None or rep.append(("unexpected $stringArray [.'$Object'.dependentRequired.'']", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected $stringArray [.'$Object'.dependentRequired.'']", lpath_11))
             return False
     return True
 
@@ -785,16 +798,16 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_12 if path is not None else None, rep):
+        lpath_12: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_12, rep):
             # handle 1 key props
             # .'$Object'.patternProperties.'$REGEX'
-            res = json_model_16(pval, lpath_12 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Object'.patternProperties.'$REGEX']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Object'.patternProperties.'$REGEX']", lpath_12))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Object'.patternProperties]", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Object'.patternProperties]", lpath_12))
             return False
     return True
 
@@ -807,33 +820,33 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$Object'.type
             res = isinstance(pval, str) and pval == "object"
             if not res:
-                rep is None or rep.append(("unexpected _object [.'$Object'.type]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Object'.type]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected _object [.'$Object'.type]", lpath_8))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Object'.type]", lpath_8))
                 return False
             continue
         if prop == "required":
             # handle may required property
             # .'$Object'.required
-            res = json_model_10(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_10(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $stringArray [.'$Object'.required]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.required]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $stringArray [.'$Object'.required]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.required]", lpath_8))
                 return False
             continue
         elif prop == "properties":
             # handle may properties property
             # .'$Object'.properties
-            res = _jm_obj_2(pval, lpath_8 if path is not None else None, rep)
+            res = _jm_obj_2(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Object'.properties]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.properties]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Object'.properties]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.properties]", lpath_8))
                 return False
             continue
         elif prop == "maxProperties":
@@ -841,8 +854,8 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Object'.maxProperties
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Object'.maxProperties]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.maxProperties]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Object'.maxProperties]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.maxProperties]", lpath_8))
                 return False
             continue
         elif prop == "minProperties":
@@ -850,65 +863,65 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Object'.minProperties
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Object'.minProperties]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.minProperties]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Object'.minProperties]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.minProperties]", lpath_8))
                 return False
             continue
         elif prop == "propertyNames":
             # handle may propertyNames property
             # .'$Object'.propertyNames
-            res = json_model_16(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Object'.propertyNames]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.propertyNames]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Object'.propertyNames]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.propertyNames]", lpath_8))
                 return False
             continue
         elif prop == "dependentSchemas":
             # handle may dependentSchemas property
             # .'$Object'.dependentSchemas
-            res = _jm_obj_3(pval, lpath_8 if path is not None else None, rep)
+            res = _jm_obj_3(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Object'.dependentSchemas]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.dependentSchemas]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Object'.dependentSchemas]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.dependentSchemas]", lpath_8))
                 return False
             continue
         elif prop == "dependentRequired":
             # handle may dependentRequired property
             # .'$Object'.dependentRequired
-            res = _jm_obj_4(pval, lpath_8 if path is not None else None, rep)
+            res = _jm_obj_4(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Object'.dependentRequired]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.dependentRequired]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Object'.dependentRequired]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.dependentRequired]", lpath_8))
                 return False
             continue
         elif prop == "patternProperties":
             # handle may patternProperties property
             # .'$Object'.patternProperties
-            res = _jm_obj_5(pval, lpath_8 if path is not None else None, rep)
+            res = _jm_obj_5(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Object'.patternProperties]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.patternProperties]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Object'.patternProperties]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.patternProperties]", lpath_8))
                 return False
             continue
         elif prop == "additionalProperties":
             # handle may additionalProperties property
             # .'$Object'.additionalProperties
-            res = json_model_16(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Object'.additionalProperties]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.additionalProperties]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Object'.additionalProperties]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.additionalProperties]", lpath_8))
                 return False
             continue
         elif prop == "unevaluatedProperties":
             # handle may unevaluatedProperties property
             # .'$Object'.unevaluatedProperties
-            res = json_model_16(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Object'.unevaluatedProperties]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Object'.unevaluatedProperties]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Object'.unevaluatedProperties]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Object'.unevaluatedProperties]", lpath_8))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Object']", lpath_8 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Object']", lpath_8))
         return False
     if must_count != 1:
         if rep is not None:
@@ -925,32 +938,32 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         if prop == "if":
             # handle may if property
             # .'$Misc'.if
-            res = json_model_16(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Misc'.if]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Misc'.if]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Misc'.if]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Misc'.if]", lpath_13))
                 return False
             continue
         elif prop == "not":
             # handle may not property
             # .'$Misc'.not
-            res = json_model_16(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Misc'.not]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Misc'.not]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Misc'.not]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Misc'.not]", lpath_13))
                 return False
             continue
         elif prop == "else":
             # handle may else property
             # .'$Misc'.else
-            res = json_model_16(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Misc'.else]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Misc'.else]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Misc'.else]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Misc'.else]", lpath_13))
                 return False
             continue
         elif prop == "enum":
@@ -958,35 +971,35 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Misc'.enum
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Misc'.enum]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Misc'.enum]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Misc'.enum]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Misc'.enum]", lpath_13))
                 return False
             continue
         elif prop == "then":
             # handle may then property
             # .'$Misc'.then
-            res = json_model_16(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$Misc'.then]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Misc'.then]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$Misc'.then]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Misc'.then]", lpath_13))
                 return False
             continue
         elif prop == "allOf":
             # handle may allOf property
             # .'$Misc'.allOf
-            res = json_model_11(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_11(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$Misc'.allOf]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Misc'.allOf]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$Misc'.allOf]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Misc'.allOf]", lpath_13))
                 return False
             continue
         elif prop == "anyOf":
             # handle may anyOf property
             # .'$Misc'.anyOf
-            res = json_model_11(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_11(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$Misc'.anyOf]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Misc'.anyOf]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$Misc'.anyOf]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Misc'.anyOf]", lpath_13))
                 return False
             continue
         elif prop == "const":
@@ -997,13 +1010,13 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
         elif prop == "oneOf":
             # handle may oneOf property
             # .'$Misc'.oneOf
-            res = json_model_11(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_11(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $schemaArray [.'$Misc'.oneOf]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Misc'.oneOf]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $schemaArray [.'$Misc'.oneOf]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Misc'.oneOf]", lpath_13))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Misc']", lpath_13 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Misc']", lpath_13))
         return False
     return True
 
@@ -1023,12 +1036,12 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.0.'$defs'.''
-        res = json_model_16(pval, lpath_15 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_15, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.0.'$defs'.'']", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.0.'$defs'.'']", lpath_15))
             return False
     return True
 
@@ -1048,16 +1061,16 @@ def _jm_f_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_16 if path is not None else None, rep):
+        lpath_16: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_16, rep):
             # handle 1 key props
             # .'$TightSchema'.'|'.0.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.0.'$vocabulary'.'$URI']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.0.'$vocabulary'.'$URI']", lpath_16))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.0.'$vocabulary']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.0.'$vocabulary']", lpath_16))
             return False
     return True
 
@@ -1126,24 +1139,24 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$TightSchema'.'|'.0.type
             res = isinstance(pval, str) and pval == "null"
             if not res:
-                rep is None or rep.append(("unexpected _null [.'$TightSchema'.'|'.0.type]", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.0.type]", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected _null [.'$TightSchema'.'|'.0.type]", lpath_14))
+                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.0.type]", lpath_14))
                 return False
             continue
         if pfun := _jm_obj_6_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_14 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.0]", lpath_14 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_14, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.0]", lpath_14))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.0]", lpath_14 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.0]", lpath_14))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1168,12 +1181,12 @@ def _jm_f_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.1.'$defs'.''
-        res = json_model_16(pval, lpath_18 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_18, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.1.'$defs'.'']", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.1.'$defs'.'']", lpath_18))
             return False
     return True
 
@@ -1193,16 +1206,16 @@ def _jm_f_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_19 if path is not None else None, rep):
+        lpath_19: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_19, rep):
             # handle 1 key props
             # .'$TightSchema'.'|'.1.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.1.'$vocabulary'.'$URI']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.1.'$vocabulary'.'$URI']", lpath_19))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.1.'$vocabulary']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.1.'$vocabulary']", lpath_19))
             return False
     return True
 
@@ -1271,24 +1284,24 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$TightSchema'.'|'.1.type
             res = isinstance(pval, str) and pval == "boolean"
             if not res:
-                rep is None or rep.append(("unexpected _boolean [.'$TightSchema'.'|'.1.type]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.1.type]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected _boolean [.'$TightSchema'.'|'.1.type]", lpath_17))
+                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.1.type]", lpath_17))
                 return False
             continue
         if pfun := _jm_obj_7_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_17 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.1]", lpath_17 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_17, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.1]", lpath_17))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.1]", lpath_17 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.1]", lpath_17))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1313,12 +1326,12 @@ def _jm_f_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.2.'$defs'.''
-        res = json_model_16(pval, lpath_21 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_21, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.2.'$defs'.'']", lpath_21 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.2.'$defs'.'']", lpath_21))
             return False
     return True
 
@@ -1338,16 +1351,16 @@ def _jm_f_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_22 if path is not None else None, rep):
+        lpath_22: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_22, rep):
             # handle 1 key props
             # .'$TightSchema'.'|'.2.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.2.'$vocabulary'.'$URI']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.2.'$vocabulary'.'$URI']", lpath_22))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.2.'$vocabulary']", lpath_22 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.2.'$vocabulary']", lpath_22))
             return False
     return True
 
@@ -1501,24 +1514,24 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$TightSchema'.'|'.2.type
             res = isinstance(pval, str) and pval == "number"
             if not res:
-                rep is None or rep.append(("unexpected _number [.'$TightSchema'.'|'.2.type]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.2.type]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected _number [.'$TightSchema'.'|'.2.type]", lpath_20))
+                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.2.type]", lpath_20))
                 return False
             continue
         if pfun := _jm_obj_8_map.get(prop):
             # handle 21 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_20 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.2]", lpath_20 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_20, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.2]", lpath_20))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.2]", lpath_20 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.2]", lpath_20))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1543,12 +1556,12 @@ def _jm_f_39(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.3.'$defs'.''
-        res = json_model_16(pval, lpath_24 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_24, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.3.'$defs'.'']", lpath_24 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.3.'$defs'.'']", lpath_24))
             return False
     return True
 
@@ -1568,16 +1581,16 @@ def _jm_f_41(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_25 if path is not None else None, rep):
+        lpath_25: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_25, rep):
             # handle 1 key props
             # .'$TightSchema'.'|'.3.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.3.'$vocabulary'.'$URI']", lpath_25 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.3.'$vocabulary'.'$URI']", lpath_25))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.3.'$vocabulary']", lpath_25 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.3.'$vocabulary']", lpath_25))
             return False
     return True
 
@@ -1686,24 +1699,24 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$TightSchema'.'|'.3.type
             res = isinstance(pval, str) and pval == "integer"
             if not res:
-                rep is None or rep.append(("unexpected _integer [.'$TightSchema'.'|'.3.type]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.3.type]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected _integer [.'$TightSchema'.'|'.3.type]", lpath_23))
+                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.3.type]", lpath_23))
                 return False
             continue
         if pfun := _jm_obj_9_map.get(prop):
             # handle 21 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_23 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.3]", lpath_23 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_23, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.3]", lpath_23))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.3]", lpath_23 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.3]", lpath_23))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1728,12 +1741,12 @@ def _jm_f_55(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_27: Path = (path + [ prop ]) if path is not None else None
+        lpath_27: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.4.'$defs'.''
-        res = json_model_16(pval, lpath_27 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_27, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.4.'$defs'.'']", lpath_27 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.4.'$defs'.'']", lpath_27))
             return False
     return True
 
@@ -1753,16 +1766,16 @@ def _jm_f_57(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_28: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_28 if path is not None else None, rep):
+        lpath_28: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_28, rep):
             # handle 1 key props
             # .'$TightSchema'.'|'.4.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.4.'$vocabulary'.'$URI']", lpath_28 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.4.'$vocabulary'.'$URI']", lpath_28))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.4.'$vocabulary']", lpath_28 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.4.'$vocabulary']", lpath_28))
             return False
     return True
 
@@ -1879,24 +1892,24 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_26: Path = (path + [ prop ]) if path is not None else None
+        lpath_26: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$TightSchema'.'|'.4.type
             res = isinstance(pval, str) and pval == "string"
             if not res:
-                rep is None or rep.append(("unexpected _string [.'$TightSchema'.'|'.4.type]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.4.type]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected _string [.'$TightSchema'.'|'.4.type]", lpath_26))
+                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.4.type]", lpath_26))
                 return False
             continue
         if pfun := _jm_obj_10_map.get(prop):
             # handle 23 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_26 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.4]", lpath_26 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_26, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.4]", lpath_26))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.4]", lpath_26 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.4]", lpath_26))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1921,12 +1934,12 @@ def _jm_f_72(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_30: Path = (path + [ prop ]) if path is not None else None
+        lpath_30: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.5.'$defs'.''
-        res = json_model_16(pval, lpath_30 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_30, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.5.'$defs'.'']", lpath_30 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.5.'$defs'.'']", lpath_30))
             return False
     return True
 
@@ -1946,16 +1959,16 @@ def _jm_f_74(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_31: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_31 if path is not None else None, rep):
+        lpath_31: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_31, rep):
             # handle 1 key props
             # .'$TightSchema'.'|'.5.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.5.'$vocabulary'.'$URI']", lpath_31 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.5.'$vocabulary'.'$URI']", lpath_31))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.5.'$vocabulary']", lpath_31 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.5.'$vocabulary']", lpath_31))
             return False
     return True
 
@@ -2064,24 +2077,24 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_29: Path = (path + [ prop ]) if path is not None else None
+        lpath_29: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$TightSchema'.'|'.5.type
             res = isinstance(pval, str) and pval == "array"
             if not res:
-                rep is None or rep.append(("unexpected _array [.'$TightSchema'.'|'.5.type]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.5.type]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected _array [.'$TightSchema'.'|'.5.type]", lpath_29))
+                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.5.type]", lpath_29))
                 return False
             continue
         if pfun := _jm_obj_11_map.get(prop):
             # handle 25 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_29 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.5]", lpath_29 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_29, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.5]", lpath_29))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.5]", lpath_29 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.5]", lpath_29))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2106,12 +2119,12 @@ def _jm_f_88(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_33: Path = (path + [ prop ]) if path is not None else None
+        lpath_33: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.6.'$defs'.''
-        res = json_model_16(pval, lpath_33 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_33, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.6.'$defs'.'']", lpath_33 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.6.'$defs'.'']", lpath_33))
             return False
     return True
 
@@ -2131,16 +2144,16 @@ def _jm_f_90(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_34: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_34 if path is not None else None, rep):
+        lpath_34: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_34, rep):
             # handle 1 key props
             # .'$TightSchema'.'|'.6.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.6.'$vocabulary'.'$URI']", lpath_34 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.6.'$vocabulary'.'$URI']", lpath_34))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.6.'$vocabulary']", lpath_34 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.6.'$vocabulary']", lpath_34))
             return False
     return True
 
@@ -2159,12 +2172,12 @@ def _jm_f_92(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_35: Path = (path + [ prop ]) if path is not None else None
+        lpath_35: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.6.dependentRequired.''
-        res = json_model_10(pval, lpath_35 if path is not None else None, rep)
+        res = json_model_10(pval, lpath_35, rep)
         if not res:
-            rep is None or rep.append(("unexpected $stringArray [.'$TightSchema'.'|'.6.dependentRequired.'']", lpath_35 if path is not None else None))
+            rep is None or rep.append(("unexpected $stringArray [.'$TightSchema'.'|'.6.dependentRequired.'']", lpath_35))
             return False
     return True
 
@@ -2176,12 +2189,12 @@ def _jm_f_93(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_36: Path = (path + [ prop ]) if path is not None else None
+        lpath_36: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.6.dependentSchemas.''
-        res = json_model_16(pval, lpath_36 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_36, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.6.dependentSchemas.'']", lpath_36 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.6.dependentSchemas.'']", lpath_36))
             return False
     return True
 
@@ -2233,16 +2246,16 @@ def _jm_f_99(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_37: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_37 if path is not None else None, rep):
+        lpath_37: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_37, rep):
             # handle 1 key props
             # .'$TightSchema'.'|'.6.patternProperties.'$REGEX'
-            res = json_model_16(pval, lpath_37 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.6.patternProperties.'$REGEX']", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.6.patternProperties.'$REGEX']", lpath_37))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.6.patternProperties]", lpath_37 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.6.patternProperties]", lpath_37))
             return False
     return True
 
@@ -2254,12 +2267,12 @@ def _jm_f_100(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_38: Path = (path + [ prop ]) if path is not None else None
+        lpath_38: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.6.properties.''
-        res = json_model_16(pval, lpath_38 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_38, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.6.properties.'']", lpath_38 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.6.properties.'']", lpath_38))
             return False
     return True
 
@@ -2297,24 +2310,24 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_32: Path = (path + [ prop ]) if path is not None else None
+        lpath_32: Path = (path, prop) if path is not None else None
         if prop == "type":
             # handle must type property
             must_count += 1
             # .'$TightSchema'.'|'.6.type
             res = isinstance(pval, str) and pval == "object"
             if not res:
-                rep is None or rep.append(("unexpected _object [.'$TightSchema'.'|'.6.type]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.6.type]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected _object [.'$TightSchema'.'|'.6.type]", lpath_32))
+                rep is None or rep.append(("invalid mandatory prop value [.'$TightSchema'.'|'.6.type]", lpath_32))
                 return False
             continue
         if pfun := _jm_obj_12_map.get(prop):
             # handle 26 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_32 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.6]", lpath_32 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_32, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.6]", lpath_32))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.6]", lpath_32 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.6]", lpath_32))
         return False
     if must_count != 1:
         if rep is not None:
@@ -2339,12 +2352,12 @@ def _jm_f_105(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_40: Path = (path + [ prop ]) if path is not None else None
+        lpath_40: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$TightSchema'.'|'.7.'$defs'.''
-        res = json_model_16(pval, lpath_40 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_40, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.7.'$defs'.'']", lpath_40 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$TightSchema'.'|'.7.'$defs'.'']", lpath_40))
             return False
     return True
 
@@ -2364,16 +2377,16 @@ def _jm_f_107(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_41: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_41 if path is not None else None, rep):
+        lpath_41: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_41, rep):
             # handle 1 key props
             # .'$TightSchema'.'|'.7.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.7.'$vocabulary'.'$URI']", lpath_41 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$TightSchema'.'|'.7.'$vocabulary'.'$URI']", lpath_41))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.7.'$vocabulary']", lpath_41 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.7.'$vocabulary']", lpath_41))
             return False
     return True
 
@@ -2455,14 +2468,14 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_39: Path = (path + [ prop ]) if path is not None else None
+        lpath_39: Path = (path, prop) if path is not None else None
         if pfun := _jm_obj_13_map.get(prop):
             # handle 25 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_39 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.7]", lpath_39 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_39, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$TightSchema'.'|'.7]", lpath_39))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.7]", lpath_39 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$TightSchema'.'|'.7]", lpath_39))
         return False
     return True
 
@@ -2763,5 +2776,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
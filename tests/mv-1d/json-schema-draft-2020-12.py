@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 json_model_12_map: PropMap
@@ -41,12 +54,12 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$core'.'$defs'.''
-        res = json_model_16(pval, lpath_1 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_1, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$core'.'$defs'.'']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$core'.'$defs'.'']", lpath_1))
             return False
     return True
 
@@ -57,16 +70,16 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_2 if path is not None else None, rep):
+        lpath_2: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_2, rep):
             # handle 1 key props
             # .'$core'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$core'.'$vocabulary'.'$URI']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$core'.'$vocabulary'.'$URI']", lpath_2))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$core'.'$vocabulary']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$core'.'$vocabulary']", lpath_2))
             return False
     return True
 
@@ -78,41 +91,41 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "$id":
             # handle may $id property
             # .'$core'.'$id'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$id']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$id']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$id']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$id']", lpath_0))
                 return False
             continue
         elif prop == "$ref":
             # handle may $ref property
             # .'$core'.'$ref'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$ref']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$ref']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$ref']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$ref']", lpath_0))
                 return False
             continue
         elif prop == "$defs":
             # handle may $defs property
             # .'$core'.'$defs'
-            res = _jm_obj_0(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$core'.'$defs']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$defs']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$core'.'$defs']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$defs']", lpath_0))
                 return False
             continue
         elif prop == "$anchor":
             # handle may $anchor property
             # .'$core'.'$anchor'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$anchor']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$anchor']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$anchor']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$anchor']", lpath_0))
                 return False
             continue
         elif prop == "$schema":
@@ -120,8 +133,8 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$core'.'$schema'
             res = isinstance(pval, str) and (pval == "https://json-schema.org/draft/2020-12/schema")
             if not res:
-                rep is None or rep.append(("unexpected _https://json-schema.org/draft/2020-12/schema [.'$core'.'$schema']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$schema']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected _https://json-schema.org/draft/2020-12/schema [.'$core'.'$schema']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$schema']", lpath_0))
                 return False
             continue
         elif prop == "$comment":
@@ -129,38 +142,38 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$core'.'$comment'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$core'.'$comment']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$comment']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$core'.'$comment']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$comment']", lpath_0))
                 return False
             continue
         elif prop == "$dynamicRef":
             # handle may $dynamicRef property
             # .'$core'.'$dynamicRef'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$dynamicRef']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$dynamicRef']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$dynamicRef']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$dynamicRef']", lpath_0))
                 return False
             continue
         elif prop == "$vocabulary":
             # handle may $vocabulary property
             # .'$core'.'$vocabulary'
-            res = _jm_obj_1(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_1(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$core'.'$vocabulary']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$vocabulary']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$core'.'$vocabulary']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$vocabulary']", lpath_0))
                 return False
             continue
         elif prop == "$dynamicAnchor":
             # handle may $dynamicAnchor property
             # .'$core'.'$dynamicAnchor'
-            res = json_model_2(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$dynamicAnchor']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$core'.'$dynamicAnchor']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $URI-REFERENCE [.'$core'.'$dynamicAnchor']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$core'.'$dynamicAnchor']", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$core']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$core']", lpath_0))
         return False
     return True
 
@@ -172,14 +185,14 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "title":
             # handle may title property
             # .'$meta'.title
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$meta'.title]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.title]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$meta'.title]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.title]", lpath_3))
                 return False
             continue
         elif prop == "default":
@@ -192,8 +205,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.examples
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$meta'.examples]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.examples]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$meta'.examples]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.examples]", lpath_3))
                 return False
             continue
         elif prop == "readOnly":
@@ -201,8 +214,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.readOnly
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$meta'.readOnly]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.readOnly]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$meta'.readOnly]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.readOnly]", lpath_3))
                 return False
             continue
         elif prop == "writeOnly":
@@ -210,8 +223,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.writeOnly
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$meta'.writeOnly]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.writeOnly]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$meta'.writeOnly]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.writeOnly]", lpath_3))
                 return False
             continue
         elif prop == "deprecated":
@@ -219,8 +232,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.deprecated
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$meta'.deprecated]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.deprecated]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$meta'.deprecated]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.deprecated]", lpath_3))
                 return False
             continue
         elif prop == "description":
@@ -228,11 +241,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$meta'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$meta'.description]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$meta'.description]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$meta'.description]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$meta'.description]", lpath_3))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$meta']", lpath_3 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$meta']", lpath_3))
         return False
     return True
 
@@ -244,14 +257,14 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "contentSchema":
             # handle may contentSchema property
             # .'$content'.contentSchema
-            res = json_model_16(pval, lpath_4 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$content'.contentSchema]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$content'.contentSchema]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$content'.contentSchema]", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$content'.contentSchema]", lpath_4))
                 return False
             continue
         elif prop == "contentEncoding":
@@ -259,8 +272,8 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$content'.contentEncoding
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$content'.contentEncoding]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$content'.contentEncoding]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$content'.contentEncoding]", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$content'.contentEncoding]", lpath_4))
                 return False
             continue
         elif prop == "contentMediaType":
@@ -268,11 +281,11 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$content'.contentMediaType
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$content'.contentMediaType]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$content'.contentMediaType]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$content'.contentMediaType]", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$content'.contentMediaType]", lpath_4))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$content']", lpath_4 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$content']", lpath_4))
         return False
     return True
 
@@ -284,26 +297,26 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "unevaluatedItems":
             # handle may unevaluatedItems property
             # .'$unevaluated'.unevaluatedItems
-            res = json_model_16(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$unevaluated'.unevaluatedItems]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$unevaluated'.unevaluatedItems]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$unevaluated'.unevaluatedItems]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$unevaluated'.unevaluatedItems]", lpath_5))
                 return False
             continue
         elif prop == "unevaluatedProperties":
             # handle may unevaluatedProperties property
             # .'$unevaluated'.unevaluatedProperties
-            res = json_model_16(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$unevaluated'.unevaluatedProperties]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$unevaluated'.unevaluatedProperties]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$unevaluated'.unevaluatedProperties]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$unevaluated'.unevaluatedProperties]", lpath_5))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$unevaluated']", lpath_5 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$unevaluated']", lpath_5))
         return False
     return True
 
@@ -315,17 +328,17 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "format":
             # handle may format property
             # .'$format'.format
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$format'.format]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$format'.format]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$format'.format]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$format'.format]", lpath_6))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$format']", lpath_6 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$format']", lpath_6))
         return False
     return True
 
@@ -345,11 +358,11 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$simpleTypesArray'.'@'.0
-            res = json_model_8(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_8(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $simpleTypes [.'$simpleTypesArray'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $simpleTypes [.'$simpleTypesArray'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -367,11 +380,11 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$stringArray'.'@'.0
             res = isinstance(arr_1_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$stringArray'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$stringArray'.'@'.0]", arr_1_lpath))
                 break
     if res:
         res = is_unique_array(val, path, rep)
@@ -404,12 +417,12 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$validation'.dependentRequired.''
-        res = json_model_10(pval, lpath_8 if path is not None else None, rep)
+        res = json_model_10(pval, lpath_8, rep)
         if not res:
-            rep is None or rep.append(("unexpected $stringArray [.'$validation'.dependentRequired.'']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected $stringArray [.'$validation'.dependentRequired.'']", lpath_8))
             return False
     return True
 
@@ -503,14 +516,14 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if pfun := json_model_12_map.get(prop):
             # handle 20 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_7 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$validation']", lpath_7 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_7, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$validation']", lpath_7))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$validation']", lpath_7 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$validation']", lpath_7))
         return False
     return True
 
@@ -521,11 +534,11 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$schemaArray'.'@'.0
-            res = json_model_16(arr_2_item, arr_2_lpath if path is not None else None, rep)
+            res = json_model_16(arr_2_item, arr_2_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.'@'.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$schemaArray'.'@'.0]", arr_2_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -544,12 +557,12 @@ def _jm_f_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$applicator'.dependentSchemas.''
-        res = json_model_16(pval, lpath_10 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_10, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$applicator'.dependentSchemas.'']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$applicator'.dependentSchemas.'']", lpath_10))
             return False
     return True
 
@@ -561,16 +574,16 @@ def _jm_f_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_11 if path is not None else None, rep):
+        lpath_11: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_11, rep):
             # handle 1 key props
             # .'$applicator'.patternProperties.'$REGEX'
-            res = json_model_16(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$applicator'.patternProperties.'$REGEX']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$applicator'.patternProperties.'$REGEX']", lpath_11))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$applicator'.patternProperties]", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$applicator'.patternProperties]", lpath_11))
             return False
     return True
 
@@ -582,12 +595,12 @@ def _jm_f_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$applicator'.properties.''
-        res = json_model_16(pval, lpath_12 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_12, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$applicator'.properties.'']", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$applicator'.properties.'']", lpath_12))
             return False
     return True
 
@@ -600,14 +613,14 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if pfun := json_model_14_map.get(prop):
             # handle 15 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_9 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$applicator']", lpath_9 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_9, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$applicator']", lpath_9))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$applicator']", lpath_9 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$applicator']", lpath_9))
         return False
     return True
 
@@ -627,12 +640,12 @@ def _jm_f_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$ObjectSchema'.'$defs'.''
-        res = json_model_16(pval, lpath_14 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_14, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.'$defs'.'']", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.'$defs'.'']", lpath_14))
             return False
     return True
 
@@ -652,16 +665,16 @@ def _jm_f_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_url(prop, lpath_15 if path is not None else None, rep):
+        lpath_15: Path = (path, prop) if path is not None else None
+        if is_valid_url(prop, lpath_15, rep):
             # handle 1 key props
             # .'$ObjectSchema'.'$vocabulary'.'$URI'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$ObjectSchema'.'$vocabulary'.'$URI']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$ObjectSchema'.'$vocabulary'.'$URI']", lpath_15))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$ObjectSchema'.'$vocabulary']", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$ObjectSchema'.'$vocabulary']", lpath_15))
             return False
     return True
 
@@ -703,12 +716,12 @@ def _jm_f_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$ObjectSchema'.dependentRequired.''
-        res = json_model_10(pval, lpath_16 if path is not None else None, rep)
+        res = json_model_10(pval, lpath_16, rep)
         if not res:
-            rep is None or rep.append(("unexpected $stringArray [.'$ObjectSchema'.dependentRequired.'']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected $stringArray [.'$ObjectSchema'.dependentRequired.'']", lpath_16))
             return False
     return True
 
@@ -720,12 +733,12 @@ def _jm_f_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$ObjectSchema'.dependentSchemas.''
-        res = json_model_16(pval, lpath_17 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_17, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.dependentSchemas.'']", lpath_17 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.dependentSchemas.'']", lpath_17))
             return False
     return True
 
@@ -825,16 +838,16 @@ def _jm_f_35(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_regex(prop, lpath_18 if path is not None else None, rep):
+        lpath_18: Path = (path, prop) if path is not None else None
+        if is_valid_regex(prop, lpath_18, rep):
             # handle 1 key props
             # .'$ObjectSchema'.patternProperties.'$REGEX'
-            res = json_model_16(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.patternProperties.'$REGEX']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.patternProperties.'$REGEX']", lpath_18))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$ObjectSchema'.patternProperties]", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$ObjectSchema'.patternProperties]", lpath_18))
             return False
     return True
 
@@ -846,12 +859,12 @@ def _jm_f_36(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$ObjectSchema'.properties.''
-        res = json_model_16(pval, lpath_19 if path is not None else None, rep)
+        res = json_model_16(pval, lpath_19, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.properties.'']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected $Schema [.'$ObjectSchema'.properties.'']", lpath_19))
             return False
     return True
 
@@ -913,14 +926,14 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         if pfun := json_model_15_map.get(prop):
             # handle 57 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_13 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$ObjectSchema']", lpath_13 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_13, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$ObjectSchema']", lpath_13))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$ObjectSchema']", lpath_13 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$ObjectSchema']", lpath_13))
         return False
     return True
 
@@ -1091,5 +1104,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -32,15 +45,15 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "mu1":
             # handle must mu1 property
             must_count += 1
             # .mu1
             res = pval is None
             if not res:
-                rep is None or rep.append(("not null [.mu1]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.mu1]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not null [.mu1]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.mu1]", lpath_0))
                 return False
             continue
         elif prop == "mu2":
@@ -49,8 +62,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .mu2
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.mu2]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.mu2]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a bool [.mu2]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.mu2]", lpath_0))
                 return False
             continue
         elif prop == "mu3":
@@ -59,8 +72,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .mu3
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.mu3]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.mu3]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.mu3]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.mu3]", lpath_0))
                 return False
             continue
         if prop == "ma1":
@@ -68,8 +81,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .ma1
             res = isinstance(pval, float) and pval >= 0.0
             if not res:
-                rep is None or rep.append(("not a 0.0 strict float [.ma1]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.ma1]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0.0 strict float [.ma1]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.ma1]", lpath_0))
                 return False
             continue
         elif prop == "ma2":
@@ -77,20 +90,20 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .ma2
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.ma2]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.ma2]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.ma2]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.ma2]", lpath_0))
                 return False
             continue
         elif prop == "ma3":
             # handle may ma3 property
             # .ma3
-            res = is_valid_date(pval, lpath_0 if path is not None else None, rep)
+            res = is_valid_date(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $DATE [.ma3]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.ma3]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $DATE [.ma3]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.ma3]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.]", lpath_0))
         return False
     if must_count != 3:
         if rep is not None:
@@ -125,5 +138,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
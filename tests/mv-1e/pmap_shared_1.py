@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -31,15 +44,15 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "a":
             # handle must a property
             must_count += 1
             # .'$Oo0'.a
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Oo0'.a]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Oo0'.a]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Oo0'.a]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Oo0'.a]", lpath_0))
                 return False
             continue
         elif prop == "b":
@@ -48,8 +61,8 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo0'.b
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Oo0'.b]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Oo0'.b]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Oo0'.b]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Oo0'.b]", lpath_0))
                 return False
             continue
         elif prop == "c":
@@ -58,8 +71,8 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo0'.c
             res = pval is None
             if not res:
-                rep is None or rep.append(("not null [.'$Oo0'.c]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Oo0'.c]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not null [.'$Oo0'.c]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Oo0'.c]", lpath_0))
                 return False
             continue
         elif prop == "d":
@@ -68,15 +81,15 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo0'.d
             res = isinstance(pval, float) and pval >= 0.0
             if not res:
-                rep is None or rep.append(("not a 0.0 strict float [.'$Oo0'.d]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Oo0'.d]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 0.0 strict float [.'$Oo0'.d]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Oo0'.d]", lpath_0))
                 return False
             continue
         # handle other props
         # .'$Oo0'.''
-        res = is_valid_date(pval, lpath_0 if path is not None else None, rep)
+        res = is_valid_date(pval, lpath_0, rep)
         if not res:
-            rep is None or rep.append(("unexpected $DATE [.'$Oo0'.'']", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected $DATE [.'$Oo0'.'']", lpath_0))
             return False
     if must_count != 4:
         if rep is not None:
@@ -100,15 +113,15 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "z":
             # handle must z property
             must_count += 1
             # .'$Oo1'.z
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Oo1'.z]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Oo1'.z]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Oo1'.z]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Oo1'.z]", lpath_1))
                 return False
             continue
         if prop == "a":
@@ -116,8 +129,8 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo1'.a
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Oo1'.a]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Oo1'.a]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Oo1'.a]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Oo1'.a]", lpath_1))
                 return False
             continue
         elif prop == "b":
@@ -125,8 +138,8 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo1'.b
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Oo1'.b]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Oo1'.b]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Oo1'.b]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Oo1'.b]", lpath_1))
                 return False
             continue
         elif prop == "c":
@@ -134,8 +147,8 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo1'.c
             res = pval is None
             if not res:
-                rep is None or rep.append(("not null [.'$Oo1'.c]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Oo1'.c]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not null [.'$Oo1'.c]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Oo1'.c]", lpath_1))
                 return False
             continue
         elif prop == "d":
@@ -143,11 +156,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo1'.d
             res = isinstance(pval, float) and pval >= 0.0
             if not res:
-                rep is None or rep.append(("not a 0.0 strict float [.'$Oo1'.d]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Oo1'.d]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a 0.0 strict float [.'$Oo1'.d]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Oo1'.d]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Oo1']", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Oo1']", lpath_1))
         return False
     if must_count != 1:
         if rep is not None:
@@ -165,15 +178,15 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "a":
             # handle must a property
             must_count += 1
             # .'$Oo2'.a
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Oo2'.a]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Oo2'.a]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Oo2'.a]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Oo2'.a]", lpath_2))
                 return False
             continue
         elif prop == "b":
@@ -182,8 +195,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo2'.b
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.'$Oo2'.b]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Oo2'.b]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.'$Oo2'.b]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Oo2'.b]", lpath_2))
                 return False
             continue
         elif prop == "c":
@@ -192,8 +205,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo2'.c
             res = pval is None
             if not res:
-                rep is None or rep.append(("not null [.'$Oo2'.c]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Oo2'.c]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not null [.'$Oo2'.c]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Oo2'.c]", lpath_2))
                 return False
             continue
         elif prop == "d":
@@ -202,8 +215,8 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo2'.d
             res = isinstance(pval, float) and pval >= 0.0
             if not res:
-                rep is None or rep.append(("not a 0.0 strict float [.'$Oo2'.d]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Oo2'.d]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not a 0.0 strict float [.'$Oo2'.d]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Oo2'.d]", lpath_2))
                 return False
             continue
         if prop == "y":
@@ -211,11 +224,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Oo2'.y
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Oo2'.y]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Oo2'.y]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Oo2'.y]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Oo2'.y]", lpath_2))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Oo2']", lpath_2 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Oo2']", lpath_2))
         return False
     if must_count != 4:
         if rep is not None:
@@ -276,5 +289,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -34,15 +47,15 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "a":
             # handle must a property
             must_count += 1
             # .a
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
             if not res:
-                rep is None or rep.append(("not a 1 strict int [.a]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.a]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 1 strict int [.a]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.a]", lpath_0))
                 return False
             continue
         elif prop == "b":
@@ -51,8 +64,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .b
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
             if not res:
-                rep is None or rep.append(("not a 1 strict int [.b]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.b]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 1 strict int [.b]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.b]", lpath_0))
                 return False
             continue
         if prop == "c":
@@ -60,26 +73,26 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .c
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
             if not res:
-                rep is None or rep.append(("not a 1 strict int [.c]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.c]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 1 strict int [.c]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.c]", lpath_0))
                 return False
             continue
-        if is_valid_date(prop, lpath_0 if path is not None else None, rep):
+        if is_valid_date(prop, lpath_0, rep):
             # handle 1 key props
             # .'$DATE'
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
             if not res:
-                rep is None or rep.append(("not a 1 strict int [.'$DATE']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 1 strict int [.'$DATE']", lpath_0))
                 return False
         elif _jm_re_0(prop, path, rep):
             # handle 1 re props
             # .'/foo/'
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
             if not res:
-                rep is None or rep.append(("not a 1 strict int [.'/foo/']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a 1 strict int [.'/foo/']", lpath_0))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.]", lpath_0))
             return False
     if must_count != 2:
         if rep is not None:
@@ -118,5 +131,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
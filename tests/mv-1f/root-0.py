@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -38,22 +51,22 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("id", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <id> [.'$Root']", path))
         return False
-    lpath = (path + [ "id" ]) if path is not None else None
+    lpath = (path, "id") if path is not None else None
     # .'$Root'.id
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 0
     if not res:
-        rep is None or rep.append(("unexpected =0 [.'$Root'.id]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <id> [.'$Root']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =0 [.'$Root'.id]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <id> [.'$Root']", lpath))
         return False
     if not ((pval := val.get("name", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <name> [.'$Root']", path))
         return False
-    lpath = (path + [ "name" ]) if path is not None else None
+    lpath = (path, "name") if path is not None else None
     # .'$Root'.name
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$Root'.name]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <name> [.'$Root']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$Root'.name]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <name> [.'$Root']", lpath))
         return False
     return True
 
@@ -88,5 +101,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -46,12 +59,12 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("rt", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <rt> [.'$Foo']", path))
         return False
-    lpath = (path + [ "rt" ]) if path is not None else None
+    lpath = (path, "rt") if path is not None else None
     # .'$Foo'.rt
-    res = json_model_5(pval, lpath if path is not None else None, rep)
+    res = json_model_5(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $root#Root [.'$Foo'.rt]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <rt> [.'$Foo']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $root#Root [.'$Foo'.rt]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <rt> [.'$Foo']", lpath))
         return False
     return True
 
@@ -79,22 +92,22 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("id", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <id> [.'$root#Root']", path))
         return False
-    lpath = (path + [ "id" ]) if path is not None else None
+    lpath = (path, "id") if path is not None else None
     # .'$root#Root'.id
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 0
     if not res:
-        rep is None or rep.append(("unexpected =0 [.'$root#Root'.id]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <id> [.'$root#Root']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =0 [.'$root#Root'.id]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <id> [.'$root#Root']", lpath))
         return False
     if not ((pval := val.get("name", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <name> [.'$root#Root']", path))
         return False
-    lpath = (path + [ "name" ]) if path is not None else None
+    lpath = (path, "name") if path is not None else None
     # .'$root#Root'.name
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$root#Root'.name]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <name> [.'$root#Root']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$root#Root'.name]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <name> [.'$root#Root']", lpath))
         return False
     return True
 
@@ -122,5 +135,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 _jm_cst_1: set[str]
@@ -105,14 +118,14 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$AIXPlatformModel'.name
             res = isinstance(pval, str) and pval == "AIX"
             if not res:
-                rep is None or rep.append(("unexpected _AIX [.'$AIXPlatformModel'.name]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AIXPlatformModel'.name]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected _AIX [.'$AIXPlatformModel'.name]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$AIXPlatformModel'.name]", lpath_0))
                 return False
             continue
         elif prop == "versions":
@@ -121,18 +134,18 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_0_idx, arr_0_item in enumerate(pval):
-                    arr_0_lpath: Path = ((lpath_0 if path is not None else None) + [ arr_0_idx ]) if (lpath_0 if path is not None else None) is not None else None
+                    arr_0_lpath: Path = (lpath_0, arr_0_idx) if lpath_0 is not None else None
                     # .'$AIXPlatformModel'.versions.0
                     res = ((arr_0_item is None or isinstance(arr_0_item, (bool, int, float, str)))) and arr_0_item in _jm_cst_0
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$AIXPlatformModel'.versions.0.'|']", arr_0_lpath if (lpath_0 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$AIXPlatformModel'.versions.0.'|']", arr_0_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$AIXPlatformModel'.versions]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AIXPlatformModel'.versions]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$AIXPlatformModel'.versions]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$AIXPlatformModel'.versions]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AIXPlatformModel']", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AIXPlatformModel']", lpath_0))
         return False
     return True
 
@@ -144,14 +157,14 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$AlpinePlatformModel'.name
             res = isinstance(pval, str) and pval == "Alpine"
             if not res:
-                rep is None or rep.append(("unexpected _Alpine [.'$AlpinePlatformModel'.name]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AlpinePlatformModel'.name]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected _Alpine [.'$AlpinePlatformModel'.name]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$AlpinePlatformModel'.name]", lpath_1))
                 return False
             continue
         elif prop == "versions":
@@ -160,18 +173,18 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_1_idx, arr_1_item in enumerate(pval):
-                    arr_1_lpath: Path = ((lpath_1 if path is not None else None) + [ arr_1_idx ]) if (lpath_1 if path is not None else None) is not None else None
+                    arr_1_lpath: Path = (lpath_1, arr_1_idx) if lpath_1 is not None else None
                     # .'$AlpinePlatformModel'.versions.0
                     res = isinstance(arr_1_item, str) and arr_1_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$AlpinePlatformModel'.versions.0]", arr_1_lpath if (lpath_1 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$AlpinePlatformModel'.versions.0]", arr_1_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$AlpinePlatformModel'.versions]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AlpinePlatformModel'.versions]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$AlpinePlatformModel'.versions]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$AlpinePlatformModel'.versions]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AlpinePlatformModel']", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AlpinePlatformModel']", lpath_1))
         return False
     return True
 
@@ -184,14 +197,14 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$AmazonLinuxPlatformModel'.name
             res = isinstance(pval, str) and pval == "Amazon Linux"
             if not res:
-                rep is None or rep.append(("unexpected _Amazon Linux [.'$AmazonLinuxPlatformModel'.name]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AmazonLinuxPlatformModel'.name]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected _Amazon Linux [.'$AmazonLinuxPlatformModel'.name]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$AmazonLinuxPlatformModel'.name]", lpath_2))
                 return False
             continue
         elif prop == "versions":
@@ -200,18 +213,18 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_2_idx, arr_2_item in enumerate(pval):
-                    arr_2_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_2_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_2_lpath: Path = (lpath_2, arr_2_idx) if lpath_2 is not None else None
                     # .'$AmazonLinuxPlatformModel'.versions.0
                     res = ((arr_2_item is None or isinstance(arr_2_item, (bool, int, float, str)))) and arr_2_item in _jm_cst_1
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$AmazonLinuxPlatformModel'.versions.0.'|']", arr_2_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$AmazonLinuxPlatformModel'.versions.0.'|']", arr_2_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$AmazonLinuxPlatformModel'.versions]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AmazonLinuxPlatformModel'.versions]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$AmazonLinuxPlatformModel'.versions]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$AmazonLinuxPlatformModel'.versions]", lpath_2))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AmazonLinuxPlatformModel']", lpath_2 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AmazonLinuxPlatformModel']", lpath_2))
         return False
     return True
 
@@ -224,14 +237,14 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$AmazonPlatformModel'.name
             res = isinstance(pval, str) and pval == "Amazon"
             if not res:
-                rep is None or rep.append(("unexpected _Amazon [.'$AmazonPlatformModel'.name]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AmazonPlatformModel'.name]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected _Amazon [.'$AmazonPlatformModel'.name]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$AmazonPlatformModel'.name]", lpath_3))
                 return False
             continue
         elif prop == "versions":
@@ -240,18 +253,18 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_3_idx, arr_3_item in enumerate(pval):
-                    arr_3_lpath: Path = ((lpath_3 if path is not None else None) + [ arr_3_idx ]) if (lpath_3 if path is not None else None) is not None else None
+                    arr_3_lpath: Path = (lpath_3, arr_3_idx) if lpath_3 is not None else None
                     # .'$AmazonPlatformModel'.versions.0
                     res = ((arr_3_item is None or isinstance(arr_3_item, (bool, int, float, str)))) and arr_3_item in _jm_cst_2
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$AmazonPlatformModel'.versions.0.'|']", arr_3_lpath if (lpath_3 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$AmazonPlatformModel'.versions.0.'|']", arr_3_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$AmazonPlatformModel'.versions]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AmazonPlatformModel'.versions]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$AmazonPlatformModel'.versions]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$AmazonPlatformModel'.versions]", lpath_3))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AmazonPlatformModel']", lpath_3 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AmazonPlatformModel']", lpath_3))
         return False
     return True
 
@@ -263,14 +276,14 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$ArchLinuxPlatformModel'.name
             res = isinstance(pval, str) and pval == "ArchLinux"
             if not res:
-                rep is None or rep.append(("unexpected _ArchLinux [.'$ArchLinuxPlatformModel'.name]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ArchLinuxPlatformModel'.name]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected _ArchLinux [.'$ArchLinuxPlatformModel'.name]", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$ArchLinuxPlatformModel'.name]", lpath_4))
                 return False
             continue
         elif prop == "versions":
@@ -279,18 +292,18 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_4_idx, arr_4_item in enumerate(pval):
-                    arr_4_lpath: Path = ((lpath_4 if path is not None else None) + [ arr_4_idx ]) if (lpath_4 if path is not None else None) is not None else None
+                    arr_4_lpath: Path = (lpath_4, arr_4_idx) if lpath_4 is not None else None
                     # .'$ArchLinuxPlatformModel'.versions.0
                     res = isinstance(arr_4_item, str) and arr_4_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$ArchLinuxPlatformModel'.versions.0]", arr_4_lpath if (lpath_4 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$ArchLinuxPlatformModel'.versions.0]", arr_4_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$ArchLinuxPlatformModel'.versions]", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ArchLinuxPlatformModel'.versions]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$ArchLinuxPlatformModel'.versions]", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$ArchLinuxPlatformModel'.versions]", lpath_4))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$ArchLinuxPlatformModel']", lpath_4 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$ArchLinuxPlatformModel']", lpath_4))
         return False
     return True
 
@@ -303,14 +316,14 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$AstraLinuxPlatformModel'.name
             res = isinstance(pval, str) and pval == "Astra Linux"
             if not res:
-                rep is None or rep.append(("unexpected _Astra Linux [.'$AstraLinuxPlatformModel'.name]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AstraLinuxPlatformModel'.name]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected _Astra Linux [.'$AstraLinuxPlatformModel'.name]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$AstraLinuxPlatformModel'.name]", lpath_5))
                 return False
             continue
         elif prop == "versions":
@@ -319,18 +332,18 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_5_idx, arr_5_item in enumerate(pval):
-                    arr_5_lpath: Path = ((lpath_5 if path is not None else None) + [ arr_5_idx ]) if (lpath_5 if path is not None else None) is not None else None
+                    arr_5_lpath: Path = (lpath_5, arr_5_idx) if lpath_5 is not None else None
                     # .'$AstraLinuxPlatformModel'.versions.0
                     res = ((arr_5_item is None or isinstance(arr_5_item, (bool, int, float, str)))) and arr_5_item in _jm_cst_3
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$AstraLinuxPlatformModel'.versions.0.'|']", arr_5_lpath if (lpath_5 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$AstraLinuxPlatformModel'.versions.0.'|']", arr_5_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$AstraLinuxPlatformModel'.versions]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AstraLinuxPlatformModel'.versions]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$AstraLinuxPlatformModel'.versions]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$AstraLinuxPlatformModel'.versions]", lpath_5))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AstraLinuxPlatformModel']", lpath_5 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AstraLinuxPlatformModel']", lpath_5))
         return False
     return True
 
@@ -342,14 +355,14 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$ClearLinuxPlatformModel'.name
             res = isinstance(pval, str) and pval == "ClearLinux"
             if not res:
-                rep is None or rep.append(("unexpected _ClearLinux [.'$ClearLinuxPlatformModel'.name]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ClearLinuxPlatformModel'.name]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected _ClearLinux [.'$ClearLinuxPlatformModel'.name]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$ClearLinuxPlatformModel'.name]", lpath_6))
                 return False
             continue
         elif prop == "versions":
@@ -358,18 +371,18 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_6_idx, arr_6_item in enumerate(pval):
-                    arr_6_lpath: Path = ((lpath_6 if path is not None else None) + [ arr_6_idx ]) if (lpath_6 if path is not None else None) is not None else None
+                    arr_6_lpath: Path = (lpath_6, arr_6_idx) if lpath_6 is not None else None
                     # .'$ClearLinuxPlatformModel'.versions.0
                     res = isinstance(arr_6_item, str) and arr_6_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$ClearLinuxPlatformModel'.versions.0]", arr_6_lpath if (lpath_6 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$ClearLinuxPlatformModel'.versions.0]", arr_6_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$ClearLinuxPlatformModel'.versions]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ClearLinuxPlatformModel'.versions]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$ClearLinuxPlatformModel'.versions]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$ClearLinuxPlatformModel'.versions]", lpath_6))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$ClearLinuxPlatformModel']", lpath_6 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$ClearLinuxPlatformModel']", lpath_6))
         return False
     return True
 
@@ -382,14 +395,14 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$CumulusPlatformModel'.name
             res = isinstance(pval, str) and pval == "Cumulus"
             if not res:
-                rep is None or rep.append(("unexpected _Cumulus [.'$CumulusPlatformModel'.name]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$CumulusPlatformModel'.name]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected _Cumulus [.'$CumulusPlatformModel'.name]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$CumulusPlatformModel'.name]", lpath_7))
                 return False
             continue
         elif prop == "versions":
@@ -398,18 +411,18 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_7_idx, arr_7_item in enumerate(pval):
-                    arr_7_lpath: Path = ((lpath_7 if path is not None else None) + [ arr_7_idx ]) if (lpath_7 if path is not None else None) is not None else None
+                    arr_7_lpath: Path = (lpath_7, arr_7_idx) if lpath_7 is not None else None
                     # .'$CumulusPlatformModel'.versions.0
                     res = ((arr_7_item is None or isinstance(arr_7_item, (bool, int, float, str)))) and arr_7_item in _jm_cst_4
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$CumulusPlatformModel'.versions.0.'|']", arr_7_lpath if (lpath_7 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$CumulusPlatformModel'.versions.0.'|']", arr_7_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$CumulusPlatformModel'.versions]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$CumulusPlatformModel'.versions]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$CumulusPlatformModel'.versions]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$CumulusPlatformModel'.versions]", lpath_7))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$CumulusPlatformModel']", lpath_7 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$CumulusPlatformModel']", lpath_7))
         return False
     return True
 
@@ -422,14 +435,14 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$DebianPlatformModel'.name
             res = isinstance(pval, str) and pval == "Debian"
             if not res:
-                rep is None or rep.append(("unexpected _Debian [.'$DebianPlatformModel'.name]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$DebianPlatformModel'.name]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected _Debian [.'$DebianPlatformModel'.name]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$DebianPlatformModel'.name]", lpath_8))
                 return False
             continue
         elif prop == "versions":
@@ -438,18 +451,18 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_8_idx, arr_8_item in enumerate(pval):
-                    arr_8_lpath: Path = ((lpath_8 if path is not None else None) + [ arr_8_idx ]) if (lpath_8 if path is not None else None) is not None else None
+                    arr_8_lpath: Path = (lpath_8, arr_8_idx) if lpath_8 is not None else None
                     # .'$DebianPlatformModel'.versions.0
                     res = ((arr_8_item is None or isinstance(arr_8_item, (bool, int, float, str)))) and arr_8_item in _jm_cst_5
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$DebianPlatformModel'.versions.0.'|']", arr_8_lpath if (lpath_8 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$DebianPlatformModel'.versions.0.'|']", arr_8_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$DebianPlatformModel'.versions]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$DebianPlatformModel'.versions]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$DebianPlatformModel'.versions]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$DebianPlatformModel'.versions]", lpath_8))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$DebianPlatformModel']", lpath_8 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$DebianPlatformModel']", lpath_8))
         return False
     return True
 
@@ -462,14 +475,14 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$DellOSPlatformModel'.name
             res = isinstance(pval, str) and pval == "DellOS"
             if not res:
-                rep is None or rep.append(("unexpected _DellOS [.'$DellOSPlatformModel'.name]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$DellOSPlatformModel'.name]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected _DellOS [.'$DellOSPlatformModel'.name]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$DellOSPlatformModel'.name]", lpath_9))
                 return False
             continue
         elif prop == "versions":
@@ -478,18 +491,18 @@ def json_model_11(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_9_idx, arr_9_item in enumerate(pval):
-                    arr_9_lpath: Path = ((lpath_9 if path is not None else None) + [ arr_9_idx ]) if (lpath_9 if path is not None else None) is not None else None
+                    arr_9_lpath: Path = (lpath_9, arr_9_idx) if lpath_9 is not None else None
                     # .'$DellOSPlatformModel'.versions.0
                     res = ((arr_9_item is None or isinstance(arr_9_item, (bool, int, float, str)))) and arr_9_item in _jm_cst_6
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$DellOSPlatformModel'.versions.0.'|']", arr_9_lpath if (lpath_9 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$DellOSPlatformModel'.versions.0.'|']", arr_9_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$DellOSPlatformModel'.versions]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$DellOSPlatformModel'.versions]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$DellOSPlatformModel'.versions]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$DellOSPlatformModel'.versions]", lpath_9))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$DellOSPlatformModel']", lpath_9 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$DellOSPlatformModel']", lpath_9))
         return False
     return True
 
@@ -502,14 +515,14 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$DevuanPlatformModel'.name
             res = isinstance(pval, str) and pval == "Devuan"
             if not res:
-                rep is None or rep.append(("unexpected _Devuan [.'$DevuanPlatformModel'.name]", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$DevuanPlatformModel'.name]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected _Devuan [.'$DevuanPlatformModel'.name]", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'$DevuanPlatformModel'.name]", lpath_10))
                 return False
             continue
         elif prop == "versions":
@@ -518,18 +531,18 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_10_idx, arr_10_item in enumerate(pval):
-                    arr_10_lpath: Path = ((lpath_10 if path is not None else None) + [ arr_10_idx ]) if (lpath_10 if path is not None else None) is not None else None
+                    arr_10_lpath: Path = (lpath_10, arr_10_idx) if lpath_10 is not None else None
                     # .'$DevuanPlatformModel'.versions.0
                     res = ((arr_10_item is None or isinstance(arr_10_item, (bool, int, float, str)))) and arr_10_item in _jm_cst_7
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$DevuanPlatformModel'.versions.0.'|']", arr_10_lpath if (lpath_10 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$DevuanPlatformModel'.versions.0.'|']", arr_10_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$DevuanPlatformModel'.versions]", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$DevuanPlatformModel'.versions]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$DevuanPlatformModel'.versions]", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'$DevuanPlatformModel'.versions]", lpath_10))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$DevuanPlatformModel']", lpath_10 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$DevuanPlatformModel']", lpath_10))
         return False
     return True
 
@@ -542,14 +555,14 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$DragonFlyBSDPlatformModel'.name
             res = isinstance(pval, str) and pval == "DragonFlyBSD"
             if not res:
-                rep is None or rep.append(("unexpected _DragonFlyBSD [.'$DragonFlyBSDPlatformModel'.name]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$DragonFlyBSDPlatformModel'.name]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected _DragonFlyBSD [.'$DragonFlyBSDPlatformModel'.name]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$DragonFlyBSDPlatformModel'.name]", lpath_11))
                 return False
             continue
         elif prop == "versions":
@@ -558,18 +571,18 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_11_idx, arr_11_item in enumerate(pval):
-                    arr_11_lpath: Path = ((lpath_11 if path is not None else None) + [ arr_11_idx ]) if (lpath_11 if path is not None else None) is not None else None
+                    arr_11_lpath: Path = (lpath_11, arr_11_idx) if lpath_11 is not None else None
                     # .'$DragonFlyBSDPlatformModel'.versions.0
                     res = ((arr_11_item is None or isinstance(arr_11_item, (bool, int, float, str)))) and arr_11_item in _jm_cst_8
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$DragonFlyBSDPlatformModel'.versions.0.'|']", arr_11_lpath if (lpath_11 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$DragonFlyBSDPlatformModel'.versions.0.'|']", arr_11_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$DragonFlyBSDPlatformModel'.versions]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$DragonFlyBSDPlatformModel'.versions]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$DragonFlyBSDPlatformModel'.versions]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$DragonFlyBSDPlatformModel'.versions]", lpath_11))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$DragonFlyBSDPlatformModel']", lpath_11 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$DragonFlyBSDPlatformModel']", lpath_11))
         return False
     return True
 
@@ -582,14 +595,14 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$ELPlatformModel'.name
             res = isinstance(pval, str) and pval == "EL"
             if not res:
-                rep is None or rep.append(("unexpected _EL [.'$ELPlatformModel'.name]", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ELPlatformModel'.name]", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected _EL [.'$ELPlatformModel'.name]", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$ELPlatformModel'.name]", lpath_12))
                 return False
             continue
         elif prop == "versions":
@@ -598,18 +611,18 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_12_idx, arr_12_item in enumerate(pval):
-                    arr_12_lpath: Path = ((lpath_12 if path is not None else None) + [ arr_12_idx ]) if (lpath_12 if path is not None else None) is not None else None
+                    arr_12_lpath: Path = (lpath_12, arr_12_idx) if lpath_12 is not None else None
                     # .'$ELPlatformModel'.versions.0
                     res = ((arr_12_item is None or isinstance(arr_12_item, (bool, int, float, str)))) and arr_12_item in _jm_cst_9
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$ELPlatformModel'.versions.0.'|']", arr_12_lpath if (lpath_12 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$ELPlatformModel'.versions.0.'|']", arr_12_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$ELPlatformModel'.versions]", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ELPlatformModel'.versions]", lpath_12 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$ELPlatformModel'.versions]", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$ELPlatformModel'.versions]", lpath_12))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$ELPlatformModel']", lpath_12 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$ELPlatformModel']", lpath_12))
         return False
     return True
 
@@ -622,14 +635,14 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$FedoraPlatformModel'.name
             res = isinstance(pval, str) and (pval == "Fedora")
             if not res:
-                rep is None or rep.append(("unexpected _Fedora [.'$FedoraPlatformModel'.name]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$FedoraPlatformModel'.name]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected _Fedora [.'$FedoraPlatformModel'.name]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$FedoraPlatformModel'.name]", lpath_13))
                 return False
             continue
         elif prop == "versions":
@@ -638,18 +651,18 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_13_idx, arr_13_item in enumerate(pval):
-                    arr_13_lpath: Path = ((lpath_13 if path is not None else None) + [ arr_13_idx ]) if (lpath_13 if path is not None else None) is not None else None
+                    arr_13_lpath: Path = (lpath_13, arr_13_idx) if lpath_13 is not None else None
                     # .'$FedoraPlatformModel'.versions.0
                     res = ((arr_13_item is None or isinstance(arr_13_item, (bool, int, float, str)))) and arr_13_item in _jm_cst_10
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$FedoraPlatformModel'.versions.0.'|']", arr_13_lpath if (lpath_13 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$FedoraPlatformModel'.versions.0.'|']", arr_13_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$FedoraPlatformModel'.versions]", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$FedoraPlatformModel'.versions]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$FedoraPlatformModel'.versions]", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$FedoraPlatformModel'.versions]", lpath_13))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$FedoraPlatformModel']", lpath_13 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$FedoraPlatformModel']", lpath_13))
         return False
     return True
 
@@ -662,14 +675,14 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$FreeBSDPlatformModel'.name
             res = isinstance(pval, str) and pval == "FreeBSD"
             if not res:
-                rep is None or rep.append(("unexpected _FreeBSD [.'$FreeBSDPlatformModel'.name]", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$FreeBSDPlatformModel'.name]", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected _FreeBSD [.'$FreeBSDPlatformModel'.name]", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$FreeBSDPlatformModel'.name]", lpath_14))
                 return False
             continue
         elif prop == "versions":
@@ -678,18 +691,18 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_14_idx, arr_14_item in enumerate(pval):
-                    arr_14_lpath: Path = ((lpath_14 if path is not None else None) + [ arr_14_idx ]) if (lpath_14 if path is not None else None) is not None else None
+                    arr_14_lpath: Path = (lpath_14, arr_14_idx) if lpath_14 is not None else None
                     # .'$FreeBSDPlatformModel'.versions.0
                     res = ((arr_14_item is None or isinstance(arr_14_item, (bool, int, float, str)))) and arr_14_item in _jm_cst_11
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$FreeBSDPlatformModel'.versions.0.'|']", arr_14_lpath if (lpath_14 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$FreeBSDPlatformModel'.versions.0.'|']", arr_14_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$FreeBSDPlatformModel'.versions]", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$FreeBSDPlatformModel'.versions]", lpath_14 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$FreeBSDPlatformModel'.versions]", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$FreeBSDPlatformModel'.versions]", lpath_14))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$FreeBSDPlatformModel']", lpath_14 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$FreeBSDPlatformModel']", lpath_14))
         return False
     return True
 
@@ -701,14 +714,14 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$GenericBSDPlatformModel'.name
             res = isinstance(pval, str) and pval == "GenericBSD"
             if not res:
-                rep is None or rep.append(("unexpected _GenericBSD [.'$GenericBSDPlatformModel'.name]", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GenericBSDPlatformModel'.name]", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected _GenericBSD [.'$GenericBSDPlatformModel'.name]", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$GenericBSDPlatformModel'.name]", lpath_15))
                 return False
             continue
         elif prop == "versions":
@@ -717,18 +730,18 @@ def json_model_17(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_15_idx, arr_15_item in enumerate(pval):
-                    arr_15_lpath: Path = ((lpath_15 if path is not None else None) + [ arr_15_idx ]) if (lpath_15 if path is not None else None) is not None else None
+                    arr_15_lpath: Path = (lpath_15, arr_15_idx) if lpath_15 is not None else None
                     # .'$GenericBSDPlatformModel'.versions.0
                     res = isinstance(arr_15_item, str) and arr_15_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$GenericBSDPlatformModel'.versions.0]", arr_15_lpath if (lpath_15 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$GenericBSDPlatformModel'.versions.0]", arr_15_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$GenericBSDPlatformModel'.versions]", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GenericBSDPlatformModel'.versions]", lpath_15 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$GenericBSDPlatformModel'.versions]", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$GenericBSDPlatformModel'.versions]", lpath_15))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$GenericBSDPlatformModel']", lpath_15 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$GenericBSDPlatformModel']", lpath_15))
         return False
     return True
 
@@ -740,14 +753,14 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$GenericLinuxPlatformModel'.name
             res = isinstance(pval, str) and pval == "GenericLinux"
             if not res:
-                rep is None or rep.append(("unexpected _GenericLinux [.'$GenericLinuxPlatformModel'.name]", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GenericLinuxPlatformModel'.name]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected _GenericLinux [.'$GenericLinuxPlatformModel'.name]", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$GenericLinuxPlatformModel'.name]", lpath_16))
                 return False
             continue
         elif prop == "versions":
@@ -756,18 +769,18 @@ def json_model_18(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_16_idx, arr_16_item in enumerate(pval):
-                    arr_16_lpath: Path = ((lpath_16 if path is not None else None) + [ arr_16_idx ]) if (lpath_16 if path is not None else None) is not None else None
+                    arr_16_lpath: Path = (lpath_16, arr_16_idx) if lpath_16 is not None else None
                     # .'$GenericLinuxPlatformModel'.versions.0
                     res = isinstance(arr_16_item, str) and arr_16_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$GenericLinuxPlatformModel'.versions.0]", arr_16_lpath if (lpath_16 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$GenericLinuxPlatformModel'.versions.0]", arr_16_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$GenericLinuxPlatformModel'.versions]", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GenericLinuxPlatformModel'.versions]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$GenericLinuxPlatformModel'.versions]", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$GenericLinuxPlatformModel'.versions]", lpath_16))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$GenericLinuxPlatformModel']", lpath_16 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$GenericLinuxPlatformModel']", lpath_16))
         return False
     return True
 
@@ -779,14 +792,14 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$GenericUNIXPlatformModel'.name
             res = isinstance(pval, str) and pval == "GenericUNIX"
             if not res:
-                rep is None or rep.append(("unexpected _GenericUNIX [.'$GenericUNIXPlatformModel'.name]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GenericUNIXPlatformModel'.name]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected _GenericUNIX [.'$GenericUNIXPlatformModel'.name]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$GenericUNIXPlatformModel'.name]", lpath_17))
                 return False
             continue
         elif prop == "versions":
@@ -795,18 +808,18 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_17_idx, arr_17_item in enumerate(pval):
-                    arr_17_lpath: Path = ((lpath_17 if path is not None else None) + [ arr_17_idx ]) if (lpath_17 if path is not None else None) is not None else None
+                    arr_17_lpath: Path = (lpath_17, arr_17_idx) if lpath_17 is not None else None
                     # .'$GenericUNIXPlatformModel'.versions.0
                     res = isinstance(arr_17_item, str) and arr_17_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$GenericUNIXPlatformModel'.versions.0]", arr_17_lpath if (lpath_17 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$GenericUNIXPlatformModel'.versions.0]", arr_17_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$GenericUNIXPlatformModel'.versions]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GenericUNIXPlatformModel'.versions]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$GenericUNIXPlatformModel'.versions]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$GenericUNIXPlatformModel'.versions]", lpath_17))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$GenericUNIXPlatformModel']", lpath_17 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$GenericUNIXPlatformModel']", lpath_17))
         return False
     return True
 
@@ -818,14 +831,14 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$GentooPlatformModel'.name
             res = isinstance(pval, str) and pval == "Gentoo"
             if not res:
-                rep is None or rep.append(("unexpected _Gentoo [.'$GentooPlatformModel'.name]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GentooPlatformModel'.name]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected _Gentoo [.'$GentooPlatformModel'.name]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$GentooPlatformModel'.name]", lpath_18))
                 return False
             continue
         elif prop == "versions":
@@ -834,18 +847,18 @@ def json_model_20(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_18_idx, arr_18_item in enumerate(pval):
-                    arr_18_lpath: Path = ((lpath_18 if path is not None else None) + [ arr_18_idx ]) if (lpath_18 if path is not None else None) is not None else None
+                    arr_18_lpath: Path = (lpath_18, arr_18_idx) if lpath_18 is not None else None
                     # .'$GentooPlatformModel'.versions.0
                     res = isinstance(arr_18_item, str) and arr_18_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$GentooPlatformModel'.versions.0]", arr_18_lpath if (lpath_18 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$GentooPlatformModel'.versions.0]", arr_18_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$GentooPlatformModel'.versions]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GentooPlatformModel'.versions]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$GentooPlatformModel'.versions]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$GentooPlatformModel'.versions]", lpath_18))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$GentooPlatformModel']", lpath_18 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$GentooPlatformModel']", lpath_18))
         return False
     return True
 
@@ -858,14 +871,14 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$HardenedBSDPlatformModel'.name
             res = isinstance(pval, str) and pval == "HardenedBSD"
             if not res:
-                rep is None or rep.append(("unexpected _HardenedBSD [.'$HardenedBSDPlatformModel'.name]", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$HardenedBSDPlatformModel'.name]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected _HardenedBSD [.'$HardenedBSDPlatformModel'.name]", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$HardenedBSDPlatformModel'.name]", lpath_19))
                 return False
             continue
         elif prop == "versions":
@@ -874,18 +887,18 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_19_idx, arr_19_item in enumerate(pval):
-                    arr_19_lpath: Path = ((lpath_19 if path is not None else None) + [ arr_19_idx ]) if (lpath_19 if path is not None else None) is not None else None
+                    arr_19_lpath: Path = (lpath_19, arr_19_idx) if lpath_19 is not None else None
                     # .'$HardenedBSDPlatformModel'.versions.0
                     res = ((arr_19_item is None or isinstance(arr_19_item, (bool, int, float, str)))) and arr_19_item in _jm_cst_12
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$HardenedBSDPlatformModel'.versions.0.'|']", arr_19_lpath if (lpath_19 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$HardenedBSDPlatformModel'.versions.0.'|']", arr_19_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$HardenedBSDPlatformModel'.versions]", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$HardenedBSDPlatformModel'.versions]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$HardenedBSDPlatformModel'.versions]", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$HardenedBSDPlatformModel'.versions]", lpath_19))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$HardenedBSDPlatformModel']", lpath_19 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$HardenedBSDPlatformModel']", lpath_19))
         return False
     return True
 
@@ -897,14 +910,14 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$IOSPlatformModel'.name
             res = isinstance(pval, str) and pval == "IOS"
             if not res:
-                rep is None or rep.append(("unexpected _IOS [.'$IOSPlatformModel'.name]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$IOSPlatformModel'.name]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected _IOS [.'$IOSPlatformModel'.name]", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$IOSPlatformModel'.name]", lpath_20))
                 return False
             continue
         elif prop == "versions":
@@ -913,18 +926,18 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_20_idx, arr_20_item in enumerate(pval):
-                    arr_20_lpath: Path = ((lpath_20 if path is not None else None) + [ arr_20_idx ]) if (lpath_20 if path is not None else None) is not None else None
+                    arr_20_lpath: Path = (lpath_20, arr_20_idx) if lpath_20 is not None else None
                     # .'$IOSPlatformModel'.versions.0
                     res = isinstance(arr_20_item, str) and arr_20_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$IOSPlatformModel'.versions.0]", arr_20_lpath if (lpath_20 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$IOSPlatformModel'.versions.0]", arr_20_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$IOSPlatformModel'.versions]", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$IOSPlatformModel'.versions]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$IOSPlatformModel'.versions]", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$IOSPlatformModel'.versions]", lpath_20))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$IOSPlatformModel']", lpath_20 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$IOSPlatformModel']", lpath_20))
         return False
     return True
 
@@ -936,14 +949,14 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$JunosPlatformModel'.name
             res = isinstance(pval, str) and pval == "Junos"
             if not res:
-                rep is None or rep.append(("unexpected _Junos [.'$JunosPlatformModel'.name]", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$JunosPlatformModel'.name]", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected _Junos [.'$JunosPlatformModel'.name]", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$JunosPlatformModel'.name]", lpath_21))
                 return False
             continue
         elif prop == "versions":
@@ -952,18 +965,18 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_21_idx, arr_21_item in enumerate(pval):
-                    arr_21_lpath: Path = ((lpath_21 if path is not None else None) + [ arr_21_idx ]) if (lpath_21 if path is not None else None) is not None else None
+                    arr_21_lpath: Path = (lpath_21, arr_21_idx) if lpath_21 is not None else None
                     # .'$JunosPlatformModel'.versions.0
                     res = isinstance(arr_21_item, str) and arr_21_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$JunosPlatformModel'.versions.0]", arr_21_lpath if (lpath_21 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$JunosPlatformModel'.versions.0]", arr_21_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$JunosPlatformModel'.versions]", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$JunosPlatformModel'.versions]", lpath_21 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$JunosPlatformModel'.versions]", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$JunosPlatformModel'.versions]", lpath_21))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$JunosPlatformModel']", lpath_21 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$JunosPlatformModel']", lpath_21))
         return False
     return True
 
@@ -976,14 +989,14 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
+        lpath_22: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$KaliPlatformModel'.name
             res = isinstance(pval, str) and pval == "Kali"
             if not res:
-                rep is None or rep.append(("unexpected _Kali [.'$KaliPlatformModel'.name]", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$KaliPlatformModel'.name]", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected _Kali [.'$KaliPlatformModel'.name]", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.'$KaliPlatformModel'.name]", lpath_22))
                 return False
             continue
         elif prop == "versions":
@@ -992,18 +1005,18 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_22_idx, arr_22_item in enumerate(pval):
-                    arr_22_lpath: Path = ((lpath_22 if path is not None else None) + [ arr_22_idx ]) if (lpath_22 if path is not None else None) is not None else None
+                    arr_22_lpath: Path = (lpath_22, arr_22_idx) if lpath_22 is not None else None
                     # .'$KaliPlatformModel'.versions.0
                     res = ((arr_22_item is None or isinstance(arr_22_item, (bool, int, float, str)))) and arr_22_item in _jm_cst_13
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$KaliPlatformModel'.versions.0.'|']", arr_22_lpath if (lpath_22 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$KaliPlatformModel'.versions.0.'|']", arr_22_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$KaliPlatformModel'.versions]", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$KaliPlatformModel'.versions]", lpath_22 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$KaliPlatformModel'.versions]", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.'$KaliPlatformModel'.versions]", lpath_22))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$KaliPlatformModel']", lpath_22 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$KaliPlatformModel']", lpath_22))
         return False
     return True
 
@@ -1016,14 +1029,14 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$MacOSXPlatformModel'.name
             res = isinstance(pval, str) and pval == "Kali"
             if not res:
-                rep is None or rep.append(("unexpected _Kali [.'$MacOSXPlatformModel'.name]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MacOSXPlatformModel'.name]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected _Kali [.'$MacOSXPlatformModel'.name]", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$MacOSXPlatformModel'.name]", lpath_23))
                 return False
             continue
         elif prop == "versions":
@@ -1032,18 +1045,18 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_23_idx, arr_23_item in enumerate(pval):
-                    arr_23_lpath: Path = ((lpath_23 if path is not None else None) + [ arr_23_idx ]) if (lpath_23 if path is not None else None) is not None else None
+                    arr_23_lpath: Path = (lpath_23, arr_23_idx) if lpath_23 is not None else None
                     # .'$MacOSXPlatformModel'.versions.0
                     res = ((arr_23_item is None or isinstance(arr_23_item, (bool, int, float, str)))) and arr_23_item in _jm_cst_14
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$MacOSXPlatformModel'.versions.0.'|']", arr_23_lpath if (lpath_23 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$MacOSXPlatformModel'.versions.0.'|']", arr_23_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$MacOSXPlatformModel'.versions]", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MacOSXPlatformModel'.versions]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$MacOSXPlatformModel'.versions]", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$MacOSXPlatformModel'.versions]", lpath_23))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$MacOSXPlatformModel']", lpath_23 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$MacOSXPlatformModel']", lpath_23))
         return False
     return True
 
@@ -1056,14 +1069,14 @@ def json_model_26(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$MageiaPlatformModel'.name
             res = isinstance(pval, str) and pval == "Megeia"
             if not res:
-                rep is None or rep.append(("unexpected _Megeia [.'$MageiaPlatformModel'.name]", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MageiaPlatformModel'.name]", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected _Megeia [.'$MageiaPlatformModel'.name]", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$MageiaPlatformModel'.name]", lpath_24))
                 return False
             continue
         elif prop == "versions":
@@ -1072,18 +1085,18 @@ def json_model_26(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_24_idx, arr_24_item in enumerate(pval):
-                    arr_24_lpath: Path = ((lpath_24 if path is not None else None) + [ arr_24_idx ]) if (lpath_24 if path is not None else None) is not None else None
+                    arr_24_lpath: Path = (lpath_24, arr_24_idx) if lpath_24 is not None else None
                     # .'$MageiaPlatformModel'.versions.0
                     res = ((arr_24_item is None or isinstance(arr_24_item, (bool, int, float, str)))) and arr_24_item in _jm_cst_15
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$MageiaPlatformModel'.versions.0.'|']", arr_24_lpath if (lpath_24 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$MageiaPlatformModel'.versions.0.'|']", arr_24_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$MageiaPlatformModel'.versions]", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$MageiaPlatformModel'.versions]", lpath_24 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$MageiaPlatformModel'.versions]", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$MageiaPlatformModel'.versions]", lpath_24))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$MageiaPlatformModel']", lpath_24 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$MageiaPlatformModel']", lpath_24))
         return False
     return True
 
@@ -1095,14 +1108,14 @@ def json_model_27(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$NXOSPlatformModel'.name
             res = isinstance(pval, str) and pval == "NXOS"
             if not res:
-                rep is None or rep.append(("unexpected _NXOS [.'$NXOSPlatformModel'.name]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$NXOSPlatformModel'.name]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("unexpected _NXOS [.'$NXOSPlatformModel'.name]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$NXOSPlatformModel'.name]", lpath_25))
                 return False
             continue
         elif prop == "versions":
@@ -1111,18 +1124,18 @@ def json_model_27(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_25_idx, arr_25_item in enumerate(pval):
-                    arr_25_lpath: Path = ((lpath_25 if path is not None else None) + [ arr_25_idx ]) if (lpath_25 if path is not None else None) is not None else None
+                    arr_25_lpath: Path = (lpath_25, arr_25_idx) if lpath_25 is not None else None
                     # .'$NXOSPlatformModel'.versions.0
                     res = isinstance(arr_25_item, str) and arr_25_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$NXOSPlatformModel'.versions.0]", arr_25_lpath if (lpath_25 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$NXOSPlatformModel'.versions.0]", arr_25_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$NXOSPlatformModel'.versions]", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$NXOSPlatformModel'.versions]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$NXOSPlatformModel'.versions]", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$NXOSPlatformModel'.versions]", lpath_25))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$NXOSPlatformModel']", lpath_25 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$NXOSPlatformModel']", lpath_25))
         return False
     return True
 
@@ -1135,14 +1148,14 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_26: Path = (path + [ prop ]) if path is not None else None
+        lpath_26: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$NetBSDPlatformModel'.name
             res = isinstance(pval, str) and pval == "NetBSD"
             if not res:
-                rep is None or rep.append(("unexpected _NetBSD [.'$NetBSDPlatformModel'.name]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$NetBSDPlatformModel'.name]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected _NetBSD [.'$NetBSDPlatformModel'.name]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$NetBSDPlatformModel'.name]", lpath_26))
                 return False
             continue
         elif prop == "versions":
@@ -1151,18 +1164,18 @@ def json_model_28(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_26_idx, arr_26_item in enumerate(pval):
-                    arr_26_lpath: Path = ((lpath_26 if path is not None else None) + [ arr_26_idx ]) if (lpath_26 if path is not None else None) is not None else None
+                    arr_26_lpath: Path = (lpath_26, arr_26_idx) if lpath_26 is not None else None
                     # .'$NetBSDPlatformModel'.versions.0
                     res = ((arr_26_item is None or isinstance(arr_26_item, (bool, int, float, str)))) and arr_26_item in _jm_cst_16
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$NetBSDPlatformModel'.versions.0.'|']", arr_26_lpath if (lpath_26 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$NetBSDPlatformModel'.versions.0.'|']", arr_26_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$NetBSDPlatformModel'.versions]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$NetBSDPlatformModel'.versions]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$NetBSDPlatformModel'.versions]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$NetBSDPlatformModel'.versions]", lpath_26))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$NetBSDPlatformModel']", lpath_26 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$NetBSDPlatformModel']", lpath_26))
         return False
     return True
 
@@ -1175,14 +1188,14 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_27: Path = (path + [ prop ]) if path is not None else None
+        lpath_27: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$OpenBSDPlatformModel'.name
             res = isinstance(pval, str) and pval == "OpenBSD"
             if not res:
-                rep is None or rep.append(("unexpected _OpenBSD [.'$OpenBSDPlatformModel'.name]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenBSDPlatformModel'.name]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected _OpenBSD [.'$OpenBSDPlatformModel'.name]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenBSDPlatformModel'.name]", lpath_27))
                 return False
             continue
         elif prop == "versions":
@@ -1191,18 +1204,18 @@ def json_model_29(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_27_idx, arr_27_item in enumerate(pval):
-                    arr_27_lpath: Path = ((lpath_27 if path is not None else None) + [ arr_27_idx ]) if (lpath_27 if path is not None else None) is not None else None
+                    arr_27_lpath: Path = (lpath_27, arr_27_idx) if lpath_27 is not None else None
                     # .'$OpenBSDPlatformModel'.versions.0
                     res = ((arr_27_item is None or isinstance(arr_27_item, (bool, int, float, str)))) and arr_27_item in _jm_cst_17
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$OpenBSDPlatformModel'.versions.0.'|']", arr_27_lpath if (lpath_27 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$OpenBSDPlatformModel'.versions.0.'|']", arr_27_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$OpenBSDPlatformModel'.versions]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenBSDPlatformModel'.versions]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$OpenBSDPlatformModel'.versions]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenBSDPlatformModel'.versions]", lpath_27))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$OpenBSDPlatformModel']", lpath_27 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$OpenBSDPlatformModel']", lpath_27))
         return False
     return True
 
@@ -1215,14 +1228,14 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_28: Path = (path + [ prop ]) if path is not None else None
+        lpath_28: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$OpenWrtPlatformModel'.name
             res = isinstance(pval, str) and pval == "OpenWrt"
             if not res:
-                rep is None or rep.append(("unexpected _OpenWrt [.'$OpenWrtPlatformModel'.name]", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenWrtPlatformModel'.name]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected _OpenWrt [.'$OpenWrtPlatformModel'.name]", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenWrtPlatformModel'.name]", lpath_28))
                 return False
             continue
         elif prop == "versions":
@@ -1231,18 +1244,18 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_28_idx, arr_28_item in enumerate(pval):
-                    arr_28_lpath: Path = ((lpath_28 if path is not None else None) + [ arr_28_idx ]) if (lpath_28 if path is not None else None) is not None else None
+                    arr_28_lpath: Path = (lpath_28, arr_28_idx) if lpath_28 is not None else None
                     # .'$OpenWrtPlatformModel'.versions.0
                     res = ((arr_28_item is None or isinstance(arr_28_item, (bool, int, float, str)))) and arr_28_item in _jm_cst_18
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$OpenWrtPlatformModel'.versions.0.'|']", arr_28_lpath if (lpath_28 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$OpenWrtPlatformModel'.versions.0.'|']", arr_28_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$OpenWrtPlatformModel'.versions]", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OpenWrtPlatformModel'.versions]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$OpenWrtPlatformModel'.versions]", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.'$OpenWrtPlatformModel'.versions]", lpath_28))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$OpenWrtPlatformModel']", lpath_28 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$OpenWrtPlatformModel']", lpath_28))
         return False
     return True
 
@@ -1255,14 +1268,14 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_29: Path = (path + [ prop ]) if path is not None else None
+        lpath_29: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$OracleLinuxPlatformModel'.name
             res = isinstance(pval, str) and pval == "OracleLinux"
             if not res:
-                rep is None or rep.append(("unexpected _OracleLinux [.'$OracleLinuxPlatformModel'.name]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OracleLinuxPlatformModel'.name]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected _OracleLinux [.'$OracleLinuxPlatformModel'.name]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$OracleLinuxPlatformModel'.name]", lpath_29))
                 return False
             continue
         elif prop == "versions":
@@ -1271,18 +1284,18 @@ def json_model_31(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_29_idx, arr_29_item in enumerate(pval):
-                    arr_29_lpath: Path = ((lpath_29 if path is not None else None) + [ arr_29_idx ]) if (lpath_29 if path is not None else None) is not None else None
+                    arr_29_lpath: Path = (lpath_29, arr_29_idx) if lpath_29 is not None else None
                     # .'$OracleLinuxPlatformModel'.versions.0
                     res = ((arr_29_item is None or isinstance(arr_29_item, (bool, int, float, str)))) and arr_29_item in _jm_cst_19
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$OracleLinuxPlatformModel'.versions.0.'|']", arr_29_lpath if (lpath_29 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$OracleLinuxPlatformModel'.versions.0.'|']", arr_29_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$OracleLinuxPlatformModel'.versions]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$OracleLinuxPlatformModel'.versions]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$OracleLinuxPlatformModel'.versions]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$OracleLinuxPlatformModel'.versions]", lpath_29))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$OracleLinuxPlatformModel']", lpath_29 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$OracleLinuxPlatformModel']", lpath_29))
         return False
     return True
 
@@ -1295,14 +1308,14 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_30: Path = (path + [ prop ]) if path is not None else None
+        lpath_30: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$PAN-OSPlatformModel'.name
             res = isinstance(pval, str) and pval == "PAN-OS"
             if not res:
-                rep is None or rep.append(("unexpected _PAN-OS [.'$PAN-OSPlatformModel'.name]", lpath_30 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$PAN-OSPlatformModel'.name]", lpath_30 if path is not None else None))
+                rep is None or rep.append(("unexpected _PAN-OS [.'$PAN-OSPlatformModel'.name]", lpath_30))
+                rep is None or rep.append(("invalid optional prop value [.'$PAN-OSPlatformModel'.name]", lpath_30))
                 return False
             continue
         elif prop == "versions":
@@ -1311,18 +1324,18 @@ def json_model_32(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_30_idx, arr_30_item in enumerate(pval):
-                    arr_30_lpath: Path = ((lpath_30 if path is not None else None) + [ arr_30_idx ]) if (lpath_30 if path is not None else None) is not None else None
+                    arr_30_lpath: Path = (lpath_30, arr_30_idx) if lpath_30 is not None else None
                     # .'$PAN-OSPlatformModel'.versions.0
                     res = ((arr_30_item is None or isinstance(arr_30_item, (bool, int, float, str)))) and arr_30_item in _jm_cst_20
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$PAN-OSPlatformModel'.versions.0.'|']", arr_30_lpath if (lpath_30 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$PAN-OSPlatformModel'.versions.0.'|']", arr_30_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$PAN-OSPlatformModel'.versions]", lpath_30 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$PAN-OSPlatformModel'.versions]", lpath_30 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$PAN-OSPlatformModel'.versions]", lpath_30))
+                rep is None or rep.append(("invalid optional prop value [.'$PAN-OSPlatformModel'.versions]", lpath_30))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$PAN-OSPlatformModel']", lpath_30 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$PAN-OSPlatformModel']", lpath_30))
         return False
     return True
 
@@ -1335,14 +1348,14 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_31: Path = (path + [ prop ]) if path is not None else None
+        lpath_31: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$RockyLinuxPlatformModel'.name
             res = isinstance(pval, str) and pval == "Rocky"
             if not res:
-                rep is None or rep.append(("unexpected _Rocky [.'$RockyLinuxPlatformModel'.name]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RockyLinuxPlatformModel'.name]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected _Rocky [.'$RockyLinuxPlatformModel'.name]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$RockyLinuxPlatformModel'.name]", lpath_31))
                 return False
             continue
         elif prop == "versions":
@@ -1351,18 +1364,18 @@ def json_model_33(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_31_idx, arr_31_item in enumerate(pval):
-                    arr_31_lpath: Path = ((lpath_31 if path is not None else None) + [ arr_31_idx ]) if (lpath_31 if path is not None else None) is not None else None
+                    arr_31_lpath: Path = (lpath_31, arr_31_idx) if lpath_31 is not None else None
                     # .'$RockyLinuxPlatformModel'.versions.0
                     res = ((arr_31_item is None or isinstance(arr_31_item, (bool, int, float, str)))) and arr_31_item in _jm_cst_21
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$RockyLinuxPlatformModel'.versions.0.'|']", arr_31_lpath if (lpath_31 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$RockyLinuxPlatformModel'.versions.0.'|']", arr_31_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$RockyLinuxPlatformModel'.versions]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RockyLinuxPlatformModel'.versions]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$RockyLinuxPlatformModel'.versions]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$RockyLinuxPlatformModel'.versions]", lpath_31))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$RockyLinuxPlatformModel']", lpath_31 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$RockyLinuxPlatformModel']", lpath_31))
         return False
     return True
 
@@ -1375,14 +1388,14 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_32: Path = (path + [ prop ]) if path is not None else None
+        lpath_32: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$SLESPlatformModel'.name
             res = isinstance(pval, str) and pval == "SLES"
             if not res:
-                rep is None or rep.append(("unexpected _SLES [.'$SLESPlatformModel'.name]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SLESPlatformModel'.name]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected _SLES [.'$SLESPlatformModel'.name]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$SLESPlatformModel'.name]", lpath_32))
                 return False
             continue
         elif prop == "versions":
@@ -1391,18 +1404,18 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_32_idx, arr_32_item in enumerate(pval):
-                    arr_32_lpath: Path = ((lpath_32 if path is not None else None) + [ arr_32_idx ]) if (lpath_32 if path is not None else None) is not None else None
+                    arr_32_lpath: Path = (lpath_32, arr_32_idx) if lpath_32 is not None else None
                     # .'$SLESPlatformModel'.versions.0
                     res = ((arr_32_item is None or isinstance(arr_32_item, (bool, int, float, str)))) and arr_32_item in _jm_cst_22
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$SLESPlatformModel'.versions.0.'|']", arr_32_lpath if (lpath_32 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$SLESPlatformModel'.versions.0.'|']", arr_32_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$SLESPlatformModel'.versions]", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SLESPlatformModel'.versions]", lpath_32 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$SLESPlatformModel'.versions]", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$SLESPlatformModel'.versions]", lpath_32))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SLESPlatformModel']", lpath_32 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SLESPlatformModel']", lpath_32))
         return False
     return True
 
@@ -1414,14 +1427,14 @@ def json_model_35(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_33: Path = (path + [ prop ]) if path is not None else None
+        lpath_33: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$SmartOSPlatformModel'.name
             res = isinstance(pval, str) and pval == "SmartOS"
             if not res:
-                rep is None or rep.append(("unexpected _SmartOS [.'$SmartOSPlatformModel'.name]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SmartOSPlatformModel'.name]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected _SmartOS [.'$SmartOSPlatformModel'.name]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$SmartOSPlatformModel'.name]", lpath_33))
                 return False
             continue
         elif prop == "versions":
@@ -1430,18 +1443,18 @@ def json_model_35(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_33_idx, arr_33_item in enumerate(pval):
-                    arr_33_lpath: Path = ((lpath_33 if path is not None else None) + [ arr_33_idx ]) if (lpath_33 if path is not None else None) is not None else None
+                    arr_33_lpath: Path = (lpath_33, arr_33_idx) if lpath_33 is not None else None
                     # .'$SmartOSPlatformModel'.versions.0
                     res = isinstance(arr_33_item, str) and arr_33_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$SmartOSPlatformModel'.versions.0]", arr_33_lpath if (lpath_33 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$SmartOSPlatformModel'.versions.0]", arr_33_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$SmartOSPlatformModel'.versions]", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SmartOSPlatformModel'.versions]", lpath_33 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$SmartOSPlatformModel'.versions]", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$SmartOSPlatformModel'.versions]", lpath_33))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SmartOSPlatformModel']", lpath_33 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SmartOSPlatformModel']", lpath_33))
         return False
     return True
 
@@ -1454,14 +1467,14 @@ def json_model_36(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_34: Path = (path + [ prop ]) if path is not None else None
+        lpath_34: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$SolarisPlatformModel'.name
             res = isinstance(pval, str) and pval == "Solaris"
             if not res:
-                rep is None or rep.append(("unexpected _Solaris [.'$SolarisPlatformModel'.name]", lpath_34 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SolarisPlatformModel'.name]", lpath_34 if path is not None else None))
+                rep is None or rep.append(("unexpected _Solaris [.'$SolarisPlatformModel'.name]", lpath_34))
+                rep is None or rep.append(("invalid optional prop value [.'$SolarisPlatformModel'.name]", lpath_34))
                 return False
             continue
         elif prop == "versions":
@@ -1470,18 +1483,18 @@ def json_model_36(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_34_idx, arr_34_item in enumerate(pval):
-                    arr_34_lpath: Path = ((lpath_34 if path is not None else None) + [ arr_34_idx ]) if (lpath_34 if path is not None else None) is not None else None
+                    arr_34_lpath: Path = (lpath_34, arr_34_idx) if lpath_34 is not None else None
                     # .'$SolarisPlatformModel'.versions.0
                     res = ((arr_34_item is None or isinstance(arr_34_item, (bool, int, float, str)))) and arr_34_item in _jm_cst_23
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$SolarisPlatformModel'.versions.0.'|']", arr_34_lpath if (lpath_34 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$SolarisPlatformModel'.versions.0.'|']", arr_34_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$SolarisPlatformModel'.versions]", lpath_34 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SolarisPlatformModel'.versions]", lpath_34 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$SolarisPlatformModel'.versions]", lpath_34))
+                rep is None or rep.append(("invalid optional prop value [.'$SolarisPlatformModel'.versions]", lpath_34))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SolarisPlatformModel']", lpath_34 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SolarisPlatformModel']", lpath_34))
         return False
     return True
 
@@ -1494,14 +1507,14 @@ def json_model_37(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_35: Path = (path + [ prop ]) if path is not None else None
+        lpath_35: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$SynologyPlatformModel'.name
             res = isinstance(pval, str) and pval == "Synology"
             if not res:
-                rep is None or rep.append(("unexpected _Synology [.'$SynologyPlatformModel'.name]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SynologyPlatformModel'.name]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected _Synology [.'$SynologyPlatformModel'.name]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$SynologyPlatformModel'.name]", lpath_35))
                 return False
             continue
         elif prop == "versions":
@@ -1510,18 +1523,18 @@ def json_model_37(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_35_idx, arr_35_item in enumerate(pval):
-                    arr_35_lpath: Path = ((lpath_35 if path is not None else None) + [ arr_35_idx ]) if (lpath_35 if path is not None else None) is not None else None
+                    arr_35_lpath: Path = (lpath_35, arr_35_idx) if lpath_35 is not None else None
                     # .'$SynologyPlatformModel'.versions.0
                     res = ((arr_35_item is None or isinstance(arr_35_item, (bool, int, float, str)))) and arr_35_item in _jm_cst_24
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$SynologyPlatformModel'.versions.0.'|']", arr_35_lpath if (lpath_35 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$SynologyPlatformModel'.versions.0.'|']", arr_35_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$SynologyPlatformModel'.versions]", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$SynologyPlatformModel'.versions]", lpath_35 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$SynologyPlatformModel'.versions]", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$SynologyPlatformModel'.versions]", lpath_35))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$SynologyPlatformModel']", lpath_35 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$SynologyPlatformModel']", lpath_35))
         return False
     return True
 
@@ -1534,14 +1547,14 @@ def json_model_38(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_36: Path = (path + [ prop ]) if path is not None else None
+        lpath_36: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$TMOSPlatformModel'.name
             res = isinstance(pval, str) and pval == "TMOS"
             if not res:
-                rep is None or rep.append(("unexpected _TMOS [.'$TMOSPlatformModel'.name]", lpath_36 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$TMOSPlatformModel'.name]", lpath_36 if path is not None else None))
+                rep is None or rep.append(("unexpected _TMOS [.'$TMOSPlatformModel'.name]", lpath_36))
+                rep is None or rep.append(("invalid optional prop value [.'$TMOSPlatformModel'.name]", lpath_36))
                 return False
             continue
         elif prop == "versions":
@@ -1550,18 +1563,18 @@ def json_model_38(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_36_idx, arr_36_item in enumerate(pval):
-                    arr_36_lpath: Path = ((lpath_36 if path is not None else None) + [ arr_36_idx ]) if (lpath_36 if path is not None else None) is not None else None
+                    arr_36_lpath: Path = (lpath_36, arr_36_idx) if lpath_36 is not None else None
                     # .'$TMOSPlatformModel'.versions.0
                     res = ((arr_36_item is None or isinstance(arr_36_item, (bool, int, float, str)))) and arr_36_item in _jm_cst_25
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$TMOSPlatformModel'.versions.0.'|']", arr_36_lpath if (lpath_36 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$TMOSPlatformModel'.versions.0.'|']", arr_36_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$TMOSPlatformModel'.versions]", lpath_36 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$TMOSPlatformModel'.versions]", lpath_36 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$TMOSPlatformModel'.versions]", lpath_36))
+                rep is None or rep.append(("invalid optional prop value [.'$TMOSPlatformModel'.versions]", lpath_36))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$TMOSPlatformModel']", lpath_36 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$TMOSPlatformModel']", lpath_36))
         return False
     return True
 
@@ -1574,14 +1587,14 @@ def json_model_39(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_37: Path = (path + [ prop ]) if path is not None else None
+        lpath_37: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$UbuntuPlatformModel'.name
             res = isinstance(pval, str) and pval == "Ubuntu"
             if not res:
-                rep is None or rep.append(("unexpected _Ubuntu [.'$UbuntuPlatformModel'.name]", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$UbuntuPlatformModel'.name]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected _Ubuntu [.'$UbuntuPlatformModel'.name]", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$UbuntuPlatformModel'.name]", lpath_37))
                 return False
             continue
         elif prop == "versions":
@@ -1590,18 +1603,18 @@ def json_model_39(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_37_idx, arr_37_item in enumerate(pval):
-                    arr_37_lpath: Path = ((lpath_37 if path is not None else None) + [ arr_37_idx ]) if (lpath_37 if path is not None else None) is not None else None
+                    arr_37_lpath: Path = (lpath_37, arr_37_idx) if lpath_37 is not None else None
                     # .'$UbuntuPlatformModel'.versions.0
                     res = ((arr_37_item is None or isinstance(arr_37_item, (bool, int, float, str)))) and arr_37_item in _jm_cst_26
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$UbuntuPlatformModel'.versions.0.'|']", arr_37_lpath if (lpath_37 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$UbuntuPlatformModel'.versions.0.'|']", arr_37_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$UbuntuPlatformModel'.versions]", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$UbuntuPlatformModel'.versions]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$UbuntuPlatformModel'.versions]", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$UbuntuPlatformModel'.versions]", lpath_37))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$UbuntuPlatformModel']", lpath_37 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$UbuntuPlatformModel']", lpath_37))
         return False
     return True
 
@@ -1613,14 +1626,14 @@ def json_model_40(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_38: Path = (path + [ prop ]) if path is not None else None
+        lpath_38: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$Void_LinuxPlatformModel'.name
             res = isinstance(pval, str) and pval == "Void Linux"
             if not res:
-                rep is None or rep.append(("unexpected _Void Linux [.'$Void_LinuxPlatformModel'.name]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Void_LinuxPlatformModel'.name]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("unexpected _Void Linux [.'$Void_LinuxPlatformModel'.name]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$Void_LinuxPlatformModel'.name]", lpath_38))
                 return False
             continue
         elif prop == "versions":
@@ -1629,18 +1642,18 @@ def json_model_40(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_38_idx, arr_38_item in enumerate(pval):
-                    arr_38_lpath: Path = ((lpath_38 if path is not None else None) + [ arr_38_idx ]) if (lpath_38 if path is not None else None) is not None else None
+                    arr_38_lpath: Path = (lpath_38, arr_38_idx) if lpath_38 is not None else None
                     # .'$Void_LinuxPlatformModel'.versions.0
                     res = isinstance(arr_38_item, str) and arr_38_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$Void_LinuxPlatformModel'.versions.0]", arr_38_lpath if (lpath_38 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$Void_LinuxPlatformModel'.versions.0]", arr_38_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Void_LinuxPlatformModel'.versions]", lpath_38 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Void_LinuxPlatformModel'.versions]", lpath_38 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Void_LinuxPlatformModel'.versions]", lpath_38))
+                rep is None or rep.append(("invalid optional prop value [.'$Void_LinuxPlatformModel'.versions]", lpath_38))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Void_LinuxPlatformModel']", lpath_38 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Void_LinuxPlatformModel']", lpath_38))
         return False
     return True
 
@@ -1653,14 +1666,14 @@ def json_model_41(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_39: Path = (path + [ prop ]) if path is not None else None
+        lpath_39: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$WindowsPlatformModel'.name
             res = isinstance(pval, str) and pval == "Windows"
             if not res:
-                rep is None or rep.append(("unexpected _Windows [.'$WindowsPlatformModel'.name]", lpath_39 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$WindowsPlatformModel'.name]", lpath_39 if path is not None else None))
+                rep is None or rep.append(("unexpected _Windows [.'$WindowsPlatformModel'.name]", lpath_39))
+                rep is None or rep.append(("invalid optional prop value [.'$WindowsPlatformModel'.name]", lpath_39))
                 return False
             continue
         elif prop == "versions":
@@ -1669,18 +1682,18 @@ def json_model_41(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_39_idx, arr_39_item in enumerate(pval):
-                    arr_39_lpath: Path = ((lpath_39 if path is not None else None) + [ arr_39_idx ]) if (lpath_39 if path is not None else None) is not None else None
+                    arr_39_lpath: Path = (lpath_39, arr_39_idx) if lpath_39 is not None else None
                     # .'$WindowsPlatformModel'.versions.0
                     res = ((arr_39_item is None or isinstance(arr_39_item, (bool, int, float, str)))) and arr_39_item in _jm_cst_27
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$WindowsPlatformModel'.versions.0.'|']", arr_39_lpath if (lpath_39 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$WindowsPlatformModel'.versions.0.'|']", arr_39_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$WindowsPlatformModel'.versions]", lpath_39 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$WindowsPlatformModel'.versions]", lpath_39 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$WindowsPlatformModel'.versions]", lpath_39))
+                rep is None or rep.append(("invalid optional prop value [.'$WindowsPlatformModel'.versions]", lpath_39))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$WindowsPlatformModel']", lpath_39 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$WindowsPlatformModel']", lpath_39))
         return False
     return True
 
@@ -1692,14 +1705,14 @@ def json_model_42(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_40: Path = (path + [ prop ]) if path is not None else None
+        lpath_40: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$aosPlatformModel'.name
             res = isinstance(pval, str) and pval == "aos"
             if not res:
-                rep is None or rep.append(("unexpected _aos [.'$aosPlatformModel'.name]", lpath_40 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$aosPlatformModel'.name]", lpath_40 if path is not None else None))
+                rep is None or rep.append(("unexpected _aos [.'$aosPlatformModel'.name]", lpath_40))
+                rep is None or rep.append(("invalid optional prop value [.'$aosPlatformModel'.name]", lpath_40))
                 return False
             continue
         elif prop == "versions":
@@ -1708,18 +1721,18 @@ def json_model_42(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_40_idx, arr_40_item in enumerate(pval):
-                    arr_40_lpath: Path = ((lpath_40 if path is not None else None) + [ arr_40_idx ]) if (lpath_40 if path is not None else None) is not None else None
+                    arr_40_lpath: Path = (lpath_40, arr_40_idx) if lpath_40 is not None else None
                     # .'$aosPlatformModel'.versions.0
                     res = isinstance(arr_40_item, str) and arr_40_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$aosPlatformModel'.versions.0]", arr_40_lpath if (lpath_40 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$aosPlatformModel'.versions.0]", arr_40_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$aosPlatformModel'.versions]", lpath_40 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$aosPlatformModel'.versions]", lpath_40 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$aosPlatformModel'.versions]", lpath_40))
+                rep is None or rep.append(("invalid optional prop value [.'$aosPlatformModel'.versions]", lpath_40))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$aosPlatformModel']", lpath_40 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$aosPlatformModel']", lpath_40))
         return False
     return True
 
@@ -1731,14 +1744,14 @@ def json_model_43(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_41: Path = (path + [ prop ]) if path is not None else None
+        lpath_41: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$eosPlatformModel'.name
             res = isinstance(pval, str) and pval == "eos"
             if not res:
-                rep is None or rep.append(("unexpected _eos [.'$eosPlatformModel'.name]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$eosPlatformModel'.name]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("unexpected _eos [.'$eosPlatformModel'.name]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$eosPlatformModel'.name]", lpath_41))
                 return False
             continue
         elif prop == "versions":
@@ -1747,18 +1760,18 @@ def json_model_43(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_41_idx, arr_41_item in enumerate(pval):
-                    arr_41_lpath: Path = ((lpath_41 if path is not None else None) + [ arr_41_idx ]) if (lpath_41 if path is not None else None) is not None else None
+                    arr_41_lpath: Path = (lpath_41, arr_41_idx) if lpath_41 is not None else None
                     # .'$eosPlatformModel'.versions.0
                     res = isinstance(arr_41_item, str) and arr_41_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$eosPlatformModel'.versions.0]", arr_41_lpath if (lpath_41 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$eosPlatformModel'.versions.0]", arr_41_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$eosPlatformModel'.versions]", lpath_41 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$eosPlatformModel'.versions]", lpath_41 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$eosPlatformModel'.versions]", lpath_41))
+                rep is None or rep.append(("invalid optional prop value [.'$eosPlatformModel'.versions]", lpath_41))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$eosPlatformModel']", lpath_41 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$eosPlatformModel']", lpath_41))
         return False
     return True
 
@@ -1771,14 +1784,14 @@ def json_model_44(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_42: Path = (path + [ prop ]) if path is not None else None
+        lpath_42: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$macOSPlatformModel'.name
             res = isinstance(pval, str) and pval == "macOS"
             if not res:
-                rep is None or rep.append(("unexpected _macOS [.'$macOSPlatformModel'.name]", lpath_42 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$macOSPlatformModel'.name]", lpath_42 if path is not None else None))
+                rep is None or rep.append(("unexpected _macOS [.'$macOSPlatformModel'.name]", lpath_42))
+                rep is None or rep.append(("invalid optional prop value [.'$macOSPlatformModel'.name]", lpath_42))
                 return False
             continue
         elif prop == "versions":
@@ -1787,18 +1800,18 @@ def json_model_44(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_42_idx, arr_42_item in enumerate(pval):
-                    arr_42_lpath: Path = ((lpath_42 if path is not None else None) + [ arr_42_idx ]) if (lpath_42 if path is not None else None) is not None else None
+                    arr_42_lpath: Path = (lpath_42, arr_42_idx) if lpath_42 is not None else None
                     # .'$macOSPlatformModel'.versions.0
                     res = ((arr_42_item is None or isinstance(arr_42_item, (bool, int, float, str)))) and arr_42_item in _jm_cst_28
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$macOSPlatformModel'.versions.0.'|']", arr_42_lpath if (lpath_42 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$macOSPlatformModel'.versions.0.'|']", arr_42_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$macOSPlatformModel'.versions]", lpath_42 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$macOSPlatformModel'.versions]", lpath_42 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$macOSPlatformModel'.versions]", lpath_42))
+                rep is None or rep.append(("invalid optional prop value [.'$macOSPlatformModel'.versions]", lpath_42))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$macOSPlatformModel']", lpath_42 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$macOSPlatformModel']", lpath_42))
         return False
     return True
 
@@ -1811,14 +1824,14 @@ def json_model_45(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_43: Path = (path + [ prop ]) if path is not None else None
+        lpath_43: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$opensusePlatformModel'.name
             res = isinstance(pval, str) and pval == "opensuse"
             if not res:
-                rep is None or rep.append(("unexpected _opensuse [.'$opensusePlatformModel'.name]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$opensusePlatformModel'.name]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("unexpected _opensuse [.'$opensusePlatformModel'.name]", lpath_43))
+                rep is None or rep.append(("invalid optional prop value [.'$opensusePlatformModel'.name]", lpath_43))
                 return False
             continue
         elif prop == "versions":
@@ -1827,18 +1840,18 @@ def json_model_45(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_43_idx, arr_43_item in enumerate(pval):
-                    arr_43_lpath: Path = ((lpath_43 if path is not None else None) + [ arr_43_idx ]) if (lpath_43 if path is not None else None) is not None else None
+                    arr_43_lpath: Path = (lpath_43, arr_43_idx) if lpath_43 is not None else None
                     # .'$opensusePlatformModel'.versions.0
                     res = ((arr_43_item is None or isinstance(arr_43_item, (bool, int, float, str)))) and arr_43_item in _jm_cst_29
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$opensusePlatformModel'.versions.0.'|']", arr_43_lpath if (lpath_43 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$opensusePlatformModel'.versions.0.'|']", arr_43_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$opensusePlatformModel'.versions]", lpath_43 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$opensusePlatformModel'.versions]", lpath_43 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$opensusePlatformModel'.versions]", lpath_43))
+                rep is None or rep.append(("invalid optional prop value [.'$opensusePlatformModel'.versions]", lpath_43))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$opensusePlatformModel']", lpath_43 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$opensusePlatformModel']", lpath_43))
         return False
     return True
 
@@ -1850,14 +1863,14 @@ def json_model_46(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_44: Path = (path + [ prop ]) if path is not None else None
+        lpath_44: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$os10PlatformModel'.name
             res = isinstance(pval, str) and pval == "os10"
             if not res:
-                rep is None or rep.append(("unexpected _os10 [.'$os10PlatformModel'.name]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$os10PlatformModel'.name]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("unexpected _os10 [.'$os10PlatformModel'.name]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$os10PlatformModel'.name]", lpath_44))
                 return False
             continue
         elif prop == "versions":
@@ -1866,18 +1879,18 @@ def json_model_46(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_44_idx, arr_44_item in enumerate(pval):
-                    arr_44_lpath: Path = ((lpath_44 if path is not None else None) + [ arr_44_idx ]) if (lpath_44 if path is not None else None) is not None else None
+                    arr_44_lpath: Path = (lpath_44, arr_44_idx) if lpath_44 is not None else None
                     # .'$os10PlatformModel'.versions.0
                     res = isinstance(arr_44_item, str) and arr_44_item == "all"
                     if not res:
-                        rep is None or rep.append(("unexpected _all [.'$os10PlatformModel'.versions.0]", arr_44_lpath if (lpath_44 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected _all [.'$os10PlatformModel'.versions.0]", arr_44_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$os10PlatformModel'.versions]", lpath_44 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$os10PlatformModel'.versions]", lpath_44 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$os10PlatformModel'.versions]", lpath_44))
+                rep is None or rep.append(("invalid optional prop value [.'$os10PlatformModel'.versions]", lpath_44))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$os10PlatformModel']", lpath_44 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$os10PlatformModel']", lpath_44))
         return False
     return True
 
@@ -1890,14 +1903,14 @@ def json_model_47(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_45: Path = (path + [ prop ]) if path is not None else None
+        lpath_45: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$vCenterPlatformModel'.name
             res = isinstance(pval, str) and pval == "vCenter"
             if not res:
-                rep is None or rep.append(("unexpected _vCenter [.'$vCenterPlatformModel'.name]", lpath_45 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$vCenterPlatformModel'.name]", lpath_45 if path is not None else None))
+                rep is None or rep.append(("unexpected _vCenter [.'$vCenterPlatformModel'.name]", lpath_45))
+                rep is None or rep.append(("invalid optional prop value [.'$vCenterPlatformModel'.name]", lpath_45))
                 return False
             continue
         elif prop == "versions":
@@ -1906,18 +1919,18 @@ def json_model_47(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_45_idx, arr_45_item in enumerate(pval):
-                    arr_45_lpath: Path = ((lpath_45 if path is not None else None) + [ arr_45_idx ]) if (lpath_45 if path is not None else None) is not None else None
+                    arr_45_lpath: Path = (lpath_45, arr_45_idx) if lpath_45 is not None else None
                     # .'$vCenterPlatformModel'.versions.0
                     res = ((arr_45_item is None or isinstance(arr_45_item, (bool, int, float, str)))) and arr_45_item in _jm_cst_30
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$vCenterPlatformModel'.versions.0.'|']", arr_45_lpath if (lpath_45 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$vCenterPlatformModel'.versions.0.'|']", arr_45_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$vCenterPlatformModel'.versions]", lpath_45 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$vCenterPlatformModel'.versions]", lpath_45 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$vCenterPlatformModel'.versions]", lpath_45))
+                rep is None or rep.append(("invalid optional prop value [.'$vCenterPlatformModel'.versions]", lpath_45))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$vCenterPlatformModel']", lpath_45 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$vCenterPlatformModel']", lpath_45))
         return False
     return True
 
@@ -1930,14 +1943,14 @@ def json_model_48(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_46: Path = (path + [ prop ]) if path is not None else None
+        lpath_46: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle may name property
             # .'$vSpherePlatformModel'.name
             res = isinstance(pval, str) and pval == "vSphere"
             if not res:
-                rep is None or rep.append(("unexpected _vSphere [.'$vSpherePlatformModel'.name]", lpath_46 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$vSpherePlatformModel'.name]", lpath_46 if path is not None else None))
+                rep is None or rep.append(("unexpected _vSphere [.'$vSpherePlatformModel'.name]", lpath_46))
+                rep is None or rep.append(("invalid optional prop value [.'$vSpherePlatformModel'.name]", lpath_46))
                 return False
             continue
         elif prop == "versions":
@@ -1946,18 +1959,18 @@ def json_model_48(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_46_idx, arr_46_item in enumerate(pval):
-                    arr_46_lpath: Path = ((lpath_46 if path is not None else None) + [ arr_46_idx ]) if (lpath_46 if path is not None else None) is not None else None
+                    arr_46_lpath: Path = (lpath_46, arr_46_idx) if lpath_46 is not None else None
                     # .'$vSpherePlatformModel'.versions.0
                     res = ((arr_46_item is None or isinstance(arr_46_item, (bool, int, float, str)))) and arr_46_item in _jm_cst_31
                     if not res:
-                        rep is None or rep.append(("value not in enum [.'$vSpherePlatformModel'.versions.0.'|']", arr_46_lpath if (lpath_46 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("value not in enum [.'$vSpherePlatformModel'.versions.0.'|']", arr_46_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$vSpherePlatformModel'.versions]", lpath_46 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$vSpherePlatformModel'.versions]", lpath_46 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$vSpherePlatformModel'.versions]", lpath_46))
+                rep is None or rep.append(("invalid optional prop value [.'$vSpherePlatformModel'.versions]", lpath_46))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$vSpherePlatformModel']", lpath_46 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$vSpherePlatformModel']", lpath_46))
         return False
     return True
 
@@ -2170,28 +2183,28 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.46.name
         res = isinstance(pval, str) and pval == "Windows"
         if not res:
-            rep is None or rep.append(("unexpected _Windows [.'$platforms'.0.'|'.46.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.46]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Windows [.'$platforms'.0.'|'.46.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.46]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.46.versions
         res = isinstance(pval, list)
         if res:
             for arr_48_idx, arr_48_item in enumerate(pval):
-                arr_48_lpath: Path = ((lpath if path is not None else None) + [ arr_48_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_48_lpath: Path = (lpath, arr_48_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.46.versions.0
                 res = ((arr_48_item is None or isinstance(arr_48_item, (bool, int, float, str)))) and arr_48_item in _jm_cst_32
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.46.versions.0.'|']", arr_48_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.46.versions.0.'|']", arr_48_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.46.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.46]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.46.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.46]", lpath))
             return False
     return True
 
@@ -2206,28 +2219,28 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.45.name
         res = isinstance(pval, str) and pval == "vSphere"
         if not res:
-            rep is None or rep.append(("unexpected _vSphere [.'$platforms'.0.'|'.45.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.45]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _vSphere [.'$platforms'.0.'|'.45.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.45]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.45.versions
         res = isinstance(pval, list)
         if res:
             for arr_49_idx, arr_49_item in enumerate(pval):
-                arr_49_lpath: Path = ((lpath if path is not None else None) + [ arr_49_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_49_lpath: Path = (lpath, arr_49_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.45.versions.0
                 res = ((arr_49_item is None or isinstance(arr_49_item, (bool, int, float, str)))) and arr_49_item in _jm_cst_33
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.45.versions.0.'|']", arr_49_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.45.versions.0.'|']", arr_49_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.45.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.45]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.45.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.45]", lpath))
             return False
     return True
 
@@ -2241,28 +2254,28 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.44.name
         res = isinstance(pval, str) and pval == "Void Linux"
         if not res:
-            rep is None or rep.append(("unexpected _Void Linux [.'$platforms'.0.'|'.44.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.44]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Void Linux [.'$platforms'.0.'|'.44.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.44]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.44.versions
         res = isinstance(pval, list)
         if res:
             for arr_50_idx, arr_50_item in enumerate(pval):
-                arr_50_lpath: Path = ((lpath if path is not None else None) + [ arr_50_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_50_lpath: Path = (lpath, arr_50_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.44.versions.0
                 res = isinstance(arr_50_item, str) and arr_50_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.44.versions.0]", arr_50_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.44.versions.0]", arr_50_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.44.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.44]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.44.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.44]", lpath))
             return False
     return True
 
@@ -2277,28 +2290,28 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.43.name
         res = isinstance(pval, str) and pval == "vCenter"
         if not res:
-            rep is None or rep.append(("unexpected _vCenter [.'$platforms'.0.'|'.43.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.43]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _vCenter [.'$platforms'.0.'|'.43.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.43]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.43.versions
         res = isinstance(pval, list)
         if res:
             for arr_51_idx, arr_51_item in enumerate(pval):
-                arr_51_lpath: Path = ((lpath if path is not None else None) + [ arr_51_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_51_lpath: Path = (lpath, arr_51_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.43.versions.0
                 res = ((arr_51_item is None or isinstance(arr_51_item, (bool, int, float, str)))) and arr_51_item in _jm_cst_34
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.43.versions.0.'|']", arr_51_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.43.versions.0.'|']", arr_51_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.43.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.43]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.43.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.43]", lpath))
             return False
     return True
 
@@ -2313,28 +2326,28 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.42.name
         res = isinstance(pval, str) and pval == "Ubuntu"
         if not res:
-            rep is None or rep.append(("unexpected _Ubuntu [.'$platforms'.0.'|'.42.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.42]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Ubuntu [.'$platforms'.0.'|'.42.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.42]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.42.versions
         res = isinstance(pval, list)
         if res:
             for arr_52_idx, arr_52_item in enumerate(pval):
-                arr_52_lpath: Path = ((lpath if path is not None else None) + [ arr_52_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_52_lpath: Path = (lpath, arr_52_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.42.versions.0
                 res = ((arr_52_item is None or isinstance(arr_52_item, (bool, int, float, str)))) and arr_52_item in _jm_cst_35
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.42.versions.0.'|']", arr_52_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.42.versions.0.'|']", arr_52_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.42.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.42]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.42.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.42]", lpath))
             return False
     return True
 
@@ -2349,28 +2362,28 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.41.name
         res = isinstance(pval, str) and pval == "TMOS"
         if not res:
-            rep is None or rep.append(("unexpected _TMOS [.'$platforms'.0.'|'.41.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.41]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _TMOS [.'$platforms'.0.'|'.41.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.41]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.41.versions
         res = isinstance(pval, list)
         if res:
             for arr_53_idx, arr_53_item in enumerate(pval):
-                arr_53_lpath: Path = ((lpath if path is not None else None) + [ arr_53_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_53_lpath: Path = (lpath, arr_53_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.41.versions.0
                 res = ((arr_53_item is None or isinstance(arr_53_item, (bool, int, float, str)))) and arr_53_item in _jm_cst_36
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.41.versions.0.'|']", arr_53_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.41.versions.0.'|']", arr_53_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.41.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.41]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.41.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.41]", lpath))
             return False
     return True
 
@@ -2385,28 +2398,28 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.40.name
         res = isinstance(pval, str) and pval == "Synology"
         if not res:
-            rep is None or rep.append(("unexpected _Synology [.'$platforms'.0.'|'.40.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.40]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Synology [.'$platforms'.0.'|'.40.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.40]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.40.versions
         res = isinstance(pval, list)
         if res:
             for arr_54_idx, arr_54_item in enumerate(pval):
-                arr_54_lpath: Path = ((lpath if path is not None else None) + [ arr_54_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_54_lpath: Path = (lpath, arr_54_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.40.versions.0
                 res = ((arr_54_item is None or isinstance(arr_54_item, (bool, int, float, str)))) and arr_54_item in _jm_cst_37
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.40.versions.0.'|']", arr_54_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.40.versions.0.'|']", arr_54_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.40.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.40]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.40.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.40]", lpath))
             return False
     return True
 
@@ -2421,28 +2434,28 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.39.name
         res = isinstance(pval, str) and pval == "Solaris"
         if not res:
-            rep is None or rep.append(("unexpected _Solaris [.'$platforms'.0.'|'.39.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.39]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Solaris [.'$platforms'.0.'|'.39.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.39]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.39.versions
         res = isinstance(pval, list)
         if res:
             for arr_55_idx, arr_55_item in enumerate(pval):
-                arr_55_lpath: Path = ((lpath if path is not None else None) + [ arr_55_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_55_lpath: Path = (lpath, arr_55_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.39.versions.0
                 res = ((arr_55_item is None or isinstance(arr_55_item, (bool, int, float, str)))) and arr_55_item in _jm_cst_38
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.39.versions.0.'|']", arr_55_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.39.versions.0.'|']", arr_55_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.39.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.39]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.39.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.39]", lpath))
             return False
     return True
 
@@ -2456,28 +2469,28 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.38.name
         res = isinstance(pval, str) and pval == "SmartOS"
         if not res:
-            rep is None or rep.append(("unexpected _SmartOS [.'$platforms'.0.'|'.38.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.38]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _SmartOS [.'$platforms'.0.'|'.38.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.38]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.38.versions
         res = isinstance(pval, list)
         if res:
             for arr_56_idx, arr_56_item in enumerate(pval):
-                arr_56_lpath: Path = ((lpath if path is not None else None) + [ arr_56_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_56_lpath: Path = (lpath, arr_56_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.38.versions.0
                 res = isinstance(arr_56_item, str) and arr_56_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.38.versions.0]", arr_56_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.38.versions.0]", arr_56_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.38.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.38]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.38.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.38]", lpath))
             return False
     return True
 
@@ -2492,28 +2505,28 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.37.name
         res = isinstance(pval, str) and pval == "SLES"
         if not res:
-            rep is None or rep.append(("unexpected _SLES [.'$platforms'.0.'|'.37.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.37]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _SLES [.'$platforms'.0.'|'.37.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.37]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.37.versions
         res = isinstance(pval, list)
         if res:
             for arr_57_idx, arr_57_item in enumerate(pval):
-                arr_57_lpath: Path = ((lpath if path is not None else None) + [ arr_57_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_57_lpath: Path = (lpath, arr_57_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.37.versions.0
                 res = ((arr_57_item is None or isinstance(arr_57_item, (bool, int, float, str)))) and arr_57_item in _jm_cst_39
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.37.versions.0.'|']", arr_57_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.37.versions.0.'|']", arr_57_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.37.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.37]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.37.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.37]", lpath))
             return False
     return True
 
@@ -2528,28 +2541,28 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.36.name
         res = isinstance(pval, str) and pval == "Rocky"
         if not res:
-            rep is None or rep.append(("unexpected _Rocky [.'$platforms'.0.'|'.36.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.36]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Rocky [.'$platforms'.0.'|'.36.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.36]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.36.versions
         res = isinstance(pval, list)
         if res:
             for arr_58_idx, arr_58_item in enumerate(pval):
-                arr_58_lpath: Path = ((lpath if path is not None else None) + [ arr_58_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_58_lpath: Path = (lpath, arr_58_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.36.versions.0
                 res = ((arr_58_item is None or isinstance(arr_58_item, (bool, int, float, str)))) and arr_58_item in _jm_cst_40
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.36.versions.0.'|']", arr_58_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.36.versions.0.'|']", arr_58_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.36.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.36]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.36.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.36]", lpath))
             return False
     return True
 
@@ -2564,28 +2577,28 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.35.name
         res = isinstance(pval, str) and pval == "PAN-OS"
         if not res:
-            rep is None or rep.append(("unexpected _PAN-OS [.'$platforms'.0.'|'.35.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.35]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _PAN-OS [.'$platforms'.0.'|'.35.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.35]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.35.versions
         res = isinstance(pval, list)
         if res:
             for arr_59_idx, arr_59_item in enumerate(pval):
-                arr_59_lpath: Path = ((lpath if path is not None else None) + [ arr_59_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_59_lpath: Path = (lpath, arr_59_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.35.versions.0
                 res = ((arr_59_item is None or isinstance(arr_59_item, (bool, int, float, str)))) and arr_59_item in _jm_cst_41
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.35.versions.0.'|']", arr_59_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.35.versions.0.'|']", arr_59_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.35.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.35]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.35.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.35]", lpath))
             return False
     return True
 
@@ -2599,28 +2612,28 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.34.name
         res = isinstance(pval, str) and pval == "os10"
         if not res:
-            rep is None or rep.append(("unexpected _os10 [.'$platforms'.0.'|'.34.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.34]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _os10 [.'$platforms'.0.'|'.34.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.34]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.34.versions
         res = isinstance(pval, list)
         if res:
             for arr_60_idx, arr_60_item in enumerate(pval):
-                arr_60_lpath: Path = ((lpath if path is not None else None) + [ arr_60_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_60_lpath: Path = (lpath, arr_60_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.34.versions.0
                 res = isinstance(arr_60_item, str) and arr_60_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.34.versions.0]", arr_60_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.34.versions.0]", arr_60_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.34.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.34]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.34.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.34]", lpath))
             return False
     return True
 
@@ -2635,28 +2648,28 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.33.name
         res = isinstance(pval, str) and pval == "OracleLinux"
         if not res:
-            rep is None or rep.append(("unexpected _OracleLinux [.'$platforms'.0.'|'.33.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.33]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _OracleLinux [.'$platforms'.0.'|'.33.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.33]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.33.versions
         res = isinstance(pval, list)
         if res:
             for arr_61_idx, arr_61_item in enumerate(pval):
-                arr_61_lpath: Path = ((lpath if path is not None else None) + [ arr_61_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_61_lpath: Path = (lpath, arr_61_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.33.versions.0
                 res = ((arr_61_item is None or isinstance(arr_61_item, (bool, int, float, str)))) and arr_61_item in _jm_cst_42
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.33.versions.0.'|']", arr_61_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.33.versions.0.'|']", arr_61_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.33.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.33]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.33.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.33]", lpath))
             return False
     return True
 
@@ -2671,28 +2684,28 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.32.name
         res = isinstance(pval, str) and pval == "OpenWrt"
         if not res:
-            rep is None or rep.append(("unexpected _OpenWrt [.'$platforms'.0.'|'.32.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.32]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _OpenWrt [.'$platforms'.0.'|'.32.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.32]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.32.versions
         res = isinstance(pval, list)
         if res:
             for arr_62_idx, arr_62_item in enumerate(pval):
-                arr_62_lpath: Path = ((lpath if path is not None else None) + [ arr_62_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_62_lpath: Path = (lpath, arr_62_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.32.versions.0
                 res = ((arr_62_item is None or isinstance(arr_62_item, (bool, int, float, str)))) and arr_62_item in _jm_cst_43
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.32.versions.0.'|']", arr_62_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.32.versions.0.'|']", arr_62_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.32.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.32]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.32.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.32]", lpath))
             return False
     return True
 
@@ -2707,28 +2720,28 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.31.name
         res = isinstance(pval, str) and pval == "opensuse"
         if not res:
-            rep is None or rep.append(("unexpected _opensuse [.'$platforms'.0.'|'.31.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.31]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _opensuse [.'$platforms'.0.'|'.31.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.31]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.31.versions
         res = isinstance(pval, list)
         if res:
             for arr_63_idx, arr_63_item in enumerate(pval):
-                arr_63_lpath: Path = ((lpath if path is not None else None) + [ arr_63_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_63_lpath: Path = (lpath, arr_63_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.31.versions.0
                 res = ((arr_63_item is None or isinstance(arr_63_item, (bool, int, float, str)))) and arr_63_item in _jm_cst_44
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.31.versions.0.'|']", arr_63_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.31.versions.0.'|']", arr_63_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.31.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.31]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.31.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.31]", lpath))
             return False
     return True
 
@@ -2743,28 +2756,28 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.30.name
         res = isinstance(pval, str) and pval == "OpenBSD"
         if not res:
-            rep is None or rep.append(("unexpected _OpenBSD [.'$platforms'.0.'|'.30.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.30]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _OpenBSD [.'$platforms'.0.'|'.30.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.30]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.30.versions
         res = isinstance(pval, list)
         if res:
             for arr_64_idx, arr_64_item in enumerate(pval):
-                arr_64_lpath: Path = ((lpath if path is not None else None) + [ arr_64_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_64_lpath: Path = (lpath, arr_64_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.30.versions.0
                 res = ((arr_64_item is None or isinstance(arr_64_item, (bool, int, float, str)))) and arr_64_item in _jm_cst_45
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.30.versions.0.'|']", arr_64_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.30.versions.0.'|']", arr_64_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.30.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.30]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.30.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.30]", lpath))
             return False
     return True
 
@@ -2778,28 +2791,28 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.29.name
         res = isinstance(pval, str) and pval == "NXOS"
         if not res:
-            rep is None or rep.append(("unexpected _NXOS [.'$platforms'.0.'|'.29.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.29]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _NXOS [.'$platforms'.0.'|'.29.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.29]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.29.versions
         res = isinstance(pval, list)
         if res:
             for arr_65_idx, arr_65_item in enumerate(pval):
-                arr_65_lpath: Path = ((lpath if path is not None else None) + [ arr_65_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_65_lpath: Path = (lpath, arr_65_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.29.versions.0
                 res = isinstance(arr_65_item, str) and arr_65_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.29.versions.0]", arr_65_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.29.versions.0]", arr_65_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.29.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.29]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.29.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.29]", lpath))
             return False
     return True
 
@@ -2814,28 +2827,28 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.28.name
         res = isinstance(pval, str) and pval == "Megeia"
         if not res:
-            rep is None or rep.append(("unexpected _Megeia [.'$platforms'.0.'|'.28.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.28]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Megeia [.'$platforms'.0.'|'.28.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.28]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.28.versions
         res = isinstance(pval, list)
         if res:
             for arr_66_idx, arr_66_item in enumerate(pval):
-                arr_66_lpath: Path = ((lpath if path is not None else None) + [ arr_66_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_66_lpath: Path = (lpath, arr_66_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.28.versions.0
                 res = ((arr_66_item is None or isinstance(arr_66_item, (bool, int, float, str)))) and arr_66_item in _jm_cst_46
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.28.versions.0.'|']", arr_66_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.28.versions.0.'|']", arr_66_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.28.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.28]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.28.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.28]", lpath))
             return False
     return True
 
@@ -2850,28 +2863,28 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.27.name
         res = isinstance(pval, str) and pval == "Kali"
         if not res:
-            rep is None or rep.append(("unexpected _Kali [.'$platforms'.0.'|'.27.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.27]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Kali [.'$platforms'.0.'|'.27.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.27]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.27.versions
         res = isinstance(pval, list)
         if res:
             for arr_67_idx, arr_67_item in enumerate(pval):
-                arr_67_lpath: Path = ((lpath if path is not None else None) + [ arr_67_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_67_lpath: Path = (lpath, arr_67_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.27.versions.0
                 res = ((arr_67_item is None or isinstance(arr_67_item, (bool, int, float, str)))) and arr_67_item in _jm_cst_47
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.27.versions.0.'|']", arr_67_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.27.versions.0.'|']", arr_67_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.27.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.27]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.27.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.27]", lpath))
             return False
     return True
 
@@ -2886,28 +2899,28 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.26.name
         res = isinstance(pval, str) and pval == "macOS"
         if not res:
-            rep is None or rep.append(("unexpected _macOS [.'$platforms'.0.'|'.26.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.26]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _macOS [.'$platforms'.0.'|'.26.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.26]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.26.versions
         res = isinstance(pval, list)
         if res:
             for arr_68_idx, arr_68_item in enumerate(pval):
-                arr_68_lpath: Path = ((lpath if path is not None else None) + [ arr_68_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_68_lpath: Path = (lpath, arr_68_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.26.versions.0
                 res = ((arr_68_item is None or isinstance(arr_68_item, (bool, int, float, str)))) and arr_68_item in _jm_cst_48
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.26.versions.0.'|']", arr_68_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.26.versions.0.'|']", arr_68_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.26.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.26]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.26.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.26]", lpath))
             return False
     return True
 
@@ -2922,28 +2935,28 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.25.name
         res = isinstance(pval, str) and pval == "Kali"
         if not res:
-            rep is None or rep.append(("unexpected _Kali [.'$platforms'.0.'|'.25.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.25]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Kali [.'$platforms'.0.'|'.25.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.25]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.25.versions
         res = isinstance(pval, list)
         if res:
             for arr_69_idx, arr_69_item in enumerate(pval):
-                arr_69_lpath: Path = ((lpath if path is not None else None) + [ arr_69_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_69_lpath: Path = (lpath, arr_69_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.25.versions.0
                 res = ((arr_69_item is None or isinstance(arr_69_item, (bool, int, float, str)))) and arr_69_item in _jm_cst_49
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.25.versions.0.'|']", arr_69_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.25.versions.0.'|']", arr_69_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.25.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.25]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.25.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.25]", lpath))
             return False
     return True
 
@@ -2957,28 +2970,28 @@ def _jm_obj_22(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.24.name
         res = isinstance(pval, str) and pval == "Junos"
         if not res:
-            rep is None or rep.append(("unexpected _Junos [.'$platforms'.0.'|'.24.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.24]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Junos [.'$platforms'.0.'|'.24.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.24]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.24.versions
         res = isinstance(pval, list)
         if res:
             for arr_70_idx, arr_70_item in enumerate(pval):
-                arr_70_lpath: Path = ((lpath if path is not None else None) + [ arr_70_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_70_lpath: Path = (lpath, arr_70_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.24.versions.0
                 res = isinstance(arr_70_item, str) and arr_70_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.24.versions.0]", arr_70_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.24.versions.0]", arr_70_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.24.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.24]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.24.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.24]", lpath))
             return False
     return True
 
@@ -2992,28 +3005,28 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.23.name
         res = isinstance(pval, str) and pval == "IOS"
         if not res:
-            rep is None or rep.append(("unexpected _IOS [.'$platforms'.0.'|'.23.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.23]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _IOS [.'$platforms'.0.'|'.23.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.23]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.23.versions
         res = isinstance(pval, list)
         if res:
             for arr_71_idx, arr_71_item in enumerate(pval):
-                arr_71_lpath: Path = ((lpath if path is not None else None) + [ arr_71_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_71_lpath: Path = (lpath, arr_71_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.23.versions.0
                 res = isinstance(arr_71_item, str) and arr_71_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.23.versions.0]", arr_71_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.23.versions.0]", arr_71_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.23.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.23]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.23.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.23]", lpath))
             return False
     return True
 
@@ -3028,28 +3041,28 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.22.name
         res = isinstance(pval, str) and pval == "HardenedBSD"
         if not res:
-            rep is None or rep.append(("unexpected _HardenedBSD [.'$platforms'.0.'|'.22.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.22]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _HardenedBSD [.'$platforms'.0.'|'.22.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.22]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.22.versions
         res = isinstance(pval, list)
         if res:
             for arr_72_idx, arr_72_item in enumerate(pval):
-                arr_72_lpath: Path = ((lpath if path is not None else None) + [ arr_72_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_72_lpath: Path = (lpath, arr_72_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.22.versions.0
                 res = ((arr_72_item is None or isinstance(arr_72_item, (bool, int, float, str)))) and arr_72_item in _jm_cst_50
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.22.versions.0.'|']", arr_72_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.22.versions.0.'|']", arr_72_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.22.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.22]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.22.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.22]", lpath))
             return False
     return True
 
@@ -3063,28 +3076,28 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.21.name
         res = isinstance(pval, str) and pval == "Gentoo"
         if not res:
-            rep is None or rep.append(("unexpected _Gentoo [.'$platforms'.0.'|'.21.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.21]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Gentoo [.'$platforms'.0.'|'.21.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.21]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.21.versions
         res = isinstance(pval, list)
         if res:
             for arr_73_idx, arr_73_item in enumerate(pval):
-                arr_73_lpath: Path = ((lpath if path is not None else None) + [ arr_73_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_73_lpath: Path = (lpath, arr_73_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.21.versions.0
                 res = isinstance(arr_73_item, str) and arr_73_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.21.versions.0]", arr_73_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.21.versions.0]", arr_73_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.21.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.21]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.21.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.21]", lpath))
             return False
     return True
 
@@ -3098,28 +3111,28 @@ def _jm_obj_26(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.20.name
         res = isinstance(pval, str) and pval == "GenericUNIX"
         if not res:
-            rep is None or rep.append(("unexpected _GenericUNIX [.'$platforms'.0.'|'.20.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.20]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _GenericUNIX [.'$platforms'.0.'|'.20.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.20]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.20.versions
         res = isinstance(pval, list)
         if res:
             for arr_74_idx, arr_74_item in enumerate(pval):
-                arr_74_lpath: Path = ((lpath if path is not None else None) + [ arr_74_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_74_lpath: Path = (lpath, arr_74_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.20.versions.0
                 res = isinstance(arr_74_item, str) and arr_74_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.20.versions.0]", arr_74_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.20.versions.0]", arr_74_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.20.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.20]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.20.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.20]", lpath))
             return False
     return True
 
@@ -3133,28 +3146,28 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.19.name
         res = isinstance(pval, str) and pval == "GenericLinux"
         if not res:
-            rep is None or rep.append(("unexpected _GenericLinux [.'$platforms'.0.'|'.19.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.19]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _GenericLinux [.'$platforms'.0.'|'.19.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.19]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.19.versions
         res = isinstance(pval, list)
         if res:
             for arr_75_idx, arr_75_item in enumerate(pval):
-                arr_75_lpath: Path = ((lpath if path is not None else None) + [ arr_75_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_75_lpath: Path = (lpath, arr_75_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.19.versions.0
                 res = isinstance(arr_75_item, str) and arr_75_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.19.versions.0]", arr_75_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.19.versions.0]", arr_75_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.19.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.19]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.19.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.19]", lpath))
             return False
     return True
 
@@ -3168,28 +3181,28 @@ def _jm_obj_28(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.18.name
         res = isinstance(pval, str) and pval == "GenericBSD"
         if not res:
-            rep is None or rep.append(("unexpected _GenericBSD [.'$platforms'.0.'|'.18.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.18]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _GenericBSD [.'$platforms'.0.'|'.18.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.18]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.18.versions
         res = isinstance(pval, list)
         if res:
             for arr_76_idx, arr_76_item in enumerate(pval):
-                arr_76_lpath: Path = ((lpath if path is not None else None) + [ arr_76_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_76_lpath: Path = (lpath, arr_76_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.18.versions.0
                 res = isinstance(arr_76_item, str) and arr_76_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.18.versions.0]", arr_76_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.18.versions.0]", arr_76_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.18.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.18]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.18.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.18]", lpath))
             return False
     return True
 
@@ -3204,28 +3217,28 @@ def _jm_obj_29(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.17.name
         res = isinstance(pval, str) and pval == "FreeBSD"
         if not res:
-            rep is None or rep.append(("unexpected _FreeBSD [.'$platforms'.0.'|'.17.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.17]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _FreeBSD [.'$platforms'.0.'|'.17.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.17]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.17.versions
         res = isinstance(pval, list)
         if res:
             for arr_77_idx, arr_77_item in enumerate(pval):
-                arr_77_lpath: Path = ((lpath if path is not None else None) + [ arr_77_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_77_lpath: Path = (lpath, arr_77_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.17.versions.0
                 res = ((arr_77_item is None or isinstance(arr_77_item, (bool, int, float, str)))) and arr_77_item in _jm_cst_51
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.17.versions.0.'|']", arr_77_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.17.versions.0.'|']", arr_77_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.17.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.17]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.17.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.17]", lpath))
             return False
     return True
 
@@ -3240,28 +3253,28 @@ def _jm_obj_30(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.16.name
         res = isinstance(pval, str) and (pval == "Fedora")
         if not res:
-            rep is None or rep.append(("unexpected _Fedora [.'$platforms'.0.'|'.16.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.16]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Fedora [.'$platforms'.0.'|'.16.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.16]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.16.versions
         res = isinstance(pval, list)
         if res:
             for arr_78_idx, arr_78_item in enumerate(pval):
-                arr_78_lpath: Path = ((lpath if path is not None else None) + [ arr_78_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_78_lpath: Path = (lpath, arr_78_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.16.versions.0
                 res = ((arr_78_item is None or isinstance(arr_78_item, (bool, int, float, str)))) and arr_78_item in _jm_cst_52
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.16.versions.0.'|']", arr_78_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.16.versions.0.'|']", arr_78_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.16.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.16]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.16.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.16]", lpath))
             return False
     return True
 
@@ -3275,28 +3288,28 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.15.name
         res = isinstance(pval, str) and pval == "eos"
         if not res:
-            rep is None or rep.append(("unexpected _eos [.'$platforms'.0.'|'.15.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.15]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _eos [.'$platforms'.0.'|'.15.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.15]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.15.versions
         res = isinstance(pval, list)
         if res:
             for arr_79_idx, arr_79_item in enumerate(pval):
-                arr_79_lpath: Path = ((lpath if path is not None else None) + [ arr_79_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_79_lpath: Path = (lpath, arr_79_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.15.versions.0
                 res = isinstance(arr_79_item, str) and arr_79_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.15.versions.0]", arr_79_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.15.versions.0]", arr_79_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.15.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.15]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.15.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.15]", lpath))
             return False
     return True
 
@@ -3311,28 +3324,28 @@ def _jm_obj_32(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.14.name
         res = isinstance(pval, str) and pval == "EL"
         if not res:
-            rep is None or rep.append(("unexpected _EL [.'$platforms'.0.'|'.14.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.14]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _EL [.'$platforms'.0.'|'.14.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.14]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.14.versions
         res = isinstance(pval, list)
         if res:
             for arr_80_idx, arr_80_item in enumerate(pval):
-                arr_80_lpath: Path = ((lpath if path is not None else None) + [ arr_80_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_80_lpath: Path = (lpath, arr_80_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.14.versions.0
                 res = ((arr_80_item is None or isinstance(arr_80_item, (bool, int, float, str)))) and arr_80_item in _jm_cst_53
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.14.versions.0.'|']", arr_80_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.14.versions.0.'|']", arr_80_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.14.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.14]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.14.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.14]", lpath))
             return False
     return True
 
@@ -3347,28 +3360,28 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.13.name
         res = isinstance(pval, str) and pval == "DragonFlyBSD"
         if not res:
-            rep is None or rep.append(("unexpected _DragonFlyBSD [.'$platforms'.0.'|'.13.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.13]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _DragonFlyBSD [.'$platforms'.0.'|'.13.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.13]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.13.versions
         res = isinstance(pval, list)
         if res:
             for arr_81_idx, arr_81_item in enumerate(pval):
-                arr_81_lpath: Path = ((lpath if path is not None else None) + [ arr_81_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_81_lpath: Path = (lpath, arr_81_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.13.versions.0
                 res = ((arr_81_item is None or isinstance(arr_81_item, (bool, int, float, str)))) and arr_81_item in _jm_cst_54
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.13.versions.0.'|']", arr_81_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.13.versions.0.'|']", arr_81_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.13.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.13]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.13.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.13]", lpath))
             return False
     return True
 
@@ -3383,28 +3396,28 @@ def _jm_obj_34(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.12.name
         res = isinstance(pval, str) and pval == "Devuan"
         if not res:
-            rep is None or rep.append(("unexpected _Devuan [.'$platforms'.0.'|'.12.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.12]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Devuan [.'$platforms'.0.'|'.12.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.12]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.12.versions
         res = isinstance(pval, list)
         if res:
             for arr_82_idx, arr_82_item in enumerate(pval):
-                arr_82_lpath: Path = ((lpath if path is not None else None) + [ arr_82_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_82_lpath: Path = (lpath, arr_82_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.12.versions.0
                 res = ((arr_82_item is None or isinstance(arr_82_item, (bool, int, float, str)))) and arr_82_item in _jm_cst_55
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.12.versions.0.'|']", arr_82_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.12.versions.0.'|']", arr_82_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.12.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.12]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.12.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.12]", lpath))
             return False
     return True
 
@@ -3419,28 +3432,28 @@ def _jm_obj_35(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.11.name
         res = isinstance(pval, str) and pval == "DellOS"
         if not res:
-            rep is None or rep.append(("unexpected _DellOS [.'$platforms'.0.'|'.11.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.11]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _DellOS [.'$platforms'.0.'|'.11.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.11]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.11.versions
         res = isinstance(pval, list)
         if res:
             for arr_83_idx, arr_83_item in enumerate(pval):
-                arr_83_lpath: Path = ((lpath if path is not None else None) + [ arr_83_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_83_lpath: Path = (lpath, arr_83_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.11.versions.0
                 res = ((arr_83_item is None or isinstance(arr_83_item, (bool, int, float, str)))) and arr_83_item in _jm_cst_56
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.11.versions.0.'|']", arr_83_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.11.versions.0.'|']", arr_83_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.11.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.11]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.11.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.11]", lpath))
             return False
     return True
 
@@ -3455,28 +3468,28 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.10.name
         res = isinstance(pval, str) and pval == "Debian"
         if not res:
-            rep is None or rep.append(("unexpected _Debian [.'$platforms'.0.'|'.10.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.10]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Debian [.'$platforms'.0.'|'.10.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.10]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.10.versions
         res = isinstance(pval, list)
         if res:
             for arr_84_idx, arr_84_item in enumerate(pval):
-                arr_84_lpath: Path = ((lpath if path is not None else None) + [ arr_84_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_84_lpath: Path = (lpath, arr_84_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.10.versions.0
                 res = ((arr_84_item is None or isinstance(arr_84_item, (bool, int, float, str)))) and arr_84_item in _jm_cst_57
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.10.versions.0.'|']", arr_84_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.10.versions.0.'|']", arr_84_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.10.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.10]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.10.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.10]", lpath))
             return False
     return True
 
@@ -3491,28 +3504,28 @@ def _jm_obj_37(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.9.name
         res = isinstance(pval, str) and pval == "NetBSD"
         if not res:
-            rep is None or rep.append(("unexpected _NetBSD [.'$platforms'.0.'|'.9.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.9]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _NetBSD [.'$platforms'.0.'|'.9.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.9]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.9.versions
         res = isinstance(pval, list)
         if res:
             for arr_85_idx, arr_85_item in enumerate(pval):
-                arr_85_lpath: Path = ((lpath if path is not None else None) + [ arr_85_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_85_lpath: Path = (lpath, arr_85_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.9.versions.0
                 res = ((arr_85_item is None or isinstance(arr_85_item, (bool, int, float, str)))) and arr_85_item in _jm_cst_58
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.9.versions.0.'|']", arr_85_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.9.versions.0.'|']", arr_85_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.9.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.9]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.9.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.9]", lpath))
             return False
     return True
 
@@ -3527,28 +3540,28 @@ def _jm_obj_38(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.8.name
         res = isinstance(pval, str) and pval == "Cumulus"
         if not res:
-            rep is None or rep.append(("unexpected _Cumulus [.'$platforms'.0.'|'.8.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.8]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Cumulus [.'$platforms'.0.'|'.8.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.8]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.8.versions
         res = isinstance(pval, list)
         if res:
             for arr_86_idx, arr_86_item in enumerate(pval):
-                arr_86_lpath: Path = ((lpath if path is not None else None) + [ arr_86_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_86_lpath: Path = (lpath, arr_86_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.8.versions.0
                 res = ((arr_86_item is None or isinstance(arr_86_item, (bool, int, float, str)))) and arr_86_item in _jm_cst_59
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.8.versions.0.'|']", arr_86_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.8.versions.0.'|']", arr_86_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.8.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.8]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.8.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.8]", lpath))
             return False
     return True
 
@@ -3562,28 +3575,28 @@ def _jm_obj_39(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.7.name
         res = isinstance(pval, str) and pval == "ClearLinux"
         if not res:
-            rep is None or rep.append(("unexpected _ClearLinux [.'$platforms'.0.'|'.7.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.7]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _ClearLinux [.'$platforms'.0.'|'.7.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.7]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.7.versions
         res = isinstance(pval, list)
         if res:
             for arr_87_idx, arr_87_item in enumerate(pval):
-                arr_87_lpath: Path = ((lpath if path is not None else None) + [ arr_87_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_87_lpath: Path = (lpath, arr_87_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.7.versions.0
                 res = isinstance(arr_87_item, str) and arr_87_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.7.versions.0]", arr_87_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.7.versions.0]", arr_87_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.7.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.7]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.7.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.7]", lpath))
             return False
     return True
 
@@ -3598,28 +3611,28 @@ def _jm_obj_40(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.6.name
         res = isinstance(pval, str) and pval == "Astra Linux"
         if not res:
-            rep is None or rep.append(("unexpected _Astra Linux [.'$platforms'.0.'|'.6.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.6]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Astra Linux [.'$platforms'.0.'|'.6.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.6]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.6.versions
         res = isinstance(pval, list)
         if res:
             for arr_88_idx, arr_88_item in enumerate(pval):
-                arr_88_lpath: Path = ((lpath if path is not None else None) + [ arr_88_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_88_lpath: Path = (lpath, arr_88_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.6.versions.0
                 res = ((arr_88_item is None or isinstance(arr_88_item, (bool, int, float, str)))) and arr_88_item in _jm_cst_60
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.6.versions.0.'|']", arr_88_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.6.versions.0.'|']", arr_88_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.6.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.6]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.6.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.6]", lpath))
             return False
     return True
 
@@ -3633,28 +3646,28 @@ def _jm_obj_41(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.5.name
         res = isinstance(pval, str) and pval == "ArchLinux"
         if not res:
-            rep is None or rep.append(("unexpected _ArchLinux [.'$platforms'.0.'|'.5.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.5]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _ArchLinux [.'$platforms'.0.'|'.5.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.5]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.5.versions
         res = isinstance(pval, list)
         if res:
             for arr_89_idx, arr_89_item in enumerate(pval):
-                arr_89_lpath: Path = ((lpath if path is not None else None) + [ arr_89_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_89_lpath: Path = (lpath, arr_89_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.5.versions.0
                 res = isinstance(arr_89_item, str) and arr_89_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.5.versions.0]", arr_89_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.5.versions.0]", arr_89_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.5.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.5]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.5.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.5]", lpath))
             return False
     return True
 
@@ -3668,28 +3681,28 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.4.name
         res = isinstance(pval, str) and pval == "aos"
         if not res:
-            rep is None or rep.append(("unexpected _aos [.'$platforms'.0.'|'.4.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.4]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _aos [.'$platforms'.0.'|'.4.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.4]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.4.versions
         res = isinstance(pval, list)
         if res:
             for arr_90_idx, arr_90_item in enumerate(pval):
-                arr_90_lpath: Path = ((lpath if path is not None else None) + [ arr_90_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_90_lpath: Path = (lpath, arr_90_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.4.versions.0
                 res = isinstance(arr_90_item, str) and arr_90_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.4.versions.0]", arr_90_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.4.versions.0]", arr_90_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.4.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.4]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.4.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.4]", lpath))
             return False
     return True
 
@@ -3704,28 +3717,28 @@ def _jm_obj_43(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.3.name
         res = isinstance(pval, str) and pval == "Amazon Linux"
         if not res:
-            rep is None or rep.append(("unexpected _Amazon Linux [.'$platforms'.0.'|'.3.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.3]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Amazon Linux [.'$platforms'.0.'|'.3.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.3]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.3.versions
         res = isinstance(pval, list)
         if res:
             for arr_91_idx, arr_91_item in enumerate(pval):
-                arr_91_lpath: Path = ((lpath if path is not None else None) + [ arr_91_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_91_lpath: Path = (lpath, arr_91_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.3.versions.0
                 res = ((arr_91_item is None or isinstance(arr_91_item, (bool, int, float, str)))) and arr_91_item in _jm_cst_61
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.3.versions.0.'|']", arr_91_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.3.versions.0.'|']", arr_91_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.3.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.3]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.3.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.3]", lpath))
             return False
     return True
 
@@ -3740,28 +3753,28 @@ def _jm_obj_44(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.2.name
         res = isinstance(pval, str) and pval == "Amazon"
         if not res:
-            rep is None or rep.append(("unexpected _Amazon [.'$platforms'.0.'|'.2.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.2]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Amazon [.'$platforms'.0.'|'.2.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.2]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.2.versions
         res = isinstance(pval, list)
         if res:
             for arr_92_idx, arr_92_item in enumerate(pval):
-                arr_92_lpath: Path = ((lpath if path is not None else None) + [ arr_92_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_92_lpath: Path = (lpath, arr_92_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.2.versions.0
                 res = ((arr_92_item is None or isinstance(arr_92_item, (bool, int, float, str)))) and arr_92_item in _jm_cst_62
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.2.versions.0.'|']", arr_92_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.2.versions.0.'|']", arr_92_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.2.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.2]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.2.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.2]", lpath))
             return False
     return True
 
@@ -3775,28 +3788,28 @@ def _jm_obj_45(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.1.name
         res = isinstance(pval, str) and pval == "Alpine"
         if not res:
-            rep is None or rep.append(("unexpected _Alpine [.'$platforms'.0.'|'.1.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.1]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _Alpine [.'$platforms'.0.'|'.1.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.1]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.1.versions
         res = isinstance(pval, list)
         if res:
             for arr_93_idx, arr_93_item in enumerate(pval):
-                arr_93_lpath: Path = ((lpath if path is not None else None) + [ arr_93_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_93_lpath: Path = (lpath, arr_93_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.1.versions.0
                 res = isinstance(arr_93_item, str) and arr_93_item == "all"
                 if not res:
-                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.1.versions.0]", arr_93_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("unexpected _all [.'$platforms'.0.'|'.1.versions.0]", arr_93_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.1.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.1]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.1.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.1]", lpath))
             return False
     return True
 
@@ -3811,28 +3824,28 @@ def _jm_obj_46(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$platforms'.0.'|'.0.name
         res = isinstance(pval, str) and pval == "AIX"
         if not res:
-            rep is None or rep.append(("unexpected _AIX [.'$platforms'.0.'|'.0.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.0]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _AIX [.'$platforms'.0.'|'.0.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$platforms'.0.'|'.0]", lpath))
             return False
     if (pval := val.get("versions", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "versions" ]) if path is not None else None
+        lpath = (path, "versions") if path is not None else None
         # .'$platforms'.0.'|'.0.versions
         res = isinstance(pval, list)
         if res:
             for arr_94_idx, arr_94_item in enumerate(pval):
-                arr_94_lpath: Path = ((lpath if path is not None else None) + [ arr_94_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_94_lpath: Path = (lpath, arr_94_idx) if lpath is not None else None
                 # .'$platforms'.0.'|'.0.versions.0
                 res = ((arr_94_item is None or isinstance(arr_94_item, (bool, int, float, str)))) and arr_94_item in _jm_cst_63
                 if not res:
-                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.0.versions.0.'|']", arr_94_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("value not in enum [.'$platforms'.0.'|'.0.versions.0.'|']", arr_94_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.0.versions]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.0]", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$platforms'.0.'|'.0.versions]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <versions> [.'$platforms'.0.'|'.0]", lpath))
             return False
     return True
 
@@ -3842,204 +3855,204 @@ def json_model_50(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_47_idx, arr_47_item in enumerate(val):
-            arr_47_lpath: Path = (path + [ arr_47_idx ]) if path is not None else None
+            arr_47_lpath: Path = (path, arr_47_idx) if path is not None else None
             # .'$platforms'.0
             res = isinstance(arr_47_item, dict)
             if res:
                 # .'$platforms'.0.'|'.0
-                res = _jm_obj_46(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                res = _jm_obj_46(arr_47_item, arr_47_lpath, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.0]", arr_47_lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.0]", arr_47_lpath))
                     # .'$platforms'.0.'|'.1
-                    res = _jm_obj_45(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                    res = _jm_obj_45(arr_47_item, arr_47_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.1]", arr_47_lpath if path is not None else None))
+                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.1]", arr_47_lpath))
                         # .'$platforms'.0.'|'.2
-                        res = _jm_obj_44(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                        res = _jm_obj_44(arr_47_item, arr_47_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.2]", arr_47_lpath if path is not None else None))
+                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.2]", arr_47_lpath))
                             # .'$platforms'.0.'|'.3
-                            res = _jm_obj_43(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                            res = _jm_obj_43(arr_47_item, arr_47_lpath, rep)
                             if not res:
-                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.3]", arr_47_lpath if path is not None else None))
+                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.3]", arr_47_lpath))
                                 # .'$platforms'.0.'|'.4
-                                res = _jm_obj_42(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                res = _jm_obj_42(arr_47_item, arr_47_lpath, rep)
                                 if not res:
-                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.4]", arr_47_lpath if path is not None else None))
+                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.4]", arr_47_lpath))
                                     # .'$platforms'.0.'|'.5
-                                    res = _jm_obj_41(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                    res = _jm_obj_41(arr_47_item, arr_47_lpath, rep)
                                     if not res:
-                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.5]", arr_47_lpath if path is not None else None))
+                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.5]", arr_47_lpath))
                                         # .'$platforms'.0.'|'.6
-                                        res = _jm_obj_40(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                        res = _jm_obj_40(arr_47_item, arr_47_lpath, rep)
                                         if not res:
-                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.6]", arr_47_lpath if path is not None else None))
+                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.6]", arr_47_lpath))
                                             # .'$platforms'.0.'|'.7
-                                            res = _jm_obj_39(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                            res = _jm_obj_39(arr_47_item, arr_47_lpath, rep)
                                             if not res:
-                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.7]", arr_47_lpath if path is not None else None))
+                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.7]", arr_47_lpath))
                                                 # .'$platforms'.0.'|'.8
-                                                res = _jm_obj_38(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                res = _jm_obj_38(arr_47_item, arr_47_lpath, rep)
                                                 if not res:
-                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.8]", arr_47_lpath if path is not None else None))
+                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.8]", arr_47_lpath))
                                                     # .'$platforms'.0.'|'.9
-                                                    res = _jm_obj_37(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                    res = _jm_obj_37(arr_47_item, arr_47_lpath, rep)
                                                     if not res:
-                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.9]", arr_47_lpath if path is not None else None))
+                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.9]", arr_47_lpath))
                                                         # .'$platforms'.0.'|'.10
-                                                        res = _jm_obj_36(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                        res = _jm_obj_36(arr_47_item, arr_47_lpath, rep)
                                                         if not res:
-                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.10]", arr_47_lpath if path is not None else None))
+                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.10]", arr_47_lpath))
                                                             # .'$platforms'.0.'|'.11
-                                                            res = _jm_obj_35(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                            res = _jm_obj_35(arr_47_item, arr_47_lpath, rep)
                                                             if not res:
-                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.11]", arr_47_lpath if path is not None else None))
+                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.11]", arr_47_lpath))
                                                                 # .'$platforms'.0.'|'.12
-                                                                res = _jm_obj_34(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                res = _jm_obj_34(arr_47_item, arr_47_lpath, rep)
                                                                 if not res:
-                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.12]", arr_47_lpath if path is not None else None))
+                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.12]", arr_47_lpath))
                                                                     # .'$platforms'.0.'|'.13
-                                                                    res = _jm_obj_33(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                    res = _jm_obj_33(arr_47_item, arr_47_lpath, rep)
                                                                     if not res:
-                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.13]", arr_47_lpath if path is not None else None))
+                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.13]", arr_47_lpath))
                                                                         # .'$platforms'.0.'|'.14
-                                                                        res = _jm_obj_32(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                        res = _jm_obj_32(arr_47_item, arr_47_lpath, rep)
                                                                         if not res:
-                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.14]", arr_47_lpath if path is not None else None))
+                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.14]", arr_47_lpath))
                                                                             # .'$platforms'.0.'|'.15
-                                                                            res = _jm_obj_31(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                            res = _jm_obj_31(arr_47_item, arr_47_lpath, rep)
                                                                             if not res:
-                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.15]", arr_47_lpath if path is not None else None))
+                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.15]", arr_47_lpath))
                                                                                 # .'$platforms'.0.'|'.16
-                                                                                res = _jm_obj_30(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                res = _jm_obj_30(arr_47_item, arr_47_lpath, rep)
                                                                                 if not res:
-                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.16]", arr_47_lpath if path is not None else None))
+                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.16]", arr_47_lpath))
                                                                                     # .'$platforms'.0.'|'.17
-                                                                                    res = _jm_obj_29(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                    res = _jm_obj_29(arr_47_item, arr_47_lpath, rep)
                                                                                     if not res:
-                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.17]", arr_47_lpath if path is not None else None))
+                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.17]", arr_47_lpath))
                                                                                         # .'$platforms'.0.'|'.18
-                                                                                        res = _jm_obj_28(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                        res = _jm_obj_28(arr_47_item, arr_47_lpath, rep)
                                                                                         if not res:
-                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.18]", arr_47_lpath if path is not None else None))
+                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.18]", arr_47_lpath))
                                                                                             # .'$platforms'.0.'|'.19
-                                                                                            res = _jm_obj_27(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                            res = _jm_obj_27(arr_47_item, arr_47_lpath, rep)
                                                                                             if not res:
-                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.19]", arr_47_lpath if path is not None else None))
+                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.19]", arr_47_lpath))
                                                                                                 # .'$platforms'.0.'|'.20
-                                                                                                res = _jm_obj_26(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                res = _jm_obj_26(arr_47_item, arr_47_lpath, rep)
                                                                                                 if not res:
-                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.20]", arr_47_lpath if path is not None else None))
+                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.20]", arr_47_lpath))
                                                                                                     # .'$platforms'.0.'|'.21
-                                                                                                    res = _jm_obj_25(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                    res = _jm_obj_25(arr_47_item, arr_47_lpath, rep)
                                                                                                     if not res:
-                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.21]", arr_47_lpath if path is not None else None))
+                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.21]", arr_47_lpath))
                                                                                                         # .'$platforms'.0.'|'.22
-                                                                                                        res = _jm_obj_24(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                        res = _jm_obj_24(arr_47_item, arr_47_lpath, rep)
                                                                                                         if not res:
-                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.22]", arr_47_lpath if path is not None else None))
+                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.22]", arr_47_lpath))
                                                                                                             # .'$platforms'.0.'|'.23
-                                                                                                            res = _jm_obj_23(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                            res = _jm_obj_23(arr_47_item, arr_47_lpath, rep)
                                                                                                             if not res:
-                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.23]", arr_47_lpath if path is not None else None))
+                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.23]", arr_47_lpath))
                                                                                                                 # .'$platforms'.0.'|'.24
-                                                                                                                res = _jm_obj_22(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                res = _jm_obj_22(arr_47_item, arr_47_lpath, rep)
                                                                                                                 if not res:
-                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.24]", arr_47_lpath if path is not None else None))
+                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.24]", arr_47_lpath))
                                                                                                                     # .'$platforms'.0.'|'.25
-                                                                                                                    res = _jm_obj_21(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                    res = _jm_obj_21(arr_47_item, arr_47_lpath, rep)
                                                                                                                     if not res:
-                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.25]", arr_47_lpath if path is not None else None))
+                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.25]", arr_47_lpath))
                                                                                                                         # .'$platforms'.0.'|'.26
-                                                                                                                        res = _jm_obj_20(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                        res = _jm_obj_20(arr_47_item, arr_47_lpath, rep)
                                                                                                                         if not res:
-                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.26]", arr_47_lpath if path is not None else None))
+                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.26]", arr_47_lpath))
                                                                                                                             # .'$platforms'.0.'|'.27
-                                                                                                                            res = _jm_obj_19(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                            res = _jm_obj_19(arr_47_item, arr_47_lpath, rep)
                                                                                                                             if not res:
-                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.27]", arr_47_lpath if path is not None else None))
+                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.27]", arr_47_lpath))
                                                                                                                                 # .'$platforms'.0.'|'.28
-                                                                                                                                res = _jm_obj_18(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                res = _jm_obj_18(arr_47_item, arr_47_lpath, rep)
                                                                                                                                 if not res:
-                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.28]", arr_47_lpath if path is not None else None))
+                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.28]", arr_47_lpath))
                                                                                                                                     # .'$platforms'.0.'|'.29
-                                                                                                                                    res = _jm_obj_17(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                    res = _jm_obj_17(arr_47_item, arr_47_lpath, rep)
                                                                                                                                     if not res:
-                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.29]", arr_47_lpath if path is not None else None))
+                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.29]", arr_47_lpath))
                                                                                                                                         # .'$platforms'.0.'|'.30
-                                                                                                                                        res = _jm_obj_16(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                        res = _jm_obj_16(arr_47_item, arr_47_lpath, rep)
                                                                                                                                         if not res:
-                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.30]", arr_47_lpath if path is not None else None))
+                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.30]", arr_47_lpath))
                                                                                                                                             # .'$platforms'.0.'|'.31
-                                                                                                                                            res = _jm_obj_15(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                            res = _jm_obj_15(arr_47_item, arr_47_lpath, rep)
                                                                                                                                             if not res:
-                                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.31]", arr_47_lpath if path is not None else None))
+                                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.31]", arr_47_lpath))
                                                                                                                                                 # .'$platforms'.0.'|'.32
-                                                                                                                                                res = _jm_obj_14(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                res = _jm_obj_14(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                 if not res:
-                                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.32]", arr_47_lpath if path is not None else None))
+                                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.32]", arr_47_lpath))
                                                                                                                                                     # .'$platforms'.0.'|'.33
-                                                                                                                                                    res = _jm_obj_13(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                    res = _jm_obj_13(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                     if not res:
-                                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.33]", arr_47_lpath if path is not None else None))
+                                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.33]", arr_47_lpath))
                                                                                                                                                         # .'$platforms'.0.'|'.34
-                                                                                                                                                        res = _jm_obj_12(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                        res = _jm_obj_12(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                         if not res:
-                                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.34]", arr_47_lpath if path is not None else None))
+                                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.34]", arr_47_lpath))
                                                                                                                                                             # .'$platforms'.0.'|'.35
-                                                                                                                                                            res = _jm_obj_11(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                            res = _jm_obj_11(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                             if not res:
-                                                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.35]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.35]", arr_47_lpath))
                                                                                                                                                                 # .'$platforms'.0.'|'.36
-                                                                                                                                                                res = _jm_obj_10(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                res = _jm_obj_10(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                 if not res:
-                                                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.36]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.36]", arr_47_lpath))
                                                                                                                                                                     # .'$platforms'.0.'|'.37
-                                                                                                                                                                    res = _jm_obj_9(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                    res = _jm_obj_9(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                     if not res:
-                                                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.37]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.37]", arr_47_lpath))
                                                                                                                                                                         # .'$platforms'.0.'|'.38
-                                                                                                                                                                        res = _jm_obj_8(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                        res = _jm_obj_8(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                         if not res:
-                                                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.38]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.38]", arr_47_lpath))
                                                                                                                                                                             # .'$platforms'.0.'|'.39
-                                                                                                                                                                            res = _jm_obj_7(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                            res = _jm_obj_7(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                             if not res:
-                                                                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.39]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.39]", arr_47_lpath))
                                                                                                                                                                                 # .'$platforms'.0.'|'.40
-                                                                                                                                                                                res = _jm_obj_6(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                                res = _jm_obj_6(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                                 if not res:
-                                                                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.40]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.40]", arr_47_lpath))
                                                                                                                                                                                     # .'$platforms'.0.'|'.41
-                                                                                                                                                                                    res = _jm_obj_5(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                                    res = _jm_obj_5(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                                     if not res:
-                                                                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.41]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.41]", arr_47_lpath))
                                                                                                                                                                                         # .'$platforms'.0.'|'.42
-                                                                                                                                                                                        res = _jm_obj_4(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                                        res = _jm_obj_4(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                                         if not res:
-                                                                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.42]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.42]", arr_47_lpath))
                                                                                                                                                                                             # .'$platforms'.0.'|'.43
-                                                                                                                                                                                            res = _jm_obj_3(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                                            res = _jm_obj_3(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                                             if not res:
-                                                                                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.43]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                                                rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.43]", arr_47_lpath))
                                                                                                                                                                                                 # .'$platforms'.0.'|'.44
-                                                                                                                                                                                                res = _jm_obj_2(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                                                res = _jm_obj_2(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                                                 if not res:
-                                                                                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.44]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                                                    rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.44]", arr_47_lpath))
                                                                                                                                                                                                     # .'$platforms'.0.'|'.45
-                                                                                                                                                                                                    res = _jm_obj_1(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                                                    res = _jm_obj_1(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                                                     if not res:
-                                                                                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.45]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                                                        rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.45]", arr_47_lpath))
                                                                                                                                                                                                         # .'$platforms'.0.'|'.46
-                                                                                                                                                                                                        res = _jm_obj_0(arr_47_item, arr_47_lpath if path is not None else None, rep)
+                                                                                                                                                                                                        res = _jm_obj_0(arr_47_item, arr_47_lpath, rep)
                                                                                                                                                                                                         if not res:
-                                                                                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.46]", arr_47_lpath if path is not None else None))
+                                                                                                                                                                                                            rep is None or rep.append(("unexpected element [.'$platforms'.0.'|'.46]", arr_47_lpath))
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.'$platforms'.0.'|']", arr_47_lpath if path is not None else None))
+                    rep is None or rep.append(("no model matched [.'$platforms'.0.'|']", arr_47_lpath))
             else:
-                rep is None or rep.append(("unexpected type [.'$platforms'.0.'|']", arr_47_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected type [.'$platforms'.0.'|']", arr_47_lpath))
             if not res:
                 break
     if not res:
@@ -4056,34 +4069,34 @@ def json_model_51(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_47: Path = (path + [ prop ]) if path is not None else None
+        lpath_47: Path = (path, prop) if path is not None else None
         if prop == "namespace":
             # handle may namespace property
             # .'$GalaxyInfoModelCollection'.namespace
             # "/^[a-z][-a-z0-9_]+$/"
-            res = isinstance(pval, str) and _jm_re_0(pval, lpath_47 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_0(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^[a-z][-a-z0-9_]+$/ [.'$GalaxyInfoModelCollection'.namespace]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.namespace]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected /^[a-z][-a-z0-9_]+$/ [.'$GalaxyInfoModelCollection'.namespace]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.namespace]", lpath_47))
                 return False
             continue
         elif prop == "platforms":
             # handle may platforms property
             # .'$GalaxyInfoModelCollection'.platforms
-            res = json_model_50(pval, lpath_47 if path is not None else None, rep)
+            res = json_model_50(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected $platforms [.'$GalaxyInfoModelCollection'.platforms]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.platforms]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected $platforms [.'$GalaxyInfoModelCollection'.platforms]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.platforms]", lpath_47))
                 return False
             continue
         elif prop == "role_name":
             # handle may role_name property
             # .'$GalaxyInfoModelCollection'.role_name
             # "/^[a-z][a-z0-9_]+$/"
-            res = isinstance(pval, str) and _jm_re_1(pval, lpath_47 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_1(pval, lpath_47, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^[a-z][a-z0-9_]+$/ [.'$GalaxyInfoModelCollection'.role_name]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.role_name]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected /^[a-z][a-z0-9_]+$/ [.'$GalaxyInfoModelCollection'.role_name]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.role_name]", lpath_47))
                 return False
             continue
         elif prop == "galaxy_tags":
@@ -4092,15 +4105,15 @@ def json_model_51(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_95_idx, arr_95_item in enumerate(pval):
-                    arr_95_lpath: Path = ((lpath_47 if path is not None else None) + [ arr_95_idx ]) if (lpath_47 if path is not None else None) is not None else None
+                    arr_95_lpath: Path = (lpath_47, arr_95_idx) if lpath_47 is not None else None
                     # .'$GalaxyInfoModelCollection'.galaxy_tags.0
                     res = isinstance(arr_95_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelCollection'.galaxy_tags.0]", arr_95_lpath if (lpath_47 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelCollection'.galaxy_tags.0]", arr_95_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModelCollection'.galaxy_tags]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.galaxy_tags]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModelCollection'.galaxy_tags]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.galaxy_tags]", lpath_47))
                 return False
             continue
         elif prop == "video_links":
@@ -4108,8 +4121,8 @@ def json_model_51(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelCollection'.video_links
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModelCollection'.video_links]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.video_links]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModelCollection'.video_links]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.video_links]", lpath_47))
                 return False
             continue
         elif prop == "cloud_platforms":
@@ -4122,11 +4135,11 @@ def json_model_51(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelCollection'.min_ansible_version
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelCollection'.min_ansible_version]", lpath_47 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.min_ansible_version]", lpath_47 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelCollection'.min_ansible_version]", lpath_47))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelCollection'.min_ansible_version]", lpath_47))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModelCollection']", lpath_47 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModelCollection']", lpath_47))
         return False
     return True
 
@@ -4140,15 +4153,15 @@ def json_model_52(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_48: Path = (path + [ prop ]) if path is not None else None
+        lpath_48: Path = (path, prop) if path is not None else None
         if prop == "description":
             # handle must description property
             must_count += 1
             # .'$GalaxyInfoModelLoose'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.description]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelLoose'.description]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.description]", lpath_48))
+                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelLoose'.description]", lpath_48))
                 return False
             continue
         if prop == "author":
@@ -4156,8 +4169,8 @@ def json_model_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelLoose'.author
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.author]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.author]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.author]", lpath_48))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.author]", lpath_48))
                 return False
             continue
         elif prop == "company":
@@ -4165,8 +4178,8 @@ def json_model_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelLoose'.company
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.company]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.company]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.company]", lpath_48))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.company]", lpath_48))
                 return False
             continue
         elif prop == "license":
@@ -4174,8 +4187,8 @@ def json_model_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelLoose'.license
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.license]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.license]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.license]", lpath_48))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.license]", lpath_48))
                 return False
             continue
         elif prop == "github_branch":
@@ -4183,8 +4196,8 @@ def json_model_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelLoose'.github_branch
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.github_branch]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.github_branch]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.github_branch]", lpath_48))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.github_branch]", lpath_48))
                 return False
             continue
         elif prop == "issue_tracker_url":
@@ -4192,8 +4205,8 @@ def json_model_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelLoose'.issue_tracker_url
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.issue_tracker_url]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.issue_tracker_url]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.issue_tracker_url]", lpath_48))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.issue_tracker_url]", lpath_48))
                 return False
             continue
         elif prop == "min_ansible_container_version":
@@ -4201,11 +4214,11 @@ def json_model_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelLoose'.min_ansible_container_version
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.min_ansible_container_version]", lpath_48 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.min_ansible_container_version]", lpath_48 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelLoose'.min_ansible_container_version]", lpath_48))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelLoose'.min_ansible_container_version]", lpath_48))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModelLoose']", lpath_48 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModelLoose']", lpath_48))
         return False
     if must_count != 1:
         if rep is not None:
@@ -4223,15 +4236,15 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_49: Path = (path + [ prop ]) if path is not None else None
+        lpath_49: Path = (path, prop) if path is not None else None
         if prop == "author":
             # handle must author property
             must_count += 1
             # .'$GalaxyInfoModelStandalone'.author
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.author]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.author]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.author]", lpath_49))
+                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.author]", lpath_49))
                 return False
             continue
         elif prop == "license":
@@ -4240,8 +4253,8 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelStandalone'.license
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.license]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.license]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.license]", lpath_49))
+                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.license]", lpath_49))
                 return False
             continue
         elif prop == "standalone":
@@ -4250,8 +4263,8 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelStandalone'.standalone
             res = isinstance(pval, bool) and pval == True
             if not res:
-                rep is None or rep.append(("unexpected =true [.'$GalaxyInfoModelStandalone'.standalone]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.standalone]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected =true [.'$GalaxyInfoModelStandalone'.standalone]", lpath_49))
+                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.standalone]", lpath_49))
                 return False
             continue
         elif prop == "description":
@@ -4260,8 +4273,8 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelStandalone'.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.description]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.description]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.description]", lpath_49))
+                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.description]", lpath_49))
                 return False
             continue
         elif prop == "min_ansible_version":
@@ -4270,8 +4283,8 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelStandalone'.min_ansible_version
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.min_ansible_version]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.min_ansible_version]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.min_ansible_version]", lpath_49))
+                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModelStandalone'.min_ansible_version]", lpath_49))
                 return False
             continue
         if prop == "company":
@@ -4279,37 +4292,37 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelStandalone'.company
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.company]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.company]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.company]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.company]", lpath_49))
                 return False
             continue
         elif prop == "namespace":
             # handle may namespace property
             # .'$GalaxyInfoModelStandalone'.namespace
             # "/^[a-z][-a-z0-9_]+$/"
-            res = isinstance(pval, str) and _jm_re_0(pval, lpath_49 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_0(pval, lpath_49, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^[a-z][-a-z0-9_]+$/ [.'$GalaxyInfoModelStandalone'.namespace]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.namespace]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected /^[a-z][-a-z0-9_]+$/ [.'$GalaxyInfoModelStandalone'.namespace]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.namespace]", lpath_49))
                 return False
             continue
         elif prop == "platforms":
             # handle may platforms property
             # .'$GalaxyInfoModelStandalone'.platforms
-            res = json_model_50(pval, lpath_49 if path is not None else None, rep)
+            res = json_model_50(pval, lpath_49, rep)
             if not res:
-                rep is None or rep.append(("unexpected $platforms [.'$GalaxyInfoModelStandalone'.platforms]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.platforms]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected $platforms [.'$GalaxyInfoModelStandalone'.platforms]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.platforms]", lpath_49))
                 return False
             continue
         elif prop == "role_name":
             # handle may role_name property
             # .'$GalaxyInfoModelStandalone'.role_name
             # "/^[a-z][a-z0-9_]+$/"
-            res = isinstance(pval, str) and _jm_re_1(pval, lpath_49 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_1(pval, lpath_49, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^[a-z][a-z0-9_]+$/ [.'$GalaxyInfoModelStandalone'.role_name]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.role_name]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected /^[a-z][a-z0-9_]+$/ [.'$GalaxyInfoModelStandalone'.role_name]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.role_name]", lpath_49))
                 return False
             continue
         elif prop == "galaxy_tags":
@@ -4318,15 +4331,15 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_96_idx, arr_96_item in enumerate(pval):
-                    arr_96_lpath: Path = ((lpath_49 if path is not None else None) + [ arr_96_idx ]) if (lpath_49 if path is not None else None) is not None else None
+                    arr_96_lpath: Path = (lpath_49, arr_96_idx) if lpath_49 is not None else None
                     # .'$GalaxyInfoModelStandalone'.galaxy_tags.0
                     res = isinstance(arr_96_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.galaxy_tags.0]", arr_96_lpath if (lpath_49 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.galaxy_tags.0]", arr_96_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModelStandalone'.galaxy_tags]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.galaxy_tags]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModelStandalone'.galaxy_tags]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.galaxy_tags]", lpath_49))
                 return False
             continue
         elif prop == "video_links":
@@ -4334,8 +4347,8 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelStandalone'.video_links
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModelStandalone'.video_links]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.video_links]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModelStandalone'.video_links]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.video_links]", lpath_49))
                 return False
             continue
         elif prop == "github_branch":
@@ -4343,8 +4356,8 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelStandalone'.github_branch
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.github_branch]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.github_branch]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.github_branch]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.github_branch]", lpath_49))
                 return False
             continue
         elif prop == "cloud_platforms":
@@ -4357,8 +4370,8 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelStandalone'.issue_tracker_url
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.issue_tracker_url]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.issue_tracker_url]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.issue_tracker_url]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.issue_tracker_url]", lpath_49))
                 return False
             continue
         elif prop == "min_ansible_container_version":
@@ -4366,11 +4379,11 @@ def json_model_53(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModelStandalone'.min_ansible_container_version
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.min_ansible_container_version]", lpath_49 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.min_ansible_container_version]", lpath_49 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModelStandalone'.min_ansible_container_version]", lpath_49))
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModelStandalone'.min_ansible_container_version]", lpath_49))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModelStandalone']", lpath_49 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModelStandalone']", lpath_49))
         return False
     if must_count != 5:
         if rep is not None:
@@ -4416,11 +4429,11 @@ def _jm_f_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_97_idx, arr_97_item in enumerate(val):
-            arr_97_lpath: Path = (path + [ arr_97_idx ]) if path is not None else None
+            arr_97_lpath: Path = (path, arr_97_idx) if path is not None else None
             # .'$GalaxyInfoModel'.'|'.1.galaxy_tags.0
             res = isinstance(arr_97_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModel'.'|'.1.galaxy_tags.0]", arr_97_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModel'.'|'.1.galaxy_tags.0]", arr_97_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModel'.'|'.1.galaxy_tags]", path))
@@ -4502,15 +4515,15 @@ def _jm_obj_47(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_50: Path = (path + [ prop ]) if path is not None else None
+        lpath_50: Path = (path, prop) if path is not None else None
         if prop == "standalone":
             # handle must standalone property
             must_count += 1
             # .'$GalaxyInfoModel'.'|'.1.standalone
             res = isinstance(pval, bool) and pval == False
             if not res:
-                rep is None or rep.append(("unexpected =false [.'$GalaxyInfoModel'.'|'.1.standalone]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModel'.'|'.1.standalone]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected =false [.'$GalaxyInfoModel'.'|'.1.standalone]", lpath_50))
+                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModel'.'|'.1.standalone]", lpath_50))
                 return False
             continue
         elif prop == "description":
@@ -4519,17 +4532,17 @@ def _jm_obj_47(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$GalaxyInfoModel'.'|'.1.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModel'.'|'.1.description]", lpath_50 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModel'.'|'.1.description]", lpath_50 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModel'.'|'.1.description]", lpath_50))
+                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModel'.'|'.1.description]", lpath_50))
                 return False
             continue
         if pfun := _jm_obj_47_map.get(prop):
             # handle 13 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_50 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModel'.'|'.1]", lpath_50 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_50, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModel'.'|'.1]", lpath_50))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModel'.'|'.1]", lpath_50 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModel'.'|'.1]", lpath_50))
         return False
     if must_count != 2:
         if rep is not None:
@@ -4569,11 +4582,11 @@ def _jm_f_15(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_98_idx, arr_98_item in enumerate(val):
-            arr_98_lpath: Path = (path + [ arr_98_idx ]) if path is not None else None
+            arr_98_lpath: Path = (path, arr_98_idx) if path is not None else None
             # .'$GalaxyInfoModel'.'|'.2.galaxy_tags.0
             res = isinstance(arr_98_item, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModel'.'|'.2.galaxy_tags.0]", arr_98_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModel'.'|'.2.galaxy_tags.0]", arr_98_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$GalaxyInfoModel'.'|'.2.galaxy_tags]", path))
@@ -4655,24 +4668,24 @@ def _jm_obj_48(val: Jsonable, path: Path, rep: Report) -> bool:
     pfun: CheckFun
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_51: Path = (path + [ prop ]) if path is not None else None
+        lpath_51: Path = (path, prop) if path is not None else None
         if prop == "description":
             # handle must description property
             must_count += 1
             # .'$GalaxyInfoModel'.'|'.2.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModel'.'|'.2.description]", lpath_51 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModel'.'|'.2.description]", lpath_51 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$GalaxyInfoModel'.'|'.2.description]", lpath_51))
+                rep is None or rep.append(("invalid mandatory prop value [.'$GalaxyInfoModel'.'|'.2.description]", lpath_51))
                 return False
             continue
         if pfun := _jm_obj_48_map.get(prop):
             # handle 13 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_51 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModel'.'|'.2]", lpath_51 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_51, rep):
+                rep is None or rep.append(("invalid optional prop value [.'$GalaxyInfoModel'.'|'.2]", lpath_51))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModel'.'|'.2]", lpath_51 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$GalaxyInfoModel'.'|'.2]", lpath_51))
         return False
     if must_count != 1:
         if rep is not None:
@@ -4717,12 +4730,12 @@ def json_model_55(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_99_idx, arr_99_item in enumerate(val):
-            arr_99_lpath: Path = (path + [ arr_99_idx ]) if path is not None else None
+            arr_99_lpath: Path = (path, arr_99_idx) if path is not None else None
             # .'$collections'.0
             # "/^[a-z_]+\\.[a-z_]+$/"
-            res = isinstance(arr_99_item, str) and _jm_re_2(arr_99_item, arr_99_lpath if path is not None else None, rep)
+            res = isinstance(arr_99_item, str) and _jm_re_2(arr_99_item, arr_99_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^[a-z_]+\\.[a-z_]+$/ [.'$collections'.0]", arr_99_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected /^[a-z_]+\\.[a-z_]+$/ [.'$collections'.0]", arr_99_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$collections']", path))
@@ -4743,11 +4756,11 @@ def json_model_56(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(val, list)
             if res:
                 for arr_100_idx, arr_100_item in enumerate(val):
-                    arr_100_lpath: Path = (path + [ arr_100_idx ]) if path is not None else None
+                    arr_100_lpath: Path = (path, arr_100_idx) if path is not None else None
                     # .'$complex_conditional'.'|'.2.0
                     res = isinstance(arr_100_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$complex_conditional'.'|'.2.0]", arr_100_lpath if path is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$complex_conditional'.'|'.2.0]", arr_100_lpath))
                         break
             if not res:
                 rep is None or rep.append(("not array or unexpected array [.'$complex_conditional'.'|'.2]", path))
@@ -4780,93 +4793,93 @@ def json_model_57(val: Jsonable, path: Path, rep: Report) -> bool:
     pval: Jsonable
     res: bool
     if (pval := val.get("become", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "become" ]) if path is not None else None
+        lpath = (path, "become") if path is not None else None
         # .'$DependencyModelLoose'.become
         res = isinstance(pval, bool)
         if not res:
-            rep is None or rep.append(("not a bool [.'$DependencyModelLoose'.become]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <become> [.'$DependencyModelLoose']", lpath if path is not None else None))
+            rep is None or rep.append(("not a bool [.'$DependencyModelLoose'.become]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <become> [.'$DependencyModelLoose']", lpath))
             return False
     if (pval := val.get("name", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "name" ]) if path is not None else None
+        lpath = (path, "name") if path is not None else None
         # .'$DependencyModelLoose'.name
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.name]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <name> [.'$DependencyModelLoose']", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.name]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <name> [.'$DependencyModelLoose']", lpath))
             return False
     if (pval := val.get("role", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "role" ]) if path is not None else None
+        lpath = (path, "role") if path is not None else None
         # .'$DependencyModelLoose'.role
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.role]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <role> [.'$DependencyModelLoose']", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.role]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <role> [.'$DependencyModelLoose']", lpath))
             return False
     if (pval := val.get("src", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "src" ]) if path is not None else None
+        lpath = (path, "src") if path is not None else None
         # .'$DependencyModelLoose'.src
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.src]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <src> [.'$DependencyModelLoose']", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.src]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <src> [.'$DependencyModelLoose']", lpath))
             return False
     if (pval := val.get("scm", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "scm" ]) if path is not None else None
+        lpath = (path, "scm") if path is not None else None
         # .'$DependencyModelLoose'.scm
         res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_64
         if not res:
-            rep is None or rep.append(("value not in enum [.'$DependencyModelLoose'.scm.'|']", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <scm> [.'$DependencyModelLoose']", lpath if path is not None else None))
+            rep is None or rep.append(("value not in enum [.'$DependencyModelLoose'.scm.'|']", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <scm> [.'$DependencyModelLoose']", lpath))
             return False
     if (pval := val.get("tags", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "tags" ]) if path is not None else None
+        lpath = (path, "tags") if path is not None else None
         # .'$DependencyModelLoose'.tags
         # .'$DependencyModelLoose'.tags.'|'.0
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.tags.'|'.0]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.tags.'|'.0]", lpath))
             # .'$DependencyModelLoose'.tags.'|'.1
             res = isinstance(pval, list)
             if res:
                 for arr_101_idx, arr_101_item in enumerate(pval):
-                    arr_101_lpath: Path = ((lpath if path is not None else None) + [ arr_101_idx ]) if (lpath if path is not None else None) is not None else None
+                    arr_101_lpath: Path = (lpath, arr_101_idx) if lpath is not None else None
                     # .'$DependencyModelLoose'.tags.'|'.1.0
                     res = isinstance(arr_101_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.tags.'|'.1.0]", arr_101_lpath if (lpath if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.tags.'|'.1.0]", arr_101_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$DependencyModelLoose'.tags.'|'.1]", lpath if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$DependencyModelLoose'.tags.'|'.1]", lpath))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$DependencyModelLoose'.tags.'|']", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <tags> [.'$DependencyModelLoose']", lpath if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$DependencyModelLoose'.tags.'|']", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <tags> [.'$DependencyModelLoose']", lpath))
             return False
     if (pval := val.get("vars", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "vars" ]) if path is not None else None
+        lpath = (path, "vars") if path is not None else None
         # .'$DependencyModelLoose'.vars
-        res = _jm_obj_49(pval, lpath if path is not None else None, rep)
+        res = _jm_obj_49(pval, lpath, rep)
         if not res:
-            rep is None or rep.append(("unexpected element [.'$DependencyModelLoose'.vars]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <vars> [.'$DependencyModelLoose']", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected element [.'$DependencyModelLoose'.vars]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <vars> [.'$DependencyModelLoose']", lpath))
             return False
     if (pval := val.get("version", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "version" ]) if path is not None else None
+        lpath = (path, "version") if path is not None else None
         # .'$DependencyModelLoose'.version
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.version]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <version> [.'$DependencyModelLoose']", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$DependencyModelLoose'.version]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <version> [.'$DependencyModelLoose']", lpath))
             return False
     if (pval := val.get("when", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "when" ]) if path is not None else None
+        lpath = (path, "when") if path is not None else None
         # .'$DependencyModelLoose'.when
-        res = json_model_56(pval, lpath if path is not None else None, rep)
+        res = json_model_56(pval, lpath, rep)
         if not res:
-            rep is None or rep.append(("unexpected $complex_conditional [.'$DependencyModelLoose'.when]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <when> [.'$DependencyModelLoose']", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected $complex_conditional [.'$DependencyModelLoose'.when]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <when> [.'$DependencyModelLoose']", lpath))
             return False
     return True
 
@@ -4882,12 +4895,12 @@ def _jm_obj_50(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("name", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <name> [.'$DependencyModel'.'&'.1.'|'.2]", path))
         return False
-    lpath = (path + [ "name" ]) if path is not None else None
+    lpath = (path, "name") if path is not None else None
     # .'$DependencyModel'.'&'.1.'|'.2.name
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$DependencyModel'.'&'.1.'|'.2.name]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <name> [.'$DependencyModel'.'&'.1.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$DependencyModel'.'&'.1.'|'.2.name]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <name> [.'$DependencyModel'.'&'.1.'|'.2]", lpath))
         return False
     return True
 
@@ -4903,12 +4916,12 @@ def _jm_obj_51(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("src", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <src> [.'$DependencyModel'.'&'.1.'|'.1]", path))
         return False
-    lpath = (path + [ "src" ]) if path is not None else None
+    lpath = (path, "src") if path is not None else None
     # .'$DependencyModel'.'&'.1.'|'.1.src
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$DependencyModel'.'&'.1.'|'.1.src]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <src> [.'$DependencyModel'.'&'.1.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$DependencyModel'.'&'.1.'|'.1.src]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <src> [.'$DependencyModel'.'&'.1.'|'.1]", lpath))
         return False
     return True
 
@@ -4924,12 +4937,12 @@ def _jm_obj_52(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("role", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <role> [.'$DependencyModel'.'&'.1.'|'.0]", path))
         return False
-    lpath = (path + [ "role" ]) if path is not None else None
+    lpath = (path, "role") if path is not None else None
     # .'$DependencyModel'.'&'.1.'|'.0.role
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$DependencyModel'.'&'.1.'|'.0.role]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <role> [.'$DependencyModel'.'&'.1.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$DependencyModel'.'&'.1.'|'.0.role]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <role> [.'$DependencyModel'.'&'.1.'|'.0]", lpath))
         return False
     return True
 
@@ -4979,23 +4992,23 @@ def json_model_59(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_52: Path = (path + [ prop ]) if path is not None else None
+        lpath_52: Path = (path, prop) if path is not None else None
         if prop == "collections":
             # handle may collections property
             # .'$AnsibleMetaObj'.collections
-            res = json_model_55(pval, lpath_52 if path is not None else None, rep)
+            res = json_model_55(pval, lpath_52, rep)
             if not res:
-                rep is None or rep.append(("unexpected $collections [.'$AnsibleMetaObj'.collections]", lpath_52 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnsibleMetaObj'.collections]", lpath_52 if path is not None else None))
+                rep is None or rep.append(("unexpected $collections [.'$AnsibleMetaObj'.collections]", lpath_52))
+                rep is None or rep.append(("invalid optional prop value [.'$AnsibleMetaObj'.collections]", lpath_52))
                 return False
             continue
         elif prop == "galaxy_info":
             # handle may galaxy_info property
             # .'$AnsibleMetaObj'.galaxy_info
-            res = json_model_54(pval, lpath_52 if path is not None else None, rep)
+            res = json_model_54(pval, lpath_52, rep)
             if not res:
-                rep is None or rep.append(("unexpected $GalaxyInfoModel [.'$AnsibleMetaObj'.galaxy_info]", lpath_52 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnsibleMetaObj'.galaxy_info]", lpath_52 if path is not None else None))
+                rep is None or rep.append(("unexpected $GalaxyInfoModel [.'$AnsibleMetaObj'.galaxy_info]", lpath_52))
+                rep is None or rep.append(("invalid optional prop value [.'$AnsibleMetaObj'.galaxy_info]", lpath_52))
                 return False
             continue
         elif prop == "dependencies":
@@ -5004,24 +5017,24 @@ def json_model_59(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_102_idx, arr_102_item in enumerate(pval):
-                    arr_102_lpath: Path = ((lpath_52 if path is not None else None) + [ arr_102_idx ]) if (lpath_52 if path is not None else None) is not None else None
+                    arr_102_lpath: Path = (lpath_52, arr_102_idx) if lpath_52 is not None else None
                     # .'$AnsibleMetaObj'.dependencies.0
                     # .'$AnsibleMetaObj'.dependencies.0.'|'.0
                     res = isinstance(arr_102_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.'$AnsibleMetaObj'.dependencies.0.'|'.0]", arr_102_lpath if (lpath_52 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.'$AnsibleMetaObj'.dependencies.0.'|'.0]", arr_102_lpath))
                         # .'$AnsibleMetaObj'.dependencies.0.'|'.1
-                        res = json_model_58(arr_102_item, arr_102_lpath if (lpath_52 if path is not None else None) is not None else None, rep)
+                        res = json_model_58(arr_102_item, arr_102_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $DependencyModel [.'$AnsibleMetaObj'.dependencies.0.'|'.1]", arr_102_lpath if (lpath_52 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $DependencyModel [.'$AnsibleMetaObj'.dependencies.0.'|'.1]", arr_102_lpath))
                     if res:
                         rep is None or rep.clear()
                     else:
-                        rep is None or rep.append(("no model matched [.'$AnsibleMetaObj'.dependencies.0.'|']", arr_102_lpath if (lpath_52 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("no model matched [.'$AnsibleMetaObj'.dependencies.0.'|']", arr_102_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$AnsibleMetaObj'.dependencies]", lpath_52 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnsibleMetaObj'.dependencies]", lpath_52 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$AnsibleMetaObj'.dependencies]", lpath_52))
+                rep is None or rep.append(("invalid optional prop value [.'$AnsibleMetaObj'.dependencies]", lpath_52))
                 return False
             continue
         elif prop == "allow_duplicates":
@@ -5029,11 +5042,11 @@ def json_model_59(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$AnsibleMetaObj'.allow_duplicates
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$AnsibleMetaObj'.allow_duplicates]", lpath_52 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$AnsibleMetaObj'.allow_duplicates]", lpath_52 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$AnsibleMetaObj'.allow_duplicates]", lpath_52))
+                rep is None or rep.append(("invalid optional prop value [.'$AnsibleMetaObj'.allow_duplicates]", lpath_52))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$AnsibleMetaObj']", lpath_52 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$AnsibleMetaObj']", lpath_52))
         return False
     return True
 
@@ -5327,5 +5340,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
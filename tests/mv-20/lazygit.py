@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 _jm_re_0_reco: object
@@ -81,11 +94,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$colorArray'.'@'.0
-            res = json_model_2(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_2(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $color [.'$colorArray'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $color [.'$colorArray'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -159,11 +172,11 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$stringArray'.'@'.0
-            res = json_model_8(arr_1_item, arr_1_lpath if path is not None else None, rep)
+            res = json_model_8(arr_1_item, arr_1_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $neString [.'$stringArray'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $neString [.'$stringArray'.'@'.0]", arr_1_lpath))
                 break
     if res:
         res = is_unique_array(val, path, rep)
@@ -188,12 +201,12 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("command", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <command> [.'$Prompts'.'|'.0.suggestions.'|'.1]", path))
         return False
-    lpath = (path + [ "command" ]) if path is not None else None
+    lpath = (path, "command") if path is not None else None
     # .'$Prompts'.'|'.0.suggestions.'|'.1.command
     res = isinstance(pval, str)
     if not res:
-        rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.0.suggestions.'|'.1.command]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <command> [.'$Prompts'.'|'.0.suggestions.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.0.suggestions.'|'.1.command]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <command> [.'$Prompts'.'|'.0.suggestions.'|'.1]", lpath))
         return False
     return True
 
@@ -213,12 +226,12 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("preset", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <preset> [.'$Prompts'.'|'.0.suggestions.'|'.0]", path))
         return False
-    lpath = (path + [ "preset" ]) if path is not None else None
+    lpath = (path, "preset") if path is not None else None
     # .'$Prompts'.'|'.0.suggestions.'|'.0.preset
     res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_2
     if not res:
-        rep is None or rep.append(("value not in enum [.'$Prompts'.'|'.0.suggestions.'|'.0.preset.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <preset> [.'$Prompts'.'|'.0.suggestions.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("value not in enum [.'$Prompts'.'|'.0.suggestions.'|'.0.preset.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <preset> [.'$Prompts'.'|'.0.suggestions.'|'.0]", lpath))
         return False
     return True
 
@@ -230,15 +243,15 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "key":
             # handle must key property
             must_count += 1
             # .'$Prompts'.'|'.0.key
-            res = json_model_7(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $custom-commands-prompts-key-property [.'$Prompts'.'|'.0.key]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.0.key]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $custom-commands-prompts-key-property [.'$Prompts'.'|'.0.key]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.0.key]", lpath_0))
                 return False
             continue
         elif prop == "type":
@@ -247,18 +260,18 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.0.type
             res = isinstance(pval, str) and pval == "input"
             if not res:
-                rep is None or rep.append(("unexpected input [.'$Prompts'.'|'.0.type]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.0.type]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected input [.'$Prompts'.'|'.0.type]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.0.type]", lpath_0))
                 return False
             continue
         elif prop == "title":
             # handle must title property
             must_count += 1
             # .'$Prompts'.'|'.0.title
-            res = json_model_6(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $custom-commands-prompts-title-property [.'$Prompts'.'|'.0.title]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.0.title]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $custom-commands-prompts-title-property [.'$Prompts'.'|'.0.title]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.0.title]", lpath_0))
                 return False
             continue
         if prop == "suggestions":
@@ -268,25 +281,25 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
             if res:
                 if "preset" in pval:
                     # .'$Prompts'.'|'.0.suggestions.'|'.0
-                    res = _jm_obj_2(pval, lpath_0 if path is not None else None, rep)
+                    res = _jm_obj_2(pval, lpath_0, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected element [.'$Prompts'.'|'.0.suggestions.'|'.0]", lpath_0 if path is not None else None))
+                        rep is None or rep.append(("unexpected element [.'$Prompts'.'|'.0.suggestions.'|'.0]", lpath_0))
                 else:
                     if "command" in pval:
                         # .'$Prompts'.'|'.0.suggestions.'|'.1
-                        res = _jm_obj_1(pval, lpath_0 if path is not None else None, rep)
+                        res = _jm_obj_1(pval, lpath_0, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected element [.'$Prompts'.'|'.0.suggestions.'|'.1]", lpath_0 if path is not None else None))
+                            rep is None or rep.append(("unexpected element [.'$Prompts'.'|'.0.suggestions.'|'.1]", lpath_0))
                     else:
                         res = False
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.'$Prompts'.'|'.0.suggestions.'|']", lpath_0 if path is not None else None))
+                    rep is None or rep.append(("no model matched [.'$Prompts'.'|'.0.suggestions.'|']", lpath_0))
             else:
-                rep is None or rep.append(("unexpected type [.'$Prompts'.'|'.0.suggestions.'|']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected type [.'$Prompts'.'|'.0.suggestions.'|']", lpath_0))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.0.suggestions]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.0.suggestions]", lpath_0))
                 return False
             continue
         elif prop == "initialValue":
@@ -294,11 +307,11 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.0.initialValue
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.0.initialValue]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.0.initialValue]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.0.initialValue]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.0.initialValue]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Prompts'.'|'.0]", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Prompts'.'|'.0]", lpath_0))
         return False
     if must_count != 3:
         if rep is not None:
@@ -319,15 +332,15 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "key":
             # handle must key property
             must_count += 1
             # .'$Prompts'.'|'.1.key
-            res = json_model_7(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $custom-commands-prompts-key-property [.'$Prompts'.'|'.1.key]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.1.key]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $custom-commands-prompts-key-property [.'$Prompts'.'|'.1.key]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.1.key]", lpath_1))
                 return False
             continue
         elif prop == "type":
@@ -336,18 +349,18 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.1.type
             res = isinstance(pval, str) and pval == "confirm"
             if not res:
-                rep is None or rep.append(("unexpected confirm [.'$Prompts'.'|'.1.type]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.1.type]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected confirm [.'$Prompts'.'|'.1.type]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.1.type]", lpath_1))
                 return False
             continue
         elif prop == "title":
             # handle must title property
             must_count += 1
             # .'$Prompts'.'|'.1.title
-            res = json_model_6(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $custom-commands-prompts-title-property [.'$Prompts'.'|'.1.title]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.1.title]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $custom-commands-prompts-title-property [.'$Prompts'.'|'.1.title]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.1.title]", lpath_1))
                 return False
             continue
         if prop == "body":
@@ -355,11 +368,11 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.1.body
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.1.body]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.1.body]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.1.body]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.1.body]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Prompts'.'|'.1]", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Prompts'.'|'.1]", lpath_1))
         return False
     if must_count != 3:
         if rep is not None:
@@ -380,15 +393,15 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "value":
             # handle must value property
             must_count += 1
             # .'$Prompts'.'|'.2.options.'@'.0.value
-            res = json_model_8(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_8(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $neString [.'$Prompts'.'|'.2.options.'@'.0.value]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.2.options.'@'.0.value]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $neString [.'$Prompts'.'|'.2.options.'@'.0.value]", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.2.options.'@'.0.value]", lpath_2))
                 return False
             continue
         if prop == "name":
@@ -396,8 +409,8 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.2.options.'@'.0.name
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.2.options.'@'.0.name]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.2.options.'@'.0.name]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.2.options.'@'.0.name]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.2.options.'@'.0.name]", lpath_2))
                 return False
             continue
         elif prop == "description":
@@ -405,11 +418,11 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.2.options.'@'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.2.options.'@'.0.description]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.2.options.'@'.0.description]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.2.options.'@'.0.description]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.2.options.'@'.0.description]", lpath_2))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Prompts'.'|'.2.options.'@'.0]", lpath_2 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Prompts'.'|'.2.options.'@'.0]", lpath_2))
         return False
     if must_count != 1:
         if rep is not None:
@@ -433,56 +446,56 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$Prompts'.'|'.2]", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$Prompts'.'|'.2.type
     res = isinstance(pval, str) and pval == "menu"
     if not res:
-        rep is None or rep.append(("unexpected menu [.'$Prompts'.'|'.2.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Prompts'.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected menu [.'$Prompts'.'|'.2.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Prompts'.'|'.2]", lpath))
         return False
     if not ((pval := val.get("title", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <title> [.'$Prompts'.'|'.2]", path))
         return False
-    lpath = (path + [ "title" ]) if path is not None else None
+    lpath = (path, "title") if path is not None else None
     # .'$Prompts'.'|'.2.title
-    res = json_model_6(pval, lpath if path is not None else None, rep)
+    res = json_model_6(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $custom-commands-prompts-title-property [.'$Prompts'.'|'.2.title]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <title> [.'$Prompts'.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $custom-commands-prompts-title-property [.'$Prompts'.'|'.2.title]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <title> [.'$Prompts'.'|'.2]", lpath))
         return False
     if not ((pval := val.get("key", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <key> [.'$Prompts'.'|'.2]", path))
         return False
-    lpath = (path + [ "key" ]) if path is not None else None
+    lpath = (path, "key") if path is not None else None
     # .'$Prompts'.'|'.2.key
-    res = json_model_7(pval, lpath if path is not None else None, rep)
+    res = json_model_7(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $custom-commands-prompts-key-property [.'$Prompts'.'|'.2.key]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <key> [.'$Prompts'.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $custom-commands-prompts-key-property [.'$Prompts'.'|'.2.key]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <key> [.'$Prompts'.'|'.2]", lpath))
         return False
     if not ((pval := val.get("options", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <options> [.'$Prompts'.'|'.2]", path))
         return False
-    lpath = (path + [ "options" ]) if path is not None else None
+    lpath = (path, "options") if path is not None else None
     # .'$Prompts'.'|'.2.options
     # .'$Prompts'.'|'.2.options.'@'
     res = isinstance(pval, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(pval):
-            arr_2_lpath: Path = ((lpath if path is not None else None) + [ arr_2_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_2_lpath: Path = (lpath, arr_2_idx) if lpath is not None else None
             # .'$Prompts'.'|'.2.options.'@'.0
-            res = _jm_obj_5(arr_2_item, arr_2_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = _jm_obj_5(arr_2_item, arr_2_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Prompts'.'|'.2.options.'@'.0]", arr_2_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Prompts'.'|'.2.options.'@'.0]", arr_2_lpath))
                 break
     if res:
-        res = is_unique_array(pval, lpath if path is not None else None, rep)
+        res = is_unique_array(pval, lpath, rep)
         if not res:
-            rep is None or rep.append(("constraints failed [.'$Prompts'.'|'.2.options]", lpath if path is not None else None))
+            rep is None or rep.append(("constraints failed [.'$Prompts'.'|'.2.options]", lpath))
     else:
-        rep is None or rep.append(("not array or unexpected array [.'$Prompts'.'|'.2.options.'@']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$Prompts'.'|'.2.options.'@']", lpath))
     if not res:
-        rep is None or rep.append(("unexpected value for mandatory prop <options> [.'$Prompts'.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected value for mandatory prop <options> [.'$Prompts'.'|'.2]", lpath))
         return False
     return True
 
@@ -494,15 +507,15 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "key":
             # handle must key property
             must_count += 1
             # .'$Prompts'.'|'.3.key
-            res = json_model_7(pval, lpath_3 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected $custom-commands-prompts-key-property [.'$Prompts'.'|'.3.key]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.3.key]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $custom-commands-prompts-key-property [.'$Prompts'.'|'.3.key]", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.3.key]", lpath_3))
                 return False
             continue
         elif prop == "type":
@@ -511,18 +524,18 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.3.type
             res = isinstance(pval, str) and pval == "menuFromCommand"
             if not res:
-                rep is None or rep.append(("unexpected menuFromCommand [.'$Prompts'.'|'.3.type]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.3.type]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected menuFromCommand [.'$Prompts'.'|'.3.type]", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.3.type]", lpath_3))
                 return False
             continue
         elif prop == "title":
             # handle must title property
             must_count += 1
             # .'$Prompts'.'|'.3.title
-            res = json_model_6(pval, lpath_3 if path is not None else None, rep)
+            res = json_model_6(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected $custom-commands-prompts-title-property [.'$Prompts'.'|'.3.title]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.3.title]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $custom-commands-prompts-title-property [.'$Prompts'.'|'.3.title]", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.3.title]", lpath_3))
                 return False
             continue
         elif prop == "command":
@@ -531,8 +544,8 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.3.command
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.3.command]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.3.command]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.3.command]", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Prompts'.'|'.3.command]", lpath_3))
                 return False
             continue
         if prop == "filter":
@@ -540,8 +553,8 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.3.filter
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.3.filter]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.3.filter]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.3.filter]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.3.filter]", lpath_3))
                 return False
             continue
         elif prop == "labelFormat":
@@ -549,8 +562,8 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.3.labelFormat
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.3.labelFormat]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.3.labelFormat]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.3.labelFormat]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.3.labelFormat]", lpath_3))
                 return False
             continue
         elif prop == "valueFormat":
@@ -558,11 +571,11 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Prompts'.'|'.3.valueFormat
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.3.valueFormat]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.3.valueFormat]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Prompts'.'|'.3.valueFormat]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Prompts'.'|'.3.valueFormat]", lpath_3))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Prompts'.'|'.3]", lpath_3 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Prompts'.'|'.3]", lpath_3))
         return False
     if must_count != 4:
         if rep is not None:
@@ -616,17 +629,17 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "checkForConflicts":
             # handle may checkForConflicts property
             # .customCommands.'@'.0.after.checkForConflicts
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.customCommands.'@'.0.after.checkForConflicts]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.after.checkForConflicts]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not a bool [.customCommands.'@'.0.after.checkForConflicts]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.after.checkForConflicts]", lpath_6))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.customCommands.'@'.0.after]", lpath_6 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.customCommands.'@'.0.after]", lpath_6))
         return False
     return True
 
@@ -638,15 +651,15 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "key":
             # handle must key property
             must_count += 1
             # .customCommands.'@'.0.key
-            res = json_model_4(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.customCommands.'@'.0.key]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.customCommands.'@'.0.key]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.customCommands.'@'.0.key]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.customCommands.'@'.0.key]", lpath_5))
                 return False
             continue
         elif prop == "command":
@@ -655,8 +668,8 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .customCommands.'@'.0.command
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.customCommands.'@'.0.command]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.customCommands.'@'.0.command]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.customCommands.'@'.0.command]", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.customCommands.'@'.0.command]", lpath_5))
                 return False
             continue
         elif prop == "context":
@@ -665,17 +678,17 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .customCommands.'@'.0.context
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_3
             if not res:
-                rep is None or rep.append(("value not in enum [.customCommands.'@'.0.context.'|']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.customCommands.'@'.0.context]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.customCommands.'@'.0.context.'|']", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.customCommands.'@'.0.context]", lpath_5))
                 return False
             continue
         if prop == "after":
             # handle may after property
             # .customCommands.'@'.0.after
-            res = _jm_obj_8(pval, lpath_5 if path is not None else None, rep)
+            res = _jm_obj_8(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.customCommands.'@'.0.after]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.after]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.customCommands.'@'.0.after]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.after]", lpath_5))
                 return False
             continue
         elif prop == "stream":
@@ -683,8 +696,8 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .customCommands.'@'.0.stream
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.customCommands.'@'.0.stream]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.stream]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a bool [.customCommands.'@'.0.stream]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.stream]", lpath_5))
                 return False
             continue
         elif prop == "prompts":
@@ -693,15 +706,15 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_4_idx, arr_4_item in enumerate(pval):
-                    arr_4_lpath: Path = ((lpath_5 if path is not None else None) + [ arr_4_idx ]) if (lpath_5 if path is not None else None) is not None else None
+                    arr_4_lpath: Path = (lpath_5, arr_4_idx) if lpath_5 is not None else None
                     # .customCommands.'@'.0.prompts.0
-                    res = json_model_10(arr_4_item, arr_4_lpath if (lpath_5 if path is not None else None) is not None else None, rep)
+                    res = json_model_10(arr_4_item, arr_4_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $Prompts [.customCommands.'@'.0.prompts.0]", arr_4_lpath if (lpath_5 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $Prompts [.customCommands.'@'.0.prompts.0]", arr_4_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.customCommands.'@'.0.prompts]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.prompts]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.customCommands.'@'.0.prompts]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.prompts]", lpath_5))
                 return False
             continue
         elif prop == "showOutput":
@@ -709,8 +722,8 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .customCommands.'@'.0.showOutput
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.customCommands.'@'.0.showOutput]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.showOutput]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a bool [.customCommands.'@'.0.showOutput]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.showOutput]", lpath_5))
                 return False
             continue
         elif prop == "subprocess":
@@ -718,8 +731,8 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .customCommands.'@'.0.subprocess
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.customCommands.'@'.0.subprocess]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.subprocess]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a bool [.customCommands.'@'.0.subprocess]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.subprocess]", lpath_5))
                 return False
             continue
         elif prop == "description":
@@ -727,8 +740,8 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .customCommands.'@'.0.description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.customCommands.'@'.0.description]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.description]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.customCommands.'@'.0.description]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.description]", lpath_5))
                 return False
             continue
         elif prop == "loadingText":
@@ -736,11 +749,11 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .customCommands.'@'.0.loadingText
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.customCommands.'@'.0.loadingText]", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.loadingText]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.customCommands.'@'.0.loadingText]", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.customCommands.'@'.0.loadingText]", lpath_5))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.customCommands.'@'.0]", lpath_5 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.customCommands.'@'.0]", lpath_5))
         return False
     if must_count != 3:
         if rep is not None:
@@ -760,11 +773,11 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_3_idx, arr_3_item in enumerate(val):
-            arr_3_lpath: Path = (path + [ arr_3_idx ]) if path is not None else None
+            arr_3_lpath: Path = (path, arr_3_idx) if path is not None else None
             # .customCommands.'@'.0
-            res = _jm_obj_7(arr_3_item, arr_3_lpath if path is not None else None, rep)
+            res = _jm_obj_7(arr_3_item, arr_3_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.customCommands.'@'.0]", arr_3_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected element [.customCommands.'@'.0]", arr_3_lpath))
                 break
     if res:
         res = is_unique_array(val, path, rep)
@@ -822,17 +835,17 @@ def _jm_f_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "signOff":
             # handle may signOff property
             # .git.commit.signOff
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.git.commit.signOff]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.git.commit.signOff]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("not a bool [.git.commit.signOff]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.git.commit.signOff]", lpath_8))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.git.commit]", lpath_8 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.git.commit]", lpath_8))
         return False
     return True
 
@@ -852,22 +865,22 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("pattern", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <pattern> [.git.commitPrefixes.'/./']", path))
         return False
-    lpath = (path + [ "pattern" ]) if path is not None else None
+    lpath = (path, "pattern") if path is not None else None
     # .git.commitPrefixes.'/./'.pattern
-    res = json_model_8(pval, lpath if path is not None else None, rep)
+    res = json_model_8(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $neString [.git.commitPrefixes.'/./'.pattern]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <pattern> [.git.commitPrefixes.'/./']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $neString [.git.commitPrefixes.'/./'.pattern]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <pattern> [.git.commitPrefixes.'/./']", lpath))
         return False
     if not ((pval := val.get("replace", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <replace> [.git.commitPrefixes.'/./']", path))
         return False
-    lpath = (path + [ "replace" ]) if path is not None else None
+    lpath = (path, "replace") if path is not None else None
     # .git.commitPrefixes.'/./'.replace
-    res = json_model_8(pval, lpath if path is not None else None, rep)
+    res = json_model_8(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $neString [.git.commitPrefixes.'/./'.replace]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <replace> [.git.commitPrefixes.'/./']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $neString [.git.commitPrefixes.'/./'.replace]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <replace> [.git.commitPrefixes.'/./']", lpath))
         return False
     return True
 
@@ -879,16 +892,16 @@ def _jm_f_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if _jm_re_1(prop, path, rep):
             # handle 1 re props
             # .git.commitPrefixes.'/./'
-            res = _jm_obj_9(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_9(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.git.commitPrefixes.'/./']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.git.commitPrefixes.'/./']", lpath_9))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.git.commitPrefixes]", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.git.commitPrefixes]", lpath_9))
             return False
     return True
 
@@ -926,14 +939,14 @@ def _jm_f_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         if prop == "order":
             # handle may order property
             # .git.log.order
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_4
             if not res:
-                rep is None or rep.append(("value not in enum [.git.log.order.'|']", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.git.log.order]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.git.log.order.'|']", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.git.log.order]", lpath_10))
                 return False
             continue
         elif prop == "showGraph":
@@ -941,8 +954,8 @@ def _jm_f_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .git.log.showGraph
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_5
             if not res:
-                rep is None or rep.append(("value not in enum [.git.log.showGraph.'|']", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.git.log.showGraph]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.git.log.showGraph.'|']", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.git.log.showGraph]", lpath_10))
                 return False
             continue
         elif prop == "showWholeGraph":
@@ -950,11 +963,11 @@ def _jm_f_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .git.log.showWholeGraph
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.git.log.showWholeGraph]", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.git.log.showWholeGraph]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("not a bool [.git.log.showWholeGraph]", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.git.log.showWholeGraph]", lpath_10))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.git.log]", lpath_10 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.git.log]", lpath_10))
         return False
     return True
 
@@ -966,14 +979,14 @@ def _jm_f_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         if prop == "args":
             # handle may args property
             # .git.merging.args
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.git.merging.args]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.git.merging.args]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.git.merging.args]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.git.merging.args]", lpath_11))
                 return False
             continue
         elif prop == "manualCommit":
@@ -981,11 +994,11 @@ def _jm_f_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .git.merging.manualCommit
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.git.merging.manualCommit]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.git.merging.manualCommit]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("not a bool [.git.merging.manualCommit]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.git.merging.manualCommit]", lpath_11))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.git.merging]", lpath_11 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.git.merging]", lpath_11))
         return False
     return True
 
@@ -1006,7 +1019,7 @@ def _jm_f_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         if prop == "pager":
             # handle may pager property
             # .git.paging.pager
@@ -1016,11 +1029,11 @@ def _jm_f_16(val: Jsonable, path: Path, rep: Report) -> bool:
                 sval_1: str = pval
                 res = sval_1 != ""
                 if not res:
-                    rep is None or rep.append(("constraints failed [.git.paging.pager]", lpath_12 if path is not None else None))
+                    rep is None or rep.append(("constraints failed [.git.paging.pager]", lpath_12))
             else:
-                rep is None or rep.append(("unexpected string [.git.paging.pager.'@']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.git.paging.pager.'@']", lpath_12))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.git.paging.pager]", lpath_12 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.git.paging.pager]", lpath_12))
                 return False
             continue
         elif prop == "colorArg":
@@ -1028,8 +1041,8 @@ def _jm_f_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .git.paging.colorArg
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_6
             if not res:
-                rep is None or rep.append(("value not in enum [.git.paging.colorArg.'|']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.git.paging.colorArg]", lpath_12 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.git.paging.colorArg.'|']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.git.paging.colorArg]", lpath_12))
                 return False
             continue
         elif prop == "useConfig":
@@ -1037,11 +1050,11 @@ def _jm_f_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .git.paging.useConfig
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.git.paging.useConfig]", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.git.paging.useConfig]", lpath_12 if path is not None else None))
+                rep is None or rep.append(("not a bool [.git.paging.useConfig]", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.git.paging.useConfig]", lpath_12))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.git.paging]", lpath_12 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.git.paging]", lpath_12))
         return False
     return True
 
@@ -1070,14 +1083,14 @@ def _jm_f_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if pfun := _jm_f_3_map.get(prop):
             # handle 16 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_7 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.git]", lpath_7 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_7, rep):
+                rep is None or rep.append(("invalid optional prop value [.git]", lpath_7))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.git]", lpath_7 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.git]", lpath_7))
         return False
     return True
 
@@ -1097,16 +1110,16 @@ def _jm_f_21(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         if _jm_re_1(prop, path, rep):
             # handle 1 re props
             # .gui.authorColors.'/./'
-            res = json_model_2(pval, lpath_14 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected $color [.gui.authorColors.'/./']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected $color [.gui.authorColors.'/./']", lpath_14))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.gui.authorColors]", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.gui.authorColors]", lpath_14))
             return False
     return True
 
@@ -1127,16 +1140,16 @@ def _jm_f_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         if _jm_re_1(prop, path, rep):
             # handle 1 re props
             # .gui.branchColors.'/./'
-            res = json_model_2(pval, lpath_15 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected $color [.gui.branchColors.'/./']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected $color [.gui.branchColors.'/./']", lpath_15))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.gui.branchColors]", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.gui.branchColors]", lpath_15))
             return False
     return True
 
@@ -1156,17 +1169,17 @@ def _jm_f_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         if prop == "show":
             # handle may show property
             # .gui.commitLength.show
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.gui.commitLength.show]", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.commitLength.show]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("not a bool [.gui.commitLength.show]", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.gui.commitLength.show]", lpath_16))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.gui.commitLength]", lpath_16 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.gui.commitLength]", lpath_16))
         return False
     return True
 
@@ -1351,98 +1364,98 @@ def _jm_f_45(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         if prop == "defaultFgColor":
             # handle may defaultFgColor property
             # .gui.theme.defaultFgColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.defaultFgColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.defaultFgColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.defaultFgColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.defaultFgColor]", lpath_17))
                 return False
             continue
         elif prop == "optionsTextColor":
             # handle may optionsTextColor property
             # .gui.theme.optionsTextColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.optionsTextColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.optionsTextColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.optionsTextColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.optionsTextColor]", lpath_17))
                 return False
             continue
         elif prop == "activeBorderColor":
             # handle may activeBorderColor property
             # .gui.theme.activeBorderColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.activeBorderColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.activeBorderColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.activeBorderColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.activeBorderColor]", lpath_17))
                 return False
             continue
         elif prop == "inactiveBorderColor":
             # handle may inactiveBorderColor property
             # .gui.theme.inactiveBorderColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.inactiveBorderColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.inactiveBorderColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.inactiveBorderColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.inactiveBorderColor]", lpath_17))
                 return False
             continue
         elif prop == "selectedLineBgColor":
             # handle may selectedLineBgColor property
             # .gui.theme.selectedLineBgColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.selectedLineBgColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.selectedLineBgColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.selectedLineBgColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.selectedLineBgColor]", lpath_17))
                 return False
             continue
         elif prop == "selectedRangeBgColor":
             # handle may selectedRangeBgColor property
             # .gui.theme.selectedRangeBgColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.selectedRangeBgColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.selectedRangeBgColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.selectedRangeBgColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.selectedRangeBgColor]", lpath_17))
                 return False
             continue
         elif prop == "unstagedChangesColor":
             # handle may unstagedChangesColor property
             # .gui.theme.unstagedChangesColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.unstagedChangesColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.unstagedChangesColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.unstagedChangesColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.unstagedChangesColor]", lpath_17))
                 return False
             continue
         elif prop == "cherryPickedCommitBgColor":
             # handle may cherryPickedCommitBgColor property
             # .gui.theme.cherryPickedCommitBgColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.cherryPickedCommitBgColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.cherryPickedCommitBgColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.cherryPickedCommitBgColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.cherryPickedCommitBgColor]", lpath_17))
                 return False
             continue
         elif prop == "cherryPickedCommitFgColor":
             # handle may cherryPickedCommitFgColor property
             # .gui.theme.cherryPickedCommitFgColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.cherryPickedCommitFgColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.cherryPickedCommitFgColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.cherryPickedCommitFgColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.cherryPickedCommitFgColor]", lpath_17))
                 return False
             continue
         elif prop == "searchingActiveBorderColor":
             # handle may searchingActiveBorderColor property
             # .gui.theme.searchingActiveBorderColor
-            res = json_model_3(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $colorArray [.gui.theme.searchingActiveBorderColor]", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.gui.theme.searchingActiveBorderColor]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $colorArray [.gui.theme.searchingActiveBorderColor]", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.gui.theme.searchingActiveBorderColor]", lpath_17))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.gui.theme]", lpath_17 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.gui.theme]", lpath_17))
         return False
     return True
 
@@ -1472,14 +1485,14 @@ def _jm_f_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         if pfun := _jm_f_19_map.get(prop):
             # handle 28 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_13 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.gui]", lpath_13 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_13, rep):
+                rep is None or rep.append(("invalid optional prop value [.gui]", lpath_13))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.gui]", lpath_13 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.gui]", lpath_13))
         return False
     return True
 
@@ -1490,44 +1503,44 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         if prop == "pickBothHunks":
             # handle may pickBothHunks property
             # .keybinding.main.pickBothHunks
-            res = json_model_4(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.main.pickBothHunks]", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.main.pickBothHunks]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.main.pickBothHunks]", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.main.pickBothHunks]", lpath_19))
                 return False
             continue
         elif prop == "toggleDragSelect":
             # handle may toggleDragSelect property
             # .keybinding.main.toggleDragSelect
-            res = json_model_4(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.main.toggleDragSelect]", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.main.toggleDragSelect]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.main.toggleDragSelect]", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.main.toggleDragSelect]", lpath_19))
                 return False
             continue
         elif prop == "toggleSelectHunk":
             # handle may toggleSelectHunk property
             # .keybinding.main.toggleSelectHunk
-            res = json_model_4(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.main.toggleSelectHunk]", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.main.toggleSelectHunk]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.main.toggleSelectHunk]", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.main.toggleSelectHunk]", lpath_19))
                 return False
             continue
         elif prop == "toggleDragSelect-alt":
             # handle may toggleDragSelect-alt property
             # .keybinding.main.'toggleDragSelect-alt'
-            res = json_model_4(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.main.'toggleDragSelect-alt']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.main.'toggleDragSelect-alt']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.main.'toggleDragSelect-alt']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.main.'toggleDragSelect-alt']", lpath_19))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding.main]", lpath_19 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding.main]", lpath_19))
         return False
     return True
 
@@ -1539,14 +1552,14 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if pfun := _jm_obj_11_map.get(prop):
             # handle 14 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_20 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.keybinding.files]", lpath_20 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_20, rep):
+                rep is None or rep.append(("invalid optional prop value [.keybinding.files]", lpath_20))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding.files]", lpath_20 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding.files]", lpath_20))
         return False
     return True
 
@@ -1557,26 +1570,26 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         if prop == "popStash":
             # handle may popStash property
             # .keybinding.stash.popStash
-            res = json_model_4(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.stash.popStash]", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.stash.popStash]", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.stash.popStash]", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.stash.popStash]", lpath_21))
                 return False
             continue
         elif prop == "renameStash":
             # handle may renameStash property
             # .keybinding.stash.renameStash
-            res = json_model_4(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.stash.renameStash]", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.stash.renameStash]", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.stash.renameStash]", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.stash.renameStash]", lpath_21))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding.stash]", lpath_21 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding.stash]", lpath_21))
         return False
     return True
 
@@ -1587,26 +1600,26 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
+        lpath_22: Path = (path, prop) if path is not None else None
         if prop == "recentRepos":
             # handle may recentRepos property
             # .keybinding.status.recentRepos
-            res = json_model_4(pval, lpath_22 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.status.recentRepos]", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.status.recentRepos]", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.status.recentRepos]", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.status.recentRepos]", lpath_22))
                 return False
             continue
         elif prop == "checkForUpdate":
             # handle may checkForUpdate property
             # .keybinding.status.checkForUpdate
-            res = json_model_4(pval, lpath_22 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.status.checkForUpdate]", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.status.checkForUpdate]", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.status.checkForUpdate]", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.status.checkForUpdate]", lpath_22))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding.status]", lpath_22 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding.status]", lpath_22))
         return False
     return True
 
@@ -1618,14 +1631,14 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         if pfun := _jm_obj_14_map.get(prop):
             # handle 21 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_23 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.keybinding.commits]", lpath_23 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_23, rep):
+                rep is None or rep.append(("invalid optional prop value [.keybinding.commits]", lpath_23))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding.commits]", lpath_23 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding.commits]", lpath_23))
         return False
     return True
 
@@ -1637,14 +1650,14 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         if pfun := _jm_obj_15_map.get(prop):
             # handle 13 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_24 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.keybinding.branches]", lpath_24 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_24, rep):
+                rep is None or rep.append(("invalid optional prop value [.keybinding.branches]", lpath_24))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding.branches]", lpath_24 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding.branches]", lpath_24))
         return False
     return True
 
@@ -1672,14 +1685,14 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         if pfun := _jm_obj_16_map.get(prop):
             # handle 59 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_25 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.keybinding.universal]", lpath_25 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_25, rep):
+                rep is None or rep.append(("invalid optional prop value [.keybinding.universal]", lpath_25))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding.universal]", lpath_25 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding.universal]", lpath_25))
         return False
     return True
 
@@ -1690,35 +1703,35 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_26: Path = (path + [ prop ]) if path is not None else None
+        lpath_26: Path = (path, prop) if path is not None else None
         if prop == "init":
             # handle may init property
             # .keybinding.submodules.init
-            res = json_model_4(pval, lpath_26 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.submodules.init]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.submodules.init]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.submodules.init]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.submodules.init]", lpath_26))
                 return False
             continue
         elif prop == "update":
             # handle may update property
             # .keybinding.submodules.update
-            res = json_model_4(pval, lpath_26 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.submodules.update]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.submodules.update]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.submodules.update]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.submodules.update]", lpath_26))
                 return False
             continue
         elif prop == "bulkMenu":
             # handle may bulkMenu property
             # .keybinding.submodules.bulkMenu
-            res = json_model_4(pval, lpath_26 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.submodules.bulkMenu]", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.submodules.bulkMenu]", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.submodules.bulkMenu]", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.submodules.bulkMenu]", lpath_26))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding.submodules]", lpath_26 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding.submodules]", lpath_26))
         return False
     return True
 
@@ -1729,17 +1742,17 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_27: Path = (path + [ prop ]) if path is not None else None
+        lpath_27: Path = (path, prop) if path is not None else None
         if prop == "checkoutCommitFile":
             # handle may checkoutCommitFile property
             # .keybinding.commitFiles.checkoutCommitFile
-            res = json_model_4(pval, lpath_27 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_27, rep)
             if not res:
-                rep is None or rep.append(("unexpected $keybinding [.keybinding.commitFiles.checkoutCommitFile]", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.commitFiles.checkoutCommitFile]", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected $keybinding [.keybinding.commitFiles.checkoutCommitFile]", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.commitFiles.checkoutCommitFile]", lpath_27))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding.commitFiles]", lpath_27 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding.commitFiles]", lpath_27))
         return False
     return True
 
@@ -1751,89 +1764,89 @@ def _jm_f_48(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         if prop == "main":
             # handle may main property
             # .keybinding.main
-            res = _jm_obj_10(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_10(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.keybinding.main]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.main]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.keybinding.main]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.main]", lpath_18))
                 return False
             continue
         elif prop == "files":
             # handle may files property
             # .keybinding.files
-            res = _jm_obj_11(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_11(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.keybinding.files]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.files]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.keybinding.files]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.files]", lpath_18))
                 return False
             continue
         elif prop == "stash":
             # handle may stash property
             # .keybinding.stash
-            res = _jm_obj_12(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_12(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.keybinding.stash]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.stash]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.keybinding.stash]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.stash]", lpath_18))
                 return False
             continue
         elif prop == "status":
             # handle may status property
             # .keybinding.status
-            res = _jm_obj_13(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.keybinding.status]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.status]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.keybinding.status]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.status]", lpath_18))
                 return False
             continue
         elif prop == "commits":
             # handle may commits property
             # .keybinding.commits
-            res = _jm_obj_14(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_14(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.keybinding.commits]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.commits]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.keybinding.commits]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.commits]", lpath_18))
                 return False
             continue
         elif prop == "branches":
             # handle may branches property
             # .keybinding.branches
-            res = _jm_obj_15(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_15(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.keybinding.branches]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.branches]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.keybinding.branches]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.branches]", lpath_18))
                 return False
             continue
         elif prop == "universal":
             # handle may universal property
             # .keybinding.universal
-            res = _jm_obj_16(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_16(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.keybinding.universal]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.universal]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.keybinding.universal]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.universal]", lpath_18))
                 return False
             continue
         elif prop == "submodules":
             # handle may submodules property
             # .keybinding.submodules
-            res = _jm_obj_17(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_17(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.keybinding.submodules]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.submodules]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.keybinding.submodules]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.submodules]", lpath_18))
                 return False
             continue
         elif prop == "commitFiles":
             # handle may commitFiles property
             # .keybinding.commitFiles
-            res = _jm_obj_18(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_18(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.keybinding.commitFiles]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.keybinding.commitFiles]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.keybinding.commitFiles]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.keybinding.commitFiles]", lpath_18))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.keybinding]", lpath_18 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.keybinding]", lpath_18))
         return False
     return True
 
@@ -1855,14 +1868,14 @@ def _jm_f_52(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_28: Path = (path + [ prop ]) if path is not None else None
+        lpath_28: Path = (path, prop) if path is not None else None
         if prop == "edit":
             # handle may edit property
             # .os.edit
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.os.edit]", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.os.edit]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.os.edit]", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.os.edit]", lpath_28))
                 return False
             continue
         elif prop == "open":
@@ -1870,8 +1883,8 @@ def _jm_f_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .os.open
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.os.open]", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.os.open]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.os.open]", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.os.open]", lpath_28))
                 return False
             continue
         elif prop == "openLink":
@@ -1879,8 +1892,8 @@ def _jm_f_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .os.openLink
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.os.openLink]", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.os.openLink]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.os.openLink]", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.os.openLink]", lpath_28))
                 return False
             continue
         elif prop == "editAtLine":
@@ -1888,8 +1901,8 @@ def _jm_f_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .os.editAtLine
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.os.editAtLine]", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.os.editAtLine]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.os.editAtLine]", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.os.editAtLine]", lpath_28))
                 return False
             continue
         elif prop == "editPreset":
@@ -1897,7 +1910,7 @@ def _jm_f_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .os.editPreset
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_14
             if not res:
-                rep is None or rep.append(("value not in enum [.os.editPreset.'|']", lpath_28 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.os.editPreset.'|']", lpath_28))
                 res = isinstance(pval, str)
                 if res:
                     # .os.editPreset.'|'.0
@@ -1905,12 +1918,12 @@ def _jm_f_52(val: Jsonable, path: Path, rep: Report) -> bool:
                     if res:
                         rep is None or rep.clear()
                     else:
-                        rep is None or rep.append(("unexpected string [.os.editPreset.'|'.0]", lpath_28 if path is not None else None))
-                        rep is None or rep.append(("no model matched [.os.editPreset.'|']", lpath_28 if path is not None else None))
+                        rep is None or rep.append(("unexpected string [.os.editPreset.'|'.0]", lpath_28))
+                        rep is None or rep.append(("no model matched [.os.editPreset.'|']", lpath_28))
                 else:
-                    rep is None or rep.append(("unexpected type [.os.editPreset.'|']", lpath_28 if path is not None else None))
+                    rep is None or rep.append(("unexpected type [.os.editPreset.'|']", lpath_28))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.os.editPreset]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.os.editPreset]", lpath_28))
                 return False
             continue
         elif prop == "editAtLineAndWait":
@@ -1918,8 +1931,8 @@ def _jm_f_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .os.editAtLineAndWait
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.os.editAtLineAndWait]", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.os.editAtLineAndWait]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.os.editAtLineAndWait]", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.os.editAtLineAndWait]", lpath_28))
                 return False
             continue
         elif prop == "copyToClipboardCmd":
@@ -1927,11 +1940,11 @@ def _jm_f_52(val: Jsonable, path: Path, rep: Report) -> bool:
             # .os.copyToClipboardCmd
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.os.copyToClipboardCmd]", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.os.copyToClipboardCmd]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.os.copyToClipboardCmd]", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.os.copyToClipboardCmd]", lpath_28))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.os]", lpath_28 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.os]", lpath_28))
         return False
     return True
 
@@ -1959,14 +1972,14 @@ def _jm_f_55(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_29: Path = (path + [ prop ]) if path is not None else None
+        lpath_29: Path = (path, prop) if path is not None else None
         if prop == "fetchInterval":
             # handle may fetchInterval property
             # .refresher.fetchInterval
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.refresher.fetchInterval]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.refresher.fetchInterval]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.refresher.fetchInterval]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.refresher.fetchInterval]", lpath_29))
                 return False
             continue
         elif prop == "refreshInterval":
@@ -1974,11 +1987,11 @@ def _jm_f_55(val: Jsonable, path: Path, rep: Report) -> bool:
             # .refresher.refreshInterval
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.refresher.refreshInterval]", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.refresher.refreshInterval]", lpath_29 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.refresher.refreshInterval]", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.refresher.refreshInterval]", lpath_29))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.refresher]", lpath_29 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.refresher]", lpath_29))
         return False
     return True
 
@@ -1991,17 +2004,17 @@ def _jm_f_56(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_30: Path = (path + [ prop ]) if path is not None else None
+        lpath_30: Path = (path, prop) if path is not None else None
         if _jm_re_1(prop, path, rep):
             # handle 1 re props
             # .services.'/./'
             # "/^[^:]+:[^:]+$/"
-            res = isinstance(pval, str) and _jm_re_2(pval, lpath_30 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_2(pval, lpath_30, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^[^:]+:[^:]+$/ [.services.'/./']", lpath_30 if path is not None else None))
+                rep is None or rep.append(("unexpected /^[^:]+:[^:]+$/ [.services.'/./']", lpath_30))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.services]", lpath_30 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.services]", lpath_30))
             return False
     return True
 
@@ -2014,14 +2027,14 @@ def _jm_f_57(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_31: Path = (path + [ prop ]) if path is not None else None
+        lpath_31: Path = (path, prop) if path is not None else None
         if prop == "days":
             # handle may days property
             # .update.days
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.update.days]", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.update.days]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.update.days]", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.update.days]", lpath_31))
                 return False
             continue
         elif prop == "method":
@@ -2029,11 +2042,11 @@ def _jm_f_57(val: Jsonable, path: Path, rep: Report) -> bool:
             # .update.method
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_15
             if not res:
-                rep is None or rep.append(("value not in enum [.update.method.'|']", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.update.method]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.update.method.'|']", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.update.method]", lpath_31))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.update]", lpath_31 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.update]", lpath_31))
         return False
     return True
 
@@ -2047,14 +2060,14 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if pfun := json_model_1_map.get(prop):
             # handle 13 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_4 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.]", lpath_4 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_4, rep):
+                rep is None or rep.append(("invalid optional prop value [.]", lpath_4))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.]", lpath_4 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.]", lpath_4))
         return False
     return True
 
@@ -2331,5 +2344,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -32,25 +45,25 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if res:
         len_0: int = len(val)
         if len_0 > 0:
-            lpath_0 = (path + [ 0 ]) if path is not None else None
+            lpath_0 = (path, 0) if path is not None else None
             # .'@'.0
             res = isinstance(val[0], int) and not isinstance(val[0], bool)
             if not res:
-                rep is None or rep.append(("not a -1 strict int [.'@'.0]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.'@'.0]", lpath_0))
         if res:
             if len_0 > 1:
-                lpath_0 = (path + [ 1 ]) if path is not None else None
+                lpath_0 = (path, 1) if path is not None else None
                 # .'@'.1
                 res = isinstance(val[1], str)
                 if not res:
-                    rep is None or rep.append(("unexpected string [.'@'.1]", lpath_0 if path is not None else None))
+                    rep is None or rep.append(("unexpected string [.'@'.1]", lpath_0))
             if res:
                 for idx_0 in range(2, len_0):
-                    lpath_0 = (path + [ idx_0 ]) if path is not None else None
+                    lpath_0 = (path, idx_0) if path is not None else None
                     # .'@'.2
                     res = isinstance(val[idx_0], bool)
                     if not res:
-                        rep is None or rep.append(("not a bool [.'@'.2]", lpath_0 if path is not None else None))
+                        rep is None or rep.append(("not a bool [.'@'.2]", lpath_0))
                         break
     if res:
         ival_0: int = len(val)
@@ -83,5 +96,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
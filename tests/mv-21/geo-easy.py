@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: dict[str, str]
 _jm_map_1: dict[str, str]
@@ -31,11 +44,11 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$position'.'@'.0
             res = isinstance(arr_0_item, (int, float)) and not isinstance(arr_0_item, bool)
             if not res:
-                rep is None or rep.append(("not a -1.0 loose float [.'$position'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("not a -1.0 loose float [.'$position'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -53,11 +66,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$coord_array'.'@'.0
-            res = json_model_2(arr_1_item, arr_1_lpath if path is not None else None, rep)
+            res = json_model_2(arr_1_item, arr_1_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $position [.'$coord_array'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $position [.'$coord_array'.'@'.0]", arr_1_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -75,11 +88,11 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(val):
-            arr_2_lpath: Path = (path + [ arr_2_idx ]) if path is not None else None
+            arr_2_lpath: Path = (path, arr_2_idx) if path is not None else None
             # .'$linear_ring'.'@'.0
-            res = json_model_2(arr_2_item, arr_2_lpath if path is not None else None, rep)
+            res = json_model_2(arr_2_item, arr_2_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $position [.'$linear_ring'.'@'.0]", arr_2_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $position [.'$linear_ring'.'@'.0]", arr_2_lpath))
                 break
     if res:
         ival_2: int = len(val)
@@ -103,38 +116,38 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$Point']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$Point'.type
     res = isinstance(pval, str) and pval == "Point"
     if not res:
-        rep is None or rep.append(("unexpected Point [.'$Point'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Point']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected Point [.'$Point'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Point']", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$Point']", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$Point'.coordinates
-    res = json_model_2(pval, lpath if path is not None else None, rep)
+    res = json_model_2(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $position [.'$Point'.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$Point']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $position [.'$Point'.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$Point']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$Point'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_3_idx, arr_3_item in enumerate(pval):
-                arr_3_lpath: Path = ((lpath if path is not None else None) + [ arr_3_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_3_lpath: Path = (lpath, arr_3_idx) if lpath is not None else None
                 # .'$Point'.bbox.0
                 res = isinstance(arr_3_item, (int, float)) and not isinstance(arr_3_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$Point'.bbox.0]", arr_3_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$Point'.bbox.0]", arr_3_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$Point'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$Point']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$Point'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$Point']", lpath))
             return False
     return True
 
@@ -151,46 +164,46 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$MultiPoint']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$MultiPoint'.type
     res = isinstance(pval, str) and pval == "MultiPoint"
     if not res:
-        rep is None or rep.append(("unexpected MultiPoint [.'$MultiPoint'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$MultiPoint']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected MultiPoint [.'$MultiPoint'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$MultiPoint']", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$MultiPoint']", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$MultiPoint'.coordinates
     res = isinstance(pval, list)
     if res:
         for arr_4_idx, arr_4_item in enumerate(pval):
-            arr_4_lpath: Path = ((lpath if path is not None else None) + [ arr_4_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_4_lpath: Path = (lpath, arr_4_idx) if lpath is not None else None
             # .'$MultiPoint'.coordinates.0
-            res = json_model_2(arr_4_item, arr_4_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_2(arr_4_item, arr_4_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $position [.'$MultiPoint'.coordinates.0]", arr_4_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $position [.'$MultiPoint'.coordinates.0]", arr_4_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$MultiPoint'.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$MultiPoint']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$MultiPoint'.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$MultiPoint']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$MultiPoint'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_5_idx, arr_5_item in enumerate(pval):
-                arr_5_lpath: Path = ((lpath if path is not None else None) + [ arr_5_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_5_lpath: Path = (lpath, arr_5_idx) if lpath is not None else None
                 # .'$MultiPoint'.bbox.0
                 res = isinstance(arr_5_item, (int, float)) and not isinstance(arr_5_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$MultiPoint'.bbox.0]", arr_5_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$MultiPoint'.bbox.0]", arr_5_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$MultiPoint'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$MultiPoint']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$MultiPoint'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$MultiPoint']", lpath))
             return False
     return True
 
@@ -207,38 +220,38 @@ def json_model_7(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$LineString']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$LineString'.type
     res = isinstance(pval, str) and pval == "LineString"
     if not res:
-        rep is None or rep.append(("unexpected LineString [.'$LineString'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$LineString']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected LineString [.'$LineString'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$LineString']", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$LineString']", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$LineString'.coordinates
-    res = json_model_3(pval, lpath if path is not None else None, rep)
+    res = json_model_3(pval, lpath, rep)
     if not res:
-        rep is None or rep.append(("unexpected $coord_array [.'$LineString'.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$LineString']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected $coord_array [.'$LineString'.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$LineString']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$LineString'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_6_idx, arr_6_item in enumerate(pval):
-                arr_6_lpath: Path = ((lpath if path is not None else None) + [ arr_6_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_6_lpath: Path = (lpath, arr_6_idx) if lpath is not None else None
                 # .'$LineString'.bbox.0
                 res = isinstance(arr_6_item, (int, float)) and not isinstance(arr_6_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$LineString'.bbox.0]", arr_6_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$LineString'.bbox.0]", arr_6_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$LineString'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$LineString']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$LineString'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$LineString']", lpath))
             return False
     return True
 
@@ -255,46 +268,46 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$MultiLineString']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$MultiLineString'.type
     res = isinstance(pval, str) and pval == "MultiLineString"
     if not res:
-        rep is None or rep.append(("unexpected MultiLineString [.'$MultiLineString'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$MultiLineString']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected MultiLineString [.'$MultiLineString'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$MultiLineString']", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$MultiLineString']", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$MultiLineString'.coordinates
     res = isinstance(pval, list)
     if res:
         for arr_7_idx, arr_7_item in enumerate(pval):
-            arr_7_lpath: Path = ((lpath if path is not None else None) + [ arr_7_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_7_lpath: Path = (lpath, arr_7_idx) if lpath is not None else None
             # .'$MultiLineString'.coordinates.0
-            res = json_model_3(arr_7_item, arr_7_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_3(arr_7_item, arr_7_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $coord_array [.'$MultiLineString'.coordinates.0]", arr_7_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $coord_array [.'$MultiLineString'.coordinates.0]", arr_7_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$MultiLineString'.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$MultiLineString']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$MultiLineString'.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$MultiLineString']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$MultiLineString'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_8_idx, arr_8_item in enumerate(pval):
-                arr_8_lpath: Path = ((lpath if path is not None else None) + [ arr_8_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_8_lpath: Path = (lpath, arr_8_idx) if lpath is not None else None
                 # .'$MultiLineString'.bbox.0
                 res = isinstance(arr_8_item, (int, float)) and not isinstance(arr_8_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$MultiLineString'.bbox.0]", arr_8_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$MultiLineString'.bbox.0]", arr_8_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$MultiLineString'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$MultiLineString']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$MultiLineString'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$MultiLineString']", lpath))
             return False
     return True
 
@@ -311,46 +324,46 @@ def json_model_9(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$Polygon']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$Polygon'.type
     res = isinstance(pval, str) and pval == "Polygon"
     if not res:
-        rep is None or rep.append(("unexpected Polygon [.'$Polygon'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Polygon']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected Polygon [.'$Polygon'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Polygon']", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$Polygon']", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$Polygon'.coordinates
     res = isinstance(pval, list)
     if res:
         for arr_9_idx, arr_9_item in enumerate(pval):
-            arr_9_lpath: Path = ((lpath if path is not None else None) + [ arr_9_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_9_lpath: Path = (lpath, arr_9_idx) if lpath is not None else None
             # .'$Polygon'.coordinates.0
-            res = json_model_4(arr_9_item, arr_9_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_4(arr_9_item, arr_9_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $linear_ring [.'$Polygon'.coordinates.0]", arr_9_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $linear_ring [.'$Polygon'.coordinates.0]", arr_9_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$Polygon'.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$Polygon']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$Polygon'.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$Polygon']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$Polygon'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_10_idx, arr_10_item in enumerate(pval):
-                arr_10_lpath: Path = ((lpath if path is not None else None) + [ arr_10_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_10_lpath: Path = (lpath, arr_10_idx) if lpath is not None else None
                 # .'$Polygon'.bbox.0
                 res = isinstance(arr_10_item, (int, float)) and not isinstance(arr_10_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$Polygon'.bbox.0]", arr_10_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$Polygon'.bbox.0]", arr_10_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$Polygon'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$Polygon']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$Polygon'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$Polygon']", lpath))
             return False
     return True
 
@@ -367,54 +380,54 @@ def json_model_10(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$MultiPolygon']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$MultiPolygon'.type
     res = isinstance(pval, str) and pval == "MultiPolygon"
     if not res:
-        rep is None or rep.append(("unexpected MultiPolygon [.'$MultiPolygon'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$MultiPolygon']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected MultiPolygon [.'$MultiPolygon'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$MultiPolygon']", lpath))
         return False
     if not ((pval := val.get("coordinates", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <coordinates> [.'$MultiPolygon']", path))
         return False
-    lpath = (path + [ "coordinates" ]) if path is not None else None
+    lpath = (path, "coordinates") if path is not None else None
     # .'$MultiPolygon'.coordinates
     res = isinstance(pval, list)
     if res:
         for arr_11_idx, arr_11_item in enumerate(pval):
-            arr_11_lpath: Path = ((lpath if path is not None else None) + [ arr_11_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_11_lpath: Path = (lpath, arr_11_idx) if lpath is not None else None
             # .'$MultiPolygon'.coordinates.0
             res = isinstance(arr_11_item, list)
             if res:
                 for arr_12_idx, arr_12_item in enumerate(arr_11_item):
-                    arr_12_lpath: Path = ((arr_11_lpath if (lpath if path is not None else None) is not None else None) + [ arr_12_idx ]) if (arr_11_lpath if (lpath if path is not None else None) is not None else None) is not None else None
+                    arr_12_lpath: Path = (arr_11_lpath, arr_12_idx) if arr_11_lpath is not None else None
                     # .'$MultiPolygon'.coordinates.0.0
-                    res = json_model_4(arr_12_item, arr_12_lpath if (arr_11_lpath if (lpath if path is not None else None) is not None else None) is not None else None, rep)
+                    res = json_model_4(arr_12_item, arr_12_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $linear_ring [.'$MultiPolygon'.coordinates.0.0]", arr_12_lpath if (arr_11_lpath if (lpath if path is not None else None) is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $linear_ring [.'$MultiPolygon'.coordinates.0.0]", arr_12_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.coordinates.0]", arr_11_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.coordinates.0]", arr_11_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.coordinates]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$MultiPolygon']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.coordinates]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <coordinates> [.'$MultiPolygon']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$MultiPolygon'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_13_idx, arr_13_item in enumerate(pval):
-                arr_13_lpath: Path = ((lpath if path is not None else None) + [ arr_13_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_13_lpath: Path = (lpath, arr_13_idx) if lpath is not None else None
                 # .'$MultiPolygon'.bbox.0
                 res = isinstance(arr_13_item, (int, float)) and not isinstance(arr_13_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$MultiPolygon'.bbox.0]", arr_13_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$MultiPolygon'.bbox.0]", arr_13_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$MultiPolygon']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$MultiPolygon'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$MultiPolygon']", lpath))
             return False
     return True
 
@@ -454,46 +467,46 @@ def json_model_12(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$GeometryCollection']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$GeometryCollection'.type
     res = isinstance(pval, str) and pval == "GeometryCollection"
     if not res:
-        rep is None or rep.append(("unexpected GeometryCollection [.'$GeometryCollection'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$GeometryCollection']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected GeometryCollection [.'$GeometryCollection'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$GeometryCollection']", lpath))
         return False
     if not ((pval := val.get("geometries", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <geometries> [.'$GeometryCollection']", path))
         return False
-    lpath = (path + [ "geometries" ]) if path is not None else None
+    lpath = (path, "geometries") if path is not None else None
     # .'$GeometryCollection'.geometries
     res = isinstance(pval, list)
     if res:
         for arr_14_idx, arr_14_item in enumerate(pval):
-            arr_14_lpath: Path = ((lpath if path is not None else None) + [ arr_14_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_14_lpath: Path = (lpath, arr_14_idx) if lpath is not None else None
             # .'$GeometryCollection'.geometries.0
-            res = json_model_11(arr_14_item, arr_14_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_11(arr_14_item, arr_14_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $geometry [.'$GeometryCollection'.geometries.0]", arr_14_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $geometry [.'$GeometryCollection'.geometries.0]", arr_14_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$GeometryCollection'.geometries]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <geometries> [.'$GeometryCollection']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$GeometryCollection'.geometries]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <geometries> [.'$GeometryCollection']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$GeometryCollection'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_15_idx, arr_15_item in enumerate(pval):
-                arr_15_lpath: Path = ((lpath if path is not None else None) + [ arr_15_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_15_lpath: Path = (lpath, arr_15_idx) if lpath is not None else None
                 # .'$GeometryCollection'.bbox.0
                 res = isinstance(arr_15_item, (int, float)) and not isinstance(arr_15_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$GeometryCollection'.bbox.0]", arr_15_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$GeometryCollection'.bbox.0]", arr_15_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$GeometryCollection'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$GeometryCollection']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$GeometryCollection'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$GeometryCollection']", lpath))
             return False
     return True
 
@@ -518,87 +531,87 @@ def json_model_13(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$Feature']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$Feature'.type
     res = isinstance(pval, str) and pval == "Feature"
     if not res:
-        rep is None or rep.append(("unexpected Feature [.'$Feature'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Feature']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected Feature [.'$Feature'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$Feature']", lpath))
         return False
     if not ((pval := val.get("geometry", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <geometry> [.'$Feature']", path))
         return False
-    lpath = (path + [ "geometry" ]) if path is not None else None
+    lpath = (path, "geometry") if path is not None else None
     # .'$Feature'.geometry
     # .'$Feature'.geometry.'|'.0
     res = pval is None
     if not res:
-        rep is None or rep.append(("not null [.'$Feature'.geometry.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not null [.'$Feature'.geometry.'|'.0]", lpath))
         # .'$Feature'.geometry.'|'.1
-        res = json_model_11(pval, lpath if path is not None else None, rep)
+        res = json_model_11(pval, lpath, rep)
         if not res:
-            rep is None or rep.append(("unexpected $geometry [.'$Feature'.geometry.'|'.1]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected $geometry [.'$Feature'.geometry.'|'.1]", lpath))
             # .'$Feature'.geometry.'|'.2
-            res = json_model_12(pval, lpath if path is not None else None, rep)
+            res = json_model_12(pval, lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $GeometryCollection [.'$Feature'.geometry.'|'.2]", lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $GeometryCollection [.'$Feature'.geometry.'|'.2]", lpath))
     if res:
         rep is None or rep.clear()
     else:
-        rep is None or rep.append(("no model matched [.'$Feature'.geometry.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <geometry> [.'$Feature']", lpath if path is not None else None))
+        rep is None or rep.append(("no model matched [.'$Feature'.geometry.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <geometry> [.'$Feature']", lpath))
         return False
     if not ((pval := val.get("properties", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <properties> [.'$Feature']", path))
         return False
-    lpath = (path + [ "properties" ]) if path is not None else None
+    lpath = (path, "properties") if path is not None else None
     # .'$Feature'.properties
     # .'$Feature'.properties.'|'.0
     res = pval is None
     if not res:
-        rep is None or rep.append(("not null [.'$Feature'.properties.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not null [.'$Feature'.properties.'|'.0]", lpath))
         # .'$Feature'.properties.'|'.1
-        res = _jm_obj_0(pval, lpath if path is not None else None, rep)
+        res = _jm_obj_0(pval, lpath, rep)
         if not res:
-            rep is None or rep.append(("unexpected element [.'$Feature'.properties.'|'.1]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected element [.'$Feature'.properties.'|'.1]", lpath))
     if res:
         rep is None or rep.clear()
     else:
-        rep is None or rep.append(("no model matched [.'$Feature'.properties.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <properties> [.'$Feature']", lpath if path is not None else None))
+        rep is None or rep.append(("no model matched [.'$Feature'.properties.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <properties> [.'$Feature']", lpath))
         return False
     if (pval := val.get("id", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "id" ]) if path is not None else None
+        lpath = (path, "id") if path is not None else None
         # .'$Feature'.id
         # .'$Feature'.id.'|'.0
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$Feature'.id.'|'.0]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$Feature'.id.'|'.0]", lpath))
             # .'$Feature'.id.'|'.1
             res = isinstance(pval, (int, float)) and not isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a -1.0 loose float [.'$Feature'.id.'|'.1]", lpath if path is not None else None))
+                rep is None or rep.append(("not a -1.0 loose float [.'$Feature'.id.'|'.1]", lpath))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Feature'.id.'|']", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <id> [.'$Feature']", lpath if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Feature'.id.'|']", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <id> [.'$Feature']", lpath))
             return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$Feature'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_16_idx, arr_16_item in enumerate(pval):
-                arr_16_lpath: Path = ((lpath if path is not None else None) + [ arr_16_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_16_lpath: Path = (lpath, arr_16_idx) if lpath is not None else None
                 # .'$Feature'.bbox.0
                 res = isinstance(arr_16_item, (int, float)) and not isinstance(arr_16_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$Feature'.bbox.0]", arr_16_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$Feature'.bbox.0]", arr_16_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$Feature'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$Feature']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$Feature'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$Feature']", lpath))
             return False
     return True
 
@@ -615,46 +628,46 @@ def json_model_14(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("type", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <type> [.'$FeatureCollection']", path))
         return False
-    lpath = (path + [ "type" ]) if path is not None else None
+    lpath = (path, "type") if path is not None else None
     # .'$FeatureCollection'.type
     res = isinstance(pval, str) and pval == "FeatureCollection"
     if not res:
-        rep is None or rep.append(("unexpected FeatureCollection [.'$FeatureCollection'.type]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$FeatureCollection']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected FeatureCollection [.'$FeatureCollection'.type]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <type> [.'$FeatureCollection']", lpath))
         return False
     if not ((pval := val.get("features", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <features> [.'$FeatureCollection']", path))
         return False
-    lpath = (path + [ "features" ]) if path is not None else None
+    lpath = (path, "features") if path is not None else None
     # .'$FeatureCollection'.features
     res = isinstance(pval, list)
     if res:
         for arr_17_idx, arr_17_item in enumerate(pval):
-            arr_17_lpath: Path = ((lpath if path is not None else None) + [ arr_17_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_17_lpath: Path = (lpath, arr_17_idx) if lpath is not None else None
             # .'$FeatureCollection'.features.0
-            res = json_model_13(arr_17_item, arr_17_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_13(arr_17_item, arr_17_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Feature [.'$FeatureCollection'.features.0]", arr_17_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $Feature [.'$FeatureCollection'.features.0]", arr_17_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$FeatureCollection'.features]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <features> [.'$FeatureCollection']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$FeatureCollection'.features]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <features> [.'$FeatureCollection']", lpath))
         return False
     if (pval := val.get("bbox", UNDEFINED)) != UNDEFINED:
-        lpath = (path + [ "bbox" ]) if path is not None else None
+        lpath = (path, "bbox") if path is not None else None
         # .'$FeatureCollection'.bbox
         res = isinstance(pval, list)
         if res:
             for arr_18_idx, arr_18_item in enumerate(pval):
-                arr_18_lpath: Path = ((lpath if path is not None else None) + [ arr_18_idx ]) if (lpath if path is not None else None) is not None else None
+                arr_18_lpath: Path = (lpath, arr_18_idx) if lpath is not None else None
                 # .'$FeatureCollection'.bbox.0
                 res = isinstance(arr_18_item, (int, float)) and not isinstance(arr_18_item, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1.0 loose float [.'$FeatureCollection'.bbox.0]", arr_18_lpath if (lpath if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a -1.0 loose float [.'$FeatureCollection'.bbox.0]", arr_18_lpath))
                     break
         if not res:
-            rep is None or rep.append(("not array or unexpected array [.'$FeatureCollection'.bbox]", lpath if path is not None else None))
-            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$FeatureCollection']", lpath if path is not None else None))
+            rep is None or rep.append(("not array or unexpected array [.'$FeatureCollection'.bbox]", lpath))
+            rep is None or rep.append(("unexpected value for optional prop <bbox> [.'$FeatureCollection']", lpath))
             return False
     return True
 
@@ -732,5 +745,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
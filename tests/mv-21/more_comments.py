@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 check_model_map: PropMap
 
@@ -36,11 +49,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$Qq'.0
-            res = json_model_2(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_2(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Pp [.'$Qq'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $Pp [.'$Qq'.0]", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Qq']", path))
@@ -53,23 +66,23 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "p":
             # handle may p property
             # .o.p
-            res = json_model_2(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Pp [.o.p]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.o.p]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Pp [.o.p]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.o.p]", lpath_1))
                 return False
             continue
         elif prop == "q":
             # handle may q property
             # .o.q
-            res = json_model_3(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Qq [.o.q]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.o.q]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Qq [.o.q]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.o.q]", lpath_1))
                 return False
             continue
         elif prop == "t":
@@ -77,23 +90,23 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
             # .o.t
             res = isinstance(pval, list) and len(pval) == 2
             if res:
-                lpath_2: Path = ((lpath_1 if path is not None else None) + [ 0 ]) if (lpath_1 if path is not None else None) is not None else None
+                lpath_2: Path = (lpath_1, 0) if lpath_1 is not None else None
                 # .o.t.0
                 res = isinstance(pval[0], bool)
                 if res:
-                    lpath_2 = ((lpath_1 if path is not None else None) + [ 1 ]) if (lpath_1 if path is not None else None) is not None else None
+                    lpath_2 = (lpath_1, 1) if lpath_1 is not None else None
                     # .o.t.1
                     res = isinstance(pval[1], int) and not isinstance(pval[1], bool) and pval[1] >= 0
                     if not res:
-                        rep is None or rep.append(("not a 0 strict int [.o.t.1]", lpath_2 if (lpath_1 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a 0 strict int [.o.t.1]", lpath_2))
                 else:
-                    rep is None or rep.append(("not a bool [.o.t.0]", lpath_2 if (lpath_1 if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a bool [.o.t.0]", lpath_2))
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.o.t]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.o.t]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.o.t]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.o.t]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.o]", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.o]", lpath_1))
         return False
     return True
 
@@ -106,18 +119,18 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "o":
             # handle may o property
             # an object
             # .o
-            res = _jm_obj_0(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.o]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.o]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.o]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.o]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.]", lpath_0))
         return False
     return True
 
@@ -145,5 +158,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -53,11 +66,11 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$neStrList'.'@'.0
-            res = json_model_2(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_2(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $neStr [.'$neStrList'.'@'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $neStr [.'$neStrList'.'@'.0]", arr_0_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -84,11 +97,11 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(val):
-            arr_1_lpath: Path = (path + [ arr_1_idx ]) if path is not None else None
+            arr_1_lpath: Path = (path, arr_1_idx) if path is not None else None
             # .'$LicenseList'.'@'.0
-            res = json_model_4(arr_1_item, arr_1_lpath if path is not None else None, rep)
+            res = json_model_4(arr_1_item, arr_1_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $License [.'$LicenseList'.'@'.0]", arr_1_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $License [.'$LicenseList'.'@'.0]", arr_1_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -109,25 +122,25 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "file":
             # handle must file property
             must_count += 1
             # .'$Provide'.file
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Provide'.file]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Provide'.file]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Provide'.file]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Provide'.file]", lpath_0))
                 return False
             continue
         elif prop == "version":
             # handle must version property
             must_count += 1
             # .'$Provide'.version
-            res = json_model_10(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_10(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Version [.'$Provide'.version]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Provide'.version]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Version [.'$Provide'.version]", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Provide'.version]", lpath_0))
                 return False
             continue
         if prop == "docfile":
@@ -135,8 +148,8 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Provide'.docfile
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Provide'.docfile]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Provide'.docfile]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Provide'.docfile]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Provide'.docfile]", lpath_0))
                 return False
             continue
         elif prop == "abstract":
@@ -144,8 +157,8 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Provide'.abstract
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Provide'.abstract]", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Provide'.abstract]", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Provide'.abstract]", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Provide'.abstract]", lpath_0))
                 return False
             continue
         if _jm_re_1(prop, path, rep):
@@ -153,7 +166,7 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Provide'.'/^[Xx]_/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Provide']", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Provide']", lpath_0))
             return False
     if must_count != 2:
         if rep is not None:
@@ -180,23 +193,23 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "web":
             # handle may web property
             # .'$Resources'.bugtracker.web
-            res = is_valid_url(pval, lpath_2 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$Resources'.bugtracker.web]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Resources'.bugtracker.web]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$Resources'.bugtracker.web]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Resources'.bugtracker.web]", lpath_2))
                 return False
             continue
         elif prop == "mailto":
             # handle may mailto property
             # .'$Resources'.bugtracker.mailto
-            res = is_valid_email(pval, lpath_2 if path is not None else None, rep)
+            res = is_valid_email(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EMAIL [.'$Resources'.bugtracker.mailto]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Resources'.bugtracker.mailto]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $EMAIL [.'$Resources'.bugtracker.mailto]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Resources'.bugtracker.mailto]", lpath_2))
                 return False
             continue
         if _jm_re_1(prop, path, rep):
@@ -204,7 +217,7 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Resources'.bugtracker.'/^[Xx]_/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Resources'.bugtracker]", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Resources'.bugtracker]", lpath_2))
             return False
     return True
 
@@ -215,36 +228,36 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "url":
             # handle may url property
             # .'$Resources'.repository.url
-            res = is_valid_url(pval, lpath_3 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$Resources'.repository.url]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Resources'.repository.url]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$Resources'.repository.url]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Resources'.repository.url]", lpath_3))
                 return False
             continue
         elif prop == "web":
             # handle may web property
             # .'$Resources'.repository.web
-            res = is_valid_url(pval, lpath_3 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$Resources'.repository.web]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Resources'.repository.web]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$Resources'.repository.web]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Resources'.repository.web]", lpath_3))
                 return False
             continue
         elif prop == "type":
             # handle may type property
             # .'$Resources'.repository.type
             # "/./"
-            res = isinstance(pval, str) and _jm_re_0(pval, lpath_3 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_0(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected /./ [.'$Resources'.repository.type]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Resources'.repository.type]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected /./ [.'$Resources'.repository.type]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Resources'.repository.type]", lpath_3))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Resources'.repository]", lpath_3 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Resources'.repository]", lpath_3))
         return False
     return True
 
@@ -256,35 +269,35 @@ def json_model_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "homepage":
             # handle may homepage property
             # .'$Resources'.homepage
-            res = is_valid_url(pval, lpath_1 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$Resources'.homepage]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Resources'.homepage]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$Resources'.homepage]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Resources'.homepage]", lpath_1))
                 return False
             continue
         elif prop == "bugtracker":
             # handle may bugtracker property
             # .'$Resources'.bugtracker
-            res = _jm_obj_0(pval, lpath_1 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Resources'.bugtracker]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Resources'.bugtracker]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Resources'.bugtracker]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Resources'.bugtracker]", lpath_1))
                 return False
             continue
         elif prop == "repository":
             # handle may repository property
             # .'$Resources'.repository
-            res = _jm_obj_1(pval, lpath_1 if path is not None else None, rep)
+            res = _jm_obj_1(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Resources'.repository]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Resources'.repository]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Resources'.repository]", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Resources'.repository]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Resources']", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Resources']", lpath_1))
         return False
     return True
 
@@ -361,21 +374,21 @@ def json_model_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Prereq'.''
         # .'$Prereq'.''.'|'.0
-        res = json_model_10(pval, lpath_4 if path is not None else None, rep)
+        res = json_model_10(pval, lpath_4, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Version [.'$Prereq'.''.'|'.0]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected $Version [.'$Prereq'.''.'|'.0]", lpath_4))
             # .'$Prereq'.''.'|'.1
-            res = json_model_12(pval, lpath_4 if path is not None else None, rep)
+            res = json_model_12(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $VersionRange [.'$Prereq'.''.'|'.1]", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $VersionRange [.'$Prereq'.''.'|'.1]", lpath_4))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'$Prereq'.''.'|']", lpath_4 if path is not None else None))
+            rep is None or rep.append(("no model matched [.'$Prereq'.''.'|']", lpath_4))
             return False
     return True
 
@@ -386,20 +399,20 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
-        if json_model_14(prop, lpath_6 if path is not None else None, rep):
+        lpath_6: Path = (path, prop) if path is not None else None
+        if json_model_14(prop, lpath_6, rep):
             # handle 1 key props
             # .'$Prereqs'.'$Phase'.'$Relation'
-            res = json_model_15(pval, lpath_6 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Prereq [.'$Prereqs'.'$Phase'.'$Relation']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $Prereq [.'$Prereqs'.'$Phase'.'$Relation']", lpath_6))
                 return False
         elif _jm_re_1(prop, path, rep):
             # handle 1 re props
             # .'$Prereqs'.'$Phase'.'/^[Xx]_/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Prereqs'.'$Phase']", lpath_6 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Prereqs'.'$Phase']", lpath_6))
             return False
     return True
 
@@ -411,20 +424,20 @@ def json_model_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
-        if json_model_13(prop, lpath_5 if path is not None else None, rep):
+        lpath_5: Path = (path, prop) if path is not None else None
+        if json_model_13(prop, lpath_5, rep):
             # handle 1 key props
             # .'$Prereqs'.'$Phase'
-            res = _jm_obj_2(pval, lpath_5 if path is not None else None, rep)
+            res = _jm_obj_2(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Prereqs'.'$Phase']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Prereqs'.'$Phase']", lpath_5))
                 return False
         elif _jm_re_1(prop, path, rep):
             # handle 1 re props
             # .'$Prereqs'.'/^[Xx]_/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Prereqs']", lpath_5 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Prereqs']", lpath_5))
             return False
     return True
 
@@ -435,12 +448,12 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         # handle other props
         # .license.'|'.2.''
-        res = is_valid_url(pval, lpath_8 if path is not None else None, rep)
+        res = is_valid_url(pval, lpath_8, rep)
         if not res:
-            rep is None or rep.append(("unexpected $URL [.license.'|'.2.'']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected $URL [.license.'|'.2.'']", lpath_8))
             return False
     return True
 
@@ -451,12 +464,12 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         # handle other props
         # .provides.''
-        res = json_model_6(pval, lpath_9 if path is not None else None, rep)
+        res = json_model_6(pval, lpath_9, rep)
         if not res:
-            rep is None or rep.append(("unexpected $Provide [.provides.'']", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected $Provide [.provides.'']", lpath_9))
             return False
     return True
 
@@ -468,24 +481,24 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         if prop == "version":
             # handle must version property
             must_count += 1
             # .'meta-spec'.version
             res = isinstance(pval, str) and pval == "1.0.0"
             if not res:
-                rep is None or rep.append(("unexpected _1.0.0 [.'meta-spec'.version]", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'meta-spec'.version]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected _1.0.0 [.'meta-spec'.version]", lpath_10))
+                rep is None or rep.append(("invalid mandatory prop value [.'meta-spec'.version]", lpath_10))
                 return False
             continue
         if prop == "url":
             # handle may url property
             # .'meta-spec'.url
-            res = is_valid_url(pval, lpath_10 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'meta-spec'.url]", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'meta-spec'.url]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'meta-spec'.url]", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'meta-spec'.url]", lpath_10))
                 return False
             continue
         if _jm_re_1(prop, path, rep):
@@ -493,7 +506,7 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'meta-spec'.'/^[Xx]_/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'meta-spec']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'meta-spec']", lpath_10))
             return False
     if must_count != 1:
         if rep is not None:
@@ -509,26 +522,26 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         if prop == "file":
             # handle may file property
             # .no_index.file
-            res = json_model_3(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $neStrList [.no_index.file]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.no_index.file]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $neStrList [.no_index.file]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.no_index.file]", lpath_11))
                 return False
             continue
         elif prop == "directory":
             # handle may directory property
             # .no_index.directory
-            res = json_model_3(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $neStrList [.no_index.directory]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.no_index.directory]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $neStrList [.no_index.directory]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.no_index.directory]", lpath_11))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.no_index]", lpath_11 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.no_index]", lpath_11))
         return False
     return True
 
@@ -541,15 +554,15 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if prop == "name":
             # handle must name property
             must_count += 1
             # .name
-            res = json_model_2(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $neStr [.name]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.name]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $neStr [.name]", lpath_7))
+                rep is None or rep.append(("invalid mandatory prop value [.name]", lpath_7))
                 return False
             continue
         elif prop == "license":
@@ -557,22 +570,22 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             must_count += 1
             # .license
             # .license.'|'.0
-            res = json_model_4(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $License [.license.'|'.0]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $License [.license.'|'.0]", lpath_7))
                 # .license.'|'.1
-                res = json_model_5(pval, lpath_7 if path is not None else None, rep)
+                res = json_model_5(pval, lpath_7, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $LicenseList [.license.'|'.1]", lpath_7 if path is not None else None))
+                    rep is None or rep.append(("unexpected $LicenseList [.license.'|'.1]", lpath_7))
                     # .license.'|'.2
-                    res = _jm_obj_3(pval, lpath_7 if path is not None else None, rep)
+                    res = _jm_obj_3(pval, lpath_7, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected element [.license.'|'.2]", lpath_7 if path is not None else None))
+                        rep is None or rep.append(("unexpected element [.license.'|'.2]", lpath_7))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.license.'|']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.license]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("no model matched [.license.'|']", lpath_7))
+                rep is None or rep.append(("invalid mandatory prop value [.license]", lpath_7))
                 return False
             continue
         elif prop == "version":
@@ -581,8 +594,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .version
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.version]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.version]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.version]", lpath_7))
+                rep is None or rep.append(("invalid mandatory prop value [.version]", lpath_7))
                 return False
             continue
         elif prop == "abstract":
@@ -591,28 +604,28 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .abstract
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.abstract]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.abstract]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.abstract]", lpath_7))
+                rep is None or rep.append(("invalid mandatory prop value [.abstract]", lpath_7))
                 return False
             continue
         elif prop == "provides":
             # handle must provides property
             must_count += 1
             # .provides
-            res = _jm_obj_4(pval, lpath_7 if path is not None else None, rep)
+            res = _jm_obj_4(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.provides]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.provides]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.provides]", lpath_7))
+                rep is None or rep.append(("invalid mandatory prop value [.provides]", lpath_7))
                 return False
             continue
         elif prop == "meta-spec":
             # handle must meta-spec property
             must_count += 1
             # .'meta-spec'
-            res = _jm_obj_5(pval, lpath_7 if path is not None else None, rep)
+            res = _jm_obj_5(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'meta-spec']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'meta-spec']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'meta-spec']", lpath_7))
+                rep is None or rep.append(("invalid mandatory prop value [.'meta-spec']", lpath_7))
                 return False
             continue
         elif prop == "maintainer":
@@ -620,63 +633,63 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             must_count += 1
             # .maintainer
             # .maintainer.'|'.0
-            res = json_model_2(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $neStr [.maintainer.'|'.0]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $neStr [.maintainer.'|'.0]", lpath_7))
                 # .maintainer.'|'.1
-                res = json_model_3(pval, lpath_7 if path is not None else None, rep)
+                res = json_model_3(pval, lpath_7, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $neStrList [.maintainer.'|'.1]", lpath_7 if path is not None else None))
+                    rep is None or rep.append(("unexpected $neStrList [.maintainer.'|'.1]", lpath_7))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.maintainer.'|']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.maintainer]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("no model matched [.maintainer.'|']", lpath_7))
+                rep is None or rep.append(("invalid mandatory prop value [.maintainer]", lpath_7))
                 return False
             continue
         if prop == "url":
             # handle may url property
             # .url
-            res = is_valid_url(pval, lpath_7 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.url]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.url]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.url]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.url]", lpath_7))
                 return False
             continue
         elif prop == "tags":
             # handle may tags property
             # .tags
-            res = json_model_3(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_3(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $neStrList [.tags]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.tags]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $neStrList [.tags]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.tags]", lpath_7))
                 return False
             continue
         elif prop == "prereqs":
             # handle may prereqs property
             # .prereqs
-            res = json_model_16(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_16(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Prereqs [.prereqs]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.prereqs]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Prereqs [.prereqs]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.prereqs]", lpath_7))
                 return False
             continue
         elif prop == "no_index":
             # handle may no_index property
             # .no_index
-            res = _jm_obj_6(pval, lpath_7 if path is not None else None, rep)
+            res = _jm_obj_6(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.no_index]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.no_index]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.no_index]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.no_index]", lpath_7))
                 return False
             continue
         elif prop == "resources":
             # handle may resources property
             # .resources
-            res = json_model_8(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_8(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Resources [.resources]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.resources]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Resources [.resources]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.resources]", lpath_7))
                 return False
             continue
         elif prop == "description":
@@ -684,8 +697,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .description
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.description]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.description]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.description]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.description]", lpath_7))
                 return False
             continue
         elif prop == "generated_by":
@@ -693,17 +706,17 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .generated_by
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.generated_by]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.generated_by]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.generated_by]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.generated_by]", lpath_7))
                 return False
             continue
         elif prop == "release_status":
             # handle may release_status property
             # .release_status
-            res = json_model_7(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Status [.release_status]", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.release_status]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Status [.release_status]", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.release_status]", lpath_7))
                 return False
             continue
         if _jm_re_1(prop, path, rep):
@@ -711,7 +724,7 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'/^[Xx]_/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.]", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.]", lpath_7))
             return False
     if must_count != 7:
         if rep is not None:
@@ -807,5 +820,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_f_3_map: PropMap
 _jm_cst_0: set[str]
@@ -62,22 +75,22 @@ def json_model_4(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.'$ab']", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .'$ab'.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$ab'.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'$ab']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$ab'.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.'$ab']", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.'$ab']", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .'$ab'.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$ab'.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'$ab']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$ab'.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.'$ab']", lpath))
         return False
     return True
 
@@ -97,22 +110,22 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.'$cd']", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .'$cd'.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$cd'.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'$cd']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$cd'.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.'$cd']", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.'$cd']", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .'$cd'.d
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.'$cd'.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'$cd']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.'$cd'.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'$cd']", lpath))
         return False
     return True
 
@@ -125,30 +138,30 @@ def _jm_f_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "a0":
             # handle may a0 property
             # .and.a0
             res = True
             if res:
                 # .and.a0.'&'.0
-                res = is_valid_date(pval, lpath_1 if path is not None else None, rep)
+                res = is_valid_date(pval, lpath_1, rep)
                 if res:
                     # .and.a0.'&'.1
                     # "/^2020-/"
                     res = isinstance(pval, str) and pval.startswith("2020-")
                     if not res:
-                        rep is None or rep.append(("unexpected /^2020-/ [.and.a0.'&'.1]", lpath_1 if path is not None else None))
+                        rep is None or rep.append(("unexpected /^2020-/ [.and.a0.'&'.1]", lpath_1))
                 else:
-                    rep is None or rep.append(("unexpected $DATE [.and.a0.'&'.0]", lpath_1 if path is not None else None))
+                    rep is None or rep.append(("unexpected $DATE [.and.a0.'&'.0]", lpath_1))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("not all model match [.and.a0.'&']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.and.a0]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not all model match [.and.a0.'&']", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.and.a0]", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.and]", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.and]", lpath_1))
         return False
     return True
 
@@ -161,22 +174,22 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "a0":
             # handle may a0 property
             # .array.a0
             res = isinstance(pval, list)
             if res:
                 for arr_0_idx, arr_0_item in enumerate(pval):
-                    arr_0_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_0_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_0_lpath: Path = (lpath_2, arr_0_idx) if lpath_2 is not None else None
                     # .array.a0.0
                     res = isinstance(arr_0_item, int) and not isinstance(arr_0_item, bool) and arr_0_item >= 0
                     if not res:
-                        rep is None or rep.append(("not a 0 strict int [.array.a0.0]", arr_0_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a 0 strict int [.array.a0.0]", arr_0_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.array.a0]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.array.a0]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.array.a0]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.array.a0]", lpath_2))
                 return False
             continue
         elif prop == "a1":
@@ -185,15 +198,15 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_1_idx, arr_1_item in enumerate(pval):
-                    arr_1_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_1_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_1_lpath: Path = (lpath_2, arr_1_idx) if lpath_2 is not None else None
                     # .array.a1.0
                     res = isinstance(arr_1_item, str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.array.a1.0]", arr_1_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.array.a1.0]", arr_1_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.array.a1]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.array.a1]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.array.a1]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.array.a1]", lpath_2))
                 return False
             continue
         elif prop == "a2":
@@ -202,15 +215,15 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_2_idx, arr_2_item in enumerate(pval):
-                    arr_2_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_2_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_2_lpath: Path = (lpath_2, arr_2_idx) if lpath_2 is not None else None
                     # .array.a2.0
-                    res = is_valid_date(arr_2_item, arr_2_lpath if (lpath_2 if path is not None else None) is not None else None, rep)
+                    res = is_valid_date(arr_2_item, arr_2_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $DATE [.array.a2.0]", arr_2_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $DATE [.array.a2.0]", arr_2_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.array.a2]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.array.a2]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.array.a2]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.array.a2]", lpath_2))
                 return False
             continue
         elif prop == "a3":
@@ -219,15 +232,15 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_3_idx, arr_3_item in enumerate(pval):
-                    arr_3_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_3_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_3_lpath: Path = (lpath_2, arr_3_idx) if lpath_2 is not None else None
                     # .array.a3.0
                     res = isinstance(arr_3_item, bool)
                     if not res:
-                        rep is None or rep.append(("not a bool [.array.a3.0]", arr_3_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a bool [.array.a3.0]", arr_3_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.array.a3]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.array.a3]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.array.a3]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.array.a3]", lpath_2))
                 return False
             continue
         elif prop == "a4":
@@ -235,11 +248,11 @@ def _jm_f_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .array.a4
             res = isinstance(pval, list)
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.array.a4]", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.array.a4]", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.array.a4]", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.array.a4]", lpath_2))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.array]", lpath_2 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.array]", lpath_2))
         return False
     return True
 
@@ -252,14 +265,14 @@ def _jm_f_2(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "b0":
             # handle may b0 property
             # .bool.b0
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.bool.b0]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.bool.b0]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not a bool [.bool.b0]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.bool.b0]", lpath_3))
                 return False
             continue
         elif prop == "b1":
@@ -267,8 +280,8 @@ def _jm_f_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .bool.b1
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("unexpected $BOOL [.bool.b1]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.bool.b1]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $BOOL [.bool.b1]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.bool.b1]", lpath_3))
                 return False
             continue
         elif prop == "b2":
@@ -276,8 +289,8 @@ def _jm_f_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .bool.b2
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("unexpected $BOOLEAN [.bool.b2]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.bool.b2]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $BOOLEAN [.bool.b2]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.bool.b2]", lpath_3))
                 return False
             continue
         elif prop == "b3":
@@ -285,8 +298,8 @@ def _jm_f_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .bool.b3
             res = isinstance(pval, bool) and pval == True
             if not res:
-                rep is None or rep.append(("unexpected =true [.bool.b3]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.bool.b3]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected =true [.bool.b3]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.bool.b3]", lpath_3))
                 return False
             continue
         elif prop == "b4":
@@ -294,8 +307,8 @@ def _jm_f_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .bool.b4
             res = isinstance(pval, bool) and pval == False
             if not res:
-                rep is None or rep.append(("unexpected =false [.bool.b4]", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.bool.b4]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected =false [.bool.b4]", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.bool.b4]", lpath_3))
                 return False
             continue
         elif prop == "b5":
@@ -306,22 +319,22 @@ def _jm_f_2(val: Jsonable, path: Path, rep: Report) -> bool:
                 # .bool.b5.'|'.0
                 res = pval == False
                 if not res:
-                    rep is None or rep.append(("unexpected =false [.bool.b5.'|'.0]", lpath_3 if path is not None else None))
+                    rep is None or rep.append(("unexpected =false [.bool.b5.'|'.0]", lpath_3))
                     # .bool.b5.'|'.1
                     res = pval == True
                     if not res:
-                        rep is None or rep.append(("unexpected =true [.bool.b5.'|'.1]", lpath_3 if path is not None else None))
+                        rep is None or rep.append(("unexpected =true [.bool.b5.'|'.1]", lpath_3))
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.bool.b5.'|']", lpath_3 if path is not None else None))
+                    rep is None or rep.append(("no model matched [.bool.b5.'|']", lpath_3))
             else:
-                rep is None or rep.append(("unexpected type [.bool.b5.'|']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected type [.bool.b5.'|']", lpath_3))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.bool.b5]", lpath_3 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.bool.b5]", lpath_3))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.bool]", lpath_3 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.bool]", lpath_3))
         return False
     return True
 
@@ -332,11 +345,11 @@ def _jm_f_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_4_idx, arr_4_item in enumerate(val):
-            arr_4_lpath: Path = (path + [ arr_4_idx ]) if path is not None else None
+            arr_4_lpath: Path = (path, arr_4_idx) if path is not None else None
             # .constraints.cia0.'@'.0
             res = isinstance(arr_4_item, int) and not isinstance(arr_4_item, bool) and arr_4_item >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.constraints.cia0.'@'.0]", arr_4_lpath if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.constraints.cia0.'@'.0]", arr_4_lpath))
                 break
     if res:
         ival_0: int = len(val)
@@ -354,11 +367,11 @@ def _jm_f_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_5_idx, arr_5_item in enumerate(val):
-            arr_5_lpath: Path = (path + [ arr_5_idx ]) if path is not None else None
+            arr_5_lpath: Path = (path, arr_5_idx) if path is not None else None
             # .constraints.cia1.'@'.0
             res = isinstance(arr_5_item, int) and not isinstance(arr_5_item, bool) and arr_5_item >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.constraints.cia1.'@'.0]", arr_5_lpath if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.constraints.cia1.'@'.0]", arr_5_lpath))
                 break
     if res:
         ival_1: int = len(val)
@@ -376,11 +389,11 @@ def _jm_f_6(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_6_idx, arr_6_item in enumerate(val):
-            arr_6_lpath: Path = (path + [ arr_6_idx ]) if path is not None else None
+            arr_6_lpath: Path = (path, arr_6_idx) if path is not None else None
             # .constraints.cia2.'@'.0
             res = isinstance(arr_6_item, int) and not isinstance(arr_6_item, bool) and arr_6_item >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.constraints.cia2.'@'.0]", arr_6_lpath if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.constraints.cia2.'@'.0]", arr_6_lpath))
                 break
     if res:
         ival_2: int = len(val)
@@ -716,14 +729,14 @@ def _jm_f_3(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if pfun := _jm_f_3_map.get(prop):
             # handle 25 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_4 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.constraints]", lpath_4 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_4, rep):
+                rep is None or rep.append(("invalid optional prop value [.constraints]", lpath_4))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.constraints]", lpath_4 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.constraints]", lpath_4))
         return False
     return True
 
@@ -738,7 +751,7 @@ def _jm_f_29(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "e0":
             # handle may e0 property
             # .enum.e0
@@ -747,19 +760,19 @@ def _jm_f_29(val: Jsonable, path: Path, rep: Report) -> bool:
                 # .enum.e0.'|'.0
                 res = pval == True
                 if not res:
-                    rep is None or rep.append(("unexpected =true [.enum.e0.'|'.0]", lpath_5 if path is not None else None))
+                    rep is None or rep.append(("unexpected =true [.enum.e0.'|'.0]", lpath_5))
                     # .enum.e0.'|'.1
                     res = pval == False
                     if not res:
-                        rep is None or rep.append(("unexpected =false [.enum.e0.'|'.1]", lpath_5 if path is not None else None))
+                        rep is None or rep.append(("unexpected =false [.enum.e0.'|'.1]", lpath_5))
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.enum.e0.'|']", lpath_5 if path is not None else None))
+                    rep is None or rep.append(("no model matched [.enum.e0.'|']", lpath_5))
             else:
-                rep is None or rep.append(("unexpected type [.enum.e0.'|']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected type [.enum.e0.'|']", lpath_5))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.enum.e0]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.enum.e0]", lpath_5))
                 return False
             continue
         elif prop == "e1":
@@ -770,23 +783,23 @@ def _jm_f_29(val: Jsonable, path: Path, rep: Report) -> bool:
                 # .enum.e1.'|'.0
                 res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 200
                 if not res:
-                    rep is None or rep.append(("unexpected =200 [.enum.e1.'|'.0]", lpath_5 if path is not None else None))
+                    rep is None or rep.append(("unexpected =200 [.enum.e1.'|'.0]", lpath_5))
                     # .enum.e1.'|'.1
                     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 201
                     if not res:
-                        rep is None or rep.append(("unexpected =201 [.enum.e1.'|'.1]", lpath_5 if path is not None else None))
+                        rep is None or rep.append(("unexpected =201 [.enum.e1.'|'.1]", lpath_5))
                         # .enum.e1.'|'.2
                         res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 204
                         if not res:
-                            rep is None or rep.append(("unexpected =204 [.enum.e1.'|'.2]", lpath_5 if path is not None else None))
+                            rep is None or rep.append(("unexpected =204 [.enum.e1.'|'.2]", lpath_5))
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.enum.e1.'|']", lpath_5 if path is not None else None))
+                    rep is None or rep.append(("no model matched [.enum.e1.'|']", lpath_5))
             else:
-                rep is None or rep.append(("unexpected type [.enum.e1.'|']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected type [.enum.e1.'|']", lpath_5))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.enum.e1]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.enum.e1]", lpath_5))
                 return False
             continue
         elif prop == "e2":
@@ -794,8 +807,8 @@ def _jm_f_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .enum.e2
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_0
             if not res:
-                rep is None or rep.append(("value not in enum [.enum.e2.'|']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.enum.e2]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.enum.e2.'|']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.enum.e2]", lpath_5))
                 return False
             continue
         elif prop == "e3":
@@ -803,28 +816,28 @@ def _jm_f_29(val: Jsonable, path: Path, rep: Report) -> bool:
             # .enum.e3
             res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_1
             if not res:
-                rep is None or rep.append(("value not in enum [.enum.e3.'|']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("value not in enum [.enum.e3.'|']", lpath_5))
                 # .enum.e3.'|'.0
                 res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 42
                 if not res:
-                    rep is None or rep.append(("unexpected =42 [.enum.e3.'|'.0]", lpath_5 if path is not None else None))
+                    rep is None or rep.append(("unexpected =42 [.enum.e3.'|'.0]", lpath_5))
                     # .enum.e3.'|'.1
                     res = isinstance(pval, bool) and pval == True
                     if not res:
-                        rep is None or rep.append(("unexpected =true [.enum.e3.'|'.1]", lpath_5 if path is not None else None))
+                        rep is None or rep.append(("unexpected =true [.enum.e3.'|'.1]", lpath_5))
                         # .enum.e3.'|'.2
                         res = pval is None
                         if not res:
-                            rep is None or rep.append(("not null [.enum.e3.'|'.2]", lpath_5 if path is not None else None))
+                            rep is None or rep.append(("not null [.enum.e3.'|'.2]", lpath_5))
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.enum.e3.'|']", lpath_5 if path is not None else None))
+                    rep is None or rep.append(("no model matched [.enum.e3.'|']", lpath_5))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.enum.e3]", lpath_5 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.enum.e3]", lpath_5))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.enum]", lpath_5 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.enum]", lpath_5))
         return False
     return True
 
@@ -837,14 +850,14 @@ def _jm_f_30(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "f0":
             # handle may f0 property
             # .float.f0
             res = isinstance(pval, float) and pval >= 0.0
             if not res:
-                rep is None or rep.append(("not a 0.0 strict float [.float.f0]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.float.f0]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not a 0.0 strict float [.float.f0]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.float.f0]", lpath_6))
                 return False
             continue
         elif prop == "f1":
@@ -852,8 +865,8 @@ def _jm_f_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .float.f1
             res = isinstance(pval, float) and pval > 0.0
             if not res:
-                rep is None or rep.append(("not a 1.0 strict float [.float.f1]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.float.f1]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not a 1.0 strict float [.float.f1]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.float.f1]", lpath_6))
                 return False
             continue
         elif prop == "f2":
@@ -861,8 +874,8 @@ def _jm_f_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .float.f2
             res = isinstance(pval, float)
             if not res:
-                rep is None or rep.append(("not a -1.0 strict float [.float.f2]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.float.f2]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not a -1.0 strict float [.float.f2]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.float.f2]", lpath_6))
                 return False
             continue
         elif prop == "f3":
@@ -870,8 +883,8 @@ def _jm_f_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .float.f3
             res = isinstance(pval, float)
             if not res:
-                rep is None or rep.append(("unexpected $FLOAT [.float.f3]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.float.f3]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $FLOAT [.float.f3]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.float.f3]", lpath_6))
                 return False
             continue
         elif prop == "f4":
@@ -879,8 +892,8 @@ def _jm_f_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .float.f4
             res = isinstance(pval, float)
             if not res:
-                rep is None or rep.append(("unexpected $F32 [.float.f4]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.float.f4]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $F32 [.float.f4]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.float.f4]", lpath_6))
                 return False
             continue
         elif prop == "f5":
@@ -888,8 +901,8 @@ def _jm_f_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .float.f5
             res = isinstance(pval, float)
             if not res:
-                rep is None or rep.append(("unexpected $F64 [.float.f5]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.float.f5]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $F64 [.float.f5]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.float.f5]", lpath_6))
                 return False
             continue
         elif prop == "f6":
@@ -897,8 +910,8 @@ def _jm_f_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .float.f6
             res = isinstance(pval, float) and pval == 3.1415927
             if not res:
-                rep is None or rep.append(("unexpected =3.1415927 [.float.f6]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.float.f6]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected =3.1415927 [.float.f6]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.float.f6]", lpath_6))
                 return False
             continue
         elif prop == "f7":
@@ -906,8 +919,8 @@ def _jm_f_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .float.f7
             res = isinstance(pval, float) and pval == 1e+100
             if not res:
-                rep is None or rep.append(("unexpected =1.0E100 [.float.f7]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.float.f7]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected =1.0E100 [.float.f7]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.float.f7]", lpath_6))
                 return False
             continue
         elif prop == "f8":
@@ -915,11 +928,11 @@ def _jm_f_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .float.f8
             res = isinstance(pval, float) and pval == -42.1
             if not res:
-                rep is None or rep.append(("unexpected =-42.1 [.float.f8]", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.float.f8]", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected =-42.1 [.float.f8]", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.float.f8]", lpath_6))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.float]", lpath_6 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.float]", lpath_6))
         return False
     return True
 
@@ -1021,14 +1034,14 @@ def _jm_f_31(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if pfun := _jm_f_31_map.get(prop):
             # handle 11 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_7 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.int]", lpath_7 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_7, rep):
+                rep is None or rep.append(("invalid optional prop value [.int]", lpath_7))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.int]", lpath_7 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.int]", lpath_7))
         return False
     return True
 
@@ -1040,15 +1053,15 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "a":
             # handle must a property
             must_count += 1
             # .merge.m0.a
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.merge.m0.a]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.merge.m0.a]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.merge.m0.a]", lpath_9))
+                rep is None or rep.append(("invalid mandatory prop value [.merge.m0.a]", lpath_9))
                 return False
             continue
         if prop == "b":
@@ -1056,11 +1069,11 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .merge.m0.b
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.merge.m0.b]", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.merge.m0.b]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.merge.m0.b]", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.merge.m0.b]", lpath_9))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.merge.m0]", lpath_9 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.merge.m0]", lpath_9))
         return False
     if must_count != 1:
         if rep is not None:
@@ -1084,22 +1097,22 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.merge.m1.'|'.1]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .merge.m1.'|'.1.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m1.'|'.1.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m1.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m1.'|'.1.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m1.'|'.1]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.merge.m1.'|'.1]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .merge.m1.'|'.1.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.merge.m1.'|'.1.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m1.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.merge.m1.'|'.1.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m1.'|'.1]", lpath))
         return False
     return True
 
@@ -1118,22 +1131,22 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.merge.m1.'|'.0]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .merge.m1.'|'.0.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m1.'|'.0.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m1.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m1.'|'.0.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m1.'|'.0]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.merge.m1.'|'.0]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .merge.m1.'|'.0.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.merge.m1.'|'.0.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m1.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.merge.m1.'|'.0.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m1.'|'.0]", lpath))
         return False
     return True
 
@@ -1152,22 +1165,22 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.merge.m2.'|'.1]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .merge.m2.'|'.1.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m2.'|'.1.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m2.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m2.'|'.1.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m2.'|'.1]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.merge.m2.'|'.1]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .merge.m2.'|'.1.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.merge.m2.'|'.1.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m2.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.merge.m2.'|'.1.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m2.'|'.1]", lpath))
         return False
     return True
 
@@ -1186,22 +1199,22 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.merge.m2.'|'.0]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .merge.m2.'|'.0.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m2.'|'.0.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m2.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m2.'|'.0.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m2.'|'.0]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.merge.m2.'|'.0]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .merge.m2.'|'.0.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.merge.m2.'|'.0.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m2.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.merge.m2.'|'.0.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m2.'|'.0]", lpath))
         return False
     return True
 
@@ -1220,22 +1233,22 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.merge.m3.'|'.3]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .merge.m3.'|'.3.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m3.'|'.3.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m3.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m3.'|'.3.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m3.'|'.3]", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.merge.m3.'|'.3]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .merge.m3.'|'.3.d
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.merge.m3.'|'.3.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.merge.m3.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.merge.m3.'|'.3.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.merge.m3.'|'.3]", lpath))
         return False
     return True
 
@@ -1254,22 +1267,22 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.merge.m3.'|'.2]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .merge.m3.'|'.2.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m3.'|'.2.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m3.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m3.'|'.2.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m3.'|'.2]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.merge.m3.'|'.2]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .merge.m3.'|'.2.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.merge.m3.'|'.2.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m3.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.merge.m3.'|'.2.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m3.'|'.2]", lpath))
         return False
     return True
 
@@ -1288,22 +1301,22 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.merge.m3.'|'.1]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .merge.m3.'|'.1.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m3.'|'.1.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m3.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m3.'|'.1.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m3.'|'.1]", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.merge.m3.'|'.1]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .merge.m3.'|'.1.d
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.merge.m3.'|'.1.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.merge.m3.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.merge.m3.'|'.1.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.merge.m3.'|'.1]", lpath))
         return False
     return True
 
@@ -1322,22 +1335,22 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.merge.m3.'|'.0]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .merge.m3.'|'.0.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m3.'|'.0.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m3.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m3.'|'.0.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m3.'|'.0]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.merge.m3.'|'.0]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .merge.m3.'|'.0.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.merge.m3.'|'.0.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m3.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.merge.m3.'|'.0.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m3.'|'.0]", lpath))
         return False
     return True
 
@@ -1356,42 +1369,42 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.merge.m4]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .merge.m4.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m4.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m4]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m4.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.merge.m4]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.merge.m4]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .merge.m4.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m4.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m4]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m4.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.merge.m4]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.merge.m4]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .merge.m4.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m4.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m4]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m4.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.merge.m4]", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.merge.m4]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .merge.m4.d
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.merge.m4.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.merge.m4]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.merge.m4.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.merge.m4]", lpath))
         return False
     return True
 
@@ -1404,14 +1417,14 @@ def _jm_f_43(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "m0":
             # handle may m0 property
             # .merge.m0
-            res = _jm_obj_3(pval, lpath_8 if path is not None else None, rep)
+            res = _jm_obj_3(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.merge.m0]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.merge.m0]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.merge.m0]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.merge.m0]", lpath_8))
                 return False
             continue
         elif prop == "m1":
@@ -1421,25 +1434,25 @@ def _jm_f_43(val: Jsonable, path: Path, rep: Report) -> bool:
             if res:
                 if "b" in pval:
                     # .merge.m1.'|'.0
-                    res = _jm_obj_5(pval, lpath_8 if path is not None else None, rep)
+                    res = _jm_obj_5(pval, lpath_8, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected element [.merge.m1.'|'.0]", lpath_8 if path is not None else None))
+                        rep is None or rep.append(("unexpected element [.merge.m1.'|'.0]", lpath_8))
                 else:
                     if "c" in pval:
                         # .merge.m1.'|'.1
-                        res = _jm_obj_4(pval, lpath_8 if path is not None else None, rep)
+                        res = _jm_obj_4(pval, lpath_8, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected element [.merge.m1.'|'.1]", lpath_8 if path is not None else None))
+                            rep is None or rep.append(("unexpected element [.merge.m1.'|'.1]", lpath_8))
                     else:
                         res = False
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.merge.m1.'|']", lpath_8 if path is not None else None))
+                    rep is None or rep.append(("no model matched [.merge.m1.'|']", lpath_8))
             else:
-                rep is None or rep.append(("unexpected type [.merge.m1.'|']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected type [.merge.m1.'|']", lpath_8))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.merge.m1]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.merge.m1]", lpath_8))
                 return False
             continue
         elif prop == "m2":
@@ -1449,25 +1462,25 @@ def _jm_f_43(val: Jsonable, path: Path, rep: Report) -> bool:
             if res:
                 if "b" in pval:
                     # .merge.m2.'|'.0
-                    res = _jm_obj_7(pval, lpath_8 if path is not None else None, rep)
+                    res = _jm_obj_7(pval, lpath_8, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected element [.merge.m2.'|'.0]", lpath_8 if path is not None else None))
+                        rep is None or rep.append(("unexpected element [.merge.m2.'|'.0]", lpath_8))
                 else:
                     if "c" in pval:
                         # .merge.m2.'|'.1
-                        res = _jm_obj_6(pval, lpath_8 if path is not None else None, rep)
+                        res = _jm_obj_6(pval, lpath_8, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected element [.merge.m2.'|'.1]", lpath_8 if path is not None else None))
+                            rep is None or rep.append(("unexpected element [.merge.m2.'|'.1]", lpath_8))
                     else:
                         res = False
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.merge.m2.'|']", lpath_8 if path is not None else None))
+                    rep is None or rep.append(("no model matched [.merge.m2.'|']", lpath_8))
             else:
-                rep is None or rep.append(("unexpected type [.merge.m2.'|']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected type [.merge.m2.'|']", lpath_8))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.merge.m2]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.merge.m2]", lpath_8))
                 return False
             continue
         elif prop == "m3":
@@ -1477,55 +1490,55 @@ def _jm_f_43(val: Jsonable, path: Path, rep: Report) -> bool:
             if res:
                 if "a" in pval:
                     # .merge.m3.'|'.0
-                    res = _jm_obj_11(pval, lpath_8 if path is not None else None, rep)
+                    res = _jm_obj_11(pval, lpath_8, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected element [.merge.m3.'|'.0]", lpath_8 if path is not None else None))
+                        rep is None or rep.append(("unexpected element [.merge.m3.'|'.0]", lpath_8))
                 else:
                     res = False
                 if not res:
                     if "a" in pval:
                         # .merge.m3.'|'.1
-                        res = _jm_obj_10(pval, lpath_8 if path is not None else None, rep)
+                        res = _jm_obj_10(pval, lpath_8, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected element [.merge.m3.'|'.1]", lpath_8 if path is not None else None))
+                            rep is None or rep.append(("unexpected element [.merge.m3.'|'.1]", lpath_8))
                     else:
                         res = False
                     if not res:
                         if "b" in pval:
                             # .merge.m3.'|'.2
-                            res = _jm_obj_9(pval, lpath_8 if path is not None else None, rep)
+                            res = _jm_obj_9(pval, lpath_8, rep)
                             if not res:
-                                rep is None or rep.append(("unexpected element [.merge.m3.'|'.2]", lpath_8 if path is not None else None))
+                                rep is None or rep.append(("unexpected element [.merge.m3.'|'.2]", lpath_8))
                         else:
                             res = False
                         if not res:
                             if "b" in pval:
                                 # .merge.m3.'|'.3
-                                res = _jm_obj_8(pval, lpath_8 if path is not None else None, rep)
+                                res = _jm_obj_8(pval, lpath_8, rep)
                                 if not res:
-                                    rep is None or rep.append(("unexpected element [.merge.m3.'|'.3]", lpath_8 if path is not None else None))
+                                    rep is None or rep.append(("unexpected element [.merge.m3.'|'.3]", lpath_8))
                             else:
                                 res = False
                 if res:
                     rep is None or rep.clear()
                 else:
-                    rep is None or rep.append(("no model matched [.merge.m3.'|']", lpath_8 if path is not None else None))
+                    rep is None or rep.append(("no model matched [.merge.m3.'|']", lpath_8))
             else:
-                rep is None or rep.append(("unexpected type [.merge.m3.'|']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected type [.merge.m3.'|']", lpath_8))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.merge.m3]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.merge.m3]", lpath_8))
                 return False
             continue
         elif prop == "m4":
             # handle may m4 property
             # .merge.m4
-            res = _jm_obj_12(pval, lpath_8 if path is not None else None, rep)
+            res = _jm_obj_12(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.merge.m4]", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.merge.m4]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.merge.m4]", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.merge.m4]", lpath_8))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.merge]", lpath_8 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.merge]", lpath_8))
         return False
     return True
 
@@ -1538,14 +1551,14 @@ def _jm_f_44(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         if prop == "n0":
             # handle may n0 property
             # .null.n0
             res = pval is None
             if not res:
-                rep is None or rep.append(("not null [.null.n0]", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.null.n0]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("not null [.null.n0]", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.null.n0]", lpath_10))
                 return False
             continue
         elif prop == "n1":
@@ -1553,8 +1566,8 @@ def _jm_f_44(val: Jsonable, path: Path, rep: Report) -> bool:
             # .null.n1
             res = pval is None
             if not res:
-                rep is None or rep.append(("unexpected $NULL [.null.n1]", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.null.n1]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected $NULL [.null.n1]", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.null.n1]", lpath_10))
                 return False
             continue
         elif prop == "n2":
@@ -1562,11 +1575,11 @@ def _jm_f_44(val: Jsonable, path: Path, rep: Report) -> bool:
             # .null.n2
             res = pval is None
             if not res:
-                rep is None or rep.append(("unexpected =null [.null.n2]", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.null.n2]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected =null [.null.n2]", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.null.n2]", lpath_10))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.null]", lpath_10 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.null]", lpath_10))
         return False
     return True
 
@@ -1596,32 +1609,32 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("a", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <a> [.object.o1]", path))
         return False
-    lpath = (path + [ "a" ]) if path is not None else None
+    lpath = (path, "a") if path is not None else None
     # .object.o1.a
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.object.o1.a]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <a> [.object.o1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.object.o1.a]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <a> [.object.o1]", lpath))
         return False
     if not ((pval := val.get("b", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <b> [.object.o1]", path))
         return False
-    lpath = (path + [ "b" ]) if path is not None else None
+    lpath = (path, "b") if path is not None else None
     # .object.o1.b
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.object.o1.b]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <b> [.object.o1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.object.o1.b]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <b> [.object.o1]", lpath))
         return False
     if not ((pval := val.get("c", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <c> [.object.o1]", path))
         return False
-    lpath = (path + [ "c" ]) if path is not None else None
+    lpath = (path, "c") if path is not None else None
     # .object.o1.c
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
     if not res:
-        rep is None or rep.append(("not a 0 strict int [.object.o1.c]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <c> [.object.o1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 0 strict int [.object.o1.c]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <c> [.object.o1]", lpath))
         return False
     return True
 
@@ -1632,17 +1645,17 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         if prop == "a":
             # handle may a property
             # .object.o2.a
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.object.o2.a]", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.object.o2.a]", lpath_12 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.object.o2.a]", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.object.o2.a]", lpath_12))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.object.o2]", lpath_12 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.object.o2]", lpath_12))
         return False
     return True
 
@@ -1653,16 +1666,16 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         if prop.startswith("a"):
             # handle 1 re props
             # .object.o3.'/^a/'
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.object.o3.'/^a/']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.object.o3.'/^a/']", lpath_13))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.object.o3]", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.object.o3]", lpath_13))
             return False
     return True
 
@@ -1673,16 +1686,16 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
-        if is_valid_date(prop, lpath_14 if path is not None else None, rep):
+        lpath_14: Path = (path, prop) if path is not None else None
+        if is_valid_date(prop, lpath_14, rep):
             # handle 1 key props
             # .object.o4.'$DATE'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.object.o4.'$DATE']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.object.o4.'$DATE']", lpath_14))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.object.o4]", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.object.o4]", lpath_14))
             return False
     return True
 
@@ -1693,12 +1706,12 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         # handle other props
         # .object.o5.''
         res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
         if not res:
-            rep is None or rep.append(("not a 0 strict int [.object.o5.'']", lpath_15 if path is not None else None))
+            rep is None or rep.append(("not a 0 strict int [.object.o5.'']", lpath_15))
             return False
     return True
 
@@ -1719,71 +1732,71 @@ def _jm_f_45(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         if prop == "o0":
             # handle may o0 property
             # .object.o0
-            res = _jm_obj_13(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.object.o0]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.object.o0]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.object.o0]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.object.o0]", lpath_11))
                 return False
             continue
         elif prop == "o1":
             # handle may o1 property
             # .object.o1
-            res = _jm_obj_14(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_14(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.object.o1]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.object.o1]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.object.o1]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.object.o1]", lpath_11))
                 return False
             continue
         elif prop == "o2":
             # handle may o2 property
             # .object.o2
-            res = _jm_obj_15(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_15(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.object.o2]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.object.o2]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.object.o2]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.object.o2]", lpath_11))
                 return False
             continue
         elif prop == "o3":
             # handle may o3 property
             # .object.o3
-            res = _jm_obj_16(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_16(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.object.o3]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.object.o3]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.object.o3]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.object.o3]", lpath_11))
                 return False
             continue
         elif prop == "o4":
             # handle may o4 property
             # .object.o4
-            res = _jm_obj_17(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_17(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.object.o4]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.object.o4]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.object.o4]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.object.o4]", lpath_11))
                 return False
             continue
         elif prop == "o5":
             # handle may o5 property
             # .object.o5
-            res = _jm_obj_18(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_18(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.object.o5]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.object.o5]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.object.o5]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.object.o5]", lpath_11))
                 return False
             continue
         elif prop == "o6":
             # handle may o6 property
             # .object.o6
-            res = _jm_obj_19(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_19(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.object.o6]", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.object.o6]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.object.o6]", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.object.o6]", lpath_11))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.object]", lpath_11 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.object]", lpath_11))
         return False
     return True
 
@@ -1804,41 +1817,41 @@ def _jm_f_46(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         if prop == "o0":
             # handle may o0 property
             # .or.o0
             # .or.o0.'|'.0
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.or.o0.'|'.0]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("not a bool [.or.o0.'|'.0]", lpath_16))
                 # .or.o0.'|'.1
                 res = isinstance(pval, int) and not isinstance(pval, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1 strict int [.or.o0.'|'.1]", lpath_16 if path is not None else None))
+                    rep is None or rep.append(("not a -1 strict int [.or.o0.'|'.1]", lpath_16))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.or.o0.'|']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.or.o0]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("no model matched [.or.o0.'|']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.or.o0]", lpath_16))
                 return False
             continue
         elif prop == "o1":
             # handle may o1 property
             # .or.o1
             # .or.o1.'|'.0
-            res = is_valid_date(pval, lpath_16 if path is not None else None, rep)
+            res = is_valid_date(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected $DATE [.or.o1.'|'.0]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected $DATE [.or.o1.'|'.0]", lpath_16))
                 # .or.o1.'|'.1
-                res = is_valid_time(pval, lpath_16 if path is not None else None, rep)
+                res = is_valid_time(pval, lpath_16, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $TIME [.or.o1.'|'.1]", lpath_16 if path is not None else None))
+                    rep is None or rep.append(("unexpected $TIME [.or.o1.'|'.1]", lpath_16))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.or.o1.'|']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.or.o1]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("no model matched [.or.o1.'|']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.or.o1]", lpath_16))
                 return False
             continue
         elif prop == "o2":
@@ -1847,27 +1860,27 @@ def _jm_f_46(val: Jsonable, path: Path, rep: Report) -> bool:
             # .or.o2.'|'.0
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not res:
-                rep is None or rep.append(("not a 0 strict int [.or.o2.'|'.0]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.or.o2.'|'.0]", lpath_16))
                 # .or.o2.'|'.1
-                res = is_valid_uuid(pval, lpath_16 if path is not None else None, rep)
+                res = is_valid_uuid(pval, lpath_16, rep)
                 if not res:
-                    rep is None or rep.append(("unexpected $UUID [.or.o2.'|'.1]", lpath_16 if path is not None else None))
+                    rep is None or rep.append(("unexpected $UUID [.or.o2.'|'.1]", lpath_16))
                     # .or.o2.'|'.2
                     res = isinstance(pval, list)
                     if not res:
-                        rep is None or rep.append(("not array or unexpected array [.or.o2.'|'.2]", lpath_16 if path is not None else None))
+                        rep is None or rep.append(("not array or unexpected array [.or.o2.'|'.2]", lpath_16))
                         # .or.o2.'|'.3
-                        res = _jm_obj_20(pval, lpath_16 if path is not None else None, rep)
+                        res = _jm_obj_20(pval, lpath_16, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected element [.or.o2.'|'.3]", lpath_16 if path is not None else None))
+                            rep is None or rep.append(("unexpected element [.or.o2.'|'.3]", lpath_16))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.or.o2.'|']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.or.o2]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("no model matched [.or.o2.'|']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.or.o2]", lpath_16))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.or]", lpath_16 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.or]", lpath_16))
         return False
     return True
 
@@ -2088,14 +2101,14 @@ def _jm_f_47(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         if pfun := _jm_f_47_map.get(prop):
             # handle 26 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_17 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.predefs]", lpath_17 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_17, rep):
+                rep is None or rep.append(("invalid optional prop value [.predefs]", lpath_17))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.predefs]", lpath_17 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.predefs]", lpath_17))
         return False
     return True
 
@@ -2109,14 +2122,14 @@ def _jm_f_74(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         if prop == "s0":
             # handle may s0 property
             # .string.s0
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.string.s0]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.string.s0]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.string.s0]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.string.s0]", lpath_18))
                 return False
             continue
         elif prop == "s1":
@@ -2124,8 +2137,8 @@ def _jm_f_74(val: Jsonable, path: Path, rep: Report) -> bool:
             # .string.s1
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected $STRING [.string.s1]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.string.s1]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $STRING [.string.s1]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.string.s1]", lpath_18))
                 return False
             continue
         elif prop == "s2":
@@ -2133,8 +2146,8 @@ def _jm_f_74(val: Jsonable, path: Path, rep: Report) -> bool:
             # .string.s2
             res = isinstance(pval, str) and pval == "Susie"
             if not res:
-                rep is None or rep.append(("unexpected Susie [.string.s2]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.string.s2]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected Susie [.string.s2]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.string.s2]", lpath_18))
                 return False
             continue
         elif prop == "s3":
@@ -2142,21 +2155,21 @@ def _jm_f_74(val: Jsonable, path: Path, rep: Report) -> bool:
             # .string.s3
             res = isinstance(pval, str) and pval == "Calvin"
             if not res:
-                rep is None or rep.append(("unexpected _Calvin [.string.s3]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.string.s3]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected _Calvin [.string.s3]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.string.s3]", lpath_18))
                 return False
             continue
         elif prop == "s4":
             # handle may s4 property
             # .string.s4
             # "/^(Calvin|Susie)$/"
-            res = isinstance(pval, str) and _jm_re_0(pval, lpath_18 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_0(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^(Calvin|Susie)$/ [.string.s4]", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.string.s4]", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected /^(Calvin|Susie)$/ [.string.s4]", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.string.s4]", lpath_18))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.string]", lpath_18 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.string]", lpath_18))
         return False
     return True
 
@@ -2169,14 +2182,14 @@ def _jm_f_75(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         if prop == "t0":
             # handle may t0 property
             # .tuple.t0
             res = isinstance(pval, list) and len(pval) == 0
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.tuple.t0]", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.tuple.t0]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.tuple.t0]", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.tuple.t0]", lpath_19))
                 return False
             continue
         elif prop == "t1":
@@ -2186,21 +2199,21 @@ def _jm_f_75(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_7_idx, arr_7_item in enumerate(pval):
-                    arr_7_lpath: Path = ((lpath_19 if path is not None else None) + [ arr_7_idx ]) if (lpath_19 if path is not None else None) is not None else None
+                    arr_7_lpath: Path = (lpath_19, arr_7_idx) if lpath_19 is not None else None
                     # .tuple.t1.'@'.0
                     res = isinstance(arr_7_item, int) and not isinstance(arr_7_item, bool) and arr_7_item >= 0
                     if not res:
-                        rep is None or rep.append(("not a 0 strict int [.tuple.t1.'@'.0]", arr_7_lpath if (lpath_19 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a 0 strict int [.tuple.t1.'@'.0]", arr_7_lpath))
                         break
             if res:
                 ival_12: int = len(pval)
                 res = ival_12 == 1
                 if not res:
-                    rep is None or rep.append(("constraints failed [.tuple.t1]", lpath_19 if path is not None else None))
+                    rep is None or rep.append(("constraints failed [.tuple.t1]", lpath_19))
             else:
-                rep is None or rep.append(("not array or unexpected array [.tuple.t1.'@']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.tuple.t1.'@']", lpath_19))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.tuple.t1]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.tuple.t1]", lpath_19))
                 return False
             continue
         elif prop == "t2":
@@ -2208,20 +2221,20 @@ def _jm_f_75(val: Jsonable, path: Path, rep: Report) -> bool:
             # .tuple.t2
             res = isinstance(pval, list) and len(pval) == 2
             if res:
-                lpath_20: Path = ((lpath_19 if path is not None else None) + [ 0 ]) if (lpath_19 if path is not None else None) is not None else None
+                lpath_20: Path = (lpath_19, 0) if lpath_19 is not None else None
                 # .tuple.t2.0
                 res = isinstance(pval[0], int) and not isinstance(pval[0], bool) and pval[0] >= 0
                 if res:
-                    lpath_20 = ((lpath_19 if path is not None else None) + [ 1 ]) if (lpath_19 if path is not None else None) is not None else None
+                    lpath_20 = (lpath_19, 1) if lpath_19 is not None else None
                     # .tuple.t2.1
                     res = isinstance(pval[1], int) and not isinstance(pval[1], bool) and pval[1] >= 0
                     if not res:
-                        rep is None or rep.append(("not a 0 strict int [.tuple.t2.1]", lpath_20 if (lpath_19 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a 0 strict int [.tuple.t2.1]", lpath_20))
                 else:
-                    rep is None or rep.append(("not a 0 strict int [.tuple.t2.0]", lpath_20 if (lpath_19 if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a 0 strict int [.tuple.t2.0]", lpath_20))
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.tuple.t2]", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.tuple.t2]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.tuple.t2]", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.tuple.t2]", lpath_19))
                 return False
             continue
         elif prop == "t3":
@@ -2229,26 +2242,26 @@ def _jm_f_75(val: Jsonable, path: Path, rep: Report) -> bool:
             # .tuple.t3
             res = isinstance(pval, list) and len(pval) == 3
             if res:
-                lpath_21: Path = ((lpath_19 if path is not None else None) + [ 0 ]) if (lpath_19 if path is not None else None) is not None else None
+                lpath_21: Path = (lpath_19, 0) if lpath_19 is not None else None
                 # .tuple.t3.0
                 res = isinstance(pval[0], bool)
                 if res:
-                    lpath_21 = ((lpath_19 if path is not None else None) + [ 1 ]) if (lpath_19 if path is not None else None) is not None else None
+                    lpath_21 = (lpath_19, 1) if lpath_19 is not None else None
                     # .tuple.t3.1
                     res = isinstance(pval[1], int) and not isinstance(pval[1], bool) and pval[1] >= 0
                     if res:
-                        lpath_21 = ((lpath_19 if path is not None else None) + [ 2 ]) if (lpath_19 if path is not None else None) is not None else None
+                        lpath_21 = (lpath_19, 2) if lpath_19 is not None else None
                         # .tuple.t3.2
                         res = isinstance(pval[2], str)
                         if not res:
-                            rep is None or rep.append(("unexpected string [.tuple.t3.2]", lpath_21 if (lpath_19 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected string [.tuple.t3.2]", lpath_21))
                     else:
-                        rep is None or rep.append(("not a 0 strict int [.tuple.t3.1]", lpath_21 if (lpath_19 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("not a 0 strict int [.tuple.t3.1]", lpath_21))
                 else:
-                    rep is None or rep.append(("not a bool [.tuple.t3.0]", lpath_21 if (lpath_19 if path is not None else None) is not None else None))
+                    rep is None or rep.append(("not a bool [.tuple.t3.0]", lpath_21))
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.tuple.t3]", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.tuple.t3]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.tuple.t3]", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.tuple.t3]", lpath_19))
                 return False
             continue
         elif prop == "t4":
@@ -2260,31 +2273,31 @@ def _jm_f_75(val: Jsonable, path: Path, rep: Report) -> bool:
             if res:
                 len_0: int = len(pval)
                 if len_0 > 0:
-                    lpath_22 = ((lpath_19 if path is not None else None) + [ 0 ]) if (lpath_19 if path is not None else None) is not None else None
+                    lpath_22 = (lpath_19, 0) if lpath_19 is not None else None
                     # .tuple.t4.'@'.0
                     res = isinstance(pval[0], str)
                     if not res:
-                        rep is None or rep.append(("unexpected string [.tuple.t4.'@'.0]", lpath_22 if (lpath_19 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected string [.tuple.t4.'@'.0]", lpath_22))
                 if res:
                     for idx_0 in range(1, len_0):
-                        lpath_22 = ((lpath_19 if path is not None else None) + [ idx_0 ]) if (lpath_19 if path is not None else None) is not None else None
+                        lpath_22 = (lpath_19, idx_0) if lpath_19 is not None else None
                         # .tuple.t4.'@'.1
                         res = isinstance(pval[idx_0], int) and not isinstance(pval[idx_0], bool) and pval[idx_0] >= 0
                         if not res:
-                            rep is None or rep.append(("not a 0 strict int [.tuple.t4.'@'.1]", lpath_22 if (lpath_19 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("not a 0 strict int [.tuple.t4.'@'.1]", lpath_22))
                             break
             if res:
                 ival_13: int = len(pval)
                 res = ival_13 >= 2
                 if not res:
-                    rep is None or rep.append(("constraints failed [.tuple.t4]", lpath_19 if path is not None else None))
+                    rep is None or rep.append(("constraints failed [.tuple.t4]", lpath_19))
             else:
-                rep is None or rep.append(("not array or unexpected array [.tuple.t4.'@']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.tuple.t4.'@']", lpath_19))
             if not res:
-                rep is None or rep.append(("invalid optional prop value [.tuple.t4]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("invalid optional prop value [.tuple.t4]", lpath_19))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.tuple]", lpath_19 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.tuple]", lpath_19))
         return False
     return True
 
@@ -2297,23 +2310,23 @@ def _jm_f_76(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         if prop == "x0":
             # handle may x0 property
             # .xor.x0
             # .xor.x0.'|'.0
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.xor.x0.'|'.0]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not a bool [.xor.x0.'|'.0]", lpath_23))
                 # .xor.x0.'|'.1
                 res = isinstance(pval, int) and not isinstance(pval, bool)
                 if not res:
-                    rep is None or rep.append(("not a -1 strict int [.xor.x0.'|'.1]", lpath_23 if path is not None else None))
+                    rep is None or rep.append(("not a -1 strict int [.xor.x0.'|'.1]", lpath_23))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.xor.x0.'|']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.xor.x0]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("no model matched [.xor.x0.'|']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.xor.x0]", lpath_23))
                 return False
             continue
         elif prop == "x1":
@@ -2327,20 +2340,20 @@ def _jm_f_76(val: Jsonable, path: Path, rep: Report) -> bool:
             if xr_0:
                 xc_0 += 1
             else:
-                rep is None or rep.append(("unexpected /^a/ [.xor.x1.'^'.0]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected /^a/ [.xor.x1.'^'.0]", lpath_23))
             # .xor.x1.'^'.1
             # "/z$/"
             xr_0 = isinstance(pval, str) and pval.endswith("z")
             if xr_0:
                 xc_0 += 1
             else:
-                rep is None or rep.append(("unexpected /z$/ [.xor.x1.'^'.1]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected /z$/ [.xor.x1.'^'.1]", lpath_23))
             res = xc_0 == 1
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("not one model match [.xor.x1.'^']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.xor.x1]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not one model match [.xor.x1.'^']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.xor.x1]", lpath_23))
                 return False
             continue
         elif prop == "x2":
@@ -2353,19 +2366,19 @@ def _jm_f_76(val: Jsonable, path: Path, rep: Report) -> bool:
             if xr_1:
                 xc_1 += 1
             else:
-                rep is None or rep.append(("not a -1 strict int [.xor.x2.'^'.0]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not a -1 strict int [.xor.x2.'^'.0]", lpath_23))
             # .xor.x2.'^'.1
             xr_1 = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if xr_1:
                 xc_1 += 1
             else:
-                rep is None or rep.append(("not a 0 strict int [.xor.x2.'^'.1]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.xor.x2.'^'.1]", lpath_23))
             res = xc_1 == 1
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("not one model match [.xor.x2.'^']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.xor.x2]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not one model match [.xor.x2.'^']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.xor.x2]", lpath_23))
                 return False
             continue
         elif prop == "x3":
@@ -2375,16 +2388,16 @@ def _jm_f_76(val: Jsonable, path: Path, rep: Report) -> bool:
             # .xor.x3.'^'.1
             is_0: bool = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 0
             if not is_0:
-                rep is None or rep.append(("not a 0 strict int [.xor.x3.'^'.1]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not a 0 strict int [.xor.x3.'^'.1]", lpath_23))
             res = not is_0
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("not one model match [.xor.x3.'^']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.xor.x3]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not one model match [.xor.x3.'^']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.xor.x3]", lpath_23))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.xor]", lpath_23 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.xor]", lpath_23))
         return False
     return True
 
@@ -2398,14 +2411,14 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     pfun: CheckFun
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if pfun := json_model_1_map.get(prop):
             # handle 15 may props
-            if pfun != UNDEFINED and not pfun(pval, lpath_0 if path is not None else None, rep):
-                rep is None or rep.append(("invalid optional prop value [.]", lpath_0 if path is not None else None))
+            if pfun != UNDEFINED and not pfun(pval, lpath_0, rep):
+                rep is None or rep.append(("invalid optional prop value [.]", lpath_0))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.]", lpath_0))
         return False
     return True
 
@@ -2534,5 +2547,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: dict[str, str]
 _jm_map_1: dict[str, str]
@@ -39,22 +52,22 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'$cs'.'|'.0]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'$cs'.'|'.0.t
     res = isinstance(pval, str) and pval == "c"
     if not res:
-        rep is None or rep.append(("unexpected c [.'$cs'.'|'.0.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$cs'.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected c [.'$cs'.'|'.0.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$cs'.'|'.0]", lpath))
         return False
     if not ((pval := val.get("cal", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <cal> [.'$cs'.'|'.0]", path))
         return False
-    lpath = (path + [ "cal" ]) if path is not None else None
+    lpath = (path, "cal") if path is not None else None
     # .'$cs'.'|'.0.cal
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'$cs'.'|'.0.cal]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <cal> [.'$cs'.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'$cs'.'|'.0.cal]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <cal> [.'$cs'.'|'.0]", lpath))
         return False
     return True
 
@@ -73,22 +86,22 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'$cs'.'|'.1]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'$cs'.'|'.1.t
     res = isinstance(pval, str) and pval == "s"
     if not res:
-        rep is None or rep.append(("unexpected s [.'$cs'.'|'.1.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$cs'.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected s [.'$cs'.'|'.1.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$cs'.'|'.1]", lpath))
         return False
     if not ((pval := val.get("sus", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <sus> [.'$cs'.'|'.1]", path))
         return False
-    lpath = (path + [ "sus" ]) if path is not None else None
+    lpath = (path, "sus") if path is not None else None
     # .'$cs'.'|'.1.sus
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'$cs'.'|'.1.sus]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <sus> [.'$cs'.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'$cs'.'|'.1.sus]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <sus> [.'$cs'.'|'.1]", lpath))
         return False
     return True
 
@@ -130,22 +143,22 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.0]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.0.t
     res = isinstance(pval, str) and pval == "m"
     if not res:
-        rep is None or rep.append(("unexpected m [.'|'.0.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected m [.'|'.0.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath))
         return False
     if not ((pval := val.get("moe", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <moe> [.'|'.0]", path))
         return False
-    lpath = (path + [ "moe" ]) if path is not None else None
+    lpath = (path, "moe") if path is not None else None
     # .'|'.0.moe
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.0.moe]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <moe> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.0.moe]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <moe> [.'|'.0]", lpath))
         return False
     return True
 
@@ -164,22 +177,22 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.1]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.1.t
     res = isinstance(pval, str) and pval == "h"
     if not res:
-        rep is None or rep.append(("unexpected h [.'|'.1.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected h [.'|'.1.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath))
         return False
     if not ((pval := val.get("hob", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <hob> [.'|'.1]", path))
         return False
-    lpath = (path + [ "hob" ]) if path is not None else None
+    lpath = (path, "hob") if path is not None else None
     # .'|'.1.hob
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.1.hob]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <hob> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.1.hob]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <hob> [.'|'.1]", lpath))
         return False
     return True
 
@@ -239,5 +252,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_map_0: ConstMap = ConstMap()
 check_model_map: PropMap
@@ -38,22 +51,22 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.0]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.0.t
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 0
     if not res:
-        rep is None or rep.append(("unexpected =0 [.'|'.0.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =0 [.'|'.0.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath))
         return False
     if not ((pval := val.get("z", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <z> [.'|'.0]", path))
         return False
-    lpath = (path + [ "z" ]) if path is not None else None
+    lpath = (path, "z") if path is not None else None
     # .'|'.0.z
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.0.z]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <z> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.0.z]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <z> [.'|'.0]", lpath))
         return False
     return True
 
@@ -72,44 +85,44 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.1]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.1.t
     res = isinstance(pval, int) and not isinstance(pval, bool)
     if res:
         # .'|'.1.t.'|'.0
         res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 2
         if not res:
-            rep is None or rep.append(("unexpected =2 [.'|'.1.t.'|'.0]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected =2 [.'|'.1.t.'|'.0]", lpath))
             # .'|'.1.t.'|'.1
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 4
             if not res:
-                rep is None or rep.append(("unexpected =4 [.'|'.1.t.'|'.1]", lpath if path is not None else None))
+                rep is None or rep.append(("unexpected =4 [.'|'.1.t.'|'.1]", lpath))
                 # .'|'.1.t.'|'.2
                 res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 6
                 if not res:
-                    rep is None or rep.append(("unexpected =6 [.'|'.1.t.'|'.2]", lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected =6 [.'|'.1.t.'|'.2]", lpath))
                     # .'|'.1.t.'|'.3
                     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 8
                     if not res:
-                        rep is None or rep.append(("unexpected =8 [.'|'.1.t.'|'.3]", lpath if path is not None else None))
+                        rep is None or rep.append(("unexpected =8 [.'|'.1.t.'|'.3]", lpath))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'|'.1.t.'|']", lpath if path is not None else None))
+            rep is None or rep.append(("no model matched [.'|'.1.t.'|']", lpath))
     else:
-        rep is None or rep.append(("unexpected type [.'|'.1.t.'|']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected type [.'|'.1.t.'|']", lpath))
     if not res:
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath))
         return False
     if not ((pval := val.get("p", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <p> [.'|'.1]", path))
         return False
-    lpath = (path + [ "p" ]) if path is not None else None
+    lpath = (path, "p") if path is not None else None
     # .'|'.1.p
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.1.p]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <p> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.1.p]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <p> [.'|'.1]", lpath))
         return False
     return True
 
@@ -128,48 +141,48 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.2]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.2.t
     res = isinstance(pval, int) and not isinstance(pval, bool)
     if res:
         # .'|'.2.t.'|'.0
         res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 1
         if not res:
-            rep is None or rep.append(("unexpected =1 [.'|'.2.t.'|'.0]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected =1 [.'|'.2.t.'|'.0]", lpath))
             # .'|'.2.t.'|'.1
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 3
             if not res:
-                rep is None or rep.append(("unexpected =3 [.'|'.2.t.'|'.1]", lpath if path is not None else None))
+                rep is None or rep.append(("unexpected =3 [.'|'.2.t.'|'.1]", lpath))
                 # .'|'.2.t.'|'.2
                 res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 5
                 if not res:
-                    rep is None or rep.append(("unexpected =5 [.'|'.2.t.'|'.2]", lpath if path is not None else None))
+                    rep is None or rep.append(("unexpected =5 [.'|'.2.t.'|'.2]", lpath))
                     # .'|'.2.t.'|'.3
                     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 7
                     if not res:
-                        rep is None or rep.append(("unexpected =7 [.'|'.2.t.'|'.3]", lpath if path is not None else None))
+                        rep is None or rep.append(("unexpected =7 [.'|'.2.t.'|'.3]", lpath))
                         # .'|'.2.t.'|'.4
                         res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 9
                         if not res:
-                            rep is None or rep.append(("unexpected =9 [.'|'.2.t.'|'.4]", lpath if path is not None else None))
+                            rep is None or rep.append(("unexpected =9 [.'|'.2.t.'|'.4]", lpath))
         if res:
             rep is None or rep.clear()
         else:
-            rep is None or rep.append(("no model matched [.'|'.2.t.'|']", lpath if path is not None else None))
+            rep is None or rep.append(("no model matched [.'|'.2.t.'|']", lpath))
     else:
-        rep is None or rep.append(("unexpected type [.'|'.2.t.'|']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected type [.'|'.2.t.'|']", lpath))
     if not res:
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.2]", lpath))
         return False
     if not ((pval := val.get("i", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <i> [.'|'.2]", path))
         return False
-    lpath = (path + [ "i" ]) if path is not None else None
+    lpath = (path, "i") if path is not None else None
     # .'|'.2.i
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.2.i]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <i> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.2.i]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <i> [.'|'.2]", lpath))
         return False
     return True
 
@@ -188,22 +201,22 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.3]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.3.t
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval == 10
     if not res:
-        rep is None or rep.append(("unexpected =10 [.'|'.3.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected =10 [.'|'.3.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.3]", lpath))
         return False
     if not ((pval := val.get("d", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <d> [.'|'.3]", path))
         return False
-    lpath = (path + [ "d" ]) if path is not None else None
+    lpath = (path, "d") if path is not None else None
     # .'|'.3.d
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'|'.3.d]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.3]", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'|'.3.d]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <d> [.'|'.3]", lpath))
         return False
     return True
 
@@ -264,5 +277,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
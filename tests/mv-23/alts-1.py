@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 _jm_map_0: dict[str, str]
@@ -39,22 +52,22 @@ def json_model_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'$oA']", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'$oA'.v
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'$oA'.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'$oA']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'$oA'.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'$oA']", lpath))
         return False
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'$oA']", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'$oA'.t
     res = isinstance(pval, str) and pval == "a"
     if not res:
-        rep is None or rep.append(("unexpected _a [.'$oA'.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$oA']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _a [.'$oA'.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$oA']", lpath))
         return False
     return True
 
@@ -72,22 +85,22 @@ def json_model_3(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'$oB']", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'$oB'.v
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'$oB'.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'$oB']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'$oB'.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'$oB']", lpath))
         return False
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'$oB']", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'$oB'.t
     res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_0
     if not res:
-        rep is None or rep.append(("value not in enum [.'$oB'.t.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$oB']", lpath if path is not None else None))
+        rep is None or rep.append(("value not in enum [.'$oB'.t.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$oB']", lpath))
         return False
     return True
 
@@ -127,22 +140,22 @@ def json_model_5(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'$oL']", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'$oL'.v
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'$oL'.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'$oL']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'$oL'.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'$oL']", lpath))
         return False
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'$oL']", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'$oL'.t
     res = isinstance(pval, str) and pval == "d"
     if not res:
-        rep is None or rep.append(("unexpected _d [.'$oL'.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$oL']", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _d [.'$oL'.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$oL']", lpath))
         return False
     return True
 
@@ -160,22 +173,22 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("v", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <v> [.'$oX']", path))
         return False
-    lpath = (path + [ "v" ]) if path is not None else None
+    lpath = (path, "v") if path is not None else None
     # .'$oX'.v
     res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
     if not res:
-        rep is None or rep.append(("not a 1 strict int [.'$oX'.v]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'$oX']", lpath if path is not None else None))
+        rep is None or rep.append(("not a 1 strict int [.'$oX'.v]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <v> [.'$oX']", lpath))
         return False
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'$oX']", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'$oX'.t
     res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_1
     if not res:
-        rep is None or rep.append(("value not in enum [.'$oX'.t.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$oX']", lpath if path is not None else None))
+        rep is None or rep.append(("value not in enum [.'$oX'.t.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'$oX']", lpath))
         return False
     return True
 
@@ -245,5 +258,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 _jm_map_0: dict[str, str]
@@ -39,12 +52,12 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.0]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.0.t
     res = isinstance(pval, str) and pval == "a"
     if not res:
-        rep is None or rep.append(("unexpected a [.'|'.0.t]", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected a [.'|'.0.t]", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.0]", lpath))
         return False
     return True
 
@@ -64,12 +77,12 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.1]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.1.t
     res = ((pval is None or isinstance(pval, (bool, int, float, str)))) and pval in _jm_cst_0
     if not res:
-        rep is None or rep.append(("value not in enum [.'|'.1.t.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("value not in enum [.'|'.1.t.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.1]", lpath))
         return False
     return True
 
@@ -88,7 +101,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("t", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <t> [.'|'.2]", path))
         return False
-    lpath = (path + [ "t" ]) if path is not None else None
+    lpath = (path, "t") if path is not None else None
     # .'|'.2.t
     # generic xor list
     xc_0: int = 0
@@ -97,33 +110,33 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     if xr_0:
         xc_0 += 1
     else:
-        rep is None or rep.append(("unexpected string [.'|'.2.t.'^'.0]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected string [.'|'.2.t.'^'.0]", lpath))
     # .'|'.2.t.'^'.1
     xr_0 = isinstance(pval, str) and pval == "a"
     if xr_0:
         xc_0 += 1
     else:
-        rep is None or rep.append(("unexpected _a [.'|'.2.t.'^'.1]", lpath if path is not None else None))
+        rep is None or rep.append(("unexpected _a [.'|'.2.t.'^'.1]", lpath))
     if xc_0 <= 1:
         # .'|'.2.t.'^'.2
         xr_0 = isinstance(pval, str) and pval == "b"
         if xr_0:
             xc_0 += 1
         else:
-            rep is None or rep.append(("unexpected _b [.'|'.2.t.'^'.2]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _b [.'|'.2.t.'^'.2]", lpath))
     if xc_0 <= 1:
         # .'|'.2.t.'^'.3
         xr_0 = isinstance(pval, str) and pval == "c"
         if xr_0:
             xc_0 += 1
         else:
-            rep is None or rep.append(("unexpected _c [.'|'.2.t.'^'.3]", lpath if path is not None else None))
+            rep is None or rep.append(("unexpected _c [.'|'.2.t.'^'.3]", lpath))
     res = xc_0 == 1
     if res:
         rep is None or rep.clear()
     else:
-        rep is None or rep.append(("not one model match [.'|'.2.t.'^']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.2]", lpath if path is not None else None))
+        rep is None or rep.append(("not one model match [.'|'.2.t.'^']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <t> [.'|'.2]", lpath))
         return False
     return True
 
@@ -186,5 +199,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
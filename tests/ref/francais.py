@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 _jm_re_0_reco: object
@@ -96,11 +109,11 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$Model#Array'.0
-            res = json_model_20(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_20(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CModel [.'$Model#Array'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $CModel [.'$Model#Array'.0]", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Model#Array']", path))
@@ -335,29 +348,29 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Element'.'|'.5.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.5.'#']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.5.'#']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.5.'#']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.5.'#']", lpath_0))
                 return False
             continue
-        if json_model_28(prop, lpath_0 if path is not None else None, rep):
+        if json_model_28(prop, lpath_0, rep):
             # handle 1 key props
             # .'$Model#Element'.'|'.5.'$Prop'
-            res = json_model_35(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.5.'$Prop']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.5.'$Prop']", lpath_0))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Element'.'|'.5.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.5]", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.5]", lpath_0))
             return False
     return True
 
@@ -369,7 +382,7 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "+":
             # handle must + property
             must_count += 1
@@ -377,15 +390,15 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_1_idx, arr_1_item in enumerate(pval):
-                    arr_1_lpath: Path = ((lpath_1 if path is not None else None) + [ arr_1_idx ]) if (lpath_1 if path is not None else None) is not None else None
+                    arr_1_lpath: Path = (lpath_1, arr_1_idx) if lpath_1 is not None else None
                     # .'$Model#Element'.'|'.4.'+'.0
-                    res = json_model_20(arr_1_item, arr_1_lpath if (lpath_1 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_1_item, arr_1_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.4.'+'.0]", arr_1_lpath if (lpath_1 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.4.'+'.0]", arr_1_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.4.'+']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.4.'+']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.4.'+']", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.4.'+']", lpath_1))
                 return False
             continue
         if prop == "#":
@@ -393,8 +406,8 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.4.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.4.'#']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.4.'#']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.4.'#']", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.4.'#']", lpath_1))
                 return False
             continue
         if prop.startswith("#"):
@@ -402,7 +415,7 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.4.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.4]", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.4]", lpath_1))
             return False
     if must_count != 1:
         if rep is not None:
@@ -419,7 +432,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "^":
             # handle must ^ property
             must_count += 1
@@ -427,15 +440,15 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_2_idx, arr_2_item in enumerate(pval):
-                    arr_2_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_2_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_2_lpath: Path = (lpath_2, arr_2_idx) if lpath_2 is not None else None
                     # .'$Model#Element'.'|'.3.'^'.0
-                    res = json_model_20(arr_2_item, arr_2_lpath if (lpath_2 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_2_item, arr_2_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.3.'^'.0]", arr_2_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.3.'^'.0]", arr_2_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.3.'^']", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.3.'^']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.3.'^']", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.3.'^']", lpath_2))
                 return False
             continue
         if prop == "#":
@@ -443,8 +456,8 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.3.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.3.'#']", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.3.'#']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.3.'#']", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.3.'#']", lpath_2))
                 return False
             continue
         if prop.startswith("#"):
@@ -452,7 +465,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.3.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.3]", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.3]", lpath_2))
             return False
     if must_count != 1:
         if rep is not None:
@@ -469,7 +482,7 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "&":
             # handle must & property
             must_count += 1
@@ -477,15 +490,15 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_3_idx, arr_3_item in enumerate(pval):
-                    arr_3_lpath: Path = ((lpath_3 if path is not None else None) + [ arr_3_idx ]) if (lpath_3 if path is not None else None) is not None else None
+                    arr_3_lpath: Path = (lpath_3, arr_3_idx) if lpath_3 is not None else None
                     # .'$Model#Element'.'|'.2.'&'.0
-                    res = json_model_20(arr_3_item, arr_3_lpath if (lpath_3 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_3_item, arr_3_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.2.'&'.0]", arr_3_lpath if (lpath_3 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.2.'&'.0]", arr_3_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.2.'&']", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.2.'&']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.2.'&']", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.2.'&']", lpath_3))
                 return False
             continue
         if prop == "#":
@@ -493,8 +506,8 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.2.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.2.'#']", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.2.'#']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.2.'#']", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.2.'#']", lpath_3))
                 return False
             continue
         if prop.startswith("#"):
@@ -502,7 +515,7 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.2.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.2]", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.2]", lpath_3))
             return False
     if must_count != 1:
         if rep is not None:
@@ -519,7 +532,7 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "|":
             # handle must | property
             must_count += 1
@@ -527,15 +540,15 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_4_idx, arr_4_item in enumerate(pval):
-                    arr_4_lpath: Path = ((lpath_4 if path is not None else None) + [ arr_4_idx ]) if (lpath_4 if path is not None else None) is not None else None
+                    arr_4_lpath: Path = (lpath_4, arr_4_idx) if lpath_4 is not None else None
                     # .'$Model#Element'.'|'.1.'|'.0
-                    res = json_model_20(arr_4_item, arr_4_lpath if (lpath_4 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_4_item, arr_4_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.1.'|'.0]", arr_4_lpath if (lpath_4 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.1.'|'.0]", arr_4_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.1.'|']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.1.'|']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.1.'|']", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.1.'|']", lpath_4))
                 return False
             continue
         if prop == "#":
@@ -543,8 +556,8 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.1.'#']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.1.'#']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.1.'#']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.1.'#']", lpath_4))
                 return False
             continue
         if prop.startswith("#"):
@@ -552,7 +565,7 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.1]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.1]", lpath_4))
             return False
     if must_count != 1:
         if rep is not None:
@@ -571,15 +584,15 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$Model#Element'.'|'.0.'@'
-            res = json_model_35(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.0.'@']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.0.'@']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.0.'@']", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.0.'@']", lpath_5))
                 return False
             continue
         if prop == "!":
@@ -587,8 +600,8 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.0.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Model#Element'.'|'.0.'!']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'!']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Model#Element'.'|'.0.'!']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'!']", lpath_5))
                 return False
             continue
         elif prop == "#":
@@ -596,8 +609,8 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.0.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.0.'#']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'#']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.0.'#']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'#']", lpath_5))
                 return False
             continue
         if prop.startswith("#"):
@@ -607,19 +620,19 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_3(prop, path, rep):
             # handle 3 re props
             # .'$Model#Element'.'|'.0.'/^(<=|>=|<|>)$/'
-            res = json_model_14(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_14(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_5))
                 return False
         elif _jm_re_4(prop, path, rep):
             # handle 3 re props
             # .'$Model#Element'.'|'.0.'/^(=|!=)$/'
-            res = json_model_15(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Model#Element'.'|'.0.'/^(=|!=)$/']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Model#Element'.'|'.0.'/^(=|!=)$/']", lpath_5))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.0]", lpath_5 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.0]", lpath_5))
             return False
     if must_count != 1:
         if rep is not None:
@@ -759,14 +772,14 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.5.'$'.''
-            res = json_model_4(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.5.'$'.'']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.5.'$'.'']", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'']", lpath_7))
                 return False
             continue
         elif prop == "#":
@@ -774,23 +787,23 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.5.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'$'.'#']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'#']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'$'.'#']", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'#']", lpath_7))
                 return False
             continue
-        if json_model_6(prop, lpath_7 if path is not None else None, rep):
+        if json_model_6(prop, lpath_7, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.5.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.5.'$'.'$Identifier']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.5.'$'.'$Identifier']", lpath_7))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.5.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5.'$']", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5.'$']", lpath_7))
             return False
     return True
 
@@ -803,49 +816,49 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.5.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'%'.'#']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'#']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'%'.'#']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'#']", lpath_8))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.5.'%'.'<'
             # .'$Model#Root'.'|'.5.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.5.'%'.'<'.'|'.0]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.5.'%'.'<'.'|'.0]", lpath_8))
                 # .'$Model#Root'.'|'.5.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_5_idx, arr_5_item in enumerate(pval):
-                        arr_5_lpath: Path = ((lpath_8 if path is not None else None) + [ arr_5_idx ]) if (lpath_8 if path is not None else None) is not None else None
+                        arr_5_lpath: Path = (lpath_8, arr_5_idx) if lpath_8 is not None else None
                         # .'$Model#Root'.'|'.5.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_5_item, arr_5_lpath if (lpath_8 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_5_item, arr_5_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.5.'%'.'<'.'|'.1.0]", arr_5_lpath if (lpath_8 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.5.'%'.'<'.'|'.1.0]", arr_5_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.5.'%'.'<'.'|'.1]", lpath_8 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.5.'%'.'<'.'|'.1]", lpath_8))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.5.'%'.'<'.'|']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'<']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.5.'%'.'<'.'|']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'<']", lpath_8))
                 return False
             continue
-        if json_model_13(prop, lpath_8 if path is not None else None, rep):
+        if json_model_13(prop, lpath_8, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.5.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_8 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.5.'%'.'$Name']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.5.'%'.'$Name']", lpath_8))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -854,12 +867,12 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.5.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.5.'%'.'/^\\\\$.*$/']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.5.'%'.'/^\\\\$.*$/']", lpath_8))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5.'%']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5.'%']", lpath_8))
             return False
     return True
 
@@ -870,56 +883,56 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.5.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'#']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'#']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'#']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'#']", lpath_6))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.5.'$'
-            res = _jm_obj_7(pval, lpath_6 if path is not None else None, rep)
+            res = _jm_obj_7(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'$']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'$']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$']", lpath_6))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.5.'%'
-            res = _jm_obj_8(pval, lpath_6 if path is not None else None, rep)
+            res = _jm_obj_8(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'%']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'%']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%']", lpath_6))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.5.'~'
-            res = json_model_4(pval, lpath_6 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.5.'~']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'~']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.5.'~']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'~']", lpath_6))
                 return False
             continue
-        if json_model_28(prop, lpath_6 if path is not None else None, rep):
+        if json_model_28(prop, lpath_6, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.5.'$Prop'
-            res = json_model_35(pval, lpath_6 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.5.'$Prop']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.5.'$Prop']", lpath_6))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.5.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5]", lpath_6 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5]", lpath_6))
             return False
     return True
 
@@ -930,14 +943,14 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.4.'$'.''
-            res = json_model_4(pval, lpath_10 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'$'.'']", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'$'.'']", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'']", lpath_10))
                 return False
             continue
         elif prop == "#":
@@ -945,23 +958,23 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.4.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'$'.'#']", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'#']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'$'.'#']", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'#']", lpath_10))
                 return False
             continue
-        if json_model_6(prop, lpath_10 if path is not None else None, rep):
+        if json_model_6(prop, lpath_10, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.4.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_10 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.4.'$'.'$Identifier']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.4.'$'.'$Identifier']", lpath_10))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.4.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'$']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'$']", lpath_10))
             return False
     return True
 
@@ -972,49 +985,49 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.4.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'%'.'#']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'#']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'%'.'#']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'#']", lpath_11))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.4.'%'.'<'
             # .'$Model#Root'.'|'.4.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.0]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.0]", lpath_11))
                 # .'$Model#Root'.'|'.4.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_7_idx, arr_7_item in enumerate(pval):
-                        arr_7_lpath: Path = ((lpath_11 if path is not None else None) + [ arr_7_idx ]) if (lpath_11 if path is not None else None) is not None else None
+                        arr_7_lpath: Path = (lpath_11, arr_7_idx) if lpath_11 is not None else None
                         # .'$Model#Root'.'|'.4.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_7_item, arr_7_lpath if (lpath_11 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_7_item, arr_7_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1.0]", arr_7_lpath if (lpath_11 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1.0]", arr_7_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1]", lpath_11 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1]", lpath_11))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.4.'%'.'<'.'|']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'<']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.4.'%'.'<'.'|']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'<']", lpath_11))
                 return False
             continue
-        if json_model_13(prop, lpath_11 if path is not None else None, rep):
+        if json_model_13(prop, lpath_11, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.4.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_11 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.4.'%'.'$Name']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.4.'%'.'$Name']", lpath_11))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1023,12 +1036,12 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.4.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.4.'%'.'/^\\\\$.*$/']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.4.'%'.'/^\\\\$.*$/']", lpath_11))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'%']", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'%']", lpath_11))
             return False
     return True
 
@@ -1040,7 +1053,7 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "+":
             # handle must + property
             must_count += 1
@@ -1048,15 +1061,15 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_6_idx, arr_6_item in enumerate(pval):
-                    arr_6_lpath: Path = ((lpath_9 if path is not None else None) + [ arr_6_idx ]) if (lpath_9 if path is not None else None) is not None else None
+                    arr_6_lpath: Path = (lpath_9, arr_6_idx) if lpath_9 is not None else None
                     # .'$Model#Root'.'|'.4.'+'.0
-                    res = json_model_20(arr_6_item, arr_6_lpath if (lpath_9 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_6_item, arr_6_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.4.'+'.0]", arr_6_lpath if (lpath_9 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.4.'+'.0]", arr_6_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'+']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.4.'+']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'+']", lpath_9))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.4.'+']", lpath_9))
                 return False
             continue
         if prop == "#":
@@ -1064,35 +1077,35 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.4.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'#']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'#']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'#']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'#']", lpath_9))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.4.'$'
-            res = _jm_obj_10(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_10(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'$']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'$']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$']", lpath_9))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.4.'%'
-            res = _jm_obj_11(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_11(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'%']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'%']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%']", lpath_9))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.4.'~'
-            res = json_model_4(pval, lpath_9 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'~']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'~']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'~']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'~']", lpath_9))
                 return False
             continue
         if prop.startswith("#"):
@@ -1100,7 +1113,7 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.4.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4]", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4]", lpath_9))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1116,14 +1129,14 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.3.'$'.''
-            res = json_model_4(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'$'.'']", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'$'.'']", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'']", lpath_13))
                 return False
             continue
         elif prop == "#":
@@ -1131,23 +1144,23 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.3.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'$'.'#']", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'#']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'$'.'#']", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'#']", lpath_13))
                 return False
             continue
-        if json_model_6(prop, lpath_13 if path is not None else None, rep):
+        if json_model_6(prop, lpath_13, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.3.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.3.'$'.'$Identifier']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.3.'$'.'$Identifier']", lpath_13))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.3.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'$']", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'$']", lpath_13))
             return False
     return True
 
@@ -1158,49 +1171,49 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.3.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'%'.'#']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'#']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'%'.'#']", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'#']", lpath_14))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.3.'%'.'<'
             # .'$Model#Root'.'|'.3.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_14 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.0]", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.0]", lpath_14))
                 # .'$Model#Root'.'|'.3.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_9_idx, arr_9_item in enumerate(pval):
-                        arr_9_lpath: Path = ((lpath_14 if path is not None else None) + [ arr_9_idx ]) if (lpath_14 if path is not None else None) is not None else None
+                        arr_9_lpath: Path = (lpath_14, arr_9_idx) if lpath_14 is not None else None
                         # .'$Model#Root'.'|'.3.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_9_item, arr_9_lpath if (lpath_14 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_9_item, arr_9_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1.0]", arr_9_lpath if (lpath_14 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1.0]", arr_9_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1]", lpath_14 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1]", lpath_14))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.3.'%'.'<'.'|']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'<']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.3.'%'.'<'.'|']", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'<']", lpath_14))
                 return False
             continue
-        if json_model_13(prop, lpath_14 if path is not None else None, rep):
+        if json_model_13(prop, lpath_14, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.3.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_14 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.3.'%'.'$Name']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.3.'%'.'$Name']", lpath_14))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1209,12 +1222,12 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.3.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_14 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.3.'%'.'/^\\\\$.*$/']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.3.'%'.'/^\\\\$.*$/']", lpath_14))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'%']", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'%']", lpath_14))
             return False
     return True
 
@@ -1226,7 +1239,7 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         if prop == "^":
             # handle must ^ property
             must_count += 1
@@ -1234,15 +1247,15 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_8_idx, arr_8_item in enumerate(pval):
-                    arr_8_lpath: Path = ((lpath_12 if path is not None else None) + [ arr_8_idx ]) if (lpath_12 if path is not None else None) is not None else None
+                    arr_8_lpath: Path = (lpath_12, arr_8_idx) if lpath_12 is not None else None
                     # .'$Model#Root'.'|'.3.'^'.0
-                    res = json_model_20(arr_8_item, arr_8_lpath if (lpath_12 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_8_item, arr_8_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.3.'^'.0]", arr_8_lpath if (lpath_12 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.3.'^'.0]", arr_8_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'^']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.3.'^']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'^']", lpath_12))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.3.'^']", lpath_12))
                 return False
             continue
         if prop == "#":
@@ -1250,35 +1263,35 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.3.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'#']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'#']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'#']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'#']", lpath_12))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.3.'$'
-            res = _jm_obj_13(pval, lpath_12 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'$']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'$']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$']", lpath_12))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.3.'%'
-            res = _jm_obj_14(pval, lpath_12 if path is not None else None, rep)
+            res = _jm_obj_14(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'%']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'%']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%']", lpath_12))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.3.'~'
-            res = json_model_4(pval, lpath_12 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'~']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'~']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'~']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'~']", lpath_12))
                 return False
             continue
         if prop.startswith("#"):
@@ -1286,7 +1299,7 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.3.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3]", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3]", lpath_12))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1302,14 +1315,14 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.2.'$'.''
-            res = json_model_4(pval, lpath_16 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'$'.'']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'$'.'']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'']", lpath_16))
                 return False
             continue
         elif prop == "#":
@@ -1317,23 +1330,23 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.2.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'$'.'#']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'#']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'$'.'#']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'#']", lpath_16))
                 return False
             continue
-        if json_model_6(prop, lpath_16 if path is not None else None, rep):
+        if json_model_6(prop, lpath_16, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.2.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_16 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.2.'$'.'$Identifier']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.2.'$'.'$Identifier']", lpath_16))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.2.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'$']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'$']", lpath_16))
             return False
     return True
 
@@ -1344,49 +1357,49 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.2.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'%'.'#']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'#']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'%'.'#']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'#']", lpath_17))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.2.'%'.'<'
             # .'$Model#Root'.'|'.2.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.0]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.0]", lpath_17))
                 # .'$Model#Root'.'|'.2.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_11_idx, arr_11_item in enumerate(pval):
-                        arr_11_lpath: Path = ((lpath_17 if path is not None else None) + [ arr_11_idx ]) if (lpath_17 if path is not None else None) is not None else None
+                        arr_11_lpath: Path = (lpath_17, arr_11_idx) if lpath_17 is not None else None
                         # .'$Model#Root'.'|'.2.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_11_item, arr_11_lpath if (lpath_17 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_11_item, arr_11_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1.0]", arr_11_lpath if (lpath_17 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1.0]", arr_11_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1]", lpath_17 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1]", lpath_17))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.2.'%'.'<'.'|']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'<']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.2.'%'.'<'.'|']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'<']", lpath_17))
                 return False
             continue
-        if json_model_13(prop, lpath_17 if path is not None else None, rep):
+        if json_model_13(prop, lpath_17, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.2.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_17 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.2.'%'.'$Name']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.2.'%'.'$Name']", lpath_17))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1395,12 +1408,12 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.2.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.2.'%'.'/^\\\\$.*$/']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.2.'%'.'/^\\\\$.*$/']", lpath_17))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'%']", lpath_17 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'%']", lpath_17))
             return False
     return True
 
@@ -1412,7 +1425,7 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         if prop == "&":
             # handle must & property
             must_count += 1
@@ -1420,15 +1433,15 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_10_idx, arr_10_item in enumerate(pval):
-                    arr_10_lpath: Path = ((lpath_15 if path is not None else None) + [ arr_10_idx ]) if (lpath_15 if path is not None else None) is not None else None
+                    arr_10_lpath: Path = (lpath_15, arr_10_idx) if lpath_15 is not None else None
                     # .'$Model#Root'.'|'.2.'&'.0
-                    res = json_model_20(arr_10_item, arr_10_lpath if (lpath_15 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_10_item, arr_10_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.2.'&'.0]", arr_10_lpath if (lpath_15 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.2.'&'.0]", arr_10_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'&']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.2.'&']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'&']", lpath_15))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.2.'&']", lpath_15))
                 return False
             continue
         if prop == "#":
@@ -1436,35 +1449,35 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.2.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'#']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'#']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'#']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'#']", lpath_15))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.2.'$'
-            res = _jm_obj_16(pval, lpath_15 if path is not None else None, rep)
+            res = _jm_obj_16(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'$']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'$']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$']", lpath_15))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.2.'%'
-            res = _jm_obj_17(pval, lpath_15 if path is not None else None, rep)
+            res = _jm_obj_17(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'%']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'%']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%']", lpath_15))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.2.'~'
-            res = json_model_4(pval, lpath_15 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'~']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'~']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'~']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'~']", lpath_15))
                 return False
             continue
         if prop.startswith("#"):
@@ -1472,7 +1485,7 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.2.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2]", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2]", lpath_15))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1488,14 +1501,14 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.1.'$'.''
-            res = json_model_4(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'$'.'']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'$'.'']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'']", lpath_19))
                 return False
             continue
         elif prop == "#":
@@ -1503,23 +1516,23 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.1.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'$'.'#']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'#']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'$'.'#']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'#']", lpath_19))
                 return False
             continue
-        if json_model_6(prop, lpath_19 if path is not None else None, rep):
+        if json_model_6(prop, lpath_19, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.1.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.1.'$'.'$Identifier']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.1.'$'.'$Identifier']", lpath_19))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.1.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'$']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'$']", lpath_19))
             return False
     return True
 
@@ -1530,49 +1543,49 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.1.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'%'.'#']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'#']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'%'.'#']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'#']", lpath_20))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.1.'%'.'<'
             # .'$Model#Root'.'|'.1.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_20 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.0]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.0]", lpath_20))
                 # .'$Model#Root'.'|'.1.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_13_idx, arr_13_item in enumerate(pval):
-                        arr_13_lpath: Path = ((lpath_20 if path is not None else None) + [ arr_13_idx ]) if (lpath_20 if path is not None else None) is not None else None
+                        arr_13_lpath: Path = (lpath_20, arr_13_idx) if lpath_20 is not None else None
                         # .'$Model#Root'.'|'.1.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_13_item, arr_13_lpath if (lpath_20 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_13_item, arr_13_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1.0]", arr_13_lpath if (lpath_20 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1.0]", arr_13_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1]", lpath_20 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1]", lpath_20))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.1.'%'.'<'.'|']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'<']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.1.'%'.'<'.'|']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'<']", lpath_20))
                 return False
             continue
-        if json_model_13(prop, lpath_20 if path is not None else None, rep):
+        if json_model_13(prop, lpath_20, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.1.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_20 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.1.'%'.'$Name']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.1.'%'.'$Name']", lpath_20))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1581,12 +1594,12 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.1.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_20 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.1.'%'.'/^\\\\$.*$/']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.1.'%'.'/^\\\\$.*$/']", lpath_20))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'%']", lpath_20 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'%']", lpath_20))
             return False
     return True
 
@@ -1598,7 +1611,7 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         if prop == "|":
             # handle must | property
             must_count += 1
@@ -1606,15 +1619,15 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_12_idx, arr_12_item in enumerate(pval):
-                    arr_12_lpath: Path = ((lpath_18 if path is not None else None) + [ arr_12_idx ]) if (lpath_18 if path is not None else None) is not None else None
+                    arr_12_lpath: Path = (lpath_18, arr_12_idx) if lpath_18 is not None else None
                     # .'$Model#Root'.'|'.1.'|'.0
-                    res = json_model_20(arr_12_item, arr_12_lpath if (lpath_18 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_12_item, arr_12_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.1.'|'.0]", arr_12_lpath if (lpath_18 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.1.'|'.0]", arr_12_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'|']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.1.'|']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'|']", lpath_18))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.1.'|']", lpath_18))
                 return False
             continue
         if prop == "#":
@@ -1622,35 +1635,35 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'#']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'#']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'#']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'#']", lpath_18))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.1.'$'
-            res = _jm_obj_19(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_19(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'$']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'$']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$']", lpath_18))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.1.'%'
-            res = _jm_obj_20(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_20(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'%']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'%']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%']", lpath_18))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.1.'~'
-            res = json_model_4(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'~']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'~']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'~']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'~']", lpath_18))
                 return False
             continue
         if prop.startswith("#"):
@@ -1658,7 +1671,7 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1]", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1]", lpath_18))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1674,14 +1687,14 @@ def _jm_obj_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
+        lpath_22: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.0.'$'.''
-            res = json_model_4(pval, lpath_22 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'$'.'']", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'$'.'']", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'']", lpath_22))
                 return False
             continue
         elif prop == "#":
@@ -1689,23 +1702,23 @@ def _jm_obj_22(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'$'.'#']", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'#']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'$'.'#']", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'#']", lpath_22))
                 return False
             continue
-        if json_model_6(prop, lpath_22 if path is not None else None, rep):
+        if json_model_6(prop, lpath_22, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.0.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_22 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'$'.'$Identifier']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'$'.'$Identifier']", lpath_22))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.0.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'$']", lpath_22 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'$']", lpath_22))
             return False
     return True
 
@@ -1716,49 +1729,49 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.0.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'%'.'#']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'#']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'%'.'#']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'#']", lpath_23))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.0.'%'.'<'
             # .'$Model#Root'.'|'.0.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_23 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.0]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.0]", lpath_23))
                 # .'$Model#Root'.'|'.0.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_14_idx, arr_14_item in enumerate(pval):
-                        arr_14_lpath: Path = ((lpath_23 if path is not None else None) + [ arr_14_idx ]) if (lpath_23 if path is not None else None) is not None else None
+                        arr_14_lpath: Path = (lpath_23, arr_14_idx) if lpath_23 is not None else None
                         # .'$Model#Root'.'|'.0.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_14_item, arr_14_lpath if (lpath_23 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_14_item, arr_14_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1.0]", arr_14_lpath if (lpath_23 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1.0]", arr_14_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1]", lpath_23 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1]", lpath_23))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.0.'%'.'<'.'|']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'<']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.0.'%'.'<'.'|']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'<']", lpath_23))
                 return False
             continue
-        if json_model_13(prop, lpath_23 if path is not None else None, rep):
+        if json_model_13(prop, lpath_23, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.0.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_23 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.0.'%'.'$Name']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.0.'%'.'$Name']", lpath_23))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1767,12 +1780,12 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.0.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_23 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.0.'%'.'/^\\\\$.*$/']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.0.'%'.'/^\\\\$.*$/']", lpath_23))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'%']", lpath_23 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'%']", lpath_23))
             return False
     return True
 
@@ -1784,15 +1797,15 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$Model#Root'.'|'.0.'@'
-            res = json_model_35(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'@']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.0.'@']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'@']", lpath_21))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.0.'@']", lpath_21))
                 return False
             continue
         if prop == "!":
@@ -1800,8 +1813,8 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Model#Root'.'|'.0.'!']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'!']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Model#Root'.'|'.0.'!']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'!']", lpath_21))
                 return False
             continue
         elif prop == "#":
@@ -1809,35 +1822,35 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'#']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'#']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'#']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'#']", lpath_21))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.0.'$'
-            res = _jm_obj_22(pval, lpath_21 if path is not None else None, rep)
+            res = _jm_obj_22(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'$']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'$']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$']", lpath_21))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.0.'%'
-            res = _jm_obj_23(pval, lpath_21 if path is not None else None, rep)
+            res = _jm_obj_23(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'%']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'%']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%']", lpath_21))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.0.'~'
-            res = json_model_4(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'~']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'~']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'~']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'~']", lpath_21))
                 return False
             continue
         if prop.startswith("#"):
@@ -1847,19 +1860,19 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_3(prop, path, rep):
             # handle 3 re props
             # .'$Model#Root'.'|'.0.'/^(<=|>=|<|>)$/'
-            res = json_model_14(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_14(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Root'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Root'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_21))
                 return False
         elif _jm_re_4(prop, path, rep):
             # handle 3 re props
             # .'$Model#Root'.'|'.0.'/^(=|!=)$/'
-            res = json_model_15(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Model#Root'.'|'.0.'/^(=|!=)$/']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Model#Root'.'|'.0.'/^(=|!=)$/']", lpath_21))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0]", lpath_21 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0]", lpath_21))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1946,12 +1959,12 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Model#Transformation'.'|'.1.'~'.''
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$Model#Transformation'.'|'.1.'~'.'']", lpath_25 if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$Model#Transformation'.'|'.1.'~'.'']", lpath_25))
             return False
     return True
 
@@ -1962,14 +1975,14 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Transformation'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Transformation'.'|'.1.'#']", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'#']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Transformation'.'|'.1.'#']", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'#']", lpath_24))
                 return False
             continue
         elif prop == "*":
@@ -1981,27 +1994,27 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # handle may / property
             # .'$Model#Transformation'.'|'.1.'/'
             # .'$Model#Transformation'.'|'.1.'/'.'|'.0
-            res = json_model_15(pval, lpath_24 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_24, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Model#Transformation'.'|'.1.'/'.'|'.0]", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Model#Transformation'.'|'.1.'/'.'|'.0]", lpath_24))
                 # .'$Model#Transformation'.'|'.1.'/'.'|'.1
                 res = isinstance(pval, list)
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Transformation'.'|'.1.'/'.'|'.1]", lpath_24 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Transformation'.'|'.1.'/'.'|'.1]", lpath_24))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Transformation'.'|'.1.'/'.'|']", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'/']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Transformation'.'|'.1.'/'.'|']", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'/']", lpath_24))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Transformation'.'|'.1.'~'
-            res = _jm_obj_25(pval, lpath_24 if path is not None else None, rep)
+            res = _jm_obj_25(pval, lpath_24, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Transformation'.'|'.1.'~']", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'~']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Transformation'.'|'.1.'~']", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'~']", lpath_24))
                 return False
             continue
         if prop.startswith("#"):
@@ -2009,7 +2022,7 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Transformation'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Transformation'.'|'.1]", lpath_24 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Transformation'.'|'.1]", lpath_24))
             return False
     return True
 
@@ -2139,5 +2152,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
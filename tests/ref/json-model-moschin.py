@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 _jm_re_0_reco: object
@@ -96,11 +109,11 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$Model#Array'.0
-            res = json_model_20(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_20(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CModel [.'$Model#Array'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $CModel [.'$Model#Array'.0]", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Model#Array']", path))
@@ -343,38 +356,38 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Element'.'|'.5.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.5.'#']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.5.'#']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.5.'#']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.5.'#']", lpath_0))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Element'.'|'.5.'.schema'
-            res = _jm_obj_1(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_1(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.5.'.schema']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.5.'.schema']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.5.'.schema']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.5.'.schema']", lpath_0))
                 return False
             continue
-        if json_model_28(prop, lpath_0 if path is not None else None, rep):
+        if json_model_28(prop, lpath_0, rep):
             # handle 1 key props
             # .'$Model#Element'.'|'.5.'$Prop'
-            res = json_model_35(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.5.'$Prop']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.5.'$Prop']", lpath_0))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Element'.'|'.5.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.5]", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.5]", lpath_0))
             return False
     return True
 
@@ -394,7 +407,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "+":
             # handle must + property
             must_count += 1
@@ -402,15 +415,15 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_1_idx, arr_1_item in enumerate(pval):
-                    arr_1_lpath: Path = ((lpath_1 if path is not None else None) + [ arr_1_idx ]) if (lpath_1 if path is not None else None) is not None else None
+                    arr_1_lpath: Path = (lpath_1, arr_1_idx) if lpath_1 is not None else None
                     # .'$Model#Element'.'|'.4.'+'.0
-                    res = json_model_20(arr_1_item, arr_1_lpath if (lpath_1 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_1_item, arr_1_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.4.'+'.0]", arr_1_lpath if (lpath_1 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.4.'+'.0]", arr_1_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.4.'+']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.4.'+']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.4.'+']", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.4.'+']", lpath_1))
                 return False
             continue
         if prop == "#":
@@ -418,17 +431,17 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.4.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.4.'#']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.4.'#']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.4.'#']", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.4.'#']", lpath_1))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Element'.'|'.4.'.schema'
-            res = _jm_obj_3(pval, lpath_1 if path is not None else None, rep)
+            res = _jm_obj_3(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.4.'.schema']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.4.'.schema']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.4.'.schema']", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.4.'.schema']", lpath_1))
                 return False
             continue
         if prop.startswith("#"):
@@ -436,7 +449,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.4.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.4]", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.4]", lpath_1))
             return False
     if must_count != 1:
         if rep is not None:
@@ -461,7 +474,7 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "^":
             # handle must ^ property
             must_count += 1
@@ -469,15 +482,15 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_2_idx, arr_2_item in enumerate(pval):
-                    arr_2_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_2_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_2_lpath: Path = (lpath_2, arr_2_idx) if lpath_2 is not None else None
                     # .'$Model#Element'.'|'.3.'^'.0
-                    res = json_model_20(arr_2_item, arr_2_lpath if (lpath_2 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_2_item, arr_2_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.3.'^'.0]", arr_2_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.3.'^'.0]", arr_2_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.3.'^']", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.3.'^']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.3.'^']", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.3.'^']", lpath_2))
                 return False
             continue
         if prop == "#":
@@ -485,17 +498,17 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.3.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.3.'#']", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.3.'#']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.3.'#']", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.3.'#']", lpath_2))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Element'.'|'.3.'.schema'
-            res = _jm_obj_5(pval, lpath_2 if path is not None else None, rep)
+            res = _jm_obj_5(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.3.'.schema']", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.3.'.schema']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.3.'.schema']", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.3.'.schema']", lpath_2))
                 return False
             continue
         if prop.startswith("#"):
@@ -503,7 +516,7 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.3.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.3]", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.3]", lpath_2))
             return False
     if must_count != 1:
         if rep is not None:
@@ -528,7 +541,7 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "&":
             # handle must & property
             must_count += 1
@@ -536,15 +549,15 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_3_idx, arr_3_item in enumerate(pval):
-                    arr_3_lpath: Path = ((lpath_3 if path is not None else None) + [ arr_3_idx ]) if (lpath_3 if path is not None else None) is not None else None
+                    arr_3_lpath: Path = (lpath_3, arr_3_idx) if lpath_3 is not None else None
                     # .'$Model#Element'.'|'.2.'&'.0
-                    res = json_model_20(arr_3_item, arr_3_lpath if (lpath_3 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_3_item, arr_3_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.2.'&'.0]", arr_3_lpath if (lpath_3 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.2.'&'.0]", arr_3_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.2.'&']", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.2.'&']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.2.'&']", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.2.'&']", lpath_3))
                 return False
             continue
         if prop == "#":
@@ -552,17 +565,17 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.2.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.2.'#']", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.2.'#']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.2.'#']", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.2.'#']", lpath_3))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Element'.'|'.2.'.schema'
-            res = _jm_obj_7(pval, lpath_3 if path is not None else None, rep)
+            res = _jm_obj_7(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.2.'.schema']", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.2.'.schema']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.2.'.schema']", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.2.'.schema']", lpath_3))
                 return False
             continue
         if prop.startswith("#"):
@@ -570,7 +583,7 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.2.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.2]", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.2]", lpath_3))
             return False
     if must_count != 1:
         if rep is not None:
@@ -595,7 +608,7 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "|":
             # handle must | property
             must_count += 1
@@ -603,15 +616,15 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_4_idx, arr_4_item in enumerate(pval):
-                    arr_4_lpath: Path = ((lpath_4 if path is not None else None) + [ arr_4_idx ]) if (lpath_4 if path is not None else None) is not None else None
+                    arr_4_lpath: Path = (lpath_4, arr_4_idx) if lpath_4 is not None else None
                     # .'$Model#Element'.'|'.1.'|'.0
-                    res = json_model_20(arr_4_item, arr_4_lpath if (lpath_4 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_4_item, arr_4_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.1.'|'.0]", arr_4_lpath if (lpath_4 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.1.'|'.0]", arr_4_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.1.'|']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.1.'|']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.1.'|']", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.1.'|']", lpath_4))
                 return False
             continue
         if prop == "#":
@@ -619,17 +632,17 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.1.'#']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.1.'#']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.1.'#']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.1.'#']", lpath_4))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Element'.'|'.1.'.schema'
-            res = _jm_obj_9(pval, lpath_4 if path is not None else None, rep)
+            res = _jm_obj_9(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.1.'.schema']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.1.'.schema']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.1.'.schema']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.1.'.schema']", lpath_4))
                 return False
             continue
         if prop.startswith("#"):
@@ -637,7 +650,7 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.1]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.1]", lpath_4))
             return False
     if must_count != 1:
         if rep is not None:
@@ -664,15 +677,15 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$Model#Element'.'|'.0.'@'
-            res = json_model_35(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.0.'@']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.0.'@']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.0.'@']", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.0.'@']", lpath_5))
                 return False
             continue
         if prop == "!":
@@ -680,8 +693,8 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.0.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Model#Element'.'|'.0.'!']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'!']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Model#Element'.'|'.0.'!']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'!']", lpath_5))
                 return False
             continue
         elif prop == "#":
@@ -689,17 +702,17 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.0.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.0.'#']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'#']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.0.'#']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'#']", lpath_5))
                 return False
             continue
         elif prop == ".in":
             # handle may .in property
             # .'$Model#Element'.'|'.0.'.in'
-            res = json_model_35(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.0.'.in']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'.in']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.0.'.in']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'.in']", lpath_5))
                 return False
             continue
         elif prop == ".mo":
@@ -707,17 +720,17 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.0.'.mo'
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
             if not res:
-                rep is None or rep.append(("not a 1 strict int [.'$Model#Element'.'|'.0.'.mo']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'.mo']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not a 1 strict int [.'$Model#Element'.'|'.0.'.mo']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'.mo']", lpath_5))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Element'.'|'.0.'.schema'
-            res = _jm_obj_11(pval, lpath_5 if path is not None else None, rep)
+            res = _jm_obj_11(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.0.'.schema']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'.schema']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Element'.'|'.0.'.schema']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'.schema']", lpath_5))
                 return False
             continue
         if prop.startswith("#"):
@@ -727,19 +740,19 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_3(prop, path, rep):
             # handle 3 re props
             # .'$Model#Element'.'|'.0.'/^(<=|>=|<|>)$/'
-            res = json_model_14(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_14(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_5))
                 return False
         elif _jm_re_4(prop, path, rep):
             # handle 3 re props
             # .'$Model#Element'.'|'.0.'/^(=|!=)$/'
-            res = json_model_15(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Model#Element'.'|'.0.'/^(=|!=)$/']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Model#Element'.'|'.0.'/^(=|!=)$/']", lpath_5))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.0]", lpath_5 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.0]", lpath_5))
             return False
     if must_count != 1:
         if rep is not None:
@@ -887,14 +900,14 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.5.'$'.''
-            res = json_model_4(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.5.'$'.'']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.5.'$'.'']", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'']", lpath_7))
                 return False
             continue
         elif prop == "#":
@@ -902,32 +915,32 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.5.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'$'.'#']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'#']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'$'.'#']", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'#']", lpath_7))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.5.'$'.'.schema'
-            res = _jm_obj_14(pval, lpath_7 if path is not None else None, rep)
+            res = _jm_obj_14(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'$'.'.schema']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'.schema']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'$'.'.schema']", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$'.'.schema']", lpath_7))
                 return False
             continue
-        if json_model_6(prop, lpath_7 if path is not None else None, rep):
+        if json_model_6(prop, lpath_7, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.5.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.5.'$'.'$Identifier']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.5.'$'.'$Identifier']", lpath_7))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.5.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5.'$']", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5.'$']", lpath_7))
             return False
     return True
 
@@ -948,58 +961,58 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.5.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'%'.'#']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'#']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'%'.'#']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'#']", lpath_8))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.5.'%'.'<'
             # .'$Model#Root'.'|'.5.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.5.'%'.'<'.'|'.0]", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.5.'%'.'<'.'|'.0]", lpath_8))
                 # .'$Model#Root'.'|'.5.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_5_idx, arr_5_item in enumerate(pval):
-                        arr_5_lpath: Path = ((lpath_8 if path is not None else None) + [ arr_5_idx ]) if (lpath_8 if path is not None else None) is not None else None
+                        arr_5_lpath: Path = (lpath_8, arr_5_idx) if lpath_8 is not None else None
                         # .'$Model#Root'.'|'.5.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_5_item, arr_5_lpath if (lpath_8 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_5_item, arr_5_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.5.'%'.'<'.'|'.1.0]", arr_5_lpath if (lpath_8 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.5.'%'.'<'.'|'.1.0]", arr_5_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.5.'%'.'<'.'|'.1]", lpath_8 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.5.'%'.'<'.'|'.1]", lpath_8))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.5.'%'.'<'.'|']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'<']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.5.'%'.'<'.'|']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'<']", lpath_8))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.5.'%'.'.schema'
-            res = _jm_obj_16(pval, lpath_8 if path is not None else None, rep)
+            res = _jm_obj_16(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'%'.'.schema']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'.schema']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'%'.'.schema']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%'.'.schema']", lpath_8))
                 return False
             continue
-        if json_model_13(prop, lpath_8 if path is not None else None, rep):
+        if json_model_13(prop, lpath_8, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.5.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_8 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.5.'%'.'$Name']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.5.'%'.'$Name']", lpath_8))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1008,12 +1021,12 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.5.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.5.'%'.'/^\\\\$.*$/']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.5.'%'.'/^\\\\$.*$/']", lpath_8))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5.'%']", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5.'%']", lpath_8))
             return False
     return True
 
@@ -1032,65 +1045,65 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.5.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'#']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'#']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.5.'#']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'#']", lpath_6))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.5.'$'
-            res = _jm_obj_13(pval, lpath_6 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'$']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'$']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'$']", lpath_6))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.5.'%'
-            res = _jm_obj_15(pval, lpath_6 if path is not None else None, rep)
+            res = _jm_obj_15(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'%']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'%']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'%']", lpath_6))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.5.'~'
-            res = json_model_4(pval, lpath_6 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.5.'~']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'~']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.5.'~']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'~']", lpath_6))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.5.'.schema'
-            res = _jm_obj_17(pval, lpath_6 if path is not None else None, rep)
+            res = _jm_obj_17(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'.schema']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'.schema']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.5.'.schema']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.5.'.schema']", lpath_6))
                 return False
             continue
-        if json_model_28(prop, lpath_6 if path is not None else None, rep):
+        if json_model_28(prop, lpath_6, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.5.'$Prop'
-            res = json_model_35(pval, lpath_6 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.5.'$Prop']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.5.'$Prop']", lpath_6))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.5.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5]", lpath_6 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.5]", lpath_6))
             return False
     return True
 
@@ -1109,14 +1122,14 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.4.'$'.''
-            res = json_model_4(pval, lpath_10 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'$'.'']", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'$'.'']", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'']", lpath_10))
                 return False
             continue
         elif prop == "#":
@@ -1124,32 +1137,32 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.4.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'$'.'#']", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'#']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'$'.'#']", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'#']", lpath_10))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.4.'$'.'.schema'
-            res = _jm_obj_20(pval, lpath_10 if path is not None else None, rep)
+            res = _jm_obj_20(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'$'.'.schema']", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'.schema']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'$'.'.schema']", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'.schema']", lpath_10))
                 return False
             continue
-        if json_model_6(prop, lpath_10 if path is not None else None, rep):
+        if json_model_6(prop, lpath_10, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.4.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_10 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.4.'$'.'$Identifier']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.4.'$'.'$Identifier']", lpath_10))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.4.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'$']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'$']", lpath_10))
             return False
     return True
 
@@ -1168,58 +1181,58 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.4.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'%'.'#']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'#']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'%'.'#']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'#']", lpath_11))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.4.'%'.'<'
             # .'$Model#Root'.'|'.4.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.0]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.0]", lpath_11))
                 # .'$Model#Root'.'|'.4.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_7_idx, arr_7_item in enumerate(pval):
-                        arr_7_lpath: Path = ((lpath_11 if path is not None else None) + [ arr_7_idx ]) if (lpath_11 if path is not None else None) is not None else None
+                        arr_7_lpath: Path = (lpath_11, arr_7_idx) if lpath_11 is not None else None
                         # .'$Model#Root'.'|'.4.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_7_item, arr_7_lpath if (lpath_11 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_7_item, arr_7_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1.0]", arr_7_lpath if (lpath_11 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1.0]", arr_7_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1]", lpath_11 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1]", lpath_11))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.4.'%'.'<'.'|']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'<']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.4.'%'.'<'.'|']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'<']", lpath_11))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.4.'%'.'.schema'
-            res = _jm_obj_22(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_22(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'%'.'.schema']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'.schema']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'%'.'.schema']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'.schema']", lpath_11))
                 return False
             continue
-        if json_model_13(prop, lpath_11 if path is not None else None, rep):
+        if json_model_13(prop, lpath_11, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.4.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_11 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.4.'%'.'$Name']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.4.'%'.'$Name']", lpath_11))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1228,12 +1241,12 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.4.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.4.'%'.'/^\\\\$.*$/']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.4.'%'.'/^\\\\$.*$/']", lpath_11))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'%']", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'%']", lpath_11))
             return False
     return True
 
@@ -1253,7 +1266,7 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "+":
             # handle must + property
             must_count += 1
@@ -1261,15 +1274,15 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_6_idx, arr_6_item in enumerate(pval):
-                    arr_6_lpath: Path = ((lpath_9 if path is not None else None) + [ arr_6_idx ]) if (lpath_9 if path is not None else None) is not None else None
+                    arr_6_lpath: Path = (lpath_9, arr_6_idx) if lpath_9 is not None else None
                     # .'$Model#Root'.'|'.4.'+'.0
-                    res = json_model_20(arr_6_item, arr_6_lpath if (lpath_9 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_6_item, arr_6_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.4.'+'.0]", arr_6_lpath if (lpath_9 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.4.'+'.0]", arr_6_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'+']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.4.'+']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'+']", lpath_9))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.4.'+']", lpath_9))
                 return False
             continue
         if prop == "#":
@@ -1277,44 +1290,44 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.4.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'#']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'#']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'#']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'#']", lpath_9))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.4.'$'
-            res = _jm_obj_19(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_19(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'$']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'$']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$']", lpath_9))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.4.'%'
-            res = _jm_obj_21(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_21(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'%']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'%']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%']", lpath_9))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.4.'~'
-            res = json_model_4(pval, lpath_9 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'~']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'~']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'~']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'~']", lpath_9))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.4.'.schema'
-            res = _jm_obj_23(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_23(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'.schema']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'.schema']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'.schema']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'.schema']", lpath_9))
                 return False
             continue
         if prop.startswith("#"):
@@ -1322,7 +1335,7 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.4.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4]", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4]", lpath_9))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1346,14 +1359,14 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.3.'$'.''
-            res = json_model_4(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'$'.'']", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'$'.'']", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'']", lpath_13))
                 return False
             continue
         elif prop == "#":
@@ -1361,32 +1374,32 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.3.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'$'.'#']", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'#']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'$'.'#']", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'#']", lpath_13))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.3.'$'.'.schema'
-            res = _jm_obj_26(pval, lpath_13 if path is not None else None, rep)
+            res = _jm_obj_26(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'$'.'.schema']", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'.schema']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'$'.'.schema']", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'.schema']", lpath_13))
                 return False
             continue
-        if json_model_6(prop, lpath_13 if path is not None else None, rep):
+        if json_model_6(prop, lpath_13, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.3.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.3.'$'.'$Identifier']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.3.'$'.'$Identifier']", lpath_13))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.3.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'$']", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'$']", lpath_13))
             return False
     return True
 
@@ -1405,58 +1418,58 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.3.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'%'.'#']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'#']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'%'.'#']", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'#']", lpath_14))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.3.'%'.'<'
             # .'$Model#Root'.'|'.3.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_14 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.0]", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.0]", lpath_14))
                 # .'$Model#Root'.'|'.3.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_9_idx, arr_9_item in enumerate(pval):
-                        arr_9_lpath: Path = ((lpath_14 if path is not None else None) + [ arr_9_idx ]) if (lpath_14 if path is not None else None) is not None else None
+                        arr_9_lpath: Path = (lpath_14, arr_9_idx) if lpath_14 is not None else None
                         # .'$Model#Root'.'|'.3.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_9_item, arr_9_lpath if (lpath_14 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_9_item, arr_9_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1.0]", arr_9_lpath if (lpath_14 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1.0]", arr_9_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1]", lpath_14 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1]", lpath_14))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.3.'%'.'<'.'|']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'<']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.3.'%'.'<'.'|']", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'<']", lpath_14))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.3.'%'.'.schema'
-            res = _jm_obj_28(pval, lpath_14 if path is not None else None, rep)
+            res = _jm_obj_28(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'%'.'.schema']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'.schema']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'%'.'.schema']", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'.schema']", lpath_14))
                 return False
             continue
-        if json_model_13(prop, lpath_14 if path is not None else None, rep):
+        if json_model_13(prop, lpath_14, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.3.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_14 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.3.'%'.'$Name']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.3.'%'.'$Name']", lpath_14))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1465,12 +1478,12 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.3.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_14 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.3.'%'.'/^\\\\$.*$/']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.3.'%'.'/^\\\\$.*$/']", lpath_14))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'%']", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'%']", lpath_14))
             return False
     return True
 
@@ -1490,7 +1503,7 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         if prop == "^":
             # handle must ^ property
             must_count += 1
@@ -1498,15 +1511,15 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_8_idx, arr_8_item in enumerate(pval):
-                    arr_8_lpath: Path = ((lpath_12 if path is not None else None) + [ arr_8_idx ]) if (lpath_12 if path is not None else None) is not None else None
+                    arr_8_lpath: Path = (lpath_12, arr_8_idx) if lpath_12 is not None else None
                     # .'$Model#Root'.'|'.3.'^'.0
-                    res = json_model_20(arr_8_item, arr_8_lpath if (lpath_12 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_8_item, arr_8_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.3.'^'.0]", arr_8_lpath if (lpath_12 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.3.'^'.0]", arr_8_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'^']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.3.'^']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'^']", lpath_12))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.3.'^']", lpath_12))
                 return False
             continue
         if prop == "#":
@@ -1514,44 +1527,44 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.3.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'#']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'#']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'#']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'#']", lpath_12))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.3.'$'
-            res = _jm_obj_25(pval, lpath_12 if path is not None else None, rep)
+            res = _jm_obj_25(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'$']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'$']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$']", lpath_12))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.3.'%'
-            res = _jm_obj_27(pval, lpath_12 if path is not None else None, rep)
+            res = _jm_obj_27(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'%']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'%']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%']", lpath_12))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.3.'~'
-            res = json_model_4(pval, lpath_12 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'~']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'~']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'~']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'~']", lpath_12))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.3.'.schema'
-            res = _jm_obj_29(pval, lpath_12 if path is not None else None, rep)
+            res = _jm_obj_29(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'.schema']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'.schema']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'.schema']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'.schema']", lpath_12))
                 return False
             continue
         if prop.startswith("#"):
@@ -1559,7 +1572,7 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.3.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3]", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3]", lpath_12))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1583,14 +1596,14 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.2.'$'.''
-            res = json_model_4(pval, lpath_16 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'$'.'']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'$'.'']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'']", lpath_16))
                 return False
             continue
         elif prop == "#":
@@ -1598,32 +1611,32 @@ def _jm_obj_31(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.2.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'$'.'#']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'#']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'$'.'#']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'#']", lpath_16))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.2.'$'.'.schema'
-            res = _jm_obj_32(pval, lpath_16 if path is not None else None, rep)
+            res = _jm_obj_32(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'$'.'.schema']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'.schema']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'$'.'.schema']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'.schema']", lpath_16))
                 return False
             continue
-        if json_model_6(prop, lpath_16 if path is not None else None, rep):
+        if json_model_6(prop, lpath_16, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.2.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_16 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.2.'$'.'$Identifier']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.2.'$'.'$Identifier']", lpath_16))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.2.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'$']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'$']", lpath_16))
             return False
     return True
 
@@ -1642,58 +1655,58 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.2.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'%'.'#']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'#']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'%'.'#']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'#']", lpath_17))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.2.'%'.'<'
             # .'$Model#Root'.'|'.2.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.0]", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.0]", lpath_17))
                 # .'$Model#Root'.'|'.2.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_11_idx, arr_11_item in enumerate(pval):
-                        arr_11_lpath: Path = ((lpath_17 if path is not None else None) + [ arr_11_idx ]) if (lpath_17 if path is not None else None) is not None else None
+                        arr_11_lpath: Path = (lpath_17, arr_11_idx) if lpath_17 is not None else None
                         # .'$Model#Root'.'|'.2.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_11_item, arr_11_lpath if (lpath_17 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_11_item, arr_11_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1.0]", arr_11_lpath if (lpath_17 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1.0]", arr_11_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1]", lpath_17 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1]", lpath_17))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.2.'%'.'<'.'|']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'<']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.2.'%'.'<'.'|']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'<']", lpath_17))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.2.'%'.'.schema'
-            res = _jm_obj_34(pval, lpath_17 if path is not None else None, rep)
+            res = _jm_obj_34(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'%'.'.schema']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'.schema']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'%'.'.schema']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'.schema']", lpath_17))
                 return False
             continue
-        if json_model_13(prop, lpath_17 if path is not None else None, rep):
+        if json_model_13(prop, lpath_17, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.2.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_17 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.2.'%'.'$Name']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.2.'%'.'$Name']", lpath_17))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1702,12 +1715,12 @@ def _jm_obj_33(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.2.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.2.'%'.'/^\\\\$.*$/']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.2.'%'.'/^\\\\$.*$/']", lpath_17))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'%']", lpath_17 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'%']", lpath_17))
             return False
     return True
 
@@ -1727,7 +1740,7 @@ def _jm_obj_30(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         if prop == "&":
             # handle must & property
             must_count += 1
@@ -1735,15 +1748,15 @@ def _jm_obj_30(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_10_idx, arr_10_item in enumerate(pval):
-                    arr_10_lpath: Path = ((lpath_15 if path is not None else None) + [ arr_10_idx ]) if (lpath_15 if path is not None else None) is not None else None
+                    arr_10_lpath: Path = (lpath_15, arr_10_idx) if lpath_15 is not None else None
                     # .'$Model#Root'.'|'.2.'&'.0
-                    res = json_model_20(arr_10_item, arr_10_lpath if (lpath_15 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_10_item, arr_10_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.2.'&'.0]", arr_10_lpath if (lpath_15 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.2.'&'.0]", arr_10_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'&']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.2.'&']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'&']", lpath_15))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.2.'&']", lpath_15))
                 return False
             continue
         if prop == "#":
@@ -1751,44 +1764,44 @@ def _jm_obj_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.2.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'#']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'#']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'#']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'#']", lpath_15))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.2.'$'
-            res = _jm_obj_31(pval, lpath_15 if path is not None else None, rep)
+            res = _jm_obj_31(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'$']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'$']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$']", lpath_15))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.2.'%'
-            res = _jm_obj_33(pval, lpath_15 if path is not None else None, rep)
+            res = _jm_obj_33(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'%']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'%']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%']", lpath_15))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.2.'~'
-            res = json_model_4(pval, lpath_15 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'~']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'~']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'~']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'~']", lpath_15))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.2.'.schema'
-            res = _jm_obj_35(pval, lpath_15 if path is not None else None, rep)
+            res = _jm_obj_35(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'.schema']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'.schema']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'.schema']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'.schema']", lpath_15))
                 return False
             continue
         if prop.startswith("#"):
@@ -1796,7 +1809,7 @@ def _jm_obj_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.2.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2]", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2]", lpath_15))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1820,14 +1833,14 @@ def _jm_obj_37(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.1.'$'.''
-            res = json_model_4(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'$'.'']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'$'.'']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'']", lpath_19))
                 return False
             continue
         elif prop == "#":
@@ -1835,32 +1848,32 @@ def _jm_obj_37(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.1.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'$'.'#']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'#']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'$'.'#']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'#']", lpath_19))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.1.'$'.'.schema'
-            res = _jm_obj_38(pval, lpath_19 if path is not None else None, rep)
+            res = _jm_obj_38(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'$'.'.schema']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'.schema']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'$'.'.schema']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'.schema']", lpath_19))
                 return False
             continue
-        if json_model_6(prop, lpath_19 if path is not None else None, rep):
+        if json_model_6(prop, lpath_19, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.1.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.1.'$'.'$Identifier']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.1.'$'.'$Identifier']", lpath_19))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.1.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'$']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'$']", lpath_19))
             return False
     return True
 
@@ -1879,58 +1892,58 @@ def _jm_obj_39(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.1.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'%'.'#']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'#']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'%'.'#']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'#']", lpath_20))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.1.'%'.'<'
             # .'$Model#Root'.'|'.1.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_20 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.0]", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.0]", lpath_20))
                 # .'$Model#Root'.'|'.1.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_13_idx, arr_13_item in enumerate(pval):
-                        arr_13_lpath: Path = ((lpath_20 if path is not None else None) + [ arr_13_idx ]) if (lpath_20 if path is not None else None) is not None else None
+                        arr_13_lpath: Path = (lpath_20, arr_13_idx) if lpath_20 is not None else None
                         # .'$Model#Root'.'|'.1.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_13_item, arr_13_lpath if (lpath_20 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_13_item, arr_13_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1.0]", arr_13_lpath if (lpath_20 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1.0]", arr_13_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1]", lpath_20 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1]", lpath_20))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.1.'%'.'<'.'|']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'<']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.1.'%'.'<'.'|']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'<']", lpath_20))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.1.'%'.'.schema'
-            res = _jm_obj_40(pval, lpath_20 if path is not None else None, rep)
+            res = _jm_obj_40(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'%'.'.schema']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'.schema']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'%'.'.schema']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'.schema']", lpath_20))
                 return False
             continue
-        if json_model_13(prop, lpath_20 if path is not None else None, rep):
+        if json_model_13(prop, lpath_20, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.1.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_20 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.1.'%'.'$Name']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.1.'%'.'$Name']", lpath_20))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1939,12 +1952,12 @@ def _jm_obj_39(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.1.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_20 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.1.'%'.'/^\\\\$.*$/']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.1.'%'.'/^\\\\$.*$/']", lpath_20))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'%']", lpath_20 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'%']", lpath_20))
             return False
     return True
 
@@ -1964,7 +1977,7 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         if prop == "|":
             # handle must | property
             must_count += 1
@@ -1972,15 +1985,15 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_12_idx, arr_12_item in enumerate(pval):
-                    arr_12_lpath: Path = ((lpath_18 if path is not None else None) + [ arr_12_idx ]) if (lpath_18 if path is not None else None) is not None else None
+                    arr_12_lpath: Path = (lpath_18, arr_12_idx) if lpath_18 is not None else None
                     # .'$Model#Root'.'|'.1.'|'.0
-                    res = json_model_20(arr_12_item, arr_12_lpath if (lpath_18 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_12_item, arr_12_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.1.'|'.0]", arr_12_lpath if (lpath_18 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.1.'|'.0]", arr_12_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'|']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.1.'|']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'|']", lpath_18))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.1.'|']", lpath_18))
                 return False
             continue
         if prop == "#":
@@ -1988,44 +2001,44 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'#']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'#']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'#']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'#']", lpath_18))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.1.'$'
-            res = _jm_obj_37(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_37(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'$']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'$']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$']", lpath_18))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.1.'%'
-            res = _jm_obj_39(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_39(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'%']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'%']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%']", lpath_18))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.1.'~'
-            res = json_model_4(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'~']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'~']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'~']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'~']", lpath_18))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.1.'.schema'
-            res = _jm_obj_41(pval, lpath_18 if path is not None else None, rep)
+            res = _jm_obj_41(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'.schema']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'.schema']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'.schema']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'.schema']", lpath_18))
                 return False
             continue
         if prop.startswith("#"):
@@ -2033,7 +2046,7 @@ def _jm_obj_36(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1]", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1]", lpath_18))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2057,14 +2070,14 @@ def _jm_obj_43(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
+        lpath_22: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.0.'$'.''
-            res = json_model_4(pval, lpath_22 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'$'.'']", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'$'.'']", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'']", lpath_22))
                 return False
             continue
         elif prop == "#":
@@ -2072,32 +2085,32 @@ def _jm_obj_43(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'$'.'#']", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'#']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'$'.'#']", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'#']", lpath_22))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.0.'$'.'.schema'
-            res = _jm_obj_44(pval, lpath_22 if path is not None else None, rep)
+            res = _jm_obj_44(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'$'.'.schema']", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'.schema']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'$'.'.schema']", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'.schema']", lpath_22))
                 return False
             continue
-        if json_model_6(prop, lpath_22 if path is not None else None, rep):
+        if json_model_6(prop, lpath_22, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.0.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_22 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'$'.'$Identifier']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'$'.'$Identifier']", lpath_22))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.0.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'$']", lpath_22 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'$']", lpath_22))
             return False
     return True
 
@@ -2116,58 +2129,58 @@ def _jm_obj_45(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.0.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'%'.'#']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'#']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'%'.'#']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'#']", lpath_23))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.0.'%'.'<'
             # .'$Model#Root'.'|'.0.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_23 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.0]", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.0]", lpath_23))
                 # .'$Model#Root'.'|'.0.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_14_idx, arr_14_item in enumerate(pval):
-                        arr_14_lpath: Path = ((lpath_23 if path is not None else None) + [ arr_14_idx ]) if (lpath_23 if path is not None else None) is not None else None
+                        arr_14_lpath: Path = (lpath_23, arr_14_idx) if lpath_23 is not None else None
                         # .'$Model#Root'.'|'.0.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_14_item, arr_14_lpath if (lpath_23 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_14_item, arr_14_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1.0]", arr_14_lpath if (lpath_23 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1.0]", arr_14_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1]", lpath_23 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1]", lpath_23))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.0.'%'.'<'.'|']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'<']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.0.'%'.'<'.'|']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'<']", lpath_23))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.0.'%'.'.schema'
-            res = _jm_obj_46(pval, lpath_23 if path is not None else None, rep)
+            res = _jm_obj_46(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'%'.'.schema']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'.schema']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'%'.'.schema']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'.schema']", lpath_23))
                 return False
             continue
-        if json_model_13(prop, lpath_23 if path is not None else None, rep):
+        if json_model_13(prop, lpath_23, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.0.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_23 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.0.'%'.'$Name']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.0.'%'.'$Name']", lpath_23))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -2176,12 +2189,12 @@ def _jm_obj_45(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Model#Root'.'|'.0.'%'.'/^\\$.*$/'
-            res = json_model_33(pval, lpath_23 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.0.'%'.'/^\\\\$.*$/']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Model#Root'.'|'.0.'%'.'/^\\\\$.*$/']", lpath_23))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'%']", lpath_23 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'%']", lpath_23))
             return False
     return True
 
@@ -2201,15 +2214,15 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$Model#Root'.'|'.0.'@'
-            res = json_model_35(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'@']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.0.'@']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'@']", lpath_21))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.0.'@']", lpath_21))
                 return False
             continue
         if prop == "!":
@@ -2217,8 +2230,8 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Model#Root'.'|'.0.'!']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'!']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Model#Root'.'|'.0.'!']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'!']", lpath_21))
                 return False
             continue
         elif prop == "#":
@@ -2226,44 +2239,44 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'#']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'#']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'#']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'#']", lpath_21))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.0.'$'
-            res = _jm_obj_43(pval, lpath_21 if path is not None else None, rep)
+            res = _jm_obj_43(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'$']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'$']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$']", lpath_21))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.0.'%'
-            res = _jm_obj_45(pval, lpath_21 if path is not None else None, rep)
+            res = _jm_obj_45(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'%']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'%']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%']", lpath_21))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.0.'~'
-            res = json_model_4(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'~']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'~']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'~']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'~']", lpath_21))
                 return False
             continue
         elif prop == ".in":
             # handle may .in property
             # .'$Model#Root'.'|'.0.'.in'
-            res = json_model_35(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'.in']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'.in']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'.in']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'.in']", lpath_21))
                 return False
             continue
         elif prop == ".mo":
@@ -2271,17 +2284,17 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'.mo'
             res = isinstance(pval, int) and not isinstance(pval, bool) and pval >= 1
             if not res:
-                rep is None or rep.append(("not a 1 strict int [.'$Model#Root'.'|'.0.'.mo']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'.mo']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("not a 1 strict int [.'$Model#Root'.'|'.0.'.mo']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'.mo']", lpath_21))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Root'.'|'.0.'.schema'
-            res = _jm_obj_47(pval, lpath_21 if path is not None else None, rep)
+            res = _jm_obj_47(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'.schema']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'.schema']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'.schema']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'.schema']", lpath_21))
                 return False
             continue
         if prop.startswith("#"):
@@ -2291,19 +2304,19 @@ def _jm_obj_42(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_3(prop, path, rep):
             # handle 3 re props
             # .'$Model#Root'.'|'.0.'/^(<=|>=|<|>)$/'
-            res = json_model_14(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_14(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Root'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Root'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_21))
                 return False
         elif _jm_re_4(prop, path, rep):
             # handle 3 re props
             # .'$Model#Root'.'|'.0.'/^(=|!=)$/'
-            res = json_model_15(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Model#Root'.'|'.0.'/^(=|!=)$/']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Model#Root'.'|'.0.'/^(=|!=)$/']", lpath_21))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0]", lpath_21 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0]", lpath_21))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2390,12 +2403,12 @@ def _jm_obj_49(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Model#Transformation'.'|'.1.'~'.''
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$Model#Transformation'.'|'.1.'~'.'']", lpath_25 if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$Model#Transformation'.'|'.1.'~'.'']", lpath_25))
             return False
     return True
 
@@ -2414,14 +2427,14 @@ def _jm_obj_48(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Transformation'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Transformation'.'|'.1.'#']", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'#']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Transformation'.'|'.1.'#']", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'#']", lpath_24))
                 return False
             continue
         elif prop == "*":
@@ -2433,36 +2446,36 @@ def _jm_obj_48(val: Jsonable, path: Path, rep: Report) -> bool:
             # handle may / property
             # .'$Model#Transformation'.'|'.1.'/'
             # .'$Model#Transformation'.'|'.1.'/'.'|'.0
-            res = json_model_15(pval, lpath_24 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_24, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Model#Transformation'.'|'.1.'/'.'|'.0]", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Model#Transformation'.'|'.1.'/'.'|'.0]", lpath_24))
                 # .'$Model#Transformation'.'|'.1.'/'.'|'.1
                 res = isinstance(pval, list)
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Transformation'.'|'.1.'/'.'|'.1]", lpath_24 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Transformation'.'|'.1.'/'.'|'.1]", lpath_24))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Transformation'.'|'.1.'/'.'|']", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'/']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Transformation'.'|'.1.'/'.'|']", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'/']", lpath_24))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Transformation'.'|'.1.'~'
-            res = _jm_obj_49(pval, lpath_24 if path is not None else None, rep)
+            res = _jm_obj_49(pval, lpath_24, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Transformation'.'|'.1.'~']", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'~']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Transformation'.'|'.1.'~']", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'~']", lpath_24))
                 return False
             continue
         elif prop == ".schema":
             # handle may .schema property
             # .'$Model#Transformation'.'|'.1.'.schema'
-            res = _jm_obj_50(pval, lpath_24 if path is not None else None, rep)
+            res = _jm_obj_50(pval, lpath_24, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Transformation'.'|'.1.'.schema']", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'.schema']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Transformation'.'|'.1.'.schema']", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Transformation'.'|'.1.'.schema']", lpath_24))
                 return False
             continue
         if prop.startswith("#"):
@@ -2470,7 +2483,7 @@ def _jm_obj_48(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Transformation'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Transformation'.'|'.1]", lpath_24 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Transformation'.'|'.1]", lpath_24))
             return False
     return True
 
@@ -2600,5 +2613,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_cst_0: set[str]
 _jm_re_0_reco: object
@@ -94,11 +107,11 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$Model#Array'.0
-            res = json_model_20(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_20(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CModel [.'$Model#Array'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $CModel [.'$Model#Array'.0]", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Model#Array']", path))
@@ -333,29 +346,29 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Element'.'|'.4.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.4.'#']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.4.'#']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.4.'#']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.4.'#']", lpath_0))
                 return False
             continue
-        if json_model_28(prop, lpath_0 if path is not None else None, rep):
+        if json_model_28(prop, lpath_0, rep):
             # handle 1 key props
             # .'$Model#Element'.'|'.4.'$Prop'
-            res = json_model_35(pval, lpath_0 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.4.'$Prop']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.4.'$Prop']", lpath_0))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Element'.'|'.4.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.4]", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.4]", lpath_0))
             return False
     return True
 
@@ -367,7 +380,7 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "^":
             # handle must ^ property
             must_count += 1
@@ -375,15 +388,15 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_1_idx, arr_1_item in enumerate(pval):
-                    arr_1_lpath: Path = ((lpath_1 if path is not None else None) + [ arr_1_idx ]) if (lpath_1 if path is not None else None) is not None else None
+                    arr_1_lpath: Path = (lpath_1, arr_1_idx) if lpath_1 is not None else None
                     # .'$Model#Element'.'|'.3.'^'.0
-                    res = json_model_20(arr_1_item, arr_1_lpath if (lpath_1 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_1_item, arr_1_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.3.'^'.0]", arr_1_lpath if (lpath_1 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.3.'^'.0]", arr_1_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.3.'^']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.3.'^']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.3.'^']", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.3.'^']", lpath_1))
                 return False
             continue
         if prop == "#":
@@ -391,8 +404,8 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.3.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.3.'#']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.3.'#']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.3.'#']", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.3.'#']", lpath_1))
                 return False
             continue
         if prop.startswith("#"):
@@ -400,7 +413,7 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.3.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.3]", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.3]", lpath_1))
             return False
     if must_count != 1:
         if rep is not None:
@@ -417,7 +430,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop == "&":
             # handle must & property
             must_count += 1
@@ -425,15 +438,15 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_2_idx, arr_2_item in enumerate(pval):
-                    arr_2_lpath: Path = ((lpath_2 if path is not None else None) + [ arr_2_idx ]) if (lpath_2 if path is not None else None) is not None else None
+                    arr_2_lpath: Path = (lpath_2, arr_2_idx) if lpath_2 is not None else None
                     # .'$Model#Element'.'|'.2.'&'.0
-                    res = json_model_20(arr_2_item, arr_2_lpath if (lpath_2 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_2_item, arr_2_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.2.'&'.0]", arr_2_lpath if (lpath_2 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.2.'&'.0]", arr_2_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.2.'&']", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.2.'&']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.2.'&']", lpath_2))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.2.'&']", lpath_2))
                 return False
             continue
         if prop == "#":
@@ -441,8 +454,8 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.2.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.2.'#']", lpath_2 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.2.'#']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.2.'#']", lpath_2))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.2.'#']", lpath_2))
                 return False
             continue
         if prop.startswith("#"):
@@ -450,7 +463,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.2.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.2]", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.2]", lpath_2))
             return False
     if must_count != 1:
         if rep is not None:
@@ -467,7 +480,7 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "|":
             # handle must | property
             must_count += 1
@@ -475,15 +488,15 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_3_idx, arr_3_item in enumerate(pval):
-                    arr_3_lpath: Path = ((lpath_3 if path is not None else None) + [ arr_3_idx ]) if (lpath_3 if path is not None else None) is not None else None
+                    arr_3_lpath: Path = (lpath_3, arr_3_idx) if lpath_3 is not None else None
                     # .'$Model#Element'.'|'.1.'|'.0
-                    res = json_model_20(arr_3_item, arr_3_lpath if (lpath_3 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_3_item, arr_3_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.1.'|'.0]", arr_3_lpath if (lpath_3 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Element'.'|'.1.'|'.0]", arr_3_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.1.'|']", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.1.'|']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Element'.'|'.1.'|']", lpath_3))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.1.'|']", lpath_3))
                 return False
             continue
         if prop == "#":
@@ -491,8 +504,8 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.1.'#']", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.1.'#']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.1.'#']", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.1.'#']", lpath_3))
                 return False
             continue
         if prop.startswith("#"):
@@ -500,7 +513,7 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.1]", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.1]", lpath_3))
             return False
     if must_count != 1:
         if rep is not None:
@@ -519,15 +532,15 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$Model#Element'.'|'.0.'@'
-            res = json_model_35(pval, lpath_4 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.0.'@']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.0.'@']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Element'.'|'.0.'@']", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Element'.'|'.0.'@']", lpath_4))
                 return False
             continue
         if prop == "!":
@@ -535,8 +548,8 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.0.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Model#Element'.'|'.0.'!']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'!']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Model#Element'.'|'.0.'!']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'!']", lpath_4))
                 return False
             continue
         elif prop == "#":
@@ -544,8 +557,8 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Element'.'|'.0.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.0.'#']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'#']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Element'.'|'.0.'#']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Element'.'|'.0.'#']", lpath_4))
                 return False
             continue
         if prop.startswith("#"):
@@ -555,19 +568,19 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_3(prop, path, rep):
             # handle 3 re props
             # .'$Model#Element'.'|'.0.'/^(<=|>=|<|>)$/'
-            res = json_model_14(pval, lpath_4 if path is not None else None, rep)
+            res = json_model_14(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_4))
                 return False
         elif _jm_re_4(prop, path, rep):
             # handle 3 re props
             # .'$Model#Element'.'|'.0.'/^(=|!=)$/'
-            res = json_model_15(pval, lpath_4 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_4, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Model#Element'.'|'.0.'/^(=|!=)$/']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Model#Element'.'|'.0.'/^(=|!=)$/']", lpath_4))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.0]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Element'.'|'.0]", lpath_4))
             return False
     if must_count != 1:
         if rep is not None:
@@ -703,14 +716,14 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.4.'$'.''
-            res = json_model_4(pval, lpath_6 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'$'.'']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'$'.'']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'']", lpath_6))
                 return False
             continue
         elif prop == "#":
@@ -718,23 +731,23 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.4.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'$'.'#']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'#']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'$'.'#']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$'.'#']", lpath_6))
                 return False
             continue
-        if json_model_6(prop, lpath_6 if path is not None else None, rep):
+        if json_model_6(prop, lpath_6, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.4.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_6 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_6, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.4.'$'.'$Identifier']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.4.'$'.'$Identifier']", lpath_6))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.4.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'$']", lpath_6 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'$']", lpath_6))
             return False
     return True
 
@@ -746,56 +759,56 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.4.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'%'.'#']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'#']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'%'.'#']", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'#']", lpath_7))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.4.'%'.'<'
             # .'$Model#Root'.'|'.4.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_7 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.0]", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.0]", lpath_7))
                 # .'$Model#Root'.'|'.4.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_4_idx, arr_4_item in enumerate(pval):
-                        arr_4_lpath: Path = ((lpath_7 if path is not None else None) + [ arr_4_idx ]) if (lpath_7 if path is not None else None) is not None else None
+                        arr_4_lpath: Path = (lpath_7, arr_4_idx) if lpath_7 is not None else None
                         # .'$Model#Root'.'|'.4.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_4_item, arr_4_lpath if (lpath_7 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_4_item, arr_4_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1.0]", arr_4_lpath if (lpath_7 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1.0]", arr_4_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1]", lpath_7 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.4.'%'.'<'.'|'.1]", lpath_7))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.4.'%'.'<'.'|']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'<']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.4.'%'.'<'.'|']", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%'.'<']", lpath_7))
                 return False
             continue
-        if json_model_13(prop, lpath_7 if path is not None else None, rep):
+        if json_model_13(prop, lpath_7, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.4.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_7 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_7, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.4.'%'.'$Name']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.4.'%'.'$Name']", lpath_7))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.4.'%'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'%']", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4.'%']", lpath_7))
             return False
     return True
 
@@ -806,56 +819,56 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.4.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'#']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'#']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.4.'#']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'#']", lpath_5))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.4.'$'
-            res = _jm_obj_6(pval, lpath_5 if path is not None else None, rep)
+            res = _jm_obj_6(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'$']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'$']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'$']", lpath_5))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.4.'%'
-            res = _jm_obj_7(pval, lpath_5 if path is not None else None, rep)
+            res = _jm_obj_7(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'%']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.4.'%']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'%']", lpath_5))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.4.'~'
-            res = json_model_4(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'~']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'~']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.4.'~']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.4.'~']", lpath_5))
                 return False
             continue
-        if json_model_28(prop, lpath_5 if path is not None else None, rep):
+        if json_model_28(prop, lpath_5, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.4.'$Prop'
-            res = json_model_35(pval, lpath_5 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_5, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.4.'$Prop']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.4.'$Prop']", lpath_5))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.4.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4]", lpath_5 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.4]", lpath_5))
             return False
     return True
 
@@ -866,14 +879,14 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.3.'$'.''
-            res = json_model_4(pval, lpath_9 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'$'.'']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'$'.'']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'']", lpath_9))
                 return False
             continue
         elif prop == "#":
@@ -881,23 +894,23 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.3.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'$'.'#']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'#']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'$'.'#']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$'.'#']", lpath_9))
                 return False
             continue
-        if json_model_6(prop, lpath_9 if path is not None else None, rep):
+        if json_model_6(prop, lpath_9, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.3.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_9 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.3.'$'.'$Identifier']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.3.'$'.'$Identifier']", lpath_9))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.3.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'$']", lpath_9 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'$']", lpath_9))
             return False
     return True
 
@@ -908,56 +921,56 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.3.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'%'.'#']", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'#']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'%'.'#']", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'#']", lpath_10))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.3.'%'.'<'
             # .'$Model#Root'.'|'.3.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_10 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.0]", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.0]", lpath_10))
                 # .'$Model#Root'.'|'.3.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_6_idx, arr_6_item in enumerate(pval):
-                        arr_6_lpath: Path = ((lpath_10 if path is not None else None) + [ arr_6_idx ]) if (lpath_10 if path is not None else None) is not None else None
+                        arr_6_lpath: Path = (lpath_10, arr_6_idx) if lpath_10 is not None else None
                         # .'$Model#Root'.'|'.3.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_6_item, arr_6_lpath if (lpath_10 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_6_item, arr_6_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1.0]", arr_6_lpath if (lpath_10 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1.0]", arr_6_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1]", lpath_10 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'%'.'<'.'|'.1]", lpath_10))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.3.'%'.'<'.'|']", lpath_10 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'<']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.3.'%'.'<'.'|']", lpath_10))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%'.'<']", lpath_10))
                 return False
             continue
-        if json_model_13(prop, lpath_10 if path is not None else None, rep):
+        if json_model_13(prop, lpath_10, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.3.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_10 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_10, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.3.'%'.'$Name']", lpath_10 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.3.'%'.'$Name']", lpath_10))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.3.'%'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'%']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3.'%']", lpath_10))
             return False
     return True
 
@@ -969,7 +982,7 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "^":
             # handle must ^ property
             must_count += 1
@@ -977,15 +990,15 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_5_idx, arr_5_item in enumerate(pval):
-                    arr_5_lpath: Path = ((lpath_8 if path is not None else None) + [ arr_5_idx ]) if (lpath_8 if path is not None else None) is not None else None
+                    arr_5_lpath: Path = (lpath_8, arr_5_idx) if lpath_8 is not None else None
                     # .'$Model#Root'.'|'.3.'^'.0
-                    res = json_model_20(arr_5_item, arr_5_lpath if (lpath_8 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_5_item, arr_5_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.3.'^'.0]", arr_5_lpath if (lpath_8 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.3.'^'.0]", arr_5_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'^']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.3.'^']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.3.'^']", lpath_8))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.3.'^']", lpath_8))
                 return False
             continue
         if prop == "#":
@@ -993,35 +1006,35 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.3.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'#']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'#']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.3.'#']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'#']", lpath_8))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.3.'$'
-            res = _jm_obj_9(pval, lpath_8 if path is not None else None, rep)
+            res = _jm_obj_9(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'$']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'$']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'$']", lpath_8))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.3.'%'
-            res = _jm_obj_10(pval, lpath_8 if path is not None else None, rep)
+            res = _jm_obj_10(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'%']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.3.'%']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'%']", lpath_8))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.3.'~'
-            res = json_model_4(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'~']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'~']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.3.'~']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.3.'~']", lpath_8))
                 return False
             continue
         if prop.startswith("#"):
@@ -1029,7 +1042,7 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.3.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3]", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.3]", lpath_8))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1045,14 +1058,14 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.2.'$'.''
-            res = json_model_4(pval, lpath_12 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'$'.'']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'$'.'']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'']", lpath_12))
                 return False
             continue
         elif prop == "#":
@@ -1060,23 +1073,23 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.2.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'$'.'#']", lpath_12 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'#']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'$'.'#']", lpath_12))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$'.'#']", lpath_12))
                 return False
             continue
-        if json_model_6(prop, lpath_12 if path is not None else None, rep):
+        if json_model_6(prop, lpath_12, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.2.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_12 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_12, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.2.'$'.'$Identifier']", lpath_12 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.2.'$'.'$Identifier']", lpath_12))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.2.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'$']", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'$']", lpath_12))
             return False
     return True
 
@@ -1087,56 +1100,56 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.2.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'%'.'#']", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'#']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'%'.'#']", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'#']", lpath_13))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.2.'%'.'<'
             # .'$Model#Root'.'|'.2.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.0]", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.0]", lpath_13))
                 # .'$Model#Root'.'|'.2.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_8_idx, arr_8_item in enumerate(pval):
-                        arr_8_lpath: Path = ((lpath_13 if path is not None else None) + [ arr_8_idx ]) if (lpath_13 if path is not None else None) is not None else None
+                        arr_8_lpath: Path = (lpath_13, arr_8_idx) if lpath_13 is not None else None
                         # .'$Model#Root'.'|'.2.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_8_item, arr_8_lpath if (lpath_13 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_8_item, arr_8_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1.0]", arr_8_lpath if (lpath_13 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1.0]", arr_8_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1]", lpath_13 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'%'.'<'.'|'.1]", lpath_13))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.2.'%'.'<'.'|']", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'<']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.2.'%'.'<'.'|']", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%'.'<']", lpath_13))
                 return False
             continue
-        if json_model_13(prop, lpath_13 if path is not None else None, rep):
+        if json_model_13(prop, lpath_13, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.2.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_13 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.2.'%'.'$Name']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.2.'%'.'$Name']", lpath_13))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.2.'%'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'%']", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2.'%']", lpath_13))
             return False
     return True
 
@@ -1148,7 +1161,7 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         if prop == "&":
             # handle must & property
             must_count += 1
@@ -1156,15 +1169,15 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_7_idx, arr_7_item in enumerate(pval):
-                    arr_7_lpath: Path = ((lpath_11 if path is not None else None) + [ arr_7_idx ]) if (lpath_11 if path is not None else None) is not None else None
+                    arr_7_lpath: Path = (lpath_11, arr_7_idx) if lpath_11 is not None else None
                     # .'$Model#Root'.'|'.2.'&'.0
-                    res = json_model_20(arr_7_item, arr_7_lpath if (lpath_11 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_7_item, arr_7_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.2.'&'.0]", arr_7_lpath if (lpath_11 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.2.'&'.0]", arr_7_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'&']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.2.'&']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.2.'&']", lpath_11))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.2.'&']", lpath_11))
                 return False
             continue
         if prop == "#":
@@ -1172,35 +1185,35 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.2.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'#']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'#']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.2.'#']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'#']", lpath_11))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.2.'$'
-            res = _jm_obj_12(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_12(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'$']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'$']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'$']", lpath_11))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.2.'%'
-            res = _jm_obj_13(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'%']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.2.'%']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'%']", lpath_11))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.2.'~'
-            res = json_model_4(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'~']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'~']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.2.'~']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.2.'~']", lpath_11))
                 return False
             continue
         if prop.startswith("#"):
@@ -1208,7 +1221,7 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.2.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2]", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.2]", lpath_11))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1224,14 +1237,14 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.1.'$'.''
-            res = json_model_4(pval, lpath_15 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'$'.'']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'$'.'']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'']", lpath_15))
                 return False
             continue
         elif prop == "#":
@@ -1239,23 +1252,23 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.1.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'$'.'#']", lpath_15 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'#']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'$'.'#']", lpath_15))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$'.'#']", lpath_15))
                 return False
             continue
-        if json_model_6(prop, lpath_15 if path is not None else None, rep):
+        if json_model_6(prop, lpath_15, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.1.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_15 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.1.'$'.'$Identifier']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.1.'$'.'$Identifier']", lpath_15))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.1.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'$']", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'$']", lpath_15))
             return False
     return True
 
@@ -1266,56 +1279,56 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.1.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'%'.'#']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'#']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'%'.'#']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'#']", lpath_16))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.1.'%'.'<'
             # .'$Model#Root'.'|'.1.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_16 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.0]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.0]", lpath_16))
                 # .'$Model#Root'.'|'.1.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_10_idx, arr_10_item in enumerate(pval):
-                        arr_10_lpath: Path = ((lpath_16 if path is not None else None) + [ arr_10_idx ]) if (lpath_16 if path is not None else None) is not None else None
+                        arr_10_lpath: Path = (lpath_16, arr_10_idx) if lpath_16 is not None else None
                         # .'$Model#Root'.'|'.1.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_10_item, arr_10_lpath if (lpath_16 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_10_item, arr_10_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1.0]", arr_10_lpath if (lpath_16 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1.0]", arr_10_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1]", lpath_16 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'%'.'<'.'|'.1]", lpath_16))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.1.'%'.'<'.'|']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'<']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.1.'%'.'<'.'|']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%'.'<']", lpath_16))
                 return False
             continue
-        if json_model_13(prop, lpath_16 if path is not None else None, rep):
+        if json_model_13(prop, lpath_16, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.1.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_16 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.1.'%'.'$Name']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.1.'%'.'$Name']", lpath_16))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.1.'%'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'%']", lpath_16 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1.'%']", lpath_16))
             return False
     return True
 
@@ -1327,7 +1340,7 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
+        lpath_14: Path = (path, prop) if path is not None else None
         if prop == "|":
             # handle must | property
             must_count += 1
@@ -1335,15 +1348,15 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_9_idx, arr_9_item in enumerate(pval):
-                    arr_9_lpath: Path = ((lpath_14 if path is not None else None) + [ arr_9_idx ]) if (lpath_14 if path is not None else None) is not None else None
+                    arr_9_lpath: Path = (lpath_14, arr_9_idx) if lpath_14 is not None else None
                     # .'$Model#Root'.'|'.1.'|'.0
-                    res = json_model_20(arr_9_item, arr_9_lpath if (lpath_14 if path is not None else None) is not None else None, rep)
+                    res = json_model_20(arr_9_item, arr_9_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.1.'|'.0]", arr_9_lpath if (lpath_14 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Model#Root'.'|'.1.'|'.0]", arr_9_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'|']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.1.'|']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.1.'|']", lpath_14))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.1.'|']", lpath_14))
                 return False
             continue
         if prop == "#":
@@ -1351,35 +1364,35 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'#']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'#']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.1.'#']", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'#']", lpath_14))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.1.'$'
-            res = _jm_obj_15(pval, lpath_14 if path is not None else None, rep)
+            res = _jm_obj_15(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'$']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'$']", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'$']", lpath_14))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.1.'%'
-            res = _jm_obj_16(pval, lpath_14 if path is not None else None, rep)
+            res = _jm_obj_16(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'%']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.1.'%']", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'%']", lpath_14))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.1.'~'
-            res = json_model_4(pval, lpath_14 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'~']", lpath_14 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'~']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.1.'~']", lpath_14))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.1.'~']", lpath_14))
                 return False
             continue
         if prop.startswith("#"):
@@ -1387,7 +1400,7 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1]", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.1]", lpath_14))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1403,14 +1416,14 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Model#Root'.'|'.0.'$'.''
-            res = json_model_4(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'$'.'']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'$'.'']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'']", lpath_18))
                 return False
             continue
         elif prop == "#":
@@ -1418,23 +1431,23 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'$'.'#']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'#']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'$'.'#']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$'.'#']", lpath_18))
                 return False
             continue
-        if json_model_6(prop, lpath_18 if path is not None else None, rep):
+        if json_model_6(prop, lpath_18, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.0.'$'.'$Identifier'
-            res = json_model_35(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'$'.'$Identifier']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'$'.'$Identifier']", lpath_18))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.0.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'$']", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'$']", lpath_18))
             return False
     return True
 
@@ -1445,56 +1458,56 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Model#Root'.'|'.0.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'%'.'#']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'#']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'%'.'#']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'#']", lpath_19))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Model#Root'.'|'.0.'%'.'<'
             # .'$Model#Root'.'|'.0.'%'.'<'.'|'.0
-            res = json_model_9(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_9(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.0]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.0]", lpath_19))
                 # .'$Model#Root'.'|'.0.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_11_idx, arr_11_item in enumerate(pval):
-                        arr_11_lpath: Path = ((lpath_19 if path is not None else None) + [ arr_11_idx ]) if (lpath_19 if path is not None else None) is not None else None
+                        arr_11_lpath: Path = (lpath_19, arr_11_idx) if lpath_19 is not None else None
                         # .'$Model#Root'.'|'.0.'%'.'<'.'|'.1.0
-                        res = json_model_9(arr_11_item, arr_11_lpath if (lpath_19 if path is not None else None) is not None else None, rep)
+                        res = json_model_9(arr_11_item, arr_11_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1.0]", arr_11_lpath if (lpath_19 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1.0]", arr_11_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1]", lpath_19 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Model#Root'.'|'.0.'%'.'<'.'|'.1]", lpath_19))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.0.'%'.'<'.'|']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'<']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Model#Root'.'|'.0.'%'.'<'.'|']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%'.'<']", lpath_19))
                 return False
             continue
-        if json_model_13(prop, lpath_19 if path is not None else None, rep):
+        if json_model_13(prop, lpath_19, rep):
             # handle 1 key props
             # .'$Model#Root'.'|'.0.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_7(pval, lpath_19 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_7(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.0.'%'.'$Name']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Model#Root'.'|'.0.'%'.'$Name']", lpath_19))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Model#Root'.'|'.0.'%'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'%']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0.'%']", lpath_19))
             return False
     return True
 
@@ -1506,15 +1519,15 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$Model#Root'.'|'.0.'@'
-            res = json_model_35(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_35(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'@']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.0.'@']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Model#Root'.'|'.0.'@']", lpath_17))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Model#Root'.'|'.0.'@']", lpath_17))
                 return False
             continue
         if prop == "!":
@@ -1522,8 +1535,8 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Model#Root'.'|'.0.'!']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'!']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Model#Root'.'|'.0.'!']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'!']", lpath_17))
                 return False
             continue
         elif prop == "#":
@@ -1531,35 +1544,35 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Model#Root'.'|'.0.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'#']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'#']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Model#Root'.'|'.0.'#']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'#']", lpath_17))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Model#Root'.'|'.0.'$'
-            res = _jm_obj_18(pval, lpath_17 if path is not None else None, rep)
+            res = _jm_obj_18(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'$']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'$']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'$']", lpath_17))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Model#Root'.'|'.0.'%'
-            res = _jm_obj_19(pval, lpath_17 if path is not None else None, rep)
+            res = _jm_obj_19(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'%']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Model#Root'.'|'.0.'%']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'%']", lpath_17))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Model#Root'.'|'.0.'~'
-            res = json_model_4(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_4(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'~']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'~']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Model#Root'.'|'.0.'~']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$Model#Root'.'|'.0.'~']", lpath_17))
                 return False
             continue
         if prop.startswith("#"):
@@ -1569,19 +1582,19 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_3(prop, path, rep):
             # handle 3 re props
             # .'$Model#Root'.'|'.0.'/^(<=|>=|<|>)$/'
-            res = json_model_14(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_14(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Root'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$Model#Root'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_17))
                 return False
         elif _jm_re_4(prop, path, rep):
             # handle 3 re props
             # .'$Model#Root'.'|'.0.'/^(=|!=)$/'
-            res = json_model_15(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_15(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Model#Root'.'|'.0.'/^(=|!=)$/']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Model#Root'.'|'.0.'/^(=|!=)$/']", lpath_17))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0]", lpath_17 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Model#Root'.'|'.0]", lpath_17))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1760,5 +1773,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -113,14 +126,14 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$ObjectComment'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$ObjectComment'.'#']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$ObjectComment'.'#']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$ObjectComment'.'#']", lpath_0))
+                rep is None or rep.append(("invalid optional prop value [.'$ObjectComment'.'#']", lpath_0))
                 return False
             continue
         if prop.startswith("#"):
@@ -128,7 +141,7 @@ def json_model_6(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$ObjectComment'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$ObjectComment']", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$ObjectComment']", lpath_0))
             return False
     return True
 
@@ -371,11 +384,11 @@ def json_model_19(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool = isinstance(val, list)
     if res:
         for arr_0_idx, arr_0_item in enumerate(val):
-            arr_0_lpath: Path = (path + [ arr_0_idx ]) if path is not None else None
+            arr_0_lpath: Path = (path, arr_0_idx) if path is not None else None
             # .'$Array'.0
-            res = json_model_18(arr_0_item, arr_0_lpath if path is not None else None, rep)
+            res = json_model_18(arr_0_item, arr_0_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CModel [.'$Array'.0]", arr_0_lpath if path is not None else None))
+                rep is None or rep.append(("unexpected $CModel [.'$Array'.0]", arr_0_lpath))
                 break
     if not res:
         rep is None or rep.append(("not array or unexpected array [.'$Array']", path))
@@ -400,15 +413,15 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$Constraint'.'@'
-            res = json_model_33(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Constraint'.'@']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Constraint'.'@']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Constraint'.'@']", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Constraint'.'@']", lpath_1))
                 return False
             continue
         if prop == "!":
@@ -416,26 +429,26 @@ def json_model_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Constraint'.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Constraint'.'!']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Constraint'.'!']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Constraint'.'!']", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$Constraint'.'!']", lpath_1))
                 return False
             continue
         if _jm_re_7(prop, path, rep):
             # handle 2 re props
             # .'$Constraint'.'/^(<=|>=|<|>)$/'
-            res = json_model_12(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_12(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$Constraint'.'/^(<=|>=|<|>)$/']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$Constraint'.'/^(<=|>=|<|>)$/']", lpath_1))
                 return False
         elif _jm_re_8(prop, path, rep):
             # handle 2 re props
             # .'$Constraint'.'/^(=|!=)$/'
-            res = json_model_13(pval, lpath_1 if path is not None else None, rep)
+            res = json_model_13(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Constraint'.'/^(=|!=)$/']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Constraint'.'/^(=|!=)$/']", lpath_1))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Constraint']", lpath_1 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Constraint']", lpath_1))
             return False
     if must_count != 1:
         if rep is not None:
@@ -460,20 +473,20 @@ def json_model_22(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("|", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <|> [.'$Or']", path))
         return False
-    lpath = (path + [ "|" ]) if path is not None else None
+    lpath = (path, "|") if path is not None else None
     # .'$Or'.'|'
     res = isinstance(pval, list)
     if res:
         for arr_1_idx, arr_1_item in enumerate(pval):
-            arr_1_lpath: Path = ((lpath if path is not None else None) + [ arr_1_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_1_lpath: Path = (lpath, arr_1_idx) if lpath is not None else None
             # .'$Or'.'|'.0
-            res = json_model_18(arr_1_item, arr_1_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_18(arr_1_item, arr_1_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CModel [.'$Or'.'|'.0]", arr_1_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $CModel [.'$Or'.'|'.0]", arr_1_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$Or'.'|']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <|> [.'$Or']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$Or'.'|']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <|> [.'$Or']", lpath))
         return False
     return True
 
@@ -493,20 +506,20 @@ def json_model_23(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("&", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <&> [.'$And']", path))
         return False
-    lpath = (path + [ "&" ]) if path is not None else None
+    lpath = (path, "&") if path is not None else None
     # .'$And'.'&'
     res = isinstance(pval, list)
     if res:
         for arr_2_idx, arr_2_item in enumerate(pval):
-            arr_2_lpath: Path = ((lpath if path is not None else None) + [ arr_2_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_2_lpath: Path = (lpath, arr_2_idx) if lpath is not None else None
             # .'$And'.'&'.0
-            res = json_model_18(arr_2_item, arr_2_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_18(arr_2_item, arr_2_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CModel [.'$And'.'&'.0]", arr_2_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $CModel [.'$And'.'&'.0]", arr_2_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$And'.'&']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <&> [.'$And']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$And'.'&']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <&> [.'$And']", lpath))
         return False
     return True
 
@@ -526,20 +539,20 @@ def json_model_24(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("^", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <^> [.'$Xor']", path))
         return False
-    lpath = (path + [ "^" ]) if path is not None else None
+    lpath = (path, "^") if path is not None else None
     # .'$Xor'.'^'
     res = isinstance(pval, list)
     if res:
         for arr_3_idx, arr_3_item in enumerate(pval):
-            arr_3_lpath: Path = ((lpath if path is not None else None) + [ arr_3_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_3_lpath: Path = (lpath, arr_3_idx) if lpath is not None else None
             # .'$Xor'.'^'.0
-            res = json_model_18(arr_3_item, arr_3_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_18(arr_3_item, arr_3_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CModel [.'$Xor'.'^'.0]", arr_3_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $CModel [.'$Xor'.'^'.0]", arr_3_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$Xor'.'^']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <^> [.'$Xor']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$Xor'.'^']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <^> [.'$Xor']", lpath))
         return False
     return True
 
@@ -559,20 +572,20 @@ def json_model_25(val: Jsonable, path: Path, rep: Report) -> bool:
     if not ((pval := val.get("+", UNDEFINED)) != UNDEFINED):
         rep is None or rep.append(("missing mandatory prop <+> [.'$Add']", path))
         return False
-    lpath = (path + [ "+" ]) if path is not None else None
+    lpath = (path, "+") if path is not None else None
     # .'$Add'.'+'
     res = isinstance(pval, list)
     if res:
         for arr_4_idx, arr_4_item in enumerate(pval):
-            arr_4_lpath: Path = ((lpath if path is not None else None) + [ arr_4_idx ]) if (lpath if path is not None else None) is not None else None
+            arr_4_lpath: Path = (lpath, arr_4_idx) if lpath is not None else None
             # .'$Add'.'+'.0
-            res = json_model_18(arr_4_item, arr_4_lpath if (lpath if path is not None else None) is not None else None, rep)
+            res = json_model_18(arr_4_item, arr_4_lpath, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CModel [.'$Add'.'+'.0]", arr_4_lpath if (lpath if path is not None else None) is not None else None))
+                rep is None or rep.append(("unexpected $CModel [.'$Add'.'+'.0]", arr_4_lpath))
                 break
     if not res:
-        rep is None or rep.append(("not array or unexpected array [.'$Add'.'+']", lpath if path is not None else None))
-        rep is None or rep.append(("unexpected value for mandatory prop <+> [.'$Add']", lpath if path is not None else None))
+        rep is None or rep.append(("not array or unexpected array [.'$Add'.'+']", lpath))
+        rep is None or rep.append(("unexpected value for mandatory prop <+> [.'$Add']", lpath))
         return False
     return True
 
@@ -619,16 +632,16 @@ def json_model_27(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
-        if json_model_26(prop, lpath_2 if path is not None else None, rep):
+        lpath_2: Path = (path, prop) if path is not None else None
+        if json_model_26(prop, lpath_2, rep):
             # handle 1 key props
             # .'$Obj'.'$Prop'
-            res = json_model_33(pval, lpath_2 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Obj'.'$Prop']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Obj'.'$Prop']", lpath_2))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Obj']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Obj']", lpath_2))
             return False
     return True
 
@@ -672,29 +685,29 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_3: Path = (path + [ prop ]) if path is not None else None
+        lpath_3: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Element'.'|'.5.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Element'.'|'.5.'#']", lpath_3 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.5.'#']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Element'.'|'.5.'#']", lpath_3))
+                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.5.'#']", lpath_3))
                 return False
             continue
-        if json_model_26(prop, lpath_3 if path is not None else None, rep):
+        if json_model_26(prop, lpath_3, rep):
             # handle 1 key props
             # .'$Element'.'|'.5.'$Prop'
-            res = json_model_33(pval, lpath_3 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_3, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Element'.'|'.5.'$Prop']", lpath_3 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Element'.'|'.5.'$Prop']", lpath_3))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Element'.'|'.5.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.5]", lpath_3 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.5]", lpath_3))
             return False
     return True
 
@@ -706,7 +719,7 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_4: Path = (path + [ prop ]) if path is not None else None
+        lpath_4: Path = (path, prop) if path is not None else None
         if prop == "+":
             # handle must + property
             must_count += 1
@@ -714,15 +727,15 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_5_idx, arr_5_item in enumerate(pval):
-                    arr_5_lpath: Path = ((lpath_4 if path is not None else None) + [ arr_5_idx ]) if (lpath_4 if path is not None else None) is not None else None
+                    arr_5_lpath: Path = (lpath_4, arr_5_idx) if lpath_4 is not None else None
                     # .'$Element'.'|'.4.'+'.0
-                    res = json_model_18(arr_5_item, arr_5_lpath if (lpath_4 if path is not None else None) is not None else None, rep)
+                    res = json_model_18(arr_5_item, arr_5_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Element'.'|'.4.'+'.0]", arr_5_lpath if (lpath_4 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Element'.'|'.4.'+'.0]", arr_5_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Element'.'|'.4.'+']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.4.'+']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Element'.'|'.4.'+']", lpath_4))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.4.'+']", lpath_4))
                 return False
             continue
         if prop == "#":
@@ -730,8 +743,8 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.4.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Element'.'|'.4.'#']", lpath_4 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.4.'#']", lpath_4 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Element'.'|'.4.'#']", lpath_4))
+                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.4.'#']", lpath_4))
                 return False
             continue
         if prop.startswith("#"):
@@ -739,7 +752,7 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.4.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.4]", lpath_4 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.4]", lpath_4))
             return False
     if must_count != 1:
         if rep is not None:
@@ -756,7 +769,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_5: Path = (path + [ prop ]) if path is not None else None
+        lpath_5: Path = (path, prop) if path is not None else None
         if prop == "^":
             # handle must ^ property
             must_count += 1
@@ -764,15 +777,15 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_6_idx, arr_6_item in enumerate(pval):
-                    arr_6_lpath: Path = ((lpath_5 if path is not None else None) + [ arr_6_idx ]) if (lpath_5 if path is not None else None) is not None else None
+                    arr_6_lpath: Path = (lpath_5, arr_6_idx) if lpath_5 is not None else None
                     # .'$Element'.'|'.3.'^'.0
-                    res = json_model_18(arr_6_item, arr_6_lpath if (lpath_5 if path is not None else None) is not None else None, rep)
+                    res = json_model_18(arr_6_item, arr_6_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Element'.'|'.3.'^'.0]", arr_6_lpath if (lpath_5 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Element'.'|'.3.'^'.0]", arr_6_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Element'.'|'.3.'^']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.3.'^']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Element'.'|'.3.'^']", lpath_5))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.3.'^']", lpath_5))
                 return False
             continue
         if prop == "#":
@@ -780,8 +793,8 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.3.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Element'.'|'.3.'#']", lpath_5 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.3.'#']", lpath_5 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Element'.'|'.3.'#']", lpath_5))
+                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.3.'#']", lpath_5))
                 return False
             continue
         if prop.startswith("#"):
@@ -789,7 +802,7 @@ def _jm_obj_2(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.3.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.3]", lpath_5 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.3]", lpath_5))
             return False
     if must_count != 1:
         if rep is not None:
@@ -806,7 +819,7 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_6: Path = (path + [ prop ]) if path is not None else None
+        lpath_6: Path = (path, prop) if path is not None else None
         if prop == "&":
             # handle must & property
             must_count += 1
@@ -814,15 +827,15 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_7_idx, arr_7_item in enumerate(pval):
-                    arr_7_lpath: Path = ((lpath_6 if path is not None else None) + [ arr_7_idx ]) if (lpath_6 if path is not None else None) is not None else None
+                    arr_7_lpath: Path = (lpath_6, arr_7_idx) if lpath_6 is not None else None
                     # .'$Element'.'|'.2.'&'.0
-                    res = json_model_18(arr_7_item, arr_7_lpath if (lpath_6 if path is not None else None) is not None else None, rep)
+                    res = json_model_18(arr_7_item, arr_7_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Element'.'|'.2.'&'.0]", arr_7_lpath if (lpath_6 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Element'.'|'.2.'&'.0]", arr_7_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Element'.'|'.2.'&']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.2.'&']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Element'.'|'.2.'&']", lpath_6))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.2.'&']", lpath_6))
                 return False
             continue
         if prop == "#":
@@ -830,8 +843,8 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.2.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Element'.'|'.2.'#']", lpath_6 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.2.'#']", lpath_6 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Element'.'|'.2.'#']", lpath_6))
+                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.2.'#']", lpath_6))
                 return False
             continue
         if prop.startswith("#"):
@@ -839,7 +852,7 @@ def _jm_obj_3(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.2.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.2]", lpath_6 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.2]", lpath_6))
             return False
     if must_count != 1:
         if rep is not None:
@@ -856,7 +869,7 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_7: Path = (path + [ prop ]) if path is not None else None
+        lpath_7: Path = (path, prop) if path is not None else None
         if prop == "|":
             # handle must | property
             must_count += 1
@@ -864,15 +877,15 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_8_idx, arr_8_item in enumerate(pval):
-                    arr_8_lpath: Path = ((lpath_7 if path is not None else None) + [ arr_8_idx ]) if (lpath_7 if path is not None else None) is not None else None
+                    arr_8_lpath: Path = (lpath_7, arr_8_idx) if lpath_7 is not None else None
                     # .'$Element'.'|'.1.'|'.0
-                    res = json_model_18(arr_8_item, arr_8_lpath if (lpath_7 if path is not None else None) is not None else None, rep)
+                    res = json_model_18(arr_8_item, arr_8_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Element'.'|'.1.'|'.0]", arr_8_lpath if (lpath_7 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Element'.'|'.1.'|'.0]", arr_8_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Element'.'|'.1.'|']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.1.'|']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Element'.'|'.1.'|']", lpath_7))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.1.'|']", lpath_7))
                 return False
             continue
         if prop == "#":
@@ -880,8 +893,8 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Element'.'|'.1.'#']", lpath_7 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.1.'#']", lpath_7 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Element'.'|'.1.'#']", lpath_7))
+                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.1.'#']", lpath_7))
                 return False
             continue
         if prop.startswith("#"):
@@ -889,7 +902,7 @@ def _jm_obj_4(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.1]", lpath_7 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.1]", lpath_7))
             return False
     if must_count != 1:
         if rep is not None:
@@ -906,15 +919,15 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_8: Path = (path + [ prop ]) if path is not None else None
+        lpath_8: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$Element'.'|'.0.'@'
-            res = json_model_33(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Element'.'|'.0.'@']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.0.'@']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Element'.'|'.0.'@']", lpath_8))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Element'.'|'.0.'@']", lpath_8))
                 return False
             continue
         if prop == "!":
@@ -922,8 +935,8 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.0.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Element'.'|'.0.'!']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.0.'!']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Element'.'|'.0.'!']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.0.'!']", lpath_8))
                 return False
             continue
         elif prop == "#":
@@ -931,8 +944,8 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Element'.'|'.0.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Element'.'|'.0.'#']", lpath_8 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.0.'#']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Element'.'|'.0.'#']", lpath_8))
+                rep is None or rep.append(("invalid optional prop value [.'$Element'.'|'.0.'#']", lpath_8))
                 return False
             continue
         if prop.startswith("#"):
@@ -942,19 +955,19 @@ def _jm_obj_5(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_7(prop, path, rep):
             # handle 3 re props
             # .'$Element'.'|'.0.'/^(<=|>=|<|>)$/'
-            res = json_model_12(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_12(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$Element'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_8))
                 return False
         elif _jm_re_8(prop, path, rep):
             # handle 3 re props
             # .'$Element'.'|'.0.'/^(=|!=)$/'
-            res = json_model_13(pval, lpath_8 if path is not None else None, rep)
+            res = json_model_13(pval, lpath_8, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Element'.'|'.0.'/^(=|!=)$/']", lpath_8 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Element'.'|'.0.'/^(=|!=)$/']", lpath_8))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.0]", lpath_8 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Element'.'|'.0]", lpath_8))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1007,12 +1020,12 @@ def _jm_obj_6(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_10: Path = (path + [ prop ]) if path is not None else None
+        lpath_10: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Trafo'.'~'.''
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$Trafo'.'~'.'']", lpath_10 if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$Trafo'.'~'.'']", lpath_10))
             return False
     return True
 
@@ -1025,7 +1038,7 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_9: Path = (path + [ prop ]) if path is not None else None
+        lpath_9: Path = (path, prop) if path is not None else None
         if prop == "*":
             # handle may * property
             # .'$Trafo'.'*'
@@ -1035,30 +1048,30 @@ def json_model_30(val: Jsonable, path: Path, rep: Report) -> bool:
             # handle may / property
             # .'$Trafo'.'/'
             # .'$Trafo'.'/'.'|'.0
-            res = json_model_13(pval, lpath_9 if path is not None else None, rep)
+            res = json_model_13(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Trafo'.'/'.'|'.0]", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Trafo'.'/'.'|'.0]", lpath_9))
                 # .'$Trafo'.'/'.'|'.1
                 res = isinstance(pval, list)
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Trafo'.'/'.'|'.1]", lpath_9 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Trafo'.'/'.'|'.1]", lpath_9))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Trafo'.'/'.'|']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Trafo'.'/']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Trafo'.'/'.'|']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Trafo'.'/']", lpath_9))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Trafo'.'~'
-            res = _jm_obj_6(pval, lpath_9 if path is not None else None, rep)
+            res = _jm_obj_6(pval, lpath_9, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Trafo'.'~']", lpath_9 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Trafo'.'~']", lpath_9 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Trafo'.'~']", lpath_9))
+                rep is None or rep.append(("invalid optional prop value [.'$Trafo'.'~']", lpath_9))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Trafo']", lpath_9 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Trafo']", lpath_9))
         return False
     return True
 
@@ -1069,12 +1082,12 @@ def _jm_obj_8(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_12: Path = (path + [ prop ]) if path is not None else None
+        lpath_12: Path = (path, prop) if path is not None else None
         # handle other props
         # .'$Transformation'.'|'.1.'~'.''
         res = isinstance(pval, str)
         if not res:
-            rep is None or rep.append(("unexpected string [.'$Transformation'.'|'.1.'~'.'']", lpath_12 if path is not None else None))
+            rep is None or rep.append(("unexpected string [.'$Transformation'.'|'.1.'~'.'']", lpath_12))
             return False
     return True
 
@@ -1085,14 +1098,14 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_11: Path = (path + [ prop ]) if path is not None else None
+        lpath_11: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Transformation'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Transformation'.'|'.1.'#']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Transformation'.'|'.1.'#']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Transformation'.'|'.1.'#']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Transformation'.'|'.1.'#']", lpath_11))
                 return False
             continue
         elif prop == "*":
@@ -1104,27 +1117,27 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # handle may / property
             # .'$Transformation'.'|'.1.'/'
             # .'$Transformation'.'|'.1.'/'.'|'.0
-            res = json_model_13(pval, lpath_11 if path is not None else None, rep)
+            res = json_model_13(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Transformation'.'|'.1.'/'.'|'.0]", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Transformation'.'|'.1.'/'.'|'.0]", lpath_11))
                 # .'$Transformation'.'|'.1.'/'.'|'.1
                 res = isinstance(pval, list)
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Transformation'.'|'.1.'/'.'|'.1]", lpath_11 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Transformation'.'|'.1.'/'.'|'.1]", lpath_11))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Transformation'.'|'.1.'/'.'|']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Transformation'.'|'.1.'/']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Transformation'.'|'.1.'/'.'|']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Transformation'.'|'.1.'/']", lpath_11))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Transformation'.'|'.1.'~'
-            res = _jm_obj_8(pval, lpath_11 if path is not None else None, rep)
+            res = _jm_obj_8(pval, lpath_11, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Transformation'.'|'.1.'~']", lpath_11 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Transformation'.'|'.1.'~']", lpath_11 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Transformation'.'|'.1.'~']", lpath_11))
+                rep is None or rep.append(("invalid optional prop value [.'$Transformation'.'|'.1.'~']", lpath_11))
                 return False
             continue
         if prop.startswith("#"):
@@ -1132,7 +1145,7 @@ def _jm_obj_7(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Transformation'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Transformation'.'|'.1]", lpath_11 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Transformation'.'|'.1]", lpath_11))
             return False
     return True
 
@@ -1199,25 +1212,25 @@ def json_model_34(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_13: Path = (path + [ prop ]) if path is not None else None
+        lpath_13: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Defs'.''
-            res = json_model_2(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Defs'.'']", lpath_13 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Defs'.'']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Defs'.'']", lpath_13))
+                rep is None or rep.append(("invalid optional prop value [.'$Defs'.'']", lpath_13))
                 return False
             continue
-        if json_model_4(prop, lpath_13 if path is not None else None, rep):
+        if json_model_4(prop, lpath_13, rep):
             # handle 1 key props
             # .'$Defs'.'$Identifier'
-            res = json_model_33(pval, lpath_13 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_13, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Defs'.'$Identifier']", lpath_13 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Defs'.'$Identifier']", lpath_13))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Defs']", lpath_13 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Defs']", lpath_13))
             return False
     return True
 
@@ -1230,17 +1243,17 @@ def json_model_35(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_14: Path = (path + [ prop ]) if path is not None else None
-        if json_model_11(prop, lpath_14 if path is not None else None, rep):
+        lpath_14: Path = (path, prop) if path is not None else None
+        if json_model_11(prop, lpath_14, rep):
             # handle 1 key props
             # .'$Rename'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_10(pval, lpath_14 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_10(pval, lpath_14, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Rename'.'$Name']", lpath_14 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Rename'.'$Name']", lpath_14))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Rename']", lpath_14 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Rename']", lpath_14))
             return False
     return True
 
@@ -1253,16 +1266,16 @@ def json_model_36(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_15: Path = (path + [ prop ]) if path is not None else None
+        lpath_15: Path = (path, prop) if path is not None else None
         if _jm_re_11(prop, path, rep):
             # handle 1 re props
             # .'$Rewrite'.'/^\\$.*$/'
-            res = json_model_31(pval, lpath_15 if path is not None else None, rep)
+            res = json_model_31(pval, lpath_15, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Rewrite'.'/^\\\\$.*$/']", lpath_15 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Rewrite'.'/^\\\\$.*$/']", lpath_15))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Rewrite']", lpath_15 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Rewrite']", lpath_15))
             return False
     return True
 
@@ -1274,34 +1287,34 @@ def json_model_37(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_16: Path = (path + [ prop ]) if path is not None else None
+        lpath_16: Path = (path, prop) if path is not None else None
         if prop == "<":
             # handle may < property
             # .'$Import'.'<'
             # .'$Import'.'<'.'|'.0
-            res = json_model_7(pval, lpath_16 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_16, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Import'.'<'.'|'.0]", lpath_16 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Import'.'<'.'|'.0]", lpath_16))
                 # .'$Import'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_9_idx, arr_9_item in enumerate(pval):
-                        arr_9_lpath: Path = ((lpath_16 if path is not None else None) + [ arr_9_idx ]) if (lpath_16 if path is not None else None) is not None else None
+                        arr_9_lpath: Path = (lpath_16, arr_9_idx) if lpath_16 is not None else None
                         # .'$Import'.'<'.'|'.1.0
-                        res = json_model_7(arr_9_item, arr_9_lpath if (lpath_16 if path is not None else None) is not None else None, rep)
+                        res = json_model_7(arr_9_item, arr_9_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Import'.'<'.'|'.1.0]", arr_9_lpath if (lpath_16 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Import'.'<'.'|'.1.0]", arr_9_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Import'.'<'.'|'.1]", lpath_16 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Import'.'<'.'|'.1]", lpath_16))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Import'.'<'.'|']", lpath_16 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Import'.'<']", lpath_16 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Import'.'<'.'|']", lpath_16))
+                rep is None or rep.append(("invalid optional prop value [.'$Import'.'<']", lpath_16))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$Import']", lpath_16 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$Import']", lpath_16))
         return False
     return True
 
@@ -1312,14 +1325,14 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_18: Path = (path + [ prop ]) if path is not None else None
+        lpath_18: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$RootOnly'.'$'.''
-            res = json_model_2(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$RootOnly'.'$'.'']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'$'.'']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$RootOnly'.'$'.'']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'$'.'']", lpath_18))
                 return False
             continue
         elif prop == "#":
@@ -1327,23 +1340,23 @@ def _jm_obj_9(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$RootOnly'.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$RootOnly'.'$'.'#']", lpath_18 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'$'.'#']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$RootOnly'.'$'.'#']", lpath_18))
+                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'$'.'#']", lpath_18))
                 return False
             continue
-        if json_model_4(prop, lpath_18 if path is not None else None, rep):
+        if json_model_4(prop, lpath_18, rep):
             # handle 1 key props
             # .'$RootOnly'.'$'.'$Identifier'
-            res = json_model_33(pval, lpath_18 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_18, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$RootOnly'.'$'.'$Identifier']", lpath_18 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$RootOnly'.'$'.'$Identifier']", lpath_18))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$RootOnly'.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$RootOnly'.'$']", lpath_18 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$RootOnly'.'$']", lpath_18))
             return False
     return True
 
@@ -1354,49 +1367,49 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_19: Path = (path + [ prop ]) if path is not None else None
+        lpath_19: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$RootOnly'.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$RootOnly'.'%'.'#']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'%'.'#']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$RootOnly'.'%'.'#']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'%'.'#']", lpath_19))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$RootOnly'.'%'.'<'
             # .'$RootOnly'.'%'.'<'.'|'.0
-            res = json_model_7(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$RootOnly'.'%'.'<'.'|'.0]", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$RootOnly'.'%'.'<'.'|'.0]", lpath_19))
                 # .'$RootOnly'.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_10_idx, arr_10_item in enumerate(pval):
-                        arr_10_lpath: Path = ((lpath_19 if path is not None else None) + [ arr_10_idx ]) if (lpath_19 if path is not None else None) is not None else None
+                        arr_10_lpath: Path = (lpath_19, arr_10_idx) if lpath_19 is not None else None
                         # .'$RootOnly'.'%'.'<'.'|'.1.0
-                        res = json_model_7(arr_10_item, arr_10_lpath if (lpath_19 if path is not None else None) is not None else None, rep)
+                        res = json_model_7(arr_10_item, arr_10_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$RootOnly'.'%'.'<'.'|'.1.0]", arr_10_lpath if (lpath_19 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$RootOnly'.'%'.'<'.'|'.1.0]", arr_10_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$RootOnly'.'%'.'<'.'|'.1]", lpath_19 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$RootOnly'.'%'.'<'.'|'.1]", lpath_19))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$RootOnly'.'%'.'<'.'|']", lpath_19 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'%'.'<']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$RootOnly'.'%'.'<'.'|']", lpath_19))
+                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'%'.'<']", lpath_19))
                 return False
             continue
-        if json_model_11(prop, lpath_19 if path is not None else None, rep):
+        if json_model_11(prop, lpath_19, rep):
             # handle 1 key props
             # .'$RootOnly'.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_10(pval, lpath_19 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_10(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$RootOnly'.'%'.'$Name']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$RootOnly'.'%'.'$Name']", lpath_19))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1405,12 +1418,12 @@ def _jm_obj_10(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_11(prop, path, rep):
             # handle 2 re props
             # .'$RootOnly'.'%'.'/^\\$.*$/'
-            res = json_model_31(pval, lpath_19 if path is not None else None, rep)
+            res = json_model_31(pval, lpath_19, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$RootOnly'.'%'.'/^\\\\$.*$/']", lpath_19 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$RootOnly'.'%'.'/^\\\\$.*$/']", lpath_19))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$RootOnly'.'%']", lpath_19 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$RootOnly'.'%']", lpath_19))
             return False
     return True
 
@@ -1423,35 +1436,35 @@ def json_model_38(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_17: Path = (path + [ prop ]) if path is not None else None
+        lpath_17: Path = (path, prop) if path is not None else None
         if prop == "$":
             # handle may $ property
             # .'$RootOnly'.'$'
-            res = _jm_obj_9(pval, lpath_17 if path is not None else None, rep)
+            res = _jm_obj_9(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$RootOnly'.'$']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'$']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$RootOnly'.'$']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'$']", lpath_17))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$RootOnly'.'%'
-            res = _jm_obj_10(pval, lpath_17 if path is not None else None, rep)
+            res = _jm_obj_10(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$RootOnly'.'%']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'%']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$RootOnly'.'%']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'%']", lpath_17))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$RootOnly'.'~'
-            res = json_model_2(pval, lpath_17 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_17, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$RootOnly'.'~']", lpath_17 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'~']", lpath_17 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$RootOnly'.'~']", lpath_17))
+                rep is None or rep.append(("invalid optional prop value [.'$RootOnly'.'~']", lpath_17))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$RootOnly']", lpath_17 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$RootOnly']", lpath_17))
         return False
     return True
 
@@ -1462,14 +1475,14 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_21: Path = (path + [ prop ]) if path is not None else None
+        lpath_21: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Root'.'|'.5.'$'.''
-            res = json_model_2(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.5.'$'.'']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'$'.'']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.5.'$'.'']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'$'.'']", lpath_21))
                 return False
             continue
         elif prop == "#":
@@ -1477,23 +1490,23 @@ def _jm_obj_12(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.5.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.5.'$'.'#']", lpath_21 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'$'.'#']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.5.'$'.'#']", lpath_21))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'$'.'#']", lpath_21))
                 return False
             continue
-        if json_model_4(prop, lpath_21 if path is not None else None, rep):
+        if json_model_4(prop, lpath_21, rep):
             # handle 1 key props
             # .'$Root'.'|'.5.'$'.'$Identifier'
-            res = json_model_33(pval, lpath_21 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_21, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.5.'$'.'$Identifier']", lpath_21 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.5.'$'.'$Identifier']", lpath_21))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Root'.'|'.5.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.5.'$']", lpath_21 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.5.'$']", lpath_21))
             return False
     return True
 
@@ -1504,49 +1517,49 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_22: Path = (path + [ prop ]) if path is not None else None
+        lpath_22: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Root'.'|'.5.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.5.'%'.'#']", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'%'.'#']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.5.'%'.'#']", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'%'.'#']", lpath_22))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Root'.'|'.5.'%'.'<'
             # .'$Root'.'|'.5.'%'.'<'.'|'.0
-            res = json_model_7(pval, lpath_22 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.5.'%'.'<'.'|'.0]", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.5.'%'.'<'.'|'.0]", lpath_22))
                 # .'$Root'.'|'.5.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_11_idx, arr_11_item in enumerate(pval):
-                        arr_11_lpath: Path = ((lpath_22 if path is not None else None) + [ arr_11_idx ]) if (lpath_22 if path is not None else None) is not None else None
+                        arr_11_lpath: Path = (lpath_22, arr_11_idx) if lpath_22 is not None else None
                         # .'$Root'.'|'.5.'%'.'<'.'|'.1.0
-                        res = json_model_7(arr_11_item, arr_11_lpath if (lpath_22 if path is not None else None) is not None else None, rep)
+                        res = json_model_7(arr_11_item, arr_11_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.5.'%'.'<'.'|'.1.0]", arr_11_lpath if (lpath_22 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.5.'%'.'<'.'|'.1.0]", arr_11_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.5.'%'.'<'.'|'.1]", lpath_22 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.5.'%'.'<'.'|'.1]", lpath_22))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Root'.'|'.5.'%'.'<'.'|']", lpath_22 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'%'.'<']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Root'.'|'.5.'%'.'<'.'|']", lpath_22))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'%'.'<']", lpath_22))
                 return False
             continue
-        if json_model_11(prop, lpath_22 if path is not None else None, rep):
+        if json_model_11(prop, lpath_22, rep):
             # handle 1 key props
             # .'$Root'.'|'.5.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_10(pval, lpath_22 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_10(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.5.'%'.'$Name']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.5.'%'.'$Name']", lpath_22))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1555,12 +1568,12 @@ def _jm_obj_13(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_11(prop, path, rep):
             # handle 2 re props
             # .'$Root'.'|'.5.'%'.'/^\\$.*$/'
-            res = json_model_31(pval, lpath_22 if path is not None else None, rep)
+            res = json_model_31(pval, lpath_22, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.5.'%'.'/^\\\\$.*$/']", lpath_22 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.5.'%'.'/^\\\\$.*$/']", lpath_22))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.5.'%']", lpath_22 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.5.'%']", lpath_22))
             return False
     return True
 
@@ -1571,56 +1584,56 @@ def _jm_obj_11(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_20: Path = (path + [ prop ]) if path is not None else None
+        lpath_20: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Root'.'|'.5.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.5.'#']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'#']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.5.'#']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'#']", lpath_20))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Root'.'|'.5.'$'
-            res = _jm_obj_12(pval, lpath_20 if path is not None else None, rep)
+            res = _jm_obj_12(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.5.'$']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'$']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.5.'$']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'$']", lpath_20))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Root'.'|'.5.'%'
-            res = _jm_obj_13(pval, lpath_20 if path is not None else None, rep)
+            res = _jm_obj_13(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.5.'%']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'%']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.5.'%']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'%']", lpath_20))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Root'.'|'.5.'~'
-            res = json_model_2(pval, lpath_20 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.5.'~']", lpath_20 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'~']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.5.'~']", lpath_20))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.5.'~']", lpath_20))
                 return False
             continue
-        if json_model_26(prop, lpath_20 if path is not None else None, rep):
+        if json_model_26(prop, lpath_20, rep):
             # handle 1 key props
             # .'$Root'.'|'.5.'$Prop'
-            res = json_model_33(pval, lpath_20 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_20, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.5.'$Prop']", lpath_20 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.5.'$Prop']", lpath_20))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Root'.'|'.5.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.5]", lpath_20 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.5]", lpath_20))
             return False
     return True
 
@@ -1631,14 +1644,14 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_24: Path = (path + [ prop ]) if path is not None else None
+        lpath_24: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Root'.'|'.4.'$'.''
-            res = json_model_2(pval, lpath_24 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_24, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.4.'$'.'']", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'$'.'']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.4.'$'.'']", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'$'.'']", lpath_24))
                 return False
             continue
         elif prop == "#":
@@ -1646,23 +1659,23 @@ def _jm_obj_15(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.4.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.4.'$'.'#']", lpath_24 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'$'.'#']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.4.'$'.'#']", lpath_24))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'$'.'#']", lpath_24))
                 return False
             continue
-        if json_model_4(prop, lpath_24 if path is not None else None, rep):
+        if json_model_4(prop, lpath_24, rep):
             # handle 1 key props
             # .'$Root'.'|'.4.'$'.'$Identifier'
-            res = json_model_33(pval, lpath_24 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_24, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.4.'$'.'$Identifier']", lpath_24 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.4.'$'.'$Identifier']", lpath_24))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Root'.'|'.4.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.4.'$']", lpath_24 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.4.'$']", lpath_24))
             return False
     return True
 
@@ -1673,49 +1686,49 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_25: Path = (path + [ prop ]) if path is not None else None
+        lpath_25: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Root'.'|'.4.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.4.'%'.'#']", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'%'.'#']", lpath_25 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.4.'%'.'#']", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'%'.'#']", lpath_25))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Root'.'|'.4.'%'.'<'
             # .'$Root'.'|'.4.'%'.'<'.'|'.0
-            res = json_model_7(pval, lpath_25 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_25, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.4.'%'.'<'.'|'.0]", lpath_25 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.4.'%'.'<'.'|'.0]", lpath_25))
                 # .'$Root'.'|'.4.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_13_idx, arr_13_item in enumerate(pval):
-                        arr_13_lpath: Path = ((lpath_25 if path is not None else None) + [ arr_13_idx ]) if (lpath_25 if path is not None else None) is not None else None
+                        arr_13_lpath: Path = (lpath_25, arr_13_idx) if lpath_25 is not None else None
                         # .'$Root'.'|'.4.'%'.'<'.'|'.1.0
-                        res = json_model_7(arr_13_item, arr_13_lpath if (lpath_25 if path is not None else None) is not None else None, rep)
+                        res = json_model_7(arr_13_item, arr_13_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.4.'%'.'<'.'|'.1.0]", arr_13_lpath if (lpath_25 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.4.'%'.'<'.'|'.1.0]", arr_13_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.4.'%'.'<'.'|'.1]", lpath_25 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.4.'%'.'<'.'|'.1]", lpath_25))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Root'.'|'.4.'%'.'<'.'|']", lpath_25 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'%'.'<']", lpath_25 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Root'.'|'.4.'%'.'<'.'|']", lpath_25))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'%'.'<']", lpath_25))
                 return False
             continue
-        if json_model_11(prop, lpath_25 if path is not None else None, rep):
+        if json_model_11(prop, lpath_25, rep):
             # handle 1 key props
             # .'$Root'.'|'.4.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_10(pval, lpath_25 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_10(pval, lpath_25, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.4.'%'.'$Name']", lpath_25 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.4.'%'.'$Name']", lpath_25))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1724,12 +1737,12 @@ def _jm_obj_16(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_11(prop, path, rep):
             # handle 2 re props
             # .'$Root'.'|'.4.'%'.'/^\\$.*$/'
-            res = json_model_31(pval, lpath_25 if path is not None else None, rep)
+            res = json_model_31(pval, lpath_25, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.4.'%'.'/^\\\\$.*$/']", lpath_25 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.4.'%'.'/^\\\\$.*$/']", lpath_25))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.4.'%']", lpath_25 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.4.'%']", lpath_25))
             return False
     return True
 
@@ -1741,7 +1754,7 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_23: Path = (path + [ prop ]) if path is not None else None
+        lpath_23: Path = (path, prop) if path is not None else None
         if prop == "+":
             # handle must + property
             must_count += 1
@@ -1749,15 +1762,15 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_12_idx, arr_12_item in enumerate(pval):
-                    arr_12_lpath: Path = ((lpath_23 if path is not None else None) + [ arr_12_idx ]) if (lpath_23 if path is not None else None) is not None else None
+                    arr_12_lpath: Path = (lpath_23, arr_12_idx) if lpath_23 is not None else None
                     # .'$Root'.'|'.4.'+'.0
-                    res = json_model_18(arr_12_item, arr_12_lpath if (lpath_23 if path is not None else None) is not None else None, rep)
+                    res = json_model_18(arr_12_item, arr_12_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Root'.'|'.4.'+'.0]", arr_12_lpath if (lpath_23 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Root'.'|'.4.'+'.0]", arr_12_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.4.'+']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.4.'+']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.4.'+']", lpath_23))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.4.'+']", lpath_23))
                 return False
             continue
         if prop == "#":
@@ -1765,35 +1778,35 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.4.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.4.'#']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'#']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.4.'#']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'#']", lpath_23))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Root'.'|'.4.'$'
-            res = _jm_obj_15(pval, lpath_23 if path is not None else None, rep)
+            res = _jm_obj_15(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.4.'$']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'$']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.4.'$']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'$']", lpath_23))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Root'.'|'.4.'%'
-            res = _jm_obj_16(pval, lpath_23 if path is not None else None, rep)
+            res = _jm_obj_16(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.4.'%']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'%']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.4.'%']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'%']", lpath_23))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Root'.'|'.4.'~'
-            res = json_model_2(pval, lpath_23 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_23, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.4.'~']", lpath_23 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'~']", lpath_23 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.4.'~']", lpath_23))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.4.'~']", lpath_23))
                 return False
             continue
         if prop.startswith("#"):
@@ -1801,7 +1814,7 @@ def _jm_obj_14(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.4.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.4]", lpath_23 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.4]", lpath_23))
             return False
     if must_count != 1:
         if rep is not None:
@@ -1817,14 +1830,14 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_27: Path = (path + [ prop ]) if path is not None else None
+        lpath_27: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Root'.'|'.3.'$'.''
-            res = json_model_2(pval, lpath_27 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_27, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.3.'$'.'']", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'$'.'']", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.3.'$'.'']", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'$'.'']", lpath_27))
                 return False
             continue
         elif prop == "#":
@@ -1832,23 +1845,23 @@ def _jm_obj_18(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.3.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.3.'$'.'#']", lpath_27 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'$'.'#']", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.3.'$'.'#']", lpath_27))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'$'.'#']", lpath_27))
                 return False
             continue
-        if json_model_4(prop, lpath_27 if path is not None else None, rep):
+        if json_model_4(prop, lpath_27, rep):
             # handle 1 key props
             # .'$Root'.'|'.3.'$'.'$Identifier'
-            res = json_model_33(pval, lpath_27 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_27, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.3.'$'.'$Identifier']", lpath_27 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.3.'$'.'$Identifier']", lpath_27))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Root'.'|'.3.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.3.'$']", lpath_27 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.3.'$']", lpath_27))
             return False
     return True
 
@@ -1859,49 +1872,49 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_28: Path = (path + [ prop ]) if path is not None else None
+        lpath_28: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Root'.'|'.3.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.3.'%'.'#']", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'%'.'#']", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.3.'%'.'#']", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'%'.'#']", lpath_28))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Root'.'|'.3.'%'.'<'
             # .'$Root'.'|'.3.'%'.'<'.'|'.0
-            res = json_model_7(pval, lpath_28 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_28, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.3.'%'.'<'.'|'.0]", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.3.'%'.'<'.'|'.0]", lpath_28))
                 # .'$Root'.'|'.3.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_15_idx, arr_15_item in enumerate(pval):
-                        arr_15_lpath: Path = ((lpath_28 if path is not None else None) + [ arr_15_idx ]) if (lpath_28 if path is not None else None) is not None else None
+                        arr_15_lpath: Path = (lpath_28, arr_15_idx) if lpath_28 is not None else None
                         # .'$Root'.'|'.3.'%'.'<'.'|'.1.0
-                        res = json_model_7(arr_15_item, arr_15_lpath if (lpath_28 if path is not None else None) is not None else None, rep)
+                        res = json_model_7(arr_15_item, arr_15_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.3.'%'.'<'.'|'.1.0]", arr_15_lpath if (lpath_28 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.3.'%'.'<'.'|'.1.0]", arr_15_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.3.'%'.'<'.'|'.1]", lpath_28 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.3.'%'.'<'.'|'.1]", lpath_28))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Root'.'|'.3.'%'.'<'.'|']", lpath_28 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'%'.'<']", lpath_28 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Root'.'|'.3.'%'.'<'.'|']", lpath_28))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'%'.'<']", lpath_28))
                 return False
             continue
-        if json_model_11(prop, lpath_28 if path is not None else None, rep):
+        if json_model_11(prop, lpath_28, rep):
             # handle 1 key props
             # .'$Root'.'|'.3.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_10(pval, lpath_28 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_10(pval, lpath_28, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.3.'%'.'$Name']", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.3.'%'.'$Name']", lpath_28))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -1910,12 +1923,12 @@ def _jm_obj_19(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_11(prop, path, rep):
             # handle 2 re props
             # .'$Root'.'|'.3.'%'.'/^\\$.*$/'
-            res = json_model_31(pval, lpath_28 if path is not None else None, rep)
+            res = json_model_31(pval, lpath_28, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.3.'%'.'/^\\\\$.*$/']", lpath_28 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.3.'%'.'/^\\\\$.*$/']", lpath_28))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.3.'%']", lpath_28 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.3.'%']", lpath_28))
             return False
     return True
 
@@ -1927,7 +1940,7 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_26: Path = (path + [ prop ]) if path is not None else None
+        lpath_26: Path = (path, prop) if path is not None else None
         if prop == "^":
             # handle must ^ property
             must_count += 1
@@ -1935,15 +1948,15 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_14_idx, arr_14_item in enumerate(pval):
-                    arr_14_lpath: Path = ((lpath_26 if path is not None else None) + [ arr_14_idx ]) if (lpath_26 if path is not None else None) is not None else None
+                    arr_14_lpath: Path = (lpath_26, arr_14_idx) if lpath_26 is not None else None
                     # .'$Root'.'|'.3.'^'.0
-                    res = json_model_18(arr_14_item, arr_14_lpath if (lpath_26 if path is not None else None) is not None else None, rep)
+                    res = json_model_18(arr_14_item, arr_14_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Root'.'|'.3.'^'.0]", arr_14_lpath if (lpath_26 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Root'.'|'.3.'^'.0]", arr_14_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.3.'^']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.3.'^']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.3.'^']", lpath_26))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.3.'^']", lpath_26))
                 return False
             continue
         if prop == "#":
@@ -1951,35 +1964,35 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.3.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.3.'#']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'#']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.3.'#']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'#']", lpath_26))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Root'.'|'.3.'$'
-            res = _jm_obj_18(pval, lpath_26 if path is not None else None, rep)
+            res = _jm_obj_18(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.3.'$']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'$']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.3.'$']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'$']", lpath_26))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Root'.'|'.3.'%'
-            res = _jm_obj_19(pval, lpath_26 if path is not None else None, rep)
+            res = _jm_obj_19(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.3.'%']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'%']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.3.'%']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'%']", lpath_26))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Root'.'|'.3.'~'
-            res = json_model_2(pval, lpath_26 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_26, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.3.'~']", lpath_26 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'~']", lpath_26 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.3.'~']", lpath_26))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.3.'~']", lpath_26))
                 return False
             continue
         if prop.startswith("#"):
@@ -1987,7 +2000,7 @@ def _jm_obj_17(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.3.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.3]", lpath_26 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.3]", lpath_26))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2003,14 +2016,14 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_30: Path = (path + [ prop ]) if path is not None else None
+        lpath_30: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Root'.'|'.2.'$'.''
-            res = json_model_2(pval, lpath_30 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_30, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.2.'$'.'']", lpath_30 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'$'.'']", lpath_30 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.2.'$'.'']", lpath_30))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'$'.'']", lpath_30))
                 return False
             continue
         elif prop == "#":
@@ -2018,23 +2031,23 @@ def _jm_obj_21(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.2.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.2.'$'.'#']", lpath_30 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'$'.'#']", lpath_30 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.2.'$'.'#']", lpath_30))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'$'.'#']", lpath_30))
                 return False
             continue
-        if json_model_4(prop, lpath_30 if path is not None else None, rep):
+        if json_model_4(prop, lpath_30, rep):
             # handle 1 key props
             # .'$Root'.'|'.2.'$'.'$Identifier'
-            res = json_model_33(pval, lpath_30 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_30, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.2.'$'.'$Identifier']", lpath_30 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.2.'$'.'$Identifier']", lpath_30))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Root'.'|'.2.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.2.'$']", lpath_30 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.2.'$']", lpath_30))
             return False
     return True
 
@@ -2045,49 +2058,49 @@ def _jm_obj_22(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_31: Path = (path + [ prop ]) if path is not None else None
+        lpath_31: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Root'.'|'.2.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.2.'%'.'#']", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'%'.'#']", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.2.'%'.'#']", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'%'.'#']", lpath_31))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Root'.'|'.2.'%'.'<'
             # .'$Root'.'|'.2.'%'.'<'.'|'.0
-            res = json_model_7(pval, lpath_31 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_31, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.2.'%'.'<'.'|'.0]", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.2.'%'.'<'.'|'.0]", lpath_31))
                 # .'$Root'.'|'.2.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_17_idx, arr_17_item in enumerate(pval):
-                        arr_17_lpath: Path = ((lpath_31 if path is not None else None) + [ arr_17_idx ]) if (lpath_31 if path is not None else None) is not None else None
+                        arr_17_lpath: Path = (lpath_31, arr_17_idx) if lpath_31 is not None else None
                         # .'$Root'.'|'.2.'%'.'<'.'|'.1.0
-                        res = json_model_7(arr_17_item, arr_17_lpath if (lpath_31 if path is not None else None) is not None else None, rep)
+                        res = json_model_7(arr_17_item, arr_17_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.2.'%'.'<'.'|'.1.0]", arr_17_lpath if (lpath_31 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.2.'%'.'<'.'|'.1.0]", arr_17_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.2.'%'.'<'.'|'.1]", lpath_31 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.2.'%'.'<'.'|'.1]", lpath_31))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Root'.'|'.2.'%'.'<'.'|']", lpath_31 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'%'.'<']", lpath_31 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Root'.'|'.2.'%'.'<'.'|']", lpath_31))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'%'.'<']", lpath_31))
                 return False
             continue
-        if json_model_11(prop, lpath_31 if path is not None else None, rep):
+        if json_model_11(prop, lpath_31, rep):
             # handle 1 key props
             # .'$Root'.'|'.2.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_10(pval, lpath_31 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_10(pval, lpath_31, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.2.'%'.'$Name']", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.2.'%'.'$Name']", lpath_31))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -2096,12 +2109,12 @@ def _jm_obj_22(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_11(prop, path, rep):
             # handle 2 re props
             # .'$Root'.'|'.2.'%'.'/^\\$.*$/'
-            res = json_model_31(pval, lpath_31 if path is not None else None, rep)
+            res = json_model_31(pval, lpath_31, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.2.'%'.'/^\\\\$.*$/']", lpath_31 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.2.'%'.'/^\\\\$.*$/']", lpath_31))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.2.'%']", lpath_31 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.2.'%']", lpath_31))
             return False
     return True
 
@@ -2113,7 +2126,7 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_29: Path = (path + [ prop ]) if path is not None else None
+        lpath_29: Path = (path, prop) if path is not None else None
         if prop == "&":
             # handle must & property
             must_count += 1
@@ -2121,15 +2134,15 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_16_idx, arr_16_item in enumerate(pval):
-                    arr_16_lpath: Path = ((lpath_29 if path is not None else None) + [ arr_16_idx ]) if (lpath_29 if path is not None else None) is not None else None
+                    arr_16_lpath: Path = (lpath_29, arr_16_idx) if lpath_29 is not None else None
                     # .'$Root'.'|'.2.'&'.0
-                    res = json_model_18(arr_16_item, arr_16_lpath if (lpath_29 if path is not None else None) is not None else None, rep)
+                    res = json_model_18(arr_16_item, arr_16_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Root'.'|'.2.'&'.0]", arr_16_lpath if (lpath_29 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Root'.'|'.2.'&'.0]", arr_16_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.2.'&']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.2.'&']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.2.'&']", lpath_29))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.2.'&']", lpath_29))
                 return False
             continue
         if prop == "#":
@@ -2137,35 +2150,35 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.2.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.2.'#']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'#']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.2.'#']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'#']", lpath_29))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Root'.'|'.2.'$'
-            res = _jm_obj_21(pval, lpath_29 if path is not None else None, rep)
+            res = _jm_obj_21(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.2.'$']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'$']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.2.'$']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'$']", lpath_29))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Root'.'|'.2.'%'
-            res = _jm_obj_22(pval, lpath_29 if path is not None else None, rep)
+            res = _jm_obj_22(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.2.'%']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'%']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.2.'%']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'%']", lpath_29))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Root'.'|'.2.'~'
-            res = json_model_2(pval, lpath_29 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_29, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.2.'~']", lpath_29 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'~']", lpath_29 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.2.'~']", lpath_29))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.2.'~']", lpath_29))
                 return False
             continue
         if prop.startswith("#"):
@@ -2173,7 +2186,7 @@ def _jm_obj_20(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.2.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.2]", lpath_29 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.2]", lpath_29))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2189,14 +2202,14 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_33: Path = (path + [ prop ]) if path is not None else None
+        lpath_33: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Root'.'|'.1.'$'.''
-            res = json_model_2(pval, lpath_33 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_33, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.1.'$'.'']", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'$'.'']", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.1.'$'.'']", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'$'.'']", lpath_33))
                 return False
             continue
         elif prop == "#":
@@ -2204,23 +2217,23 @@ def _jm_obj_24(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.1.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.1.'$'.'#']", lpath_33 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'$'.'#']", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.1.'$'.'#']", lpath_33))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'$'.'#']", lpath_33))
                 return False
             continue
-        if json_model_4(prop, lpath_33 if path is not None else None, rep):
+        if json_model_4(prop, lpath_33, rep):
             # handle 1 key props
             # .'$Root'.'|'.1.'$'.'$Identifier'
-            res = json_model_33(pval, lpath_33 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_33, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.1.'$'.'$Identifier']", lpath_33 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.1.'$'.'$Identifier']", lpath_33))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Root'.'|'.1.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.1.'$']", lpath_33 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.1.'$']", lpath_33))
             return False
     return True
 
@@ -2231,49 +2244,49 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_34: Path = (path + [ prop ]) if path is not None else None
+        lpath_34: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Root'.'|'.1.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.1.'%'.'#']", lpath_34 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'%'.'#']", lpath_34 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.1.'%'.'#']", lpath_34))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'%'.'#']", lpath_34))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Root'.'|'.1.'%'.'<'
             # .'$Root'.'|'.1.'%'.'<'.'|'.0
-            res = json_model_7(pval, lpath_34 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_34, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.1.'%'.'<'.'|'.0]", lpath_34 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.1.'%'.'<'.'|'.0]", lpath_34))
                 # .'$Root'.'|'.1.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_19_idx, arr_19_item in enumerate(pval):
-                        arr_19_lpath: Path = ((lpath_34 if path is not None else None) + [ arr_19_idx ]) if (lpath_34 if path is not None else None) is not None else None
+                        arr_19_lpath: Path = (lpath_34, arr_19_idx) if lpath_34 is not None else None
                         # .'$Root'.'|'.1.'%'.'<'.'|'.1.0
-                        res = json_model_7(arr_19_item, arr_19_lpath if (lpath_34 if path is not None else None) is not None else None, rep)
+                        res = json_model_7(arr_19_item, arr_19_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.1.'%'.'<'.'|'.1.0]", arr_19_lpath if (lpath_34 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.1.'%'.'<'.'|'.1.0]", arr_19_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.1.'%'.'<'.'|'.1]", lpath_34 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.1.'%'.'<'.'|'.1]", lpath_34))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Root'.'|'.1.'%'.'<'.'|']", lpath_34 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'%'.'<']", lpath_34 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Root'.'|'.1.'%'.'<'.'|']", lpath_34))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'%'.'<']", lpath_34))
                 return False
             continue
-        if json_model_11(prop, lpath_34 if path is not None else None, rep):
+        if json_model_11(prop, lpath_34, rep):
             # handle 1 key props
             # .'$Root'.'|'.1.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_10(pval, lpath_34 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_10(pval, lpath_34, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.1.'%'.'$Name']", lpath_34 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.1.'%'.'$Name']", lpath_34))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -2282,12 +2295,12 @@ def _jm_obj_25(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_11(prop, path, rep):
             # handle 2 re props
             # .'$Root'.'|'.1.'%'.'/^\\$.*$/'
-            res = json_model_31(pval, lpath_34 if path is not None else None, rep)
+            res = json_model_31(pval, lpath_34, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.1.'%'.'/^\\\\$.*$/']", lpath_34 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.1.'%'.'/^\\\\$.*$/']", lpath_34))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.1.'%']", lpath_34 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.1.'%']", lpath_34))
             return False
     return True
 
@@ -2299,7 +2312,7 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_32: Path = (path + [ prop ]) if path is not None else None
+        lpath_32: Path = (path, prop) if path is not None else None
         if prop == "|":
             # handle must | property
             must_count += 1
@@ -2307,15 +2320,15 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
             res = isinstance(pval, list)
             if res:
                 for arr_18_idx, arr_18_item in enumerate(pval):
-                    arr_18_lpath: Path = ((lpath_32 if path is not None else None) + [ arr_18_idx ]) if (lpath_32 if path is not None else None) is not None else None
+                    arr_18_lpath: Path = (lpath_32, arr_18_idx) if lpath_32 is not None else None
                     # .'$Root'.'|'.1.'|'.0
-                    res = json_model_18(arr_18_item, arr_18_lpath if (lpath_32 if path is not None else None) is not None else None, rep)
+                    res = json_model_18(arr_18_item, arr_18_lpath, rep)
                     if not res:
-                        rep is None or rep.append(("unexpected $CModel [.'$Root'.'|'.1.'|'.0]", arr_18_lpath if (lpath_32 if path is not None else None) is not None else None))
+                        rep is None or rep.append(("unexpected $CModel [.'$Root'.'|'.1.'|'.0]", arr_18_lpath))
                         break
             if not res:
-                rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.1.'|']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.1.'|']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.1.'|']", lpath_32))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.1.'|']", lpath_32))
                 return False
             continue
         if prop == "#":
@@ -2323,35 +2336,35 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.1.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.1.'#']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'#']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.1.'#']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'#']", lpath_32))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Root'.'|'.1.'$'
-            res = _jm_obj_24(pval, lpath_32 if path is not None else None, rep)
+            res = _jm_obj_24(pval, lpath_32, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.1.'$']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'$']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.1.'$']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'$']", lpath_32))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Root'.'|'.1.'%'
-            res = _jm_obj_25(pval, lpath_32 if path is not None else None, rep)
+            res = _jm_obj_25(pval, lpath_32, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.1.'%']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'%']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.1.'%']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'%']", lpath_32))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Root'.'|'.1.'~'
-            res = json_model_2(pval, lpath_32 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_32, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.1.'~']", lpath_32 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'~']", lpath_32 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.1.'~']", lpath_32))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.1.'~']", lpath_32))
                 return False
             continue
         if prop.startswith("#"):
@@ -2359,7 +2372,7 @@ def _jm_obj_23(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.1.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.1]", lpath_32 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.1]", lpath_32))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2375,14 +2388,14 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_36: Path = (path + [ prop ]) if path is not None else None
+        lpath_36: Path = (path, prop) if path is not None else None
         if prop == "":
             # handle may  property
             # .'$Root'.'|'.0.'$'.''
-            res = json_model_2(pval, lpath_36 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_36, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.0.'$'.'']", lpath_36 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'$'.'']", lpath_36 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.0.'$'.'']", lpath_36))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'$'.'']", lpath_36))
                 return False
             continue
         elif prop == "#":
@@ -2390,23 +2403,23 @@ def _jm_obj_27(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.0.'$'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.0.'$'.'#']", lpath_36 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'$'.'#']", lpath_36 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.0.'$'.'#']", lpath_36))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'$'.'#']", lpath_36))
                 return False
             continue
-        if json_model_4(prop, lpath_36 if path is not None else None, rep):
+        if json_model_4(prop, lpath_36, rep):
             # handle 1 key props
             # .'$Root'.'|'.0.'$'.'$Identifier'
-            res = json_model_33(pval, lpath_36 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_36, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.0.'$'.'$Identifier']", lpath_36 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.0.'$'.'$Identifier']", lpath_36))
                 return False
         elif prop.startswith("#"):
             # handle 1 re props
             # .'$Root'.'|'.0.'$'.'/^#/'
             res = True
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.0.'$']", lpath_36 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.0.'$']", lpath_36))
             return False
     return True
 
@@ -2417,49 +2430,49 @@ def _jm_obj_28(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_37: Path = (path + [ prop ]) if path is not None else None
+        lpath_37: Path = (path, prop) if path is not None else None
         if prop == "#":
             # handle may # property
             # .'$Root'.'|'.0.'%'.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.0.'%'.'#']", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'%'.'#']", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.0.'%'.'#']", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'%'.'#']", lpath_37))
                 return False
             continue
         elif prop == "<":
             # handle may < property
             # .'$Root'.'|'.0.'%'.'<'
             # .'$Root'.'|'.0.'%'.'<'.'|'.0
-            res = json_model_7(pval, lpath_37 if path is not None else None, rep)
+            res = json_model_7(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.0.'%'.'<'.'|'.0]", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.0.'%'.'<'.'|'.0]", lpath_37))
                 # .'$Root'.'|'.0.'%'.'<'.'|'.1
                 res = isinstance(pval, list)
                 if res:
                     for arr_20_idx, arr_20_item in enumerate(pval):
-                        arr_20_lpath: Path = ((lpath_37 if path is not None else None) + [ arr_20_idx ]) if (lpath_37 if path is not None else None) is not None else None
+                        arr_20_lpath: Path = (lpath_37, arr_20_idx) if lpath_37 is not None else None
                         # .'$Root'.'|'.0.'%'.'<'.'|'.1.0
-                        res = json_model_7(arr_20_item, arr_20_lpath if (lpath_37 if path is not None else None) is not None else None, rep)
+                        res = json_model_7(arr_20_item, arr_20_lpath, rep)
                         if not res:
-                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.0.'%'.'<'.'|'.1.0]", arr_20_lpath if (lpath_37 if path is not None else None) is not None else None))
+                            rep is None or rep.append(("unexpected $Ref [.'$Root'.'|'.0.'%'.'<'.'|'.1.0]", arr_20_lpath))
                             break
                 if not res:
-                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.0.'%'.'<'.'|'.1]", lpath_37 if path is not None else None))
+                    rep is None or rep.append(("not array or unexpected array [.'$Root'.'|'.0.'%'.'<'.'|'.1]", lpath_37))
             if res:
                 rep is None or rep.clear()
             else:
-                rep is None or rep.append(("no model matched [.'$Root'.'|'.0.'%'.'<'.'|']", lpath_37 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'%'.'<']", lpath_37 if path is not None else None))
+                rep is None or rep.append(("no model matched [.'$Root'.'|'.0.'%'.'<'.'|']", lpath_37))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'%'.'<']", lpath_37))
                 return False
             continue
-        if json_model_11(prop, lpath_37 if path is not None else None, rep):
+        if json_model_11(prop, lpath_37, rep):
             # handle 1 key props
             # .'$Root'.'|'.0.'%'.'$Name'
             # "/^([#|&^+/*@~=$%]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_10(pval, lpath_37 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_10(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.0.'%'.'$Name']", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#|&^+/*@~=$%]|[<>!]=?)$/ [.'$Root'.'|'.0.'%'.'$Name']", lpath_37))
                 return False
         elif prop.startswith("#"):
             # handle 2 re props
@@ -2468,12 +2481,12 @@ def _jm_obj_28(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_11(prop, path, rep):
             # handle 2 re props
             # .'$Root'.'|'.0.'%'.'/^\\$.*$/'
-            res = json_model_31(pval, lpath_37 if path is not None else None, rep)
+            res = json_model_31(pval, lpath_37, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.0.'%'.'/^\\\\$.*$/']", lpath_37 if path is not None else None))
+                rep is None or rep.append(("unexpected $Transformation [.'$Root'.'|'.0.'%'.'/^\\\\$.*$/']", lpath_37))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.0.'%']", lpath_37 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.0.'%']", lpath_37))
             return False
     return True
 
@@ -2485,15 +2498,15 @@ def _jm_obj_26(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_35: Path = (path + [ prop ]) if path is not None else None
+        lpath_35: Path = (path, prop) if path is not None else None
         if prop == "@":
             # handle must @ property
             must_count += 1
             # .'$Root'.'|'.0.'@'
-            res = json_model_33(pval, lpath_35 if path is not None else None, rep)
+            res = json_model_33(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.0.'@']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.0.'@']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected $Model [.'$Root'.'|'.0.'@']", lpath_35))
+                rep is None or rep.append(("invalid mandatory prop value [.'$Root'.'|'.0.'@']", lpath_35))
                 return False
             continue
         if prop == "!":
@@ -2501,8 +2514,8 @@ def _jm_obj_26(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.0.'!'
             res = isinstance(pval, bool)
             if not res:
-                rep is None or rep.append(("not a bool [.'$Root'.'|'.0.'!']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'!']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("not a bool [.'$Root'.'|'.0.'!']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'!']", lpath_35))
                 return False
             continue
         elif prop == "#":
@@ -2510,35 +2523,35 @@ def _jm_obj_26(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'$Root'.'|'.0.'#'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'$Root'.'|'.0.'#']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'#']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'$Root'.'|'.0.'#']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'#']", lpath_35))
                 return False
             continue
         elif prop == "$":
             # handle may $ property
             # .'$Root'.'|'.0.'$'
-            res = _jm_obj_27(pval, lpath_35 if path is not None else None, rep)
+            res = _jm_obj_27(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.0.'$']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'$']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.0.'$']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'$']", lpath_35))
                 return False
             continue
         elif prop == "%":
             # handle may % property
             # .'$Root'.'|'.0.'%'
-            res = _jm_obj_28(pval, lpath_35 if path is not None else None, rep)
+            res = _jm_obj_28(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$Root'.'|'.0.'%']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'%']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$Root'.'|'.0.'%']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'%']", lpath_35))
                 return False
             continue
         elif prop == "~":
             # handle may ~ property
             # .'$Root'.'|'.0.'~'
-            res = json_model_2(pval, lpath_35 if path is not None else None, rep)
+            res = json_model_2(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.0.'~']", lpath_35 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'~']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected $Url [.'$Root'.'|'.0.'~']", lpath_35))
+                rep is None or rep.append(("invalid optional prop value [.'$Root'.'|'.0.'~']", lpath_35))
                 return False
             continue
         if prop.startswith("#"):
@@ -2548,19 +2561,19 @@ def _jm_obj_26(val: Jsonable, path: Path, rep: Report) -> bool:
         elif _jm_re_7(prop, path, rep):
             # handle 3 re props
             # .'$Root'.'|'.0.'/^(<=|>=|<|>)$/'
-            res = json_model_12(pval, lpath_35 if path is not None else None, rep)
+            res = json_model_12(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected $CmpValue [.'$Root'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected $CmpValue [.'$Root'.'|'.0.'/^(<=|>=|<|>)$/']", lpath_35))
                 return False
         elif _jm_re_8(prop, path, rep):
             # handle 3 re props
             # .'$Root'.'|'.0.'/^(=|!=)$/'
-            res = json_model_13(pval, lpath_35 if path is not None else None, rep)
+            res = json_model_13(pval, lpath_35, rep)
             if not res:
-                rep is None or rep.append(("unexpected $EqValue [.'$Root'.'|'.0.'/^(=|!=)$/']", lpath_35 if path is not None else None))
+                rep is None or rep.append(("unexpected $EqValue [.'$Root'.'|'.0.'/^(=|!=)$/']", lpath_35))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.0]", lpath_35 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'$Root'.'|'.0]", lpath_35))
             return False
     if must_count != 1:
         if rep is not None:
@@ -2782,5 +2795,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
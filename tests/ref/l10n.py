@@ -18,7 +18,20 @@ def check_model(val: Jsonable, name: str = "", rep: Report = None) -> bool:
     if name not in check_model_map:
         raise Exception(f"unexpected model name: {name}")
     checker = check_model_map[name]
-    return checker(val, [], rep)
+    # no path bookkeeping without a report
+    return checker(val, () if rep is not None else None, rep)
+
+# batch entry point for generated checkers
+def check_model_many(
+    values: JsonValues, name: str = "", reports: Reports|None = None
+) -> bytearray:
+    """Check many values against JSON Model name, one result byte per value.
+
+    Reports of failed values are collected by index if reports is not None.
+    """
+    if name not in check_model_map:
+        raise Exception(f"unexpected model name: {name}")
+    return check_many(check_model_map[name], values, reports)
 
 _jm_re_0_reco: object
 _jm_re_0: RegexFun
@@ -34,27 +47,27 @@ def _jm_obj_0(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_1: Path = (path + [ prop ]) if path is not None else None
+        lpath_1: Path = (path, prop) if path is not None else None
         if prop == "Model":
             # handle must Model property
             must_count += 1
             # .'$'.Model
             res = isinstance(pval, str) and (pval == "$https://json-model.org/models/json-model")
             if not res:
-                rep is None or rep.append(("unexpected _$https://json-model.org/models/json-model [.'$'.Model]", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$'.Model]", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected _$https://json-model.org/models/json-model [.'$'.Model]", lpath_1))
+                rep is None or rep.append(("invalid mandatory prop value [.'$'.Model]", lpath_1))
                 return False
             continue
         if prop == "":
             # handle may  property
             # .'$'.''
-            res = is_valid_url(pval, lpath_1 if path is not None else None, rep)
+            res = is_valid_url(pval, lpath_1, rep)
             if not res:
-                rep is None or rep.append(("unexpected $URL [.'$'.'']", lpath_1 if path is not None else None))
-                rep is None or rep.append(("invalid optional prop value [.'$'.'']", lpath_1 if path is not None else None))
+                rep is None or rep.append(("unexpected $URL [.'$'.'']", lpath_1))
+                rep is None or rep.append(("invalid optional prop value [.'$'.'']", lpath_1))
                 return False
             continue
-        rep is None or rep.append(("unexpected prop [.'$']", lpath_1 if path is not None else None))
+        rep is None or rep.append(("unexpected prop [.'$']", lpath_1))
         return False
     if must_count != 1:
         if rep is not None:
@@ -72,24 +85,24 @@ def _jm_obj_1(val: Jsonable, path: Path, rep: Report) -> bool:
         return False
     res: bool
     for prop, pval in val.items():
-        lpath_2: Path = (path + [ prop ]) if path is not None else None
+        lpath_2: Path = (path, prop) if path is not None else None
         if prop.startswith("#"):
             # handle 2 re props
             # .'%'.'/^#/'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'%'.'/^#/']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'%'.'/^#/']", lpath_2))
                 return False
         elif _jm_re_0(prop, path, rep):
             # handle 2 re props
             # .'%'.'/^\\..+$/'
             # "/^([#~$%@|&+^/*=]|[<>!]=?)$/"
-            res = isinstance(pval, str) and _jm_re_1(pval, lpath_2 if path is not None else None, rep)
+            res = isinstance(pval, str) and _jm_re_1(pval, lpath_2, rep)
             if not res:
-                rep is None or rep.append(("unexpected /^([#~$%@|&+^/*=]|[<>!]=?)$/ [.'%'.'/^\\\\..+$/']", lpath_2 if path is not None else None))
+                rep is None or rep.append(("unexpected /^([#~$%@|&+^/*=]|[<>!]=?)$/ [.'%'.'/^\\\\..+$/']", lpath_2))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.'%']", lpath_2 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.'%']", lpath_2))
             return False
     return True
 
@@ -103,15 +116,15 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
     res: bool
     must_count: int = 0
     for prop, pval in val.items():
-        lpath_0: Path = (path + [ prop ]) if path is not None else None
+        lpath_0: Path = (path, prop) if path is not None else None
         if prop == "$":
             # handle must $ property
             must_count += 1
             # .'$'
-            res = _jm_obj_0(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_0(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'$']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'$']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'$']", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'$']", lpath_0))
                 return False
             continue
         elif prop == "%":
@@ -119,10 +132,10 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             must_count += 1
             # dot-prefixed arbitrary key, one or two char keyword values
             # .'%'
-            res = _jm_obj_1(pval, lpath_0 if path is not None else None, rep)
+            res = _jm_obj_1(pval, lpath_0, rep)
             if not res:
-                rep is None or rep.append(("unexpected element [.'%']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'%']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected element [.'%']", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'%']", lpath_0))
                 return False
             continue
         elif prop == "@":
@@ -131,8 +144,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'@'
             res = isinstance(pval, str) and pval == "$Model"
             if not res:
-                rep is None or rep.append(("unexpected _$Model [.'@']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'@']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected _$Model [.'@']", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'@']", lpath_0))
                 return False
             continue
         elif prop == "~":
@@ -141,8 +154,8 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'~'
             res = isinstance(pval, str) and (pval == "https://json-model.org/models/l10n")
             if not res:
-                rep is None or rep.append(("unexpected _https://json-model.org/models/l10n [.'~']", lpath_0 if path is not None else None))
-                rep is None or rep.append(("invalid mandatory prop value [.'~']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected _https://json-model.org/models/l10n [.'~']", lpath_0))
+                rep is None or rep.append(("invalid mandatory prop value [.'~']", lpath_0))
                 return False
             continue
         if prop.startswith("#"):
@@ -150,10 +163,10 @@ def json_model_1(val: Jsonable, path: Path, rep: Report) -> bool:
             # .'/^#/'
             res = isinstance(pval, str)
             if not res:
-                rep is None or rep.append(("unexpected string [.'/^#/']", lpath_0 if path is not None else None))
+                rep is None or rep.append(("unexpected string [.'/^#/']", lpath_0))
                 return False
         else:
-            rep is None or rep.append(("unexpected prop [.]", lpath_0 if path is not None else None))
+            rep is None or rep.append(("unexpected prop [.]", lpath_0))
             return False
     if must_count != 4:
         if rep is not None:
@@ -202,5 +215,5 @@ def check_model_free():
 
 if __name__ == "__main__":
     check_model_init()
-    main(check_model_fun, check_model_map, __version__)
+    main(check_model_fun, check_model_map, __version__, check_model_init)
     check_model_free()
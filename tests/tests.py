@@ -1,5 +1,6 @@
 import typing
 import os
+import sys
 import pathlib
 import re
 import json
@@ -7,9 +8,16 @@ import logging
 import filelock
 import pytest
 
-from json_model.script import model_from_url, model_checker_from_url
+from json_model.script import model_from_url, model_from_json, model_checker_from_url, CheckerRegistry
+from json_model.script import jmc_script
+from json_model.code_cache import CodeCache, DefinitionCache, ArtifactCache
 from json_model.resolver import Resolver
 from json_model.xstatic import xstatic_compile
+from json_model.irep import IRep, IRNode, invertBool
+from json_model import optim
+from json_model.recurse import recModel, path_list
+from json_model.utils import timings_start, timings_stop, model_key, model_eq
+import json_model.runtime as rt
 
 logging.basicConfig()
 log = logging.getLogger("test")
@@ -692,6 +700,63 @@ def test_dyn_py(directory: pathlib.Path):
 
     run_dyn(directory, gen_py_checker, "dynpy")
 
+def test_dyn_py_cached(directory: pathlib.Path, tmp_path):
+    """Test dynamic checkers through the code cache, on miss then on hit."""
+
+    resolver = Resolver(None, dirmap(directory))
+    options = EXPECT.get(f"{directory}:mod-opts", {})
+    cache = CodeCache(str(tmp_path))
+
+    def gen_py_checker(fmodel: str):
+        assert fmodel.endswith(".model.json")
+        model = fmodel.replace(".model.json", "").replace(f"{directory}/", "")
+        return model_checker_from_url(model, resolver=resolver, follow=True, debug=False,
+                                      cache=cache, **options)
+
+    run_dyn(directory, gen_py_checker, "dynpy")
+    assert cache.size() > 0
+    run_dyn(directory, gen_py_checker, "dynpy")
+
+def test_dyn_py_incremental(directory: pathlib.Path, tmp_path):
+    """Test dynamic checkers generated through the definition cache, on miss then on hit."""
+
+    resolver = Resolver(None, dirmap(directory))
+    options = EXPECT.get(f"{directory}:mod-opts", {})
+    cache = DefinitionCache(str(tmp_path))
+
+    def gen_py_checker(fmodel: str):
+        assert fmodel.endswith(".model.json")
+        model = fmodel.replace(".model.json", "").replace(f"{directory}/", "")
+        jm = model_from_url(model, resolver=resolver, follow=True, **options)
+        env: dict = {}
+        exec(str(xstatic_compile(jm, lang="py", def_cache=cache)), env)
+        env["check_model_init"]()
+        return env["check_model"]
+
+    run_dyn(directory, gen_py_checker, "dynpy")
+    hits, misses = cache.hits, cache.misses
+    assert misses > 0
+    # second pass only reuses cached units
+    run_dyn(directory, gen_py_checker, "dynpy")
+    assert cache.misses == misses and cache.hits > hits
+
+def test_dyn_py_obj_share(directory: pathlib.Path):
+    """Test dynamic checkers which share functions of identical objects."""
+
+    resolver = Resolver(None, dirmap(directory))
+    options = EXPECT.get(f"{directory}:mod-opts", {})
+
+    def gen_py_checker(fmodel: str):
+        assert fmodel.endswith(".model.json")
+        model = fmodel.replace(".model.json", "").replace(f"{directory}/", "")
+        jm = model_from_url(model, resolver=resolver, follow=True, **options)
+        env: dict = {}
+        exec(str(xstatic_compile(jm, lang="py", obj_share=True)), env)
+        env["check_model_init"]()
+        return env["check_model"]
+
+    run_dyn(directory, gen_py_checker, "dynpy")
+
 def test_dyn_json_schema(directory: pathlib.Path):
     """Test generated JSON Schema with test value files."""
 
@@ -796,6 +861,593 @@ def test_models_dpy(directory):
     assert ntests == EXPECT.get(f"{directory}:models", 0)
 
 
+def test_checker_registry():
+    """Check registry reuse and eviction."""
+    registry = CheckerRegistry(max_count=2)
+    c1 = registry.from_json({"a": "$INT"})
+    assert c1({"a": 1}) and not c1({"a": "1"})
+    assert registry.from_json({"a": "$INT"}) is c1
+    assert registry.from_json({"a": "$INT"}, loose_int=True) is not c1
+    c3 = registry.from_json(["$STRING"])
+    assert c3(["hello"]) and not c3([1])
+
+    def size(mjson: rt.Jsonable, **options) -> int:
+        alone = CheckerRegistry()
+        alone.from_json(mjson, **options)
+        return alone.stats()["memory"]
+
+    sizes = {"a": size({"a": "$INT"}), "b": size({"b": "$INT"}), "l": size({"a": "$INT"}, loose_int=True),
+             "s": size(["$STRING"])}
+    assert all(sizes.values()) and sizes["a"] == sizes["b"]
+    assert registry.stats() == {
+        "count": 2, "memory": sizes["l"] + sizes["s"], "hits": 1, "misses": 3, "evictions": 1
+    }
+    assert registry.from_json({"a": "$INT"}) is not c1  # evicted
+
+    # memory limit, with one entry too many
+    registry = CheckerRegistry(max_count=0, max_memory=sizes["s"] + sizes["a"])
+    cs, ca = registry.from_json(["$STRING"]), registry.from_json({"a": "$INT"})
+    assert registry.stats()["evictions"] == 0
+    assert registry.from_json(["$STRING"]) is cs  # a is now the least recently used
+    cb = registry.from_json({"b": "$INT"})
+    assert registry.stats() == {
+        "count": 2, "memory": sizes["s"] + sizes["b"], "hits": 1, "misses": 3, "evictions": 1
+    }
+    assert registry.from_json(["$STRING"]) is cs and registry.from_json({"b": "$INT"}) is cb
+    assert registry.from_json({"a": "$INT"}) is not ca  # evicted
+
+def test_exreg_path():
+    """Check references in extended regex under a property, with and without reporting."""
+    checker = CheckerRegistry().from_json({"x": "/($DATE)T/X"})
+    assert checker({"x": "2020-01-01T"}) and not checker({"x": "2020-13-01T"})
+    rep: list = []
+    assert not checker({"x": "2020-13-01T"}, "", rep)
+    assert rep and all(path == ((), "x") for _, path in rep)
+
+def test_regex_cache():
+    """Check memoized regex results, including extended regex."""
+    jm = model_from_json({"c": "/^[A-Z]{2}$/", "x": "/($DATE)T/X", "/^k[0-9]$/": "$INT"})
+    env: dict = {}
+    exec(str(xstatic_compile(jm, lang="py", regex_cache=2)), env)
+    env["check_model_init"]()
+    for _ in range(3):
+        assert env["check_model"]({"c": "FR", "x": "2020-01-01T", "k1": 1})
+        assert not env["check_model"]({"c": "FR", "x": "2020-13-01T"})
+        rep: list = []
+        assert not env["check_model"]({"c": "fr", "x": "2020-01-01T"}, "", rep) and rep
+        assert not env["check_model"]({"c": "FR", "x": "2020-01-01T", "k2": "1"})
+    assert env["_jm_re_0_search"].cache_info().hits > 0
+    env["check_model_free"]()
+
+def test_dual():
+    """Check dual fast and reporting code against reporting code."""
+    jm = model_from_json({"$": {"p": {"a": "$INT", "?b": ["$STRING"]}}, "x": "$p", "?y": "$DATE"})
+    envs: list[dict] = [{}, {}]
+    exec(str(xstatic_compile(jm, lang="py")), envs[0])
+    exec(str(xstatic_compile(jm, lang="py", dual=True)), envs[1])
+    for env in envs:
+        env["check_model_init"]()
+    assert "check_model_rmap" in envs[1] and "check_model_rmap" not in envs[0]
+    values = [{"x": {"a": 1}}, {"x": {"a": 1, "b": ["c"]}, "y": "2020-01-01"},
+              {"x": {"a": "1"}}, {"x": {"a": 1, "b": [0]}}, {"y": "2020-13-01"}, None]
+    for val in values:
+        reps: list[list] = [[], []]
+        res = [env["check_model"](val, "", rep) for env, rep in zip(envs, reps)]
+        assert res[0] == res[1] == envs[1]["check_model"](val)
+        assert reps[0] == reps[1] and (len(reps[0]) == 0) == res[0]
+        assert envs[1]["check_model_fun"]("", True)(val, [], []) == res[0]
+    for env in envs:
+        env["check_model_free"]()
+
+def test_stream():
+    """Check incremental raw JSON checks against value checks."""
+    jm = model_from_json({"$": {"p": {"a": "$INT", "?b": ["$STRING"]}, "t": {"v": 0, "?k": ["$t"]}},
+                          "x": "$p", "?y": "$DATE", "?t": "$t", "?z": "$ANY", "?u": {"|": ["_a", 0]}})
+    env: dict = {}
+    exec(str(xstatic_compile(jm, lang="py", stream=True)), env)
+    env["check_model_init"]()
+    values = [{"x": {"a": 1}}, {"x": {"a": 1, "b": ["c", "d\\\"é"]}, "y": "2020-01-01", "u": "a"},
+              {"x": {"a": 1}, "t": {"v": 1, "k": [{"v": 2}, {"v": 3, "k": []}]}, "z": {"[": ["]", {}]}},
+              {"x": {"a": "1"}}, {"x": {"a": 1, "b": [0]}}, {"y": "2020-13-01"}, {"x": {"a": 1}, "w": 0},
+              {"x": {"a": 1}, "t": {"v": 1, "k": [{"v": "2"}]}}, {"x": {"a": 1}, "u": "b"}, None, [], 1.5]
+    for val in values:
+        for name in ("", "p", "t"):
+            rep: list = []
+            res = env["check_model_stream"](json.dumps(val).encode(), name, rep)
+            assert res == env["check_model"](val, name) == (len(rep) == 0)
+    # rejected on the first invalid token, before the end of data
+    assert not env["check_model_stream"](b'{"x": {"a": 1.5, ', "")
+    assert not env["check_model_stream"](b'[1, 2', "p")
+    with pytest.raises(ValueError):
+        env["check_model_stream"](b'{"x": {"a": 1}} {', "")
+    # uninspected values are still checked while skipped
+    for bad in (b'[,,,]', b'{xx}', b'[1 2 3]', b'[1,]', b'{"a" 1}', b'["\\q"]', b'["\xff"]', b'[01]', b'[1}'):
+        with pytest.raises(ValueError):
+            json.loads(bad)
+        with pytest.raises(ValueError):
+            env["check_model_stream"](b'{"x": {"a": 1}, "z": ' + bad + b'}', "")
+    env["check_model_free"]()
+
+def test_lazy():
+    """Check lazy initialization against eager initialization."""
+    jm = model_from_json({"$": {"k": "/^[a-z]+$/", "d": {"/^[0-9]+$/": "$INT", "": "$k"}},
+                          "k": "$k", "?d": "$d", "?e": "/^[a-z]+@($DATE)$/X"})
+    envs: list[dict] = [{}, {}]
+    exec(str(xstatic_compile(jm, lang="py")), envs[0])
+    exec(str(xstatic_compile(jm, lang="py", lazy=True)), envs[1])
+    envs[0]["check_model_init"]()
+    # initialized on import, regexes are not compiled yet
+    lazy = [v for v in envs[1].values() if isinstance(v, rt.LazyRegex)]
+    assert lazy and all(r._reco is None for r in lazy)
+    values = [{"k": "a"}, {"k": "A"}, {"k": "a", "d": {"12": 1, "z": "b"}}, {"k": "a", "d": {"12": "a"}},
+              {"k": "a", "d": {"z": "B"}}, {"k": "a", "e": "a@2020-01-01"}, {"k": "a", "e": "a@2020-13-01"}, None]
+    for name in ("", "k", "d"):
+        for val in values:
+            assert envs[0]["check_model"](val, name) == envs[1]["check_model"](val, name)
+    assert any(r._reco is not None for r in lazy)
+
+def test_exports():
+    """Check lazy package exports, on star import and as submodule attributes."""
+    import subprocess
+    code = ("import sys, json_model\n"
+            "assert 'json_model.script' not in sys.modules\n"
+            "assert json_model.script.model_from_json is json_model.model_from_json\n"
+            "assert json_model.xstatic.xstatic_compile and json_model.runtime.types.Report\n"
+            "ns = {}\n"
+            "exec('from json_model import *', ns)\n"
+            "assert ns['JsonModel'] is json_model.model.JsonModel and ns['optim'] is json_model.optim\n"
+            "assert 'importlib' not in ns and 'TYPE_CHECKING' not in ns\n")
+    run = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60,
+                         cwd=pathlib.Path(__file__).parent.parent)
+    assert run.returncode == 0, run.stderr
+
+def test_profile():
+    """Check profiled checks against plain checks, and collected data."""
+    jm = model_from_json({"$": {"p": {"a": "/^[a-z]+$/", "?b": "$INT"}}, "x": "$p", "?y": ["$p"]})
+    envs: list[dict] = [{}, {}]
+    exec(str(xstatic_compile(jm, lang="py")), envs[0])
+    exec(str(xstatic_compile(jm, lang="py", profile=True)), envs[1])
+    for env in envs:
+        env["check_model_init"]()
+    rt.profile_reset()
+    values = [{"x": {"a": "a"}}, {"x": {"a": "A"}}, {"x": {"a": "a"}, "y": [{"a": "b", "b": 1}, {"a": "c"}]},
+              {"x": {"a": "a"}, "y": [{"a": "b", "b": 1.5}]}, {"y": []}, None]
+    for val in values:
+        assert envs[0]["check_model"](val, "") == envs[1]["check_model"](val, "")
+    data = rt.profile_data()
+    assert set(data.keys()) == {".", ".'$p'", "/^[a-z]+$/"}
+    assert data["."]["calls"] == len(values) and data["."]["pass"] == 2
+    assert all(s["calls"] == s["pass"] + s["fail"] and s["ns"] >= 0 for s in data.values())
+    assert rt.profile_table().count("\n") == len(data)
+    rt.profile_reset()
+    assert rt.profile_data() == {}
+
+@pytest.mark.skipif(not has_exec("cc"), reason="missing cc")
+def test_profile_c(clibjm):
+    """Check that recursive C check functions are registered once for profiling."""
+    import subprocess
+    jm = model_from_json({"$": {"t": {"?l": "$t", "?r": "$t"}}, "t": "$t"})
+    tmp_dir = clibjm["tmp"]
+    fsrc, fexec, fval = f"{tmp_dir}/profile_rec.c", f"{tmp_dir}/profile_rec.out", f"{tmp_dir}/profile_rec.json"
+    with open(fsrc, "w") as f:
+        f.write(str(xstatic_compile(jm, lang="c", profile=True)))
+    with open(fval, "w") as f:
+        json.dump({"t": {"l": {"r": {}}, "r": {}}}, f)
+    status = os.system(f"{clibjm['cc']} {clibjm['cppflags']} {clibjm['cflags']} {fsrc} {clibjm['ldflags']} -o {fexec}")
+    assert status == 0, f"{fsrc} compilation success"
+    # a profile registered twice loops forever on dump
+    run = subprocess.run([fexec, "--profile", "json", fval], capture_output=True, text=True, timeout=10)
+    data = json.loads(run.stderr.splitlines()[-1])
+    assert data[".'$t'"]["calls"] == 4 and data[".'$t'"]["pass"] == 4
+
+def test_pgo():
+    """Check profile-guided compilation against plain compilation."""
+    jm = model_from_json({"$": {"p": {"a": "$STRING", "?b": "$INT", "?c": "$BOOL"}},
+                          "x": {"|": [{"k": 0}, {"l": 0}, "$p"]}})
+    values = [{"x": {"a": "a", "c": True}}] * 8 + [{"x": {"k": 1}}, {"x": {"l": 1}}, {"x": {"a": 1}}, {"x": 1}]
+
+    def profile(**options) -> dict:
+        env: dict = {}
+        exec(str(xstatic_compile(jm, lang="py", profile=True, **options)), env)
+        env["check_model_init"]()
+        rt.profile_reset()
+        for val in values:
+            env["check_model"](val, "")
+        return rt.profile_data()
+
+    pgo = profile()
+    assert pgo[".'$p'"]["props"] == {"a": 9, "c": 8}
+    # the guided order is applied at run time: fewer calls to failing alternatives
+    failing = [".x.'|'.0", ".x.'|'.1"]
+    guided_pgo = profile(pgo=pgo)
+    assert sum(pgo[k]["calls"] for k in failing) == 23
+    assert sum(guided_pgo[k]["calls"] for k in failing) == 7
+    plain, guided = str(xstatic_compile(jm, lang="py")), str(xstatic_compile(jm, lang="py", pgo=pgo))
+    # $p is tried before the other object which never passes, c is compared before b
+    assert plain.index("# .x.'|'.1\n") < plain.index("# .x.'|'.2\n")
+    assert guided.index("# .x.'|'.2\n") < guided.index("# .x.'|'.1\n")
+    assert guided.index('prop == "c"') < guided.index('prop == "b"')
+    envs: list[dict] = [{}, {}]
+    exec(plain, envs[0])
+    exec(guided, envs[1])
+    for env in envs:
+        env["check_model_init"]()
+    for val in values + [{"x": {"a": "a", "b": 1}}, {"x": {"a": "a", "b": True}}]:
+        assert envs[0]["check_model"](val, "") == envs[1]["check_model"](val, "")
+
+def test_timings():
+    """Check per-phase compilation timings and hook."""
+    mjson = {"$": {"p": {"a": "$STRING", "?b": "$INT"}}, "x": {"|": [{"k": 0}, "$p"]}}
+    for trace in (False, True):
+        seen: list[str] = []
+        timings_start(trace=trace, hook=lambda name, secs, peak: seen.append(name))
+        str(xstatic_compile(model_from_json(mjson), lang="c"))
+        timings = timings_stop()
+        assert timings is not None and timings_stop() is None
+        data = timings.toJSON()
+        for name in ("model", "optimize", "merge", "generate", "optimizeIR", "evaluate"):
+            assert data[name]["calls"] >= 1 and data[name]["seconds"] >= 0.0 and data[name]["peak"] > 0
+        assert seen.count("optimize") == data["optimize"]["calls"]
+        assert str(timings).count("\n") == len(data)
+
+def test_timings_no_resource(monkeypatch):
+    """Check that peaks are unknown without the Unix resource module."""
+    monkeypatch.setitem(sys.modules, "resource", None)
+    timings_start()
+    xstatic_compile(model_from_json({"a": "$INT"}), lang="py")
+    timings = timings_stop()
+    assert timings is not None and all(s["peak"] is None for s in timings.toJSON().values())
+    assert str(timings).splitlines()[1].endswith(" -")
+
+def test_optimize():
+    """Check that the incremental optimizer reaches the fixpoint of plain rule sweeps."""
+    rules = [optim.const_prop, optim.simplify, optim.partial_eval, optim.flatten,
+             optim.and_not_simpler, optim.and_to_merge, optim.xor_to_or, optim.notor_to_not]
+    fired = 0
+    for fmodel in sorted(pathlib.Path("./mv-26").glob("*.model.json")):
+        models = []
+        for _ in range(2):
+            resolver = Resolver(None, dirmap("mv-26"))
+            jm = model_from_url(f"./{fmodel.name}", resolver=resolver, check=False, merge=False, optimize=False)
+            models.append(sorted(jm._models.values(), key=lambda m: m._id))
+        visited = 0
+        for swept, worked in zip(*models):
+            while any([rule(swept) for rule in rules]):
+                pass
+            f, v = optim.optimize(worked)
+            fired, visited = fired + f, visited + v
+            assert worked.toModel(worked._is_root) == swept.toModel(swept._is_root)
+        assert visited > 0, fmodel
+    assert fired > 0
+
+def test_rec_lazy():
+    """Check that lazy path traversals see the same paths and rewrite models identically."""
+    for fmodel in sorted(pathlib.Path("../models").glob("*.model.json")):
+        results = []
+        for lazy in (False, True):
+            seen = []
+
+            def rwt(m, p):
+                seen.append(list(path_list(p)))
+                return m.upper() if isinstance(m, str) and m.startswith("$") else m
+
+            model = recModel(json.loads(fmodel.read_text()), lambda _m, _p: True, rwt, True, lazy=lazy)
+            results.append((model, seen))
+        assert results[0] == results[1], fmodel
+
+def test_model_key():
+    """Check that structural keys agree with model equality, including on the test models."""
+    samples = [None, True, 1, 1.0, 0, False, 0.0, "", "1", [], {}, [1], [True], [1.0],
+               {"a": 1}, {"a": 1, "#": "c"}, {"a": True}, {"a": [1, {"b": ""}]}, {"a": [1, {"b": "", "%": {}}]}]
+    for directory in ("mv-00", "mv-26"):
+        for fmodel in sorted(pathlib.Path(f"./{directory}").glob("*.model.json")):
+            samples.append(json.loads(fmodel.read_text()))
+    memo: dict = {}
+    keys = [model_key(m, memo) for m in samples]
+    for m1, k1 in zip(samples, keys):
+        assert k1 == model_key(m1)
+        for m2, k2 in zip(samples, keys):
+            assert (k1 == k2) == model_eq(m1, m2)
+
+def test_obj_share():
+    """Check that identical objects share a function, with path-independent reports."""
+    jm = model_from_json({"a": {"x": "$INT"}, "b": {"x": "$INT"}})
+    val = {"a": {"x": 1}, "b": {"x": "1"}}
+    for report in (False, True):
+        code = str(xstatic_compile(jm, lang="py", obj_share=True, report=report))
+        assert code.count("def _jm_obj_") == 1
+        env: dict = {}
+        exec(code, env)
+        env["check_model_init"]()
+        rep: list = []
+        assert not env["check_model"](val, "", rep)
+        # shared messages are relative to the object, the caller adds its path
+        msgs = [msg for msg, _ in rep]
+        assert not report or "unexpected $INT [@.x]" in msgs and "unexpected element [.b]" in msgs
+        assert all(".a" not in msg for msg in msgs)
+    # dual fast functions always share
+    code = str(xstatic_compile(jm, lang="py", dual=True))
+    assert code.count("def _jm_obj_") == 1 and code.count("def _jm_r_obj_") == 2
+
+def test_def_cache(tmp_path):
+    """Check that only changed definitions and their dependents are regenerated, here all but c."""
+    mjson = {"$": {"a": {"x": "$INT"}, "b": {"y": "$a"}, "c": ["/^[a-z]+$/"]},
+             "a": "$a", "b": "$b", "c": "$c"}
+    cache = DefinitionCache(str(tmp_path))
+    codes = []
+    for edit in (False, False, True):
+        if edit:
+            mjson["$"]["a"] = {"x": "$INT", "?z": "$BOOL"}
+        hits, misses = cache.hits, cache.misses
+        codes.append(str(xstatic_compile(model_from_json(mjson), lang="py", def_cache=cache)))
+        hits, misses = cache.hits - hits, cache.misses - misses
+        assert (hits, misses) == [(0, 4), (4, 0), (1, 3)][len(codes) - 1]
+    assert codes[0] == codes[1] and codes[1] != codes[2]
+    env: dict = {}
+    exec(codes[2], env)
+    env["check_model_init"]()
+    assert env["check_model"]({"a": {"x": 1, "z": True}, "b": {"y": {"x": 2}}, "c": ["a"]}, "")
+    assert not env["check_model"]({"a": {"x": 1}, "b": {"y": {"x": 2, "z": 1}}, "c": ["a"]}, "")
+
+def test_def_cache_ids(tmp_path):
+    """Check that adding a definition first, thus shifting model ids, only generates it."""
+    defs = {"a": {"x": "$INT", "?w": {"k": "$BOOL"}}, "b": {"y": "$a"}, "c": ["/^[a-z]+$/"]}
+    mjson = {"$": defs, "a": "$a", "b": "$b", "c": "$c"}
+    cache = DefinitionCache(str(tmp_path / "inc"))
+    xstatic_compile(model_from_json(mjson), lang="py", def_cache=cache)
+    mjson["$"] = {"u": {"v": "$c"}, **defs}
+    hits, misses = cache.hits, cache.misses
+    code = str(xstatic_compile(model_from_json(mjson), lang="py", def_cache=cache))
+    assert (cache.hits - hits, cache.misses - misses) == (4, 1)
+    fresh = DefinitionCache(str(tmp_path / "fresh"))
+    assert code == str(xstatic_compile(model_from_json(mjson), lang="py", def_cache=fresh))
+
+def test_artifact_cache(tmp_path):
+    """Check that cached outputs depend on options and on all loaded sources."""
+    (tmp_path / "a.json").write_text('{"b": "$./b.json"}')
+    (tmp_path / "b.json").write_text('"$STRING"')
+    cache = ArtifactCache(str(tmp_path / "cache"))
+
+    def run(options: dict, files: dict):
+        resolver = Resolver()
+        key = cache.key(**options)
+        if (got := cache.lookup(key, resolver)) is None:
+            for src in ("a.json", "b.json"):
+                resolver(str(tmp_path / src), follow=False)
+            cache.save(key, resolver, files)
+        return got
+
+    one, two = {"a.out": (0o755, b"one")}, {"a.out": (0o755, b"two")}
+    assert run({"format": "c"}, one) is None
+    assert run({"format": "c"}, two) == one
+    assert run({"format": "go"}, two) is None
+    (tmp_path / "b.json").write_text('"$INT"')
+    assert run({"format": "c"}, two) is None
+    assert run({"format": "c"}, one) == two
+    assert (cache.hits, cache.misses) == (2, 3)
+    stats = ArtifactCache(str(tmp_path / "cache")).stats()
+    assert stats["hits"] == 2 and stats["misses"] == 3 and stats["entries"] == 5
+    cache.clear()
+    assert cache.stats()["entries"] == 0 and cache.stats()["misses"] == 0
+
+# pytest-xdist workers run threads, jmc does not
+@pytest.mark.filterwarnings("ignore:.*use of fork:DeprecationWarning")
+def test_targets(tmp_path, monkeypatch):
+    """Check that several targets from one run match separate runs."""
+    model = tmp_path / "m.model.json"
+    model.write_text(json.dumps({"$": {"p": {"a": "$STRING"}}, "x": {"|": [{"k": 0}, "$p"]}}))
+
+    def jmc(*argv: str):
+        monkeypatch.setattr(sys, "argv", ["jmc", *argv, str(model)])
+        with pytest.raises(SystemExit) as exit:
+            jmc_script()
+        assert exit.value.code == 0
+
+    outputs = ["m.py", "m.c", "m.js", "m.sql", "m.ir.json"]
+    # targets are generated by forked workers, even on a single cpu
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    jmc(*(f"-T={tmp_path}/{out}" for out in outputs))
+    for out in outputs:
+        jmc("-o", f"{tmp_path}/single-{out}")
+        assert (tmp_path / out).read_text() == (tmp_path / f"single-{out}").read_text()
+
+@pytest.mark.filterwarnings("ignore:.*use of fork:DeprecationWarning")
+def test_jobs(tmp_path, monkeypatch, capsys):
+    """Check that parallel test vector checks match sequential ones, in order."""
+    model = tmp_path / "m.model.json"
+    model.write_text(json.dumps({"a": "$INT", "?b": ["$STRING"]}))
+    # several chunks, with failures and their reports
+    tests = [[i % 3 != 1, [{"a": i, "b": ["c"]}, {"a": str(i)}, {"a": i}][i % 3]] for i in range(2500)]
+    (tmp_path / "t.json").write_text(json.dumps(tests))
+    (tmp_path / "bad.json").write_text("[1, 2")
+
+    def jmc(*argv: str) -> tuple[int, str]:
+        files = [str(tmp_path / f) for f in ("t.json", "bad.json", "t.json")]
+        monkeypatch.setattr(sys, "argv", ["jmc", "-r", "--test-vector", *argv, str(model), *files])
+        with pytest.raises(SystemExit) as exit:
+            jmc_script()
+        return exit.value.code, capsys.readouterr().out  # type: ignore
+
+    code, out = jmc()
+    assert code != 0 and out.count("bad.json: ERROR") == 1
+    assert out.count(": PASS") == 2 * sum(1 for ok, _ in tests if ok)
+    assert f"t.json[{len(tests) - 1}]: PASS" in out and "unexpected $INT" in out
+    for jobs in ("1", "3"):
+        assert jmc("--jobs", jobs) == (code, out)
+
+def test_vector_errors(tmp_path, monkeypatch, capsys):
+    """Check that test vector results are shown up to an unknown model or an invalid test."""
+    model = tmp_path / "m.model.json"
+    model.write_text(json.dumps({"a": "$INT"}))
+    ok, ko = {"a": 1}, {"a": "1"}
+    (tmp_path / "name.json").write_text(json.dumps([[True, ok], [False, ko], [True, "nope", ok], [True, ok]]))
+    (tmp_path / "test.json").write_text(json.dumps([[True, ok], [False, ko], 5, [True, ok]]))
+    for argv in ([], ["--jobs", "3"]):
+        for fn in ("name.json", "test.json"):
+            monkeypatch.setattr(sys, "argv", ["jmc", "--test-vector", *argv, str(model), str(tmp_path / fn)])
+            with pytest.raises(SystemExit) as exit:
+                jmc_script()
+            out = capsys.readouterr().out
+            assert exit.value.code != 0
+            assert out.splitlines() == [f"{tmp_path / fn}[0]: PASS", f"{tmp_path / fn}[1]: FAIL",
+                                        f"{tmp_path / fn}: ERROR"]
+
+@pytest.mark.filterwarnings("ignore:.*use of fork:DeprecationWarning")
+def test_jsonl(tmp_path, monkeypatch, capsys):
+    """Check chunked JSONL checks, through a memory map or not, and in parallel."""
+    model = tmp_path / "m.model.json"
+    model.write_text(json.dumps({"a": "$INT"}))
+    values = [{"a": i} if i % 7 else {"a": str(i)} for i in range(2500)]
+    # blank lines are skipped, the last line has no newline
+    lines = [json.dumps(v) for v in values]
+    lines[10:10], lines[2000:2000] = [""], ["  ", "\t"]
+    fvals = tmp_path / "v.jsonl"
+    fvals.write_text("\n".join(lines))
+    (tmp_path / "empty.jsonl").write_text("")
+    for fn, nvals in ((fvals, len(values)), (tmp_path / "empty.jsonl", 0)):
+        plain = list(rt.jsonl_lines(str(fn)))
+        assert len(plain) == nvals and plain == list(rt.jsonl_lines(str(fn), True))
+
+    # chunk boundaries, parsed or not, with reports indexed within chunks
+    jm = model_from_json({"a": "$INT"})
+    env: dict = {}
+    exec(str(xstatic_compile(jm, lang="py")), env)
+    env["check_model_init"]()
+    checker, expect = env["check_model_fun"](""), env["check_model_many"](values, "")
+    for size in (1, 7, 1000, 5000):
+        for loads in (None, json.loads):
+            data = rt.jsonl_lines(str(fvals)) if loads else values
+            chunks = list(rt.check_chunks(checker, data, True, loads=loads, chunk_size=size))
+            assert len(chunks) == (len(values) + size - 1) // size
+            assert all(len(oks) == min(size, len(values) - i * size) for i, (oks, _) in enumerate(chunks))
+            assert b"".join(oks for oks, _ in chunks) == expect
+            assert all(set(reps) == {i for i, ok in enumerate(oks) if not ok} for oks, reps in chunks)
+
+    def jmc(*argv: str) -> tuple[int, str]:
+        monkeypatch.setattr(sys, "argv", ["jmc", "-r", "--jsonl", *argv, str(model), str(fvals)])
+        with pytest.raises(SystemExit) as exit:
+            jmc_script()
+        return exit.value.code, capsys.readouterr().out  # type: ignore
+
+    code, out = jmc()
+    assert out.count(": FAIL (") == expect.count(0) and out.count(": PASS") == expect.count(1)
+    assert f"v.jsonl[{len(values) - 1}]: FAIL" in out  # 2499 is a multiple of 7
+    for argv in (["--mmap"], ["--jobs", "3"], ["--mmap", "--jobs", "3"]):
+        assert jmc(*argv) == (code, out)
+
+def test_irep():
+    """Check in-memory IR nodes and their JSON serialization."""
+    jm = model_from_json({"a": {"|": ["$INT", "/^[a-z]+$/"]}, "?b": ["$BOOL"]})
+    ir = xstatic_compile(jm, lang="json")
+    assert all(isinstance(op, IRNode) for op in ir._subs)
+    full = json.loads(str(ir))
+    assert full["o"] == "gfc" and full["subs"] == json.loads(json.dumps(ir._subs))
+    # a node used twice is not shared, as the optimizer rewrites in place
+    lang = IRep(None)
+    test = lang.is_a("val", int)
+    code = lang.if_stmt(test, lang.ret(True)) + lang.if_stmt(lang.not_op(test), lang.ret(False))
+    assert code[0]["cond"] is test and code[1]["cond"]["e"] == test and code[1]["cond"]["e"] is not test
+    invertBool(code[0]["cond"])
+    assert code[1]["cond"]["e"] == test
+
+@pytest.mark.skipif(not has_exec("cc"), reason="missing cc")
+def test_pyext(tmp_dir):
+    """Check CPython extension checker against generated Python code."""
+    import sysconfig
+    import importlib.util
+    from json_model.script import DEFAULT_CC, DEFAULT_CFLAGS, DEFAULT_LDFLAGS_PYEXT_CRE2
+
+    jm = model_from_json({"$": {"p": {"a": "$INT", "?b": ["$DATE"], "?u": {"@": ["$ANY"], "!": True}}},
+                          "x": "$p", "?y": {"|": ["=1", "=2.5", "_foo"]}, "?z": "/^[a-z]+$/", "/^k/": 0.0,
+                          # 64 bits bounds
+                          "?m": "=9223372036854775807", "?e": {"|": ["=9223372036854775807", "=-9223372036854775808"]},
+                          "?n": {"@": "$INT", ">=": -9223372036854775808, "<=": 9223372036854775807},
+                          "?g": {"@": "$INT", ">": 9223372036854775807}, "?q": {"@": ["$INT"], "!": True}})
+    module = "jm_pyext"
+    fsrc, fext = f"{tmp_dir}/{module}.c", f"{tmp_dir}/{module}" + sysconfig.get_config_var("EXT_SUFFIX")
+    with open(fsrc, "w") as f:
+        f.write(str(xstatic_compile(jm, lang="pyext", relib="re2")))
+
+    # compilation settings with re2
+    src_dir = "../json_model/runtime/c"
+    cc = os.environ.get("CC", DEFAULT_CC)
+    cppflags = os.environ.get("CPPFLAGS", f"-I{src_dir} -DCHECK_FUNCTION_NAME=check_model")
+    cppflags += f" -I{sysconfig.get_path('include')} -DJSON_MODEL_PYEXT_MODULE={module}"
+    cppflags += " -DREGEX_ENGINE_RE2 -DJSON_MODEL_PYEXT"
+    cflags = os.environ.get("CFLAGS", DEFAULT_CFLAGS)
+    ldflags = os.environ.get("LDFLAGS", DEFAULT_LDFLAGS_PYEXT_CRE2)
+    status = os.system(f"{cc} {cppflags} {cflags} -shared -fPIC -o {fext} "
+                       f"{src_dir}/json-model.c {fsrc} {ldflags}")
+    assert status == 0, f"{fsrc} compilation success"
+
+    spec = importlib.util.spec_from_file_location(module, fext)
+    ext = importlib.util.module_from_spec(spec)  # type: ignore
+    spec.loader.exec_module(ext)  # type: ignore
+    env: dict = {}
+    exec(str(xstatic_compile(jm, lang="py")), env)
+    env["check_model_init"]()
+
+    values = [{"x": {"a": 1}}, {"x": {"a": True}}, {"x": {"a": 10**30, "b": ["2020-02-29"]}},
+              {"x": {"a": 1, "b": ["2021-02-29"]}}, {"x": {"a": 1, "u": [1, "1", [1], {"a": 1}]}},
+              {"x": {"a": 1, "u": [{"a": [1]}, {"a": [1]}]}}, {"x": {"a": 1}, "y": 2.5},
+              {"x": {"a": 1}, "y": "bla"}, {"x": {"a": 1}, "z": "abc"}, {"x": {"a": 1}, "z": "aBc"},
+              {"x": {"a": 1}, "k1": 1.5}, {"x": {"a": 1}, "k1": 1}, None, [], "x", (1,)]
+    # integers beyond 64 bits are not saturated
+    values += [{"x": {"a": 1}, p: v} for p in "meng" for v in (2**63 - 1, 2**63 + 5, 2**64, -2**63, -2**64)]
+    values += [{"x": {"a": 1}, "q": q} for q in ([2**64, 2**65], [2**64, 2**64], [-2**64, 2**63 - 1])]
+    for val in values:
+        reps: list[list] = [[], []]
+        res = ext.check_model(val, "", reps[0]), env["check_model"](val, "", reps[1])
+        assert res[0] == res[1] == ext.check_model(val)
+        assert (len(reps[0]) == 0) == res[0]
+        # same path format
+        if not res[0]:
+            assert {rt.support._path(p) for _, p in reps[0]} <= {rt.support._path(p) for _, p in reps[1]}
+    assert ext.check_model({"a": 1}, "p")
+    with pytest.raises(ValueError):
+        ext.check_model({"x": {"a": 1, 0: 1}})
+    with pytest.raises(Exception):
+        ext.check_model(None, "no-such-model")
+    ext.check_model_free()
+    env["check_model_free"]()
+
+def test_unique():
+    """Check hash-based unique arrays, including hash collisions."""
+    # CPython integer hashes collide, so do keys of values holding them
+    assert hash(-1) == hash(-2)
+    cases = [([], True), ([1.0], True), ([1, 2, 3], True), ([1, 2, 1], False),
+             ([0.0, -0.0], False), ([None, False, 0, ""], True), ([None, None], False),
+             ([1, 1.0], True), ([True, 1], True), ([1, "1"], True), ([[1], [1.0]], True),
+             ([[1, 2], [2, 1]], True), ([[1, []], [1, []]], False), ([[1, [2, [3]]], [1, [2, [3]]]], False),
+             ([{"a": 1}, {"b": 1}], True), ([{"a": 1, "b": [True]}, {"b": [True], "a": 1}], False),
+             ([[], {}], True), ([-1, -2], True), ([[-1], [-2]], True), ([{"k": -1}, {"k": -2}, {"k": -1}], False)]
+    for val, unique in cases:
+        assert rt.is_unique_array(val, None) == unique, val
+    rep: list = []
+    assert not rt.is_unique_array("abc", None)
+    assert not rt.is_unique_array([1, 1], (), rep) and rep == [("non unique array", ())]
+
+def test_predef_cache():
+    """Check predef results and reports with and without caching."""
+    values = ["2020-02-29", "2021-02-29", "https://json-model.org/", "no url", "a.b@c.org", "a..b@c.org"]
+    checks = [rt.is_valid_date] * 2 + [rt.is_valid_url] * 2 + [rt.is_valid_email] * 2
+    expected = [True, False, True, False, True, False]
+    try:
+        for size in (0, 2, 0):
+            rt.predef_cache(size)
+            for _ in range(3):
+                for check, val, exp in zip(checks, values, expected):
+                    rep: list = []
+                    assert check(val, (), rep) == exp and (len(rep) == 0) == exp
+            info = rt.predef_cache_info()
+            if size:
+                assert info["$DATE"]["hits"] == 4 and info["$DATE"]["misses"] == 2
+                assert info["$URL"]["rate"] == 4 / 6
+            else:
+                assert info == {}
+    finally:
+        rt.predef_cache(0)
+
 #
 # BAD MODELS
 #